@@ -1,22 +1,47 @@
 import uvicorn
+import asyncio
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import os
+import glob
 import random
-from typing import List, Dict, Any, Optional
+import logging
+import logging.handlers
+import queue
+import signal
+import sys
+import atexit
+from typing import List, Dict, Any, Optional, Deque
+from collections import deque
+from dataclasses import dataclass, field
 import uuid
-from pydantic import BaseModel, ValidationError, ConfigDict, Field
-import json
+import zlib
+from pydantic import BaseModel, ValidationError, TypeAdapter
+import orjson
 from fastapi import status
 from starlette.websockets import WebSocketState
 # from words import WORD_LIST # Removed as WORD_LIST is defined comprehensively below
 
 app = FastAPI()
 
+# --- Logging ---
+# Records are formatted lazily (%-style) and handed to a queue; a listener thread does the
+# actual stream write so logging never blocks the event loop. Set LOG_LEVEL=DEBUG for per-message detail.
+logger = logging.getLogger("sketch")
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 @app.get("/ping")
-async def ping():
+async def ping() -> Dict[str, str]:
     return {"message": "pong"}
 
 # --- CORS Middleware Configuration ---
@@ -38,7 +63,7 @@ if os.environ.get("RENDER"):
     # Replace with your actual Render URL
     production_url = os.environ.get("RENDER_EXTERNAL_URL", "https://sketch-codes.onrender.com")
     origins.append(production_url)
-    print(f"Added production origin: {production_url}")
+    logger.info("Added production origin: %s", production_url)
 
 app.add_middleware(
     CORSMiddleware,
@@ -65,46 +90,91 @@ try:
     with open("codenames_words.txt", "r") as f:
         additional_words = [line.strip() for line in f if line.strip()]
         WORD_LIST.extend(additional_words)
-        print(f"Loaded {len(additional_words)} additional words from codenames_words.txt")
+        logger.info("Loaded %s additional words from codenames_words.txt", len(additional_words))
 except FileNotFoundError:
-    print("codenames_words.txt not found. Using the built-in word list.")
+    logger.info("codenames_words.txt not found. Using the built-in word list.")
 
 WORD_LIST = list(set(WORD_LIST))
-print(f"Total word list size: {len(WORD_LIST)} words")
+logger.info("Total word list size: %s words", len(WORD_LIST))
 
-ADJECTIVES = [
+ADJECTIVES = (
     "Quick", "Lazy", "Sleepy", "Noisy", "Hungry", "Funny", "Silly", "Clever",
     "Brave", "Calm", "Eager", "Jolly", "Kind", "Proud", "Witty", "Zany"
-]
-NOUNS = [
+)
+NOUNS = (
     "Fox", "Dog", "Cat", "Bear", "Lion", "Tiger", "Puma", "Wolf", "Bird", "Duck",
     "Panda", "Koala", "Lemur", "Otter", "Squid", "Crab", "Shark", "Owl"
-]
+)
 
-class Stroke(BaseModel):
-    id: str = Field(default_factory=lambda: f"stroke-{uuid.uuid4()}")
-    points: list[list[float]]
+# A game can hold thousands of strokes, so they are slotted dataclasses rather than BaseModels: no
+# per-instance __dict__ or pydantic bookkeeping, and orjson serializes them natively.
+@dataclass(slots=True, kw_only=True)
+class Stroke:
+    id: str = field(default_factory=lambda: f"stroke-{uuid.uuid4()}")
+    points: list[tuple[float, float]] # Exactly-two-float pairs, enforced by pydantic-core during validation
     color: str = "#000000"
     width: int = 2
     tool: str = "pen"
 
-class CardRevealStatus(BaseModel):
+# Built once at import: validates a stroke dict straight through pydantic-core (which handles
+# dataclasses as well as models). Used for every NEW_STROKE and submitted stroke.
+_STROKE_VALIDATOR = TypeAdapter(Stroke)
+
+MAX_STROKE_HISTORY = 4096 # Most strokes a turn's drawing may hold; further NEW_STROKEs are ignored and submissions truncated
+CLIENT_SEND_QUEUE_SIZE = 256 # Pending outbound messages per client before it is disconnected as too slow
+CLIENT_SEND_BATCH_SIZE = 32 # Most queued messages a writer coalesces into one frame
+SLOW_CLIENT_CLOSE_CODE = 1013 # "Try again later"; the client reconnects and resyncs from INITIAL_GAME_DATA
+COMPRESS_THRESHOLD = 4096 # Messages at least this large are zlib-compressed once before being queued
+slow_clients_dropped = 0 # Connections closed with SLOW_CLIENT_CLOSE_CODE since startup
+# Fixed error message, encoded once instead of on every failure
+ERROR_SERVER_BYTES = orjson.dumps({"type": "ERROR", "payload": {"message": "A critical server error occurred."}})
+
+@dataclass(slots=True)
+class ClientChannel:
+    """A connected client's WebSocket plus the bounded outbound queue its writer task drains."""
+    websocket: WebSocket
+    send_queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=CLIENT_SEND_QUEUE_SIZE))
+    writer_task: Optional[asyncio.Task] = None
+    overflowed: bool = False
+
+    def enqueue(self, message: bytes) -> None:
+        """Queue an encoded message for this client without waiting on its socket."""
+        if self.overflowed:
+            return
+        try:
+            self.send_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow consumer: dropping messages would silently lose strokes, so discard the backlog
+            # and leave only the None sentinel, which tells the writer to close the socket.
+            self.overflowed = True
+            while not self.send_queue.empty():
+                self.send_queue.get_nowait()
+            self.send_queue.put_nowait(None)
+
+# 25 per game, built and mutated only by the server: a slotted dataclass like GameState below.
+@dataclass(slots=True)
+class CardRevealStatus:
     revealed_by_guesser_for_a: Optional[str] = None  # Stores type ('green', 'neutral', 'assassin') if Player A was cluer, Player B guessed
     revealed_by_guesser_for_b: Optional[str] = None  # Stores type if Player B was cluer, Player A guessed
 
-class GameState(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"revealed_by_guesser_for_a": self.revealed_by_guesser_for_a, "revealed_by_guesser_for_b": self.revealed_by_guesser_for_b}
+
+# Plain slotted dataclass: it is only ever built by the server itself, so pydantic validation would
+# buy nothing, and every hot-path attribute access skips the instance __dict__.
+@dataclass(slots=True)
+class GameState:
     game_id: str
-    clients: Dict[str, WebSocket] = Field(default_factory=dict)
-    strokes: List[Stroke] = Field(default_factory=list)
-    current_turn_drawing_strokes: List[Stroke] = Field(default_factory=list)
-    grid_words: List[str] = Field(default_factory=list)
-    key_card_a: List[str] = Field(default_factory=list)
-    key_card_b: List[str] = Field(default_factory=list)
+    clients: Dict[str, ClientChannel] = field(default_factory=dict)
+    strokes: Deque[Stroke] = field(default_factory=lambda: deque(maxlen=MAX_STROKE_HISTORY))
+    current_turn_drawing_strokes: List[Stroke] = field(default_factory=list)
+    grid_words: List[str] = field(default_factory=list)
+    key_card_a: List[str] = field(default_factory=list)
+    key_card_b: List[str] = field(default_factory=list)
     player_a_id: Optional[str] = None
     player_b_id: Optional[str] = None
-    # revealed_cards: List[str] = Field(default_factory=list) # Replaced by grid_reveal_status
-    grid_reveal_status: List[CardRevealStatus] = Field(default_factory=lambda: [CardRevealStatus() for _ in range(25)])
+    # revealed_cards: List[str] = field(default_factory=list) # Replaced by grid_reveal_status
+    grid_reveal_status: List[CardRevealStatus] = field(default_factory=lambda: [CardRevealStatus() for _ in range(25)])
     current_drawing_player_id: Optional[str] = None
     current_guessing_player_id: Optional[str] = None
     drawing_phase_active: bool = True
@@ -116,6 +186,121 @@ class GameState(BaseModel):
     all_agents_found_message: Optional[str] = None # Notify when a player finds all their own agent cards
     game_over: bool = False
     winner: Optional[str] = None
+    _dirty: bool = False # Set by every accepted mutation; cleared when the state is broadcast
+    _static_json: bytes = b"" # grid_words and both key cards, serialized once at creation (they never change)
+    _strokes_json: Optional[orjson.Fragment] = None # Serialized `strokes`, rebuilt lazily after they change
+    _strokes_changed: bool = True # `strokes` differs from what the last GAME_STATE carried
+    # Immutable views of `clients`, rebuilt only on connect/disconnect instead of on every broadcast
+    _client_ids: tuple = ()
+    _channels: tuple = ()
+
+    def _advance_turn(self, keep_all_agents_found_message: bool = False) -> None:
+        """Swaps drawer and guesser and resets the per-turn state for the next turn."""
+        self.current_drawing_player_id, self.current_guessing_player_id = self.current_guessing_player_id, self.current_drawing_player_id
+        self.drawing_phase_active = True
+        self.guessing_active = False
+        self.drawing_submitted = False
+        self.strokes = deque(maxlen=MAX_STROKE_HISTORY) # Clear all strokes from the board for the new turn
+        self._strokes_json = None
+        self._strokes_changed = True
+        self.current_turn_drawing_strokes = [] # Clear any strokes from the concluded turn
+        self.turn_number += 1
+        self.correct_guesses_this_turn = 0
+        if not keep_all_agents_found_message:
+            self.all_agents_found_message = None
+        self._dirty = True
+
+    def _refresh_client_views(self) -> None:
+        self._client_ids = tuple(self.clients)
+        self._channels = tuple(self.clients.values())
+
+    def add_client(self, client_id: str, channel: ClientChannel) -> bool:
+        """Registers a client's channel, replacing any stale one under the same id.
+
+        Returns True if the id was not connected before.
+        """
+        is_new = client_id not in self.clients
+        self.clients[client_id] = channel
+        self._refresh_client_views()
+        return is_new
+
+    def remove_client(self, client_id: str, channel: ClientChannel) -> bool:
+        """Drops a disconnected client, frees its player slot and re-defaults the roles.
+
+        Does nothing if `channel` was already replaced by a newer connection under the same id.
+        Returns True if the remaining clients need a GAME_STATE broadcast.
+        """
+        if self.clients.get(client_id) is not channel:
+            return False
+        del self.clients[client_id]
+        self._refresh_client_views()
+        broadcast_needed = False
+        for slot in ("player_a_id", "player_b_id"):
+            if getattr(self, slot) == client_id:
+                setattr(self, slot, None)
+                logger.info("Player slot %s (%s) cleared in game %s.", slot, client_id, self.game_id)
+                broadcast_needed = True
+                break
+        if self.current_drawing_player_id == client_id:
+            self.current_drawing_player_id = None
+        if self.current_guessing_player_id == client_id:
+            self.current_guessing_player_id = None
+
+        # With a slot open, hand any vacated role to whoever is still seated
+        if (self.player_a_id is None or self.player_b_id is None) and not self.game_over:
+            seated = self.player_a_id or self.player_b_id
+            if self.current_drawing_player_id is None and seated is not None:
+                self.current_drawing_player_id = seated
+            if self.current_guessing_player_id is None and seated is not None and seated != self.current_drawing_player_id:
+                self.current_guessing_player_id = seated
+            broadcast_needed = True
+        return broadcast_needed
+
+    def commit_strokes(self, strokes: List[Stroke]) -> None:
+        """Appends a submitted drawing to the board and drops the cached stroke JSON."""
+        self.strokes.extend(strokes)
+        self._strokes_json = None
+        self._strokes_changed = True
+
+    def _strokes_fragment(self) -> orjson.Fragment:
+        # Committed strokes only change on submit and turn end, but go out in every GAME_STATE and
+        # INITIAL_GAME_DATA, so they are serialized once and embedded as pre-encoded JSON.
+        if self._strokes_json is None:
+            self._strokes_json = orjson.Fragment(orjson.dumps(list(self.strokes)))
+        return self._strokes_json
+
+    def to_broadcast(self, include_strokes: bool = True) -> Dict[str, Any]:
+        """Builds the GAME_STATE payload directly from attributes (much cheaper than model_dump on the broadcast path).
+
+        With include_strokes=False the committed `strokes` are left out; clients keep the list they have.
+        """
+        player_identities = {}
+        if self.player_a_id:
+            player_identities[self.player_a_id] = "a"
+        if self.player_b_id:
+            player_identities[self.player_b_id] = "b"
+
+        payload = {
+            "game_id": self.game_id,
+            "grid_reveal_status": [s.to_dict() for s in self.grid_reveal_status],
+            "current_drawing_player_id": self.current_drawing_player_id,
+            "current_guessing_player_id": self.current_guessing_player_id,
+            "drawing_phase_active": self.drawing_phase_active,
+            "drawing_submitted": self.drawing_submitted,
+            "guessing_active": self.guessing_active,
+            "correct_guesses_this_turn": self.correct_guesses_this_turn,
+            "turn_number": self.turn_number,
+            "game_over": self.game_over,
+            "winner": self.winner,
+            "player_identities": player_identities,
+            "connected_client_ids": self._client_ids,
+            "all_agents_found_message": self.all_agents_found_message,
+            # Send current turn drawing strokes only if drawing isn't submitted yet
+            "current_turn_drawing_strokes": self.current_turn_drawing_strokes if not self.drawing_submitted else []
+        }
+        if include_strokes:
+            payload["strokes"] = self._strokes_fragment()
+        return payload
 
 class WebSocketMessagePayload(BaseModel):
     clientId: Optional[str] = None
@@ -125,66 +310,152 @@ class WebSocketMessage(BaseModel):
     payload: Any
     gameId: Optional[str] = None
 
+# All game state lives in this process. A game must be served by exactly one worker, so the server
+# runs a single uvicorn worker; scaling out means several processes behind a proxy that routes every
+# request for a game id (HTTP and /ws/{game_id}/...) to the same process.
 active_games: Dict[str, GameState] = {}
+# Lowercased game id -> key in active_games, so case-insensitive joins are a dict lookup rather than a scan.
+active_games_ci: Dict[str, str] = {}
+
+def _register_game(game_state: GameState) -> None:
+    active_games[game_state.game_id] = game_state
+    active_games_ci[game_state.game_id.lower()] = game_state.game_id
+
+def _unregister_game(game_id: str) -> None:
+    del active_games[game_id]
+    active_games_ci.pop(game_id.lower(), None)
+
+def _normalize_points(raw_points: List[Any]) -> Optional[List[List[float]]]:
+    """Converts client points ([x, y] pairs or {"x", "y"} objects) to [[float, float], ...].
+
+    Returns None if any point is malformed. Only needed for the object form; see _validate_stroke.
+    """
+    transformed_points: List[List[float]] = []
+    for point in raw_points:
+        try:
+            if isinstance(point, list) and len(point) == 2:
+                transformed_points.append([float(point[0]), float(point[1])])
+            elif isinstance(point, dict) and 'x' in point and 'y' in point:
+                transformed_points.append([float(point['x']), float(point['y'])])
+            else:
+                return None
+        except (TypeError, ValueError):
+            return None
+    return transformed_points
+
+def _validate_stroke(stroke_data: Dict[str, Any]) -> Stroke:
+    """Validates a client stroke dict, raising ValidationError if it is malformed.
+
+    The [x, y] point pairs the frontend sends are coerced and checked entirely inside
+    pydantic-core; only the {"x", "y"} object form goes through _normalize_points first.
+    """
+    try:
+        stroke = _STROKE_VALIDATOR.validate_python(stroke_data)
+    except ValidationError:
+        raw_points = stroke_data.get("points")
+        points = _normalize_points(raw_points) if isinstance(raw_points, list) else None
+        if points is None:
+            raise
+        stroke = _STROKE_VALIDATOR.validate_python({**stroke_data, "points": points})
+    # A turn's strokes share a handful of colors and tools; interning lets the stored history hold one
+    # copy of each instead of a fresh string per stroke.
+    stroke.color = sys.intern(stroke.color)
+    stroke.tool = sys.intern(stroke.tool)
+    return stroke
 
 def generate_memorable_game_id(max_attempts=10) -> str:
     for _ in range(max_attempts):
-        adj = random.choice(ADJECTIVES)
-        noun = random.choice(NOUNS)
-        num = random.randint(1, 999)
-        game_id = f"{adj}{noun}{num}".lower()
-        if game_id not in active_games:
+        # One 32-bit urandom draw split into fields: adjective, noun, then a 1-999 suffix
+        bits = int.from_bytes(os.urandom(4), "little")
+        bits, adj_index = divmod(bits, len(ADJECTIVES))
+        bits, noun_index = divmod(bits, len(NOUNS))
+        game_id = f"{ADJECTIVES[adj_index]}{NOUNS[noun_index]}{bits % 999 + 1}".lower()
+        if game_id not in active_games_ci:
             return game_id
-    print("Warning: Max attempts reached for memorable game ID generation. Falling back to UUID.")
+    logger.warning("Max attempts reached for memorable game ID generation. Falling back to UUID.")
     return str(uuid.uuid4()).lower()
 
-async def broadcast_game_state(game_id: str):
-    if game_id not in active_games:
-        print(f"Error: Attempted to broadcast to non-existent game room {game_id}")
-        return
-
-    game_state = active_games[game_id]
-    connected_client_ids = list(game_state.clients.keys())
+async def broadcast_game_state(game_state: GameState):
+    game_state._dirty = False
+    # Every connected client already holds the committed strokes from INITIAL_GAME_DATA or an earlier
+    # GAME_STATE, so they are only resent when they changed (a submitted drawing or a new turn).
+    base_payload = game_state.to_broadcast(include_strokes=game_state._strokes_changed)
+    game_state._strokes_changed = False
 
-    player_identities = {}
-    if game_state.player_a_id:
-        player_identities[game_state.player_a_id] = "a"
-    if game_state.player_b_id:
-        player_identities[game_state.player_b_id] = "b"
-
-    base_payload = {
-        "game_id": game_state.game_id,
-        "strokes": [stroke.model_dump() for stroke in game_state.strokes],
-        "grid_words": game_state.grid_words,
-        "key_card_a": game_state.key_card_a,  # Always send key_card_a
-        "key_card_b": game_state.key_card_b,  # Always send key_card_b
-        "grid_reveal_status": [s.model_dump() for s in game_state.grid_reveal_status],
-        "current_drawing_player_id": game_state.current_drawing_player_id,
-        "current_guessing_player_id": game_state.current_guessing_player_id,
-        "drawing_phase_active": game_state.drawing_phase_active,
-        "drawing_submitted": game_state.drawing_submitted,
-        "guessing_active": game_state.guessing_active,
-        "correct_guesses_this_turn": game_state.correct_guesses_this_turn,
-        "turn_number": game_state.turn_number,
-        "game_over": game_state.game_over,
-        "winner": game_state.winner,
-        "player_identities": player_identities,
-        "connected_client_ids": connected_client_ids,
-        "all_agents_found_message": game_state.all_agents_found_message, # <<< ADDED THIS LINE
-        # Send current turn drawing strokes only if drawing isn't submitted yet
-        "current_turn_drawing_strokes": [s.model_dump() for s in game_state.current_turn_drawing_strokes] if not game_state.drawing_submitted else []
-    }
-
-    # The client-specific key_card logic is removed.
-    # key_card_a and key_card_b are now part of base_payload, sent to all clients.
+    # grid_words, key_card_a and key_card_b never change after creation, so they are sent once per
+    # connection in INITIAL_GAME_DATA rather than in every snapshot.
     # The frontend will use its playerType to determine which keycard to display.
-    for client_id, websocket in game_state.clients.items():
-        message = {"type": "GAME_STATE", "payload": base_payload}
+    # Serialize, encode and compress once and hand the same bytes to every client's writer; a slow peer never stalls the others.
+    message_bytes = _compress_large(orjson.dumps({"type": "GAME_STATE", "payload": base_payload}))
+    for channel in game_state._channels:
+        channel.enqueue(message_bytes)
+
+def _compress_large(message_bytes: bytes) -> bytes:
+    """zlib-compresses a large encoded message once, so every recipient shares the result.
+
+    permessage-deflate is off (it would redo the work for each socket); the frontend spots
+    compressed frames by the zlib header byte 0x78, which no JSON text starts with.
+    """
+    if len(message_bytes) < COMPRESS_THRESHOLD:
+        return message_bytes
+    return zlib.compress(message_bytes, 1)
+
+def _coalesce(messages: List[bytes]) -> List[bytes]:
+    """Joins runs of plain JSON messages into array frames; compressed messages go out on their own."""
+    frames: List[bytes] = []
+    run: List[bytes] = []
+    for message in messages:
+        if message[0] == 0x78:
+            if run:
+                frames.append(run[0] if len(run) == 1 else b"[" + b",".join(run) + b"]")
+                run = []
+            frames.append(message)
+        else:
+            run.append(message)
+    if run:
+        frames.append(run[0] if len(run) == 1 else b"[" + b",".join(run) + b"]")
+    return frames
+
+async def _client_writer(client_id: str, channel: ClientChannel):
+    """Sends queued messages to one client until its socket fails or the task is cancelled.
+
+    Messages that piled up while the previous send was in flight go out together as one
+    JSON-array frame; a lone message is sent as-is.
+    """
+    global slow_clients_dropped
+    send_queue = channel.send_queue
+    while True:
+        message_bytes = await send_queue.get()
         try:
-            if websocket.client_state == WebSocketState.CONNECTED:
-                await websocket.send_text(json.dumps(message))
-        except Exception as e:
-            print(f"Error broadcasting game state to client {client_id} in game {game_id}: {e}")
+            if message_bytes is None:
+                slow_clients_dropped += 1
+                logger.warning("Client %s fell %s messages behind. Disconnecting (%s slow clients dropped so far).", client_id, CLIENT_SEND_QUEUE_SIZE, slow_clients_dropped)
+                await channel.websocket.close(code=SLOW_CLIENT_CLOSE_CODE)
+                return
+            if send_queue.empty():
+                frames = [message_bytes]
+            else:
+                batch = [message_bytes]
+                while not send_queue.empty() and len(batch) < CLIENT_SEND_BATCH_SIZE:
+                    batch.append(send_queue.get_nowait())
+                frames = _coalesce(batch)
+            # Binary frames carry the pre-encoded UTF-8 JSON as-is; send_text would re-encode it per client.
+            for frame in frames:
+                await channel.websocket.send_bytes(frame)
+        except (WebSocketDisconnect, RuntimeError, OSError):
+            # The peer went away (Starlette raises RuntimeError once the socket is closed). Routine during
+            # disconnect storms, so no traceback; the receive loop notices too and cleans up.
+            logger.debug("Client %s disconnected while sending.", client_id)
+            return
+        except Exception:
+            # Without its writer the client would stay connected but never hear from the server again,
+            # so end the session; the receive loop then sees the disconnect and cleans up.
+            logger.exception("Unexpected error sending to client %s. Closing its connection.", client_id)
+            try:
+                await channel.websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+            except (RuntimeError, OSError):
+                pass
+            return
 
 FRONTEND_DIR = os.path.join(os.path.dirname(__file__), "..", "frontend", "dist")
 STATIC_ASSETS_DIR = os.path.join(FRONTEND_DIR, "assets")
@@ -192,24 +463,52 @@ STATIC_ASSETS_DIR = os.path.join(FRONTEND_DIR, "assets")
 if os.path.exists(STATIC_ASSETS_DIR):
     app.mount("/assets", StaticFiles(directory=STATIC_ASSETS_DIR), name="static_assets")
 else:
-    print(f"Warning: Static assets directory not found at {STATIC_ASSETS_DIR}.")
+    logger.warning("Static assets directory not found at %s.", STATIC_ASSETS_DIR)
+
+# The built frontend only changes on redeploy, so scan it once at startup:
+# URL path -> (file path, stat) for every real file, plus the index.html bytes served for client-side routes.
+INDEX_FILE_PATH = os.path.join(FRONTEND_DIR, "index.html")
+FRONTEND_DIR_EXISTS = False
+STATIC_FILES: Dict[str, tuple[str, os.stat_result]] = {}
+INDEX_BYTES: Optional[bytes] = None
+# index.html names the hashed asset bundles, so browsers must revalidate it or they keep loading a stale build
+INDEX_HEADERS = {"Cache-Control": "no-cache"}
+
+def _load_frontend_files() -> None:
+    """(Re)builds the frontend file map and cached index.html from frontend/dist."""
+    global FRONTEND_DIR_EXISTS, STATIC_FILES, INDEX_BYTES
+    static_files: Dict[str, tuple[str, os.stat_result]] = {}
+    index_bytes: Optional[bytes] = None
+    frontend_dir_exists = os.path.isdir(FRONTEND_DIR)
+    if frontend_dir_exists:
+        for file_path in glob.glob(os.path.join(FRONTEND_DIR, "**"), recursive=True):
+            if os.path.isfile(file_path):
+                # The stat is kept so FileResponse can build its headers without another syscall
+                static_files[os.path.relpath(file_path, FRONTEND_DIR).replace(os.sep, "/")] = (file_path, os.stat(file_path))
+        if os.path.isfile(INDEX_FILE_PATH):
+            with open(INDEX_FILE_PATH, "rb") as index_file:
+                index_bytes = index_file.read()
+        logger.info("Serving %s frontend files from %s.", len(static_files), FRONTEND_DIR)
+    # Rebind whole objects so a request never sees a half-built map
+    FRONTEND_DIR_EXISTS, STATIC_FILES, INDEX_BYTES = frontend_dir_exists, static_files, index_bytes
+
+_load_frontend_files()
+# After rebuilding the frontend in place, `kill -HUP <pid>` picks it up without a restart.
+if hasattr(signal, "SIGHUP"):
+    signal.signal(signal.SIGHUP, lambda signum, frame: _load_frontend_files())
 
 @app.websocket("/ws/{game_id_path}/{client_id_path}")
 async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_path: str):
-    print(f"[Backend WebSocket] Received connection attempt for game: {game_id_path}, client: {client_id_path}")
+    logger.debug("Received WebSocket connection attempt for game: %s, client: %s", game_id_path, client_id_path)
     established_game_id: Optional[str] = None
     established_client_id: Optional[str] = None
 
-    actual_game_id_found = None
-    for existing_game_id_key in active_games.keys():
-        if existing_game_id_key.lower() == game_id_path.lower():
-            actual_game_id_found = existing_game_id_key
-            break
+    actual_game_id_found = active_games_ci.get(game_id_path.lower())
 
     if not actual_game_id_found:
-        print(f"Game ID '{game_id_path}' not found. Creating new game.")
+        logger.info("Game ID '%s' not found. Creating new game.", game_id_path)
         game_id = game_id_path
-        active_games[game_id] = await _initialize_new_game_state(game_id) # Use helper for Codenames Duet initialization
+        _register_game(await _initialize_new_game_state(game_id)) # Use helper for Codenames Duet initialization
         actual_game_id_found = game_id
 
     established_game_id = actual_game_id_found
@@ -219,7 +518,9 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
     await websocket.accept()
     
     game_state = active_games[established_game_id]
-    game_state.clients[established_client_id] = websocket
+    channel = ClientChannel(websocket=websocket)
+    channel.writer_task = asyncio.create_task(_client_writer(established_client_id, channel))
+    is_new_client = game_state.add_client(established_client_id, channel)
 
     try:
         # Determine player_type for the connecting client for INITIAL_GAME_DATA.
@@ -236,38 +537,21 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
             player_type = "b"
         # Otherwise, stays spectator if both roles are filled by others
 
-        initial_payload_data = {
-            "game_id": game_state.game_id,
-            "strokes": [s.model_dump() for s in game_state.strokes],
-            "grid_words": game_state.grid_words,
-            "key_card_a": game_state.key_card_a,
-            "key_card_b": game_state.key_card_b,
-            "player_a_id": game_state.player_a_id,
-            "player_b_id": game_state.player_b_id,
-            "grid_reveal_status": [s.model_dump() for s in game_state.grid_reveal_status],
-            "current_drawing_player_id": game_state.current_drawing_player_id,
-            "current_guessing_player_id": game_state.current_guessing_player_id,
-            "drawing_phase_active": game_state.drawing_phase_active,
-            "drawing_submitted": game_state.drawing_submitted,
-            "guessing_active": game_state.guessing_active,
-            "correct_guesses_this_turn": game_state.correct_guesses_this_turn,
-            "turn_number": game_state.turn_number,
-            "game_over": game_state.game_over,
-            "winner": game_state.winner,
-            "connected_client_ids": list(game_state.clients.keys()),
-            "current_turn_drawing_strokes": [],
-            "player_type": player_type # Use the determined player_type
-        }
-
-        if not game_state.drawing_submitted and established_client_id == game_state.current_drawing_player_id:
-            initial_payload_data["current_turn_drawing_strokes"] = [s.model_dump() for s in game_state.current_turn_drawing_strokes]
-
-        await websocket.send_text(json.dumps({
-            "type": "INITIAL_GAME_DATA",
-            "payload": initial_payload_data,
-            "gameId": established_game_id
-        }))
-        print(f"Sent INITIAL_GAME_DATA to client {established_client_id} for game {established_game_id} with player_type: {player_type}")
+        initial_payload_data = game_state.to_broadcast()
+        initial_payload_data["player_a_id"] = game_state.player_a_id
+        initial_payload_data["player_b_id"] = game_state.player_b_id
+        initial_payload_data["player_type"] = player_type # Use the determined player_type
+        # The in-progress drawing is only returned to the drawer themselves.
+        if established_client_id != game_state.current_drawing_player_id:
+            initial_payload_data["current_turn_drawing_strokes"] = []
+
+        # Splice the immutable fields, serialized once at game creation, into the payload object.
+        payload_json = orjson.dumps(initial_payload_data)
+        channel.enqueue(_compress_large(
+            b'{"type":"INITIAL_GAME_DATA","gameId":' + orjson.dumps(established_game_id)
+            + b',"payload":' + game_state._static_json[:-1] + b"," + payload_json[1:] + b"}"
+        ))
+        logger.debug("Sent INITIAL_GAME_DATA to client %s for game %s with player_type: %s", established_client_id, established_game_id, player_type)
 
         # Now, officially assign player roles if needed and broadcast the potentially updated state
         player_assignment_changed = False
@@ -277,40 +561,44 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
             # For the very first player, they become the drawer.
             if game_state.current_drawing_player_id is None: 
                 game_state.current_drawing_player_id = established_client_id
-            print(f"Player A ({established_client_id}) registered. Current drawer: {game_state.current_drawing_player_id}.")
+            logger.info("Player A (%s) registered. Current drawer: %s.", established_client_id, game_state.current_drawing_player_id)
             player_assignment_changed = True
         elif game_state.player_b_id is None and game_state.player_a_id != established_client_id:
             game_state.player_b_id = established_client_id
             # current_guessing_player_id is set on turn change. For the second player, they become the guesser if no one is.
             if game_state.current_guessing_player_id is None: 
                  game_state.current_guessing_player_id = established_client_id
-            print(f"Player B ({established_client_id}) registered. Current guesser: {game_state.current_guessing_player_id}.")
+            logger.info("Player B (%s) registered. Current guesser: %s.", established_client_id, game_state.current_guessing_player_id)
             player_assignment_changed = True
         elif game_state.player_a_id == established_client_id or game_state.player_b_id == established_client_id:
-            print(f"Player {established_client_id} reconnected as Player {'A' if game_state.player_a_id == established_client_id else 'B'}.")
+            logger.info("Player %s reconnected as Player %s.", established_client_id, 'A' if game_state.player_a_id == established_client_id else 'B')
         else:
-            print(f"INFO: Client {established_client_id} connected as an observer for game {established_game_id}.")
+            logger.info("Client %s connected as an observer for game %s.", established_client_id, established_game_id)
 
-        # If player assignment changed, or even if it's a reconnect, broadcast the latest state
-        # This ensures the new client gets the absolute latest, and others are updated if a new player joined.
-        await broadcast_game_state(established_game_id)
-        if player_assignment_changed:
-            print(f"Game state after role assignment for {established_client_id}: {game_state.model_dump(exclude={'clients'})}")
+        # Everyone needs a new snapshot only if roles or the connected-client list changed. A client
+        # re-attaching under an id that is still registered changes neither, so only it gets the state.
+        if player_assignment_changed or is_new_client:
+            await broadcast_game_state(game_state)
+        else:
+            channel.enqueue(_compress_large(orjson.dumps({"type": "GAME_STATE", "payload": game_state.to_broadcast()})))
+        if player_assignment_changed and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Game state after role assignment for %s: %s", established_client_id, game_state.to_broadcast())
 
         while True:
             message_text = "" # Initialize for use in error messages
             message_data = {} # Initialize for use in error messages
             try:
                 message_text = await websocket.receive_text()
-                message_data = json.loads(message_text)
+                message_data = orjson.loads(message_text)
                 message_type = message_data.get("type")
                 payload = message_data.get("payload", {})
                 # payload_client_id = payload.get("clientId") # Not strictly needed if we use established_client_id
 
-                game_state = active_games.get(established_game_id)
-                if not game_state:
-                    print(f"WARN: Game {established_game_id} disappeared during msg loop for {established_client_id}. Closing.")
-                    if websocket.client_state == WebSocketState.CONNECTED:
+                # The game can be unregistered (and its id reused) while this socket is open, e.g. after the
+                # same client id reconnected elsewhere and that connection left; don't act on a dead game.
+                if active_games.get(established_game_id) is not game_state:
+                    logger.warning("Game %s disappeared during msg loop for %s. Closing.", established_game_id, established_client_id)
+                    if websocket.application_state == WebSocketState.CONNECTED:
                         await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
                     break
 
@@ -319,7 +607,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                 if message_type == "NEW_STROKE":
                     stroke_input_data = payload.get("stroke")
                     if not isinstance(stroke_input_data, dict):
-                        print(f"ERROR: NEW_STROKE payload.stroke is not a dictionary from {actor_client_id}: {stroke_input_data}")
+                        logger.error("NEW_STROKE payload.stroke is not a dictionary from %s: %s", actor_client_id, stroke_input_data)
                         continue
 
                     if actor_client_id == game_state.current_drawing_player_id and \
@@ -329,69 +617,39 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                         if not isinstance(stroke_input_data.get('points'), list) or \
                            not isinstance(stroke_input_data.get('color'), str) or \
                            not isinstance(stroke_input_data.get('size'), (int, float)):
-                            print(f"ERROR: Invalid NEW_STROKE structure or missing/invalid keys from {actor_client_id}. Data: {stroke_input_data}")
+                            logger.error("Invalid NEW_STROKE structure or missing/invalid keys from %s. Data: %s", actor_client_id, stroke_input_data)
                             continue
 
-                        processed_stroke_data = stroke_input_data.copy() # Restore this
+                        if len(game_state.current_turn_drawing_strokes) >= MAX_STROKE_HISTORY:
+                            logger.warning("NEW_STROKE from %s ignored. Drawing already has %s strokes.", actor_client_id, MAX_STROKE_HISTORY)
+                            continue
 
-                        # Points processing
-                        raw_points = processed_stroke_data['points']
-                        transformed_points = []
-                        valid_points_format = True
-                        
-                        for p_obj in raw_points:
-                            if isinstance(p_obj, dict) and 'x' in p_obj and 'y' in p_obj:
-                                try:
-                                    transformed_points.append([float(p_obj['x']), float(p_obj['y'])])
-                                except (TypeError, ValueError):
-                                    valid_points_format = False
-                                    break 
-                            elif isinstance(p_obj, list) and len(p_obj) == 2:
-                                try:
-                                    transformed_points.append([float(p_obj[0]), float(p_obj[1])])
-                                except (TypeError, ValueError):
-                                    valid_points_format = False
-                                    break
-                            else:
-                                valid_points_format = False
-                                break
-                        
-                        if not valid_points_format:
-                            print(f"ERROR: Invalid point data format in NEW_STROKE from {actor_client_id}. Points: {raw_points}")
-                            continue 
-                        
-                        processed_stroke_data['points'] = transformed_points
-                        
                         # Attempt to create Stroke object
                         try:
-                            new_stroke = Stroke(**processed_stroke_data)
+                            new_stroke = _validate_stroke(stroke_input_data)
+                            # Nothing is sent back per stroke: the drawer already shows its own stroke, the list goes
+                            # out with the next GAME_STATE, and a reconnecting drawer gets it in INITIAL_GAME_DATA.
                             game_state.current_turn_drawing_strokes.append(new_stroke)
-                            # To give drawing player immediate feedback of their own strokes (without full broadcast yet):
-                            if websocket.client_state == WebSocketState.CONNECTED:
-                                await websocket.send_text(json.dumps({
-                                    "type": "CURRENT_STROKES_UPDATE", 
-                                    "payload": {"strokes": [s.model_dump() for s in game_state.current_turn_drawing_strokes]}
-                                }))
                         except ValidationError as e:
-                            print(f"ERROR: Stroke validation error for NEW_STROKE from {actor_client_id}: {e}. Processed data: {processed_stroke_data}")
+                            logger.error("Stroke validation error for NEW_STROKE from %s: %s. Data: %s", actor_client_id, e, stroke_input_data)
                             # Consider if a single bad stroke should halt further processing or just be skipped.
                             # For now, it prints an error and processing continues for the next message.
                     else:
-                        print(f"INFO: NEW_STROKE from {actor_client_id} ignored. Conditions not met.")
+                        logger.debug("NEW_STROKE from %s ignored. Conditions not met.", actor_client_id)
 
                 elif message_type == "CLEAR_CANVAS":
                     if actor_client_id == game_state.current_drawing_player_id and \
                        game_state.drawing_phase_active and not game_state.drawing_submitted:
                         game_state.current_turn_drawing_strokes = []
-                        print(f"INFO: Canvas cleared by drawer {actor_client_id} for game {established_game_id}.")
+                        game_state._dirty = True
+                        logger.debug("Canvas cleared by drawer %s for game %s.", actor_client_id, established_game_id)
                         # Inform the drawer their canvas was cleared
-                        if websocket.client_state == WebSocketState.CONNECTED:
-                                await websocket.send_text(json.dumps({
-                                    "type": "CURRENT_STROKES_UPDATE",
-                                    "payload": {"strokes": []}
-                                }))
+                        channel.enqueue(orjson.dumps({
+                            "type": "CURRENT_STROKES_UPDATE",
+                            "payload": {"strokes": []}
+                        }))
                     else:
-                        print(f"WARN: CLEAR_CANVAS from {actor_client_id} ignored. Conditions not met.")
+                        logger.warning("CLEAR_CANVAS from %s ignored. Conditions not met.", actor_client_id)
 
                 elif message_type == "SUBMIT_DRAWING":
                     if actor_client_id == game_state.current_drawing_player_id and \
@@ -400,87 +658,65 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                         submitted_strokes_payload = payload.get("strokes")
 
                         if isinstance(submitted_strokes_payload, list):
+                            if len(submitted_strokes_payload) > MAX_STROKE_HISTORY:
+                                logger.warning("SUBMIT_DRAWING from %s has %s strokes. Keeping the first %s.", actor_client_id, len(submitted_strokes_payload), MAX_STROKE_HISTORY)
+                                submitted_strokes_payload = submitted_strokes_payload[:MAX_STROKE_HISTORY]
                             if len(submitted_strokes_payload) > 0:
-                                print(f"INFO: Received {len(submitted_strokes_payload)} strokes in SUBMIT_DRAWING payload from {actor_client_id}.")
+                                logger.debug("Received %s strokes in SUBMIT_DRAWING payload from %s.", len(submitted_strokes_payload), actor_client_id)
                                 validated_submitted_strokes = []
                                 for stroke_data in submitted_strokes_payload:
                                     if not isinstance(stroke_data, dict):
-                                        print(f"ERROR: SUBMIT_DRAWING stroke_data is not a dictionary: {stroke_data} from {actor_client_id}")
+                                        logger.error("SUBMIT_DRAWING stroke_data is not a dictionary: %s from %s", stroke_data, actor_client_id)
                                         continue
 
-                                    processed_stroke_data = stroke_data.copy()
-                                    
-                                    # Points transformation: frontend sends points as nested arrays e.g. [[x1,y1],[x2,y2]]
-                                    if 'points' in processed_stroke_data and isinstance(processed_stroke_data['points'], list):
-                                        raw_points = processed_stroke_data['points']
-                                        transformed_points = []
-                                        valid_points_format = True
-                                        for p_pair in raw_points: # Each p_pair should be [x, y]
-                                            if isinstance(p_pair, list) and len(p_pair) == 2:
-                                                try:
-                                                    transformed_points.append([float(p_pair[0]), float(p_pair[1])])
-                                                except (TypeError, ValueError):
-                                                    valid_points_format = False
-                                                    break # Exit points loop for this stroke_data
-                                            else: # Malformed point pair
-                                                valid_points_format = False
-                                                break # Exit points loop for this stroke_data
-                                        
-                                        if valid_points_format:
-                                            processed_stroke_data['points'] = transformed_points
-                                        else:
-                                            print(f"ERROR: Invalid point data format in SUBMIT_DRAWING from {actor_client_id}. Points: {raw_points}")
-                                            continue # Skip this stroke_data (from the outer loop over stroke_data in processed_payload_strokes)
-                                    else:
-                                        print(f"ERROR: Missing or invalid 'points' list in SUBMIT_DRAWING stroke_data: {stroke_data} from {actor_client_id}")
-                                        continue # Skip this stroke
-
+                                    # Frontend sends points as nested arrays e.g. [[x1,y1],[x2,y2]]
                                     try:
-                                        stroke_instance = Stroke(**processed_stroke_data)
+                                        stroke_instance = _validate_stroke(stroke_data)
                                         validated_submitted_strokes.append(stroke_instance)
                                     except ValidationError as e:
-                                        print(f"ERROR: Stroke validation error for SUBMIT_DRAWING from {actor_client_id}: {e}. Data: {processed_stroke_data}")
+                                        logger.error("Stroke validation error for SUBMIT_DRAWING from %s: %s. Data: %s", actor_client_id, e, stroke_data)
                                         continue # Skip this stroke
                                 
                                 if validated_submitted_strokes: # If any strokes were successfully validated from non-empty payload
                                     game_state.current_turn_drawing_strokes = validated_submitted_strokes 
-                                    print(f"INFO: Replaced current_turn_drawing_strokes with {len(validated_submitted_strokes)} validated strokes from SUBMIT_DRAWING payload.")
+                                    logger.debug("Replaced current_turn_drawing_strokes with %s validated strokes from SUBMIT_DRAWING payload.", len(validated_submitted_strokes))
                                 else:
-                                    print(f"WARN: No valid strokes processed from SUBMIT_DRAWING payload from {actor_client_id}. Retaining existing current_turn_drawing_strokes if any.")
+                                    logger.warning("No valid strokes processed from SUBMIT_DRAWING payload from %s. Retaining existing current_turn_drawing_strokes if any.", actor_client_id)
                                     # Fallback: if payload had strokes but all failed validation, current_turn_drawing_strokes remains as is (from NEW_STROKEs)
                             else: # Empty list of strokes sent in payload
-                                 print(f"INFO: SUBMIT_DRAWING payload contained an empty list of strokes from {actor_client_id}. Clearing current_turn_drawing_strokes.")
+                                 logger.debug("SUBMIT_DRAWING payload contained an empty list of strokes from %s. Clearing current_turn_drawing_strokes.", actor_client_id)
                                  game_state.current_turn_drawing_strokes = []
                         else:
-                            print(f"WARN: No 'strokes' list, or non-list 'strokes', found in SUBMIT_DRAWING payload from {actor_client_id}. Relying on prior NEW_STROKE data. Payload: {payload}")
+                            logger.warning("No 'strokes' list, or non-list 'strokes', found in SUBMIT_DRAWING payload from %s. Relying on prior NEW_STROKE data. Payload: %s", actor_client_id, payload)
                             # Fallback: if 'strokes' key is missing or not a list, current_turn_drawing_strokes remains as is.
 
                         # Now, finalize the drawing with the (potentially updated or cleared) current_turn_drawing_strokes
-                        game_state.strokes.extend(game_state.current_turn_drawing_strokes)
+                        game_state.commit_strokes(game_state.current_turn_drawing_strokes)
                         
                         game_state.drawing_phase_active = False
                         game_state.drawing_submitted = True
                         game_state.guessing_active = True
-                        print(f"INFO: Drawing submitted by {actor_client_id} for game {established_game_id}. Guessing now active.")
+                        game_state._dirty = True
+                        logger.info("Drawing submitted by %s for game %s. Guessing now active.", actor_client_id, established_game_id)
                     else:
-                        print(f"WARN: SUBMIT_DRAWING from {actor_client_id} ignored. Conditions not met.")
+                        logger.warning("SUBMIT_DRAWING from %s ignored. Conditions not met.", actor_client_id)
 
                 elif message_type == "GUESS_WORD":
                     word_index_str = payload.get("wordIndex")
                     if word_index_str is None:
-                        print(f"ERROR: GUESS_WORD from {actor_client_id} missing 'wordIndex'.")
+                        logger.error("GUESS_WORD from %s missing 'wordIndex'.", actor_client_id)
                         continue
                     try:
                         word_index = int(word_index_str)
                     except ValueError:
-                        print(f"ERROR: GUESS_WORD 'wordIndex' ('{word_index_str}') not an int from {actor_client_id}.")
+                        logger.error("GUESS_WORD 'wordIndex' ('%s') not an int from %s.", word_index_str, actor_client_id)
                         continue
 
                     if not (actor_client_id == game_state.current_guessing_player_id and game_state.guessing_active):
-                        print(f"WARN: GUESS_WORD from {actor_client_id} ignored. Conditions not met.")
+                        logger.warning("GUESS_WORD from %s ignored. Conditions not met.", actor_client_id)
                         continue
                     if not (0 <= word_index < len(game_state.grid_words)):
-                        print(f"ERROR: GUESS_WORD invalid word_index {word_index} from {actor_client_id}.")
+                        logger.error("GUESS_WORD invalid word_index %s from %s.", word_index, actor_client_id)
                         continue
                     clue_giver_id = game_state.current_drawing_player_id
                     card_status_obj = game_state.grid_reveal_status[word_index]
@@ -498,21 +734,21 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                             already_revealed_for_this_turn = True
 
                     if already_revealed_for_this_turn:
-                        print(f"INFO: GUESS_WORD card at index {word_index} already processed for clue_giver {clue_giver_id} by guesser {actor_client_id}.")
+                        logger.debug("GUESS_WORD card at index %s already processed for clue_giver %s by guesser %s.", word_index, clue_giver_id, actor_client_id)
                         continue
 
                     guesser_key_card = game_state.key_card_a if guesser_is_player_a else game_state.key_card_b
                     clue_giver_key_card = game_state.key_card_a if clue_giver_is_player_a else game_state.key_card_b
 
                     if not guesser_key_card or not clue_giver_key_card:
-                        print(f"CRITICAL_ERROR: Key card missing for guesser {actor_client_id} or clue_giver {clue_giver_id}. Game: {established_game_id}")
+                        logger.error("Key card missing for guesser %s or clue_giver %s. Game: %s", actor_client_id, clue_giver_id, established_game_id)
                         continue
 
                     card_type_on_guesser_map = guesser_key_card[word_index]
                     card_type_on_clue_giver_map = clue_giver_key_card[word_index]
 
-                    print(f"INFO: Game {established_game_id}: Guesser {actor_client_id} (Player {'A' if guesser_is_player_a else 'B'}) guesses word {word_index} ('{game_state.grid_words[word_index]}').")
-                    print(f"INFO: Card is '{card_type_on_guesser_map}' on Guesser's map. Card is '{card_type_on_clue_giver_map}' on Clue Giver {clue_giver_id} (Player {'A' if clue_giver_is_player_a else 'B'})'s map.")
+                    logger.debug("Game %s: Guesser %s (Player %s) guesses word %s ('%s').", established_game_id, actor_client_id, 'A' if guesser_is_player_a else 'B', word_index, game_state.grid_words[word_index])
+                    logger.debug("Card is '%s' on Guesser's map. Card is '%s' on Clue Giver %s (Player %s)'s map.", card_type_on_guesser_map, card_type_on_clue_giver_map, clue_giver_id, 'A' if clue_giver_is_player_a else 'B')
 
                     game_ended_this_guess = False
                     turn_ended_this_guess = False
@@ -524,7 +760,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
 
                     # 1. Handle game-ending assassins first
                     if is_double_assassin:
-                        print(f"GAME_OVER: Double Assassin! Card {word_index} ('{game_state.grid_words[word_index]}'). Game {established_game_id}.")
+                        logger.info("GAME_OVER: Double Assassin! Card %s ('%s'). Game %s.", word_index, game_state.grid_words[word_index], established_game_id)
                         game_state.game_over = True
                         game_state.all_agents_found_message = None
                         game_state.winner = "Players Lose! (Double Assassin)"
@@ -534,7 +770,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                         turn_ended_this_guess = True # Game end implies turn end
 
                     elif is_clue_giver_map_assassin_only: # Clue giver's map is assassin (and not a double)
-                        print(f"GAME_OVER: Guesser {actor_client_id} revealed Clue Giver {clue_giver_id}'s Assassin! Card {word_index} ('{game_state.grid_words[word_index]}'). Game {established_game_id}.")
+                        logger.info("GAME_OVER: Guesser %s revealed Clue Giver %s's Assassin! Card %s ('%s'). Game %s.", actor_client_id, clue_giver_id, word_index, game_state.grid_words[word_index], established_game_id)
                         game_state.game_over = True
                         game_state.all_agents_found_message = None
                         game_state.winner = "Players Lose! (Assassin Revealed)"
@@ -549,7 +785,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                     if not game_ended_this_guess:
                         # Check if guesser hit their own assassin (and game isn't ending for other assassin reasons)
                         if is_guesser_map_assassin_only: # This means the card on guesser's map was assassin
-                            print(f"INFO: Guesser {actor_client_id} hit their OWN Assassin! Card {word_index} ('{game_state.grid_words[word_index]}'). Turn ends. Game continues.")
+                            logger.debug("Guesser %s hit their OWN Assassin! Card %s ('%s'). Turn ends. Game continues.", actor_client_id, word_index, game_state.grid_words[word_index])
                             turn_ended_this_guess = True # Ensure turn ends because guesser hit own assassin
 
                         revealed_type_for_clue_giver_turn = card_type_on_clue_giver_map # Determined earlier
@@ -559,7 +795,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                             card_status_obj.revealed_by_guesser_for_a = revealed_type_for_clue_giver_turn
                         else:
                             card_status_obj.revealed_by_guesser_for_b = revealed_type_for_clue_giver_turn
-                        print(f"INFO: Card {word_index} ('{game_state.grid_words[word_index]}') marked as '{revealed_type_for_clue_giver_turn}' for Clue Giver {clue_giver_id}'s turn.")
+                        logger.debug("Card %s ('%s') marked as '%s' for Clue Giver %s's turn.", word_index, game_state.grid_words[word_index], revealed_type_for_clue_giver_turn, clue_giver_id)
 
                         # ---- Check if GUESSER found all of DRAWER'S green cards ----
                         # This check runs if the current guess was green on the DRAWER's map (a correct guess for the turn)
@@ -590,7 +826,7 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                                 TOTAL_GREEN_CARDS_PER_PLAYER = 9 
 
                                 revealed_drawer_green_cards = 0
-                                print(f"DEBUG: Checking if all DRAWER ({drawer_char}) green cards revealed by GUESSER ({other_player_char_for_message}).")
+                                logger.debug("Checking if all DRAWER (%s) green cards revealed by GUESSER (%s).", drawer_char, other_player_char_for_message)
                                 for i in range(len(game_state.grid_words)):
                                     card_is_green_on_drawer_map = (drawer_key_card[i] == "green")
                                     
@@ -605,13 +841,13 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                                         revealed_drawer_green_cards += 1
                                         # print(f"DEBUG DRAWER COUNT: Card {i} ('{game_state.grid_words[i]}') COUNTED for drawer. New total: {revealed_drawer_green_cards}")
                                 
-                                print(f"DEBUG CHECK (DRAWER): revealed_drawer_green_cards = {revealed_drawer_green_cards}, TARGET = {TOTAL_GREEN_CARDS_PER_PLAYER}")
-                                print(f"DEBUG CHECK (DRAWER): game_state.all_agents_found_message before check is: '{game_state.all_agents_found_message}'")
+                                logger.debug("revealed_drawer_green_cards = %s, TARGET = %s", revealed_drawer_green_cards, TOTAL_GREEN_CARDS_PER_PLAYER)
+                                logger.debug("game_state.all_agents_found_message before check is: '%s'", game_state.all_agents_found_message)
                                 if revealed_drawer_green_cards == TOTAL_GREEN_CARDS_PER_PLAYER:
                                     if game_state.all_agents_found_message is None:
                                         game_state.all_agents_found_message = f"Great work! All agent cards for Player {drawer_char} have been found. Only Player {other_player_char_for_message}'s agent cards remain."
                                         message_was_just_set_this_guess = True
-                                        print(f"INFO: Game {established_game_id}: All {TOTAL_GREEN_CARDS_PER_PLAYER} agent cards for DRAWER Player {drawer_char} found by Guesser Player {other_player_char_for_message}. Message set and flag 'message_was_just_set_this_guess' is True.")
+                                        logger.debug("Game %s: All %s agent cards for DRAWER Player %s found by Guesser Player %s. Message set and flag 'message_was_just_set_this_guess' is True.", established_game_id, TOTAL_GREEN_CARDS_PER_PLAYER, drawer_char, other_player_char_for_message)
                             # This message is not cleared here by this specific logic block; it persists until a turn change or game end, handled elsewhere.
 
                         # ---- Check if current guesser cleared opponent's board ----
@@ -639,25 +875,25 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                                     guesser_role_char = 'A' if guesser_is_player_a else 'B'
                                     opponent_role_char_display = 'A' if actual_opponent_is_player_a else 'B'
                                     if game_state.player_cleared_opponent_board != guesser_role_char: # only log and set flag if not already set for this player
-                                        print(f"INFO: Guesser {actor_client_id} (Player {guesser_role_char}) cleared all {total_opponent_green_cards} of opponent Player {opponent_role_char_display}'s cards!")
+                                        logger.debug("Guesser %s (Player %s) cleared all %s of opponent Player %s's cards!", actor_client_id, guesser_role_char, total_opponent_green_cards, opponent_role_char_display)
                                         game_state.player_cleared_opponent_board = guesser_role_char
                                     
                                     if not game_ended_this_guess: 
                                         if not turn_ended_this_guess: # if turn wasn't already ended by e.g. own assassin
-                                            print(f"INFO: Turn ends as all opponent Player {opponent_role_char_display}'s cards cleared by Player {guesser_role_char}.")
+                                            logger.debug("Turn ends as all opponent Player %s's cards cleared by Player %s.", opponent_role_char_display, guesser_role_char)
                                         turn_ended_this_guess = True 
                         
                         # Determine if turn ends based on revealed type (if not already ended by other means)
                         if not turn_ended_this_guess: 
                             if revealed_type_for_clue_giver_turn == 'green':
                                 game_state.correct_guesses_this_turn += 1
-                                print(f"INFO: Correct guess for Clue Giver {clue_giver_id}. Turn continues. Correct guesses this turn: {game_state.correct_guesses_this_turn}.")
+                                logger.debug("Correct guess for Clue Giver %s. Turn continues. Correct guesses this turn: %s.", clue_giver_id, game_state.correct_guesses_this_turn)
                             elif revealed_type_for_clue_giver_turn == 'neutral':
-                                print(f"INFO: Incorrect guess (Neutral for Clue Giver {clue_giver_id}). Turn ends.")
+                                logger.debug("Incorrect guess (Neutral for Clue Giver %s). Turn ends.", clue_giver_id)
                                 turn_ended_this_guess = True 
                         elif revealed_type_for_clue_giver_turn == 'green': # Turn already ended (e.g. own assassin, cleared board), but guess was green for cluer
                             game_state.correct_guesses_this_turn += 1
-                            print(f"INFO: Correct guess (Green for Clue Giver), but turn had already ended. Correct guesses: {game_state.correct_guesses_this_turn}")
+                            logger.debug("Correct guess (Green for Clue Giver), but turn had already ended. Correct guesses: %s", game_state.correct_guesses_this_turn)
                         # Note: if revealed_type_for_clue_giver_turn was 'assassin' (guesser hit own), turn_ended_this_guess is already true from earlier.
                         # Win condition check happens after card_status_obj is updated and turn logic is processed
                         
@@ -676,176 +912,99 @@ async def websocket_endpoint(websocket: WebSocket, game_id_path: str, client_id_
                             if status_check.revealed_by_guesser_for_a == 'green' or status_check.revealed_by_guesser_for_b == 'green':
                                 revealed_as_green_count += 1
                         
-                        print(f"INFO: Win condition: {revealed_as_green_count} / {len(all_target_green_indices_for_win)} unique green cards revealed (target 15).")
+                        logger.debug("Win condition: %s / %s unique green cards revealed (target 15).", revealed_as_green_count, len(all_target_green_indices_for_win))
                         if revealed_as_green_count >= 15:
-                            print(f"GAME_OVER: Players WIN! {revealed_as_green_count} green words identified. Game {established_game_id}.")
+                            logger.info("GAME_OVER: Players WIN! %s green words identified. Game %s.", revealed_as_green_count, established_game_id)
                             game_state.game_over = True
                             game_state.all_agents_found_message = None
                             game_state.winner = "Players Win! (15 Green Words)"
                             game_ended_this_guess = True
                             turn_ended_this_guess = True
 
+                    # Every guess that gets this far has revealed a card.
+                    game_state._dirty = True
+
                     # --- Logic for GUESS_WORD causing a turn end or game end ---
                     if game_ended_this_guess:
-                        print(f"INFO: Game {established_game_id} ended due to guess.")
+                        logger.debug("Game %s ended due to guess.", established_game_id)
                         # Game state (game_over, winner) already set. Broadcast will reflect this.
                     elif turn_ended_this_guess: # Game not ended, but turn ended
-                        print(f"INFO: Turn {game_state.turn_number} ended for game {established_game_id} due to guess outcome. Guesses this turn: {game_state.correct_guesses_this_turn}")
-                        
-                        # Role switch and state reset for new turn
-                        temp_drawer = game_state.current_drawing_player_id
-                        game_state.current_drawing_player_id = game_state.current_guessing_player_id
-                        game_state.current_guessing_player_id = temp_drawer
+                        logger.debug("Turn %s ended for game %s due to guess outcome. Guesses this turn: %s", game_state.turn_number, established_game_id, game_state.correct_guesses_this_turn)
                         
-                        game_state.drawing_phase_active = True
-                        game_state.guessing_active = False
-                        game_state.drawing_submitted = False
-                        game_state.strokes.clear() # Clear all strokes from the board for the new turn
-                        game_state.current_turn_drawing_strokes.clear() # Clear any strokes from the concluded turn
-                        game_state.turn_number += 1
-                        game_state.correct_guesses_this_turn = 0
-                        if not message_was_just_set_this_guess:
-                            game_state.all_agents_found_message = None # Clear message only if not just set
-                            print("INFO: Clearing all_agents_found_message because it was not set in this guess cycle.")
-                        else:
-                            print("INFO: Preserving all_agents_found_message as it was set in this guess cycle.")
-                        print(f"INFO: New turn {game_state.turn_number} after GUESS_WORD. Drawer: {game_state.current_drawing_player_id}, Guesser: {game_state.current_guessing_player_id}. Canvas cleared. Display overrides cleared.")
+                        # Role switch and state reset for new turn; the message is cleared only if not just set
+                        game_state._advance_turn(keep_all_agents_found_message=message_was_just_set_this_guess)
+                        logger.info("New turn %s after GUESS_WORD. Drawer: %s, Guesser: %s. Canvas cleared. Display overrides cleared.", game_state.turn_number, game_state.current_drawing_player_id, game_state.current_guessing_player_id)
                     # If neither game_ended_this_guess nor turn_ended_this_guess is true, it means a correct green guess was made
                     # and the turn continues. In this case, display_override should persist for the current turn.
 
                 elif message_type == "END_GUESSING":
                     requesting_client_id_from_payload = payload.get("clientId")
-                    print(f"INFO: Received END_GUESSING from {actor_client_id} (payload clientId: {requesting_client_id_from_payload}) for game {established_game_id}")
+                    logger.debug("Received END_GUESSING from %s (payload clientId: %s) for game %s", actor_client_id, requesting_client_id_from_payload, established_game_id)
 
                     if not (actor_client_id == game_state.current_guessing_player_id and game_state.guessing_active and not game_state.game_over):
-                        print(f"WARN: END_GUESSING from {actor_client_id} ignored. Conditions not met. Current guesser: {game_state.current_guessing_player_id}, Guessing active: {game_state.guessing_active}, Game over: {game_state.game_over}")
+                        logger.warning("END_GUESSING from %s ignored. Conditions not met. Current guesser: %s, Guessing active: %s, Game over: %s", actor_client_id, game_state.current_guessing_player_id, game_state.guessing_active, game_state.game_over)
                     else:
-                        print(f"INFO: Player {actor_client_id} ended guessing. Switching roles for game {established_game_id}.")
-                        # Switch roles
-                        previous_drawer = game_state.current_drawing_player_id
-                        game_state.current_drawing_player_id = game_state.current_guessing_player_id # Guesser becomes drawer
-                        game_state.current_guessing_player_id = previous_drawer # Drawer becomes guesser
-
-                        # Reset game state for the new turn
-                        game_state.drawing_phase_active = True
-                        game_state.guessing_active = False
-                        game_state.drawing_submitted = False
-                        game_state.strokes.clear() # Clear all strokes from the board
-                        game_state.current_turn_drawing_strokes.clear() # Clear any strokes from the current turn
-                        game_state.turn_number += 1
-                        game_state.correct_guesses_this_turn = 0
-                        game_state.all_agents_found_message = None # Clear any previous 'all agents found' message
-                        
-                        print(f"INFO: New turn {game_state.turn_number} initiated by END_GUESSING. Drawer: {game_state.current_drawing_player_id}, Guesser: {game_state.current_guessing_player_id}. Canvas cleared. Display overrides cleared.")
+                        logger.debug("Player %s ended guessing. Switching roles for game %s.", actor_client_id, established_game_id)
+                        game_state._advance_turn()
+
+                        logger.info("New turn %s initiated by END_GUESSING. Drawer: %s, Guesser: %s. Canvas cleared. Display overrides cleared.", game_state.turn_number, game_state.current_drawing_player_id, game_state.current_guessing_player_id)
                 
-                # After processing any message type that might change game state or roles:
-                if established_game_id in active_games: # Ensure game still exists
-                    game_state_state_for_broadcast = active_games.get(established_game_id)
-                    if game_state_state_for_broadcast: # Check again, as it might be deleted in another async context
-                         print(f"DEBUG: Broadcasting game state after GUESS_WORD/END_GUESSING (or other state change). all_agents_found_message = '{game_state_state_for_broadcast.all_agents_found_message}'")
-                         await broadcast_game_state(established_game_id)
+                # After processing any message type that might change game state or roles.
+                if game_state._dirty: # Rejected or informational messages leave the state untouched; skip the fan-out
+                    logger.debug("Broadcasting game state after GUESS_WORD/END_GUESSING (or other state change). all_agents_found_message = '%s'", game_state.all_agents_found_message)
+                    await broadcast_game_state(game_state)
                     # Reset the temporary flag after broadcasting
                     if game_state.player_cleared_opponent_board is not None:
                         game_state.player_cleared_opponent_board = None
-
-                elif message_type == "END_GUESSING":
-                    # Original END_GUESSING logic would start here.
-                    # The print statement below was likely part of a different conditional block or logging
-                    # that got misplaced. For now, I'm ensuring the elif is clean.
-                    # If that WARN print was essential and tied to the END_GUESSING block's conditions,
-                    # it would need to be re-evaluated based on the original code's intent.
-                    print(f"[DEBUG] END_GUESSING message type received from {actor_client_id} for game {established_game_id}") # Placeholder for actual logic
-                else:
-                    print(f"WARN: Game {established_game_id} not in active_games for final broadcast for {actor_client_id}. Client might be closing.")
-            except json.JSONDecodeError:
-                print(f"ERROR: JSONDecodeError from {established_client_id}. Msg: '{message_text}'")
+            except orjson.JSONDecodeError:
+                logger.error("JSONDecodeError from %s. Msg: '%s'", established_client_id, message_text)
                 continue
             except KeyError as e:
-                print(f"ERROR: KeyError processing message from {established_client_id}. Error: {e}. Data: {message_data}")
+                logger.error("KeyError processing message from %s. Error: %s. Data: %s", established_client_id, e, message_data)
                 continue
             except WebSocketDisconnect:
-                print(f"INFO: WebSocket disconnected for {established_client_id} (game {established_game_id}) during message processing.")
+                logger.debug("WebSocket disconnected for %s (game %s) during message processing.", established_client_id, established_game_id)
                 break 
             except Exception as e:
-                print(f"CRITICAL_ERROR: Unexpected error in message loop for {established_client_id} (game {established_game_id}): {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("Unexpected error in message loop for %s (game %s): %s", established_client_id, established_game_id, e)
                 if websocket.client_state == WebSocketState.CONNECTED:
                     try:
-                        await websocket.send_text(json.dumps({"type": "ERROR", "payload": {"message": "A critical server error occurred."}}))
+                        await websocket.send_bytes(ERROR_SERVER_BYTES)
                     except Exception as send_err:
-                        print(f"ERROR: Failed to send critical error msg to client: {send_err}")
+                        logger.error("Failed to send critical error msg to client: %s", send_err)
                 break # Exit message loop on unhandled errors to trigger cleanup
 
     except WebSocketDisconnect:
-        print(f"INFO: Client {established_client_id or 'Unknown'} disconnected (game: {established_game_id or 'Unknown'}). Outer catch.")
+        logger.info("Client %s disconnected (game: %s). Outer catch.", established_client_id or 'Unknown', established_game_id or 'Unknown')
     except Exception as e:
-        print(f"CRITICAL_ERROR: Unhandled exception in WebSocket handler for {established_client_id} (game: {established_game_id}): {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unhandled exception in WebSocket handler for %s (game: %s): %s", established_client_id, established_game_id, e)
         if websocket.client_state == WebSocketState.CONNECTED:
             try:
-                await websocket.send_text(json.dumps({"type": "ERROR", "payload": {"message": "A critical server error occurred."}}))
+                await websocket.send_bytes(ERROR_SERVER_BYTES)
                 await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
             except Exception as close_err:
-                print(f"ERROR: Failed to send error/close websocket after unhandled exception: {close_err}")
+                logger.error("Failed to send error/close websocket after unhandled exception: %s", close_err)
     finally:
-        print(f"INFO: Cleaning up connection for client {established_client_id} in game {established_game_id}.")
-        if established_game_id and established_client_id and established_game_id in active_games:
-            game = active_games[established_game_id]
-            if established_client_id in game.clients:
-                del game.clients[established_client_id]
-                print(f"Removed {established_client_id} from game.clients list.")
-            
-            cleanup_broadcast_needed = False
-            if game.player_a_id == established_client_id:
-                game.player_a_id = None
-                print(f"Player A ({established_client_id}) slot cleared.")
-                if game.current_drawing_player_id == established_client_id:
-                    game.current_drawing_player_id = None
-                if game.current_guessing_player_id == established_client_id:
-                    game.current_guessing_player_id = None
-                cleanup_broadcast_needed = True
-            elif game.player_b_id == established_client_id:
-                game.player_b_id = None
-                print(f"Player B ({established_client_id}) slot cleared.")
-                if game.current_drawing_player_id == established_client_id:
-                    game.current_drawing_player_id = None
-                if game.current_guessing_player_id == established_client_id:
-                    game.current_guessing_player_id = None
-                cleanup_broadcast_needed = True
-            
-            # If a player disconnects and roles become unassigned, try to reassign or handle game state
-            if (game.player_a_id is None or game.player_b_id is None) and not game.game_over:
-                # Logic to pause game or await new player could be added here
-                print(f"INFO: Game {established_game_id} has an open player slot due to disconnect.")
-                if game.current_drawing_player_id is None and game.player_a_id is not None:
-                    game.current_drawing_player_id = game.player_a_id
-                    print(f"INFO: Player A ({game.player_a_id}) becomes drawer by default.")
-                elif game.current_drawing_player_id is None and game.player_b_id is not None:
-                     game.current_drawing_player_id = game.player_b_id
-                     print(f"INFO: Player B ({game.player_b_id}) becomes drawer by default.")
-
-                if game.current_guessing_player_id is None and game.player_b_id is not None and game.player_b_id != game.current_drawing_player_id :
-                    game.current_guessing_player_id = game.player_b_id
-                    print(f"INFO: Player B ({game.player_b_id}) becomes guesser by default.")
-                elif game.current_guessing_player_id is None and game.player_a_id is not None and game.player_a_id != game.current_drawing_player_id:
-                     game.current_guessing_player_id = game.player_a_id
-                     print(f"INFO: Player A ({game.player_a_id}) becomes guesser by default.")
-                cleanup_broadcast_needed = True
-
-
-            if not game.clients:
-                print(f"Game {established_game_id} has no more clients. Removing game.")
-                del active_games[established_game_id]
-            elif cleanup_broadcast_needed:
-                print(f"A player disconnected or roles potentially changed. Broadcasting updated game state for {established_game_id}.")
-                await broadcast_game_state(established_game_id)
-        
-        if websocket.client_state == WebSocketState.CONNECTED:
-            print(f"WebSocket for {established_client_id} still connected in finally. Closing now.")
+        logger.debug("Cleaning up connection for client %s in game %s.", established_client_id, established_game_id)
+        # Stop the writer before touching the socket; gather absorbs the CancelledError (or the
+        # send error that already ended it) so cleanup always proceeds.
+        channel.writer_task.cancel()
+        await asyncio.gather(channel.writer_task, return_exceptions=True)
+        broadcast_needed = game_state.remove_client(established_client_id, channel)
+        if not game_state.clients:
+            # Only unregister the game this connection joined; the id may already belong to a newer game.
+            if active_games.get(established_game_id) is game_state:
+                logger.info("Game %s has no more clients. Removing game.", established_game_id)
+                _unregister_game(established_game_id)
+        elif broadcast_needed:
+            await broadcast_game_state(game_state)
+
+        # Either side may already have closed: the peer (client_state), or this server after a dead game or a
+        # slow or failed writer (application_state). Closing a second time raises.
+        if websocket.client_state == WebSocketState.CONNECTED and websocket.application_state == WebSocketState.CONNECTED:
+            logger.debug("WebSocket for %s still connected in finally. Closing now.", established_client_id)
             await websocket.close()
-        print(f"Connection cleanup for {established_client_id} completed.")
+        logger.debug("Connection cleanup for %s completed.", established_client_id)
 
 @app.get("/api/words", response_model=List[str])
 async def get_random_words_endpoint(): # Renamed to avoid conflict with function name
@@ -914,45 +1073,58 @@ async def _initialize_new_game_state(game_id: str) -> GameState:
         # grid_reveal_status is default initialized in GameState model
         # player_identities is default initialized in GameState model
     )
-    print(f"New GameState object initialized for game_id: {game_id}")
+    game_state._static_json = orjson.dumps({
+        "grid_words": game_state.grid_words,
+        "key_card_a": game_state.key_card_a,
+        "key_card_b": game_state.key_card_b,
+    })
+    logger.debug("New GameState object initialized for game_id: %s", game_id)
     return game_state
 
 @app.post("/api/create_game")
-async def create_game():
+async def create_game() -> Dict[str, str]:
     """HTTP endpoint to create a new game."""
     game_id = generate_memorable_game_id()
     game_state = await _initialize_new_game_state(game_id) # Call helper
-    active_games[game_id] = game_state # Store it
-    print(f"Game {game_id} created via API. Initial state (excluding clients): {game_state.model_dump(exclude={'clients'})}")
+    _register_game(game_state) # Store it
+    logger.info("Game %s created via API.", game_id)
     return {"game_id": game_id, "message": f"Game {game_id} created."}
 
+@app.get("/api/stats")
+async def server_stats() -> Dict[str, int]:
+    """Process-wide counters for monitoring this server."""
+    return {"active_games": len(active_games), "slow_clients_dropped": slow_clients_dropped}
+
 @app.get("/{full_path:path}")
 async def serve_spa(full_path: str):
-    index_file_path = os.path.join(FRONTEND_DIR, "index.html")
-    
-    # Debug logging
-    print(f"Looking for frontend at: {FRONTEND_DIR}")
-    print(f"Frontend directory exists: {os.path.exists(FRONTEND_DIR)}")
-    if os.path.exists(FRONTEND_DIR):
-        print(f"Contents of frontend directory: {os.listdir(FRONTEND_DIR)}")
-    
-    if not os.path.exists(FRONTEND_DIR): # Check parent dir first
-        print(f"Error: Frontend directory not found at {FRONTEND_DIR}")
-        print(f"Current working directory: {os.getcwd()}")
-        print(f"Contents of current directory: {os.listdir('.')}")
+    if not FRONTEND_DIR_EXISTS:
+        logger.error("Frontend directory not found at %s", FRONTEND_DIR)
+        logger.error("Current working directory: %s", os.getcwd())
+        logger.error("Contents of current directory: %s", os.listdir('.'))
         return {"message": "Frontend directory not found. Build the frontend.", "debug": {"frontend_dir": FRONTEND_DIR, "cwd": os.getcwd()}}
 
-    if not os.path.exists(index_file_path) and full_path != "favicon.ico":
-        print(f"Warning: index.html not found at {index_file_path}.")
-        return {"message": "index.html not found. Ensure the frontend is built.", "debug": {"index_path": index_file_path}}
-    
-    potential_file_path = os.path.join(FRONTEND_DIR, full_path)
-    if os.path.isfile(potential_file_path):
-        return FileResponse(potential_file_path)
-        
-    return FileResponse(index_file_path)
+    if INDEX_BYTES is None and full_path != "favicon.ico":
+        logger.warning("index.html not found at %s.", INDEX_FILE_PATH)
+        return {"message": "index.html not found. Ensure the frontend is built.", "debug": {"index_path": INDEX_FILE_PATH}}
+
+    static_file = STATIC_FILES.get(full_path) if full_path != "index.html" else None
+    if static_file is not None:
+        return FileResponse(static_file[0], stat_result=static_file[1])
+
+    if INDEX_BYTES is None:
+        return Response(status_code=status.HTTP_404_NOT_FOUND)
+    return Response(content=INDEX_BYTES, media_type="text/html", headers=INDEX_HEADERS)
 
 if __name__ == "__main__":
     import os
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port, reload=False)
\ No newline at end of file
+    # uvloop, httptools and websockets all ship with uvicorn[standard]; naming them makes uvicorn
+    # fail loudly instead of silently falling back to the slower pure-Python implementations.
+    # uvloop does not support Windows, so local development there runs on the stock asyncio loop.
+    # permessage-deflate is off: it compresses separately for every socket, whereas large messages
+    # are compressed once per broadcast in _compress_large.
+    uvicorn.run(
+        app, host="0.0.0.0", port=port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop", http="httptools", ws="websockets",
+        ws_per_message_deflate=False, reload=False,
+    )
\ No newline at end of file
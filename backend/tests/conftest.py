@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+# main.py is run as a script from backend/, not installed as a package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import main  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _clear_games():
+    main.active_games.clear()
+    main.active_games_ci.clear()
+    yield
+    main.active_games.clear()
+    main.active_games_ci.clear()
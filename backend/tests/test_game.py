@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from starlette.websockets import WebSocketDisconnect
+
+import main
+
+
+class _CleanupWatcher(logging.Handler):
+    """Counts the endpoint's "cleanup completed" records so a test can wait for a connection to finish.
+
+    TestClient cancels the endpoint as soon as its context exits, which would cut the cleanup short,
+    so tests disconnect explicitly and wait here first.
+    """
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.completed = 0
+        self.condition = threading.Condition()
+
+    def emit(self, record):
+        if record.msg.startswith("Connection cleanup for"):
+            with self.condition:
+                self.completed += 1
+                self.condition.notify_all()
+
+    def wait_for(self, count):
+        with self.condition:
+            assert self.condition.wait_for(lambda: self.completed >= count, timeout=5)
+
+    def disconnect(self, ws):
+        expected = self.completed + 1
+        ws.close()
+        self.wait_for(expected)
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def cleanup():
+    watcher = _CleanupWatcher()
+    level = main.logger.level
+    main.logger.setLevel(logging.DEBUG)
+    main.logger.addHandler(watcher)
+    yield watcher
+    main.logger.removeHandler(watcher)
+    main.logger.setLevel(level)
+
+
+def _receive_until_closed(ws) -> int:
+    """Reads frames until the server closes the socket; returns the close code."""
+    with pytest.raises(WebSocketDisconnect) as closed:
+        while True:
+            ws.receive_bytes()
+    return closed.value.code
+
+
+def test_normalize_points_accepts_pairs_and_objects():
+    assert main._normalize_points([[1, 2], {"x": 3, "y": "4.5"}]) == [[1.0, 2.0], [3.0, 4.5]]
+
+
+@pytest.mark.parametrize("points", [[[1]], [[1, 2, 3]], [{"x": 1}], [["a", "b"]], [None]])
+def test_normalize_points_rejects_malformed_points(points):
+    assert main._normalize_points(points) is None
+
+
+def test_validate_stroke_accepts_both_point_forms():
+    from_pairs = main._validate_stroke({"points": [[1, 2], [3, 4]], "color": "#ff0000", "width": 3})
+    from_objects = main._validate_stroke({"points": [{"x": 1, "y": 2}, {"x": 3, "y": 4}]})
+    assert from_pairs.points == [(1.0, 2.0), (3.0, 4.0)]
+    assert from_objects.points == [(1.0, 2.0), (3.0, 4.0)]
+    assert from_pairs.color == "#ff0000"
+
+
+def test_validate_stroke_rejects_malformed_points():
+    with pytest.raises(ValidationError):
+        main._validate_stroke({"points": [[1, 2, 3]]})
+    with pytest.raises(ValidationError):
+        main._validate_stroke({"points": [{"x": 1}]})
+
+
+def test_game_id_lookup_is_case_insensitive(client, cleanup):
+    main._register_game(asyncio.run(main._initialize_new_game_state("BraveOtter7")))
+    game_state = main.active_games["BraveOtter7"]
+
+    with client.websocket_connect("/ws/braveotter7/alice") as ws:
+        ws.receive_bytes()
+        assert list(main.active_games) == ["BraveOtter7"]
+        assert "alice" in game_state.clients
+        cleanup.disconnect(ws)
+
+    # The last client leaving removes the game from both maps
+    assert main.active_games == {}
+    assert main.active_games_ci == {}
+
+
+def test_stale_connection_does_not_evict_its_replacement(client, cleanup):
+    with client.websocket_connect("/ws/reuse/alice") as stale:
+        stale.receive_bytes()
+        with client.websocket_connect("/ws/reuse/alice") as replacement:
+            replacement.receive_bytes()
+            cleanup.disconnect(stale)
+
+            # The stale socket closing must leave the reconnected client, and so the game, in place
+            game_state = main.active_games["reuse"]
+            assert list(game_state.clients) == ["alice"]
+            assert game_state.player_a_id == "alice"
+
+            cleanup.disconnect(replacement)
+            assert "reuse" not in main.active_games
+
+
+def test_orphaned_connection_does_not_touch_a_newer_game_with_the_same_id(client, cleanup):
+    with client.websocket_connect("/ws/reuse/alice") as orphan:
+        orphan.receive_bytes()
+        with client.websocket_connect("/ws/reuse/alice") as replacement:
+            replacement.receive_bytes()
+            cleanup.disconnect(replacement)
+        # The replacement held the registered channel, so its leaving ends the game
+        assert "reuse" not in main.active_games
+
+        with client.websocket_connect("/ws/reuse/bob") as bob:
+            bob.receive_bytes()
+            newer_game = main.active_games["reuse"]
+
+            expected = cleanup.completed + 1
+            orphan.send_text('{"type":"CLEAR_CANVAS","payload":{}}')
+            assert _receive_until_closed(orphan) == 1011
+            cleanup.wait_for(expected)
+
+            assert main.active_games["reuse"] is newer_game
+            assert list(newer_game.clients) == ["bob"]
+            cleanup.disconnect(bob)
@@ -0,0 +1,104 @@
+import asyncio
+import zlib
+
+import main
+
+
+class FakeWebSocket:
+    """Records what the writer sends and how it closes; optionally fails every send."""
+
+    def __init__(self, fail_with=None):
+        self.sent = []
+        self.close_codes = []
+        self.fail_with = fail_with
+
+    async def send_bytes(self, data):
+        if self.fail_with is not None:
+            raise self.fail_with
+        self.sent.append(data)
+
+    async def close(self, code=1000):
+        self.close_codes.append(code)
+
+
+async def _drain(channel):
+    """Runs the channel's writer until it has emptied the queue, then stops it."""
+    writer = asyncio.create_task(main._client_writer("c", channel))
+    while not channel.send_queue.empty() and not writer.done():
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    writer.cancel()
+    await asyncio.gather(writer, return_exceptions=True)
+
+
+def test_queue_overflow_closes_with_1013():
+    async def run():
+        channel = main.ClientChannel(websocket=FakeWebSocket())
+        for i in range(main.CLIENT_SEND_QUEUE_SIZE + 1):
+            channel.enqueue(b'{"n":%d}' % i)
+        channel.enqueue(b'{"late":true}')
+        await main._client_writer("slow", channel)
+        return channel
+
+    dropped_before = main.slow_clients_dropped
+    channel = asyncio.run(run())
+    assert channel.overflowed
+    assert channel.websocket.sent == []
+    assert channel.websocket.close_codes == [main.SLOW_CLIENT_CLOSE_CODE]
+    assert main.slow_clients_dropped == dropped_before + 1
+
+
+def test_writer_batches_queued_messages_into_one_frame():
+    async def run():
+        channel = main.ClientChannel(websocket=FakeWebSocket())
+        for message in (b'{"a":1}', b'{"b":2}', b'{"c":3}'):
+            channel.enqueue(message)
+        await _drain(channel)
+        return channel
+
+    channel = asyncio.run(run())
+    assert channel.websocket.sent == [b'[{"a":1},{"b":2},{"c":3}]']
+    assert channel.websocket.close_codes == []
+
+
+def test_writer_closes_socket_after_unexpected_send_error():
+    async def run():
+        channel = main.ClientChannel(websocket=FakeWebSocket(fail_with=ValueError("boom")))
+        channel.enqueue(b'{"a":1}')
+        await main._client_writer("c", channel)
+        return channel
+
+    channel = asyncio.run(run())
+    assert channel.websocket.close_codes == [1011]
+
+
+def test_writer_leaves_disconnected_socket_alone():
+    async def run():
+        channel = main.ClientChannel(websocket=FakeWebSocket(fail_with=OSError("gone")))
+        channel.enqueue(b'{"a":1}')
+        await main._client_writer("c", channel)
+        return channel
+
+    channel = asyncio.run(run())
+    assert channel.websocket.close_codes == []
+
+
+def test_coalesce_joins_plain_messages_into_an_array():
+    assert main._coalesce([b'{"a":1}']) == [b'{"a":1}']
+    assert main._coalesce([b'{"a":1}', b'{"b":2}']) == [b'[{"a":1},{"b":2}]']
+
+
+def test_compress_large_only_compresses_past_the_threshold():
+    small = b'{"a":1}'
+    assert main._compress_large(small) is small
+
+    large = b'{"x":"' + b"a" * main.COMPRESS_THRESHOLD + b'"}'
+    compressed = main._compress_large(large)
+    assert compressed[0] == 0x78
+    assert zlib.decompress(compressed) == large
+
+
+def test_coalesce_sends_compressed_messages_on_their_own():
+    compressed = main._compress_large(b'{"x":"' + b"a" * main.COMPRESS_THRESHOLD + b'"}')
+    frames = main._coalesce([b'{"a":1}', b'{"b":2}', compressed, b'{"c":3}'])
+    assert frames == [b'[{"a":1},{"b":2}]', compressed, b'{"c":3}']
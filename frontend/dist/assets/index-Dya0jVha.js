@@ -1,177 +0,0 @@
-var GS=(n,i)=>()=>(i||n((i={exports:{}}).exports,i),i.exports);var FN=GS((yi,bi)=>{(function(){const i=document.createElement("link").relList;if(i&&i.supports&&i.supports("modulepreload"))return;for(const c of document.querySelectorAll('link[rel="modulepreload"]'))s(c);new MutationObserver(c=>{for(const h of c)if(h.type==="childList")for(const d of h.addedNodes)d.tagName==="LINK"&&d.rel==="modulepreload"&&s(d)}).observe(document,{childList:!0,subtree:!0});function u(c){const h={};return c.integrity&&(h.integrity=c.integrity),c.referrerPolicy&&(h.referrerPolicy=c.referrerPolicy),c.crossOrigin==="use-credentials"?h.credentials="include":c.crossOrigin==="anonymous"?h.credentials="omit":h.credentials="same-origin",h}function s(c){if(c.ep)return;c.ep=!0;const h=u(c);fetch(c.href,h)}})();var Uc=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{};function Ku(n){return n&&n.__esModule&&Object.prototype.hasOwnProperty.call(n,"default")?n.default:n}var Sg={exports:{}},oh={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ky;function qS(){if(Ky)return oh;Ky=1;var n=Symbol.for("react.transitional.element"),i=Symbol.for("react.fragment");function u(s,c,h){var d=null;if(h!==void 0&&(d=""+h),c.key!==void 0&&(d=""+c.key),"key"in c){h={};for(var g in c)g!=="key"&&(h[g]=c[g])}else h=c;return c=h.ref,{$$typeof:n,type:s,key:d,ref:c!==void 0?c:null,props:h}}return oh.Fragment=i,oh.jsx=u,oh.jsxs=u,oh}var Fy;function HS(){return Fy||(Fy=1,Sg.exports=qS()),Sg.exports}var he=HS(),xg={exports:{}},ut={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var ky;function BS(){if(ky)return ut;ky=1;var n=Symbol.for("react.transitional.element"),i=Symbol.for("react.portal"),u=Symbol.for("react.fragment"),s=Symbol.for("react.strict_mode"),c=Symbol.for("react.profiler"),h=Symbol.for("react.consumer"),d=Symbol.for("react.context"),g=Symbol.for("react.forward_ref"),v=Symbol.for("react.suspense"),p=Symbol.for("react.memo"),_=Symbol.for("react.lazy"),T=Symbol.iterator;function C(j){return j===null||typeof j!="object"?null:(j=T&&j[T]||j["@@iterator"],typeof j=="function"?j:null)}var x={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},E=Object.assign,O={};function w(j,te,de){this.props=j,this.context=te,this.refs=O,this.updater=de||x}w.prototype.isReactComponent={},w.prototype.setState=function(j,te){if(typeof j!="object"&&typeof j!="function"&&j!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,j,te,"setState")},w.prototype.forceUpdate=function(j){this.updater.enqueueForceUpdate(this,j,"forceUpdate")};function U(){}U.prototype=w.prototype;function A(j,te,de){this.props=j,this.context=te,this.refs=O,this.updater=de||x}var R=A.prototype=new U;R.constructor=A,E(R,w.prototype),R.isPureReactComponent=!0;var z=Array.isArray,G={H:null,A:null,T:null,S:null,V:null},B=Object.prototype.hasOwnProperty;function Q(j,te,de,ne,ce,Se){return de=Se.ref,{$$typeof:n,type:j,key:te,ref:de!==void 0?de:null,props:Se}}function X(j,te){return Q(j.type,te,void 0,void 0,void 0,j.props)}function Y(j){return typeof j=="object"&&j!==null&&j.$$typeof===n}function V(j){var te={"=":"=0",":":"=2"};return"$"+j.replace(/[=:]/g,function(de){return te[de]})}var F=/\/+/g;function I(j,te){return typeof j=="object"&&j!==null&&j.key!=null?V(""+j.key):te.toString(36)}function D(){}function P(j){switch(j.status){case"fulfilled":return j.value;case"rejected":throw j.reason;default:switch(typeof j.status=="string"?j.then(D,D):(j.status="pending",j.then(function(te){j.status==="pending"&&(j.status="fulfilled",j.value=te)},function(te){j.status==="pending"&&(j.status="rejected",j.reason=te)})),j.status){case"fulfilled":return j.value;case"rejected":throw j.reason}}throw j}function H(j,te,de,ne,ce){var Se=typeof j;(Se==="undefined"||Se==="boolean")&&(j=null);var xe=!1;if(j===null)xe=!0;else switch(Se){case"bigint":case"string":case"number":xe=!0;break;case"object":switch(j.$$typeof){case n:case i:xe=!0;break;case _:return xe=j._init,H(xe(j._payload),te,de,ne,ce)}}if(xe)return ce=ce(j),xe=ne===""?"."+I(j,0):ne,z(ce)?(de="",xe!=null&&(de=xe.replace(F,"$&/")+"/"),H(ce,te,de,"",function(Te){return Te})):ce!=null&&(Y(ce)&&(ce=X(ce,de+(ce.key==null||j&&j.key===ce.key?"":(""+ce.key).replace(F,"$&/")+"/")+xe)),te.push(ce)),1;xe=0;var $=ne===""?".":ne+":";if(z(j))for(var oe=0;oe<j.length;oe++)ne=j[oe],Se=$+I(ne,oe),xe+=H(ne,te,de,Se,ce);else if(oe=C(j),typeof oe=="function")for(j=oe.call(j),oe=0;!(ne=j.next()).done;)ne=ne.value,Se=$+I(ne,oe++),xe+=H(ne,te,de,Se,ce);else if(Se==="object"){if(typeof j.then=="function")return H(P(j),te,de,ne,ce);throw te=String(j),Error("Objects are not valid as a React child (found: "+(te==="[object Object]"?"object with keys {"+Object.keys(j).join(", ")+"}":te)+"). If you meant to render a collection of children, use an array instead.")}return xe}function N(j,te,de){if(j==null)return j;var ne=[],ce=0;return H(j,ne,"","",function(Se){return te.call(de,Se,ce++)}),ne}function L(j){if(j._status===-1){var te=j._result;te=te(),te.then(function(de){(j._status===0||j._status===-1)&&(j._status=1,j._result=de)},function(de){(j._status===0||j._status===-1)&&(j._status=2,j._result=de)}),j._status===-1&&(j._status=0,j._result=te)}if(j._status===1)return j._result.default;throw j._result}var Z=typeof reportError=="function"?reportError:function(j){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var te=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof j=="object"&&j!==null&&typeof j.message=="string"?String(j.message):String(j),error:j});if(!window.dispatchEvent(te))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",j);return}console.error(j)};function ae(){}return ut.Children={map:N,forEach:function(j,te,de){N(j,function(){te.apply(this,arguments)},de)},count:function(j){var te=0;return N(j,function(){te++}),te},toArray:function(j){return N(j,function(te){return te})||[]},only:function(j){if(!Y(j))throw Error("React.Children.only expected to receive a single React element child.");return j}},ut.Component=w,ut.Fragment=u,ut.Profiler=c,ut.PureComponent=A,ut.StrictMode=s,ut.Suspense=v,ut.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=G,ut.__COMPILER_RUNTIME={__proto__:null,c:function(j){return G.H.useMemoCache(j)}},ut.cache=function(j){return function(){return j.apply(null,arguments)}},ut.cloneElement=function(j,te,de){if(j==null)throw Error("The argument must be a React element, but you passed "+j+".");var ne=E({},j.props),ce=j.key,Se=void 0;if(te!=null)for(xe in te.ref!==void 0&&(Se=void 0),te.key!==void 0&&(ce=""+te.key),te)!B.call(te,xe)||xe==="key"||xe==="__self"||xe==="__source"||xe==="ref"&&te.ref===void 0||(ne[xe]=te[xe]);var xe=arguments.length-2;if(xe===1)ne.children=de;else if(1<xe){for(var $=Array(xe),oe=0;oe<xe;oe++)$[oe]=arguments[oe+2];ne.children=$}return Q(j.type,ce,void 0,void 0,Se,ne)},ut.createContext=function(j){return j={$$typeof:d,_currentValue:j,_currentValue2:j,_threadCount:0,Provider:null,Consumer:null},j.Provider=j,j.Consumer={$$typeof:h,_context:j},j},ut.createElement=function(j,te,de){var ne,ce={},Se=null;if(te!=null)for(ne in te.key!==void 0&&(Se=""+te.key),te)B.call(te,ne)&&ne!=="key"&&ne!=="__self"&&ne!=="__source"&&(ce[ne]=te[ne]);var xe=arguments.length-2;if(xe===1)ce.children=de;else if(1<xe){for(var $=Array(xe),oe=0;oe<xe;oe++)$[oe]=arguments[oe+2];ce.children=$}if(j&&j.defaultProps)for(ne in xe=j.defaultProps,xe)ce[ne]===void 0&&(ce[ne]=xe[ne]);return Q(j,Se,void 0,void 0,null,ce)},ut.createRef=function(){return{current:null}},ut.forwardRef=function(j){return{$$typeof:g,render:j}},ut.isValidElement=Y,ut.lazy=function(j){return{$$typeof:_,_payload:{_status:-1,_result:j},_init:L}},ut.memo=function(j,te){return{$$typeof:p,type:j,compare:te===void 0?null:te}},ut.startTransition=function(j){var te=G.T,de={};G.T=de;try{var ne=j(),ce=G.S;ce!==null&&ce(de,ne),typeof ne=="object"&&ne!==null&&typeof ne.then=="function"&&ne.then(ae,Z)}catch(Se){Z(Se)}finally{G.T=te}},ut.unstable_useCacheRefresh=function(){return G.H.useCacheRefresh()},ut.use=function(j){return G.H.use(j)},ut.useActionState=function(j,te,de){return G.H.useActionState(j,te,de)},ut.useCallback=function(j,te){return G.H.useCallback(j,te)},ut.useContext=function(j){return G.H.useContext(j)},ut.useDebugValue=function(){},ut.useDeferredValue=function(j,te){return G.H.useDeferredValue(j,te)},ut.useEffect=function(j,te,de){var ne=G.H;if(typeof de=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return ne.useEffect(j,te)},ut.useId=function(){return G.H.useId()},ut.useImperativeHandle=function(j,te,de){return G.H.useImperativeHandle(j,te,de)},ut.useInsertionEffect=function(j,te){return G.H.useInsertionEffect(j,te)},ut.useLayoutEffect=function(j,te){return G.H.useLayoutEffect(j,te)},ut.useMemo=function(j,te){return G.H.useMemo(j,te)},ut.useOptimistic=function(j,te){return G.H.useOptimistic(j,te)},ut.useReducer=function(j,te,de){return G.H.useReducer(j,te,de)},ut.useRef=function(j){return G.H.useRef(j)},ut.useState=function(j){return G.H.useState(j)},ut.useSyncExternalStore=function(j,te,de){return G.H.useSyncExternalStore(j,te,de)},ut.useTransition=function(){return G.H.useTransition()},ut.version="19.1.0",ut}var Qy;function Fu(){return Qy||(Qy=1,xg.exports=BS()),xg.exports}var ue=Fu();const J=Ku(ue);var Eg={exports:{}},ch={},Cg={exports:{}},Tg={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Zy;function LS(){return Zy||(Zy=1,function(n){function i(N,L){var Z=N.length;N.push(L);e:for(;0<Z;){var ae=Z-1>>>1,j=N[ae];if(0<c(j,L))N[ae]=L,N[Z]=j,Z=ae;else break e}}function u(N){return N.length===0?null:N[0]}function s(N){if(N.length===0)return null;var L=N[0],Z=N.pop();if(Z!==L){N[0]=Z;e:for(var ae=0,j=N.length,te=j>>>1;ae<te;){var de=2*(ae+1)-1,ne=N[de],ce=de+1,Se=N[ce];if(0>c(ne,Z))ce<j&&0>c(Se,ne)?(N[ae]=Se,N[ce]=Z,ae=ce):(N[ae]=ne,N[de]=Z,ae=de);else if(ce<j&&0>c(Se,Z))N[ae]=Se,N[ce]=Z,ae=ce;else break e}}return L}function c(N,L){var Z=N.sortIndex-L.sortIndex;return Z!==0?Z:N.id-L.id}if(n.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var h=performance;n.unstable_now=function(){return h.now()}}else{var d=Date,g=d.now();n.unstable_now=function(){return d.now()-g}}var v=[],p=[],_=1,T=null,C=3,x=!1,E=!1,O=!1,w=!1,U=typeof setTimeout=="function"?setTimeout:null,A=typeof clearTimeout=="function"?clearTimeout:null,R=typeof setImmediate<"u"?setImmediate:null;function z(N){for(var L=u(p);L!==null;){if(L.callback===null)s(p);else if(L.startTime<=N)s(p),L.sortIndex=L.expirationTime,i(v,L);else break;L=u(p)}}function G(N){if(O=!1,z(N),!E)if(u(v)!==null)E=!0,B||(B=!0,I());else{var L=u(p);L!==null&&H(G,L.startTime-N)}}var B=!1,Q=-1,X=5,Y=-1;function V(){return w?!0:!(n.unstable_now()-Y<X)}function F(){if(w=!1,B){var N=n.unstable_now();Y=N;var L=!0;try{e:{E=!1,O&&(O=!1,A(Q),Q=-1),x=!0;var Z=C;try{t:{for(z(N),T=u(v);T!==null&&!(T.expirationTime>N&&V());){var ae=T.callback;if(typeof ae=="function"){T.callback=null,C=T.priorityLevel;var j=ae(T.expirationTime<=N);if(N=n.unstable_now(),typeof j=="function"){T.callback=j,z(N),L=!0;break t}T===u(v)&&s(v),z(N)}else s(v);T=u(v)}if(T!==null)L=!0;else{var te=u(p);te!==null&&H(G,te.startTime-N),L=!1}}break e}finally{T=null,C=Z,x=!1}L=void 0}}finally{L?I():B=!1}}}var I;if(typeof R=="function")I=function(){R(F)};else if(typeof MessageChannel<"u"){var D=new MessageChannel,P=D.port2;D.port1.onmessage=F,I=function(){P.postMessage(null)}}else I=function(){U(F,0)};function H(N,L){Q=U(function(){N(n.unstable_now())},L)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(N){N.callback=null},n.unstable_forceFrameRate=function(N){0>N||125<N?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):X=0<N?Math.floor(1e3/N):5},n.unstable_getCurrentPriorityLevel=function(){return C},n.unstable_next=function(N){switch(C){case 1:case 2:case 3:var L=3;break;default:L=C}var Z=C;C=L;try{return N()}finally{C=Z}},n.unstable_requestPaint=function(){w=!0},n.unstable_runWithPriority=function(N,L){switch(N){case 1:case 2:case 3:case 4:case 5:break;default:N=3}var Z=C;C=N;try{return L()}finally{C=Z}},n.unstable_scheduleCallback=function(N,L,Z){var ae=n.unstable_now();switch(typeof Z=="object"&&Z!==null?(Z=Z.delay,Z=typeof Z=="number"&&0<Z?ae+Z:ae):Z=ae,N){case 1:var j=-1;break;case 2:j=250;break;case 5:j=1073741823;break;case 4:j=1e4;break;default:j=5e3}return j=Z+j,N={id:_++,callback:L,priorityLevel:N,startTime:Z,expirationTime:j,sortIndex:-1},Z>ae?(N.sortIndex=Z,i(p,N),u(v)===null&&N===u(p)&&(O?(A(Q),Q=-1):O=!0,H(G,Z-ae))):(N.sortIndex=j,i(v,N),E||x||(E=!0,B||(B=!0,I()))),N},n.unstable_shouldYield=V,n.unstable_wrapCallback=function(N){var L=C;return function(){var Z=C;C=L;try{return N.apply(this,arguments)}finally{C=Z}}}}(Tg)),Tg}var Jy;function jS(){return Jy||(Jy=1,Cg.exports=LS()),Cg.exports}var Ag={exports:{}},Sn={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Wy;function VS(){if(Wy)return Sn;Wy=1;var n=Fu();function i(v){var p="https://react.dev/errors/"+v;if(1<arguments.length){p+="?args[]="+encodeURIComponent(arguments[1]);for(var _=2;_<arguments.length;_++)p+="&args[]="+encodeURIComponent(arguments[_])}return"Minified React error #"+v+"; visit "+p+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function u(){}var s={d:{f:u,r:function(){throw Error(i(522))},D:u,C:u,L:u,m:u,X:u,S:u,M:u},p:0,findDOMNode:null},c=Symbol.for("react.portal");function h(v,p,_){var T=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:c,key:T==null?null:""+T,children:v,containerInfo:p,implementation:_}}var d=n.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function g(v,p){if(v==="font")return"";if(typeof p=="string")return p==="use-credentials"?p:""}return Sn.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=s,Sn.createPortal=function(v,p){var _=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!p||p.nodeType!==1&&p.nodeType!==9&&p.nodeType!==11)throw Error(i(299));return h(v,p,null,_)},Sn.flushSync=function(v){var p=d.T,_=s.p;try{if(d.T=null,s.p=2,v)return v()}finally{d.T=p,s.p=_,s.d.f()}},Sn.preconnect=function(v,p){typeof v=="string"&&(p?(p=p.crossOrigin,p=typeof p=="string"?p==="use-credentials"?p:"":void 0):p=null,s.d.C(v,p))},Sn.prefetchDNS=function(v){typeof v=="string"&&s.d.D(v)},Sn.preinit=function(v,p){if(typeof v=="string"&&p&&typeof p.as=="string"){var _=p.as,T=g(_,p.crossOrigin),C=typeof p.integrity=="string"?p.integrity:void 0,x=typeof p.fetchPriority=="string"?p.fetchPriority:void 0;_==="style"?s.d.S(v,typeof p.precedence=="string"?p.precedence:void 0,{crossOrigin:T,integrity:C,fetchPriority:x}):_==="script"&&s.d.X(v,{crossOrigin:T,integrity:C,fetchPriority:x,nonce:typeof p.nonce=="string"?p.nonce:void 0})}},Sn.preinitModule=function(v,p){if(typeof v=="string")if(typeof p=="object"&&p!==null){if(p.as==null||p.as==="script"){var _=g(p.as,p.crossOrigin);s.d.M(v,{crossOrigin:_,integrity:typeof p.integrity=="string"?p.integrity:void 0,nonce:typeof p.nonce=="string"?p.nonce:void 0})}}else p==null&&s.d.M(v)},Sn.preload=function(v,p){if(typeof v=="string"&&typeof p=="object"&&p!==null&&typeof p.as=="string"){var _=p.as,T=g(_,p.crossOrigin);s.d.L(v,_,{crossOrigin:T,integrity:typeof p.integrity=="string"?p.integrity:void 0,nonce:typeof p.nonce=="string"?p.nonce:void 0,type:typeof p.type=="string"?p.type:void 0,fetchPriority:typeof p.fetchPriority=="string"?p.fetchPriority:void 0,referrerPolicy:typeof p.referrerPolicy=="string"?p.referrerPolicy:void 0,imageSrcSet:typeof p.imageSrcSet=="string"?p.imageSrcSet:void 0,imageSizes:typeof p.imageSizes=="string"?p.imageSizes:void 0,media:typeof p.media=="string"?p.media:void 0})}},Sn.preloadModule=function(v,p){if(typeof v=="string")if(p){var _=g(p.as,p.crossOrigin);s.d.m(v,{as:typeof p.as=="string"&&p.as!=="script"?p.as:void 0,crossOrigin:_,integrity:typeof p.integrity=="string"?p.integrity:void 0})}else s.d.m(v)},Sn.requestFormReset=function(v){s.d.r(v)},Sn.unstable_batchedUpdates=function(v,p){return v(p)},Sn.useFormState=function(v,p,_){return d.H.useFormState(v,p,_)},Sn.useFormStatus=function(){return d.H.useHostTransitionStatus()},Sn.version="19.1.0",Sn}var Iy;function YS(){if(Iy)return Ag.exports;Iy=1;function n(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(n)}catch(i){console.error(i)}}return n(),Ag.exports=VS(),Ag.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var $y;function PS(){if($y)return ch;$y=1;var n=jS(),i=Fu(),u=YS();function s(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var l=2;l<arguments.length;l++)t+="&args[]="+encodeURIComponent(arguments[l])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function c(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function h(e){var t=e,l=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,(t.flags&4098)!==0&&(l=t.return),e=t.return;while(e)}return t.tag===3?l:null}function d(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function g(e){if(h(e)!==e)throw Error(s(188))}function v(e){var t=e.alternate;if(!t){if(t=h(e),t===null)throw Error(s(188));return t!==e?null:e}for(var l=e,o=t;;){var m=l.return;if(m===null)break;var b=m.alternate;if(b===null){if(o=m.return,o!==null){l=o;continue}break}if(m.child===b.child){for(b=m.child;b;){if(b===l)return g(m),e;if(b===o)return g(m),t;b=b.sibling}throw Error(s(188))}if(l.return!==o.return)l=m,o=b;else{for(var q=!1,K=m.child;K;){if(K===l){q=!0,l=m,o=b;break}if(K===o){q=!0,o=m,l=b;break}K=K.sibling}if(!q){for(K=b.child;K;){if(K===l){q=!0,l=b,o=m;break}if(K===o){q=!0,o=b,l=m;break}K=K.sibling}if(!q)throw Error(s(189))}}if(l.alternate!==o)throw Error(s(190))}if(l.tag!==3)throw Error(s(188));return l.stateNode.current===l?e:t}function p(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e;for(e=e.child;e!==null;){if(t=p(e),t!==null)return t;e=e.sibling}return null}var _=Object.assign,T=Symbol.for("react.element"),C=Symbol.for("react.transitional.element"),x=Symbol.for("react.portal"),E=Symbol.for("react.fragment"),O=Symbol.for("react.strict_mode"),w=Symbol.for("react.profiler"),U=Symbol.for("react.provider"),A=Symbol.for("react.consumer"),R=Symbol.for("react.context"),z=Symbol.for("react.forward_ref"),G=Symbol.for("react.suspense"),B=Symbol.for("react.suspense_list"),Q=Symbol.for("react.memo"),X=Symbol.for("react.lazy"),Y=Symbol.for("react.activity"),V=Symbol.for("react.memo_cache_sentinel"),F=Symbol.iterator;function I(e){return e===null||typeof e!="object"?null:(e=F&&e[F]||e["@@iterator"],typeof e=="function"?e:null)}var D=Symbol.for("react.client.reference");function P(e){if(e==null)return null;if(typeof e=="function")return e.$$typeof===D?null:e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case E:return"Fragment";case w:return"Profiler";case O:return"StrictMode";case G:return"Suspense";case B:return"SuspenseList";case Y:return"Activity"}if(typeof e=="object")switch(e.$$typeof){case x:return"Portal";case R:return(e.displayName||"Context")+".Provider";case A:return(e._context.displayName||"Context")+".Consumer";case z:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case Q:return t=e.displayName||null,t!==null?t:P(e.type)||"Memo";case X:t=e._payload,e=e._init;try{return P(e(t))}catch{}}return null}var H=Array.isArray,N=i.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,L=u.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,Z={pending:!1,data:null,method:null,action:null},ae=[],j=-1;function te(e){return{current:e}}function de(e){0>j||(e.current=ae[j],ae[j]=null,j--)}function ne(e,t){j++,ae[j]=e.current,e.current=t}var ce=te(null),Se=te(null),xe=te(null),$=te(null);function oe(e,t){switch(ne(xe,t),ne(Se,e),ne(ce,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?by(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)t=by(t),e=_y(t,e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}de(ce),ne(ce,e)}function Te(){de(ce),de(Se),de(xe)}function Re(e){e.memoizedState!==null&&ne($,e);var t=ce.current,l=_y(t,e.type);t!==l&&(ne(Se,e),ne(ce,l))}function Me(e){Se.current===e&&(de(ce),de(Se)),$.current===e&&(de($),ih._currentValue=Z)}var Ge=Object.prototype.hasOwnProperty,$e=n.unstable_scheduleCallback,et=n.unstable_cancelCallback,ze=n.unstable_shouldYield,At=n.unstable_requestPaint,we=n.unstable_now,ft=n.unstable_getCurrentPriorityLevel,na=n.unstable_ImmediatePriority,Rt=n.unstable_UserBlockingPriority,Vt=n.unstable_NormalPriority,ht=n.unstable_LowPriority,lt=n.unstable_IdlePriority,ma=n.log,Ca=n.unstable_setDisableYieldValue,Zt=null,Dt=null;function Fe(e){if(typeof ma=="function"&&Ca(e),Dt&&typeof Dt.setStrictMode=="function")try{Dt.setStrictMode(Zt,e)}catch{}}var zt=Math.clz32?Math.clz32:ya,tn=Math.log,ka=Math.LN2;function ya(e){return e>>>=0,e===0?32:31-(tn(e)/ka|0)|0}var mt=256,yt=4194304;function He(e){var t=e&42;if(t!==0)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return e&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function Gt(e,t,l){var o=e.pendingLanes;if(o===0)return 0;var m=0,b=e.suspendedLanes,q=e.pingedLanes;e=e.warmLanes;var K=o&134217727;return K!==0?(o=K&~b,o!==0?m=He(o):(q&=K,q!==0?m=He(q):l||(l=K&~e,l!==0&&(m=He(l))))):(K=o&~b,K!==0?m=He(K):q!==0?m=He(q):l||(l=o&~e,l!==0&&(m=He(l)))),m===0?0:t!==0&&t!==m&&(t&b)===0&&(b=m&-m,l=t&-t,b>=l||b===32&&(l&4194048)!==0)?t:m}function It(e,t){return(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)===0}function Na(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function oa(){var e=mt;return mt<<=1,(mt&4194048)===0&&(mt=256),e}function br(){var e=yt;return yt<<=1,(yt&62914560)===0&&(yt=4194304),e}function Yi(e){for(var t=[],l=0;31>l;l++)t.push(e);return t}function Jt(e,t){e.pendingLanes|=t,t!==268435456&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function ca(e,t,l,o,m,b){var q=e.pendingLanes;e.pendingLanes=l,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=l,e.entangledLanes&=l,e.errorRecoveryDisabledLanes&=l,e.shellSuspendCounter=0;var K=e.entanglements,W=e.expirationTimes,ge=e.hiddenUpdates;for(l=q&~l;0<l;){var _e=31-zt(l),Ce=1<<_e;K[_e]=0,W[_e]=-1;var ve=ge[_e];if(ve!==null)for(ge[_e]=null,_e=0;_e<ve.length;_e++){var me=ve[_e];me!==null&&(me.lane&=-536870913)}l&=~Ce}o!==0&&it(e,o,0),b!==0&&m===0&&e.tag!==0&&(e.suspendedLanes|=b&~(q&~t))}function it(e,t,l){e.pendingLanes|=t,e.suspendedLanes&=~t;var o=31-zt(t);e.entangledLanes|=t,e.entanglements[o]=e.entanglements[o]|1073741824|l&4194090}function Zu(e,t){var l=e.entangledLanes|=t;for(e=e.entanglements;l;){var o=31-zt(l),m=1<<o;m&t|e[o]&t&&(e[o]|=t),l&=~m}}function _r(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function fl(e){return e&=-e,2<e?8<e?(e&134217727)!==0?32:268435456:8:2}function Ju(){var e=L.p;return e!==0?e:(e=window.event,e===void 0?32:Ly(e.type))}function xd(e,t){var l=L.p;try{return L.p=e,t()}finally{L.p=l}}var Pi=Math.random().toString(36).slice(2),Ba="__reactFiber$"+Pi,Qa="__reactProps$"+Pi,Sr="__reactContainer$"+Pi,Si="__reactEvents$"+Pi,Ed="__reactListeners$"+Pi,xr="__reactHandles$"+Pi,xi="__reactResources$"+Pi,Er="__reactMarker$"+Pi;function $t(e){delete e[Ba],delete e[Qa],delete e[Si],delete e[Ed],delete e[xr]}function Cr(e){var t=e[Ba];if(t)return t;for(var l=e.parentNode;l;){if(t=l[Sr]||l[Ba]){if(l=t.alternate,t.child!==null||l!==null&&l.child!==null)for(e=Cy(e);e!==null;){if(l=e[Ba])return l;e=Cy(e)}return t}e=l,l=e.parentNode}return null}function Tr(e){if(e=e[Ba]||e[Sr]){var t=e.tag;if(t===5||t===6||t===13||t===26||t===27||t===3)return e}return null}function Ql(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e.stateNode;throw Error(s(33))}function hl(e){var t=e[xi];return t||(t=e[xi]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Da(e){e[Er]=!0}var ao=new Set,no={};function Xi(e,t){Ta(e,t),Ta(e+"Capture",t)}function Ta(e,t){for(no[e]=t,e=0;e<t.length;e++)ao.add(t[e])}var ba=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Zl={},Wu={};function Vc(e){return Ge.call(Wu,e)?!0:Ge.call(Zl,e)?!1:ba.test(e)?Wu[e]=!0:(Zl[e]=!0,!1)}function Bn(e,t,l){if(Vc(t))if(l===null)e.removeAttribute(t);else{switch(typeof l){case"undefined":case"function":case"symbol":e.removeAttribute(t);return;case"boolean":var o=t.toLowerCase().slice(0,5);if(o!=="data-"&&o!=="aria-"){e.removeAttribute(t);return}}e.setAttribute(t,""+l)}}function dl(e,t,l){if(l===null)e.removeAttribute(t);else{switch(typeof l){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(t);return}e.setAttribute(t,""+l)}}function ni(e,t,l,o){if(o===null)e.removeAttribute(l);else{switch(typeof o){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(l);return}e.setAttributeNS(t,l,""+o)}}var Iu,Yc;function gl(e){if(Iu===void 0)try{throw Error()}catch(l){var t=l.stack.trim().match(/\n( *(at )?)/);Iu=t&&t[1]||"",Yc=-1<l.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<l.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Iu+e+Yc}var io=!1;function ro(e,t){if(!e||io)return"";io=!0;var l=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var o={DetermineComponentFrameRoot:function(){try{if(t){var Ce=function(){throw Error()};if(Object.defineProperty(Ce.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(Ce,[])}catch(me){var ve=me}Reflect.construct(e,[],Ce)}else{try{Ce.call()}catch(me){ve=me}e.call(Ce.prototype)}}else{try{throw Error()}catch(me){ve=me}(Ce=e())&&typeof Ce.catch=="function"&&Ce.catch(function(){})}}catch(me){if(me&&ve&&typeof me.stack=="string")return[me.stack,ve.stack]}return[null,null]}};o.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var m=Object.getOwnPropertyDescriptor(o.DetermineComponentFrameRoot,"name");m&&m.configurable&&Object.defineProperty(o.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var b=o.DetermineComponentFrameRoot(),q=b[0],K=b[1];if(q&&K){var W=q.split(`
-`),ge=K.split(`
-`);for(m=o=0;o<W.length&&!W[o].includes("DetermineComponentFrameRoot");)o++;for(;m<ge.length&&!ge[m].includes("DetermineComponentFrameRoot");)m++;if(o===W.length||m===ge.length)for(o=W.length-1,m=ge.length-1;1<=o&&0<=m&&W[o]!==ge[m];)m--;for(;1<=o&&0<=m;o--,m--)if(W[o]!==ge[m]){if(o!==1||m!==1)do if(o--,m--,0>m||W[o]!==ge[m]){var _e=`
-`+W[o].replace(" at new "," at ");return e.displayName&&_e.includes("<anonymous>")&&(_e=_e.replace("<anonymous>",e.displayName)),_e}while(1<=o&&0<=m);break}}}finally{io=!1,Error.prepareStackTrace=l}return(l=e?e.displayName||e.name:"")?gl(l):""}function Cd(e){switch(e.tag){case 26:case 27:case 5:return gl(e.type);case 16:return gl("Lazy");case 13:return gl("Suspense");case 19:return gl("SuspenseList");case 0:case 15:return ro(e.type,!1);case 11:return ro(e.type.render,!1);case 1:return ro(e.type,!0);case 31:return gl("Activity");default:return""}}function Pc(e){try{var t="";do t+=Cd(e),e=e.return;while(e);return t}catch(l){return`
-Error generating stack: `+l.message+`
-`+l.stack}}function hn(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function Xc(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function B1(e){var t=Xc(e)?"checked":"value",l=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),o=""+e[t];if(!e.hasOwnProperty(t)&&typeof l<"u"&&typeof l.get=="function"&&typeof l.set=="function"){var m=l.get,b=l.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return m.call(this)},set:function(q){o=""+q,b.call(this,q)}}),Object.defineProperty(e,t,{enumerable:l.enumerable}),{getValue:function(){return o},setValue:function(q){o=""+q},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function $u(e){e._valueTracker||(e._valueTracker=B1(e))}function Kc(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var l=t.getValue(),o="";return e&&(o=Xc(e)?e.checked?"true":"false":e.value),e=o,e!==l?(t.setValue(e),!0):!1}function es(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}var Fc=/[\n"\\]/g;function xn(e){return e.replace(Fc,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function lo(e,t,l,o,m,b,q,K){e.name="",q!=null&&typeof q!="function"&&typeof q!="symbol"&&typeof q!="boolean"?e.type=q:e.removeAttribute("type"),t!=null?q==="number"?(t===0&&e.value===""||e.value!=t)&&(e.value=""+hn(t)):e.value!==""+hn(t)&&(e.value=""+hn(t)):q!=="submit"&&q!=="reset"||e.removeAttribute("value"),t!=null?uo(e,q,hn(t)):l!=null?uo(e,q,hn(l)):o!=null&&e.removeAttribute("value"),m==null&&b!=null&&(e.defaultChecked=!!b),m!=null&&(e.checked=m&&typeof m!="function"&&typeof m!="symbol"),K!=null&&typeof K!="function"&&typeof K!="symbol"&&typeof K!="boolean"?e.name=""+hn(K):e.removeAttribute("name")}function kc(e,t,l,o,m,b,q,K){if(b!=null&&typeof b!="function"&&typeof b!="symbol"&&typeof b!="boolean"&&(e.type=b),t!=null||l!=null){if(!(b!=="submit"&&b!=="reset"||t!=null))return;l=l!=null?""+hn(l):"",t=t!=null?""+hn(t):l,K||t===e.value||(e.value=t),e.defaultValue=t}o=o??m,o=typeof o!="function"&&typeof o!="symbol"&&!!o,e.checked=K?e.checked:!!o,e.defaultChecked=!!o,q!=null&&typeof q!="function"&&typeof q!="symbol"&&typeof q!="boolean"&&(e.name=q)}function uo(e,t,l){t==="number"&&es(e.ownerDocument)===e||e.defaultValue===""+l||(e.defaultValue=""+l)}function pl(e,t,l,o){if(e=e.options,t){t={};for(var m=0;m<l.length;m++)t["$"+l[m]]=!0;for(l=0;l<e.length;l++)m=t.hasOwnProperty("$"+e[l].value),e[l].selected!==m&&(e[l].selected=m),m&&o&&(e[l].defaultSelected=!0)}else{for(l=""+hn(l),t=null,m=0;m<e.length;m++){if(e[m].value===l){e[m].selected=!0,o&&(e[m].defaultSelected=!0);return}t!==null||e[m].disabled||(t=e[m])}t!==null&&(t.selected=!0)}}function Td(e,t,l){if(t!=null&&(t=""+hn(t),t!==e.value&&(e.value=t),l==null)){e.defaultValue!==t&&(e.defaultValue=t);return}e.defaultValue=l!=null?""+hn(l):""}function Qc(e,t,l,o){if(t==null){if(o!=null){if(l!=null)throw Error(s(92));if(H(o)){if(1<o.length)throw Error(s(93));o=o[0]}l=o}l==null&&(l=""),t=l}l=hn(t),e.defaultValue=l,o=e.textContent,o===l&&o!==""&&o!==null&&(e.value=o)}function ii(e,t){if(t){var l=e.firstChild;if(l&&l===e.lastChild&&l.nodeType===3){l.nodeValue=t;return}}e.textContent=t}var Ad=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function ts(e,t,l){var o=t.indexOf("--")===0;l==null||typeof l=="boolean"||l===""?o?e.setProperty(t,""):t==="float"?e.cssFloat="":e[t]="":o?e.setProperty(t,l):typeof l!="number"||l===0||Ad.has(t)?t==="float"?e.cssFloat=l:e[t]=(""+l).trim():e[t]=l+"px"}function as(e,t,l){if(t!=null&&typeof t!="object")throw Error(s(62));if(e=e.style,l!=null){for(var o in l)!l.hasOwnProperty(o)||t!=null&&t.hasOwnProperty(o)||(o.indexOf("--")===0?e.setProperty(o,""):o==="float"?e.cssFloat="":e[o]="");for(var m in t)o=t[m],t.hasOwnProperty(m)&&l[m]!==o&&ts(e,m,o)}else for(var b in t)t.hasOwnProperty(b)&&ts(e,b,t[b])}function so(e){if(e.indexOf("-")===-1)return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Zc=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Rd=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function ns(e){return Rd.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var oo=null;function co(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Ar=null,vl=null;function Jc(e){var t=Tr(e);if(t&&(e=t.stateNode)){var l=e[Qa]||null;e:switch(e=t.stateNode,t.type){case"input":if(lo(e,l.value,l.defaultValue,l.defaultValue,l.checked,l.defaultChecked,l.type,l.name),t=l.name,l.type==="radio"&&t!=null){for(l=e;l.parentNode;)l=l.parentNode;for(l=l.querySelectorAll('input[name="'+xn(""+t)+'"][type="radio"]'),t=0;t<l.length;t++){var o=l[t];if(o!==e&&o.form===e.form){var m=o[Qa]||null;if(!m)throw Error(s(90));lo(o,m.value,m.defaultValue,m.defaultValue,m.checked,m.defaultChecked,m.type,m.name)}}for(t=0;t<l.length;t++)o=l[t],o.form===e.form&&Kc(o)}break e;case"textarea":Td(e,l.value,l.defaultValue);break e;case"select":t=l.value,t!=null&&pl(e,!!l.multiple,t,!1)}}}var is=!1;function Wc(e,t,l){if(is)return e(t,l);is=!0;try{var o=e(t);return o}finally{if(is=!1,(Ar!==null||vl!==null)&&(Bi(),Ar&&(t=Ar,e=vl,vl=Ar=null,Jc(t),e)))for(t=0;t<e.length;t++)Jc(e[t])}}function Jl(e,t){var l=e.stateNode;if(l===null)return null;var o=l[Qa]||null;if(o===null)return null;l=o[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(o=!o.disabled)||(e=e.type,o=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!o;break e;default:e=!1}if(e)return null;if(l&&typeof l!="function")throw Error(s(231,t,typeof l));return l}var Ei=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),rs=!1;if(Ei)try{var Wl={};Object.defineProperty(Wl,"passive",{get:function(){rs=!0}}),window.addEventListener("test",Wl,Wl),window.removeEventListener("test",Wl,Wl)}catch{rs=!1}var Ki=null,Ic=null,fo=null;function $c(){if(fo)return fo;var e,t=Ic,l=t.length,o,m="value"in Ki?Ki.value:Ki.textContent,b=m.length;for(e=0;e<l&&t[e]===m[e];e++);var q=l-e;for(o=1;o<=q&&t[l-o]===m[b-o];o++);return fo=m.slice(e,1<o?1-o:void 0)}function Rr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Il(){return!0}function ls(){return!1}function an(e){function t(l,o,m,b,q){this._reactName=l,this._targetInst=m,this.type=o,this.nativeEvent=b,this.target=q,this.currentTarget=null;for(var K in e)e.hasOwnProperty(K)&&(l=e[K],this[K]=l?l(b):b[K]);return this.isDefaultPrevented=(b.defaultPrevented!=null?b.defaultPrevented:b.returnValue===!1)?Il:ls,this.isPropagationStopped=ls,this}return _(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var l=this.nativeEvent;l&&(l.preventDefault?l.preventDefault():typeof l.returnValue!="unknown"&&(l.returnValue=!1),this.isDefaultPrevented=Il)},stopPropagation:function(){var l=this.nativeEvent;l&&(l.stopPropagation?l.stopPropagation():typeof l.cancelBubble!="unknown"&&(l.cancelBubble=!0),this.isPropagationStopped=Il)},persist:function(){},isPersistent:Il}),t}var Or={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},$l=an(Or),eu=_({},Or,{view:0,detail:0}),Od=an(eu),Fi,tu,au,nu=_({},eu,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ss,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==au&&(au&&e.type==="mousemove"?(Fi=e.screenX-au.screenX,tu=e.screenY-au.screenY):tu=Fi=0,au=e),Fi)},movementY:function(e){return"movementY"in e?e.movementY:tu}}),ef=an(nu),Md=_({},nu,{dataTransfer:0}),L1=an(Md),La=_({},eu,{relatedTarget:0}),ho=an(La),wd=_({},Or,{animationName:0,elapsedTime:0,pseudoElement:0}),Nd=an(wd),Dd=_({},Or,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),zd=an(Dd),us=_({},Or,{data:0}),go=an(us),Ud={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Gd={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},qd={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function tf(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=qd[e])?!!t[e]:!1}function ss(){return tf}var Hd=_({},eu,{key:function(e){if(e.key){var t=Ud[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Rr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Gd[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ss,charCode:function(e){return e.type==="keypress"?Rr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Rr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),af=an(Hd),nf=_({},nu,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),po=an(nf),Bd=_({},eu,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ss}),rf=an(Bd),Ld=_({},Or,{propertyName:0,elapsedTime:0,pseudoElement:0}),ki=an(Ld),lf=_({},nu,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),j1=an(lf),jd=_({},Or,{newState:0,oldState:0}),Mr=an(jd),Qi=[9,13,27,32],os=Ei&&"CompositionEvent"in window,ml=null;Ei&&"documentMode"in document&&(ml=document.documentMode);var cs=Ei&&"TextEvent"in window&&!ml,fs=Ei&&(!os||ml&&8<ml&&11>=ml),wr=" ",ja=!1;function hs(e,t){switch(e){case"keyup":return Qi.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function uf(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Nr=!1;function ds(e,t){switch(e){case"compositionend":return uf(t);case"keypress":return t.which!==32?null:(ja=!0,wr);case"textInput":return e=t.data,e===wr&&ja?null:e;default:return null}}function sf(e,t){if(Nr)return e==="compositionend"||!os&&hs(e,t)?(e=$c(),fo=Ic=Ki=null,Nr=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return fs&&t.locale!=="ko"?null:t.data;default:return null}}var vo={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function of(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!vo[e.type]:t==="textarea"}function dn(e,t,l,o){Ar?vl?vl.push(o):vl=[o]:Ar=o,t=L0(t,"onChange"),0<t.length&&(l=new $l("onChange","change",null,l,o),e.push({event:l,listeners:t}))}var iu=null,yl=null;function Vd(e){gy(e,0)}function gs(e){var t=Ql(e);if(Kc(t))return e}function mo(e,t){if(e==="change")return t}var yo=!1;if(Ei){var bo;if(Ei){var ru="oninput"in document;if(!ru){var lu=document.createElement("div");lu.setAttribute("oninput","return;"),ru=typeof lu.oninput=="function"}bo=ru}else bo=!1;yo=bo&&(!document.documentMode||9<document.documentMode)}function Wt(){iu&&(iu.detachEvent("onpropertychange",Yd),yl=iu=null)}function Yd(e){if(e.propertyName==="value"&&gs(yl)){var t=[];dn(t,yl,e,co(e)),Wc(Vd,t)}}function V1(e,t,l){e==="focusin"?(Wt(),iu=t,yl=l,iu.attachEvent("onpropertychange",Yd)):e==="focusout"&&Wt()}function Pd(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return gs(yl)}function ps(e,t){if(e==="click")return gs(t)}function Dr(e,t){if(e==="input"||e==="change")return gs(t)}function Xd(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var gn=typeof Object.is=="function"?Object.is:Xd;function ri(e,t){if(gn(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var l=Object.keys(e),o=Object.keys(t);if(l.length!==o.length)return!1;for(o=0;o<l.length;o++){var m=l[o];if(!Ge.call(t,m)||!gn(e[m],t[m]))return!1}return!0}function pn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cf(e,t){var l=pn(e);e=0;for(var o;l;){if(l.nodeType===3){if(o=e+l.textContent.length,e<=t&&o>=t)return{node:l,offset:t-e};e=o}e:{for(;l;){if(l.nextSibling){l=l.nextSibling;break e}l=l.parentNode}l=void 0}l=pn(l)}}function ff(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?ff(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function hf(e){e=e!=null&&e.ownerDocument!=null&&e.ownerDocument.defaultView!=null?e.ownerDocument.defaultView:window;for(var t=es(e.document);t instanceof e.HTMLIFrameElement;){try{var l=typeof t.contentWindow.location.href=="string"}catch{l=!1}if(l)e=t.contentWindow;else break;t=es(e.document)}return t}function vs(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}var df=Ei&&"documentMode"in document&&11>=document.documentMode,Zi=null,_o=null,ms=null,So=!1;function gf(e,t,l){var o=l.window===l?l.document:l.nodeType===9?l:l.ownerDocument;So||Zi==null||Zi!==es(o)||(o=Zi,"selectionStart"in o&&vs(o)?o={start:o.selectionStart,end:o.selectionEnd}:(o=(o.ownerDocument&&o.ownerDocument.defaultView||window).getSelection(),o={anchorNode:o.anchorNode,anchorOffset:o.anchorOffset,focusNode:o.focusNode,focusOffset:o.focusOffset}),ms&&ri(ms,o)||(ms=o,o=L0(_o,"onSelect"),0<o.length&&(t=new $l("onSelect","select",null,t,l),e.push({event:t,listeners:o}),t.target=Zi)))}function Va(e,t){var l={};return l[e.toLowerCase()]=t.toLowerCase(),l["Webkit"+e]="webkit"+t,l["Moz"+e]="moz"+t,l}var zr={animationend:Va("Animation","AnimationEnd"),animationiteration:Va("Animation","AnimationIteration"),animationstart:Va("Animation","AnimationStart"),transitionrun:Va("Transition","TransitionRun"),transitionstart:Va("Transition","TransitionStart"),transitioncancel:Va("Transition","TransitionCancel"),transitionend:Va("Transition","TransitionEnd")},xo={},Kd={};Ei&&(Kd=document.createElement("div").style,"AnimationEvent"in window||(delete zr.animationend.animation,delete zr.animationiteration.animation,delete zr.animationstart.animation),"TransitionEvent"in window||delete zr.transitionend.transition);function Ji(e){if(xo[e])return xo[e];if(!zr[e])return e;var t=zr[e],l;for(l in t)if(t.hasOwnProperty(l)&&l in Kd)return xo[e]=t[l];return e}var nn=Ji("animationend"),pf=Ji("animationiteration"),vn=Ji("animationstart"),Fd=Ji("transitionrun"),Wi=Ji("transitionstart"),uu=Ji("transitioncancel"),Ii=Ji("transitionend"),Eo=new Map,ys="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");ys.push("scrollEnd");function za(e,t){Eo.set(e,t),Xi(t,[e])}var vf=new WeakMap;function Ya(e,t){if(typeof e=="object"&&e!==null){var l=vf.get(e);return l!==void 0?l:(t={value:e,source:t,stack:Pc(t)},vf.set(e,t),t)}return{value:e,source:t,stack:Pc(t)}}var Za=[],Ln=0,Co=0;function bs(){for(var e=Ln,t=Co=Ln=0;t<e;){var l=Za[t];Za[t++]=null;var o=Za[t];Za[t++]=null;var m=Za[t];Za[t++]=null;var b=Za[t];if(Za[t++]=null,o!==null&&m!==null){var q=o.pending;q===null?m.next=m:(m.next=q.next,q.next=m),o.pending=m}b!==0&&mf(l,m,b)}}function Ur(e,t,l,o){Za[Ln++]=e,Za[Ln++]=t,Za[Ln++]=l,Za[Ln++]=o,Co|=o,e.lanes|=o,e=e.alternate,e!==null&&(e.lanes|=o)}function To(e,t,l,o){return Ur(e,t,l,o),su(e)}function $i(e,t){return Ur(e,null,null,t),su(e)}function mf(e,t,l){e.lanes|=l;var o=e.alternate;o!==null&&(o.lanes|=l);for(var m=!1,b=e.return;b!==null;)b.childLanes|=l,o=b.alternate,o!==null&&(o.childLanes|=l),b.tag===22&&(e=b.stateNode,e===null||e._visibility&1||(m=!0)),e=b,b=b.return;return e.tag===3?(b=e.stateNode,m&&t!==null&&(m=31-zt(l),e=b.hiddenUpdates,o=e[m],o===null?e[m]=[t]:o.push(t),t.lane=l|536870912),b):null}function su(e){if(50<Hi)throw Hi=0,ql=null,Error(s(185));for(var t=e.return;t!==null;)e=t,t=e.return;return e.tag===3?e.stateNode:null}var Gr={};function yf(e,t,l,o){this.tag=e,this.key=l,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=o,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function mn(e,t,l,o){return new yf(e,t,l,o)}function _s(e){return e=e.prototype,!(!e||!e.isReactComponent)}function fa(e,t){var l=e.alternate;return l===null?(l=mn(e.tag,t,e.key,e.mode),l.elementType=e.elementType,l.type=e.type,l.stateNode=e.stateNode,l.alternate=e,e.alternate=l):(l.pendingProps=t,l.type=e.type,l.flags=0,l.subtreeFlags=0,l.deletions=null),l.flags=e.flags&65011712,l.childLanes=e.childLanes,l.lanes=e.lanes,l.child=e.child,l.memoizedProps=e.memoizedProps,l.memoizedState=e.memoizedState,l.updateQueue=e.updateQueue,t=e.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},l.sibling=e.sibling,l.index=e.index,l.ref=e.ref,l.refCleanup=e.refCleanup,l}function bf(e,t){e.flags&=65011714;var l=e.alternate;return l===null?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=l.childLanes,e.lanes=l.lanes,e.child=l.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=l.memoizedProps,e.memoizedState=l.memoizedState,e.updateQueue=l.updateQueue,e.type=l.type,t=l.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Ua(e,t,l,o,m,b){var q=0;if(o=e,typeof e=="function")_s(e)&&(q=1);else if(typeof e=="string")q=xS(e,l,ce.current)?26:e==="html"||e==="head"||e==="body"?27:5;else e:switch(e){case Y:return e=mn(31,l,t,m),e.elementType=Y,e.lanes=b,e;case E:return qr(l.children,m,b,t);case O:q=8,m|=24;break;case w:return e=mn(12,l,t,m|2),e.elementType=w,e.lanes=b,e;case G:return e=mn(13,l,t,m),e.elementType=G,e.lanes=b,e;case B:return e=mn(19,l,t,m),e.elementType=B,e.lanes=b,e;default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case U:case R:q=10;break e;case A:q=9;break e;case z:q=11;break e;case Q:q=14;break e;case X:q=16,o=null;break e}q=29,l=Error(s(130,e===null?"null":typeof e,"")),o=null}return t=mn(q,l,t,m),t.elementType=e,t.type=o,t.lanes=b,t}function qr(e,t,l,o){return e=mn(7,e,o,t),e.lanes=l,e}function Ss(e,t,l){return e=mn(6,e,null,t),e.lanes=l,e}function Ao(e,t,l){return t=mn(4,e.children!==null?e.children:[],e.key,t),t.lanes=l,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var ou=[],yn=0,xs=null,cu=0,Pa=[],En=0,Hr=null,Ci=1,Ti="";function er(e,t){ou[yn++]=cu,ou[yn++]=xs,xs=e,cu=t}function Ro(e,t,l){Pa[En++]=Ci,Pa[En++]=Ti,Pa[En++]=Hr,Hr=e;var o=Ci;e=Ti;var m=32-zt(o)-1;o&=~(1<<m),l+=1;var b=32-zt(t)+m;if(30<b){var q=m-m%5;b=(o&(1<<q)-1).toString(32),o>>=q,m-=q,Ci=1<<32-zt(t)+m|l<<m|o,Ti=b+e}else Ci=1<<b|l<<m|o,Ti=e}function _f(e){e.return!==null&&(er(e,1),Ro(e,1,0))}function Sf(e){for(;e===xs;)xs=ou[--yn],ou[yn]=null,cu=ou[--yn],ou[yn]=null;for(;e===Hr;)Hr=Pa[--En],Pa[En]=null,Ti=Pa[--En],Pa[En]=null,Ci=Pa[--En],Pa[En]=null}var rn=null,ea=null,Ct=!1,jn=null,Cn=!1,Oo=Error(s(519));function Br(e){var t=Error(s(418,""));throw bl(Ya(t,e)),Oo}function kd(e){var t=e.stateNode,l=e.type,o=e.memoizedProps;switch(t[Ba]=e,t[Qa]=o,l){case"dialog":pt("cancel",t),pt("close",t);break;case"iframe":case"object":case"embed":pt("load",t);break;case"video":case"audio":for(l=0;l<If.length;l++)pt(If[l],t);break;case"source":pt("error",t);break;case"img":case"image":case"link":pt("error",t),pt("load",t);break;case"details":pt("toggle",t);break;case"input":pt("invalid",t),kc(t,o.value,o.defaultValue,o.checked,o.defaultChecked,o.type,o.name,!0),$u(t);break;case"select":pt("invalid",t);break;case"textarea":pt("invalid",t),Qc(t,o.value,o.defaultValue,o.children),$u(t)}l=o.children,typeof l!="string"&&typeof l!="number"&&typeof l!="bigint"||t.textContent===""+l||o.suppressHydrationWarning===!0||yy(t.textContent,l)?(o.popover!=null&&(pt("beforetoggle",t),pt("toggle",t)),o.onScroll!=null&&pt("scroll",t),o.onScrollEnd!=null&&pt("scrollend",t),o.onClick!=null&&(t.onclick=j0),t=!0):t=!1,t||Br(e)}function xf(e){for(rn=e.return;rn;)switch(rn.tag){case 5:case 13:Cn=!1;return;case 27:case 3:Cn=!0;return;default:rn=rn.return}}function li(e){if(e!==rn)return!1;if(!Ct)return xf(e),Ct=!0,!1;var t=e.tag,l;if((l=t!==3&&t!==27)&&((l=t===5)&&(l=e.type,l=!(l!=="form"&&l!=="button")||ug(e.type,e.memoizedProps)),l=!l),l&&ea&&Br(e),xf(e),t===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(s(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8)if(l=e.data,l==="/$"){if(t===0){ea=gr(e.nextSibling);break e}t--}else l!=="$"&&l!=="$!"&&l!=="$?"||t++;e=e.nextSibling}ea=null}}else t===27?(t=ea,Gu(e.type)?(e=fg,fg=null,ea=e):ea=t):ea=rn?gr(e.stateNode.nextSibling):null;return!0}function fu(){ea=rn=null,Ct=!1}function Ot(){var e=jn;return e!==null&&(Pe===null?Pe=e:Pe.push.apply(Pe,e),jn=null),e}function bl(e){jn===null?jn=[e]:jn.push(e)}var Ef=te(null),Lr=null,tr=null;function jr(e,t,l){ne(Ef,t._currentValue),t._currentValue=l}function ar(e){e._currentValue=Ef.current,de(Ef)}function Cf(e,t,l){for(;e!==null;){var o=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,o!==null&&(o.childLanes|=t)):o!==null&&(o.childLanes&t)!==t&&(o.childLanes|=t),e===l)break;e=e.return}}function Es(e,t,l,o){var m=e.child;for(m!==null&&(m.return=e);m!==null;){var b=m.dependencies;if(b!==null){var q=m.child;b=b.firstContext;e:for(;b!==null;){var K=b;b=m;for(var W=0;W<t.length;W++)if(K.context===t[W]){b.lanes|=l,K=b.alternate,K!==null&&(K.lanes|=l),Cf(b.return,l,e),o||(q=null);break e}b=K.next}}else if(m.tag===18){if(q=m.return,q===null)throw Error(s(341));q.lanes|=l,b=q.alternate,b!==null&&(b.lanes|=l),Cf(q,l,e),q=null}else q=m.child;if(q!==null)q.return=m;else for(q=m;q!==null;){if(q===e){q=null;break}if(m=q.sibling,m!==null){m.return=q.return,q=m;break}q=q.return}m=q}}function Vn(e,t,l,o){e=null;for(var m=t,b=!1;m!==null;){if(!b){if((m.flags&524288)!==0)b=!0;else if((m.flags&262144)!==0)break}if(m.tag===10){var q=m.alternate;if(q===null)throw Error(s(387));if(q=q.memoizedProps,q!==null){var K=m.type;gn(m.pendingProps.value,q.value)||(e!==null?e.push(K):e=[K])}}else if(m===$.current){if(q=m.alternate,q===null)throw Error(s(387));q.memoizedState.memoizedState!==m.memoizedState.memoizedState&&(e!==null?e.push(ih):e=[ih])}m=m.return}e!==null&&Es(t,e,l,o),t.flags|=262144}function Cs(e){for(e=e.firstContext;e!==null;){if(!gn(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Ai(e){Lr=e,tr=null,e=e.dependencies,e!==null&&(e.firstContext=null)}function ia(e){return Mo(Lr,e)}function Ts(e,t){return Lr===null&&Ai(e),Mo(e,t)}function Mo(e,t){var l=t._currentValue;if(t={context:t,memoizedValue:l,next:null},tr===null){if(e===null)throw Error(s(308));tr=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else tr=tr.next=t;return l}var Tf=typeof AbortController<"u"?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(l,o){e.push(o)}};this.abort=function(){t.aborted=!0,e.forEach(function(l){return l()})}},Y1=n.unstable_scheduleCallback,Qd=n.unstable_NormalPriority,_a={$$typeof:R,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function wo(){return{controller:new Tf,data:new Map,refCount:0}}function hu(e){e.refCount--,e.refCount===0&&Y1(Qd,function(){e.controller.abort()})}var du=null,As=0,tt=0,gu=null;function Tn(e,t){if(du===null){var l=du=[];As=0,tt=I1(),gu={status:"pending",value:void 0,then:function(o){l.push(o)}}}return As++,t.then(No,No),t}function No(){if(--As===0&&du!==null){gu!==null&&(gu.status="fulfilled");var e=du;du=null,tt=0,gu=null;for(var t=0;t<e.length;t++)(0,e[t])()}}function P1(e,t){var l=[],o={status:"pending",value:null,reason:null,then:function(m){l.push(m)}};return e.then(function(){o.status="fulfilled",o.value=t;for(var m=0;m<l.length;m++)(0,l[m])(t)},function(m){for(o.status="rejected",o.reason=m,m=0;m<l.length;m++)(0,l[m])(void 0)}),o}var Rs=N.S;N.S=function(e,t){typeof t=="object"&&t!==null&&typeof t.then=="function"&&Tn(e,t),Rs!==null&&Rs(e,t)};var Yn=te(null);function Vr(){var e=Yn.current;return e!==null?e:We.pooledCache}function Os(e,t){t===null?ne(Yn,Yn.current):ne(Yn,t.pool)}function Do(){var e=Vr();return e===null?null:{parent:_a._currentValue,pool:e}}var Ms=Error(s(460)),Af=Error(s(474)),ui=Error(s(542)),ws={then:function(){}};function zo(e){return e=e.status,e==="fulfilled"||e==="rejected"}function pu(){}function Uo(e,t,l){switch(l=e[l],l===void 0?e.push(t):l!==t&&(t.then(pu,pu),t=l),t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,Zd(e),e;default:if(typeof t.status=="string")t.then(pu,pu);else{if(e=We,e!==null&&100<e.shellSuspendCounter)throw Error(s(482));e=t,e.status="pending",e.then(function(o){if(t.status==="pending"){var m=t;m.status="fulfilled",m.value=o}},function(o){if(t.status==="pending"){var m=t;m.status="rejected",m.reason=o}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,Zd(e),e}throw Pn=t,Ms}}var Pn=null;function Rf(){if(Pn===null)throw Error(s(459));var e=Pn;return Pn=null,e}function Zd(e){if(e===Ms||e===ui)throw Error(s(483))}var nr=!1;function Of(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function ke(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function Ri(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ir(e,t,l){var o=e.updateQueue;if(o===null)return null;if(o=o.shared,(Mt&2)!==0){var m=o.pending;return m===null?t.next=t:(t.next=m.next,m.next=t),o.pending=t,t=su(e),mf(e,null,l),t}return Ur(e,o,t,l),su(e)}function _l(e,t,l){if(t=t.updateQueue,t!==null&&(t=t.shared,(l&4194048)!==0)){var o=t.lanes;o&=e.pendingLanes,l|=o,t.lanes=l,Zu(e,l)}}function vu(e,t){var l=e.updateQueue,o=e.alternate;if(o!==null&&(o=o.updateQueue,l===o)){var m=null,b=null;if(l=l.firstBaseUpdate,l!==null){do{var q={lane:l.lane,tag:l.tag,payload:l.payload,callback:null,next:null};b===null?m=b=q:b=b.next=q,l=l.next}while(l!==null);b===null?m=b=t:b=b.next=t}else m=b=t;l={baseState:o.baseState,firstBaseUpdate:m,lastBaseUpdate:b,shared:o.shared,callbacks:o.callbacks},e.updateQueue=l;return}e=l.lastBaseUpdate,e===null?l.firstBaseUpdate=t:e.next=t,l.lastBaseUpdate=t}var Mf=!1;function Ns(){if(Mf){var e=gu;if(e!==null)throw e}}function mu(e,t,l,o){Mf=!1;var m=e.updateQueue;nr=!1;var b=m.firstBaseUpdate,q=m.lastBaseUpdate,K=m.shared.pending;if(K!==null){m.shared.pending=null;var W=K,ge=W.next;W.next=null,q===null?b=ge:q.next=ge,q=W;var _e=e.alternate;_e!==null&&(_e=_e.updateQueue,K=_e.lastBaseUpdate,K!==q&&(K===null?_e.firstBaseUpdate=ge:K.next=ge,_e.lastBaseUpdate=W))}if(b!==null){var Ce=m.baseState;q=0,_e=ge=W=null,K=b;do{var ve=K.lane&-536870913,me=ve!==K.lane;if(me?(Ve&ve)===ve:(o&ve)===ve){ve!==0&&ve===tt&&(Mf=!0),_e!==null&&(_e=_e.next={lane:0,tag:K.tag,payload:K.payload,callback:null,next:null});e:{var Ze=e,Xe=K;ve=t;var Ft=l;switch(Xe.tag){case 1:if(Ze=Xe.payload,typeof Ze=="function"){Ce=Ze.call(Ft,Ce,ve);break e}Ce=Ze;break e;case 3:Ze.flags=Ze.flags&-65537|128;case 0:if(Ze=Xe.payload,ve=typeof Ze=="function"?Ze.call(Ft,Ce,ve):Ze,ve==null)break e;Ce=_({},Ce,ve);break e;case 2:nr=!0}}ve=K.callback,ve!==null&&(e.flags|=64,me&&(e.flags|=8192),me=m.callbacks,me===null?m.callbacks=[ve]:me.push(ve))}else me={lane:ve,tag:K.tag,payload:K.payload,callback:K.callback,next:null},_e===null?(ge=_e=me,W=Ce):_e=_e.next=me,q|=ve;if(K=K.next,K===null){if(K=m.shared.pending,K===null)break;me=K,K=me.next,me.next=null,m.lastBaseUpdate=me,m.shared.pending=null}}while(!0);_e===null&&(W=Ce),m.baseState=W,m.firstBaseUpdate=ge,m.lastBaseUpdate=_e,b===null&&(m.shared.lanes=0),pi|=q,e.lanes=q,e.memoizedState=Ce}}function yu(e,t){if(typeof e!="function")throw Error(s(191,e));e.call(t)}function Jd(e,t){var l=e.callbacks;if(l!==null)for(e.callbacks=null,e=0;e<l.length;e++)yu(l[e],t)}var bu=te(null),Go=te(0);function Wd(e,t){e=Zn,ne(Go,e),ne(bu,t),Zn=e|t.baseLanes}function wf(){ne(Go,Zn),ne(bu,bu.current)}function Ds(){Zn=Go.current,de(bu),de(Go)}var rr=0,at=null,Ut=null,Sa=null,qo=!1,Yr=!1,ln=!1,Aa=0,Xn=0,Xa=null,Id=0;function ha(){throw Error(s(321))}function Ja(e,t){if(t===null)return!1;for(var l=0;l<t.length&&l<e.length;l++)if(!gn(e[l],t[l]))return!1;return!0}function lr(e,t,l,o,m,b){return rr=b,at=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,N.H=e===null||e.memoizedState===null?Ko:Ff,ln=!1,b=l(o,m),ln=!1,Yr&&(b=e0(t,l,o,m)),$d(e),b}function $d(e){N.H=Gs;var t=Ut!==null&&Ut.next!==null;if(rr=0,Sa=Ut=at=null,qo=!1,Xn=0,Xa=null,t)throw Error(s(300));e===null||Ga||(e=e.dependencies,e!==null&&Cs(e)&&(Ga=!0))}function e0(e,t,l,o){at=e;var m=0;do{if(Yr&&(Xa=null),Xn=0,Yr=!1,25<=m)throw Error(s(301));if(m+=1,Sa=Ut=null,e.updateQueue!=null){var b=e.updateQueue;b.lastEffect=null,b.events=null,b.stores=null,b.memoCache!=null&&(b.memoCache.index=0)}N.H=A0,b=t(l,o)}while(Yr);return b}function X1(){var e=N.H,t=e.useState()[0];return t=typeof t.then=="function"?si(t):t,e=e.useState()[0],(Ut!==null?Ut.memoizedState:null)!==e&&(at.flags|=1024),t}function Nf(){var e=Aa!==0;return Aa=0,e}function Ho(e,t,l){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~l}function Df(e){if(qo){for(e=e.memoizedState;e!==null;){var t=e.queue;t!==null&&(t.pending=null),e=e.next}qo=!1}rr=0,Sa=Ut=at=null,Yr=!1,Xn=Aa=0,Xa=null}function un(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Sa===null?at.memoizedState=Sa=e:Sa=Sa.next=e,Sa}function xa(){if(Ut===null){var e=at.alternate;e=e!==null?e.memoizedState:null}else e=Ut.next;var t=Sa===null?at.memoizedState:Sa.next;if(t!==null)Sa=t,Ut=e;else{if(e===null)throw at.alternate===null?Error(s(467)):Error(s(310));Ut=e,e={memoizedState:Ut.memoizedState,baseState:Ut.baseState,baseQueue:Ut.baseQueue,queue:Ut.queue,next:null},Sa===null?at.memoizedState=Sa=e:Sa=Sa.next=e}return Sa}function Pr(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function si(e){var t=Xn;return Xn+=1,Xa===null&&(Xa=[]),e=Uo(Xa,e,t),t=at,(Sa===null?t.memoizedState:Sa.next)===null&&(t=t.alternate,N.H=t===null||t.memoizedState===null?Ko:Ff),e}function Bo(e){if(e!==null&&typeof e=="object"){if(typeof e.then=="function")return si(e);if(e.$$typeof===R)return ia(e)}throw Error(s(438,String(e)))}function zf(e){var t=null,l=at.updateQueue;if(l!==null&&(t=l.memoCache),t==null){var o=at.alternate;o!==null&&(o=o.updateQueue,o!==null&&(o=o.memoCache,o!=null&&(t={data:o.data.map(function(m){return m.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),l===null&&(l=Pr(),at.updateQueue=l),l.memoCache=t,l=t.data[t.index],l===void 0)for(l=t.data[t.index]=Array(e),o=0;o<e;o++)l[o]=V;return t.index++,l}function ur(e,t){return typeof t=="function"?t(e):t}function Xr(e){var t=xa();return Uf(t,Ut,e)}function Uf(e,t,l){var o=e.queue;if(o===null)throw Error(s(311));o.lastRenderedReducer=l;var m=e.baseQueue,b=o.pending;if(b!==null){if(m!==null){var q=m.next;m.next=b.next,b.next=q}t.baseQueue=m=b,o.pending=null}if(b=e.baseState,m===null)e.memoizedState=b;else{t=m.next;var K=q=null,W=null,ge=t,_e=!1;do{var Ce=ge.lane&-536870913;if(Ce!==ge.lane?(Ve&Ce)===Ce:(rr&Ce)===Ce){var ve=ge.revertLane;if(ve===0)W!==null&&(W=W.next={lane:0,revertLane:0,action:ge.action,hasEagerState:ge.hasEagerState,eagerState:ge.eagerState,next:null}),Ce===tt&&(_e=!0);else if((rr&ve)===ve){ge=ge.next,ve===tt&&(_e=!0);continue}else Ce={lane:0,revertLane:ge.revertLane,action:ge.action,hasEagerState:ge.hasEagerState,eagerState:ge.eagerState,next:null},W===null?(K=W=Ce,q=b):W=W.next=Ce,at.lanes|=ve,pi|=ve;Ce=ge.action,ln&&l(b,Ce),b=ge.hasEagerState?ge.eagerState:l(b,Ce)}else ve={lane:Ce,revertLane:ge.revertLane,action:ge.action,hasEagerState:ge.hasEagerState,eagerState:ge.eagerState,next:null},W===null?(K=W=ve,q=b):W=W.next=ve,at.lanes|=Ce,pi|=Ce;ge=ge.next}while(ge!==null&&ge!==t);if(W===null?q=b:W.next=K,!gn(b,e.memoizedState)&&(Ga=!0,_e&&(l=gu,l!==null)))throw l;e.memoizedState=b,e.baseState=q,e.baseQueue=W,o.lastRenderedState=b}return m===null&&(o.lanes=0),[e.memoizedState,o.dispatch]}function Gf(e){var t=xa(),l=t.queue;if(l===null)throw Error(s(311));l.lastRenderedReducer=e;var o=l.dispatch,m=l.pending,b=t.memoizedState;if(m!==null){l.pending=null;var q=m=m.next;do b=e(b,q.action),q=q.next;while(q!==m);gn(b,t.memoizedState)||(Ga=!0),t.memoizedState=b,t.baseQueue===null&&(t.baseState=b),l.lastRenderedState=b}return[b,o]}function t0(e,t,l){var o=at,m=xa(),b=Ct;if(b){if(l===void 0)throw Error(s(407));l=l()}else l=t();var q=!gn((Ut||m).memoizedState,l);q&&(m.memoizedState=l,Ga=!0),m=m.queue;var K=n0.bind(null,o,m,e);if(xu(2048,8,K,[e]),m.getSnapshot!==t||q||Sa!==null&&Sa.memoizedState.tag&1){if(o.flags|=2048,Su(9,zs(),a0.bind(null,o,m,l,t),null),We===null)throw Error(s(349));b||(rr&124)!==0||_u(o,t,l)}return l}function _u(e,t,l){e.flags|=16384,e={getSnapshot:t,value:l},t=at.updateQueue,t===null?(t=Pr(),at.updateQueue=t,t.stores=[e]):(l=t.stores,l===null?t.stores=[e]:l.push(e))}function a0(e,t,l,o){t.value=l,t.getSnapshot=o,i0(t)&&r0(e)}function n0(e,t,l){return l(function(){i0(t)&&r0(e)})}function i0(e){var t=e.getSnapshot;e=e.value;try{var l=t();return!gn(e,l)}catch{return!0}}function r0(e){var t=$i(e,2);t!==null&&cn(t,e,2)}function qf(e){var t=un();if(typeof e=="function"){var l=e;if(e=l(),ln){Fe(!0);try{l()}finally{Fe(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:ur,lastRenderedState:e},t}function l0(e,t,l,o){return e.baseState=l,Uf(e,Ut,typeof o=="function"?o:ur)}function K1(e,t,l,o,m){if(Xo(e))throw Error(s(485));if(e=t.action,e!==null){var b={payload:m,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(q){b.listeners.push(q)}};N.T!==null?l(!0):b.isTransition=!1,o(b),l=t.pending,l===null?(b.next=t.pending=b,u0(t,b)):(b.next=l.next,t.pending=l.next=b)}}function u0(e,t){var l=t.action,o=t.payload,m=e.state;if(t.isTransition){var b=N.T,q={};N.T=q;try{var K=l(m,o),W=N.S;W!==null&&W(q,K),s0(e,t,K)}catch(ge){Hf(e,t,ge)}finally{N.T=b}}else try{b=l(m,o),s0(e,t,b)}catch(ge){Hf(e,t,ge)}}function s0(e,t,l){l!==null&&typeof l=="object"&&typeof l.then=="function"?l.then(function(o){o0(e,t,o)},function(o){return Hf(e,t,o)}):o0(e,t,l)}function o0(e,t,l){t.status="fulfilled",t.value=l,c0(t),e.state=l,t=e.pending,t!==null&&(l=t.next,l===t?e.pending=null:(l=l.next,t.next=l,u0(e,l)))}function Hf(e,t,l){var o=e.pending;if(e.pending=null,o!==null){o=o.next;do t.status="rejected",t.reason=l,c0(t),t=t.next;while(t!==o)}e.action=null}function c0(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function Bf(e,t){return t}function f0(e,t){if(Ct){var l=We.formState;if(l!==null){e:{var o=at;if(Ct){if(ea){t:{for(var m=ea,b=Cn;m.nodeType!==8;){if(!b){m=null;break t}if(m=gr(m.nextSibling),m===null){m=null;break t}}b=m.data,m=b==="F!"||b==="F"?m:null}if(m){ea=gr(m.nextSibling),o=m.data==="F!";break e}}Br(o)}o=!1}o&&(t=l[0])}}return l=un(),l.memoizedState=l.baseState=t,o={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Bf,lastRenderedState:t},l.queue=o,l=C0.bind(null,at,o),o.dispatch=l,o=qf(!1),b=Po.bind(null,at,!1,o.queue),o=un(),m={state:t,dispatch:null,action:e,pending:null},o.queue=m,l=K1.bind(null,at,m,b,l),m.dispatch=l,o.memoizedState=e,[t,l,!1]}function h0(e){var t=xa();return d0(t,Ut,e)}function d0(e,t,l){if(t=Uf(e,t,Bf)[0],e=Xr(ur)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var o=si(t)}catch(q){throw q===Ms?ui:q}else o=t;t=xa();var m=t.queue,b=m.dispatch;return l!==t.memoizedState&&(at.flags|=2048,Su(9,zs(),F1.bind(null,m,l),null)),[o,b,e]}function F1(e,t){e.action=t}function g0(e){var t=xa(),l=Ut;if(l!==null)return d0(t,l,e);xa(),t=t.memoizedState,l=xa();var o=l.queue.dispatch;return l.memoizedState=e,[t,o,!1]}function Su(e,t,l,o){return e={tag:e,create:l,deps:o,inst:t,next:null},t=at.updateQueue,t===null&&(t=Pr(),at.updateQueue=t),l=t.lastEffect,l===null?t.lastEffect=e.next=e:(o=l.next,l.next=e,e.next=o,t.lastEffect=e),e}function zs(){return{destroy:void 0,resource:void 0}}function Lf(){return xa().memoizedState}function Lo(e,t,l,o){var m=un();o=o===void 0?null:o,at.flags|=e,m.memoizedState=Su(1|t,zs(),l,o)}function xu(e,t,l,o){var m=xa();o=o===void 0?null:o;var b=m.memoizedState.inst;Ut!==null&&o!==null&&Ja(o,Ut.memoizedState.deps)?m.memoizedState=Su(t,b,l,o):(at.flags|=e,m.memoizedState=Su(1|t,b,l,o))}function jf(e,t){Lo(8390656,8,e,t)}function Vf(e,t){xu(2048,8,e,t)}function jo(e,t){return xu(4,2,e,t)}function Vo(e,t){return xu(4,4,e,t)}function p0(e,t){if(typeof t=="function"){e=e();var l=t(e);return function(){typeof l=="function"?l():t(null)}}if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function v0(e,t,l){l=l!=null?l.concat([e]):null,xu(4,4,p0.bind(null,t,e),l)}function Yf(){}function m0(e,t){var l=xa();t=t===void 0?null:t;var o=l.memoizedState;return t!==null&&Ja(t,o[1])?o[0]:(l.memoizedState=[e,t],e)}function Pf(e,t){var l=xa();t=t===void 0?null:t;var o=l.memoizedState;if(t!==null&&Ja(t,o[1]))return o[0];if(o=e(),ln){Fe(!0);try{e()}finally{Fe(!1)}}return l.memoizedState=[o,t],o}function Yo(e,t,l){return l===void 0||(rr&1073741824)!==0?e.memoizedState=t:(e.memoizedState=l,e=ac(),at.lanes|=e,pi|=e,l)}function y0(e,t,l,o){return gn(l,t)?l:bu.current!==null?(e=Yo(e,l,o),gn(e,t)||(Ga=!0),e):(rr&42)===0?(Ga=!0,e.memoizedState=l):(e=ac(),at.lanes|=e,pi|=e,t)}function b0(e,t,l,o,m){var b=L.p;L.p=b!==0&&8>b?b:8;var q=N.T,K={};N.T=K,Po(e,!1,t,l);try{var W=m(),ge=N.S;if(ge!==null&&ge(K,W),W!==null&&typeof W=="object"&&typeof W.then=="function"){var _e=P1(W,o);Us(e,t,_e,ua(e))}else Us(e,t,o,ua(e))}catch(Ce){Us(e,t,{then:function(){},status:"rejected",reason:Ce},ua())}finally{L.p=b,N.T=q}}function k1(){}function Xf(e,t,l,o){if(e.tag!==5)throw Error(s(476));var m=_0(e).queue;b0(e,m,t,Z,l===null?k1:function(){return S0(e),l(o)})}function _0(e){var t=e.memoizedState;if(t!==null)return t;t={memoizedState:Z,baseState:Z,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:ur,lastRenderedState:Z},next:null};var l={};return t.next={memoizedState:l,baseState:l,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:ur,lastRenderedState:l},next:null},e.memoizedState=t,e=e.alternate,e!==null&&(e.memoizedState=t),t}function S0(e){var t=_0(e).next.queue;Us(e,t,{},ua())}function Kf(){return ia(ih)}function x0(){return xa().memoizedState}function E0(){return xa().memoizedState}function Q1(e){for(var t=e.return;t!==null;){switch(t.tag){case 24:case 3:var l=ua();e=Ri(l);var o=ir(t,e,l);o!==null&&(cn(o,t,l),_l(o,t,l)),t={cache:wo()},e.payload=t;return}t=t.return}}function Z1(e,t,l){var o=ua();l={lane:o,revertLane:0,action:l,hasEagerState:!1,eagerState:null,next:null},Xo(e)?T0(t,l):(l=To(e,t,l,o),l!==null&&(cn(l,e,o),An(l,t,o)))}function C0(e,t,l){var o=ua();Us(e,t,l,o)}function Us(e,t,l,o){var m={lane:o,revertLane:0,action:l,hasEagerState:!1,eagerState:null,next:null};if(Xo(e))T0(t,m);else{var b=e.alternate;if(e.lanes===0&&(b===null||b.lanes===0)&&(b=t.lastRenderedReducer,b!==null))try{var q=t.lastRenderedState,K=b(q,l);if(m.hasEagerState=!0,m.eagerState=K,gn(K,q))return Ur(e,t,m,0),We===null&&bs(),!1}catch{}finally{}if(l=To(e,t,m,o),l!==null)return cn(l,e,o),An(l,t,o),!0}return!1}function Po(e,t,l,o){if(o={lane:2,revertLane:I1(),action:o,hasEagerState:!1,eagerState:null,next:null},Xo(e)){if(t)throw Error(s(479))}else t=To(e,l,o,2),t!==null&&cn(t,e,2)}function Xo(e){var t=e.alternate;return e===at||t!==null&&t===at}function T0(e,t){Yr=qo=!0;var l=e.pending;l===null?t.next=t:(t.next=l.next,l.next=t),e.pending=t}function An(e,t,l){if((l&4194048)!==0){var o=t.lanes;o&=e.pendingLanes,l|=o,t.lanes=l,Zu(e,l)}}var Gs={readContext:ia,use:Bo,useCallback:ha,useContext:ha,useEffect:ha,useImperativeHandle:ha,useLayoutEffect:ha,useInsertionEffect:ha,useMemo:ha,useReducer:ha,useRef:ha,useState:ha,useDebugValue:ha,useDeferredValue:ha,useTransition:ha,useSyncExternalStore:ha,useId:ha,useHostTransitionStatus:ha,useFormState:ha,useActionState:ha,useOptimistic:ha,useMemoCache:ha,useCacheRefresh:ha},Ko={readContext:ia,use:Bo,useCallback:function(e,t){return un().memoizedState=[e,t===void 0?null:t],e},useContext:ia,useEffect:jf,useImperativeHandle:function(e,t,l){l=l!=null?l.concat([e]):null,Lo(4194308,4,p0.bind(null,t,e),l)},useLayoutEffect:function(e,t){return Lo(4194308,4,e,t)},useInsertionEffect:function(e,t){Lo(4,2,e,t)},useMemo:function(e,t){var l=un();t=t===void 0?null:t;var o=e();if(ln){Fe(!0);try{e()}finally{Fe(!1)}}return l.memoizedState=[o,t],o},useReducer:function(e,t,l){var o=un();if(l!==void 0){var m=l(t);if(ln){Fe(!0);try{l(t)}finally{Fe(!1)}}}else m=t;return o.memoizedState=o.baseState=m,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:m},o.queue=e,e=e.dispatch=Z1.bind(null,at,e),[o.memoizedState,e]},useRef:function(e){var t=un();return e={current:e},t.memoizedState=e},useState:function(e){e=qf(e);var t=e.queue,l=C0.bind(null,at,t);return t.dispatch=l,[e.memoizedState,l]},useDebugValue:Yf,useDeferredValue:function(e,t){var l=un();return Yo(l,e,t)},useTransition:function(){var e=qf(!1);return e=b0.bind(null,at,e.queue,!0,!1),un().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,l){var o=at,m=un();if(Ct){if(l===void 0)throw Error(s(407));l=l()}else{if(l=t(),We===null)throw Error(s(349));(Ve&124)!==0||_u(o,t,l)}m.memoizedState=l;var b={value:l,getSnapshot:t};return m.queue=b,jf(n0.bind(null,o,b,e),[e]),o.flags|=2048,Su(9,zs(),a0.bind(null,o,b,l,t),null),l},useId:function(){var e=un(),t=We.identifierPrefix;if(Ct){var l=Ti,o=Ci;l=(o&~(1<<32-zt(o)-1)).toString(32)+l,t="«"+t+"R"+l,l=Aa++,0<l&&(t+="H"+l.toString(32)),t+="»"}else l=Id++,t="«"+t+"r"+l.toString(32)+"»";return e.memoizedState=t},useHostTransitionStatus:Kf,useFormState:f0,useActionState:f0,useOptimistic:function(e){var t=un();t.memoizedState=t.baseState=e;var l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=l,t=Po.bind(null,at,!0,l),l.dispatch=t,[e,t]},useMemoCache:zf,useCacheRefresh:function(){return un().memoizedState=Q1.bind(null,at)}},Ff={readContext:ia,use:Bo,useCallback:m0,useContext:ia,useEffect:Vf,useImperativeHandle:v0,useInsertionEffect:jo,useLayoutEffect:Vo,useMemo:Pf,useReducer:Xr,useRef:Lf,useState:function(){return Xr(ur)},useDebugValue:Yf,useDeferredValue:function(e,t){var l=xa();return y0(l,Ut.memoizedState,e,t)},useTransition:function(){var e=Xr(ur)[0],t=xa().memoizedState;return[typeof e=="boolean"?e:si(e),t]},useSyncExternalStore:t0,useId:x0,useHostTransitionStatus:Kf,useFormState:h0,useActionState:h0,useOptimistic:function(e,t){var l=xa();return l0(l,Ut,e,t)},useMemoCache:zf,useCacheRefresh:E0},A0={readContext:ia,use:Bo,useCallback:m0,useContext:ia,useEffect:Vf,useImperativeHandle:v0,useInsertionEffect:jo,useLayoutEffect:Vo,useMemo:Pf,useReducer:Gf,useRef:Lf,useState:function(){return Gf(ur)},useDebugValue:Yf,useDeferredValue:function(e,t){var l=xa();return Ut===null?Yo(l,e,t):y0(l,Ut.memoizedState,e,t)},useTransition:function(){var e=Gf(ur)[0],t=xa().memoizedState;return[typeof e=="boolean"?e:si(e),t]},useSyncExternalStore:t0,useId:x0,useHostTransitionStatus:Kf,useFormState:g0,useActionState:g0,useOptimistic:function(e,t){var l=xa();return Ut!==null?l0(l,Ut,e,t):(l.baseState=e,[e,l.queue.dispatch])},useMemoCache:zf,useCacheRefresh:E0},Sl=null,qs=0;function Hs(e){var t=qs;return qs+=1,Sl===null&&(Sl=[]),Uo(Sl,e,t)}function Eu(e,t){t=t.props.ref,e.ref=t!==void 0?t:null}function Fo(e,t){throw t.$$typeof===T?Error(s(525)):(e=Object.prototype.toString.call(t),Error(s(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e)))}function R0(e){var t=e._init;return t(e._payload)}function O0(e){function t(le,re){if(e){var fe=le.deletions;fe===null?(le.deletions=[re],le.flags|=16):fe.push(re)}}function l(le,re){if(!e)return null;for(;re!==null;)t(le,re),re=re.sibling;return null}function o(le){for(var re=new Map;le!==null;)le.key!==null?re.set(le.key,le):re.set(le.index,le),le=le.sibling;return re}function m(le,re){return le=fa(le,re),le.index=0,le.sibling=null,le}function b(le,re,fe){return le.index=fe,e?(fe=le.alternate,fe!==null?(fe=fe.index,fe<re?(le.flags|=67108866,re):fe):(le.flags|=67108866,re)):(le.flags|=1048576,re)}function q(le){return e&&le.alternate===null&&(le.flags|=67108866),le}function K(le,re,fe,Ee){return re===null||re.tag!==6?(re=Ss(fe,le.mode,Ee),re.return=le,re):(re=m(re,fe),re.return=le,re)}function W(le,re,fe,Ee){var qe=fe.type;return qe===E?_e(le,re,fe.props.children,Ee,fe.key):re!==null&&(re.elementType===qe||typeof qe=="object"&&qe!==null&&qe.$$typeof===X&&R0(qe)===re.type)?(re=m(re,fe.props),Eu(re,fe),re.return=le,re):(re=Ua(fe.type,fe.key,fe.props,null,le.mode,Ee),Eu(re,fe),re.return=le,re)}function ge(le,re,fe,Ee){return re===null||re.tag!==4||re.stateNode.containerInfo!==fe.containerInfo||re.stateNode.implementation!==fe.implementation?(re=Ao(fe,le.mode,Ee),re.return=le,re):(re=m(re,fe.children||[]),re.return=le,re)}function _e(le,re,fe,Ee,qe){return re===null||re.tag!==7?(re=qr(fe,le.mode,Ee,qe),re.return=le,re):(re=m(re,fe),re.return=le,re)}function Ce(le,re,fe){if(typeof re=="string"&&re!==""||typeof re=="number"||typeof re=="bigint")return re=Ss(""+re,le.mode,fe),re.return=le,re;if(typeof re=="object"&&re!==null){switch(re.$$typeof){case C:return fe=Ua(re.type,re.key,re.props,null,le.mode,fe),Eu(fe,re),fe.return=le,fe;case x:return re=Ao(re,le.mode,fe),re.return=le,re;case X:var Ee=re._init;return re=Ee(re._payload),Ce(le,re,fe)}if(H(re)||I(re))return re=qr(re,le.mode,fe,null),re.return=le,re;if(typeof re.then=="function")return Ce(le,Hs(re),fe);if(re.$$typeof===R)return Ce(le,Ts(le,re),fe);Fo(le,re)}return null}function ve(le,re,fe,Ee){var qe=re!==null?re.key:null;if(typeof fe=="string"&&fe!==""||typeof fe=="number"||typeof fe=="bigint")return qe!==null?null:K(le,re,""+fe,Ee);if(typeof fe=="object"&&fe!==null){switch(fe.$$typeof){case C:return fe.key===qe?W(le,re,fe,Ee):null;case x:return fe.key===qe?ge(le,re,fe,Ee):null;case X:return qe=fe._init,fe=qe(fe._payload),ve(le,re,fe,Ee)}if(H(fe)||I(fe))return qe!==null?null:_e(le,re,fe,Ee,null);if(typeof fe.then=="function")return ve(le,re,Hs(fe),Ee);if(fe.$$typeof===R)return ve(le,re,Ts(le,fe),Ee);Fo(le,fe)}return null}function me(le,re,fe,Ee,qe){if(typeof Ee=="string"&&Ee!==""||typeof Ee=="number"||typeof Ee=="bigint")return le=le.get(fe)||null,K(re,le,""+Ee,qe);if(typeof Ee=="object"&&Ee!==null){switch(Ee.$$typeof){case C:return le=le.get(Ee.key===null?fe:Ee.key)||null,W(re,le,Ee,qe);case x:return le=le.get(Ee.key===null?fe:Ee.key)||null,ge(re,le,Ee,qe);case X:var gt=Ee._init;return Ee=gt(Ee._payload),me(le,re,fe,Ee,qe)}if(H(Ee)||I(Ee))return le=le.get(fe)||null,_e(re,le,Ee,qe,null);if(typeof Ee.then=="function")return me(le,re,fe,Hs(Ee),qe);if(Ee.$$typeof===R)return me(le,re,fe,Ts(re,Ee),qe);Fo(re,Ee)}return null}function Ze(le,re,fe,Ee){for(var qe=null,gt=null,je=re,Ke=re=0,$a=null;je!==null&&Ke<fe.length;Ke++){je.index>Ke?($a=je,je=null):$a=je.sibling;var Nt=ve(le,je,fe[Ke],Ee);if(Nt===null){je===null&&(je=$a);break}e&&je&&Nt.alternate===null&&t(le,je),re=b(Nt,re,Ke),gt===null?qe=Nt:gt.sibling=Nt,gt=Nt,je=$a}if(Ke===fe.length)return l(le,je),Ct&&er(le,Ke),qe;if(je===null){for(;Ke<fe.length;Ke++)je=Ce(le,fe[Ke],Ee),je!==null&&(re=b(je,re,Ke),gt===null?qe=je:gt.sibling=je,gt=je);return Ct&&er(le,Ke),qe}for(je=o(je);Ke<fe.length;Ke++)$a=me(je,le,Ke,fe[Ke],Ee),$a!==null&&(e&&$a.alternate!==null&&je.delete($a.key===null?Ke:$a.key),re=b($a,re,Ke),gt===null?qe=$a:gt.sibling=$a,gt=$a);return e&&je.forEach(function(ju){return t(le,ju)}),Ct&&er(le,Ke),qe}function Xe(le,re,fe,Ee){if(fe==null)throw Error(s(151));for(var qe=null,gt=null,je=re,Ke=re=0,$a=null,Nt=fe.next();je!==null&&!Nt.done;Ke++,Nt=fe.next()){je.index>Ke?($a=je,je=null):$a=je.sibling;var ju=ve(le,je,Nt.value,Ee);if(ju===null){je===null&&(je=$a);break}e&&je&&ju.alternate===null&&t(le,je),re=b(ju,re,Ke),gt===null?qe=ju:gt.sibling=ju,gt=ju,je=$a}if(Nt.done)return l(le,je),Ct&&er(le,Ke),qe;if(je===null){for(;!Nt.done;Ke++,Nt=fe.next())Nt=Ce(le,Nt.value,Ee),Nt!==null&&(re=b(Nt,re,Ke),gt===null?qe=Nt:gt.sibling=Nt,gt=Nt);return Ct&&er(le,Ke),qe}for(je=o(je);!Nt.done;Ke++,Nt=fe.next())Nt=me(je,le,Ke,Nt.value,Ee),Nt!==null&&(e&&Nt.alternate!==null&&je.delete(Nt.key===null?Ke:Nt.key),re=b(Nt,re,Ke),gt===null?qe=Nt:gt.sibling=Nt,gt=Nt);return e&&je.forEach(function(US){return t(le,US)}),Ct&&er(le,Ke),qe}function Ft(le,re,fe,Ee){if(typeof fe=="object"&&fe!==null&&fe.type===E&&fe.key===null&&(fe=fe.props.children),typeof fe=="object"&&fe!==null){switch(fe.$$typeof){case C:e:{for(var qe=fe.key;re!==null;){if(re.key===qe){if(qe=fe.type,qe===E){if(re.tag===7){l(le,re.sibling),Ee=m(re,fe.props.children),Ee.return=le,le=Ee;break e}}else if(re.elementType===qe||typeof qe=="object"&&qe!==null&&qe.$$typeof===X&&R0(qe)===re.type){l(le,re.sibling),Ee=m(re,fe.props),Eu(Ee,fe),Ee.return=le,le=Ee;break e}l(le,re);break}else t(le,re);re=re.sibling}fe.type===E?(Ee=qr(fe.props.children,le.mode,Ee,fe.key),Ee.return=le,le=Ee):(Ee=Ua(fe.type,fe.key,fe.props,null,le.mode,Ee),Eu(Ee,fe),Ee.return=le,le=Ee)}return q(le);case x:e:{for(qe=fe.key;re!==null;){if(re.key===qe)if(re.tag===4&&re.stateNode.containerInfo===fe.containerInfo&&re.stateNode.implementation===fe.implementation){l(le,re.sibling),Ee=m(re,fe.children||[]),Ee.return=le,le=Ee;break e}else{l(le,re);break}else t(le,re);re=re.sibling}Ee=Ao(fe,le.mode,Ee),Ee.return=le,le=Ee}return q(le);case X:return qe=fe._init,fe=qe(fe._payload),Ft(le,re,fe,Ee)}if(H(fe))return Ze(le,re,fe,Ee);if(I(fe)){if(qe=I(fe),typeof qe!="function")throw Error(s(150));return fe=qe.call(fe),Xe(le,re,fe,Ee)}if(typeof fe.then=="function")return Ft(le,re,Hs(fe),Ee);if(fe.$$typeof===R)return Ft(le,re,Ts(le,fe),Ee);Fo(le,fe)}return typeof fe=="string"&&fe!==""||typeof fe=="number"||typeof fe=="bigint"?(fe=""+fe,re!==null&&re.tag===6?(l(le,re.sibling),Ee=m(re,fe),Ee.return=le,le=Ee):(l(le,re),Ee=Ss(fe,le.mode,Ee),Ee.return=le,le=Ee),q(le)):l(le,re)}return function(le,re,fe,Ee){try{qs=0;var qe=Ft(le,re,fe,Ee);return Sl=null,qe}catch(je){if(je===Ms||je===ui)throw je;var gt=mn(29,je,null,le.mode);return gt.lanes=Ee,gt.return=le,gt}finally{}}}var xl=O0(!0),M0=O0(!1),Ht=te(null),oi=null;function Kr(e){var t=e.alternate;ne(da,da.current&1),ne(Ht,e),oi===null&&(t===null||bu.current!==null||t.memoizedState!==null)&&(oi=e)}function w0(e){if(e.tag===22){if(ne(da,da.current),ne(Ht,e),oi===null){var t=e.alternate;t!==null&&t.memoizedState!==null&&(oi=e)}}else Fr()}function Fr(){ne(da,da.current),ne(Ht,Ht.current)}function Oi(e){de(Ht),oi===e&&(oi=null),de(da)}var da=te(0);function sr(e){for(var t=e;t!==null;){if(t.tag===13){var l=t.memoizedState;if(l!==null&&(l=l.dehydrated,l===null||l.data==="$?"||cg(l)))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function kr(e,t,l,o){t=e.memoizedState,l=l(o,t),l=l==null?t:_({},t,l),e.memoizedState=l,e.lanes===0&&(e.updateQueue.baseState=l)}var sn={enqueueSetState:function(e,t,l){e=e._reactInternals;var o=ua(),m=Ri(o);m.payload=t,l!=null&&(m.callback=l),t=ir(e,m,o),t!==null&&(cn(t,e,o),_l(t,e,o))},enqueueReplaceState:function(e,t,l){e=e._reactInternals;var o=ua(),m=Ri(o);m.tag=1,m.payload=t,l!=null&&(m.callback=l),t=ir(e,m,o),t!==null&&(cn(t,e,o),_l(t,e,o))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var l=ua(),o=Ri(l);o.tag=2,t!=null&&(o.callback=t),t=ir(e,o,l),t!==null&&(cn(t,e,l),_l(t,e,l))}};function N0(e,t,l,o,m,b,q){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(o,b,q):t.prototype&&t.prototype.isPureReactComponent?!ri(l,o)||!ri(m,b):!0}function D0(e,t,l,o){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(l,o),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(l,o),t.state!==e&&sn.enqueueReplaceState(t,t.state,null)}function Mi(e,t){var l=t;if("ref"in t){l={};for(var o in t)o!=="ref"&&(l[o]=t[o])}if(e=e.defaultProps){l===t&&(l=_({},l));for(var m in e)l[m]===void 0&&(l[m]=e[m])}return l}var El=typeof reportError=="function"?reportError:function(e){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof e=="object"&&e!==null&&typeof e.message=="string"?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",e);return}console.error(e)};function Bs(e){El(e)}function ko(e){console.error(e)}function z0(e){El(e)}function Qo(e,t){try{var l=e.onUncaughtError;l(t.value,{componentStack:t.stack})}catch(o){setTimeout(function(){throw o})}}function Kn(e,t,l){try{var o=e.onCaughtError;o(l.value,{componentStack:l.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(m){setTimeout(function(){throw m})}}function Zo(e,t,l){return l=Ri(l),l.tag=3,l.payload={element:null},l.callback=function(){Qo(e,t)},l}function U0(e){return e=Ri(e),e.tag=3,e}function Jo(e,t,l,o){var m=l.type.getDerivedStateFromError;if(typeof m=="function"){var b=o.value;e.payload=function(){return m(b)},e.callback=function(){Kn(t,l,o)}}var q=l.stateNode;q!==null&&typeof q.componentDidCatch=="function"&&(e.callback=function(){Kn(t,l,o),typeof m!="function"&&(Un===null?Un=new Set([this]):Un.add(this));var K=o.stack;this.componentDidCatch(o.value,{componentStack:K!==null?K:""})})}function J1(e,t,l,o,m){if(l.flags|=32768,o!==null&&typeof o=="object"&&typeof o.then=="function"){if(t=l.alternate,t!==null&&Vn(t,l,m,!0),l=Ht.current,l!==null){switch(l.tag){case 13:return oi===null?a():l.alternate===null&&kt===0&&(kt=3),l.flags&=-257,l.flags|=65536,l.lanes=m,o===ws?l.flags|=16384:(t=l.updateQueue,t===null?l.updateQueue=new Set([o]):t.add(o),ye(e,o,m)),!1;case 22:return l.flags|=65536,o===ws?l.flags|=16384:(t=l.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([o])},l.updateQueue=t):(l=t.retryQueue,l===null?t.retryQueue=new Set([o]):l.add(o)),ye(e,o,m)),!1}throw Error(s(435,l.tag))}return ye(e,o,m),a(),!1}if(Ct)return t=Ht.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=m,o!==Oo&&(e=Error(s(422),{cause:o}),bl(Ya(e,l)))):(o!==Oo&&(t=Error(s(423),{cause:o}),bl(Ya(t,l))),e=e.current.alternate,e.flags|=65536,m&=-m,e.lanes|=m,o=Ya(o,l),m=Zo(e.stateNode,o,m),vu(e,m),kt!==4&&(kt=2)),!1;var b=Error(s(520),{cause:o});if(b=Ya(b,l),wt===null?wt=[b]:wt.push(b),kt!==4&&(kt=2),t===null)return!0;o=Ya(o,l),l=t;do{switch(l.tag){case 3:return l.flags|=65536,e=m&-m,l.lanes|=e,e=Zo(l.stateNode,o,e),vu(l,e),!1;case 1:if(t=l.type,b=l.stateNode,(l.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||b!==null&&typeof b.componentDidCatch=="function"&&(Un===null||!Un.has(b))))return l.flags|=65536,m&=-m,l.lanes|=m,m=U0(m),Jo(m,e,l,o),vu(l,m),!1}l=l.return}while(l!==null);return!1}var G0=Error(s(461)),Ga=!1;function ga(e,t,l,o){t.child=e===null?M0(t,null,l,o):xl(t,e.child,l,o)}function bn(e,t,l,o,m){l=l.render;var b=t.ref;if("ref"in o){var q={};for(var K in o)K!=="ref"&&(q[K]=o[K])}else q=o;return Ai(t),o=lr(e,t,l,q,b,m),K=Nf(),e!==null&&!Ga?(Ho(e,t,m),qa(e,t,m)):(Ct&&K&&_f(t),t.flags|=1,ga(e,t,o,m),t.child)}function _n(e,t,l,o,m){if(e===null){var b=l.type;return typeof b=="function"&&!_s(b)&&b.defaultProps===void 0&&l.compare===null?(t.tag=15,t.type=b,kf(e,t,b,o,m)):(e=Ua(l.type,null,o,t,t.mode,m),e.ref=t.ref,e.return=t,t.child=e)}if(b=e.child,!Ls(e,m)){var q=b.memoizedProps;if(l=l.compare,l=l!==null?l:ri,l(q,o)&&e.ref===t.ref)return qa(e,t,m)}return t.flags|=1,e=fa(b,o),e.ref=t.ref,e.return=t,t.child=e}function kf(e,t,l,o,m){if(e!==null){var b=e.memoizedProps;if(ri(b,o)&&e.ref===t.ref)if(Ga=!1,t.pendingProps=o=b,Ls(e,m))(e.flags&131072)!==0&&(Ga=!0);else return t.lanes=e.lanes,qa(e,t,m)}return Cu(e,t,l,o,m)}function Cl(e,t,l){var o=t.pendingProps,m=o.children,b=e!==null?e.memoizedState:null;if(o.mode==="hidden"){if((t.flags&128)!==0){if(o=b!==null?b.baseLanes|l:l,e!==null){for(m=t.child=e.child,b=0;m!==null;)b=b|m.lanes|m.childLanes,m=m.sibling;t.childLanes=b&~o}else t.childLanes=0,t.child=null;return Tl(e,t,o,l)}if((l&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},e!==null&&Os(t,b!==null?b.cachePool:null),b!==null?Wd(t,b):wf(),w0(t);else return t.lanes=t.childLanes=536870912,Tl(e,t,b!==null?b.baseLanes|l:l,l)}else b!==null?(Os(t,b.cachePool),Wd(t,b),Fr(),t.memoizedState=null):(e!==null&&Os(t,null),wf(),Fr());return ga(e,t,m,l),t.child}function Tl(e,t,l,o){var m=Vr();return m=m===null?null:{parent:_a._currentValue,pool:m},t.memoizedState={baseLanes:l,cachePool:m},e!==null&&Os(t,null),wf(),w0(t),e!==null&&Vn(e,t,o,!0),null}function Al(e,t){var l=t.ref;if(l===null)e!==null&&e.ref!==null&&(t.flags|=4194816);else{if(typeof l!="function"&&typeof l!="object")throw Error(s(284));(e===null||e.ref!==l)&&(t.flags|=4194816)}}function Cu(e,t,l,o,m){return Ai(t),l=lr(e,t,l,o,void 0,m),o=Nf(),e!==null&&!Ga?(Ho(e,t,m),qa(e,t,m)):(Ct&&o&&_f(t),t.flags|=1,ga(e,t,l,m),t.child)}function Rn(e,t,l,o,m,b){return Ai(t),t.updateQueue=null,l=e0(t,o,l,m),$d(e),o=Nf(),e!==null&&!Ga?(Ho(e,t,b),qa(e,t,b)):(Ct&&o&&_f(t),t.flags|=1,ga(e,t,l,b),t.child)}function On(e,t,l,o,m){if(Ai(t),t.stateNode===null){var b=Gr,q=l.contextType;typeof q=="object"&&q!==null&&(b=ia(q)),b=new l(o,b),t.memoizedState=b.state!==null&&b.state!==void 0?b.state:null,b.updater=sn,t.stateNode=b,b._reactInternals=t,b=t.stateNode,b.props=o,b.state=t.memoizedState,b.refs={},Of(t),q=l.contextType,b.context=typeof q=="object"&&q!==null?ia(q):Gr,b.state=t.memoizedState,q=l.getDerivedStateFromProps,typeof q=="function"&&(kr(t,l,q,o),b.state=t.memoizedState),typeof l.getDerivedStateFromProps=="function"||typeof b.getSnapshotBeforeUpdate=="function"||typeof b.UNSAFE_componentWillMount!="function"&&typeof b.componentWillMount!="function"||(q=b.state,typeof b.componentWillMount=="function"&&b.componentWillMount(),typeof b.UNSAFE_componentWillMount=="function"&&b.UNSAFE_componentWillMount(),q!==b.state&&sn.enqueueReplaceState(b,b.state,null),mu(t,o,b,m),Ns(),b.state=t.memoizedState),typeof b.componentDidMount=="function"&&(t.flags|=4194308),o=!0}else if(e===null){b=t.stateNode;var K=t.memoizedProps,W=Mi(l,K);b.props=W;var ge=b.context,_e=l.contextType;q=Gr,typeof _e=="object"&&_e!==null&&(q=ia(_e));var Ce=l.getDerivedStateFromProps;_e=typeof Ce=="function"||typeof b.getSnapshotBeforeUpdate=="function",K=t.pendingProps!==K,_e||typeof b.UNSAFE_componentWillReceiveProps!="function"&&typeof b.componentWillReceiveProps!="function"||(K||ge!==q)&&D0(t,b,o,q),nr=!1;var ve=t.memoizedState;b.state=ve,mu(t,o,b,m),Ns(),ge=t.memoizedState,K||ve!==ge||nr?(typeof Ce=="function"&&(kr(t,l,Ce,o),ge=t.memoizedState),(W=nr||N0(t,l,W,o,ve,ge,q))?(_e||typeof b.UNSAFE_componentWillMount!="function"&&typeof b.componentWillMount!="function"||(typeof b.componentWillMount=="function"&&b.componentWillMount(),typeof b.UNSAFE_componentWillMount=="function"&&b.UNSAFE_componentWillMount()),typeof b.componentDidMount=="function"&&(t.flags|=4194308)):(typeof b.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=o,t.memoizedState=ge),b.props=o,b.state=ge,b.context=q,o=W):(typeof b.componentDidMount=="function"&&(t.flags|=4194308),o=!1)}else{b=t.stateNode,ke(e,t),q=t.memoizedProps,_e=Mi(l,q),b.props=_e,Ce=t.pendingProps,ve=b.context,ge=l.contextType,W=Gr,typeof ge=="object"&&ge!==null&&(W=ia(ge)),K=l.getDerivedStateFromProps,(ge=typeof K=="function"||typeof b.getSnapshotBeforeUpdate=="function")||typeof b.UNSAFE_componentWillReceiveProps!="function"&&typeof b.componentWillReceiveProps!="function"||(q!==Ce||ve!==W)&&D0(t,b,o,W),nr=!1,ve=t.memoizedState,b.state=ve,mu(t,o,b,m),Ns();var me=t.memoizedState;q!==Ce||ve!==me||nr||e!==null&&e.dependencies!==null&&Cs(e.dependencies)?(typeof K=="function"&&(kr(t,l,K,o),me=t.memoizedState),(_e=nr||N0(t,l,_e,o,ve,me,W)||e!==null&&e.dependencies!==null&&Cs(e.dependencies))?(ge||typeof b.UNSAFE_componentWillUpdate!="function"&&typeof b.componentWillUpdate!="function"||(typeof b.componentWillUpdate=="function"&&b.componentWillUpdate(o,me,W),typeof b.UNSAFE_componentWillUpdate=="function"&&b.UNSAFE_componentWillUpdate(o,me,W)),typeof b.componentDidUpdate=="function"&&(t.flags|=4),typeof b.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof b.componentDidUpdate!="function"||q===e.memoizedProps&&ve===e.memoizedState||(t.flags|=4),typeof b.getSnapshotBeforeUpdate!="function"||q===e.memoizedProps&&ve===e.memoizedState||(t.flags|=1024),t.memoizedProps=o,t.memoizedState=me),b.props=o,b.state=me,b.context=W,o=_e):(typeof b.componentDidUpdate!="function"||q===e.memoizedProps&&ve===e.memoizedState||(t.flags|=4),typeof b.getSnapshotBeforeUpdate!="function"||q===e.memoizedProps&&ve===e.memoizedState||(t.flags|=1024),o=!1)}return b=o,Al(e,t),o=(t.flags&128)!==0,b||o?(b=t.stateNode,l=o&&typeof l.getDerivedStateFromError!="function"?null:b.render(),t.flags|=1,e!==null&&o?(t.child=xl(t,e.child,null,m),t.child=xl(t,null,l,m)):ga(e,t,l,m),t.memoizedState=b.state,e=t.child):e=qa(e,t,m),e}function Qr(e,t,l,o){return fu(),t.flags|=256,ga(e,t,l,o),t.child}var ci={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function fi(e){return{baseLanes:e,cachePool:Do()}}function Ra(e,t,l){return e=e!==null?e.childLanes&~l:0,t&&(e|=Jn),e}function Tu(e,t,l){var o=t.pendingProps,m=!1,b=(t.flags&128)!==0,q;if((q=b)||(q=e!==null&&e.memoizedState===null?!1:(da.current&2)!==0),q&&(m=!0,t.flags&=-129),q=(t.flags&32)!==0,t.flags&=-33,e===null){if(Ct){if(m?Kr(t):Fr(),Ct){var K=ea,W;if(W=K){e:{for(W=K,K=Cn;W.nodeType!==8;){if(!K){K=null;break e}if(W=gr(W.nextSibling),W===null){K=null;break e}}K=W}K!==null?(t.memoizedState={dehydrated:K,treeContext:Hr!==null?{id:Ci,overflow:Ti}:null,retryLane:536870912,hydrationErrors:null},W=mn(18,null,null,0),W.stateNode=K,W.return=t,t.child=W,rn=t,ea=null,W=!0):W=!1}W||Br(t)}if(K=t.memoizedState,K!==null&&(K=K.dehydrated,K!==null))return cg(K)?t.lanes=32:t.lanes=536870912,null;Oi(t)}return K=o.children,o=o.fallback,m?(Fr(),m=t.mode,K=Rl({mode:"hidden",children:K},m),o=qr(o,m,l,null),K.return=t,o.return=t,K.sibling=o,t.child=K,m=t.child,m.memoizedState=fi(l),m.childLanes=Ra(e,q,l),t.memoizedState=ci,o):(Kr(t),wi(t,K))}if(W=e.memoizedState,W!==null&&(K=W.dehydrated,K!==null)){if(b)t.flags&256?(Kr(t),t.flags&=-257,t=Ka(e,t,l)):t.memoizedState!==null?(Fr(),t.child=e.child,t.flags|=128,t=null):(Fr(),m=o.fallback,K=t.mode,o=Rl({mode:"visible",children:o.children},K),m=qr(m,K,l,null),m.flags|=2,o.return=t,m.return=t,o.sibling=m,t.child=o,xl(t,e.child,null,l),o=t.child,o.memoizedState=fi(l),o.childLanes=Ra(e,q,l),t.memoizedState=ci,t=m);else if(Kr(t),cg(K)){if(q=K.nextSibling&&K.nextSibling.dataset,q)var ge=q.dgst;q=ge,o=Error(s(419)),o.stack="",o.digest=q,bl({value:o,source:null,stack:null}),t=Ka(e,t,l)}else if(Ga||Vn(e,t,l,!1),q=(l&e.childLanes)!==0,Ga||q){if(q=We,q!==null&&(o=l&-l,o=(o&42)!==0?1:_r(o),o=(o&(q.suspendedLanes|l))!==0?0:o,o!==0&&o!==W.retryLane))throw W.retryLane=o,$i(e,o),cn(q,e,o),G0;K.data==="$?"||a(),t=Ka(e,t,l)}else K.data==="$?"?(t.flags|=192,t.child=e.child,t=null):(e=W.treeContext,ea=gr(K.nextSibling),rn=t,Ct=!0,jn=null,Cn=!1,e!==null&&(Pa[En++]=Ci,Pa[En++]=Ti,Pa[En++]=Hr,Ci=e.id,Ti=e.overflow,Hr=t),t=wi(t,o.children),t.flags|=4096);return t}return m?(Fr(),m=o.fallback,K=t.mode,W=e.child,ge=W.sibling,o=fa(W,{mode:"hidden",children:o.children}),o.subtreeFlags=W.subtreeFlags&65011712,ge!==null?m=fa(ge,m):(m=qr(m,K,l,null),m.flags|=2),m.return=t,o.return=t,o.sibling=m,t.child=o,o=m,m=t.child,K=e.child.memoizedState,K===null?K=fi(l):(W=K.cachePool,W!==null?(ge=_a._currentValue,W=W.parent!==ge?{parent:ge,pool:ge}:W):W=Do(),K={baseLanes:K.baseLanes|l,cachePool:W}),m.memoizedState=K,m.childLanes=Ra(e,q,l),t.memoizedState=ci,o):(Kr(t),l=e.child,e=l.sibling,l=fa(l,{mode:"visible",children:o.children}),l.return=t,l.sibling=null,e!==null&&(q=t.deletions,q===null?(t.deletions=[e],t.flags|=16):q.push(e)),t.child=l,t.memoizedState=null,l)}function wi(e,t){return t=Rl({mode:"visible",children:t},e.mode),t.return=e,e.child=t}function Rl(e,t){return e=mn(22,e,null,t),e.lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function Ka(e,t,l){return xl(t,e.child,null,l),e=wi(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Fa(e,t,l){e.lanes|=t;var o=e.alternate;o!==null&&(o.lanes|=t),Cf(e.return,t,l)}function bt(e,t,l,o,m){var b=e.memoizedState;b===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:o,tail:l,tailMode:m}:(b.isBackwards=t,b.rendering=null,b.renderingStartTime=0,b.last=o,b.tail=l,b.tailMode=m)}function Fn(e,t,l){var o=t.pendingProps,m=o.revealOrder,b=o.tail;if(ga(e,t,o.children,l),o=da.current,(o&2)!==0)o=o&1|2,t.flags|=128;else{if(e!==null&&(e.flags&128)!==0)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Fa(e,l,t);else if(e.tag===19)Fa(e,l,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}o&=1}switch(ne(da,o),m){case"forwards":for(l=t.child,m=null;l!==null;)e=l.alternate,e!==null&&sr(e)===null&&(m=l),l=l.sibling;l=m,l===null?(m=t.child,t.child=null):(m=l.sibling,l.sibling=null),bt(t,!1,m,l,b);break;case"backwards":for(l=null,m=t.child,t.child=null;m!==null;){if(e=m.alternate,e!==null&&sr(e)===null){t.child=m;break}e=m.sibling,m.sibling=l,l=m,m=e}bt(t,!0,l,null,b);break;case"together":bt(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function qa(e,t,l){if(e!==null&&(t.dependencies=e.dependencies),pi|=t.lanes,(l&t.childLanes)===0)if(e!==null){if(Vn(e,t,l,!1),(l&t.childLanes)===0)return null}else return null;if(e!==null&&t.child!==e.child)throw Error(s(153));if(t.child!==null){for(e=t.child,l=fa(e,e.pendingProps),t.child=l,l.return=t;e.sibling!==null;)e=e.sibling,l=l.sibling=fa(e,e.pendingProps),l.return=t;l.sibling=null}return t.child}function Ls(e,t){return(e.lanes&t)!==0?!0:(e=e.dependencies,!!(e!==null&&Cs(e)))}function kn(e,t,l){switch(t.tag){case 3:oe(t,t.stateNode.containerInfo),jr(t,_a,e.memoizedState.cache),fu();break;case 27:case 5:Re(t);break;case 4:oe(t,t.stateNode.containerInfo);break;case 10:jr(t,t.type,t.memoizedProps.value);break;case 13:var o=t.memoizedState;if(o!==null)return o.dehydrated!==null?(Kr(t),t.flags|=128,null):(l&t.child.childLanes)!==0?Tu(e,t,l):(Kr(t),e=qa(e,t,l),e!==null?e.sibling:null);Kr(t);break;case 19:var m=(e.flags&128)!==0;if(o=(l&t.childLanes)!==0,o||(Vn(e,t,l,!1),o=(l&t.childLanes)!==0),m){if(o)return Fn(e,t,l);t.flags|=128}if(m=t.memoizedState,m!==null&&(m.rendering=null,m.tail=null,m.lastEffect=null),ne(da,da.current),o)break;return null;case 22:case 23:return t.lanes=0,Cl(e,t,l);case 24:jr(t,_a,e.memoizedState.cache)}return qa(e,t,l)}function Ol(e,t,l){if(e!==null)if(e.memoizedProps!==t.pendingProps)Ga=!0;else{if(!Ls(e,l)&&(t.flags&128)===0)return Ga=!1,kn(e,t,l);Ga=(e.flags&131072)!==0}else Ga=!1,Ct&&(t.flags&1048576)!==0&&Ro(t,cu,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var o=t.elementType,m=o._init;if(o=m(o._payload),t.type=o,typeof o=="function")_s(o)?(e=Mi(o,e),t.tag=1,t=On(null,t,o,e,l)):(t.tag=0,t=Cu(null,t,o,e,l));else{if(o!=null){if(m=o.$$typeof,m===z){t.tag=11,t=bn(null,t,o,e,l);break e}else if(m===Q){t.tag=14,t=_n(null,t,o,e,l);break e}}throw t=P(o)||o,Error(s(306,t,""))}}return t;case 0:return Cu(e,t,t.type,t.pendingProps,l);case 1:return o=t.type,m=Mi(o,t.pendingProps),On(e,t,o,m,l);case 3:e:{if(oe(t,t.stateNode.containerInfo),e===null)throw Error(s(387));o=t.pendingProps;var b=t.memoizedState;m=b.element,ke(e,t),mu(t,o,null,l);var q=t.memoizedState;if(o=q.cache,jr(t,_a,o),o!==b.cache&&Es(t,[_a],l,!0),Ns(),o=q.element,b.isDehydrated)if(b={element:o,isDehydrated:!1,cache:q.cache},t.updateQueue.baseState=b,t.memoizedState=b,t.flags&256){t=Qr(e,t,o,l);break e}else if(o!==m){m=Ya(Error(s(424)),t),bl(m),t=Qr(e,t,o,l);break e}else{switch(e=t.stateNode.containerInfo,e.nodeType){case 9:e=e.body;break;default:e=e.nodeName==="HTML"?e.ownerDocument.body:e}for(ea=gr(e.firstChild),rn=t,Ct=!0,jn=null,Cn=!0,l=M0(t,null,o,l),t.child=l;l;)l.flags=l.flags&-3|4096,l=l.sibling}else{if(fu(),o===m){t=qa(e,t,l);break e}ga(e,t,o,l)}t=t.child}return t;case 26:return Al(e,t),e===null?(l=Oy(t.type,null,t.pendingProps,null))?t.memoizedState=l:Ct||(l=t.type,e=t.pendingProps,o=V0(xe.current).createElement(l),o[Ba]=t,o[Qa]=e,fn(o,l,e),Da(o),t.stateNode=o):t.memoizedState=Oy(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return Re(t),e===null&&Ct&&(o=t.stateNode=Ty(t.type,t.pendingProps,xe.current),rn=t,Cn=!0,m=ea,Gu(t.type)?(fg=m,ea=gr(o.firstChild)):ea=m),ga(e,t,t.pendingProps.children,l),Al(e,t),e===null&&(t.flags|=4194304),t.child;case 5:return e===null&&Ct&&((m=o=ea)&&(o=oS(o,t.type,t.pendingProps,Cn),o!==null?(t.stateNode=o,rn=t,ea=gr(o.firstChild),Cn=!1,m=!0):m=!1),m||Br(t)),Re(t),m=t.type,b=t.pendingProps,q=e!==null?e.memoizedProps:null,o=b.children,ug(m,b)?o=null:q!==null&&ug(m,q)&&(t.flags|=32),t.memoizedState!==null&&(m=lr(e,t,X1,null,null,l),ih._currentValue=m),Al(e,t),ga(e,t,o,l),t.child;case 6:return e===null&&Ct&&((e=l=ea)&&(l=cS(l,t.pendingProps,Cn),l!==null?(t.stateNode=l,rn=t,ea=null,e=!0):e=!1),e||Br(t)),null;case 13:return Tu(e,t,l);case 4:return oe(t,t.stateNode.containerInfo),o=t.pendingProps,e===null?t.child=xl(t,null,o,l):ga(e,t,o,l),t.child;case 11:return bn(e,t,t.type,t.pendingProps,l);case 7:return ga(e,t,t.pendingProps,l),t.child;case 8:return ga(e,t,t.pendingProps.children,l),t.child;case 12:return ga(e,t,t.pendingProps.children,l),t.child;case 10:return o=t.pendingProps,jr(t,t.type,o.value),ga(e,t,o.children,l),t.child;case 9:return m=t.type._context,o=t.pendingProps.children,Ai(t),m=ia(m),o=o(m),t.flags|=1,ga(e,t,o,l),t.child;case 14:return _n(e,t,t.type,t.pendingProps,l);case 15:return kf(e,t,t.type,t.pendingProps,l);case 19:return Fn(e,t,l);case 31:return o=t.pendingProps,l=t.mode,o={mode:o.mode,children:o.children},e===null?(l=Rl(o,l),l.ref=t.ref,t.child=l,l.return=t,t=l):(l=fa(e.child,o),l.ref=t.ref,t.child=l,l.return=t,t=l),t;case 22:return Cl(e,t,l);case 24:return Ai(t),o=ia(_a),e===null?(m=Vr(),m===null&&(m=We,b=wo(),m.pooledCache=b,b.refCount++,b!==null&&(m.pooledCacheLanes|=l),m=b),t.memoizedState={parent:o,cache:m},Of(t),jr(t,_a,m)):((e.lanes&l)!==0&&(ke(e,t),mu(t,null,null,l),Ns()),m=e.memoizedState,b=t.memoizedState,m.parent!==o?(m={parent:o,cache:o},t.memoizedState=m,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=m),jr(t,_a,o)):(o=b.cache,jr(t,_a,o),o!==m.cache&&Es(t,[_a],l,!0))),ga(e,t,t.pendingProps.children,l),t.child;case 29:throw t.pendingProps}throw Error(s(156,t.tag))}function hi(e){e.flags|=4}function js(e,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)e.flags&=-16777217;else if(e.flags|=16777216,!zy(t)){if(t=Ht.current,t!==null&&((Ve&4194048)===Ve?oi!==null:(Ve&62914560)!==Ve&&(Ve&536870912)===0||t!==oi))throw Pn=ws,Af;e.flags|=8192}}function or(e,t){t!==null&&(e.flags|=4),e.flags&16384&&(t=e.tag!==22?br():536870912,e.lanes|=t,xt|=t)}function Ml(e,t){if(!Ct)switch(e.tailMode){case"hidden":t=e.tail;for(var l=null;t!==null;)t.alternate!==null&&(l=t),t=t.sibling;l===null?e.tail=null:l.sibling=null;break;case"collapsed":l=e.tail;for(var o=null;l!==null;)l.alternate!==null&&(o=l),l=l.sibling;o===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:o.sibling=null}}function Yt(e){var t=e.alternate!==null&&e.alternate.child===e.child,l=0,o=0;if(t)for(var m=e.child;m!==null;)l|=m.lanes|m.childLanes,o|=m.subtreeFlags&65011712,o|=m.flags&65011712,m.return=e,m=m.sibling;else for(m=e.child;m!==null;)l|=m.lanes|m.childLanes,o|=m.subtreeFlags,o|=m.flags,m.return=e,m=m.sibling;return e.subtreeFlags|=o,e.childLanes=l,t}function Qf(e,t,l){var o=t.pendingProps;switch(Sf(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Yt(t),null;case 1:return Yt(t),null;case 3:return l=t.stateNode,o=null,e!==null&&(o=e.memoizedState.cache),t.memoizedState.cache!==o&&(t.flags|=2048),ar(_a),Te(),l.pendingContext&&(l.context=l.pendingContext,l.pendingContext=null),(e===null||e.child===null)&&(li(t)?hi(t):e===null||e.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Ot())),Yt(t),null;case 26:return l=t.memoizedState,e===null?(hi(t),l!==null?(Yt(t),js(t,l)):(Yt(t),t.flags&=-16777217)):l?l!==e.memoizedState?(hi(t),Yt(t),js(t,l)):(Yt(t),t.flags&=-16777217):(e.memoizedProps!==o&&hi(t),Yt(t),t.flags&=-16777217),null;case 27:Me(t),l=xe.current;var m=t.type;if(e!==null&&t.stateNode!=null)e.memoizedProps!==o&&hi(t);else{if(!o){if(t.stateNode===null)throw Error(s(166));return Yt(t),null}e=ce.current,li(t)?kd(t):(e=Ty(m,o,l),t.stateNode=e,hi(t))}return Yt(t),null;case 5:if(Me(t),l=t.type,e!==null&&t.stateNode!=null)e.memoizedProps!==o&&hi(t);else{if(!o){if(t.stateNode===null)throw Error(s(166));return Yt(t),null}if(e=ce.current,li(t))kd(t);else{switch(m=V0(xe.current),e){case 1:e=m.createElementNS("http://www.w3.org/2000/svg",l);break;case 2:e=m.createElementNS("http://www.w3.org/1998/Math/MathML",l);break;default:switch(l){case"svg":e=m.createElementNS("http://www.w3.org/2000/svg",l);break;case"math":e=m.createElementNS("http://www.w3.org/1998/Math/MathML",l);break;case"script":e=m.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e=typeof o.is=="string"?m.createElement("select",{is:o.is}):m.createElement("select"),o.multiple?e.multiple=!0:o.size&&(e.size=o.size);break;default:e=typeof o.is=="string"?m.createElement(l,{is:o.is}):m.createElement(l)}}e[Ba]=t,e[Qa]=o;e:for(m=t.child;m!==null;){if(m.tag===5||m.tag===6)e.appendChild(m.stateNode);else if(m.tag!==4&&m.tag!==27&&m.child!==null){m.child.return=m,m=m.child;continue}if(m===t)break e;for(;m.sibling===null;){if(m.return===null||m.return===t)break e;m=m.return}m.sibling.return=m.return,m=m.sibling}t.stateNode=e;e:switch(fn(e,l,o),l){case"button":case"input":case"select":case"textarea":e=!!o.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&hi(t)}}return Yt(t),t.flags&=-16777217,null;case 6:if(e&&t.stateNode!=null)e.memoizedProps!==o&&hi(t);else{if(typeof o!="string"&&t.stateNode===null)throw Error(s(166));if(e=xe.current,li(t)){if(e=t.stateNode,l=t.memoizedProps,o=null,m=rn,m!==null)switch(m.tag){case 27:case 5:o=m.memoizedProps}e[Ba]=t,e=!!(e.nodeValue===l||o!==null&&o.suppressHydrationWarning===!0||yy(e.nodeValue,l)),e||Br(t)}else e=V0(e).createTextNode(o),e[Ba]=t,t.stateNode=e}return Yt(t),null;case 13:if(o=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(m=li(t),o!==null&&o.dehydrated!==null){if(e===null){if(!m)throw Error(s(318));if(m=t.memoizedState,m=m!==null?m.dehydrated:null,!m)throw Error(s(317));m[Ba]=t}else fu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;Yt(t),m=!1}else m=Ot(),e!==null&&e.memoizedState!==null&&(e.memoizedState.hydrationErrors=m),m=!0;if(!m)return t.flags&256?(Oi(t),t):(Oi(t),null)}if(Oi(t),(t.flags&128)!==0)return t.lanes=l,t;if(l=o!==null,e=e!==null&&e.memoizedState!==null,l){o=t.child,m=null,o.alternate!==null&&o.alternate.memoizedState!==null&&o.alternate.memoizedState.cachePool!==null&&(m=o.alternate.memoizedState.cachePool.pool);var b=null;o.memoizedState!==null&&o.memoizedState.cachePool!==null&&(b=o.memoizedState.cachePool.pool),b!==m&&(o.flags|=2048)}return l!==e&&l&&(t.child.flags|=8192),or(t,t.updateQueue),Yt(t),null;case 4:return Te(),e===null&&ag(t.stateNode.containerInfo),Yt(t),null;case 10:return ar(t.type),Yt(t),null;case 19:if(de(da),m=t.memoizedState,m===null)return Yt(t),null;if(o=(t.flags&128)!==0,b=m.rendering,b===null)if(o)Ml(m,!1);else{if(kt!==0||e!==null&&(e.flags&128)!==0)for(e=t.child;e!==null;){if(b=sr(e),b!==null){for(t.flags|=128,Ml(m,!1),e=b.updateQueue,t.updateQueue=e,or(t,e),t.subtreeFlags=0,e=l,l=t.child;l!==null;)bf(l,e),l=l.sibling;return ne(da,da.current&1|2),t.child}e=e.sibling}m.tail!==null&&we()>Wa&&(t.flags|=128,o=!0,Ml(m,!1),t.lanes=4194304)}else{if(!o)if(e=sr(b),e!==null){if(t.flags|=128,o=!0,e=e.updateQueue,t.updateQueue=e,or(t,e),Ml(m,!0),m.tail===null&&m.tailMode==="hidden"&&!b.alternate&&!Ct)return Yt(t),null}else 2*we()-m.renderingStartTime>Wa&&l!==536870912&&(t.flags|=128,o=!0,Ml(m,!1),t.lanes=4194304);m.isBackwards?(b.sibling=t.child,t.child=b):(e=m.last,e!==null?e.sibling=b:t.child=b,m.last=b)}return m.tail!==null?(t=m.tail,m.rendering=t,m.tail=t.sibling,m.renderingStartTime=we(),t.sibling=null,e=da.current,ne(da,o?e&1|2:e&1),t):(Yt(t),null);case 22:case 23:return Oi(t),Ds(),o=t.memoizedState!==null,e!==null?e.memoizedState!==null!==o&&(t.flags|=8192):o&&(t.flags|=8192),o?(l&536870912)!==0&&(t.flags&128)===0&&(Yt(t),t.subtreeFlags&6&&(t.flags|=8192)):Yt(t),l=t.updateQueue,l!==null&&or(t,l.retryQueue),l=null,e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(l=e.memoizedState.cachePool.pool),o=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(o=t.memoizedState.cachePool.pool),o!==l&&(t.flags|=2048),e!==null&&de(Yn),null;case 24:return l=null,e!==null&&(l=e.memoizedState.cache),t.memoizedState.cache!==l&&(t.flags|=2048),ar(_a),Yt(t),null;case 25:return null;case 30:return null}throw Error(s(156,t.tag))}function Au(e,t){switch(Sf(t),t.tag){case 1:return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return ar(_a),Te(),e=t.flags,(e&65536)!==0&&(e&128)===0?(t.flags=e&-65537|128,t):null;case 26:case 27:case 5:return Me(t),null;case 13:if(Oi(t),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(s(340));fu()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return de(da),null;case 4:return Te(),null;case 10:return ar(t.type),null;case 22:case 23:return Oi(t),Ds(),e!==null&&de(Yn),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 24:return ar(_a),null;case 25:return null;default:return null}}function Ru(e,t){switch(Sf(t),t.tag){case 3:ar(_a),Te();break;case 26:case 27:case 5:Me(t);break;case 4:Te();break;case 13:Oi(t);break;case 19:de(da);break;case 10:ar(t.type);break;case 22:case 23:Oi(t),Ds(),e!==null&&de(Yn);break;case 24:ar(_a)}}function wl(e,t){try{var l=t.updateQueue,o=l!==null?l.lastEffect:null;if(o!==null){var m=o.next;l=m;do{if((l.tag&e)===e){o=void 0;var b=l.create,q=l.inst;o=b(),q.destroy=o}l=l.next}while(l!==m)}}catch(K){ie(t,t.return,K)}}function Mn(e,t,l){try{var o=t.updateQueue,m=o!==null?o.lastEffect:null;if(m!==null){var b=m.next;o=b;do{if((o.tag&e)===e){var q=o.inst,K=q.destroy;if(K!==void 0){q.destroy=void 0,m=t;var W=l,ge=K;try{ge()}catch(_e){ie(m,W,_e)}}}o=o.next}while(o!==b)}}catch(_e){ie(t,t.return,_e)}}function Nl(e){var t=e.updateQueue;if(t!==null){var l=e.stateNode;try{Jd(t,l)}catch(o){ie(e,e.return,o)}}}function cr(e,t,l){l.props=Mi(e.type,e.memoizedProps),l.state=e.memoizedState;try{l.componentWillUnmount()}catch(o){ie(e,t,o)}}function Dl(e,t){try{var l=e.ref;if(l!==null){switch(e.tag){case 26:case 27:case 5:var o=e.stateNode;break;case 30:o=e.stateNode;break;default:o=e.stateNode}typeof l=="function"?e.refCleanup=l(o):l.current=o}}catch(m){ie(e,t,m)}}function Ni(e,t){var l=e.ref,o=e.refCleanup;if(l!==null)if(typeof o=="function")try{o()}catch(m){ie(e,t,m)}finally{e.refCleanup=null,e=e.alternate,e!=null&&(e.refCleanup=null)}else if(typeof l=="function")try{l(null)}catch(m){ie(e,t,m)}else l.current=null}function Ou(e){var t=e.type,l=e.memoizedProps,o=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":l.autoFocus&&o.focus();break e;case"img":l.src?o.src=l.src:l.srcSet&&(o.srcset=l.srcSet)}}catch(m){ie(e,e.return,m)}}function Vs(e,t,l){try{var o=e.stateNode;iS(o,e.type,l,t),o[Qa]=t}catch(m){ie(e,e.return,m)}}function Ys(e){return e.tag===5||e.tag===3||e.tag===26||e.tag===27&&Gu(e.type)||e.tag===4}function Zr(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Ys(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.tag===27&&Gu(e.type)||e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Jr(e,t,l){var o=e.tag;if(o===5||o===6)e=e.stateNode,t?(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l).insertBefore(e,t):(t=l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,t.appendChild(e),l=l._reactRootContainer,l!=null||t.onclick!==null||(t.onclick=j0));else if(o!==4&&(o===27&&Gu(e.type)&&(l=e.stateNode,t=null),e=e.child,e!==null))for(Jr(e,t,l),e=e.sibling;e!==null;)Jr(e,t,l),e=e.sibling}function Wr(e,t,l){var o=e.tag;if(o===5||o===6)e=e.stateNode,t?l.insertBefore(e,t):l.appendChild(e);else if(o!==4&&(o===27&&Gu(e.type)&&(l=e.stateNode),e=e.child,e!==null))for(Wr(e,t,l),e=e.sibling;e!==null;)Wr(e,t,l),e=e.sibling}function Ir(e){var t=e.stateNode,l=e.memoizedProps;try{for(var o=e.type,m=t.attributes;m.length;)t.removeAttributeNode(m[0]);fn(t,o,l),t[Ba]=e,t[Qa]=l}catch(b){ie(e,e.return,b)}}var Di=!1,Pt=!1,Mu=!1,wn=typeof WeakSet=="function"?WeakSet:Set,Bt=null;function Oa(e,t){if(e=e.containerInfo,rg=k0,e=hf(e),vs(e)){if("selectionStart"in e)var l={start:e.selectionStart,end:e.selectionEnd};else e:{l=(l=e.ownerDocument)&&l.defaultView||window;var o=l.getSelection&&l.getSelection();if(o&&o.rangeCount!==0){l=o.anchorNode;var m=o.anchorOffset,b=o.focusNode;o=o.focusOffset;try{l.nodeType,b.nodeType}catch{l=null;break e}var q=0,K=-1,W=-1,ge=0,_e=0,Ce=e,ve=null;t:for(;;){for(var me;Ce!==l||m!==0&&Ce.nodeType!==3||(K=q+m),Ce!==b||o!==0&&Ce.nodeType!==3||(W=q+o),Ce.nodeType===3&&(q+=Ce.nodeValue.length),(me=Ce.firstChild)!==null;)ve=Ce,Ce=me;for(;;){if(Ce===e)break t;if(ve===l&&++ge===m&&(K=q),ve===b&&++_e===o&&(W=q),(me=Ce.nextSibling)!==null)break;Ce=ve,ve=Ce.parentNode}Ce=me}l=K===-1||W===-1?null:{start:K,end:W}}else l=null}l=l||{start:0,end:0}}else l=null;for(lg={focusedElem:e,selectionRange:l},k0=!1,Bt=t;Bt!==null;)if(t=Bt,e=t.child,(t.subtreeFlags&1024)!==0&&e!==null)e.return=t,Bt=e;else for(;Bt!==null;){switch(t=Bt,b=t.alternate,e=t.flags,t.tag){case 0:break;case 11:case 15:break;case 1:if((e&1024)!==0&&b!==null){e=void 0,l=t,m=b.memoizedProps,b=b.memoizedState,o=l.stateNode;try{var Ze=Mi(l.type,m,l.elementType===l.type);e=o.getSnapshotBeforeUpdate(Ze,b),o.__reactInternalSnapshotBeforeUpdate=e}catch(Xe){ie(l,l.return,Xe)}}break;case 3:if((e&1024)!==0){if(e=t.stateNode.containerInfo,l=e.nodeType,l===9)og(e);else if(l===1)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":og(e);break;default:e.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((e&1024)!==0)throw Error(s(163))}if(e=t.sibling,e!==null){e.return=t.return,Bt=e;break}Bt=t.return}}function fr(e,t,l){var o=l.flags;switch(l.tag){case 0:case 11:case 15:on(e,l),o&4&&wl(5,l);break;case 1:if(on(e,l),o&4)if(e=l.stateNode,t===null)try{e.componentDidMount()}catch(q){ie(l,l.return,q)}else{var m=Mi(l.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(m,t,e.__reactInternalSnapshotBeforeUpdate)}catch(q){ie(l,l.return,q)}}o&64&&Nl(l),o&512&&Dl(l,l.return);break;case 3:if(on(e,l),o&64&&(e=l.updateQueue,e!==null)){if(t=null,l.child!==null)switch(l.child.tag){case 27:case 5:t=l.child.stateNode;break;case 1:t=l.child.stateNode}try{Jd(e,t)}catch(q){ie(l,l.return,q)}}break;case 27:t===null&&o&4&&Ir(l);case 26:case 5:on(e,l),t===null&&o&4&&Ou(l),o&512&&Dl(l,l.return);break;case 12:on(e,l);break;case 13:on(e,l),o&4&&$r(e,l),o&64&&(e=l.memoizedState,e!==null&&(e=e.dehydrated,e!==null&&(l=Qt.bind(null,l),fS(e,l))));break;case 22:if(o=l.memoizedState!==null||Di,!o){t=t!==null&&t.memoizedState!==null||Pt,m=Di;var b=Pt;Di=o,(Pt=t)&&!b?zi(e,l,(l.subtreeFlags&8772)!==0):on(e,l),Di=m,Pt=b}break;case 30:break;default:on(e,l)}}function rt(e){var t=e.alternate;t!==null&&(e.alternate=null,rt(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&$t(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Ye=null,St=!1;function Qn(e,t,l){for(l=l.child;l!==null;)zl(e,t,l),l=l.sibling}function zl(e,t,l){if(Dt&&typeof Dt.onCommitFiberUnmount=="function")try{Dt.onCommitFiberUnmount(Zt,l)}catch{}switch(l.tag){case 26:Pt||Ni(l,t),Qn(e,t,l),l.memoizedState?l.memoizedState.count--:l.stateNode&&(l=l.stateNode,l.parentNode.removeChild(l));break;case 27:Pt||Ni(l,t);var o=Ye,m=St;Gu(l.type)&&(Ye=l.stateNode,St=!1),Qn(e,t,l),eh(l.stateNode),Ye=o,St=m;break;case 5:Pt||Ni(l,t);case 6:if(o=Ye,m=St,Ye=null,Qn(e,t,l),Ye=o,St=m,Ye!==null)if(St)try{(Ye.nodeType===9?Ye.body:Ye.nodeName==="HTML"?Ye.ownerDocument.body:Ye).removeChild(l.stateNode)}catch(b){ie(l,t,b)}else try{Ye.removeChild(l.stateNode)}catch(b){ie(l,t,b)}break;case 18:Ye!==null&&(St?(e=Ye,Ey(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,l.stateNode),sh(e)):Ey(Ye,l.stateNode));break;case 4:o=Ye,m=St,Ye=l.stateNode.containerInfo,St=!0,Qn(e,t,l),Ye=o,St=m;break;case 0:case 11:case 14:case 15:Pt||Mn(2,l,t),Pt||Mn(4,l,t),Qn(e,t,l);break;case 1:Pt||(Ni(l,t),o=l.stateNode,typeof o.componentWillUnmount=="function"&&cr(l,t,o)),Qn(e,t,l);break;case 21:Qn(e,t,l);break;case 22:Pt=(o=Pt)||l.memoizedState!==null,Qn(e,t,l),Pt=o;break;default:Qn(e,t,l)}}function $r(e,t){if(t.memoizedState===null&&(e=t.alternate,e!==null&&(e=e.memoizedState,e!==null&&(e=e.dehydrated,e!==null))))try{sh(e)}catch(l){ie(t,t.return,l)}}function Wo(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return t===null&&(t=e.stateNode=new wn),t;case 22:return e=e.stateNode,t=e._retryCache,t===null&&(t=e._retryCache=new wn),t;default:throw Error(s(435,e.tag))}}function Ul(e,t){var l=Wo(e);t.forEach(function(o){var m=Qe.bind(null,e,o);l.has(o)||(l.add(o),o.then(m,m))})}function Ha(e,t){var l=t.deletions;if(l!==null)for(var o=0;o<l.length;o++){var m=l[o],b=e,q=t,K=q;e:for(;K!==null;){switch(K.tag){case 27:if(Gu(K.type)){Ye=K.stateNode,St=!1;break e}break;case 5:Ye=K.stateNode,St=!1;break e;case 3:case 4:Ye=K.stateNode.containerInfo,St=!0;break e}K=K.return}if(Ye===null)throw Error(s(160));zl(b,q,m),Ye=null,St=!1,b=m.alternate,b!==null&&(b.return=null),m.return=null}if(t.subtreeFlags&13878)for(t=t.child;t!==null;)Io(t,e),t=t.sibling}var di=null;function Io(e,t){var l=e.alternate,o=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:Ha(t,e),ra(e),o&4&&(Mn(3,e,e.return),wl(3,e),Mn(5,e,e.return));break;case 1:Ha(t,e),ra(e),o&512&&(Pt||l===null||Ni(l,l.return)),o&64&&Di&&(e=e.updateQueue,e!==null&&(o=e.callbacks,o!==null&&(l=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=l===null?o:l.concat(o))));break;case 26:var m=di;if(Ha(t,e),ra(e),o&512&&(Pt||l===null||Ni(l,l.return)),o&4){var b=l!==null?l.memoizedState:null;if(o=e.memoizedState,l===null)if(o===null)if(e.stateNode===null){e:{o=e.type,l=e.memoizedProps,m=m.ownerDocument||m;t:switch(o){case"title":b=m.getElementsByTagName("title")[0],(!b||b[Er]||b[Ba]||b.namespaceURI==="http://www.w3.org/2000/svg"||b.hasAttribute("itemprop"))&&(b=m.createElement(o),m.head.insertBefore(b,m.querySelector("head > title"))),fn(b,o,l),b[Ba]=e,Da(b),o=b;break e;case"link":var q=Ny("link","href",m).get(o+(l.href||""));if(q){for(var K=0;K<q.length;K++)if(b=q[K],b.getAttribute("href")===(l.href==null||l.href===""?null:l.href)&&b.getAttribute("rel")===(l.rel==null?null:l.rel)&&b.getAttribute("title")===(l.title==null?null:l.title)&&b.getAttribute("crossorigin")===(l.crossOrigin==null?null:l.crossOrigin)){q.splice(K,1);break t}}b=m.createElement(o),fn(b,o,l),m.head.appendChild(b);break;case"meta":if(q=Ny("meta","content",m).get(o+(l.content||""))){for(K=0;K<q.length;K++)if(b=q[K],b.getAttribute("content")===(l.content==null?null:""+l.content)&&b.getAttribute("name")===(l.name==null?null:l.name)&&b.getAttribute("property")===(l.property==null?null:l.property)&&b.getAttribute("http-equiv")===(l.httpEquiv==null?null:l.httpEquiv)&&b.getAttribute("charset")===(l.charSet==null?null:l.charSet)){q.splice(K,1);break t}}b=m.createElement(o),fn(b,o,l),m.head.appendChild(b);break;default:throw Error(s(468,o))}b[Ba]=e,Da(b),o=b}e.stateNode=o}else Dy(m,e.type,e.stateNode);else e.stateNode=wy(m,o,e.memoizedProps);else b!==o?(b===null?l.stateNode!==null&&(l=l.stateNode,l.parentNode.removeChild(l)):b.count--,o===null?Dy(m,e.type,e.stateNode):wy(m,o,e.memoizedProps)):o===null&&e.stateNode!==null&&Vs(e,e.memoizedProps,l.memoizedProps)}break;case 27:Ha(t,e),ra(e),o&512&&(Pt||l===null||Ni(l,l.return)),l!==null&&o&4&&Vs(e,e.memoizedProps,l.memoizedProps);break;case 5:if(Ha(t,e),ra(e),o&512&&(Pt||l===null||Ni(l,l.return)),e.flags&32){m=e.stateNode;try{ii(m,"")}catch(me){ie(e,e.return,me)}}o&4&&e.stateNode!=null&&(m=e.memoizedProps,Vs(e,m,l!==null?l.memoizedProps:m)),o&1024&&(Mu=!0);break;case 6:if(Ha(t,e),ra(e),o&4){if(e.stateNode===null)throw Error(s(162));o=e.memoizedProps,l=e.stateNode;try{l.nodeValue=o}catch(me){ie(e,e.return,me)}}break;case 3:if(X0=null,m=di,di=Y0(t.containerInfo),Ha(t,e),di=m,ra(e),o&4&&l!==null&&l.memoizedState.isDehydrated)try{sh(t.containerInfo)}catch(me){ie(e,e.return,me)}Mu&&(Mu=!1,el(e));break;case 4:o=di,di=Y0(e.stateNode.containerInfo),Ha(t,e),ra(e),di=o;break;case 12:Ha(t,e),ra(e);break;case 13:Ha(t,e),ra(e),e.child.flags&8192&&e.memoizedState!==null!=(l!==null&&l.memoizedState!==null)&&(qt=we()),o&4&&(o=e.updateQueue,o!==null&&(e.updateQueue=null,Ul(e,o)));break;case 22:m=e.memoizedState!==null;var W=l!==null&&l.memoizedState!==null,ge=Di,_e=Pt;if(Di=ge||m,Pt=_e||W,Ha(t,e),Pt=_e,Di=ge,ra(e),o&8192)e:for(t=e.stateNode,t._visibility=m?t._visibility&-2:t._visibility|1,m&&(l===null||W||Di||Pt||Nn(e)),l=null,t=e;;){if(t.tag===5||t.tag===26){if(l===null){W=l=t;try{if(b=W.stateNode,m)q=b.style,typeof q.setProperty=="function"?q.setProperty("display","none","important"):q.display="none";else{K=W.stateNode;var Ce=W.memoizedProps.style,ve=Ce!=null&&Ce.hasOwnProperty("display")?Ce.display:null;K.style.display=ve==null||typeof ve=="boolean"?"":(""+ve).trim()}}catch(me){ie(W,W.return,me)}}}else if(t.tag===6){if(l===null){W=t;try{W.stateNode.nodeValue=m?"":W.memoizedProps}catch(me){ie(W,W.return,me)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===e)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;t.sibling===null;){if(t.return===null||t.return===e)break e;l===t&&(l=null),t=t.return}l===t&&(l=null),t.sibling.return=t.return,t=t.sibling}o&4&&(o=e.updateQueue,o!==null&&(l=o.retryQueue,l!==null&&(o.retryQueue=null,Ul(e,l))));break;case 19:Ha(t,e),ra(e),o&4&&(o=e.updateQueue,o!==null&&(e.updateQueue=null,Ul(e,o)));break;case 30:break;case 21:break;default:Ha(t,e),ra(e)}}function ra(e){var t=e.flags;if(t&2){try{for(var l,o=e.return;o!==null;){if(Ys(o)){l=o;break}o=o.return}if(l==null)throw Error(s(160));switch(l.tag){case 27:var m=l.stateNode,b=Zr(e);Wr(e,b,m);break;case 5:var q=l.stateNode;l.flags&32&&(ii(q,""),l.flags&=-33);var K=Zr(e);Wr(e,K,q);break;case 3:case 4:var W=l.stateNode.containerInfo,ge=Zr(e);Jr(e,ge,W);break;default:throw Error(s(161))}}catch(_e){ie(e,e.return,_e)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function el(e){if(e.subtreeFlags&1024)for(e=e.child;e!==null;){var t=e;el(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),e=e.sibling}}function on(e,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)fr(e,t.alternate,t),t=t.sibling}function Nn(e){for(e=e.child;e!==null;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:Mn(4,t,t.return),Nn(t);break;case 1:Ni(t,t.return);var l=t.stateNode;typeof l.componentWillUnmount=="function"&&cr(t,t.return,l),Nn(t);break;case 27:eh(t.stateNode);case 26:case 5:Ni(t,t.return),Nn(t);break;case 22:t.memoizedState===null&&Nn(t);break;case 30:Nn(t);break;default:Nn(t)}e=e.sibling}}function zi(e,t,l){for(l=l&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var o=t.alternate,m=e,b=t,q=b.flags;switch(b.tag){case 0:case 11:case 15:zi(m,b,l),wl(4,b);break;case 1:if(zi(m,b,l),o=b,m=o.stateNode,typeof m.componentDidMount=="function")try{m.componentDidMount()}catch(ge){ie(o,o.return,ge)}if(o=b,m=o.updateQueue,m!==null){var K=o.stateNode;try{var W=m.shared.hiddenCallbacks;if(W!==null)for(m.shared.hiddenCallbacks=null,m=0;m<W.length;m++)yu(W[m],K)}catch(ge){ie(o,o.return,ge)}}l&&q&64&&Nl(b),Dl(b,b.return);break;case 27:Ir(b);case 26:case 5:zi(m,b,l),l&&o===null&&q&4&&Ou(b),Dl(b,b.return);break;case 12:zi(m,b,l);break;case 13:zi(m,b,l),l&&q&4&&$r(m,b);break;case 22:b.memoizedState===null&&zi(m,b,l),Dl(b,b.return);break;case 30:break;default:zi(m,b,l)}t=t.sibling}}function $o(e,t){var l=null;e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(l=e.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==l&&(e!=null&&e.refCount++,l!=null&&hu(l))}function ec(e,t){e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&hu(e))}function Lt(e,t,l,o){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)tc(e,t,l,o),t=t.sibling}function tc(e,t,l,o){var m=t.flags;switch(t.tag){case 0:case 11:case 15:Lt(e,t,l,o),m&2048&&wl(9,t);break;case 1:Lt(e,t,l,o);break;case 3:Lt(e,t,l,o),m&2048&&(e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&hu(e)));break;case 12:if(m&2048){Lt(e,t,l,o),e=t.stateNode;try{var b=t.memoizedProps,q=b.id,K=b.onPostCommit;typeof K=="function"&&K(q,t.alternate===null?"mount":"update",e.passiveEffectDuration,-0)}catch(W){ie(t,t.return,W)}}else Lt(e,t,l,o);break;case 13:Lt(e,t,l,o);break;case 23:break;case 22:b=t.stateNode,q=t.alternate,t.memoizedState!==null?b._visibility&2?Lt(e,t,l,o):gi(e,t):b._visibility&2?Lt(e,t,l,o):(b._visibility|=2,hr(e,t,l,o,(t.subtreeFlags&10256)!==0)),m&2048&&$o(q,t);break;case 24:Lt(e,t,l,o),m&2048&&ec(t.alternate,t);break;default:Lt(e,t,l,o)}}function hr(e,t,l,o,m){for(m=m&&(t.subtreeFlags&10256)!==0,t=t.child;t!==null;){var b=e,q=t,K=l,W=o,ge=q.flags;switch(q.tag){case 0:case 11:case 15:hr(b,q,K,W,m),wl(8,q);break;case 23:break;case 22:var _e=q.stateNode;q.memoizedState!==null?_e._visibility&2?hr(b,q,K,W,m):gi(b,q):(_e._visibility|=2,hr(b,q,K,W,m)),m&&ge&2048&&$o(q.alternate,q);break;case 24:hr(b,q,K,W,m),m&&ge&2048&&ec(q.alternate,q);break;default:hr(b,q,K,W,m)}t=t.sibling}}function gi(e,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var l=e,o=t,m=o.flags;switch(o.tag){case 22:gi(l,o),m&2048&&$o(o.alternate,o);break;case 24:gi(l,o),m&2048&&ec(o.alternate,o);break;default:gi(l,o)}t=t.sibling}}var Dn=8192;function wu(e){if(e.subtreeFlags&Dn)for(e=e.child;e!==null;)q0(e),e=e.sibling}function q0(e){switch(e.tag){case 26:wu(e),e.flags&Dn&&e.memoizedState!==null&&CS(di,e.memoizedState,e.memoizedProps);break;case 5:wu(e);break;case 3:case 4:var t=di;di=Y0(e.stateNode.containerInfo),wu(e),di=t;break;case 22:e.memoizedState===null&&(t=e.alternate,t!==null&&t.memoizedState!==null?(t=Dn,Dn=16777216,wu(e),Dn=t):wu(e));break;default:wu(e)}}function H0(e){var t=e.alternate;if(t!==null&&(e=t.child,e!==null)){t.child=null;do t=e.sibling,e.sibling=null,e=t;while(e!==null)}}function Xt(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var l=0;l<t.length;l++){var o=t[l];Bt=o,Gi(o,e)}H0(e)}if(e.subtreeFlags&10256)for(e=e.child;e!==null;)Zf(e),e=e.sibling}function Zf(e){switch(e.tag){case 0:case 11:case 15:Xt(e),e.flags&2048&&Mn(9,e,e.return);break;case 3:Xt(e);break;case 12:Xt(e);break;case 22:var t=e.stateNode;e.memoizedState!==null&&t._visibility&2&&(e.return===null||e.return.tag!==13)?(t._visibility&=-3,Ui(e)):Xt(e);break;default:Xt(e)}}function Ui(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var l=0;l<t.length;l++){var o=t[l];Bt=o,Gi(o,e)}H0(e)}for(e=e.child;e!==null;){switch(t=e,t.tag){case 0:case 11:case 15:Mn(8,t,t.return),Ui(t);break;case 22:l=t.stateNode,l._visibility&2&&(l._visibility&=-3,Ui(t));break;default:Ui(t)}e=e.sibling}}function Gi(e,t){for(;Bt!==null;){var l=Bt;switch(l.tag){case 0:case 11:case 15:Mn(8,l,t);break;case 23:case 22:if(l.memoizedState!==null&&l.memoizedState.cachePool!==null){var o=l.memoizedState.cachePool.pool;o!=null&&o.refCount++}break;case 24:hu(l.memoizedState.cache)}if(o=l.child,o!==null)o.return=l,Bt=o;else e:for(l=e;Bt!==null;){o=Bt;var m=o.sibling,b=o.return;if(rt(o),o===l){Bt=null;break e}if(m!==null){m.return=b,Bt=m;break e}Bt=b}}}var la={getCacheForType:function(e){var t=ia(_a),l=t.data.get(e);return l===void 0&&(l=e(),t.data.set(e,l)),l}},Jf=typeof WeakMap=="function"?WeakMap:Map,Mt=0,We=null,st=null,Ve=0,nt=0,ta=null,zn=!1,Nu=!1,Du=!1,Zn=0,kt=0,pi=0,qi=0,Gl=0,Jn=0,xt=0,wt=null,Pe=null,dt=!1,qt=0,Wa=1/0,Wn=null,Un=null,Ma=0,Ia=null,jt=null,Gn=0,dr=0,Ps=null,qn=null,Hi=0,ql=null;function ua(){if((Mt&2)!==0&&Ve!==0)return Ve&-Ve;if(N.T!==null){var e=tt;return e!==0?e:I1()}return Ju()}function ac(){Jn===0&&(Jn=(Ve&536870912)===0||Ct?oa():536870912);var e=Ht.current;return e!==null&&(e.flags|=32),Jn}function cn(e,t,l){(e===We&&(nt===2||nt===9)||e.cancelPendingCommit!==null)&&(al(e,0),vi(e,Ve,Jn,!1)),Jt(e,l),((Mt&2)===0||e!==We)&&(e===We&&((Mt&2)===0&&(qi|=l),kt===4&&vi(e,Ve,Jn,!1)),rl(e))}function zu(e,t,l){if((Mt&6)!==0)throw Error(s(327));var o=!l&&(t&124)===0&&(t&e.expiredLanes)===0||It(e,t),m=o?y(e,t):r(e,t,!0),b=o;do{if(m===0){Nu&&!o&&vi(e,t,0,!1);break}else{if(l=e.current.alternate,b&&!tl(l)){m=r(e,t,!1),b=!1;continue}if(m===2){if(b=t,e.errorRecoveryDisabledLanes&b)var q=0;else q=e.pendingLanes&-536870913,q=q!==0?q:q&536870912?536870912:0;if(q!==0){t=q;e:{var K=e;m=wt;var W=K.current.memoizedState.isDehydrated;if(W&&(al(K,q).flags|=256),q=r(K,q,!1),q!==2){if(Du&&!W){K.errorRecoveryDisabledLanes|=b,qi|=b,m=4;break e}b=Pe,Pe=m,b!==null&&(Pe===null?Pe=b:Pe.push.apply(Pe,b))}m=q}if(b=!1,m!==2)continue}}if(m===1){al(e,0),vi(e,t,0,!0);break}e:{switch(o=e,b=m,b){case 0:case 1:throw Error(s(345));case 4:if((t&4194048)!==t)break;case 6:vi(o,t,Jn,!zn);break e;case 2:Pe=null;break;case 3:case 5:break;default:throw Error(s(329))}if((t&62914560)===t&&(m=qt+300-we(),10<m)){if(vi(o,t,Jn,!zn),Gt(o,0,!0)!==0)break e;o.timeoutHandle=Sy(Xs.bind(null,o,l,Pe,Wn,dt,t,Jn,qi,xt,zn,b,2,-0,0),m);break e}Xs(o,l,Pe,Wn,dt,t,Jn,qi,xt,zn,b,0,-0,0)}}break}while(!0);rl(e)}function Xs(e,t,l,o,m,b,q,K,W,ge,_e,Ce,ve,me){if(e.timeoutHandle=-1,Ce=t.subtreeFlags,(Ce&8192||(Ce&16785408)===16785408)&&(nh={stylesheets:null,count:0,unsuspend:ES},q0(t),Ce=TS(),Ce!==null)){e.cancelPendingCommit=Ce(Oe.bind(null,e,t,b,l,o,m,q,K,W,_e,1,ve,me)),vi(e,b,q,!ge);return}Oe(e,t,b,l,o,m,q,K,W)}function tl(e){for(var t=e;;){var l=t.tag;if((l===0||l===11||l===15)&&t.flags&16384&&(l=t.updateQueue,l!==null&&(l=l.stores,l!==null)))for(var o=0;o<l.length;o++){var m=l[o],b=m.getSnapshot;m=m.value;try{if(!gn(b(),m))return!1}catch{return!1}}if(l=t.child,t.subtreeFlags&16384&&l!==null)l.return=t,t=l;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function vi(e,t,l,o){t&=~Gl,t&=~qi,e.suspendedLanes|=t,e.pingedLanes&=~t,o&&(e.warmLanes|=t),o=e.expirationTimes;for(var m=t;0<m;){var b=31-zt(m),q=1<<b;o[b]=-1,m&=~q}l!==0&&it(e,l,t)}function Bi(){return(Mt&6)===0?(Wf(0),!1):!0}function Hl(){if(st!==null){if(nt===0)var e=st.return;else e=st,tr=Lr=null,Df(e),Sl=null,qs=0,e=st;for(;e!==null;)Ru(e.alternate,e),e=e.return;st=null}}function al(e,t){var l=e.timeoutHandle;l!==-1&&(e.timeoutHandle=-1,lS(l)),l=e.cancelPendingCommit,l!==null&&(e.cancelPendingCommit=null,l()),Hl(),We=e,st=l=fa(e.current,null),Ve=t,nt=0,ta=null,zn=!1,Nu=It(e,t),Du=!1,xt=Jn=Gl=qi=pi=kt=0,Pe=wt=null,dt=!1,(t&8)!==0&&(t|=t&32);var o=e.entangledLanes;if(o!==0)for(e=e.entanglements,o&=t;0<o;){var m=31-zt(o),b=1<<m;t|=e[m],o&=~b}return Zn=t,bs(),l}function nc(e,t){at=null,N.H=Gs,t===Ms||t===ui?(t=Rf(),nt=3):t===Af?(t=Rf(),nt=4):nt=t===G0?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,ta=t,st===null&&(kt=1,Qo(e,Ya(t,e.current)))}function Uu(){var e=N.H;return N.H=Gs,e===null?Gs:e}function ic(){var e=N.A;return N.A=la,e}function a(){kt=4,zn||(Ve&4194048)!==Ve&&Ht.current!==null||(Nu=!0),(pi&134217727)===0&&(qi&134217727)===0||We===null||vi(We,Ve,Jn,!1)}function r(e,t,l){var o=Mt;Mt|=2;var m=Uu(),b=ic();(We!==e||Ve!==t)&&(Wn=null,al(e,t)),t=!1;var q=kt;e:do try{if(nt!==0&&st!==null){var K=st,W=ta;switch(nt){case 8:Hl(),q=6;break e;case 3:case 2:case 9:case 6:Ht.current===null&&(t=!0);var ge=nt;if(nt=0,ta=null,ee(e,K,W,ge),l&&Nu){q=0;break e}break;default:ge=nt,nt=0,ta=null,ee(e,K,W,ge)}}f(),q=kt;break}catch(_e){nc(e,_e)}while(!0);return t&&e.shellSuspendCounter++,tr=Lr=null,Mt=o,N.H=m,N.A=b,st===null&&(We=null,Ve=0,bs()),q}function f(){for(;st!==null;)M(st)}function y(e,t){var l=Mt;Mt|=2;var o=Uu(),m=ic();We!==e||Ve!==t?(Wn=null,Wa=we()+500,al(e,t)):Nu=It(e,t);e:do try{if(nt!==0&&st!==null){t=st;var b=ta;t:switch(nt){case 1:nt=0,ta=null,ee(e,t,b,1);break;case 2:case 9:if(zo(b)){nt=0,ta=null,k(t);break}t=function(){nt!==2&&nt!==9||We!==e||(nt=7),rl(e)},b.then(t,t);break e;case 3:nt=7;break e;case 4:nt=5;break e;case 7:zo(b)?(nt=0,ta=null,k(t)):(nt=0,ta=null,ee(e,t,b,7));break;case 5:var q=null;switch(st.tag){case 26:q=st.memoizedState;case 5:case 27:var K=st;if(!q||zy(q)){nt=0,ta=null;var W=K.sibling;if(W!==null)st=W;else{var ge=K.return;ge!==null?(st=ge,se(ge)):st=null}break t}}nt=0,ta=null,ee(e,t,b,5);break;case 6:nt=0,ta=null,ee(e,t,b,6);break;case 8:Hl(),kt=6;break e;default:throw Error(s(462))}}S();break}catch(_e){nc(e,_e)}while(!0);return tr=Lr=null,N.H=o,N.A=m,Mt=l,st!==null?0:(We=null,Ve=0,bs(),kt)}function S(){for(;st!==null&&!ze();)M(st)}function M(e){var t=Ol(e.alternate,e,Zn);e.memoizedProps=e.pendingProps,t===null?se(e):st=t}function k(e){var t=e,l=t.alternate;switch(t.tag){case 15:case 0:t=Rn(l,t,t.pendingProps,t.type,void 0,Ve);break;case 11:t=Rn(l,t,t.pendingProps,t.type.render,t.ref,Ve);break;case 5:Df(t);default:Ru(l,t),t=st=bf(t,Zn),t=Ol(l,t,Zn)}e.memoizedProps=e.pendingProps,t===null?se(e):st=t}function ee(e,t,l,o){tr=Lr=null,Df(t),Sl=null,qs=0;var m=t.return;try{if(J1(e,m,t,l,Ve)){kt=1,Qo(e,Ya(l,e.current)),st=null;return}}catch(b){if(m!==null)throw st=m,b;kt=1,Qo(e,Ya(l,e.current)),st=null;return}t.flags&32768?(Ct||o===1?e=!0:Nu||(Ve&536870912)!==0?e=!1:(zn=e=!0,(o===2||o===9||o===3||o===6)&&(o=Ht.current,o!==null&&o.tag===13&&(o.flags|=16384))),be(t,e)):se(t)}function se(e){var t=e;do{if((t.flags&32768)!==0){be(t,zn);return}e=t.return;var l=Qf(t.alternate,t,Zn);if(l!==null){st=l;return}if(t=t.sibling,t!==null){st=t;return}st=t=e}while(t!==null);kt===0&&(kt=5)}function be(e,t){do{var l=Au(e.alternate,e);if(l!==null){l.flags&=32767,st=l;return}if(l=e.return,l!==null&&(l.flags|=32768,l.subtreeFlags=0,l.deletions=null),!t&&(e=e.sibling,e!==null)){st=e;return}st=e=l}while(e!==null);kt=6,st=null}function Oe(e,t,l,o,m,b,q,K,W){e.cancelPendingCommit=null;do nl();while(Ma!==0);if((Mt&6)!==0)throw Error(s(327));if(t!==null){if(t===e.current)throw Error(s(177));if(b=t.lanes|t.childLanes,b|=Co,ca(e,l,b,q,K,W),e===We&&(st=We=null,Ve=0),jt=t,Ia=e,Gn=l,dr=b,Ps=m,qn=o,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(e.callbackNode=null,e.callbackPriority=0,Tt(Vt,function(){return il(),null})):(e.callbackNode=null,e.callbackPriority=0),o=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||o){o=N.T,N.T=null,m=L.p,L.p=2,q=Mt,Mt|=4;try{Oa(e,t,l)}finally{Mt=q,L.p=m,N.T=o}}Ma=1,De(),Ue(),Ie()}}function De(){if(Ma===1){Ma=0;var e=Ia,t=jt,l=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||l){l=N.T,N.T=null;var o=L.p;L.p=2;var m=Mt;Mt|=4;try{Io(t,e);var b=lg,q=hf(e.containerInfo),K=b.focusedElem,W=b.selectionRange;if(q!==K&&K&&K.ownerDocument&&ff(K.ownerDocument.documentElement,K)){if(W!==null&&vs(K)){var ge=W.start,_e=W.end;if(_e===void 0&&(_e=ge),"selectionStart"in K)K.selectionStart=ge,K.selectionEnd=Math.min(_e,K.value.length);else{var Ce=K.ownerDocument||document,ve=Ce&&Ce.defaultView||window;if(ve.getSelection){var me=ve.getSelection(),Ze=K.textContent.length,Xe=Math.min(W.start,Ze),Ft=W.end===void 0?Xe:Math.min(W.end,Ze);!me.extend&&Xe>Ft&&(q=Ft,Ft=Xe,Xe=q);var le=cf(K,Xe),re=cf(K,Ft);if(le&&re&&(me.rangeCount!==1||me.anchorNode!==le.node||me.anchorOffset!==le.offset||me.focusNode!==re.node||me.focusOffset!==re.offset)){var fe=Ce.createRange();fe.setStart(le.node,le.offset),me.removeAllRanges(),Xe>Ft?(me.addRange(fe),me.extend(re.node,re.offset)):(fe.setEnd(re.node,re.offset),me.addRange(fe))}}}}for(Ce=[],me=K;me=me.parentNode;)me.nodeType===1&&Ce.push({element:me,left:me.scrollLeft,top:me.scrollTop});for(typeof K.focus=="function"&&K.focus(),K=0;K<Ce.length;K++){var Ee=Ce[K];Ee.element.scrollLeft=Ee.left,Ee.element.scrollTop=Ee.top}}k0=!!rg,lg=rg=null}finally{Mt=m,L.p=o,N.T=l}}e.current=t,Ma=2}}function Ue(){if(Ma===2){Ma=0;var e=Ia,t=jt,l=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||l){l=N.T,N.T=null;var o=L.p;L.p=2;var m=Mt;Mt|=4;try{fr(e,t.alternate,t)}finally{Mt=m,L.p=o,N.T=l}}Ma=3}}function Ie(){if(Ma===4||Ma===3){Ma=0,At();var e=Ia,t=jt,l=Gn,o=qn;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Ma=5:(Ma=0,jt=Ia=null,Hn(e,e.pendingLanes));var m=e.pendingLanes;if(m===0&&(Un=null),fl(l),t=t.stateNode,Dt&&typeof Dt.onCommitFiberRoot=="function")try{Dt.onCommitFiberRoot(Zt,t,void 0,(t.current.flags&128)===128)}catch{}if(o!==null){t=N.T,m=L.p,L.p=2,N.T=null;try{for(var b=e.onRecoverableError,q=0;q<o.length;q++){var K=o[q];b(K.value,{componentStack:K.stack})}}finally{N.T=t,L.p=m}}(Gn&3)!==0&&nl(),rl(e),m=e.pendingLanes,(l&4194090)!==0&&(m&42)!==0?e===ql?Hi++:(Hi=0,ql=e):Hi=0,Wf(0)}}function Hn(e,t){(e.pooledCacheLanes&=t)===0&&(t=e.pooledCache,t!=null&&(e.pooledCache=null,hu(t)))}function nl(e){return De(),Ue(),Ie(),il()}function il(){if(Ma!==5)return!1;var e=Ia,t=dr;dr=0;var l=fl(Gn),o=N.T,m=L.p;try{L.p=32>l?32:l,N.T=null,l=Ps,Ps=null;var b=Ia,q=Gn;if(Ma=0,jt=Ia=null,Gn=0,(Mt&6)!==0)throw Error(s(331));var K=Mt;if(Mt|=4,Zf(b.current),tc(b,b.current,q,l),Mt=K,Wf(0,!1),Dt&&typeof Dt.onPostCommitFiberRoot=="function")try{Dt.onPostCommitFiberRoot(Zt,b)}catch{}return!0}finally{L.p=m,N.T=o,Hn(e,t)}}function pe(e,t,l){t=Ya(l,t),t=Zo(e.stateNode,t,2),e=ir(e,t,2),e!==null&&(Jt(e,2),rl(e))}function ie(e,t,l){if(e.tag===3)pe(e,e,l);else for(;t!==null;){if(t.tag===3){pe(t,e,l);break}else if(t.tag===1){var o=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof o.componentDidCatch=="function"&&(Un===null||!Un.has(o))){e=Ya(l,e),l=U0(2),o=ir(t,l,2),o!==null&&(Jo(l,o,t,e),Jt(o,2),rl(o));break}}t=t.return}}function ye(e,t,l){var o=e.pingCache;if(o===null){o=e.pingCache=new Jf;var m=new Set;o.set(t,m)}else m=o.get(t),m===void 0&&(m=new Set,o.set(t,m));m.has(l)||(Du=!0,m.add(l),e=Ae.bind(null,e,t,l),t.then(e,e))}function Ae(e,t,l){var o=e.pingCache;o!==null&&o.delete(t),e.pingedLanes|=e.suspendedLanes&l,e.warmLanes&=~l,We===e&&(Ve&l)===l&&(kt===4||kt===3&&(Ve&62914560)===Ve&&300>we()-qt?(Mt&2)===0&&al(e,0):Gl|=l,xt===Ve&&(xt=0)),rl(e)}function Le(e,t){t===0&&(t=br()),e=$i(e,t),e!==null&&(Jt(e,t),rl(e))}function Qt(e){var t=e.memoizedState,l=0;t!==null&&(l=t.retryLane),Le(e,l)}function Qe(e,t){var l=0;switch(e.tag){case 13:var o=e.stateNode,m=e.memoizedState;m!==null&&(l=m.retryLane);break;case 19:o=e.stateNode;break;case 22:o=e.stateNode._retryCache;break;default:throw Error(s(314))}o!==null&&o.delete(t),Le(e,l)}function Tt(e,t){return $e(e,t)}var pa=null,ot=null,Li=!1,rc=!1,W1=!1,Ks=0;function rl(e){e!==ot&&e.next===null&&(ot===null?pa=ot=e:ot=ot.next=e),rc=!0,Li||(Li=!0,W8())}function Wf(e,t){if(!W1&&rc){W1=!0;do for(var l=!1,o=pa;o!==null;){if(e!==0){var m=o.pendingLanes;if(m===0)var b=0;else{var q=o.suspendedLanes,K=o.pingedLanes;b=(1<<31-zt(42|e)+1)-1,b&=m&~(q&~K),b=b&201326741?b&201326741|1:b?b|2:0}b!==0&&(l=!0,fy(o,b))}else b=Ve,b=Gt(o,o===We?b:0,o.cancelPendingCommit!==null||o.timeoutHandle!==-1),(b&3)===0||It(o,b)||(l=!0,fy(o,b));o=o.next}while(l);W1=!1}}function J8(){sy()}function sy(){rc=Li=!1;var e=0;Ks!==0&&(rS()&&(e=Ks),Ks=0);for(var t=we(),l=null,o=pa;o!==null;){var m=o.next,b=oy(o,t);b===0?(o.next=null,l===null?pa=m:l.next=m,m===null&&(ot=l)):(l=o,(e!==0||(b&3)!==0)&&(rc=!0)),o=m}Wf(e)}function oy(e,t){for(var l=e.suspendedLanes,o=e.pingedLanes,m=e.expirationTimes,b=e.pendingLanes&-62914561;0<b;){var q=31-zt(b),K=1<<q,W=m[q];W===-1?((K&l)===0||(K&o)!==0)&&(m[q]=Na(K,t)):W<=t&&(e.expiredLanes|=K),b&=~K}if(t=We,l=Ve,l=Gt(e,e===t?l:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),o=e.callbackNode,l===0||e===t&&(nt===2||nt===9)||e.cancelPendingCommit!==null)return o!==null&&o!==null&&et(o),e.callbackNode=null,e.callbackPriority=0;if((l&3)===0||It(e,l)){if(t=l&-l,t===e.callbackPriority)return t;switch(o!==null&&et(o),fl(l)){case 2:case 8:l=Rt;break;case 32:l=Vt;break;case 268435456:l=lt;break;default:l=Vt}return o=cy.bind(null,e),l=$e(l,o),e.callbackPriority=t,e.callbackNode=l,t}return o!==null&&o!==null&&et(o),e.callbackPriority=2,e.callbackNode=null,2}function cy(e,t){if(Ma!==0&&Ma!==5)return e.callbackNode=null,e.callbackPriority=0,null;var l=e.callbackNode;if(nl()&&e.callbackNode!==l)return null;var o=Ve;return o=Gt(e,e===We?o:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),o===0?null:(zu(e,o,t),oy(e,we()),e.callbackNode!=null&&e.callbackNode===l?cy.bind(null,e):null)}function fy(e,t){if(nl())return null;zu(e,t,!0)}function W8(){uS(function(){(Mt&6)!==0?$e(na,J8):sy()})}function I1(){return Ks===0&&(Ks=oa()),Ks}function hy(e){return e==null||typeof e=="symbol"||typeof e=="boolean"?null:typeof e=="function"?e:ns(""+e)}function dy(e,t){var l=t.ownerDocument.createElement("input");return l.name=t.name,l.value=t.value,e.id&&l.setAttribute("form",e.id),t.parentNode.insertBefore(l,t),e=new FormData(e),l.parentNode.removeChild(l),e}function I8(e,t,l,o,m){if(t==="submit"&&l&&l.stateNode===m){var b=hy((m[Qa]||null).action),q=o.submitter;q&&(t=(t=q[Qa]||null)?hy(t.formAction):q.getAttribute("formAction"),t!==null&&(b=t,q=null));var K=new $l("action","action",null,o,m);e.push({event:K,listeners:[{instance:null,listener:function(){if(o.defaultPrevented){if(Ks!==0){var W=q?dy(m,q):new FormData(m);Xf(l,{pending:!0,data:W,method:m.method,action:b},null,W)}}else typeof b=="function"&&(K.preventDefault(),W=q?dy(m,q):new FormData(m),Xf(l,{pending:!0,data:W,method:m.method,action:b},b,W))},currentTarget:m}]})}}for(var $1=0;$1<ys.length;$1++){var eg=ys[$1],$8=eg.toLowerCase(),eS=eg[0].toUpperCase()+eg.slice(1);za($8,"on"+eS)}za(nn,"onAnimationEnd"),za(pf,"onAnimationIteration"),za(vn,"onAnimationStart"),za("dblclick","onDoubleClick"),za("focusin","onFocus"),za("focusout","onBlur"),za(Fd,"onTransitionRun"),za(Wi,"onTransitionStart"),za(uu,"onTransitionCancel"),za(Ii,"onTransitionEnd"),Ta("onMouseEnter",["mouseout","mouseover"]),Ta("onMouseLeave",["mouseout","mouseover"]),Ta("onPointerEnter",["pointerout","pointerover"]),Ta("onPointerLeave",["pointerout","pointerover"]),Xi("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Xi("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Xi("onBeforeInput",["compositionend","keypress","textInput","paste"]),Xi("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Xi("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Xi("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var If="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),tS=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(If));function gy(e,t){t=(t&4)!==0;for(var l=0;l<e.length;l++){var o=e[l],m=o.event;o=o.listeners;e:{var b=void 0;if(t)for(var q=o.length-1;0<=q;q--){var K=o[q],W=K.instance,ge=K.currentTarget;if(K=K.listener,W!==b&&m.isPropagationStopped())break e;b=K,m.currentTarget=ge;try{b(m)}catch(_e){El(_e)}m.currentTarget=null,b=W}else for(q=0;q<o.length;q++){if(K=o[q],W=K.instance,ge=K.currentTarget,K=K.listener,W!==b&&m.isPropagationStopped())break e;b=K,m.currentTarget=ge;try{b(m)}catch(_e){El(_e)}m.currentTarget=null,b=W}}}}function pt(e,t){var l=t[Si];l===void 0&&(l=t[Si]=new Set);var o=e+"__bubble";l.has(o)||(py(t,e,2,!1),l.add(o))}function tg(e,t,l){var o=0;t&&(o|=4),py(l,e,o,t)}var B0="_reactListening"+Math.random().toString(36).slice(2);function ag(e){if(!e[B0]){e[B0]=!0,ao.forEach(function(l){l!=="selectionchange"&&(tS.has(l)||tg(l,!1,e),tg(l,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[B0]||(t[B0]=!0,tg("selectionchange",!1,t))}}function py(e,t,l,o){switch(Ly(t)){case 2:var m=OS;break;case 8:m=MS;break;default:m=vg}l=m.bind(null,t,l,e),m=void 0,!rs||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(m=!0),o?m!==void 0?e.addEventListener(t,l,{capture:!0,passive:m}):e.addEventListener(t,l,!0):m!==void 0?e.addEventListener(t,l,{passive:m}):e.addEventListener(t,l,!1)}function ng(e,t,l,o,m){var b=o;if((t&1)===0&&(t&2)===0&&o!==null)e:for(;;){if(o===null)return;var q=o.tag;if(q===3||q===4){var K=o.stateNode.containerInfo;if(K===m)break;if(q===4)for(q=o.return;q!==null;){var W=q.tag;if((W===3||W===4)&&q.stateNode.containerInfo===m)return;q=q.return}for(;K!==null;){if(q=Cr(K),q===null)return;if(W=q.tag,W===5||W===6||W===26||W===27){o=b=q;continue e}K=K.parentNode}}o=o.return}Wc(function(){var ge=b,_e=co(l),Ce=[];e:{var ve=Eo.get(e);if(ve!==void 0){var me=$l,Ze=e;switch(e){case"keypress":if(Rr(l)===0)break e;case"keydown":case"keyup":me=af;break;case"focusin":Ze="focus",me=ho;break;case"focusout":Ze="blur",me=ho;break;case"beforeblur":case"afterblur":me=ho;break;case"click":if(l.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":me=ef;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":me=L1;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":me=rf;break;case nn:case pf:case vn:me=Nd;break;case Ii:me=ki;break;case"scroll":case"scrollend":me=Od;break;case"wheel":me=j1;break;case"copy":case"cut":case"paste":me=zd;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":me=po;break;case"toggle":case"beforetoggle":me=Mr}var Xe=(t&4)!==0,Ft=!Xe&&(e==="scroll"||e==="scrollend"),le=Xe?ve!==null?ve+"Capture":null:ve;Xe=[];for(var re=ge,fe;re!==null;){var Ee=re;if(fe=Ee.stateNode,Ee=Ee.tag,Ee!==5&&Ee!==26&&Ee!==27||fe===null||le===null||(Ee=Jl(re,le),Ee!=null&&Xe.push($f(re,Ee,fe))),Ft)break;re=re.return}0<Xe.length&&(ve=new me(ve,Ze,null,l,_e),Ce.push({event:ve,listeners:Xe}))}}if((t&7)===0){e:{if(ve=e==="mouseover"||e==="pointerover",me=e==="mouseout"||e==="pointerout",ve&&l!==oo&&(Ze=l.relatedTarget||l.fromElement)&&(Cr(Ze)||Ze[Sr]))break e;if((me||ve)&&(ve=_e.window===_e?_e:(ve=_e.ownerDocument)?ve.defaultView||ve.parentWindow:window,me?(Ze=l.relatedTarget||l.toElement,me=ge,Ze=Ze?Cr(Ze):null,Ze!==null&&(Ft=h(Ze),Xe=Ze.tag,Ze!==Ft||Xe!==5&&Xe!==27&&Xe!==6)&&(Ze=null)):(me=null,Ze=ge),me!==Ze)){if(Xe=ef,Ee="onMouseLeave",le="onMouseEnter",re="mouse",(e==="pointerout"||e==="pointerover")&&(Xe=po,Ee="onPointerLeave",le="onPointerEnter",re="pointer"),Ft=me==null?ve:Ql(me),fe=Ze==null?ve:Ql(Ze),ve=new Xe(Ee,re+"leave",me,l,_e),ve.target=Ft,ve.relatedTarget=fe,Ee=null,Cr(_e)===ge&&(Xe=new Xe(le,re+"enter",Ze,l,_e),Xe.target=fe,Xe.relatedTarget=Ft,Ee=Xe),Ft=Ee,me&&Ze)t:{for(Xe=me,le=Ze,re=0,fe=Xe;fe;fe=lc(fe))re++;for(fe=0,Ee=le;Ee;Ee=lc(Ee))fe++;for(;0<re-fe;)Xe=lc(Xe),re--;for(;0<fe-re;)le=lc(le),fe--;for(;re--;){if(Xe===le||le!==null&&Xe===le.alternate)break t;Xe=lc(Xe),le=lc(le)}Xe=null}else Xe=null;me!==null&&vy(Ce,ve,me,Xe,!1),Ze!==null&&Ft!==null&&vy(Ce,Ft,Ze,Xe,!0)}}e:{if(ve=ge?Ql(ge):window,me=ve.nodeName&&ve.nodeName.toLowerCase(),me==="select"||me==="input"&&ve.type==="file")var qe=mo;else if(of(ve))if(yo)qe=Dr;else{qe=Pd;var gt=V1}else me=ve.nodeName,!me||me.toLowerCase()!=="input"||ve.type!=="checkbox"&&ve.type!=="radio"?ge&&so(ge.elementType)&&(qe=mo):qe=ps;if(qe&&(qe=qe(e,ge))){dn(Ce,qe,l,_e);break e}gt&&gt(e,ve,ge),e==="focusout"&&ge&&ve.type==="number"&&ge.memoizedProps.value!=null&&uo(ve,"number",ve.value)}switch(gt=ge?Ql(ge):window,e){case"focusin":(of(gt)||gt.contentEditable==="true")&&(Zi=gt,_o=ge,ms=null);break;case"focusout":ms=_o=Zi=null;break;case"mousedown":So=!0;break;case"contextmenu":case"mouseup":case"dragend":So=!1,gf(Ce,l,_e);break;case"selectionchange":if(df)break;case"keydown":case"keyup":gf(Ce,l,_e)}var je;if(os)e:{switch(e){case"compositionstart":var Ke="onCompositionStart";break e;case"compositionend":Ke="onCompositionEnd";break e;case"compositionupdate":Ke="onCompositionUpdate";break e}Ke=void 0}else Nr?hs(e,l)&&(Ke="onCompositionEnd"):e==="keydown"&&l.keyCode===229&&(Ke="onCompositionStart");Ke&&(fs&&l.locale!=="ko"&&(Nr||Ke!=="onCompositionStart"?Ke==="onCompositionEnd"&&Nr&&(je=$c()):(Ki=_e,Ic="value"in Ki?Ki.value:Ki.textContent,Nr=!0)),gt=L0(ge,Ke),0<gt.length&&(Ke=new go(Ke,e,null,l,_e),Ce.push({event:Ke,listeners:gt}),je?Ke.data=je:(je=uf(l),je!==null&&(Ke.data=je)))),(je=cs?ds(e,l):sf(e,l))&&(Ke=L0(ge,"onBeforeInput"),0<Ke.length&&(gt=new go("onBeforeInput","beforeinput",null,l,_e),Ce.push({event:gt,listeners:Ke}),gt.data=je)),I8(Ce,e,ge,l,_e)}gy(Ce,t)})}function $f(e,t,l){return{instance:e,listener:t,currentTarget:l}}function L0(e,t){for(var l=t+"Capture",o=[];e!==null;){var m=e,b=m.stateNode;if(m=m.tag,m!==5&&m!==26&&m!==27||b===null||(m=Jl(e,l),m!=null&&o.unshift($f(e,m,b)),m=Jl(e,t),m!=null&&o.push($f(e,m,b))),e.tag===3)return o;e=e.return}return[]}function lc(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5&&e.tag!==27);return e||null}function vy(e,t,l,o,m){for(var b=t._reactName,q=[];l!==null&&l!==o;){var K=l,W=K.alternate,ge=K.stateNode;if(K=K.tag,W!==null&&W===o)break;K!==5&&K!==26&&K!==27||ge===null||(W=ge,m?(ge=Jl(l,b),ge!=null&&q.unshift($f(l,ge,W))):m||(ge=Jl(l,b),ge!=null&&q.push($f(l,ge,W)))),l=l.return}q.length!==0&&e.push({event:t,listeners:q})}var aS=/\r\n?/g,nS=/\u0000|\uFFFD/g;function my(e){return(typeof e=="string"?e:""+e).replace(aS,`
-`).replace(nS,"")}function yy(e,t){return t=my(t),my(e)===t}function j0(){}function Kt(e,t,l,o,m,b){switch(l){case"children":typeof o=="string"?t==="body"||t==="textarea"&&o===""||ii(e,o):(typeof o=="number"||typeof o=="bigint")&&t!=="body"&&ii(e,""+o);break;case"className":dl(e,"class",o);break;case"tabIndex":dl(e,"tabindex",o);break;case"dir":case"role":case"viewBox":case"width":case"height":dl(e,l,o);break;case"style":as(e,o,b);break;case"data":if(t!=="object"){dl(e,"data",o);break}case"src":case"href":if(o===""&&(t!=="a"||l!=="href")){e.removeAttribute(l);break}if(o==null||typeof o=="function"||typeof o=="symbol"||typeof o=="boolean"){e.removeAttribute(l);break}o=ns(""+o),e.setAttribute(l,o);break;case"action":case"formAction":if(typeof o=="function"){e.setAttribute(l,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof b=="function"&&(l==="formAction"?(t!=="input"&&Kt(e,t,"name",m.name,m,null),Kt(e,t,"formEncType",m.formEncType,m,null),Kt(e,t,"formMethod",m.formMethod,m,null),Kt(e,t,"formTarget",m.formTarget,m,null)):(Kt(e,t,"encType",m.encType,m,null),Kt(e,t,"method",m.method,m,null),Kt(e,t,"target",m.target,m,null)));if(o==null||typeof o=="symbol"||typeof o=="boolean"){e.removeAttribute(l);break}o=ns(""+o),e.setAttribute(l,o);break;case"onClick":o!=null&&(e.onclick=j0);break;case"onScroll":o!=null&&pt("scroll",e);break;case"onScrollEnd":o!=null&&pt("scrollend",e);break;case"dangerouslySetInnerHTML":if(o!=null){if(typeof o!="object"||!("__html"in o))throw Error(s(61));if(l=o.__html,l!=null){if(m.children!=null)throw Error(s(60));e.innerHTML=l}}break;case"multiple":e.multiple=o&&typeof o!="function"&&typeof o!="symbol";break;case"muted":e.muted=o&&typeof o!="function"&&typeof o!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(o==null||typeof o=="function"||typeof o=="boolean"||typeof o=="symbol"){e.removeAttribute("xlink:href");break}l=ns(""+o),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",l);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":o!=null&&typeof o!="function"&&typeof o!="symbol"?e.setAttribute(l,""+o):e.removeAttribute(l);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":o&&typeof o!="function"&&typeof o!="symbol"?e.setAttribute(l,""):e.removeAttribute(l);break;case"capture":case"download":o===!0?e.setAttribute(l,""):o!==!1&&o!=null&&typeof o!="function"&&typeof o!="symbol"?e.setAttribute(l,o):e.removeAttribute(l);break;case"cols":case"rows":case"size":case"span":o!=null&&typeof o!="function"&&typeof o!="symbol"&&!isNaN(o)&&1<=o?e.setAttribute(l,o):e.removeAttribute(l);break;case"rowSpan":case"start":o==null||typeof o=="function"||typeof o=="symbol"||isNaN(o)?e.removeAttribute(l):e.setAttribute(l,o);break;case"popover":pt("beforetoggle",e),pt("toggle",e),Bn(e,"popover",o);break;case"xlinkActuate":ni(e,"http://www.w3.org/1999/xlink","xlink:actuate",o);break;case"xlinkArcrole":ni(e,"http://www.w3.org/1999/xlink","xlink:arcrole",o);break;case"xlinkRole":ni(e,"http://www.w3.org/1999/xlink","xlink:role",o);break;case"xlinkShow":ni(e,"http://www.w3.org/1999/xlink","xlink:show",o);break;case"xlinkTitle":ni(e,"http://www.w3.org/1999/xlink","xlink:title",o);break;case"xlinkType":ni(e,"http://www.w3.org/1999/xlink","xlink:type",o);break;case"xmlBase":ni(e,"http://www.w3.org/XML/1998/namespace","xml:base",o);break;case"xmlLang":ni(e,"http://www.w3.org/XML/1998/namespace","xml:lang",o);break;case"xmlSpace":ni(e,"http://www.w3.org/XML/1998/namespace","xml:space",o);break;case"is":Bn(e,"is",o);break;case"innerText":case"textContent":break;default:(!(2<l.length)||l[0]!=="o"&&l[0]!=="O"||l[1]!=="n"&&l[1]!=="N")&&(l=Zc.get(l)||l,Bn(e,l,o))}}function ig(e,t,l,o,m,b){switch(l){case"style":as(e,o,b);break;case"dangerouslySetInnerHTML":if(o!=null){if(typeof o!="object"||!("__html"in o))throw Error(s(61));if(l=o.__html,l!=null){if(m.children!=null)throw Error(s(60));e.innerHTML=l}}break;case"children":typeof o=="string"?ii(e,o):(typeof o=="number"||typeof o=="bigint")&&ii(e,""+o);break;case"onScroll":o!=null&&pt("scroll",e);break;case"onScrollEnd":o!=null&&pt("scrollend",e);break;case"onClick":o!=null&&(e.onclick=j0);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!no.hasOwnProperty(l))e:{if(l[0]==="o"&&l[1]==="n"&&(m=l.endsWith("Capture"),t=l.slice(2,m?l.length-7:void 0),b=e[Qa]||null,b=b!=null?b[l]:null,typeof b=="function"&&e.removeEventListener(t,b,m),typeof o=="function")){typeof b!="function"&&b!==null&&(l in e?e[l]=null:e.hasAttribute(l)&&e.removeAttribute(l)),e.addEventListener(t,o,m);break e}l in e?e[l]=o:o===!0?e.setAttribute(l,""):Bn(e,l,o)}}}function fn(e,t,l){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":pt("error",e),pt("load",e);var o=!1,m=!1,b;for(b in l)if(l.hasOwnProperty(b)){var q=l[b];if(q!=null)switch(b){case"src":o=!0;break;case"srcSet":m=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:Kt(e,t,b,q,l,null)}}m&&Kt(e,t,"srcSet",l.srcSet,l,null),o&&Kt(e,t,"src",l.src,l,null);return;case"input":pt("invalid",e);var K=b=q=m=null,W=null,ge=null;for(o in l)if(l.hasOwnProperty(o)){var _e=l[o];if(_e!=null)switch(o){case"name":m=_e;break;case"type":q=_e;break;case"checked":W=_e;break;case"defaultChecked":ge=_e;break;case"value":b=_e;break;case"defaultValue":K=_e;break;case"children":case"dangerouslySetInnerHTML":if(_e!=null)throw Error(s(137,t));break;default:Kt(e,t,o,_e,l,null)}}kc(e,b,K,W,ge,q,m,!1),$u(e);return;case"select":pt("invalid",e),o=q=b=null;for(m in l)if(l.hasOwnProperty(m)&&(K=l[m],K!=null))switch(m){case"value":b=K;break;case"defaultValue":q=K;break;case"multiple":o=K;default:Kt(e,t,m,K,l,null)}t=b,l=q,e.multiple=!!o,t!=null?pl(e,!!o,t,!1):l!=null&&pl(e,!!o,l,!0);return;case"textarea":pt("invalid",e),b=m=o=null;for(q in l)if(l.hasOwnProperty(q)&&(K=l[q],K!=null))switch(q){case"value":o=K;break;case"defaultValue":m=K;break;case"children":b=K;break;case"dangerouslySetInnerHTML":if(K!=null)throw Error(s(91));break;default:Kt(e,t,q,K,l,null)}Qc(e,o,m,b),$u(e);return;case"option":for(W in l)if(l.hasOwnProperty(W)&&(o=l[W],o!=null))switch(W){case"selected":e.selected=o&&typeof o!="function"&&typeof o!="symbol";break;default:Kt(e,t,W,o,l,null)}return;case"dialog":pt("beforetoggle",e),pt("toggle",e),pt("cancel",e),pt("close",e);break;case"iframe":case"object":pt("load",e);break;case"video":case"audio":for(o=0;o<If.length;o++)pt(If[o],e);break;case"image":pt("error",e),pt("load",e);break;case"details":pt("toggle",e);break;case"embed":case"source":case"link":pt("error",e),pt("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(ge in l)if(l.hasOwnProperty(ge)&&(o=l[ge],o!=null))switch(ge){case"children":case"dangerouslySetInnerHTML":throw Error(s(137,t));default:Kt(e,t,ge,o,l,null)}return;default:if(so(t)){for(_e in l)l.hasOwnProperty(_e)&&(o=l[_e],o!==void 0&&ig(e,t,_e,o,l,void 0));return}}for(K in l)l.hasOwnProperty(K)&&(o=l[K],o!=null&&Kt(e,t,K,o,l,null))}function iS(e,t,l,o){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var m=null,b=null,q=null,K=null,W=null,ge=null,_e=null;for(me in l){var Ce=l[me];if(l.hasOwnProperty(me)&&Ce!=null)switch(me){case"checked":break;case"value":break;case"defaultValue":W=Ce;default:o.hasOwnProperty(me)||Kt(e,t,me,null,o,Ce)}}for(var ve in o){var me=o[ve];if(Ce=l[ve],o.hasOwnProperty(ve)&&(me!=null||Ce!=null))switch(ve){case"type":b=me;break;case"name":m=me;break;case"checked":ge=me;break;case"defaultChecked":_e=me;break;case"value":q=me;break;case"defaultValue":K=me;break;case"children":case"dangerouslySetInnerHTML":if(me!=null)throw Error(s(137,t));break;default:me!==Ce&&Kt(e,t,ve,me,o,Ce)}}lo(e,q,K,W,ge,_e,b,m);return;case"select":me=q=K=ve=null;for(b in l)if(W=l[b],l.hasOwnProperty(b)&&W!=null)switch(b){case"value":break;case"multiple":me=W;default:o.hasOwnProperty(b)||Kt(e,t,b,null,o,W)}for(m in o)if(b=o[m],W=l[m],o.hasOwnProperty(m)&&(b!=null||W!=null))switch(m){case"value":ve=b;break;case"defaultValue":K=b;break;case"multiple":q=b;default:b!==W&&Kt(e,t,m,b,o,W)}t=K,l=q,o=me,ve!=null?pl(e,!!l,ve,!1):!!o!=!!l&&(t!=null?pl(e,!!l,t,!0):pl(e,!!l,l?[]:"",!1));return;case"textarea":me=ve=null;for(K in l)if(m=l[K],l.hasOwnProperty(K)&&m!=null&&!o.hasOwnProperty(K))switch(K){case"value":break;case"children":break;default:Kt(e,t,K,null,o,m)}for(q in o)if(m=o[q],b=l[q],o.hasOwnProperty(q)&&(m!=null||b!=null))switch(q){case"value":ve=m;break;case"defaultValue":me=m;break;case"children":break;case"dangerouslySetInnerHTML":if(m!=null)throw Error(s(91));break;default:m!==b&&Kt(e,t,q,m,o,b)}Td(e,ve,me);return;case"option":for(var Ze in l)if(ve=l[Ze],l.hasOwnProperty(Ze)&&ve!=null&&!o.hasOwnProperty(Ze))switch(Ze){case"selected":e.selected=!1;break;default:Kt(e,t,Ze,null,o,ve)}for(W in o)if(ve=o[W],me=l[W],o.hasOwnProperty(W)&&ve!==me&&(ve!=null||me!=null))switch(W){case"selected":e.selected=ve&&typeof ve!="function"&&typeof ve!="symbol";break;default:Kt(e,t,W,ve,o,me)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var Xe in l)ve=l[Xe],l.hasOwnProperty(Xe)&&ve!=null&&!o.hasOwnProperty(Xe)&&Kt(e,t,Xe,null,o,ve);for(ge in o)if(ve=o[ge],me=l[ge],o.hasOwnProperty(ge)&&ve!==me&&(ve!=null||me!=null))switch(ge){case"children":case"dangerouslySetInnerHTML":if(ve!=null)throw Error(s(137,t));break;default:Kt(e,t,ge,ve,o,me)}return;default:if(so(t)){for(var Ft in l)ve=l[Ft],l.hasOwnProperty(Ft)&&ve!==void 0&&!o.hasOwnProperty(Ft)&&ig(e,t,Ft,void 0,o,ve);for(_e in o)ve=o[_e],me=l[_e],!o.hasOwnProperty(_e)||ve===me||ve===void 0&&me===void 0||ig(e,t,_e,ve,o,me);return}}for(var le in l)ve=l[le],l.hasOwnProperty(le)&&ve!=null&&!o.hasOwnProperty(le)&&Kt(e,t,le,null,o,ve);for(Ce in o)ve=o[Ce],me=l[Ce],!o.hasOwnProperty(Ce)||ve===me||ve==null&&me==null||Kt(e,t,Ce,ve,o,me)}var rg=null,lg=null;function V0(e){return e.nodeType===9?e:e.ownerDocument}function by(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function _y(e,t){if(e===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return e===1&&t==="foreignObject"?0:e}function ug(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var sg=null;function rS(){var e=window.event;return e&&e.type==="popstate"?e===sg?!1:(sg=e,!0):(sg=null,!1)}var Sy=typeof setTimeout=="function"?setTimeout:void 0,lS=typeof clearTimeout=="function"?clearTimeout:void 0,xy=typeof Promise=="function"?Promise:void 0,uS=typeof queueMicrotask=="function"?queueMicrotask:typeof xy<"u"?function(e){return xy.resolve(null).then(e).catch(sS)}:Sy;function sS(e){setTimeout(function(){throw e})}function Gu(e){return e==="head"}function Ey(e,t){var l=t,o=0,m=0;do{var b=l.nextSibling;if(e.removeChild(l),b&&b.nodeType===8)if(l=b.data,l==="/$"){if(0<o&&8>o){l=o;var q=e.ownerDocument;if(l&1&&eh(q.documentElement),l&2&&eh(q.body),l&4)for(l=q.head,eh(l),q=l.firstChild;q;){var K=q.nextSibling,W=q.nodeName;q[Er]||W==="SCRIPT"||W==="STYLE"||W==="LINK"&&q.rel.toLowerCase()==="stylesheet"||l.removeChild(q),q=K}}if(m===0){e.removeChild(b),sh(t);return}m--}else l==="$"||l==="$?"||l==="$!"?m++:o=l.charCodeAt(0)-48;else o=0;l=b}while(l);sh(t)}function og(e){var t=e.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var l=t;switch(t=t.nextSibling,l.nodeName){case"HTML":case"HEAD":case"BODY":og(l),$t(l);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(l.rel.toLowerCase()==="stylesheet")continue}e.removeChild(l)}}function oS(e,t,l,o){for(;e.nodeType===1;){var m=l;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!o&&(e.nodeName!=="INPUT"||e.type!=="hidden"))break}else if(o){if(!e[Er])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if(b=e.getAttribute("rel"),b==="stylesheet"&&e.hasAttribute("data-precedence"))break;if(b!==m.rel||e.getAttribute("href")!==(m.href==null||m.href===""?null:m.href)||e.getAttribute("crossorigin")!==(m.crossOrigin==null?null:m.crossOrigin)||e.getAttribute("title")!==(m.title==null?null:m.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(b=e.getAttribute("src"),(b!==(m.src==null?null:m.src)||e.getAttribute("type")!==(m.type==null?null:m.type)||e.getAttribute("crossorigin")!==(m.crossOrigin==null?null:m.crossOrigin))&&b&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else if(t==="input"&&e.type==="hidden"){var b=m.name==null?null:""+m.name;if(m.type==="hidden"&&e.getAttribute("name")===b)return e}else return e;if(e=gr(e.nextSibling),e===null)break}return null}function cS(e,t,l){if(t==="")return null;for(;e.nodeType!==3;)if((e.nodeType!==1||e.nodeName!=="INPUT"||e.type!=="hidden")&&!l||(e=gr(e.nextSibling),e===null))return null;return e}function cg(e){return e.data==="$!"||e.data==="$?"&&e.ownerDocument.readyState==="complete"}function fS(e,t){var l=e.ownerDocument;if(e.data!=="$?"||l.readyState==="complete")t();else{var o=function(){t(),l.removeEventListener("DOMContentLoaded",o)};l.addEventListener("DOMContentLoaded",o),e._reactRetry=o}}function gr(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return e}var fg=null;function Cy(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var l=e.data;if(l==="$"||l==="$!"||l==="$?"){if(t===0)return e;t--}else l==="/$"&&t++}e=e.previousSibling}return null}function Ty(e,t,l){switch(t=V0(l),e){case"html":if(e=t.documentElement,!e)throw Error(s(452));return e;case"head":if(e=t.head,!e)throw Error(s(453));return e;case"body":if(e=t.body,!e)throw Error(s(454));return e;default:throw Error(s(451))}}function eh(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);$t(e)}var ji=new Map,Ay=new Set;function Y0(e){return typeof e.getRootNode=="function"?e.getRootNode():e.nodeType===9?e:e.ownerDocument}var Bl=L.d;L.d={f:hS,r:dS,D:gS,C:pS,L:vS,m:mS,X:bS,S:yS,M:_S};function hS(){var e=Bl.f(),t=Bi();return e||t}function dS(e){var t=Tr(e);t!==null&&t.tag===5&&t.type==="form"?S0(t):Bl.r(e)}var uc=typeof document>"u"?null:document;function Ry(e,t,l){var o=uc;if(o&&typeof t=="string"&&t){var m=xn(t);m='link[rel="'+e+'"][href="'+m+'"]',typeof l=="string"&&(m+='[crossorigin="'+l+'"]'),Ay.has(m)||(Ay.add(m),e={rel:e,crossOrigin:l,href:t},o.querySelector(m)===null&&(t=o.createElement("link"),fn(t,"link",e),Da(t),o.head.appendChild(t)))}}function gS(e){Bl.D(e),Ry("dns-prefetch",e,null)}function pS(e,t){Bl.C(e,t),Ry("preconnect",e,t)}function vS(e,t,l){Bl.L(e,t,l);var o=uc;if(o&&e&&t){var m='link[rel="preload"][as="'+xn(t)+'"]';t==="image"&&l&&l.imageSrcSet?(m+='[imagesrcset="'+xn(l.imageSrcSet)+'"]',typeof l.imageSizes=="string"&&(m+='[imagesizes="'+xn(l.imageSizes)+'"]')):m+='[href="'+xn(e)+'"]';var b=m;switch(t){case"style":b=sc(e);break;case"script":b=oc(e)}ji.has(b)||(e=_({rel:"preload",href:t==="image"&&l&&l.imageSrcSet?void 0:e,as:t},l),ji.set(b,e),o.querySelector(m)!==null||t==="style"&&o.querySelector(th(b))||t==="script"&&o.querySelector(ah(b))||(t=o.createElement("link"),fn(t,"link",e),Da(t),o.head.appendChild(t)))}}function mS(e,t){Bl.m(e,t);var l=uc;if(l&&e){var o=t&&typeof t.as=="string"?t.as:"script",m='link[rel="modulepreload"][as="'+xn(o)+'"][href="'+xn(e)+'"]',b=m;switch(o){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":b=oc(e)}if(!ji.has(b)&&(e=_({rel:"modulepreload",href:e},t),ji.set(b,e),l.querySelector(m)===null)){switch(o){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(l.querySelector(ah(b)))return}o=l.createElement("link"),fn(o,"link",e),Da(o),l.head.appendChild(o)}}}function yS(e,t,l){Bl.S(e,t,l);var o=uc;if(o&&e){var m=hl(o).hoistableStyles,b=sc(e);t=t||"default";var q=m.get(b);if(!q){var K={loading:0,preload:null};if(q=o.querySelector(th(b)))K.loading=5;else{e=_({rel:"stylesheet",href:e,"data-precedence":t},l),(l=ji.get(b))&&hg(e,l);var W=q=o.createElement("link");Da(W),fn(W,"link",e),W._p=new Promise(function(ge,_e){W.onload=ge,W.onerror=_e}),W.addEventListener("load",function(){K.loading|=1}),W.addEventListener("error",function(){K.loading|=2}),K.loading|=4,P0(q,t,o)}q={type:"stylesheet",instance:q,count:1,state:K},m.set(b,q)}}}function bS(e,t){Bl.X(e,t);var l=uc;if(l&&e){var o=hl(l).hoistableScripts,m=oc(e),b=o.get(m);b||(b=l.querySelector(ah(m)),b||(e=_({src:e,async:!0},t),(t=ji.get(m))&&dg(e,t),b=l.createElement("script"),Da(b),fn(b,"link",e),l.head.appendChild(b)),b={type:"script",instance:b,count:1,state:null},o.set(m,b))}}function _S(e,t){Bl.M(e,t);var l=uc;if(l&&e){var o=hl(l).hoistableScripts,m=oc(e),b=o.get(m);b||(b=l.querySelector(ah(m)),b||(e=_({src:e,async:!0,type:"module"},t),(t=ji.get(m))&&dg(e,t),b=l.createElement("script"),Da(b),fn(b,"link",e),l.head.appendChild(b)),b={type:"script",instance:b,count:1,state:null},o.set(m,b))}}function Oy(e,t,l,o){var m=(m=xe.current)?Y0(m):null;if(!m)throw Error(s(446));switch(e){case"meta":case"title":return null;case"style":return typeof l.precedence=="string"&&typeof l.href=="string"?(t=sc(l.href),l=hl(m).hoistableStyles,o=l.get(t),o||(o={type:"style",instance:null,count:0,state:null},l.set(t,o)),o):{type:"void",instance:null,count:0,state:null};case"link":if(l.rel==="stylesheet"&&typeof l.href=="string"&&typeof l.precedence=="string"){e=sc(l.href);var b=hl(m).hoistableStyles,q=b.get(e);if(q||(m=m.ownerDocument||m,q={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},b.set(e,q),(b=m.querySelector(th(e)))&&!b._p&&(q.instance=b,q.state.loading=5),ji.has(e)||(l={rel:"preload",as:"style",href:l.href,crossOrigin:l.crossOrigin,integrity:l.integrity,media:l.media,hrefLang:l.hrefLang,referrerPolicy:l.referrerPolicy},ji.set(e,l),b||SS(m,e,l,q.state))),t&&o===null)throw Error(s(528,""));return q}if(t&&o!==null)throw Error(s(529,""));return null;case"script":return t=l.async,l=l.src,typeof l=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=oc(l),l=hl(m).hoistableScripts,o=l.get(t),o||(o={type:"script",instance:null,count:0,state:null},l.set(t,o)),o):{type:"void",instance:null,count:0,state:null};default:throw Error(s(444,e))}}function sc(e){return'href="'+xn(e)+'"'}function th(e){return'link[rel="stylesheet"]['+e+"]"}function My(e){return _({},e,{"data-precedence":e.precedence,precedence:null})}function SS(e,t,l,o){e.querySelector('link[rel="preload"][as="style"]['+t+"]")?o.loading=1:(t=e.createElement("link"),o.preload=t,t.addEventListener("load",function(){return o.loading|=1}),t.addEventListener("error",function(){return o.loading|=2}),fn(t,"link",l),Da(t),e.head.appendChild(t))}function oc(e){return'[src="'+xn(e)+'"]'}function ah(e){return"script[async]"+e}function wy(e,t,l){if(t.count++,t.instance===null)switch(t.type){case"style":var o=e.querySelector('style[data-href~="'+xn(l.href)+'"]');if(o)return t.instance=o,Da(o),o;var m=_({},l,{"data-href":l.href,"data-precedence":l.precedence,href:null,precedence:null});return o=(e.ownerDocument||e).createElement("style"),Da(o),fn(o,"style",m),P0(o,l.precedence,e),t.instance=o;case"stylesheet":m=sc(l.href);var b=e.querySelector(th(m));if(b)return t.state.loading|=4,t.instance=b,Da(b),b;o=My(l),(m=ji.get(m))&&hg(o,m),b=(e.ownerDocument||e).createElement("link"),Da(b);var q=b;return q._p=new Promise(function(K,W){q.onload=K,q.onerror=W}),fn(b,"link",o),t.state.loading|=4,P0(b,l.precedence,e),t.instance=b;case"script":return b=oc(l.src),(m=e.querySelector(ah(b)))?(t.instance=m,Da(m),m):(o=l,(m=ji.get(b))&&(o=_({},l),dg(o,m)),e=e.ownerDocument||e,m=e.createElement("script"),Da(m),fn(m,"link",o),e.head.appendChild(m),t.instance=m);case"void":return null;default:throw Error(s(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(o=t.instance,t.state.loading|=4,P0(o,l.precedence,e));return t.instance}function P0(e,t,l){for(var o=l.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),m=o.length?o[o.length-1]:null,b=m,q=0;q<o.length;q++){var K=o[q];if(K.dataset.precedence===t)b=K;else if(b!==m)break}b?b.parentNode.insertBefore(e,b.nextSibling):(t=l.nodeType===9?l.head:l,t.insertBefore(e,t.firstChild))}function hg(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.title==null&&(e.title=t.title)}function dg(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.integrity==null&&(e.integrity=t.integrity)}var X0=null;function Ny(e,t,l){if(X0===null){var o=new Map,m=X0=new Map;m.set(l,o)}else m=X0,o=m.get(l),o||(o=new Map,m.set(l,o));if(o.has(e))return o;for(o.set(e,null),l=l.getElementsByTagName(e),m=0;m<l.length;m++){var b=l[m];if(!(b[Er]||b[Ba]||e==="link"&&b.getAttribute("rel")==="stylesheet")&&b.namespaceURI!=="http://www.w3.org/2000/svg"){var q=b.getAttribute(t)||"";q=e+q;var K=o.get(q);K?K.push(b):o.set(q,[b])}}return o}function Dy(e,t,l){e=e.ownerDocument||e,e.head.insertBefore(l,t==="title"?e.querySelector("head > title"):null)}function xS(e,t,l){if(l===1||t.itemProp!=null)return!1;switch(e){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return e=t.disabled,typeof t.precedence=="string"&&e==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function zy(e){return!(e.type==="stylesheet"&&(e.state.loading&3)===0)}var nh=null;function ES(){}function CS(e,t,l){if(nh===null)throw Error(s(475));var o=nh;if(t.type==="stylesheet"&&(typeof l.media!="string"||matchMedia(l.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var m=sc(l.href),b=e.querySelector(th(m));if(b){e=b._p,e!==null&&typeof e=="object"&&typeof e.then=="function"&&(o.count++,o=K0.bind(o),e.then(o,o)),t.state.loading|=4,t.instance=b,Da(b);return}b=e.ownerDocument||e,l=My(l),(m=ji.get(m))&&hg(l,m),b=b.createElement("link"),Da(b);var q=b;q._p=new Promise(function(K,W){q.onload=K,q.onerror=W}),fn(b,"link",l),t.instance=b}o.stylesheets===null&&(o.stylesheets=new Map),o.stylesheets.set(t,e),(e=t.state.preload)&&(t.state.loading&3)===0&&(o.count++,t=K0.bind(o),e.addEventListener("load",t),e.addEventListener("error",t))}}function TS(){if(nh===null)throw Error(s(475));var e=nh;return e.stylesheets&&e.count===0&&gg(e,e.stylesheets),0<e.count?function(t){var l=setTimeout(function(){if(e.stylesheets&&gg(e,e.stylesheets),e.unsuspend){var o=e.unsuspend;e.unsuspend=null,o()}},6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(l)}}:null}function K0(){if(this.count--,this.count===0){if(this.stylesheets)gg(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}}var F0=null;function gg(e,t){e.stylesheets=null,e.unsuspend!==null&&(e.count++,F0=new Map,t.forEach(AS,e),F0=null,K0.call(e))}function AS(e,t){if(!(t.state.loading&4)){var l=F0.get(e);if(l)var o=l.get(null);else{l=new Map,F0.set(e,l);for(var m=e.querySelectorAll("link[data-precedence],style[data-precedence]"),b=0;b<m.length;b++){var q=m[b];(q.nodeName==="LINK"||q.getAttribute("media")!=="not all")&&(l.set(q.dataset.precedence,q),o=q)}o&&l.set(null,o)}m=t.instance,q=m.getAttribute("data-precedence"),b=l.get(q)||o,b===o&&l.set(null,m),l.set(q,m),this.count++,o=K0.bind(this),m.addEventListener("load",o),m.addEventListener("error",o),b?b.parentNode.insertBefore(m,b.nextSibling):(e=e.nodeType===9?e.head:e,e.insertBefore(m,e.firstChild)),t.state.loading|=4}}var ih={$$typeof:R,Provider:null,Consumer:null,_currentValue:Z,_currentValue2:Z,_threadCount:0};function RS(e,t,l,o,m,b,q,K){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Yi(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Yi(0),this.hiddenUpdates=Yi(null),this.identifierPrefix=o,this.onUncaughtError=m,this.onCaughtError=b,this.onRecoverableError=q,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=K,this.incompleteTransitions=new Map}function Uy(e,t,l,o,m,b,q,K,W,ge,_e,Ce){return e=new RS(e,t,l,q,K,W,ge,Ce),t=1,b===!0&&(t|=24),b=mn(3,null,null,t),e.current=b,b.stateNode=e,t=wo(),t.refCount++,e.pooledCache=t,t.refCount++,b.memoizedState={element:o,isDehydrated:l,cache:t},Of(b),e}function Gy(e){return e?(e=Gr,e):Gr}function qy(e,t,l,o,m,b){m=Gy(m),o.context===null?o.context=m:o.pendingContext=m,o=Ri(t),o.payload={element:l},b=b===void 0?null:b,b!==null&&(o.callback=b),l=ir(e,o,t),l!==null&&(cn(l,e,t),_l(l,e,t))}function Hy(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var l=e.retryLane;e.retryLane=l!==0&&l<t?l:t}}function pg(e,t){Hy(e,t),(e=e.alternate)&&Hy(e,t)}function By(e){if(e.tag===13){var t=$i(e,67108864);t!==null&&cn(t,e,67108864),pg(e,67108864)}}var k0=!0;function OS(e,t,l,o){var m=N.T;N.T=null;var b=L.p;try{L.p=2,vg(e,t,l,o)}finally{L.p=b,N.T=m}}function MS(e,t,l,o){var m=N.T;N.T=null;var b=L.p;try{L.p=8,vg(e,t,l,o)}finally{L.p=b,N.T=m}}function vg(e,t,l,o){if(k0){var m=mg(o);if(m===null)ng(e,t,o,Q0,l),jy(e,o);else if(NS(m,e,t,l,o))o.stopPropagation();else if(jy(e,o),t&4&&-1<wS.indexOf(e)){for(;m!==null;){var b=Tr(m);if(b!==null)switch(b.tag){case 3:if(b=b.stateNode,b.current.memoizedState.isDehydrated){var q=He(b.pendingLanes);if(q!==0){var K=b;for(K.pendingLanes|=2,K.entangledLanes|=2;q;){var W=1<<31-zt(q);K.entanglements[1]|=W,q&=~W}rl(b),(Mt&6)===0&&(Wa=we()+500,Wf(0))}}break;case 13:K=$i(b,2),K!==null&&cn(K,b,2),Bi(),pg(b,2)}if(b=mg(o),b===null&&ng(e,t,o,Q0,l),b===m)break;m=b}m!==null&&o.stopPropagation()}else ng(e,t,o,null,l)}}function mg(e){return e=co(e),yg(e)}var Q0=null;function yg(e){if(Q0=null,e=Cr(e),e!==null){var t=h(e);if(t===null)e=null;else{var l=t.tag;if(l===13){if(e=d(t),e!==null)return e;e=null}else if(l===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return Q0=e,null}function Ly(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(ft()){case na:return 2;case Rt:return 8;case Vt:case ht:return 32;case lt:return 268435456;default:return 32}default:return 32}}var bg=!1,qu=null,Hu=null,Bu=null,rh=new Map,lh=new Map,Lu=[],wS="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function jy(e,t){switch(e){case"focusin":case"focusout":qu=null;break;case"dragenter":case"dragleave":Hu=null;break;case"mouseover":case"mouseout":Bu=null;break;case"pointerover":case"pointerout":rh.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":lh.delete(t.pointerId)}}function uh(e,t,l,o,m,b){return e===null||e.nativeEvent!==b?(e={blockedOn:t,domEventName:l,eventSystemFlags:o,nativeEvent:b,targetContainers:[m]},t!==null&&(t=Tr(t),t!==null&&By(t)),e):(e.eventSystemFlags|=o,t=e.targetContainers,m!==null&&t.indexOf(m)===-1&&t.push(m),e)}function NS(e,t,l,o,m){switch(t){case"focusin":return qu=uh(qu,e,t,l,o,m),!0;case"dragenter":return Hu=uh(Hu,e,t,l,o,m),!0;case"mouseover":return Bu=uh(Bu,e,t,l,o,m),!0;case"pointerover":var b=m.pointerId;return rh.set(b,uh(rh.get(b)||null,e,t,l,o,m)),!0;case"gotpointercapture":return b=m.pointerId,lh.set(b,uh(lh.get(b)||null,e,t,l,o,m)),!0}return!1}function Vy(e){var t=Cr(e.target);if(t!==null){var l=h(t);if(l!==null){if(t=l.tag,t===13){if(t=d(l),t!==null){e.blockedOn=t,xd(e.priority,function(){if(l.tag===13){var o=ua();o=_r(o);var m=$i(l,o);m!==null&&cn(m,l,o),pg(l,o)}});return}}else if(t===3&&l.stateNode.current.memoizedState.isDehydrated){e.blockedOn=l.tag===3?l.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Z0(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var l=mg(e.nativeEvent);if(l===null){l=e.nativeEvent;var o=new l.constructor(l.type,l);oo=o,l.target.dispatchEvent(o),oo=null}else return t=Tr(l),t!==null&&By(t),e.blockedOn=l,!1;t.shift()}return!0}function Yy(e,t,l){Z0(e)&&l.delete(t)}function DS(){bg=!1,qu!==null&&Z0(qu)&&(qu=null),Hu!==null&&Z0(Hu)&&(Hu=null),Bu!==null&&Z0(Bu)&&(Bu=null),rh.forEach(Yy),lh.forEach(Yy)}function J0(e,t){e.blockedOn===t&&(e.blockedOn=null,bg||(bg=!0,n.unstable_scheduleCallback(n.unstable_NormalPriority,DS)))}var W0=null;function Py(e){W0!==e&&(W0=e,n.unstable_scheduleCallback(n.unstable_NormalPriority,function(){W0===e&&(W0=null);for(var t=0;t<e.length;t+=3){var l=e[t],o=e[t+1],m=e[t+2];if(typeof o!="function"){if(yg(o||l)===null)continue;break}var b=Tr(l);b!==null&&(e.splice(t,3),t-=3,Xf(b,{pending:!0,data:m,method:l.method,action:o},o,m))}}))}function sh(e){function t(W){return J0(W,e)}qu!==null&&J0(qu,e),Hu!==null&&J0(Hu,e),Bu!==null&&J0(Bu,e),rh.forEach(t),lh.forEach(t);for(var l=0;l<Lu.length;l++){var o=Lu[l];o.blockedOn===e&&(o.blockedOn=null)}for(;0<Lu.length&&(l=Lu[0],l.blockedOn===null);)Vy(l),l.blockedOn===null&&Lu.shift();if(l=(e.ownerDocument||e).$$reactFormReplay,l!=null)for(o=0;o<l.length;o+=3){var m=l[o],b=l[o+1],q=m[Qa]||null;if(typeof b=="function")q||Py(l);else if(q){var K=null;if(b&&b.hasAttribute("formAction")){if(m=b,q=b[Qa]||null)K=q.formAction;else if(yg(m)!==null)continue}else K=q.action;typeof K=="function"?l[o+1]=K:(l.splice(o,3),o-=3),Py(l)}}}function _g(e){this._internalRoot=e}I0.prototype.render=_g.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(s(409));var l=t.current,o=ua();qy(l,o,e,t,null,null)},I0.prototype.unmount=_g.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;qy(e.current,2,null,e,null,null),Bi(),t[Sr]=null}};function I0(e){this._internalRoot=e}I0.prototype.unstable_scheduleHydration=function(e){if(e){var t=Ju();e={blockedOn:null,target:e,priority:t};for(var l=0;l<Lu.length&&t!==0&&t<Lu[l].priority;l++);Lu.splice(l,0,e),l===0&&Vy(e)}};var Xy=i.version;if(Xy!=="19.1.0")throw Error(s(527,Xy,"19.1.0"));L.findDOMNode=function(e){var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(s(188)):(e=Object.keys(e).join(","),Error(s(268,e)));return e=v(t),e=e!==null?p(e):null,e=e===null?null:e.stateNode,e};var zS={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:N,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var $0=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!$0.isDisabled&&$0.supportsFiber)try{Zt=$0.inject(zS),Dt=$0}catch{}}return ch.createRoot=function(e,t){if(!c(e))throw Error(s(299));var l=!1,o="",m=Bs,b=ko,q=z0,K=null;return t!=null&&(t.unstable_strictMode===!0&&(l=!0),t.identifierPrefix!==void 0&&(o=t.identifierPrefix),t.onUncaughtError!==void 0&&(m=t.onUncaughtError),t.onCaughtError!==void 0&&(b=t.onCaughtError),t.onRecoverableError!==void 0&&(q=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(K=t.unstable_transitionCallbacks)),t=Uy(e,1,!1,null,null,l,o,m,b,q,K,null),e[Sr]=t.current,ag(e),new _g(t)},ch.hydrateRoot=function(e,t,l){if(!c(e))throw Error(s(299));var o=!1,m="",b=Bs,q=ko,K=z0,W=null,ge=null;return l!=null&&(l.unstable_strictMode===!0&&(o=!0),l.identifierPrefix!==void 0&&(m=l.identifierPrefix),l.onUncaughtError!==void 0&&(b=l.onUncaughtError),l.onCaughtError!==void 0&&(q=l.onCaughtError),l.onRecoverableError!==void 0&&(K=l.onRecoverableError),l.unstable_transitionCallbacks!==void 0&&(W=l.unstable_transitionCallbacks),l.formState!==void 0&&(ge=l.formState)),t=Uy(e,1,!0,t,l??null,o,m,b,q,K,W,ge),t.context=Gy(null),l=t.current,o=ua(),o=_r(o),m=Ri(o),m.callback=null,ir(l,m,o),l=o,t.current.lanes=l,Jt(t,l),rl(t),e[Sr]=t.current,ag(e),new I0(t)},ch.version="19.1.0",ch}var eb;function XS(){if(eb)return Eg.exports;eb=1;function n(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(n)}catch(i){console.error(i)}}return n(),Eg.exports=PS(),Eg.exports}var KS=XS();const FS=Ku(KS);var fh={},tb;function kS(){if(tb)return fh;tb=1,Object.defineProperty(fh,"__esModule",{value:!0}),fh.parse=d,fh.serialize=p;const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,i=/^[\u0021-\u003A\u003C-\u007E]*$/,u=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,s=/^[\u0020-\u003A\u003D-\u007E]*$/,c=Object.prototype.toString,h=(()=>{const C=function(){};return C.prototype=Object.create(null),C})();function d(C,x){const E=new h,O=C.length;if(O<2)return E;const w=(x==null?void 0:x.decode)||_;let U=0;do{const A=C.indexOf("=",U);if(A===-1)break;const R=C.indexOf(";",U),z=R===-1?O:R;if(A>z){U=C.lastIndexOf(";",A-1)+1;continue}const G=g(C,U,A),B=v(C,A,G),Q=C.slice(G,B);if(E[Q]===void 0){let X=g(C,A+1,z),Y=v(C,z,X);const V=w(C.slice(X,Y));E[Q]=V}U=z+1}while(U<O);return E}function g(C,x,E){do{const O=C.charCodeAt(x);if(O!==32&&O!==9)return x}while(++x<E);return E}function v(C,x,E){for(;x>E;){const O=C.charCodeAt(--x);if(O!==32&&O!==9)return x+1}return E}function p(C,x,E){const O=(E==null?void 0:E.encode)||encodeURIComponent;if(!n.test(C))throw new TypeError(`argument name is invalid: ${C}`);const w=O(x);if(!i.test(w))throw new TypeError(`argument val is invalid: ${x}`);let U=C+"="+w;if(!E)return U;if(E.maxAge!==void 0){if(!Number.isInteger(E.maxAge))throw new TypeError(`option maxAge is invalid: ${E.maxAge}`);U+="; Max-Age="+E.maxAge}if(E.domain){if(!u.test(E.domain))throw new TypeError(`option domain is invalid: ${E.domain}`);U+="; Domain="+E.domain}if(E.path){if(!s.test(E.path))throw new TypeError(`option path is invalid: ${E.path}`);U+="; Path="+E.path}if(E.expires){if(!T(E.expires)||!Number.isFinite(E.expires.valueOf()))throw new TypeError(`option expires is invalid: ${E.expires}`);U+="; Expires="+E.expires.toUTCString()}if(E.httpOnly&&(U+="; HttpOnly"),E.secure&&(U+="; Secure"),E.partitioned&&(U+="; Partitioned"),E.priority)switch(typeof E.priority=="string"?E.priority.toLowerCase():void 0){case"low":U+="; Priority=Low";break;case"medium":U+="; Priority=Medium";break;case"high":U+="; Priority=High";break;default:throw new TypeError(`option priority is invalid: ${E.priority}`)}if(E.sameSite)switch(typeof E.sameSite=="string"?E.sameSite.toLowerCase():E.sameSite){case!0:case"strict":U+="; SameSite=Strict";break;case"lax":U+="; SameSite=Lax";break;case"none":U+="; SameSite=None";break;default:throw new TypeError(`option sameSite is invalid: ${E.sameSite}`)}return U}function _(C){if(C.indexOf("%")===-1)return C;try{return decodeURIComponent(C)}catch{return C}}function T(C){return c.call(C)==="[object Date]"}return fh}kS();var ab="popstate";function QS(n={}){function i(s,c){let{pathname:h,search:d,hash:g}=s.location;return Z2("",{pathname:h,search:d,hash:g},c.state&&c.state.usr||null,c.state&&c.state.key||"default")}function u(s,c){return typeof c=="string"?c:hd(c)}return JS(i,u,null,n)}function va(n,i){if(n===!1||n===null||typeof n>"u")throw new Error(i)}function ul(n,i){if(!n){typeof console<"u"&&console.warn(i);try{throw new Error(i)}catch{}}}function ZS(){return Math.random().toString(36).substring(2,10)}function nb(n,i){return{usr:n.state,key:n.key,idx:i}}function Z2(n,i,u=null,s){return{pathname:typeof n=="string"?n:n.pathname,search:"",hash:"",...typeof i=="string"?Gc(i):i,state:u,key:i&&i.key||s||ZS()}}function hd({pathname:n="/",search:i="",hash:u=""}){return i&&i!=="?"&&(n+=i.charAt(0)==="?"?i:"?"+i),u&&u!=="#"&&(n+=u.charAt(0)==="#"?u:"#"+u),n}function Gc(n){let i={};if(n){let u=n.indexOf("#");u>=0&&(i.hash=n.substring(u),n=n.substring(0,u));let s=n.indexOf("?");s>=0&&(i.search=n.substring(s),n=n.substring(0,s)),n&&(i.pathname=n)}return i}function JS(n,i,u,s={}){let{window:c=document.defaultView,v5Compat:h=!1}=s,d=c.history,g="POP",v=null,p=_();p==null&&(p=0,d.replaceState({...d.state,idx:p},""));function _(){return(d.state||{idx:null}).idx}function T(){g="POP";let w=_(),U=w==null?null:w-p;p=w,v&&v({action:g,location:O.location,delta:U})}function C(w,U){g="PUSH";let A=Z2(O.location,w,U);p=_()+1;let R=nb(A,p),z=O.createHref(A);try{d.pushState(R,"",z)}catch(G){if(G instanceof DOMException&&G.name==="DataCloneError")throw G;c.location.assign(z)}h&&v&&v({action:g,location:O.location,delta:1})}function x(w,U){g="REPLACE";let A=Z2(O.location,w,U);p=_();let R=nb(A,p),z=O.createHref(A);d.replaceState(R,"",z),h&&v&&v({action:g,location:O.location,delta:0})}function E(w){return WS(w)}let O={get action(){return g},get location(){return n(c,d)},listen(w){if(v)throw new Error("A history only accepts one active listener");return c.addEventListener(ab,T),v=w,()=>{c.removeEventListener(ab,T),v=null}},createHref(w){return i(c,w)},createURL:E,encodeLocation(w){let U=E(w);return{pathname:U.pathname,search:U.search,hash:U.hash}},push:C,replace:x,go(w){return d.go(w)}};return O}function WS(n,i=!1){let u="http://localhost";typeof window<"u"&&(u=window.location.origin!=="null"?window.location.origin:window.location.href),va(u,"No window.location.(origin|href) available to create URL");let s=typeof n=="string"?n:hd(n);return s=s.replace(/ $/,"%20"),!i&&s.startsWith("//")&&(s=u+s),new URL(s,u)}function __(n,i,u="/"){return IS(n,i,u,!1)}function IS(n,i,u,s){let c=typeof i=="string"?Gc(i):i,h=Xl(c.pathname||"/",u);if(h==null)return null;let d=S_(n);$S(d);let g=null;for(let v=0;g==null&&v<d.length;++v){let p=c9(h);g=s9(d[v],p,s)}return g}function S_(n,i=[],u=[],s=""){let c=(h,d,g)=>{let v={relativePath:g===void 0?h.path||"":g,caseSensitive:h.caseSensitive===!0,childrenIndex:d,route:h};v.relativePath.startsWith("/")&&(va(v.relativePath.startsWith(s),`Absolute route path "${v.relativePath}" nested under path "${s}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),v.relativePath=v.relativePath.slice(s.length));let p=Pl([s,v.relativePath]),_=u.concat(v);h.children&&h.children.length>0&&(va(h.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${p}".`),S_(h.children,i,_,p)),!(h.path==null&&!h.index)&&i.push({path:p,score:l9(p,h.index),routesMeta:_})};return n.forEach((h,d)=>{var g;if(h.path===""||!((g=h.path)!=null&&g.includes("?")))c(h,d);else for(let v of x_(h.path))c(h,d,v)}),i}function x_(n){let i=n.split("/");if(i.length===0)return[];let[u,...s]=i,c=u.endsWith("?"),h=u.replace(/\?$/,"");if(s.length===0)return c?[h,""]:[h];let d=x_(s.join("/")),g=[];return g.push(...d.map(v=>v===""?h:[h,v].join("/"))),c&&g.push(...d),g.map(v=>n.startsWith("/")&&v===""?"/":v)}function $S(n){n.sort((i,u)=>i.score!==u.score?u.score-i.score:u9(i.routesMeta.map(s=>s.childrenIndex),u.routesMeta.map(s=>s.childrenIndex)))}var e9=/^:[\w-]+$/,t9=3,a9=2,n9=1,i9=10,r9=-2,ib=n=>n==="*";function l9(n,i){let u=n.split("/"),s=u.length;return u.some(ib)&&(s+=r9),i&&(s+=a9),u.filter(c=>!ib(c)).reduce((c,h)=>c+(e9.test(h)?t9:h===""?n9:i9),s)}function u9(n,i){return n.length===i.length&&n.slice(0,-1).every((s,c)=>s===i[c])?n[n.length-1]-i[i.length-1]:0}function s9(n,i,u=!1){let{routesMeta:s}=n,c={},h="/",d=[];for(let g=0;g<s.length;++g){let v=s[g],p=g===s.length-1,_=h==="/"?i:i.slice(h.length)||"/",T=o1({path:v.relativePath,caseSensitive:v.caseSensitive,end:p},_),C=v.route;if(!T&&p&&u&&!s[s.length-1].route.index&&(T=o1({path:v.relativePath,caseSensitive:v.caseSensitive,end:!1},_)),!T)return null;Object.assign(c,T.params),d.push({params:c,pathname:Pl([h,T.pathname]),pathnameBase:g9(Pl([h,T.pathnameBase])),route:C}),T.pathnameBase!=="/"&&(h=Pl([h,T.pathnameBase]))}return d}function o1(n,i){typeof n=="string"&&(n={path:n,caseSensitive:!1,end:!0});let[u,s]=o9(n.path,n.caseSensitive,n.end),c=i.match(u);if(!c)return null;let h=c[0],d=h.replace(/(.)\/+$/,"$1"),g=c.slice(1);return{params:s.reduce((p,{paramName:_,isOptional:T},C)=>{if(_==="*"){let E=g[C]||"";d=h.slice(0,h.length-E.length).replace(/(.)\/+$/,"$1")}const x=g[C];return T&&!x?p[_]=void 0:p[_]=(x||"").replace(/%2F/g,"/"),p},{}),pathname:h,pathnameBase:d,pattern:n}}function o9(n,i=!1,u=!0){ul(n==="*"||!n.endsWith("*")||n.endsWith("/*"),`Route path "${n}" will be treated as if it were "${n.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${n.replace(/\*$/,"/*")}".`);let s=[],c="^"+n.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(d,g,v)=>(s.push({paramName:g,isOptional:v!=null}),v?"/?([^\\/]+)?":"/([^\\/]+)"));return n.endsWith("*")?(s.push({paramName:"*"}),c+=n==="*"||n==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):u?c+="\\/*$":n!==""&&n!=="/"&&(c+="(?:(?=\\/|$))"),[new RegExp(c,i?void 0:"i"),s]}function c9(n){try{return n.split("/").map(i=>decodeURIComponent(i).replace(/\//g,"%2F")).join("/")}catch(i){return ul(!1,`The URL path "${n}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${i}).`),n}}function Xl(n,i){if(i==="/")return n;if(!n.toLowerCase().startsWith(i.toLowerCase()))return null;let u=i.endsWith("/")?i.length-1:i.length,s=n.charAt(u);return s&&s!=="/"?null:n.slice(u)||"/"}function f9(n,i="/"){let{pathname:u,search:s="",hash:c=""}=typeof n=="string"?Gc(n):n;return{pathname:u?u.startsWith("/")?u:h9(u,i):i,search:p9(s),hash:v9(c)}}function h9(n,i){let u=i.replace(/\/+$/,"").split("/");return n.split("/").forEach(c=>{c===".."?u.length>1&&u.pop():c!=="."&&u.push(c)}),u.length>1?u.join("/"):"/"}function Rg(n,i,u,s){return`Cannot include a '${n}' character in a manually specified \`to.${i}\` field [${JSON.stringify(s)}].  Please separate it out to the \`to.${u}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function d9(n){return n.filter((i,u)=>u===0||i.route.path&&i.route.path.length>0)}function E_(n){let i=d9(n);return i.map((u,s)=>s===i.length-1?u.pathname:u.pathnameBase)}function C_(n,i,u,s=!1){let c;typeof n=="string"?c=Gc(n):(c={...n},va(!c.pathname||!c.pathname.includes("?"),Rg("?","pathname","search",c)),va(!c.pathname||!c.pathname.includes("#"),Rg("#","pathname","hash",c)),va(!c.search||!c.search.includes("#"),Rg("#","search","hash",c)));let h=n===""||c.pathname==="",d=h?"/":c.pathname,g;if(d==null)g=u;else{let T=i.length-1;if(!s&&d.startsWith("..")){let C=d.split("/");for(;C[0]==="..";)C.shift(),T-=1;c.pathname=C.join("/")}g=T>=0?i[T]:"/"}let v=f9(c,g),p=d&&d!=="/"&&d.endsWith("/"),_=(h||d===".")&&u.endsWith("/");return!v.pathname.endsWith("/")&&(p||_)&&(v.pathname+="/"),v}var Pl=n=>n.join("/").replace(/\/\/+/g,"/"),g9=n=>n.replace(/\/+$/,"").replace(/^\/*/,"/"),p9=n=>!n||n==="?"?"":n.startsWith("?")?n:"?"+n,v9=n=>!n||n==="#"?"":n.startsWith("#")?n:"#"+n;function m9(n){return n!=null&&typeof n.status=="number"&&typeof n.statusText=="string"&&typeof n.internal=="boolean"&&"data"in n}var T_=["POST","PUT","PATCH","DELETE"];new Set(T_);var y9=["GET",...T_];new Set(y9);var qc=ue.createContext(null);qc.displayName="DataRouter";var m1=ue.createContext(null);m1.displayName="DataRouterState";var A_=ue.createContext({isTransitioning:!1});A_.displayName="ViewTransition";var b9=ue.createContext(new Map);b9.displayName="Fetchers";var _9=ue.createContext(null);_9.displayName="Await";var sl=ue.createContext(null);sl.displayName="Navigation";var pd=ue.createContext(null);pd.displayName="Location";var ol=ue.createContext({outlet:null,matches:[],isDataRoute:!1});ol.displayName="Route";var um=ue.createContext(null);um.displayName="RouteError";function S9(n,{relative:i}={}){va(vd(),"useHref() may be used only in the context of a <Router> component.");let{basename:u,navigator:s}=ue.useContext(sl),{hash:c,pathname:h,search:d}=md(n,{relative:i}),g=h;return u!=="/"&&(g=h==="/"?u:Pl([u,h])),s.createHref({pathname:g,search:d,hash:c})}function vd(){return ue.useContext(pd)!=null}function Qs(){return va(vd(),"useLocation() may be used only in the context of a <Router> component."),ue.useContext(pd).location}var R_="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function O_(n){ue.useContext(sl).static||ue.useLayoutEffect(n)}function sm(){let{isDataRoute:n}=ue.useContext(ol);return n?G9():x9()}function x9(){va(vd(),"useNavigate() may be used only in the context of a <Router> component.");let n=ue.useContext(qc),{basename:i,navigator:u}=ue.useContext(sl),{matches:s}=ue.useContext(ol),{pathname:c}=Qs(),h=JSON.stringify(E_(s)),d=ue.useRef(!1);return O_(()=>{d.current=!0}),ue.useCallback((v,p={})=>{if(ul(d.current,R_),!d.current)return;if(typeof v=="number"){u.go(v);return}let _=C_(v,JSON.parse(h),c,p.relative==="path");n==null&&i!=="/"&&(_.pathname=_.pathname==="/"?i:Pl([i,_.pathname])),(p.replace?u.replace:u.push)(_,p.state,p)},[i,u,h,c,n])}ue.createContext(null);function E9(){let{matches:n}=ue.useContext(ol),i=n[n.length-1];return i?i.params:{}}function md(n,{relative:i}={}){let{matches:u}=ue.useContext(ol),{pathname:s}=Qs(),c=JSON.stringify(E_(u));return ue.useMemo(()=>C_(n,JSON.parse(c),s,i==="path"),[n,c,s,i])}function C9(n,i){return M_(n,i)}function M_(n,i,u,s){var A;va(vd(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:c,static:h}=ue.useContext(sl),{matches:d}=ue.useContext(ol),g=d[d.length-1],v=g?g.params:{},p=g?g.pathname:"/",_=g?g.pathnameBase:"/",T=g&&g.route;{let R=T&&T.path||"";w_(p,!T||R.endsWith("*")||R.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${p}" (under <Route path="${R}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${R}"> to <Route path="${R==="/"?"*":`${R}/*`}">.`)}let C=Qs(),x;if(i){let R=typeof i=="string"?Gc(i):i;va(_==="/"||((A=R.pathname)==null?void 0:A.startsWith(_)),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${_}" but pathname "${R.pathname}" was given in the \`location\` prop.`),x=R}else x=C;let E=x.pathname||"/",O=E;if(_!=="/"){let R=_.replace(/^\//,"").split("/");O="/"+E.replace(/^\//,"").split("/").slice(R.length).join("/")}let w=!h&&u&&u.matches&&u.matches.length>0?u.matches:__(n,{pathname:O});ul(T||w!=null,`No routes matched location "${x.pathname}${x.search}${x.hash}" `),ul(w==null||w[w.length-1].route.element!==void 0||w[w.length-1].route.Component!==void 0||w[w.length-1].route.lazy!==void 0,`Matched leaf route at location "${x.pathname}${x.search}${x.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let U=M9(w&&w.map(R=>Object.assign({},R,{params:Object.assign({},v,R.params),pathname:Pl([_,c.encodeLocation?c.encodeLocation(R.pathname).pathname:R.pathname]),pathnameBase:R.pathnameBase==="/"?_:Pl([_,c.encodeLocation?c.encodeLocation(R.pathnameBase).pathname:R.pathnameBase])})),d,u,s);return i&&U?ue.createElement(pd.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...x},navigationType:"POP"}},U):U}function T9(){let n=U9(),i=m9(n)?`${n.status} ${n.statusText}`:n instanceof Error?n.message:JSON.stringify(n),u=n instanceof Error?n.stack:null,s="rgba(200,200,200, 0.5)",c={padding:"0.5rem",backgroundColor:s},h={padding:"2px 4px",backgroundColor:s},d=null;return console.error("Error handled by React Router default ErrorBoundary:",n),d=ue.createElement(ue.Fragment,null,ue.createElement("p",null,"💿 Hey developer 👋"),ue.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",ue.createElement("code",{style:h},"ErrorBoundary")," or"," ",ue.createElement("code",{style:h},"errorElement")," prop on your route.")),ue.createElement(ue.Fragment,null,ue.createElement("h2",null,"Unexpected Application Error!"),ue.createElement("h3",{style:{fontStyle:"italic"}},i),u?ue.createElement("pre",{style:c},u):null,d)}var A9=ue.createElement(T9,null),R9=class extends ue.Component{constructor(n){super(n),this.state={location:n.location,revalidation:n.revalidation,error:n.error}}static getDerivedStateFromError(n){return{error:n}}static getDerivedStateFromProps(n,i){return i.location!==n.location||i.revalidation!=="idle"&&n.revalidation==="idle"?{error:n.error,location:n.location,revalidation:n.revalidation}:{error:n.error!==void 0?n.error:i.error,location:i.location,revalidation:n.revalidation||i.revalidation}}componentDidCatch(n,i){console.error("React Router caught the following error during render",n,i)}render(){return this.state.error!==void 0?ue.createElement(ol.Provider,{value:this.props.routeContext},ue.createElement(um.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function O9({routeContext:n,match:i,children:u}){let s=ue.useContext(qc);return s&&s.static&&s.staticContext&&(i.route.errorElement||i.route.ErrorBoundary)&&(s.staticContext._deepestRenderedBoundaryId=i.route.id),ue.createElement(ol.Provider,{value:n},u)}function M9(n,i=[],u=null,s=null){if(n==null){if(!u)return null;if(u.errors)n=u.matches;else if(i.length===0&&!u.initialized&&u.matches.length>0)n=u.matches;else return null}let c=n,h=u==null?void 0:u.errors;if(h!=null){let v=c.findIndex(p=>p.route.id&&(h==null?void 0:h[p.route.id])!==void 0);va(v>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(h).join(",")}`),c=c.slice(0,Math.min(c.length,v+1))}let d=!1,g=-1;if(u)for(let v=0;v<c.length;v++){let p=c[v];if((p.route.HydrateFallback||p.route.hydrateFallbackElement)&&(g=v),p.route.id){let{loaderData:_,errors:T}=u,C=p.route.loader&&!_.hasOwnProperty(p.route.id)&&(!T||T[p.route.id]===void 0);if(p.route.lazy||C){d=!0,g>=0?c=c.slice(0,g+1):c=[c[0]];break}}}return c.reduceRight((v,p,_)=>{let T,C=!1,x=null,E=null;u&&(T=h&&p.route.id?h[p.route.id]:void 0,x=p.route.errorElement||A9,d&&(g<0&&_===0?(w_("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),C=!0,E=null):g===_&&(C=!0,E=p.route.hydrateFallbackElement||null)));let O=i.concat(c.slice(0,_+1)),w=()=>{let U;return T?U=x:C?U=E:p.route.Component?U=ue.createElement(p.route.Component,null):p.route.element?U=p.route.element:U=v,ue.createElement(O9,{match:p,routeContext:{outlet:v,matches:O,isDataRoute:u!=null},children:U})};return u&&(p.route.ErrorBoundary||p.route.errorElement||_===0)?ue.createElement(R9,{location:u.location,revalidation:u.revalidation,component:x,error:T,children:w(),routeContext:{outlet:null,matches:O,isDataRoute:!0}}):w()},null)}function om(n){return`${n} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function w9(n){let i=ue.useContext(qc);return va(i,om(n)),i}function N9(n){let i=ue.useContext(m1);return va(i,om(n)),i}function D9(n){let i=ue.useContext(ol);return va(i,om(n)),i}function cm(n){let i=D9(n),u=i.matches[i.matches.length-1];return va(u.route.id,`${n} can only be used on routes that contain a unique "id"`),u.route.id}function z9(){return cm("useRouteId")}function U9(){var s;let n=ue.useContext(um),i=N9("useRouteError"),u=cm("useRouteError");return n!==void 0?n:(s=i.errors)==null?void 0:s[u]}function G9(){let{router:n}=w9("useNavigate"),i=cm("useNavigate"),u=ue.useRef(!1);return O_(()=>{u.current=!0}),ue.useCallback(async(c,h={})=>{ul(u.current,R_),u.current&&(typeof c=="number"?n.navigate(c):await n.navigate(c,{fromRouteId:i,...h}))},[n,i])}var rb={};function w_(n,i,u){!i&&!rb[n]&&(rb[n]=!0,ul(!1,u))}ue.memo(q9);function q9({routes:n,future:i,state:u}){return M_(n,void 0,u,i)}function J2(n){va(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function H9({basename:n="/",children:i=null,location:u,navigationType:s="POP",navigator:c,static:h=!1}){va(!vd(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let d=n.replace(/^\/*/,"/"),g=ue.useMemo(()=>({basename:d,navigator:c,static:h,future:{}}),[d,c,h]);typeof u=="string"&&(u=Gc(u));let{pathname:v="/",search:p="",hash:_="",state:T=null,key:C="default"}=u,x=ue.useMemo(()=>{let E=Xl(v,d);return E==null?null:{location:{pathname:E,search:p,hash:_,state:T,key:C},navigationType:s}},[d,v,p,_,T,C,s]);return ul(x!=null,`<Router basename="${d}"> is not able to match the URL "${v}${p}${_}" because it does not start with the basename, so the <Router> won't render anything.`),x==null?null:ue.createElement(sl.Provider,{value:g},ue.createElement(pd.Provider,{children:i,value:x}))}function B9({children:n,location:i}){return C9(W2(n),i)}function W2(n,i=[]){let u=[];return ue.Children.forEach(n,(s,c)=>{if(!ue.isValidElement(s))return;let h=[...i,c];if(s.type===ue.Fragment){u.push.apply(u,W2(s.props.children,h));return}va(s.type===J2,`[${typeof s.type=="string"?s.type:s.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),va(!s.props.index||!s.props.children,"An index route cannot have child routes.");let d={id:s.props.id||h.join("-"),caseSensitive:s.props.caseSensitive,element:s.props.element,Component:s.props.Component,index:s.props.index,path:s.props.path,loader:s.props.loader,action:s.props.action,hydrateFallbackElement:s.props.hydrateFallbackElement,HydrateFallback:s.props.HydrateFallback,errorElement:s.props.errorElement,ErrorBoundary:s.props.ErrorBoundary,hasErrorBoundary:s.props.hasErrorBoundary===!0||s.props.ErrorBoundary!=null||s.props.errorElement!=null,shouldRevalidate:s.props.shouldRevalidate,handle:s.props.handle,lazy:s.props.lazy};s.props.children&&(d.children=W2(s.props.children,h)),u.push(d)}),u}var l1="get",u1="application/x-www-form-urlencoded";function y1(n){return n!=null&&typeof n.tagName=="string"}function L9(n){return y1(n)&&n.tagName.toLowerCase()==="button"}function j9(n){return y1(n)&&n.tagName.toLowerCase()==="form"}function V9(n){return y1(n)&&n.tagName.toLowerCase()==="input"}function Y9(n){return!!(n.metaKey||n.altKey||n.ctrlKey||n.shiftKey)}function P9(n,i){return n.button===0&&(!i||i==="_self")&&!Y9(n)}var e1=null;function X9(){if(e1===null)try{new FormData(document.createElement("form"),0),e1=!1}catch{e1=!0}return e1}var K9=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function Og(n){return n!=null&&!K9.has(n)?(ul(!1,`"${n}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${u1}"`),null):n}function F9(n,i){let u,s,c,h,d;if(j9(n)){let g=n.getAttribute("action");s=g?Xl(g,i):null,u=n.getAttribute("method")||l1,c=Og(n.getAttribute("enctype"))||u1,h=new FormData(n)}else if(L9(n)||V9(n)&&(n.type==="submit"||n.type==="image")){let g=n.form;if(g==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let v=n.getAttribute("formaction")||g.getAttribute("action");if(s=v?Xl(v,i):null,u=n.getAttribute("formmethod")||g.getAttribute("method")||l1,c=Og(n.getAttribute("formenctype"))||Og(g.getAttribute("enctype"))||u1,h=new FormData(g,n),!X9()){let{name:p,type:_,value:T}=n;if(_==="image"){let C=p?`${p}.`:"";h.append(`${C}x`,"0"),h.append(`${C}y`,"0")}else p&&h.append(p,T)}}else{if(y1(n))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');u=l1,s=null,c=u1,d=n}return h&&c==="text/plain"&&(d=h,h=void 0),{action:s,method:u.toLowerCase(),encType:c,formData:h,body:d}}function fm(n,i){if(n===!1||n===null||typeof n>"u")throw new Error(i)}async function k9(n,i){if(n.id in i)return i[n.id];try{let u=await import(n.module);return i[n.id]=u,u}catch(u){return console.error(`Error loading route module \`${n.module}\`, reloading page...`),console.error(u),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function Q9(n){return n==null?!1:n.href==null?n.rel==="preload"&&typeof n.imageSrcSet=="string"&&typeof n.imageSizes=="string":typeof n.rel=="string"&&typeof n.href=="string"}async function Z9(n,i,u){let s=await Promise.all(n.map(async c=>{let h=i.routes[c.route.id];if(h){let d=await k9(h,u);return d.links?d.links():[]}return[]}));return $9(s.flat(1).filter(Q9).filter(c=>c.rel==="stylesheet"||c.rel==="preload").map(c=>c.rel==="stylesheet"?{...c,rel:"prefetch",as:"style"}:{...c,rel:"prefetch"}))}function lb(n,i,u,s,c,h){let d=(v,p)=>u[p]?v.route.id!==u[p].route.id:!0,g=(v,p)=>{var _;return u[p].pathname!==v.pathname||((_=u[p].route.path)==null?void 0:_.endsWith("*"))&&u[p].params["*"]!==v.params["*"]};return h==="assets"?i.filter((v,p)=>d(v,p)||g(v,p)):h==="data"?i.filter((v,p)=>{var T;let _=s.routes[v.route.id];if(!_||!_.hasLoader)return!1;if(d(v,p)||g(v,p))return!0;if(v.route.shouldRevalidate){let C=v.route.shouldRevalidate({currentUrl:new URL(c.pathname+c.search+c.hash,window.origin),currentParams:((T=u[0])==null?void 0:T.params)||{},nextUrl:new URL(n,window.origin),nextParams:v.params,defaultShouldRevalidate:!0});if(typeof C=="boolean")return C}return!0}):[]}function J9(n,i,{includeHydrateFallback:u}={}){return W9(n.map(s=>{let c=i.routes[s.route.id];if(!c)return[];let h=[c.module];return c.clientActionModule&&(h=h.concat(c.clientActionModule)),c.clientLoaderModule&&(h=h.concat(c.clientLoaderModule)),u&&c.hydrateFallbackModule&&(h=h.concat(c.hydrateFallbackModule)),c.imports&&(h=h.concat(c.imports)),h}).flat(1))}function W9(n){return[...new Set(n)]}function I9(n){let i={},u=Object.keys(n).sort();for(let s of u)i[s]=n[s];return i}function $9(n,i){let u=new Set;return new Set(i),n.reduce((s,c)=>{let h=JSON.stringify(I9(c));return u.has(h)||(u.add(h),s.push({key:h,link:c})),s},[])}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var e7=new Set([100,101,204,205]);function t7(n,i){let u=typeof n=="string"?new URL(n,typeof window>"u"?"server://singlefetch/":window.location.origin):n;return u.pathname==="/"?u.pathname="_root.data":i&&Xl(u.pathname,i)==="/"?u.pathname=`${i.replace(/\/$/,"")}/_root.data`:u.pathname=`${u.pathname.replace(/\/$/,"")}.data`,u}function N_(){let n=ue.useContext(qc);return fm(n,"You must render this element inside a <DataRouterContext.Provider> element"),n}function a7(){let n=ue.useContext(m1);return fm(n,"You must render this element inside a <DataRouterStateContext.Provider> element"),n}var hm=ue.createContext(void 0);hm.displayName="FrameworkContext";function D_(){let n=ue.useContext(hm);return fm(n,"You must render this element inside a <HydratedRouter> element"),n}function n7(n,i){let u=ue.useContext(hm),[s,c]=ue.useState(!1),[h,d]=ue.useState(!1),{onFocus:g,onBlur:v,onMouseEnter:p,onMouseLeave:_,onTouchStart:T}=i,C=ue.useRef(null);ue.useEffect(()=>{if(n==="render"&&d(!0),n==="viewport"){let O=U=>{U.forEach(A=>{d(A.isIntersecting)})},w=new IntersectionObserver(O,{threshold:.5});return C.current&&w.observe(C.current),()=>{w.disconnect()}}},[n]),ue.useEffect(()=>{if(s){let O=setTimeout(()=>{d(!0)},100);return()=>{clearTimeout(O)}}},[s]);let x=()=>{c(!0)},E=()=>{c(!1),d(!1)};return u?n!=="intent"?[h,C,{}]:[h,C,{onFocus:hh(g,x),onBlur:hh(v,E),onMouseEnter:hh(p,x),onMouseLeave:hh(_,E),onTouchStart:hh(T,x)}]:[!1,C,{}]}function hh(n,i){return u=>{n&&n(u),u.defaultPrevented||i(u)}}function i7({page:n,...i}){let{router:u}=N_(),s=ue.useMemo(()=>__(u.routes,n,u.basename),[u.routes,n,u.basename]);return s?ue.createElement(l7,{page:n,matches:s,...i}):null}function r7(n){let{manifest:i,routeModules:u}=D_(),[s,c]=ue.useState([]);return ue.useEffect(()=>{let h=!1;return Z9(n,i,u).then(d=>{h||c(d)}),()=>{h=!0}},[n,i,u]),s}function l7({page:n,matches:i,...u}){let s=Qs(),{manifest:c,routeModules:h}=D_(),{basename:d}=N_(),{loaderData:g,matches:v}=a7(),p=ue.useMemo(()=>lb(n,i,v,c,s,"data"),[n,i,v,c,s]),_=ue.useMemo(()=>lb(n,i,v,c,s,"assets"),[n,i,v,c,s]),T=ue.useMemo(()=>{if(n===s.pathname+s.search+s.hash)return[];let E=new Set,O=!1;if(i.forEach(U=>{var R;let A=c.routes[U.route.id];!A||!A.hasLoader||(!p.some(z=>z.route.id===U.route.id)&&U.route.id in g&&((R=h[U.route.id])!=null&&R.shouldRevalidate)||A.hasClientLoader?O=!0:E.add(U.route.id))}),E.size===0)return[];let w=t7(n,d);return O&&E.size>0&&w.searchParams.set("_routes",i.filter(U=>E.has(U.route.id)).map(U=>U.route.id).join(",")),[w.pathname+w.search]},[d,g,s,c,p,i,n,h]),C=ue.useMemo(()=>J9(_,c),[_,c]),x=r7(_);return ue.createElement(ue.Fragment,null,T.map(E=>ue.createElement("link",{key:E,rel:"prefetch",as:"fetch",href:E,...u})),C.map(E=>ue.createElement("link",{key:E,rel:"modulepreload",href:E,...u})),x.map(({key:E,link:O})=>ue.createElement("link",{key:E,...O})))}function u7(...n){return i=>{n.forEach(u=>{typeof u=="function"?u(i):u!=null&&(u.current=i)})}}var z_=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{z_&&(window.__reactRouterVersion="7.6.0")}catch{}function s7({basename:n,children:i,window:u}){let s=ue.useRef();s.current==null&&(s.current=QS({window:u,v5Compat:!0}));let c=s.current,[h,d]=ue.useState({action:c.action,location:c.location}),g=ue.useCallback(v=>{ue.startTransition(()=>d(v))},[d]);return ue.useLayoutEffect(()=>c.listen(g),[c,g]),ue.createElement(H9,{basename:n,children:i,location:h.location,navigationType:h.action,navigator:c})}var U_=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,G_=ue.forwardRef(function({onClick:i,discover:u="render",prefetch:s="none",relative:c,reloadDocument:h,replace:d,state:g,target:v,to:p,preventScrollReset:_,viewTransition:T,...C},x){let{basename:E}=ue.useContext(sl),O=typeof p=="string"&&U_.test(p),w,U=!1;if(typeof p=="string"&&O&&(w=p,z_))try{let Y=new URL(window.location.href),V=p.startsWith("//")?new URL(Y.protocol+p):new URL(p),F=Xl(V.pathname,E);V.origin===Y.origin&&F!=null?p=F+V.search+V.hash:U=!0}catch{ul(!1,`<Link to="${p}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let A=S9(p,{relative:c}),[R,z,G]=n7(s,C),B=h7(p,{replace:d,state:g,target:v,preventScrollReset:_,relative:c,viewTransition:T});function Q(Y){i&&i(Y),Y.defaultPrevented||B(Y)}let X=ue.createElement("a",{...C,...G,href:w||A,onClick:U||h?i:Q,ref:u7(x,z),target:v,"data-discover":!O&&u==="render"?"true":void 0});return R&&!O?ue.createElement(ue.Fragment,null,X,ue.createElement(i7,{page:A})):X});G_.displayName="Link";var o7=ue.forwardRef(function({"aria-current":i="page",caseSensitive:u=!1,className:s="",end:c=!1,style:h,to:d,viewTransition:g,children:v,...p},_){let T=md(d,{relative:p.relative}),C=Qs(),x=ue.useContext(m1),{navigator:E,basename:O}=ue.useContext(sl),w=x!=null&&m7(T)&&g===!0,U=E.encodeLocation?E.encodeLocation(T).pathname:T.pathname,A=C.pathname,R=x&&x.navigation&&x.navigation.location?x.navigation.location.pathname:null;u||(A=A.toLowerCase(),R=R?R.toLowerCase():null,U=U.toLowerCase()),R&&O&&(R=Xl(R,O)||R);const z=U!=="/"&&U.endsWith("/")?U.length-1:U.length;let G=A===U||!c&&A.startsWith(U)&&A.charAt(z)==="/",B=R!=null&&(R===U||!c&&R.startsWith(U)&&R.charAt(U.length)==="/"),Q={isActive:G,isPending:B,isTransitioning:w},X=G?i:void 0,Y;typeof s=="function"?Y=s(Q):Y=[s,G?"active":null,B?"pending":null,w?"transitioning":null].filter(Boolean).join(" ");let V=typeof h=="function"?h(Q):h;return ue.createElement(G_,{...p,"aria-current":X,className:Y,ref:_,style:V,to:d,viewTransition:g},typeof v=="function"?v(Q):v)});o7.displayName="NavLink";var c7=ue.forwardRef(({discover:n="render",fetcherKey:i,navigate:u,reloadDocument:s,replace:c,state:h,method:d=l1,action:g,onSubmit:v,relative:p,preventScrollReset:_,viewTransition:T,...C},x)=>{let E=p7(),O=v7(g,{relative:p}),w=d.toLowerCase()==="get"?"get":"post",U=typeof g=="string"&&U_.test(g),A=R=>{if(v&&v(R),R.defaultPrevented)return;R.preventDefault();let z=R.nativeEvent.submitter,G=(z==null?void 0:z.getAttribute("formmethod"))||d;E(z||R.currentTarget,{fetcherKey:i,method:G,navigate:u,replace:c,state:h,relative:p,preventScrollReset:_,viewTransition:T})};return ue.createElement("form",{ref:x,method:w,action:O,onSubmit:s?v:A,...C,"data-discover":!U&&n==="render"?"true":void 0})});c7.displayName="Form";function f7(n){return`${n} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function q_(n){let i=ue.useContext(qc);return va(i,f7(n)),i}function h7(n,{target:i,replace:u,state:s,preventScrollReset:c,relative:h,viewTransition:d}={}){let g=sm(),v=Qs(),p=md(n,{relative:h});return ue.useCallback(_=>{if(P9(_,i)){_.preventDefault();let T=u!==void 0?u:hd(v)===hd(p);g(n,{replace:T,state:s,preventScrollReset:c,relative:h,viewTransition:d})}},[v,g,p,u,s,i,n,c,h,d])}var d7=0,g7=()=>`__${String(++d7)}__`;function p7(){let{router:n}=q_("useSubmit"),{basename:i}=ue.useContext(sl),u=z9();return ue.useCallback(async(s,c={})=>{let{action:h,method:d,encType:g,formData:v,body:p}=F9(s,i);if(c.navigate===!1){let _=c.fetcherKey||g7();await n.fetch(_,u,c.action||h,{preventScrollReset:c.preventScrollReset,formData:v,body:p,formMethod:c.method||d,formEncType:c.encType||g,flushSync:c.flushSync})}else await n.navigate(c.action||h,{preventScrollReset:c.preventScrollReset,formData:v,body:p,formMethod:c.method||d,formEncType:c.encType||g,replace:c.replace,state:c.state,fromRouteId:u,flushSync:c.flushSync,viewTransition:c.viewTransition})},[n,i,u])}function v7(n,{relative:i}={}){let{basename:u}=ue.useContext(sl),s=ue.useContext(ol);va(s,"useFormAction must be used inside a RouteContext");let[c]=s.matches.slice(-1),h={...md(n||".",{relative:i})},d=Qs();if(n==null){h.search=d.search;let g=new URLSearchParams(h.search),v=g.getAll("index");if(v.some(_=>_==="")){g.delete("index"),v.filter(T=>T).forEach(T=>g.append("index",T));let _=g.toString();h.search=_?`?${_}`:""}}return(!n||n===".")&&c.route.index&&(h.search=h.search?h.search.replace(/^\?/,"?index&"):"?index"),u!=="/"&&(h.pathname=h.pathname==="/"?u:Pl([u,h.pathname])),hd(h)}function m7(n,i={}){let u=ue.useContext(A_);va(u!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:s}=q_("useViewTransitionState"),c=md(n,{relative:i.relative});if(!u.isTransitioning)return!1;let h=Xl(u.currentLocation.pathname,s)||u.currentLocation.pathname,d=Xl(u.nextLocation.pathname,s)||u.nextLocation.pathname;return o1(c.pathname,d)!=null||o1(c.pathname,h)!=null}[...e7];const ub=({variant:n="primary",size:i="md",loading:u=!1,children:s,leftIcon:c,rightIcon:h,disabled:d,className:g="",...v})=>{const p=`
-    inline-flex items-center justify-center font-medium rounded-lg 
-    transition-all duration-200 ease-in-out focus:outline-none focus:ring-2 
-    focus:ring-offset-2 disabled:opacity-50 disabled:cursor-not-allowed
-    active:scale-95 transform
-  `,_={primary:"bg-blue-600 text-white hover:bg-blue-700 focus:ring-blue-500 shadow-md hover:shadow-lg",secondary:"bg-white text-gray-700 border border-gray-300 hover:bg-gray-50 focus:ring-blue-500 shadow-sm hover:shadow-md",ghost:"bg-transparent text-gray-600 hover:bg-gray-100 border-0 shadow-none",danger:"bg-red-600 text-white hover:bg-red-700 focus:ring-red-500 shadow-md hover:shadow-lg"},T={sm:"px-3 py-2 text-xs",md:"px-6 py-3 text-sm",lg:"px-8 py-4 text-base"},C=d||u;return he.jsx("button",{className:`${p} ${_[n]} ${T[i]} ${g}`.trim(),disabled:C,...v,children:u?he.jsxs(he.Fragment,{children:[he.jsx("span",{className:"spinner mr-2"}),typeof s=="string"?"Loading...":s]}):he.jsxs(he.Fragment,{children:[c&&he.jsx("span",{className:"mr-2",children:c}),s,h&&he.jsx("span",{className:"ml-2",children:h})]})})},y7=({label:n,error:i,helper:u,leftIcon:s,rightIcon:c,className:h="",containerClassName:d="",id:g,...v})=>{const p=g||`input-${Math.random().toString(36).substr(2,9)}`,_=`
-    w-full px-4 py-3 text-sm border border-gray-300 rounded-lg
-    focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent
-    transition-all duration-200 ease-in-out placeholder-gray-400
-    bg-white shadow-sm
-    ${s?"pl-10":""}
-    ${c?"pr-10":""}
-    ${i?"border-red-300 focus:ring-red-500 focus:border-red-500":""}
-    ${h}
-  `.trim();return he.jsxs("div",{className:d,children:[n&&he.jsx("label",{htmlFor:p,className:"block text-sm font-medium text-gray-700 mb-2",children:n}),he.jsxs("div",{className:"relative",children:[s&&he.jsx("div",{className:"absolute inset-y-0 left-0 pl-3 flex items-center pointer-events-none",children:he.jsx("span",{className:"text-gray-400",children:s})}),he.jsx("input",{id:p,className:_,...v}),c&&he.jsx("div",{className:"absolute inset-y-0 right-0 pr-3 flex items-center pointer-events-none",children:he.jsx("span",{className:"text-gray-400",children:c})})]}),i&&he.jsxs("p",{className:"mt-2 text-sm text-red-600 flex items-center",children:[he.jsx("svg",{className:"w-4 h-4 mr-1",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M12 8v4m0 4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"})}),i]}),u&&!i&&he.jsx("p",{className:"mt-2 text-sm text-gray-500",children:u})]})},b7=({children:n,className:i="",padding:u="md",shadow:s="lg"})=>{const c={none:"",sm:"p-4",md:"p-6",lg:"p-8"},h={none:"",sm:"shadow-sm",md:"shadow-md",lg:"shadow-lg",xl:"shadow-xl"},d=`
-    bg-white rounded-xl border border-gray-200 backdrop-blur-sm
-    ${c[u]}
-    ${h[s]}
-    ${i}
-  `.trim();return he.jsx("div",{className:d,children:n})},_7=()=>{const n=sm(),[i,u]=ue.useState(""),[s,c]=ue.useState(!1),[h,d]=ue.useState(""),g=async()=>{c(!0),d("");try{const x=await fetch("/api/create_game",{method:"POST",headers:{"Content-Type":"application/json"}});if(!x.ok){const O=await x.json().catch(()=>({message:"Failed to create game. Server returned an error."}));throw new Error(O.message||`HTTP error! status: ${x.status}`)}const E=await x.json();if(E.game_id)n(`/game/${E.game_id}`);else throw new Error("Failed to create game: No game_id received from server.")}catch(x){console.error("Error creating game:",x),d(x instanceof Error?x.message:String(x))}finally{c(!1)}},v=()=>{d(""),i.trim()!==""?n(`/game/${i.trim()}`):d("Please enter a Game ID to join.")},p=x=>{x.key==="Enter"&&v()},_=he.jsx("svg",{className:"w-4 h-4",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M13 10V3L4 14h7v7l9-11h-7z"})}),T=he.jsx("svg",{className:"w-4 h-4",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"})}),C=he.jsx("svg",{className:"w-5 h-5",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11 4a2 2 0 114 0v1a1 1 0 001 1h3a1 1 0 011 1v3a1 1 0 01-1 1h-1a2 2 0 100 4h1a1 1 0 011 1v3a1 1 0 01-1 1h-3a1 1 0 01-1-1v-1a2 2 0 10-4 0v1a1 1 0 01-1 1H7a1 1 0 01-1-1v-3a1 1 0 011-1h1a2 2 0 100-4H7a1 1 0 01-1-1V7a1 1 0 011-1h3a1 1 0 001-1V4z"})});return he.jsxs("div",{className:"min-h-screen flex items-center justify-center px-4 py-8",children:[he.jsxs("div",{className:"absolute inset-0 overflow-hidden pointer-events-none",children:[he.jsx("div",{className:"absolute -top-4 -right-4 w-72 h-72 bg-blue-100 rounded-full mix-blend-multiply blur-xl opacity-70 animate-pulse-subtle"}),he.jsx("div",{className:"absolute -bottom-8 -left-4 w-72 h-72 bg-green-100 rounded-full mix-blend-multiply blur-xl opacity-70 animate-pulse-subtle",style:{animationDelay:"1s"}}),he.jsx("div",{className:"absolute top-1/2 left-1/2 transform -translate-x-1/2 -translate-y-1/2 w-72 h-72 bg-yellow-100 rounded-full mix-blend-multiply blur-xl opacity-70 animate-pulse-subtle",style:{animationDelay:"2s"}})]}),he.jsxs("div",{className:"relative z-10 w-full max-w-md",children:[he.jsxs(b7,{className:"animate-fade-in",padding:"lg",children:[he.jsxs("div",{className:"text-center mb-8",children:[he.jsx("div",{className:"mb-4",children:he.jsx("div",{className:"w-16 h-16 bg-gradient-to-br from-blue-500 to-green-500 rounded-2xl mx-auto flex items-center justify-center shadow-lg",children:he.jsx("svg",{className:"w-8 h-8 text-white",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M15.232 5.232l3.536 3.536m-2.036-5.036a2.5 2.5 0 113.536 3.536L6.5 21.036H3v-3.572L16.732 3.732z"})})})}),he.jsx("h1",{className:"text-3xl md:text-4xl lg:text-5xl font-bold text-gray-900 leading-tight mb-2 bg-gradient-to-r from-blue-600 to-green-600 bg-clip-text text-transparent",children:"Sketch Codes"}),he.jsx("p",{className:"text-lg md:text-xl text-gray-600 leading-relaxed",children:"Draw, guess, and have fun with friends"})]}),h&&he.jsx("div",{className:"mb-6 p-4 bg-red-50 border border-red-200 rounded-lg animate-slide-in",children:he.jsxs("div",{className:"flex items-center",children:[he.jsx("svg",{className:"w-5 h-5 text-red-500 mr-2",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M12 8v4m0 4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"})}),he.jsx("p",{className:"text-sm text-red-700",children:h})]})}),he.jsxs("div",{className:"mb-8",children:[he.jsxs("h2",{className:"text-lg font-semibold text-gray-800 mb-4 flex items-center",children:[he.jsx("svg",{className:"w-5 h-5 text-green-500 mr-2",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M12 6v6m0 0v6m0-6h6m-6 0H6"})}),"Start a New Game"]}),he.jsx(ub,{onClick:g,loading:s,leftIcon:_,className:"w-full",children:"Create New Game"})]}),he.jsxs("div",{className:"relative mb-8",children:[he.jsx("div",{className:"absolute inset-0 flex items-center",children:he.jsx("div",{className:"w-full border-t border-gray-200"})}),he.jsx("div",{className:"relative flex justify-center text-sm",children:he.jsx("span",{className:"px-4 bg-white text-gray-500 font-medium",children:"or"})})]}),he.jsxs("div",{children:[he.jsxs("h2",{className:"text-lg font-semibold text-gray-800 mb-4 flex items-center",children:[he.jsx("svg",{className:"w-5 h-5 text-blue-500 mr-2",fill:"none",stroke:"currentColor",viewBox:"0 0 24 24",children:he.jsx("path",{strokeLinecap:"round",strokeLinejoin:"round",strokeWidth:2,d:"M11 16l-4-4m0 0l4-4m-4 4h14m-5 4v1a3 3 0 01-3 3H6a3 3 0 01-3-3V7a3 3 0 013-3h7a3 3 0 013 3v1"})}),"Join Existing Game"]}),he.jsxs("div",{className:"space-y-4",children:[he.jsx(y7,{label:"Game ID",value:i,onChange:x=>u(x.target.value),onKeyPress:p,placeholder:"Enter your game ID",leftIcon:C,error:h&&!s?h:void 0}),he.jsx(ub,{onClick:v,variant:"secondary",leftIcon:T,disabled:!i.trim(),className:"w-full",children:"Join Game"})]})]})]}),he.jsx("div",{className:"text-center mt-6 animate-fade-in",style:{animationDelay:"0.2s"},children:he.jsx("p",{className:"text-sm text-gray-500",children:"Connect with friends and unleash your creativity"})})]})]})};var In={},cc={},Mg,sb;function H_(){if(sb)return Mg;sb=1;var n=typeof Uc=="object"&&Uc&&Uc.Object===Object&&Uc;return Mg=n,Mg}var wg,ob;function cl(){if(ob)return wg;ob=1;var n=H_(),i=typeof self=="object"&&self&&self.Object===Object&&self,u=n||i||Function("return this")();return wg=u,wg}var Ng,cb;function yd(){if(cb)return Ng;cb=1;var n=cl(),i=n.Symbol;return Ng=i,Ng}var Dg,fb;function S7(){if(fb)return Dg;fb=1;var n=yd(),i=Object.prototype,u=i.hasOwnProperty,s=i.toString,c=n?n.toStringTag:void 0;function h(d){var g=u.call(d,c),v=d[c];try{d[c]=void 0;var p=!0}catch{}var _=s.call(d);return p&&(g?d[c]=v:delete d[c]),_}return Dg=h,Dg}var zg,hb;function x7(){if(hb)return zg;hb=1;var n=Object.prototype,i=n.toString;function u(s){return i.call(s)}return zg=u,zg}var Ug,db;function Zs(){if(db)return Ug;db=1;var n=yd(),i=S7(),u=x7(),s="[object Null]",c="[object Undefined]",h=n?n.toStringTag:void 0;function d(g){return g==null?g===void 0?c:s:h&&h in Object(g)?i(g):u(g)}return Ug=d,Ug}var Gg,gb;function mr(){if(gb)return Gg;gb=1;var n=Array.isArray;return Gg=n,Gg}var qg,pb;function Kl(){if(pb)return qg;pb=1;function n(i){return i!=null&&typeof i=="object"}return qg=n,qg}var Hg,vb;function E7(){if(vb)return Hg;vb=1;var n=Zs(),i=mr(),u=Kl(),s="[object String]";function c(h){return typeof h=="string"||!i(h)&&u(h)&&n(h)==s}return Hg=c,Hg}var Bg,mb;function C7(){if(mb)return Bg;mb=1;function n(i){return function(u,s,c){for(var h=-1,d=Object(u),g=c(u),v=g.length;v--;){var p=g[i?v:++h];if(s(d[p],p,d)===!1)break}return u}}return Bg=n,Bg}var Lg,yb;function T7(){if(yb)return Lg;yb=1;var n=C7(),i=n();return Lg=i,Lg}var jg,bb;function A7(){if(bb)return jg;bb=1;function n(i,u){for(var s=-1,c=Array(i);++s<i;)c[s]=u(s);return c}return jg=n,jg}var Vg,_b;function R7(){if(_b)return Vg;_b=1;var n=Zs(),i=Kl(),u="[object Arguments]";function s(c){return i(c)&&n(c)==u}return Vg=s,Vg}var Yg,Sb;function B_(){if(Sb)return Yg;Sb=1;var n=R7(),i=Kl(),u=Object.prototype,s=u.hasOwnProperty,c=u.propertyIsEnumerable,h=n(function(){return arguments}())?n:function(d){return i(d)&&s.call(d,"callee")&&!c.call(d,"callee")};return Yg=h,Yg}var id={exports:{}},Pg,xb;function O7(){if(xb)return Pg;xb=1;function n(){return!1}return Pg=n,Pg}id.exports;var Eb;function dm(){return Eb||(Eb=1,function(n,i){var u=cl(),s=O7(),c=i&&!i.nodeType&&i,h=c&&!0&&n&&!n.nodeType&&n,d=h&&h.exports===c,g=d?u.Buffer:void 0,v=g?g.isBuffer:void 0,p=v||s;n.exports=p}(id,id.exports)),id.exports}var Xg,Cb;function L_(){if(Cb)return Xg;Cb=1;var n=9007199254740991,i=/^(?:0|[1-9]\d*)$/;function u(s,c){var h=typeof s;return c=c??n,!!c&&(h=="number"||h!="symbol"&&i.test(s))&&s>-1&&s%1==0&&s<c}return Xg=u,Xg}var Kg,Tb;function gm(){if(Tb)return Kg;Tb=1;var n=9007199254740991;function i(u){return typeof u=="number"&&u>-1&&u%1==0&&u<=n}return Kg=i,Kg}var Fg,Ab;function M7(){if(Ab)return Fg;Ab=1;var n=Zs(),i=gm(),u=Kl(),s="[object Arguments]",c="[object Array]",h="[object Boolean]",d="[object Date]",g="[object Error]",v="[object Function]",p="[object Map]",_="[object Number]",T="[object Object]",C="[object RegExp]",x="[object Set]",E="[object String]",O="[object WeakMap]",w="[object ArrayBuffer]",U="[object DataView]",A="[object Float32Array]",R="[object Float64Array]",z="[object Int8Array]",G="[object Int16Array]",B="[object Int32Array]",Q="[object Uint8Array]",X="[object Uint8ClampedArray]",Y="[object Uint16Array]",V="[object Uint32Array]",F={};F[A]=F[R]=F[z]=F[G]=F[B]=F[Q]=F[X]=F[Y]=F[V]=!0,F[s]=F[c]=F[w]=F[h]=F[U]=F[d]=F[g]=F[v]=F[p]=F[_]=F[T]=F[C]=F[x]=F[E]=F[O]=!1;function I(D){return u(D)&&i(D.length)&&!!F[n(D)]}return Fg=I,Fg}var kg,Rb;function pm(){if(Rb)return kg;Rb=1;function n(i){return function(u){return i(u)}}return kg=n,kg}var rd={exports:{}};rd.exports;var Ob;function vm(){return Ob||(Ob=1,function(n,i){var u=H_(),s=i&&!i.nodeType&&i,c=s&&!0&&n&&!n.nodeType&&n,h=c&&c.exports===s,d=h&&u.process,g=function(){try{var v=c&&c.require&&c.require("util").types;return v||d&&d.binding&&d.binding("util")}catch{}}();n.exports=g}(rd,rd.exports)),rd.exports}var Qg,Mb;function j_(){if(Mb)return Qg;Mb=1;var n=M7(),i=pm(),u=vm(),s=u&&u.isTypedArray,c=s?i(s):n;return Qg=c,Qg}var Zg,wb;function V_(){if(wb)return Zg;wb=1;var n=A7(),i=B_(),u=mr(),s=dm(),c=L_(),h=j_(),d=Object.prototype,g=d.hasOwnProperty;function v(p,_){var T=u(p),C=!T&&i(p),x=!T&&!C&&s(p),E=!T&&!C&&!x&&h(p),O=T||C||x||E,w=O?n(p.length,String):[],U=w.length;for(var A in p)(_||g.call(p,A))&&!(O&&(A=="length"||x&&(A=="offset"||A=="parent")||E&&(A=="buffer"||A=="byteLength"||A=="byteOffset")||c(A,U)))&&w.push(A);return w}return Zg=v,Zg}var Jg,Nb;function mm(){if(Nb)return Jg;Nb=1;var n=Object.prototype;function i(u){var s=u&&u.constructor,c=typeof s=="function"&&s.prototype||n;return u===c}return Jg=i,Jg}var Wg,Db;function Y_(){if(Db)return Wg;Db=1;function n(i,u){return function(s){return i(u(s))}}return Wg=n,Wg}var Ig,zb;function w7(){if(zb)return Ig;zb=1;var n=Y_(),i=n(Object.keys,Object);return Ig=i,Ig}var $g,Ub;function N7(){if(Ub)return $g;Ub=1;var n=mm(),i=w7(),u=Object.prototype,s=u.hasOwnProperty;function c(h){if(!n(h))return i(h);var d=[];for(var g in Object(h))s.call(h,g)&&g!="constructor"&&d.push(g);return d}return $g=c,$g}var ep,Gb;function Hc(){if(Gb)return ep;Gb=1;function n(i){var u=typeof i;return i!=null&&(u=="object"||u=="function")}return ep=n,ep}var tp,qb;function P_(){if(qb)return tp;qb=1;var n=Zs(),i=Hc(),u="[object AsyncFunction]",s="[object Function]",c="[object GeneratorFunction]",h="[object Proxy]";function d(g){if(!i(g))return!1;var v=n(g);return v==s||v==c||v==u||v==h}return tp=d,tp}var ap,Hb;function b1(){if(Hb)return ap;Hb=1;var n=P_(),i=gm();function u(s){return s!=null&&i(s.length)&&!n(s)}return ap=u,ap}var np,Bb;function bd(){if(Bb)return np;Bb=1;var n=V_(),i=N7(),u=b1();function s(c){return u(c)?n(c):i(c)}return np=s,np}var ip,Lb;function X_(){if(Lb)return ip;Lb=1;var n=T7(),i=bd();function u(s,c){return s&&n(s,c,i)}return ip=u,ip}var rp,jb;function K_(){if(jb)return rp;jb=1;function n(i){return i}return rp=n,rp}var lp,Vb;function D7(){if(Vb)return lp;Vb=1;var n=K_();function i(u){return typeof u=="function"?u:n}return lp=i,lp}var up,Yb;function ym(){if(Yb)return up;Yb=1;var n=X_(),i=D7();function u(s,c){return s&&n(s,i(c))}return up=u,up}var sp,Pb;function bm(){if(Pb)return sp;Pb=1;var n=Y_(),i=n(Object.getPrototypeOf,Object);return sp=i,sp}var op,Xb;function z7(){if(Xb)return op;Xb=1;var n=Zs(),i=bm(),u=Kl(),s="[object Object]",c=Function.prototype,h=Object.prototype,d=c.toString,g=h.hasOwnProperty,v=d.call(Object);function p(_){if(!u(_)||n(_)!=s)return!1;var T=i(_);if(T===null)return!0;var C=g.call(T,"constructor")&&T.constructor;return typeof C=="function"&&C instanceof C&&d.call(C)==v}return op=p,op}var cp,Kb;function F_(){if(Kb)return cp;Kb=1;function n(i,u){for(var s=-1,c=i==null?0:i.length,h=Array(c);++s<c;)h[s]=u(i[s],s,i);return h}return cp=n,cp}var fp,Fb;function U7(){if(Fb)return fp;Fb=1;function n(){this.__data__=[],this.size=0}return fp=n,fp}var hp,kb;function _m(){if(kb)return hp;kb=1;function n(i,u){return i===u||i!==i&&u!==u}return hp=n,hp}var dp,Qb;function _1(){if(Qb)return dp;Qb=1;var n=_m();function i(u,s){for(var c=u.length;c--;)if(n(u[c][0],s))return c;return-1}return dp=i,dp}var gp,Zb;function G7(){if(Zb)return gp;Zb=1;var n=_1(),i=Array.prototype,u=i.splice;function s(c){var h=this.__data__,d=n(h,c);if(d<0)return!1;var g=h.length-1;return d==g?h.pop():u.call(h,d,1),--this.size,!0}return gp=s,gp}var pp,Jb;function q7(){if(Jb)return pp;Jb=1;var n=_1();function i(u){var s=this.__data__,c=n(s,u);return c<0?void 0:s[c][1]}return pp=i,pp}var vp,Wb;function H7(){if(Wb)return vp;Wb=1;var n=_1();function i(u){return n(this.__data__,u)>-1}return vp=i,vp}var mp,Ib;function B7(){if(Ib)return mp;Ib=1;var n=_1();function i(u,s){var c=this.__data__,h=n(c,u);return h<0?(++this.size,c.push([u,s])):c[h][1]=s,this}return mp=i,mp}var yp,$b;function S1(){if($b)return yp;$b=1;var n=U7(),i=G7(),u=q7(),s=H7(),c=B7();function h(d){var g=-1,v=d==null?0:d.length;for(this.clear();++g<v;){var p=d[g];this.set(p[0],p[1])}}return h.prototype.clear=n,h.prototype.delete=i,h.prototype.get=u,h.prototype.has=s,h.prototype.set=c,yp=h,yp}var bp,e3;function L7(){if(e3)return bp;e3=1;var n=S1();function i(){this.__data__=new n,this.size=0}return bp=i,bp}var _p,t3;function j7(){if(t3)return _p;t3=1;function n(i){var u=this.__data__,s=u.delete(i);return this.size=u.size,s}return _p=n,_p}var Sp,a3;function V7(){if(a3)return Sp;a3=1;function n(i){return this.__data__.get(i)}return Sp=n,Sp}var xp,n3;function Y7(){if(n3)return xp;n3=1;function n(i){return this.__data__.has(i)}return xp=n,xp}var Ep,i3;function P7(){if(i3)return Ep;i3=1;var n=cl(),i=n["__core-js_shared__"];return Ep=i,Ep}var Cp,r3;function X7(){if(r3)return Cp;r3=1;var n=P7(),i=function(){var s=/[^.]+$/.exec(n&&n.keys&&n.keys.IE_PROTO||"");return s?"Symbol(src)_1."+s:""}();function u(s){return!!i&&i in s}return Cp=u,Cp}var Tp,l3;function k_(){if(l3)return Tp;l3=1;var n=Function.prototype,i=n.toString;function u(s){if(s!=null){try{return i.call(s)}catch{}try{return s+""}catch{}}return""}return Tp=u,Tp}var Ap,u3;function K7(){if(u3)return Ap;u3=1;var n=P_(),i=X7(),u=Hc(),s=k_(),c=/[\\^$.*+?()[\]{}|]/g,h=/^\[object .+?Constructor\]$/,d=Function.prototype,g=Object.prototype,v=d.toString,p=g.hasOwnProperty,_=RegExp("^"+v.call(p).replace(c,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");function T(C){if(!u(C)||i(C))return!1;var x=n(C)?_:h;return x.test(s(C))}return Ap=T,Ap}var Rp,s3;function F7(){if(s3)return Rp;s3=1;function n(i,u){return i==null?void 0:i[u]}return Rp=n,Rp}var Op,o3;function Js(){if(o3)return Op;o3=1;var n=K7(),i=F7();function u(s,c){var h=i(s,c);return n(h)?h:void 0}return Op=u,Op}var Mp,c3;function Sm(){if(c3)return Mp;c3=1;var n=Js(),i=cl(),u=n(i,"Map");return Mp=u,Mp}var wp,f3;function x1(){if(f3)return wp;f3=1;var n=Js(),i=n(Object,"create");return wp=i,wp}var Np,h3;function k7(){if(h3)return Np;h3=1;var n=x1();function i(){this.__data__=n?n(null):{},this.size=0}return Np=i,Np}var Dp,d3;function Q7(){if(d3)return Dp;d3=1;function n(i){var u=this.has(i)&&delete this.__data__[i];return this.size-=u?1:0,u}return Dp=n,Dp}var zp,g3;function Z7(){if(g3)return zp;g3=1;var n=x1(),i="__lodash_hash_undefined__",u=Object.prototype,s=u.hasOwnProperty;function c(h){var d=this.__data__;if(n){var g=d[h];return g===i?void 0:g}return s.call(d,h)?d[h]:void 0}return zp=c,zp}var Up,p3;function J7(){if(p3)return Up;p3=1;var n=x1(),i=Object.prototype,u=i.hasOwnProperty;function s(c){var h=this.__data__;return n?h[c]!==void 0:u.call(h,c)}return Up=s,Up}var Gp,v3;function W7(){if(v3)return Gp;v3=1;var n=x1(),i="__lodash_hash_undefined__";function u(s,c){var h=this.__data__;return this.size+=this.has(s)?0:1,h[s]=n&&c===void 0?i:c,this}return Gp=u,Gp}var qp,m3;function I7(){if(m3)return qp;m3=1;var n=k7(),i=Q7(),u=Z7(),s=J7(),c=W7();function h(d){var g=-1,v=d==null?0:d.length;for(this.clear();++g<v;){var p=d[g];this.set(p[0],p[1])}}return h.prototype.clear=n,h.prototype.delete=i,h.prototype.get=u,h.prototype.has=s,h.prototype.set=c,qp=h,qp}var Hp,y3;function $7(){if(y3)return Hp;y3=1;var n=I7(),i=S1(),u=Sm();function s(){this.size=0,this.__data__={hash:new n,map:new(u||i),string:new n}}return Hp=s,Hp}var Bp,b3;function ex(){if(b3)return Bp;b3=1;function n(i){var u=typeof i;return u=="string"||u=="number"||u=="symbol"||u=="boolean"?i!=="__proto__":i===null}return Bp=n,Bp}var Lp,_3;function E1(){if(_3)return Lp;_3=1;var n=ex();function i(u,s){var c=u.__data__;return n(s)?c[typeof s=="string"?"string":"hash"]:c.map}return Lp=i,Lp}var jp,S3;function tx(){if(S3)return jp;S3=1;var n=E1();function i(u){var s=n(this,u).delete(u);return this.size-=s?1:0,s}return jp=i,jp}var Vp,x3;function ax(){if(x3)return Vp;x3=1;var n=E1();function i(u){return n(this,u).get(u)}return Vp=i,Vp}var Yp,E3;function nx(){if(E3)return Yp;E3=1;var n=E1();function i(u){return n(this,u).has(u)}return Yp=i,Yp}var Pp,C3;function ix(){if(C3)return Pp;C3=1;var n=E1();function i(u,s){var c=n(this,u),h=c.size;return c.set(u,s),this.size+=c.size==h?0:1,this}return Pp=i,Pp}var Xp,T3;function xm(){if(T3)return Xp;T3=1;var n=$7(),i=tx(),u=ax(),s=nx(),c=ix();function h(d){var g=-1,v=d==null?0:d.length;for(this.clear();++g<v;){var p=d[g];this.set(p[0],p[1])}}return h.prototype.clear=n,h.prototype.delete=i,h.prototype.get=u,h.prototype.has=s,h.prototype.set=c,Xp=h,Xp}var Kp,A3;function rx(){if(A3)return Kp;A3=1;var n=S1(),i=Sm(),u=xm(),s=200;function c(h,d){var g=this.__data__;if(g instanceof n){var v=g.__data__;if(!i||v.length<s-1)return v.push([h,d]),this.size=++g.size,this;g=this.__data__=new u(v)}return g.set(h,d),this.size=g.size,this}return Kp=c,Kp}var Fp,R3;function Em(){if(R3)return Fp;R3=1;var n=S1(),i=L7(),u=j7(),s=V7(),c=Y7(),h=rx();function d(g){var v=this.__data__=new n(g);this.size=v.size}return d.prototype.clear=i,d.prototype.delete=u,d.prototype.get=s,d.prototype.has=c,d.prototype.set=h,Fp=d,Fp}var kp,O3;function lx(){if(O3)return kp;O3=1;var n="__lodash_hash_undefined__";function i(u){return this.__data__.set(u,n),this}return kp=i,kp}var Qp,M3;function ux(){if(M3)return Qp;M3=1;function n(i){return this.__data__.has(i)}return Qp=n,Qp}var Zp,w3;function sx(){if(w3)return Zp;w3=1;var n=xm(),i=lx(),u=ux();function s(c){var h=-1,d=c==null?0:c.length;for(this.__data__=new n;++h<d;)this.add(c[h])}return s.prototype.add=s.prototype.push=i,s.prototype.has=u,Zp=s,Zp}var Jp,N3;function ox(){if(N3)return Jp;N3=1;function n(i,u){for(var s=-1,c=i==null?0:i.length;++s<c;)if(u(i[s],s,i))return!0;return!1}return Jp=n,Jp}var Wp,D3;function cx(){if(D3)return Wp;D3=1;function n(i,u){return i.has(u)}return Wp=n,Wp}var Ip,z3;function Q_(){if(z3)return Ip;z3=1;var n=sx(),i=ox(),u=cx(),s=1,c=2;function h(d,g,v,p,_,T){var C=v&s,x=d.length,E=g.length;if(x!=E&&!(C&&E>x))return!1;var O=T.get(d),w=T.get(g);if(O&&w)return O==g&&w==d;var U=-1,A=!0,R=v&c?new n:void 0;for(T.set(d,g),T.set(g,d);++U<x;){var z=d[U],G=g[U];if(p)var B=C?p(G,z,U,g,d,T):p(z,G,U,d,g,T);if(B!==void 0){if(B)continue;A=!1;break}if(R){if(!i(g,function(Q,X){if(!u(R,X)&&(z===Q||_(z,Q,v,p,T)))return R.push(X)})){A=!1;break}}else if(!(z===G||_(z,G,v,p,T))){A=!1;break}}return T.delete(d),T.delete(g),A}return Ip=h,Ip}var $p,U3;function Z_(){if(U3)return $p;U3=1;var n=cl(),i=n.Uint8Array;return $p=i,$p}var ev,G3;function fx(){if(G3)return ev;G3=1;function n(i){var u=-1,s=Array(i.size);return i.forEach(function(c,h){s[++u]=[h,c]}),s}return ev=n,ev}var tv,q3;function hx(){if(q3)return tv;q3=1;function n(i){var u=-1,s=Array(i.size);return i.forEach(function(c){s[++u]=c}),s}return tv=n,tv}var av,H3;function dx(){if(H3)return av;H3=1;var n=yd(),i=Z_(),u=_m(),s=Q_(),c=fx(),h=hx(),d=1,g=2,v="[object Boolean]",p="[object Date]",_="[object Error]",T="[object Map]",C="[object Number]",x="[object RegExp]",E="[object Set]",O="[object String]",w="[object Symbol]",U="[object ArrayBuffer]",A="[object DataView]",R=n?n.prototype:void 0,z=R?R.valueOf:void 0;function G(B,Q,X,Y,V,F,I){switch(X){case A:if(B.byteLength!=Q.byteLength||B.byteOffset!=Q.byteOffset)return!1;B=B.buffer,Q=Q.buffer;case U:return!(B.byteLength!=Q.byteLength||!F(new i(B),new i(Q)));case v:case p:case C:return u(+B,+Q);case _:return B.name==Q.name&&B.message==Q.message;case x:case O:return B==Q+"";case T:var D=c;case E:var P=Y&d;if(D||(D=h),B.size!=Q.size&&!P)return!1;var H=I.get(B);if(H)return H==Q;Y|=g,I.set(B,Q);var N=s(D(B),D(Q),Y,V,F,I);return I.delete(B),N;case w:if(z)return z.call(B)==z.call(Q)}return!1}return av=G,av}var nv,B3;function J_(){if(B3)return nv;B3=1;function n(i,u){for(var s=-1,c=u.length,h=i.length;++s<c;)i[h+s]=u[s];return i}return nv=n,nv}var iv,L3;function W_(){if(L3)return iv;L3=1;var n=J_(),i=mr();function u(s,c,h){var d=c(s);return i(s)?d:n(d,h(s))}return iv=u,iv}var rv,j3;function gx(){if(j3)return rv;j3=1;function n(i,u){for(var s=-1,c=i==null?0:i.length,h=0,d=[];++s<c;){var g=i[s];u(g,s,i)&&(d[h++]=g)}return d}return rv=n,rv}var lv,V3;function I_(){if(V3)return lv;V3=1;function n(){return[]}return lv=n,lv}var uv,Y3;function Cm(){if(Y3)return uv;Y3=1;var n=gx(),i=I_(),u=Object.prototype,s=u.propertyIsEnumerable,c=Object.getOwnPropertySymbols,h=c?function(d){return d==null?[]:(d=Object(d),n(c(d),function(g){return s.call(d,g)}))}:i;return uv=h,uv}var sv,P3;function $_(){if(P3)return sv;P3=1;var n=W_(),i=Cm(),u=bd();function s(c){return n(c,u,i)}return sv=s,sv}var ov,X3;function px(){if(X3)return ov;X3=1;var n=$_(),i=1,u=Object.prototype,s=u.hasOwnProperty;function c(h,d,g,v,p,_){var T=g&i,C=n(h),x=C.length,E=n(d),O=E.length;if(x!=O&&!T)return!1;for(var w=x;w--;){var U=C[w];if(!(T?U in d:s.call(d,U)))return!1}var A=_.get(h),R=_.get(d);if(A&&R)return A==d&&R==h;var z=!0;_.set(h,d),_.set(d,h);for(var G=T;++w<x;){U=C[w];var B=h[U],Q=d[U];if(v)var X=T?v(Q,B,U,d,h,_):v(B,Q,U,h,d,_);if(!(X===void 0?B===Q||p(B,Q,g,v,_):X)){z=!1;break}G||(G=U=="constructor")}if(z&&!G){var Y=h.constructor,V=d.constructor;Y!=V&&"constructor"in h&&"constructor"in d&&!(typeof Y=="function"&&Y instanceof Y&&typeof V=="function"&&V instanceof V)&&(z=!1)}return _.delete(h),_.delete(d),z}return ov=c,ov}var cv,K3;function vx(){if(K3)return cv;K3=1;var n=Js(),i=cl(),u=n(i,"DataView");return cv=u,cv}var fv,F3;function mx(){if(F3)return fv;F3=1;var n=Js(),i=cl(),u=n(i,"Promise");return fv=u,fv}var hv,k3;function yx(){if(k3)return hv;k3=1;var n=Js(),i=cl(),u=n(i,"Set");return hv=u,hv}var dv,Q3;function bx(){if(Q3)return dv;Q3=1;var n=Js(),i=cl(),u=n(i,"WeakMap");return dv=u,dv}var gv,Z3;function C1(){if(Z3)return gv;Z3=1;var n=vx(),i=Sm(),u=mx(),s=yx(),c=bx(),h=Zs(),d=k_(),g="[object Map]",v="[object Object]",p="[object Promise]",_="[object Set]",T="[object WeakMap]",C="[object DataView]",x=d(n),E=d(i),O=d(u),w=d(s),U=d(c),A=h;return(n&&A(new n(new ArrayBuffer(1)))!=C||i&&A(new i)!=g||u&&A(u.resolve())!=p||s&&A(new s)!=_||c&&A(new c)!=T)&&(A=function(R){var z=h(R),G=z==v?R.constructor:void 0,B=G?d(G):"";if(B)switch(B){case x:return C;case E:return g;case O:return p;case w:return _;case U:return T}return z}),gv=A,gv}var pv,J3;function _x(){if(J3)return pv;J3=1;var n=Em(),i=Q_(),u=dx(),s=px(),c=C1(),h=mr(),d=dm(),g=j_(),v=1,p="[object Arguments]",_="[object Array]",T="[object Object]",C=Object.prototype,x=C.hasOwnProperty;function E(O,w,U,A,R,z){var G=h(O),B=h(w),Q=G?_:c(O),X=B?_:c(w);Q=Q==p?T:Q,X=X==p?T:X;var Y=Q==T,V=X==T,F=Q==X;if(F&&d(O)){if(!d(w))return!1;G=!0,Y=!1}if(F&&!Y)return z||(z=new n),G||g(O)?i(O,w,U,A,R,z):u(O,w,Q,U,A,R,z);if(!(U&v)){var I=Y&&x.call(O,"__wrapped__"),D=V&&x.call(w,"__wrapped__");if(I||D){var P=I?O.value():O,H=D?w.value():w;return z||(z=new n),R(P,H,U,A,z)}}return F?(z||(z=new n),s(O,w,U,A,R,z)):!1}return pv=E,pv}var vv,W3;function e8(){if(W3)return vv;W3=1;var n=_x(),i=Kl();function u(s,c,h,d,g){return s===c?!0:s==null||c==null||!i(s)&&!i(c)?s!==s&&c!==c:n(s,c,h,d,u,g)}return vv=u,vv}var mv,I3;function Sx(){if(I3)return mv;I3=1;var n=Em(),i=e8(),u=1,s=2;function c(h,d,g,v){var p=g.length,_=p,T=!v;if(h==null)return!_;for(h=Object(h);p--;){var C=g[p];if(T&&C[2]?C[1]!==h[C[0]]:!(C[0]in h))return!1}for(;++p<_;){C=g[p];var x=C[0],E=h[x],O=C[1];if(T&&C[2]){if(E===void 0&&!(x in h))return!1}else{var w=new n;if(v)var U=v(E,O,x,h,d,w);if(!(U===void 0?i(O,E,u|s,v,w):U))return!1}}return!0}return mv=c,mv}var yv,$3;function t8(){if($3)return yv;$3=1;var n=Hc();function i(u){return u===u&&!n(u)}return yv=i,yv}var bv,e5;function xx(){if(e5)return bv;e5=1;var n=t8(),i=bd();function u(s){for(var c=i(s),h=c.length;h--;){var d=c[h],g=s[d];c[h]=[d,g,n(g)]}return c}return bv=u,bv}var _v,t5;function a8(){if(t5)return _v;t5=1;function n(i,u){return function(s){return s==null?!1:s[i]===u&&(u!==void 0||i in Object(s))}}return _v=n,_v}var Sv,a5;function Ex(){if(a5)return Sv;a5=1;var n=Sx(),i=xx(),u=a8();function s(c){var h=i(c);return h.length==1&&h[0][2]?u(h[0][0],h[0][1]):function(d){return d===c||n(d,c,h)}}return Sv=s,Sv}var xv,n5;function Tm(){if(n5)return xv;n5=1;var n=Zs(),i=Kl(),u="[object Symbol]";function s(c){return typeof c=="symbol"||i(c)&&n(c)==u}return xv=s,xv}var Ev,i5;function Am(){if(i5)return Ev;i5=1;var n=mr(),i=Tm(),u=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,s=/^\w*$/;function c(h,d){if(n(h))return!1;var g=typeof h;return g=="number"||g=="symbol"||g=="boolean"||h==null||i(h)?!0:s.test(h)||!u.test(h)||d!=null&&h in Object(d)}return Ev=c,Ev}var Cv,r5;function Cx(){if(r5)return Cv;r5=1;var n=xm(),i="Expected a function";function u(s,c){if(typeof s!="function"||c!=null&&typeof c!="function")throw new TypeError(i);var h=function(){var d=arguments,g=c?c.apply(this,d):d[0],v=h.cache;if(v.has(g))return v.get(g);var p=s.apply(this,d);return h.cache=v.set(g,p)||v,p};return h.cache=new(u.Cache||n),h}return u.Cache=n,Cv=u,Cv}var Tv,l5;function Tx(){if(l5)return Tv;l5=1;var n=Cx(),i=500;function u(s){var c=n(s,function(d){return h.size===i&&h.clear(),d}),h=c.cache;return c}return Tv=u,Tv}var Av,u5;function Ax(){if(u5)return Av;u5=1;var n=Tx(),i=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,u=/\\(\\)?/g,s=n(function(c){var h=[];return c.charCodeAt(0)===46&&h.push(""),c.replace(i,function(d,g,v,p){h.push(v?p.replace(u,"$1"):g||d)}),h});return Av=s,Av}var Rv,s5;function Rx(){if(s5)return Rv;s5=1;var n=yd(),i=F_(),u=mr(),s=Tm(),c=n?n.prototype:void 0,h=c?c.toString:void 0;function d(g){if(typeof g=="string")return g;if(u(g))return i(g,d)+"";if(s(g))return h?h.call(g):"";var v=g+"";return v=="0"&&1/g==-1/0?"-0":v}return Rv=d,Rv}var Ov,o5;function Ox(){if(o5)return Ov;o5=1;var n=Rx();function i(u){return u==null?"":n(u)}return Ov=i,Ov}var Mv,c5;function n8(){if(c5)return Mv;c5=1;var n=mr(),i=Am(),u=Ax(),s=Ox();function c(h,d){return n(h)?h:i(h,d)?[h]:u(s(h))}return Mv=c,Mv}var wv,f5;function T1(){if(f5)return wv;f5=1;var n=Tm();function i(u){if(typeof u=="string"||n(u))return u;var s=u+"";return s=="0"&&1/u==-1/0?"-0":s}return wv=i,wv}var Nv,h5;function i8(){if(h5)return Nv;h5=1;var n=n8(),i=T1();function u(s,c){c=n(c,s);for(var h=0,d=c.length;s!=null&&h<d;)s=s[i(c[h++])];return h&&h==d?s:void 0}return Nv=u,Nv}var Dv,d5;function Mx(){if(d5)return Dv;d5=1;var n=i8();function i(u,s,c){var h=u==null?void 0:n(u,s);return h===void 0?c:h}return Dv=i,Dv}var zv,g5;function wx(){if(g5)return zv;g5=1;function n(i,u){return i!=null&&u in Object(i)}return zv=n,zv}var Uv,p5;function Nx(){if(p5)return Uv;p5=1;var n=n8(),i=B_(),u=mr(),s=L_(),c=gm(),h=T1();function d(g,v,p){v=n(v,g);for(var _=-1,T=v.length,C=!1;++_<T;){var x=h(v[_]);if(!(C=g!=null&&p(g,x)))break;g=g[x]}return C||++_!=T?C:(T=g==null?0:g.length,!!T&&c(T)&&s(x,T)&&(u(g)||i(g)))}return Uv=d,Uv}var Gv,v5;function Dx(){if(v5)return Gv;v5=1;var n=wx(),i=Nx();function u(s,c){return s!=null&&i(s,c,n)}return Gv=u,Gv}var qv,m5;function zx(){if(m5)return qv;m5=1;var n=e8(),i=Mx(),u=Dx(),s=Am(),c=t8(),h=a8(),d=T1(),g=1,v=2;function p(_,T){return s(_)&&c(T)?h(d(_),T):function(C){var x=i(C,_);return x===void 0&&x===T?u(C,_):n(T,x,g|v)}}return qv=p,qv}var Hv,y5;function Ux(){if(y5)return Hv;y5=1;function n(i){return function(u){return u==null?void 0:u[i]}}return Hv=n,Hv}var Bv,b5;function Gx(){if(b5)return Bv;b5=1;var n=i8();function i(u){return function(s){return n(s,u)}}return Bv=i,Bv}var Lv,_5;function qx(){if(_5)return Lv;_5=1;var n=Ux(),i=Gx(),u=Am(),s=T1();function c(h){return u(h)?n(s(h)):i(h)}return Lv=c,Lv}var jv,S5;function Hx(){if(S5)return jv;S5=1;var n=Ex(),i=zx(),u=K_(),s=mr(),c=qx();function h(d){return typeof d=="function"?d:d==null?u:typeof d=="object"?s(d)?i(d[0],d[1]):n(d):c(d)}return jv=h,jv}var Vv,x5;function Bx(){if(x5)return Vv;x5=1;var n=b1();function i(u,s){return function(c,h){if(c==null)return c;if(!n(c))return u(c,h);for(var d=c.length,g=s?d:-1,v=Object(c);(s?g--:++g<d)&&h(v[g],g,v)!==!1;);return c}}return Vv=i,Vv}var Yv,E5;function Lx(){if(E5)return Yv;E5=1;var n=X_(),i=Bx(),u=i(n);return Yv=u,Yv}var Pv,C5;function jx(){if(C5)return Pv;C5=1;var n=Lx(),i=b1();function u(s,c){var h=-1,d=i(s)?Array(s.length):[];return n(s,function(g,v,p){d[++h]=c(g,v,p)}),d}return Pv=u,Pv}var Xv,T5;function Vx(){if(T5)return Xv;T5=1;var n=F_(),i=Hx(),u=jx(),s=mr();function c(h,d){var g=s(h)?n:u;return g(h,i(d,3))}return Xv=c,Xv}var A5;function Yx(){if(A5)return cc;A5=1,Object.defineProperty(cc,"__esModule",{value:!0}),cc.flattenNames=void 0;var n=E7(),i=v(n),u=ym(),s=v(u),c=z7(),h=v(c),d=Vx(),g=v(d);function v(_){return _&&_.__esModule?_:{default:_}}var p=cc.flattenNames=function _(){var T=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],C=[];return(0,g.default)(T,function(x){Array.isArray(x)?_(x).map(function(E){return C.push(E)}):(0,h.default)(x)?(0,s.default)(x,function(E,O){E===!0&&C.push(O),C.push(O+"-"+E)}):(0,i.default)(x)&&C.push(x)}),C};return cc.default=p,cc}var fc={},Kv,R5;function Px(){if(R5)return Kv;R5=1;function n(i,u){for(var s=-1,c=i==null?0:i.length;++s<c&&u(i[s],s,i)!==!1;);return i}return Kv=n,Kv}var Fv,O5;function Xx(){if(O5)return Fv;O5=1;var n=Js(),i=function(){try{var u=n(Object,"defineProperty");return u({},"",{}),u}catch{}}();return Fv=i,Fv}var kv,M5;function r8(){if(M5)return kv;M5=1;var n=Xx();function i(u,s,c){s=="__proto__"&&n?n(u,s,{configurable:!0,enumerable:!0,value:c,writable:!0}):u[s]=c}return kv=i,kv}var Qv,w5;function l8(){if(w5)return Qv;w5=1;var n=r8(),i=_m(),u=Object.prototype,s=u.hasOwnProperty;function c(h,d,g){var v=h[d];(!(s.call(h,d)&&i(v,g))||g===void 0&&!(d in h))&&n(h,d,g)}return Qv=c,Qv}var Zv,N5;function A1(){if(N5)return Zv;N5=1;var n=l8(),i=r8();function u(s,c,h,d){var g=!h;h||(h={});for(var v=-1,p=c.length;++v<p;){var _=c[v],T=d?d(h[_],s[_],_,h,s):void 0;T===void 0&&(T=s[_]),g?i(h,_,T):n(h,_,T)}return h}return Zv=u,Zv}var Jv,D5;function Kx(){if(D5)return Jv;D5=1;var n=A1(),i=bd();function u(s,c){return s&&n(c,i(c),s)}return Jv=u,Jv}var Wv,z5;function Fx(){if(z5)return Wv;z5=1;function n(i){var u=[];if(i!=null)for(var s in Object(i))u.push(s);return u}return Wv=n,Wv}var Iv,U5;function kx(){if(U5)return Iv;U5=1;var n=Hc(),i=mm(),u=Fx(),s=Object.prototype,c=s.hasOwnProperty;function h(d){if(!n(d))return u(d);var g=i(d),v=[];for(var p in d)p=="constructor"&&(g||!c.call(d,p))||v.push(p);return v}return Iv=h,Iv}var $v,G5;function Rm(){if(G5)return $v;G5=1;var n=V_(),i=kx(),u=b1();function s(c){return u(c)?n(c,!0):i(c)}return $v=s,$v}var e2,q5;function Qx(){if(q5)return e2;q5=1;var n=A1(),i=Rm();function u(s,c){return s&&n(c,i(c),s)}return e2=u,e2}var ld={exports:{}};ld.exports;var H5;function Zx(){return H5||(H5=1,function(n,i){var u=cl(),s=i&&!i.nodeType&&i,c=s&&!0&&n&&!n.nodeType&&n,h=c&&c.exports===s,d=h?u.Buffer:void 0,g=d?d.allocUnsafe:void 0;function v(p,_){if(_)return p.slice();var T=p.length,C=g?g(T):new p.constructor(T);return p.copy(C),C}n.exports=v}(ld,ld.exports)),ld.exports}var t2,B5;function Jx(){if(B5)return t2;B5=1;function n(i,u){var s=-1,c=i.length;for(u||(u=Array(c));++s<c;)u[s]=i[s];return u}return t2=n,t2}var a2,L5;function Wx(){if(L5)return a2;L5=1;var n=A1(),i=Cm();function u(s,c){return n(s,i(s),c)}return a2=u,a2}var n2,j5;function u8(){if(j5)return n2;j5=1;var n=J_(),i=bm(),u=Cm(),s=I_(),c=Object.getOwnPropertySymbols,h=c?function(d){for(var g=[];d;)n(g,u(d)),d=i(d);return g}:s;return n2=h,n2}var i2,V5;function Ix(){if(V5)return i2;V5=1;var n=A1(),i=u8();function u(s,c){return n(s,i(s),c)}return i2=u,i2}var r2,Y5;function $x(){if(Y5)return r2;Y5=1;var n=W_(),i=u8(),u=Rm();function s(c){return n(c,u,i)}return r2=s,r2}var l2,P5;function eE(){if(P5)return l2;P5=1;var n=Object.prototype,i=n.hasOwnProperty;function u(s){var c=s.length,h=new s.constructor(c);return c&&typeof s[0]=="string"&&i.call(s,"index")&&(h.index=s.index,h.input=s.input),h}return l2=u,l2}var u2,X5;function Om(){if(X5)return u2;X5=1;var n=Z_();function i(u){var s=new u.constructor(u.byteLength);return new n(s).set(new n(u)),s}return u2=i,u2}var s2,K5;function tE(){if(K5)return s2;K5=1;var n=Om();function i(u,s){var c=s?n(u.buffer):u.buffer;return new u.constructor(c,u.byteOffset,u.byteLength)}return s2=i,s2}var o2,F5;function aE(){if(F5)return o2;F5=1;var n=/\w*$/;function i(u){var s=new u.constructor(u.source,n.exec(u));return s.lastIndex=u.lastIndex,s}return o2=i,o2}var c2,k5;function nE(){if(k5)return c2;k5=1;var n=yd(),i=n?n.prototype:void 0,u=i?i.valueOf:void 0;function s(c){return u?Object(u.call(c)):{}}return c2=s,c2}var f2,Q5;function iE(){if(Q5)return f2;Q5=1;var n=Om();function i(u,s){var c=s?n(u.buffer):u.buffer;return new u.constructor(c,u.byteOffset,u.length)}return f2=i,f2}var h2,Z5;function rE(){if(Z5)return h2;Z5=1;var n=Om(),i=tE(),u=aE(),s=nE(),c=iE(),h="[object Boolean]",d="[object Date]",g="[object Map]",v="[object Number]",p="[object RegExp]",_="[object Set]",T="[object String]",C="[object Symbol]",x="[object ArrayBuffer]",E="[object DataView]",O="[object Float32Array]",w="[object Float64Array]",U="[object Int8Array]",A="[object Int16Array]",R="[object Int32Array]",z="[object Uint8Array]",G="[object Uint8ClampedArray]",B="[object Uint16Array]",Q="[object Uint32Array]";function X(Y,V,F){var I=Y.constructor;switch(V){case x:return n(Y);case h:case d:return new I(+Y);case E:return i(Y,F);case O:case w:case U:case A:case R:case z:case G:case B:case Q:return c(Y,F);case g:return new I;case v:case T:return new I(Y);case p:return u(Y);case _:return new I;case C:return s(Y)}}return h2=X,h2}var d2,J5;function lE(){if(J5)return d2;J5=1;var n=Hc(),i=Object.create,u=function(){function s(){}return function(c){if(!n(c))return{};if(i)return i(c);s.prototype=c;var h=new s;return s.prototype=void 0,h}}();return d2=u,d2}var g2,W5;function uE(){if(W5)return g2;W5=1;var n=lE(),i=bm(),u=mm();function s(c){return typeof c.constructor=="function"&&!u(c)?n(i(c)):{}}return g2=s,g2}var p2,I5;function sE(){if(I5)return p2;I5=1;var n=C1(),i=Kl(),u="[object Map]";function s(c){return i(c)&&n(c)==u}return p2=s,p2}var v2,$5;function oE(){if($5)return v2;$5=1;var n=sE(),i=pm(),u=vm(),s=u&&u.isMap,c=s?i(s):n;return v2=c,v2}var m2,e4;function cE(){if(e4)return m2;e4=1;var n=C1(),i=Kl(),u="[object Set]";function s(c){return i(c)&&n(c)==u}return m2=s,m2}var y2,t4;function fE(){if(t4)return y2;t4=1;var n=cE(),i=pm(),u=vm(),s=u&&u.isSet,c=s?i(s):n;return y2=c,y2}var b2,a4;function hE(){if(a4)return b2;a4=1;var n=Em(),i=Px(),u=l8(),s=Kx(),c=Qx(),h=Zx(),d=Jx(),g=Wx(),v=Ix(),p=$_(),_=$x(),T=C1(),C=eE(),x=rE(),E=uE(),O=mr(),w=dm(),U=oE(),A=Hc(),R=fE(),z=bd(),G=Rm(),B=1,Q=2,X=4,Y="[object Arguments]",V="[object Array]",F="[object Boolean]",I="[object Date]",D="[object Error]",P="[object Function]",H="[object GeneratorFunction]",N="[object Map]",L="[object Number]",Z="[object Object]",ae="[object RegExp]",j="[object Set]",te="[object String]",de="[object Symbol]",ne="[object WeakMap]",ce="[object ArrayBuffer]",Se="[object DataView]",xe="[object Float32Array]",$="[object Float64Array]",oe="[object Int8Array]",Te="[object Int16Array]",Re="[object Int32Array]",Me="[object Uint8Array]",Ge="[object Uint8ClampedArray]",$e="[object Uint16Array]",et="[object Uint32Array]",ze={};ze[Y]=ze[V]=ze[ce]=ze[Se]=ze[F]=ze[I]=ze[xe]=ze[$]=ze[oe]=ze[Te]=ze[Re]=ze[N]=ze[L]=ze[Z]=ze[ae]=ze[j]=ze[te]=ze[de]=ze[Me]=ze[Ge]=ze[$e]=ze[et]=!0,ze[D]=ze[P]=ze[ne]=!1;function At(we,ft,na,Rt,Vt,ht){var lt,ma=ft&B,Ca=ft&Q,Zt=ft&X;if(na&&(lt=Vt?na(we,Rt,Vt,ht):na(we)),lt!==void 0)return lt;if(!A(we))return we;var Dt=O(we);if(Dt){if(lt=C(we),!ma)return d(we,lt)}else{var Fe=T(we),zt=Fe==P||Fe==H;if(w(we))return h(we,ma);if(Fe==Z||Fe==Y||zt&&!Vt){if(lt=Ca||zt?{}:E(we),!ma)return Ca?v(we,c(lt,we)):g(we,s(lt,we))}else{if(!ze[Fe])return Vt?we:{};lt=x(we,Fe,ma)}}ht||(ht=new n);var tn=ht.get(we);if(tn)return tn;ht.set(we,lt),R(we)?we.forEach(function(mt){lt.add(At(mt,ft,na,mt,we,ht))}):U(we)&&we.forEach(function(mt,yt){lt.set(yt,At(mt,ft,na,yt,we,ht))});var ka=Zt?Ca?_:p:Ca?G:z,ya=Dt?void 0:ka(we);return i(ya||we,function(mt,yt){ya&&(yt=mt,mt=we[yt]),u(lt,yt,At(mt,ft,na,yt,we,ht))}),lt}return b2=At,b2}var _2,n4;function dE(){if(n4)return _2;n4=1;var n=hE(),i=1,u=4;function s(c){return n(c,i|u)}return _2=s,_2}var i4;function gE(){if(i4)return fc;i4=1,Object.defineProperty(fc,"__esModule",{value:!0}),fc.mergeClasses=void 0;var n=ym(),i=h(n),u=dE(),s=h(u),c=Object.assign||function(g){for(var v=1;v<arguments.length;v++){var p=arguments[v];for(var _ in p)Object.prototype.hasOwnProperty.call(p,_)&&(g[_]=p[_])}return g};function h(g){return g&&g.__esModule?g:{default:g}}var d=fc.mergeClasses=function(v){var p=arguments.length>1&&arguments[1]!==void 0?arguments[1]:[],_=v.default&&(0,s.default)(v.default)||{};return p.map(function(T){var C=v[T];return C&&(0,i.default)(C,function(x,E){_[E]||(_[E]={}),_[E]=c({},_[E],C[E])}),T}),_};return fc.default=d,fc}var hc={},r4;function pE(){if(r4)return hc;r4=1,Object.defineProperty(hc,"__esModule",{value:!0}),hc.autoprefix=void 0;var n=ym(),i=s(n),u=Object.assign||function(d){for(var g=1;g<arguments.length;g++){var v=arguments[g];for(var p in v)Object.prototype.hasOwnProperty.call(v,p)&&(d[p]=v[p])}return d};function s(d){return d&&d.__esModule?d:{default:d}}var c={borderRadius:function(g){return{msBorderRadius:g,MozBorderRadius:g,OBorderRadius:g,WebkitBorderRadius:g,borderRadius:g}},boxShadow:function(g){return{msBoxShadow:g,MozBoxShadow:g,OBoxShadow:g,WebkitBoxShadow:g,boxShadow:g}},userSelect:function(g){return{WebkitTouchCallout:g,KhtmlUserSelect:g,MozUserSelect:g,msUserSelect:g,WebkitUserSelect:g,userSelect:g}},flex:function(g){return{WebkitBoxFlex:g,MozBoxFlex:g,WebkitFlex:g,msFlex:g,flex:g}},flexBasis:function(g){return{WebkitFlexBasis:g,flexBasis:g}},justifyContent:function(g){return{WebkitJustifyContent:g,justifyContent:g}},transition:function(g){return{msTransition:g,MozTransition:g,OTransition:g,WebkitTransition:g,transition:g}},transform:function(g){return{msTransform:g,MozTransform:g,OTransform:g,WebkitTransform:g,transform:g}},absolute:function(g){var v=g&&g.split(" ");return{position:"absolute",top:v&&v[0],right:v&&v[1],bottom:v&&v[2],left:v&&v[3]}},extend:function(g,v){var p=v[g];return p||{extend:g}}},h=hc.autoprefix=function(g){var v={};return(0,i.default)(g,function(p,_){var T={};(0,i.default)(p,function(C,x){var E=c[x];E?T=u({},T,E(C)):T[x]=C}),v[_]=T}),v};return hc.default=h,hc}var dc={},l4;function vE(){if(l4)return dc;l4=1,Object.defineProperty(dc,"__esModule",{value:!0}),dc.hover=void 0;var n=Object.assign||function(v){for(var p=1;p<arguments.length;p++){var _=arguments[p];for(var T in _)Object.prototype.hasOwnProperty.call(_,T)&&(v[T]=_[T])}return v},i=Fu(),u=s(i);function s(v){return v&&v.__esModule?v:{default:v}}function c(v,p){if(!(v instanceof p))throw new TypeError("Cannot call a class as a function")}function h(v,p){if(!v)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return p&&(typeof p=="object"||typeof p=="function")?p:v}function d(v,p){if(typeof p!="function"&&p!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof p);v.prototype=Object.create(p&&p.prototype,{constructor:{value:v,enumerable:!1,writable:!0,configurable:!0}}),p&&(Object.setPrototypeOf?Object.setPrototypeOf(v,p):v.__proto__=p)}var g=dc.hover=function(p){var _=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"span";return function(T){d(C,T);function C(){var x,E,O,w;c(this,C);for(var U=arguments.length,A=Array(U),R=0;R<U;R++)A[R]=arguments[R];return w=(E=(O=h(this,(x=C.__proto__||Object.getPrototypeOf(C)).call.apply(x,[this].concat(A))),O),O.state={hover:!1},O.handleMouseOver=function(){return O.setState({hover:!0})},O.handleMouseOut=function(){return O.setState({hover:!1})},O.render=function(){return u.default.createElement(_,{onMouseOver:O.handleMouseOver,onMouseOut:O.handleMouseOut},u.default.createElement(p,n({},O.props,O.state)))},E),h(O,w)}return C}(u.default.Component)};return dc.default=g,dc}var gc={},u4;function mE(){if(u4)return gc;u4=1,Object.defineProperty(gc,"__esModule",{value:!0}),gc.active=void 0;var n=Object.assign||function(v){for(var p=1;p<arguments.length;p++){var _=arguments[p];for(var T in _)Object.prototype.hasOwnProperty.call(_,T)&&(v[T]=_[T])}return v},i=Fu(),u=s(i);function s(v){return v&&v.__esModule?v:{default:v}}function c(v,p){if(!(v instanceof p))throw new TypeError("Cannot call a class as a function")}function h(v,p){if(!v)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return p&&(typeof p=="object"||typeof p=="function")?p:v}function d(v,p){if(typeof p!="function"&&p!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof p);v.prototype=Object.create(p&&p.prototype,{constructor:{value:v,enumerable:!1,writable:!0,configurable:!0}}),p&&(Object.setPrototypeOf?Object.setPrototypeOf(v,p):v.__proto__=p)}var g=gc.active=function(p){var _=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"span";return function(T){d(C,T);function C(){var x,E,O,w;c(this,C);for(var U=arguments.length,A=Array(U),R=0;R<U;R++)A[R]=arguments[R];return w=(E=(O=h(this,(x=C.__proto__||Object.getPrototypeOf(C)).call.apply(x,[this].concat(A))),O),O.state={active:!1},O.handleMouseDown=function(){return O.setState({active:!0})},O.handleMouseUp=function(){return O.setState({active:!1})},O.render=function(){return u.default.createElement(_,{onMouseDown:O.handleMouseDown,onMouseUp:O.handleMouseUp},u.default.createElement(p,n({},O.props,O.state)))},E),h(O,w)}return C}(u.default.Component)};return gc.default=g,gc}var t1={},s4;function yE(){if(s4)return t1;s4=1,Object.defineProperty(t1,"__esModule",{value:!0});var n=function(u,s){var c={},h=function(g){var v=arguments.length>1&&arguments[1]!==void 0?arguments[1]:!0;c[g]=v};return u===0&&h("first-child"),u===s-1&&h("last-child"),(u===0||u%2===0)&&h("even"),Math.abs(u%2)===1&&h("odd"),h("nth-child",u),c};return t1.default=n,t1}var o4;function bE(){if(o4)return In;o4=1,Object.defineProperty(In,"__esModule",{value:!0}),In.ReactCSS=In.loop=In.handleActive=In.handleHover=In.hover=void 0;var n=Yx(),i=C(n),u=gE(),s=C(u),c=pE(),h=C(c),d=vE(),g=C(d),v=mE(),p=C(v),_=yE(),T=C(_);function C(E){return E&&E.__esModule?E:{default:E}}In.hover=g.default,In.handleHover=g.default,In.handleActive=p.default,In.loop=T.default;var x=In.ReactCSS=function(O){for(var w=arguments.length,U=Array(w>1?w-1:0),A=1;A<w;A++)U[A-1]=arguments[A];var R=(0,i.default)(U),z=(0,s.default)(O,R);return(0,h.default)(z)};return In.default=x,In}var Mm=bE();const Je=Ku(Mm);var _E=function(i,u,s,c,h){var d=h.clientWidth,g=h.clientHeight,v=typeof i.pageX=="number"?i.pageX:i.touches[0].pageX,p=typeof i.pageY=="number"?i.pageY:i.touches[0].pageY,_=v-(h.getBoundingClientRect().left+window.pageXOffset),T=p-(h.getBoundingClientRect().top+window.pageYOffset);if(s==="vertical"){var C=void 0;if(T<0?C=0:T>g?C=1:C=Math.round(T*100/g)/100,u.a!==C)return{h:u.h,s:u.s,l:u.l,a:C,source:"rgb"}}else{var x=void 0;if(_<0?x=0:_>d?x=1:x=Math.round(_*100/d)/100,c!==x)return{h:u.h,s:u.s,l:u.l,a:x,source:"rgb"}}return null},S2={},SE=function(i,u,s,c){if(typeof document>"u"&&!c)return null;var h=c?new c:document.createElement("canvas");h.width=s*2,h.height=s*2;var d=h.getContext("2d");return d?(d.fillStyle=i,d.fillRect(0,0,h.width,h.height),d.fillStyle=u,d.fillRect(0,0,s,s),d.translate(s,s),d.fillRect(0,0,s,s),h.toDataURL()):null},xE=function(i,u,s,c){var h=i+"-"+u+"-"+s+(c?"-server":"");if(S2[h])return S2[h];var d=SE(i,u,s,c);return S2[h]=d,d},c4=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},Bc=function(i){var u=i.white,s=i.grey,c=i.size,h=i.renderers,d=i.borderRadius,g=i.boxShadow,v=i.children,p=Je({default:{grid:{borderRadius:d,boxShadow:g,absolute:"0px 0px 0px 0px",background:"url("+xE(u,s,c,h.canvas)+") center left"}}});return ue.isValidElement(v)?J.cloneElement(v,c4({},v.props,{style:c4({},v.props.style,p.grid)})):J.createElement("div",{style:p.grid})};Bc.defaultProps={size:8,white:"transparent",grey:"rgba(0,0,0,.08)",renderers:{}};var EE=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},CE=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function TE(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function f4(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function AE(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var wm=function(n){AE(i,n);function i(){var u,s,c,h;TE(this,i);for(var d=arguments.length,g=Array(d),v=0;v<d;v++)g[v]=arguments[v];return h=(s=(c=f4(this,(u=i.__proto__||Object.getPrototypeOf(i)).call.apply(u,[this].concat(g))),c),c.handleChange=function(p){var _=_E(p,c.props.hsl,c.props.direction,c.props.a,c.container);_&&typeof c.props.onChange=="function"&&c.props.onChange(_,p)},c.handleMouseDown=function(p){c.handleChange(p),window.addEventListener("mousemove",c.handleChange),window.addEventListener("mouseup",c.handleMouseUp)},c.handleMouseUp=function(){c.unbindEventListeners()},c.unbindEventListeners=function(){window.removeEventListener("mousemove",c.handleChange),window.removeEventListener("mouseup",c.handleMouseUp)},s),f4(c,h)}return CE(i,[{key:"componentWillUnmount",value:function(){this.unbindEventListeners()}},{key:"render",value:function(){var s=this,c=this.props.rgb,h=Je({default:{alpha:{absolute:"0px 0px 0px 0px",borderRadius:this.props.radius},checkboard:{absolute:"0px 0px 0px 0px",overflow:"hidden",borderRadius:this.props.radius},gradient:{absolute:"0px 0px 0px 0px",background:"linear-gradient(to right, rgba("+c.r+","+c.g+","+c.b+`, 0) 0%,
-           rgba(`+c.r+","+c.g+","+c.b+", 1) 100%)",boxShadow:this.props.shadow,borderRadius:this.props.radius},container:{position:"relative",height:"100%",margin:"0 3px"},pointer:{position:"absolute",left:c.a*100+"%"},slider:{width:"4px",borderRadius:"1px",height:"8px",boxShadow:"0 0 2px rgba(0, 0, 0, .6)",background:"#fff",marginTop:"1px",transform:"translateX(-2px)"}},vertical:{gradient:{background:"linear-gradient(to bottom, rgba("+c.r+","+c.g+","+c.b+`, 0) 0%,
-           rgba(`+c.r+","+c.g+","+c.b+", 1) 100%)"},pointer:{left:0,top:c.a*100+"%"}},overwrite:EE({},this.props.style)},{vertical:this.props.direction==="vertical",overwrite:!0});return J.createElement("div",{style:h.alpha},J.createElement("div",{style:h.checkboard},J.createElement(Bc,{renderers:this.props.renderers})),J.createElement("div",{style:h.gradient}),J.createElement("div",{style:h.container,ref:function(g){return s.container=g},onMouseDown:this.handleMouseDown,onTouchMove:this.handleChange,onTouchStart:this.handleChange},J.createElement("div",{style:h.pointer},this.props.pointer?J.createElement(this.props.pointer,this.props):J.createElement("div",{style:h.slider}))))}}]),i}(ue.PureComponent||ue.Component),RE=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function OE(n,i,u){return i in n?Object.defineProperty(n,i,{value:u,enumerable:!0,configurable:!0,writable:!0}):n[i]=u,n}function ME(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function wE(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function NE(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var DE=1,s8=38,zE=40,UE=[s8,zE],GE=function(i){return UE.indexOf(i)>-1},qE=function(i){return Number(String(i).replace(/%/g,""))},HE=1,Et=function(n){NE(i,n);function i(u){ME(this,i);var s=wE(this,(i.__proto__||Object.getPrototypeOf(i)).call(this));return s.handleBlur=function(){s.state.blurValue&&s.setState({value:s.state.blurValue,blurValue:null})},s.handleChange=function(c){s.setUpdatedValue(c.target.value,c)},s.handleKeyDown=function(c){var h=qE(c.target.value);if(!isNaN(h)&&GE(c.keyCode)){var d=s.getArrowOffset(),g=c.keyCode===s8?h+d:h-d;s.setUpdatedValue(g,c)}},s.handleDrag=function(c){if(s.props.dragLabel){var h=Math.round(s.props.value+c.movementX);h>=0&&h<=s.props.dragMax&&s.props.onChange&&s.props.onChange(s.getValueObjectWithLabel(h),c)}},s.handleMouseDown=function(c){s.props.dragLabel&&(c.preventDefault(),s.handleDrag(c),window.addEventListener("mousemove",s.handleDrag),window.addEventListener("mouseup",s.handleMouseUp))},s.handleMouseUp=function(){s.unbindEventListeners()},s.unbindEventListeners=function(){window.removeEventListener("mousemove",s.handleDrag),window.removeEventListener("mouseup",s.handleMouseUp)},s.state={value:String(u.value).toUpperCase(),blurValue:String(u.value).toUpperCase()},s.inputId="rc-editable-input-"+HE++,s}return RE(i,[{key:"componentDidUpdate",value:function(s,c){this.props.value!==this.state.value&&(s.value!==this.props.value||c.value!==this.state.value)&&(this.input===document.activeElement?this.setState({blurValue:String(this.props.value).toUpperCase()}):this.setState({value:String(this.props.value).toUpperCase(),blurValue:!this.state.blurValue&&String(this.props.value).toUpperCase()}))}},{key:"componentWillUnmount",value:function(){this.unbindEventListeners()}},{key:"getValueObjectWithLabel",value:function(s){return OE({},this.props.label,s)}},{key:"getArrowOffset",value:function(){return this.props.arrowOffset||DE}},{key:"setUpdatedValue",value:function(s,c){var h=this.props.label?this.getValueObjectWithLabel(s):s;this.props.onChange&&this.props.onChange(h,c),this.setState({value:s})}},{key:"render",value:function(){var s=this,c=Je({default:{wrap:{position:"relative"}},"user-override":{wrap:this.props.style&&this.props.style.wrap?this.props.style.wrap:{},input:this.props.style&&this.props.style.input?this.props.style.input:{},label:this.props.style&&this.props.style.label?this.props.style.label:{}},"dragLabel-true":{label:{cursor:"ew-resize"}}},{"user-override":!0},this.props);return J.createElement("div",{style:c.wrap},J.createElement("input",{id:this.inputId,style:c.input,ref:function(d){return s.input=d},value:this.state.value,onKeyDown:this.handleKeyDown,onChange:this.handleChange,onBlur:this.handleBlur,placeholder:this.props.placeholder,spellCheck:"false"}),this.props.label&&!this.props.hideLabel?J.createElement("label",{htmlFor:this.inputId,style:c.label,onMouseDown:this.handleMouseDown},this.props.label):null)}}]),i}(ue.PureComponent||ue.Component),BE=function(i,u,s,c){var h=c.clientWidth,d=c.clientHeight,g=typeof i.pageX=="number"?i.pageX:i.touches[0].pageX,v=typeof i.pageY=="number"?i.pageY:i.touches[0].pageY,p=g-(c.getBoundingClientRect().left+window.pageXOffset),_=v-(c.getBoundingClientRect().top+window.pageYOffset);if(u==="vertical"){var T=void 0;if(_<0)T=359;else if(_>d)T=0;else{var C=-(_*100/d)+100;T=360*C/100}if(s.h!==T)return{h:T,s:s.s,l:s.l,a:s.a,source:"hsl"}}else{var x=void 0;if(p<0)x=0;else if(p>h)x=359;else{var E=p*100/h;x=360*E/100}if(s.h!==x)return{h:x,s:s.s,l:s.l,a:s.a,source:"hsl"}}return null},LE=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function jE(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function h4(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function VE(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var Lc=function(n){VE(i,n);function i(){var u,s,c,h;jE(this,i);for(var d=arguments.length,g=Array(d),v=0;v<d;v++)g[v]=arguments[v];return h=(s=(c=h4(this,(u=i.__proto__||Object.getPrototypeOf(i)).call.apply(u,[this].concat(g))),c),c.handleChange=function(p){var _=BE(p,c.props.direction,c.props.hsl,c.container);_&&typeof c.props.onChange=="function"&&c.props.onChange(_,p)},c.handleMouseDown=function(p){c.handleChange(p),window.addEventListener("mousemove",c.handleChange),window.addEventListener("mouseup",c.handleMouseUp)},c.handleMouseUp=function(){c.unbindEventListeners()},s),h4(c,h)}return LE(i,[{key:"componentWillUnmount",value:function(){this.unbindEventListeners()}},{key:"unbindEventListeners",value:function(){window.removeEventListener("mousemove",this.handleChange),window.removeEventListener("mouseup",this.handleMouseUp)}},{key:"render",value:function(){var s=this,c=this.props.direction,h=c===void 0?"horizontal":c,d=Je({default:{hue:{absolute:"0px 0px 0px 0px",borderRadius:this.props.radius,boxShadow:this.props.shadow},container:{padding:"0 2px",position:"relative",height:"100%",borderRadius:this.props.radius},pointer:{position:"absolute",left:this.props.hsl.h*100/360+"%"},slider:{marginTop:"1px",width:"4px",borderRadius:"1px",height:"8px",boxShadow:"0 0 2px rgba(0, 0, 0, .6)",background:"#fff",transform:"translateX(-2px)"}},vertical:{pointer:{left:"0px",top:-(this.props.hsl.h*100/360)+100+"%"}}},{vertical:h==="vertical"});return J.createElement("div",{style:d.hue},J.createElement("div",{className:"hue-"+h,style:d.container,ref:function(v){return s.container=v},onMouseDown:this.handleMouseDown,onTouchMove:this.handleChange,onTouchStart:this.handleChange},J.createElement("style",null,`
-            .hue-horizontal {
-              background: linear-gradient(to right, #f00 0%, #ff0 17%, #0f0
-                33%, #0ff 50%, #00f 67%, #f0f 83%, #f00 100%);
-              background: -webkit-linear-gradient(to right, #f00 0%, #ff0
-                17%, #0f0 33%, #0ff 50%, #00f 67%, #f0f 83%, #f00 100%);
-            }
-
-            .hue-vertical {
-              background: linear-gradient(to top, #f00 0%, #ff0 17%, #0f0 33%,
-                #0ff 50%, #00f 67%, #f0f 83%, #f00 100%);
-              background: -webkit-linear-gradient(to top, #f00 0%, #ff0 17%,
-                #0f0 33%, #0ff 50%, #00f 67%, #f0f 83%, #f00 100%);
-            }
-          `),J.createElement("div",{style:d.pointer},this.props.pointer?J.createElement(this.props.pointer,this.props):J.createElement("div",{style:d.slider}))))}}]),i}(ue.PureComponent||ue.Component),x2={exports:{}},E2,d4;function YE(){if(d4)return E2;d4=1;var n="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED";return E2=n,E2}var C2,g4;function PE(){if(g4)return C2;g4=1;var n=YE();function i(){}function u(){}return u.resetWarningCache=i,C2=function(){function s(d,g,v,p,_,T){if(T!==n){var C=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw C.name="Invariant Violation",C}}s.isRequired=s;function c(){return s}var h={array:s,bigint:s,bool:s,func:s,number:s,object:s,string:s,symbol:s,any:s,arrayOf:c,element:s,elementType:s,instanceOf:c,node:s,objectOf:c,oneOf:c,oneOfType:c,shape:c,exact:c,checkPropTypes:u,resetWarningCache:i};return h.PropTypes=h,h},C2}var p4;function XE(){return p4||(p4=1,x2.exports=PE()()),x2.exports}var KE=XE();const Ne=Ku(KE);function FE(){this.__data__=[],this.size=0}function _d(n,i){return n===i||n!==n&&i!==i}function R1(n,i){for(var u=n.length;u--;)if(_d(n[u][0],i))return u;return-1}var kE=Array.prototype,QE=kE.splice;function ZE(n){var i=this.__data__,u=R1(i,n);if(u<0)return!1;var s=i.length-1;return u==s?i.pop():QE.call(i,u,1),--this.size,!0}function JE(n){var i=this.__data__,u=R1(i,n);return u<0?void 0:i[u][1]}function WE(n){return R1(this.__data__,n)>-1}function IE(n,i){var u=this.__data__,s=R1(u,n);return s<0?(++this.size,u.push([n,i])):u[s][1]=i,this}function Fl(n){var i=-1,u=n==null?0:n.length;for(this.clear();++i<u;){var s=n[i];this.set(s[0],s[1])}}Fl.prototype.clear=FE;Fl.prototype.delete=ZE;Fl.prototype.get=JE;Fl.prototype.has=WE;Fl.prototype.set=IE;function $E(){this.__data__=new Fl,this.size=0}function eC(n){var i=this.__data__,u=i.delete(n);return this.size=i.size,u}function tC(n){return this.__data__.get(n)}function aC(n){return this.__data__.has(n)}var o8=typeof global=="object"&&global&&global.Object===Object&&global,nC=typeof self=="object"&&self&&self.Object===Object&&self,yr=o8||nC||Function("return this")(),Pu=yr.Symbol,c8=Object.prototype,iC=c8.hasOwnProperty,rC=c8.toString,dh=Pu?Pu.toStringTag:void 0;function lC(n){var i=iC.call(n,dh),u=n[dh];try{n[dh]=void 0;var s=!0}catch{}var c=rC.call(n);return s&&(i?n[dh]=u:delete n[dh]),c}var uC=Object.prototype,sC=uC.toString;function oC(n){return sC.call(n)}var cC="[object Null]",fC="[object Undefined]",v4=Pu?Pu.toStringTag:void 0;function Ws(n){return n==null?n===void 0?fC:cC:v4&&v4 in Object(n)?lC(n):oC(n)}function Vi(n){var i=typeof n;return n!=null&&(i=="object"||i=="function")}var hC="[object AsyncFunction]",dC="[object Function]",gC="[object GeneratorFunction]",pC="[object Proxy]";function Nm(n){if(!Vi(n))return!1;var i=Ws(n);return i==dC||i==gC||i==hC||i==pC}var T2=yr["__core-js_shared__"],m4=function(){var n=/[^.]+$/.exec(T2&&T2.keys&&T2.keys.IE_PROTO||"");return n?"Symbol(src)_1."+n:""}();function vC(n){return!!m4&&m4 in n}var mC=Function.prototype,yC=mC.toString;function Is(n){if(n!=null){try{return yC.call(n)}catch{}try{return n+""}catch{}}return""}var bC=/[\\^$.*+?()[\]{}|]/g,_C=/^\[object .+?Constructor\]$/,SC=Function.prototype,xC=Object.prototype,EC=SC.toString,CC=xC.hasOwnProperty,TC=RegExp("^"+EC.call(CC).replace(bC,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");function AC(n){if(!Vi(n)||vC(n))return!1;var i=Nm(n)?TC:_C;return i.test(Is(n))}function RC(n,i){return n==null?void 0:n[i]}function $s(n,i){var u=RC(n,i);return AC(u)?u:void 0}var dd=$s(yr,"Map"),gd=$s(Object,"create");function OC(){this.__data__=gd?gd(null):{},this.size=0}function MC(n){var i=this.has(n)&&delete this.__data__[n];return this.size-=i?1:0,i}var wC="__lodash_hash_undefined__",NC=Object.prototype,DC=NC.hasOwnProperty;function zC(n){var i=this.__data__;if(gd){var u=i[n];return u===wC?void 0:u}return DC.call(i,n)?i[n]:void 0}var UC=Object.prototype,GC=UC.hasOwnProperty;function qC(n){var i=this.__data__;return gd?i[n]!==void 0:GC.call(i,n)}var HC="__lodash_hash_undefined__";function BC(n,i){var u=this.__data__;return this.size+=this.has(n)?0:1,u[n]=gd&&i===void 0?HC:i,this}function ks(n){var i=-1,u=n==null?0:n.length;for(this.clear();++i<u;){var s=n[i];this.set(s[0],s[1])}}ks.prototype.clear=OC;ks.prototype.delete=MC;ks.prototype.get=zC;ks.prototype.has=qC;ks.prototype.set=BC;function LC(){this.size=0,this.__data__={hash:new ks,map:new(dd||Fl),string:new ks}}function jC(n){var i=typeof n;return i=="string"||i=="number"||i=="symbol"||i=="boolean"?n!=="__proto__":n===null}function O1(n,i){var u=n.__data__;return jC(i)?u[typeof i=="string"?"string":"hash"]:u.map}function VC(n){var i=O1(this,n).delete(n);return this.size-=i?1:0,i}function YC(n){return O1(this,n).get(n)}function PC(n){return O1(this,n).has(n)}function XC(n,i){var u=O1(this,n),s=u.size;return u.set(n,i),this.size+=u.size==s?0:1,this}function kl(n){var i=-1,u=n==null?0:n.length;for(this.clear();++i<u;){var s=n[i];this.set(s[0],s[1])}}kl.prototype.clear=LC;kl.prototype.delete=VC;kl.prototype.get=YC;kl.prototype.has=PC;kl.prototype.set=XC;var KC=200;function FC(n,i){var u=this.__data__;if(u instanceof Fl){var s=u.__data__;if(!dd||s.length<KC-1)return s.push([n,i]),this.size=++u.size,this;u=this.__data__=new kl(s)}return u.set(n,i),this.size=u.size,this}function ll(n){var i=this.__data__=new Fl(n);this.size=i.size}ll.prototype.clear=$E;ll.prototype.delete=eC;ll.prototype.get=tC;ll.prototype.has=aC;ll.prototype.set=FC;var c1=function(){try{var n=$s(Object,"defineProperty");return n({},"",{}),n}catch{}}();function Dm(n,i,u){i=="__proto__"&&c1?c1(n,i,{configurable:!0,enumerable:!0,value:u,writable:!0}):n[i]=u}function I2(n,i,u){(u!==void 0&&!_d(n[i],u)||u===void 0&&!(i in n))&&Dm(n,i,u)}function kC(n){return function(i,u,s){for(var c=-1,h=Object(i),d=s(i),g=d.length;g--;){var v=d[++c];if(u(h[v],v,h)===!1)break}return i}}var f8=kC(),h8=typeof yi=="object"&&yi&&!yi.nodeType&&yi,y4=h8&&typeof bi=="object"&&bi&&!bi.nodeType&&bi,QC=y4&&y4.exports===h8,b4=QC?yr.Buffer:void 0;b4&&b4.allocUnsafe;function ZC(n,i){return n.slice()}var f1=yr.Uint8Array;function JC(n){var i=new n.constructor(n.byteLength);return new f1(i).set(new f1(n)),i}function WC(n,i){var u=JC(n.buffer);return new n.constructor(u,n.byteOffset,n.length)}function IC(n,i){var u=-1,s=n.length;for(i||(i=Array(s));++u<s;)i[u]=n[u];return i}var _4=Object.create,$C=function(){function n(){}return function(i){if(!Vi(i))return{};if(_4)return _4(i);n.prototype=i;var u=new n;return n.prototype=void 0,u}}();function d8(n,i){return function(u){return n(i(u))}}var g8=d8(Object.getPrototypeOf,Object),eT=Object.prototype;function zm(n){var i=n&&n.constructor,u=typeof i=="function"&&i.prototype||eT;return n===u}function tT(n){return typeof n.constructor=="function"&&!zm(n)?$C(g8(n)):{}}function Xu(n){return n!=null&&typeof n=="object"}var aT="[object Arguments]";function S4(n){return Xu(n)&&Ws(n)==aT}var p8=Object.prototype,nT=p8.hasOwnProperty,iT=p8.propertyIsEnumerable,h1=S4(function(){return arguments}())?S4:function(n){return Xu(n)&&nT.call(n,"callee")&&!iT.call(n,"callee")},_i=Array.isArray,rT=9007199254740991;function Um(n){return typeof n=="number"&&n>-1&&n%1==0&&n<=rT}function jc(n){return n!=null&&Um(n.length)&&!Nm(n)}function lT(n){return Xu(n)&&jc(n)}function uT(){return!1}var v8=typeof yi=="object"&&yi&&!yi.nodeType&&yi,x4=v8&&typeof bi=="object"&&bi&&!bi.nodeType&&bi,sT=x4&&x4.exports===v8,E4=sT?yr.Buffer:void 0,oT=E4?E4.isBuffer:void 0,d1=oT||uT,cT="[object Object]",fT=Function.prototype,hT=Object.prototype,m8=fT.toString,dT=hT.hasOwnProperty,gT=m8.call(Object);function pT(n){if(!Xu(n)||Ws(n)!=cT)return!1;var i=g8(n);if(i===null)return!0;var u=dT.call(i,"constructor")&&i.constructor;return typeof u=="function"&&u instanceof u&&m8.call(u)==gT}var vT="[object Arguments]",mT="[object Array]",yT="[object Boolean]",bT="[object Date]",_T="[object Error]",ST="[object Function]",xT="[object Map]",ET="[object Number]",CT="[object Object]",TT="[object RegExp]",AT="[object Set]",RT="[object String]",OT="[object WeakMap]",MT="[object ArrayBuffer]",wT="[object DataView]",NT="[object Float32Array]",DT="[object Float64Array]",zT="[object Int8Array]",UT="[object Int16Array]",GT="[object Int32Array]",qT="[object Uint8Array]",HT="[object Uint8ClampedArray]",BT="[object Uint16Array]",LT="[object Uint32Array]",aa={};aa[NT]=aa[DT]=aa[zT]=aa[UT]=aa[GT]=aa[qT]=aa[HT]=aa[BT]=aa[LT]=!0;aa[vT]=aa[mT]=aa[MT]=aa[yT]=aa[wT]=aa[bT]=aa[_T]=aa[ST]=aa[xT]=aa[ET]=aa[CT]=aa[TT]=aa[AT]=aa[RT]=aa[OT]=!1;function jT(n){return Xu(n)&&Um(n.length)&&!!aa[Ws(n)]}function VT(n){return function(i){return n(i)}}var y8=typeof yi=="object"&&yi&&!yi.nodeType&&yi,fd=y8&&typeof bi=="object"&&bi&&!bi.nodeType&&bi,YT=fd&&fd.exports===y8,A2=YT&&o8.process,C4=function(){try{var n=fd&&fd.require&&fd.require("util").types;return n||A2&&A2.binding&&A2.binding("util")}catch{}}(),T4=C4&&C4.isTypedArray,Gm=T4?VT(T4):jT;function $2(n,i){if(!(i==="constructor"&&typeof n[i]=="function")&&i!="__proto__")return n[i]}var PT=Object.prototype,XT=PT.hasOwnProperty;function KT(n,i,u){var s=n[i];(!(XT.call(n,i)&&_d(s,u))||u===void 0&&!(i in n))&&Dm(n,i,u)}function FT(n,i,u,s){var c=!u;u||(u={});for(var h=-1,d=i.length;++h<d;){var g=i[h],v=void 0;v===void 0&&(v=n[g]),c?Dm(u,g,v):KT(u,g,v)}return u}function kT(n,i){for(var u=-1,s=Array(n);++u<n;)s[u]=i(u);return s}var QT=9007199254740991,ZT=/^(?:0|[1-9]\d*)$/;function qm(n,i){var u=typeof n;return i=i??QT,!!i&&(u=="number"||u!="symbol"&&ZT.test(n))&&n>-1&&n%1==0&&n<i}var JT=Object.prototype,WT=JT.hasOwnProperty;function b8(n,i){var u=_i(n),s=!u&&h1(n),c=!u&&!s&&d1(n),h=!u&&!s&&!c&&Gm(n),d=u||s||c||h,g=d?kT(n.length,String):[],v=g.length;for(var p in n)(i||WT.call(n,p))&&!(d&&(p=="length"||c&&(p=="offset"||p=="parent")||h&&(p=="buffer"||p=="byteLength"||p=="byteOffset")||qm(p,v)))&&g.push(p);return g}function IT(n){var i=[];if(n!=null)for(var u in Object(n))i.push(u);return i}var $T=Object.prototype,eA=$T.hasOwnProperty;function tA(n){if(!Vi(n))return IT(n);var i=zm(n),u=[];for(var s in n)s=="constructor"&&(i||!eA.call(n,s))||u.push(s);return u}function _8(n){return jc(n)?b8(n,!0):tA(n)}function aA(n){return FT(n,_8(n))}function nA(n,i,u,s,c,h,d){var g=$2(n,u),v=$2(i,u),p=d.get(v);if(p){I2(n,u,p);return}var _=h?h(g,v,u+"",n,i,d):void 0,T=_===void 0;if(T){var C=_i(v),x=!C&&d1(v),E=!C&&!x&&Gm(v);_=v,C||x||E?_i(g)?_=g:lT(g)?_=IC(g):x?(T=!1,_=ZC(v)):E?(T=!1,_=WC(v)):_=[]:pT(v)||h1(v)?(_=g,h1(g)?_=aA(g):(!Vi(g)||Nm(g))&&(_=tT(v))):T=!1}T&&(d.set(v,_),c(_,v,s,h,d),d.delete(v)),I2(n,u,_)}function S8(n,i,u,s,c){n!==i&&f8(i,function(h,d){if(c||(c=new ll),Vi(h))nA(n,i,d,u,S8,s,c);else{var g=s?s($2(n,d),h,d+"",n,i,c):void 0;g===void 0&&(g=h),I2(n,d,g)}},_8)}function M1(n){return n}function iA(n,i,u){switch(u.length){case 0:return n.call(i);case 1:return n.call(i,u[0]);case 2:return n.call(i,u[0],u[1]);case 3:return n.call(i,u[0],u[1],u[2])}return n.apply(i,u)}var A4=Math.max;function rA(n,i,u){return i=A4(i===void 0?n.length-1:i,0),function(){for(var s=arguments,c=-1,h=A4(s.length-i,0),d=Array(h);++c<h;)d[c]=s[i+c];c=-1;for(var g=Array(i+1);++c<i;)g[c]=s[c];return g[i]=u(d),iA(n,this,g)}}function lA(n){return function(){return n}}var uA=c1?function(n,i){return c1(n,"toString",{configurable:!0,enumerable:!1,value:lA(i),writable:!0})}:M1,sA=800,oA=16,cA=Date.now;function fA(n){var i=0,u=0;return function(){var s=cA(),c=oA-(s-u);if(u=s,c>0){if(++i>=sA)return arguments[0]}else i=0;return n.apply(void 0,arguments)}}var hA=fA(uA);function dA(n,i){return hA(rA(n,i,M1),n+"")}function gA(n,i,u){if(!Vi(u))return!1;var s=typeof i;return(s=="number"?jc(u)&&qm(i,u.length):s=="string"&&i in u)?_d(u[i],n):!1}function pA(n){return dA(function(i,u){var s=-1,c=u.length,h=c>1?u[c-1]:void 0,d=c>2?u[2]:void 0;for(h=n.length>3&&typeof h=="function"?(c--,h):void 0,d&&gA(u[0],u[1],d)&&(h=c<3?void 0:h,c=1),i=Object(i);++s<c;){var g=u[s];g&&n(i,g,s,h)}return i})}var ti=pA(function(n,i,u){S8(n,i,u)}),Sd=function(i){var u=i.zDepth,s=i.radius,c=i.background,h=i.children,d=i.styles,g=d===void 0?{}:d,v=Je(ti({default:{wrap:{position:"relative",display:"inline-block"},content:{position:"relative"},bg:{absolute:"0px 0px 0px 0px",boxShadow:"0 "+u+"px "+u*4+"px rgba(0,0,0,.24)",borderRadius:s,background:c}},"zDepth-0":{bg:{boxShadow:"none"}},"zDepth-1":{bg:{boxShadow:"0 2px 10px rgba(0,0,0,.12), 0 2px 5px rgba(0,0,0,.16)"}},"zDepth-2":{bg:{boxShadow:"0 6px 20px rgba(0,0,0,.19), 0 8px 17px rgba(0,0,0,.2)"}},"zDepth-3":{bg:{boxShadow:"0 17px 50px rgba(0,0,0,.19), 0 12px 15px rgba(0,0,0,.24)"}},"zDepth-4":{bg:{boxShadow:"0 25px 55px rgba(0,0,0,.21), 0 16px 28px rgba(0,0,0,.22)"}},"zDepth-5":{bg:{boxShadow:"0 40px 77px rgba(0,0,0,.22), 0 27px 24px rgba(0,0,0,.2)"}},square:{bg:{borderRadius:"0"}},circle:{bg:{borderRadius:"50%"}}},g),{"zDepth-1":u===1});return J.createElement("div",{style:v.wrap},J.createElement("div",{style:v.bg}),J.createElement("div",{style:v.content},h))};Sd.propTypes={background:Ne.string,zDepth:Ne.oneOf([0,1,2,3,4,5]),radius:Ne.number,styles:Ne.object};Sd.defaultProps={background:"#fff",zDepth:1,radius:2,styles:{}};var R2=function(){return yr.Date.now()},vA=/\s/;function mA(n){for(var i=n.length;i--&&vA.test(n.charAt(i)););return i}var yA=/^\s+/;function bA(n){return n&&n.slice(0,mA(n)+1).replace(yA,"")}var _A="[object Symbol]";function w1(n){return typeof n=="symbol"||Xu(n)&&Ws(n)==_A}var R4=NaN,SA=/^[-+]0x[0-9a-f]+$/i,xA=/^0b[01]+$/i,EA=/^0o[0-7]+$/i,CA=parseInt;function O4(n){if(typeof n=="number")return n;if(w1(n))return R4;if(Vi(n)){var i=typeof n.valueOf=="function"?n.valueOf():n;n=Vi(i)?i+"":i}if(typeof n!="string")return n===0?n:+n;n=bA(n);var u=xA.test(n);return u||EA.test(n)?CA(n.slice(2),u?2:8):SA.test(n)?R4:+n}var TA="Expected a function",AA=Math.max,RA=Math.min;function x8(n,i,u){var s,c,h,d,g,v,p=0,_=!1,T=!1,C=!0;if(typeof n!="function")throw new TypeError(TA);i=O4(i)||0,Vi(u)&&(_=!!u.leading,T="maxWait"in u,h=T?AA(O4(u.maxWait)||0,i):h,C="trailing"in u?!!u.trailing:C);function x(B){var Q=s,X=c;return s=c=void 0,p=B,d=n.apply(X,Q),d}function E(B){return p=B,g=setTimeout(U,i),_?x(B):d}function O(B){var Q=B-v,X=B-p,Y=i-Q;return T?RA(Y,h-X):Y}function w(B){var Q=B-v,X=B-p;return v===void 0||Q>=i||Q<0||T&&X>=h}function U(){var B=R2();if(w(B))return A(B);g=setTimeout(U,O(B))}function A(B){return g=void 0,C&&s?x(B):(s=c=void 0,d)}function R(){g!==void 0&&clearTimeout(g),p=0,s=v=c=g=void 0}function z(){return g===void 0?d:A(R2())}function G(){var B=R2(),Q=w(B);if(s=arguments,c=this,v=B,Q){if(g===void 0)return E(v);if(T)return clearTimeout(g),g=setTimeout(U,i),x(v)}return g===void 0&&(g=setTimeout(U,i)),d}return G.cancel=R,G.flush=z,G}var OA="Expected a function";function MA(n,i,u){var s=!0,c=!0;if(typeof n!="function")throw new TypeError(OA);return Vi(u)&&(s="leading"in u?!!u.leading:s,c="trailing"in u?!!u.trailing:c),x8(n,i,{leading:s,maxWait:i,trailing:c})}var wA=function(i,u,s){var c=s.getBoundingClientRect(),h=c.width,d=c.height,g=typeof i.pageX=="number"?i.pageX:i.touches[0].pageX,v=typeof i.pageY=="number"?i.pageY:i.touches[0].pageY,p=g-(s.getBoundingClientRect().left+window.pageXOffset),_=v-(s.getBoundingClientRect().top+window.pageYOffset);p<0?p=0:p>h&&(p=h),_<0?_=0:_>d&&(_=d);var T=p/h,C=1-_/d;return{h:u.h,s:T,v:C,a:u.a,source:"hsv"}},NA=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function DA(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function zA(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function UA(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var N1=function(n){UA(i,n);function i(u){DA(this,i);var s=zA(this,(i.__proto__||Object.getPrototypeOf(i)).call(this,u));return s.handleChange=function(c){typeof s.props.onChange=="function"&&s.throttle(s.props.onChange,wA(c,s.props.hsl,s.container),c)},s.handleMouseDown=function(c){s.handleChange(c);var h=s.getContainerRenderWindow();h.addEventListener("mousemove",s.handleChange),h.addEventListener("mouseup",s.handleMouseUp)},s.handleMouseUp=function(){s.unbindEventListeners()},s.throttle=MA(function(c,h,d){c(h,d)},50),s}return NA(i,[{key:"componentWillUnmount",value:function(){this.throttle.cancel(),this.unbindEventListeners()}},{key:"getContainerRenderWindow",value:function(){for(var s=this.container,c=window;!c.document.contains(s)&&c.parent!==c;)c=c.parent;return c}},{key:"unbindEventListeners",value:function(){var s=this.getContainerRenderWindow();s.removeEventListener("mousemove",this.handleChange),s.removeEventListener("mouseup",this.handleMouseUp)}},{key:"render",value:function(){var s=this,c=this.props.style||{},h=c.color,d=c.white,g=c.black,v=c.pointer,p=c.circle,_=Je({default:{color:{absolute:"0px 0px 0px 0px",background:"hsl("+this.props.hsl.h+",100%, 50%)",borderRadius:this.props.radius},white:{absolute:"0px 0px 0px 0px",borderRadius:this.props.radius},black:{absolute:"0px 0px 0px 0px",boxShadow:this.props.shadow,borderRadius:this.props.radius},pointer:{position:"absolute",top:-(this.props.hsv.v*100)+100+"%",left:this.props.hsv.s*100+"%",cursor:"default"},circle:{width:"4px",height:"4px",boxShadow:`0 0 0 1.5px #fff, inset 0 0 1px 1px rgba(0,0,0,.3),
-            0 0 1px 2px rgba(0,0,0,.4)`,borderRadius:"50%",cursor:"hand",transform:"translate(-2px, -2px)"}},custom:{color:h,white:d,black:g,pointer:v,circle:p}},{custom:!!this.props.style});return J.createElement("div",{style:_.color,ref:function(C){return s.container=C},onMouseDown:this.handleMouseDown,onTouchMove:this.handleChange,onTouchStart:this.handleChange},J.createElement("style",null,`
-          .saturation-white {
-            background: -webkit-linear-gradient(to right, #fff, rgba(255,255,255,0));
-            background: linear-gradient(to right, #fff, rgba(255,255,255,0));
-          }
-          .saturation-black {
-            background: -webkit-linear-gradient(to top, #000, rgba(0,0,0,0));
-            background: linear-gradient(to top, #000, rgba(0,0,0,0));
-          }
-        `),J.createElement("div",{style:_.white,className:"saturation-white"},J.createElement("div",{style:_.black,className:"saturation-black"}),J.createElement("div",{style:_.pointer},this.props.pointer?J.createElement(this.props.pointer,this.props):J.createElement("div",{style:_.circle}))))}}]),i}(ue.PureComponent||ue.Component);function GA(n,i){for(var u=-1,s=n==null?0:n.length;++u<s&&i(n[u],u,n)!==!1;);return n}var qA=d8(Object.keys,Object),HA=Object.prototype,BA=HA.hasOwnProperty;function LA(n){if(!zm(n))return qA(n);var i=[];for(var u in Object(n))BA.call(n,u)&&u!="constructor"&&i.push(u);return i}function Hm(n){return jc(n)?b8(n):LA(n)}function jA(n,i){return n&&f8(n,i,Hm)}function VA(n,i){return function(u,s){if(u==null)return u;if(!jc(u))return n(u,s);for(var c=u.length,h=-1,d=Object(u);++h<c&&s(d[h],h,d)!==!1;);return u}}var E8=VA(jA);function YA(n){return typeof n=="function"?n:M1}function PA(n,i){var u=_i(n)?GA:E8;return u(n,YA(i))}function g1(n){"@babel/helpers - typeof";return g1=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(i){return typeof i}:function(i){return i&&typeof Symbol=="function"&&i.constructor===Symbol&&i!==Symbol.prototype?"symbol":typeof i},g1(n)}var XA=/^\s+/,KA=/\s+$/;function Be(n,i){if(n=n||"",i=i||{},n instanceof Be)return n;if(!(this instanceof Be))return new Be(n,i);var u=FA(n);this._originalInput=n,this._r=u.r,this._g=u.g,this._b=u.b,this._a=u.a,this._roundA=Math.round(100*this._a)/100,this._format=i.format||u.format,this._gradientType=i.gradientType,this._r<1&&(this._r=Math.round(this._r)),this._g<1&&(this._g=Math.round(this._g)),this._b<1&&(this._b=Math.round(this._b)),this._ok=u.ok}Be.prototype={isDark:function(){return this.getBrightness()<128},isLight:function(){return!this.isDark()},isValid:function(){return this._ok},getOriginalInput:function(){return this._originalInput},getFormat:function(){return this._format},getAlpha:function(){return this._a},getBrightness:function(){var i=this.toRgb();return(i.r*299+i.g*587+i.b*114)/1e3},getLuminance:function(){var i=this.toRgb(),u,s,c,h,d,g;return u=i.r/255,s=i.g/255,c=i.b/255,u<=.03928?h=u/12.92:h=Math.pow((u+.055)/1.055,2.4),s<=.03928?d=s/12.92:d=Math.pow((s+.055)/1.055,2.4),c<=.03928?g=c/12.92:g=Math.pow((c+.055)/1.055,2.4),.2126*h+.7152*d+.0722*g},setAlpha:function(i){return this._a=C8(i),this._roundA=Math.round(100*this._a)/100,this},toHsv:function(){var i=w4(this._r,this._g,this._b);return{h:i.h*360,s:i.s,v:i.v,a:this._a}},toHsvString:function(){var i=w4(this._r,this._g,this._b),u=Math.round(i.h*360),s=Math.round(i.s*100),c=Math.round(i.v*100);return this._a==1?"hsv("+u+", "+s+"%, "+c+"%)":"hsva("+u+", "+s+"%, "+c+"%, "+this._roundA+")"},toHsl:function(){var i=M4(this._r,this._g,this._b);return{h:i.h*360,s:i.s,l:i.l,a:this._a}},toHslString:function(){var i=M4(this._r,this._g,this._b),u=Math.round(i.h*360),s=Math.round(i.s*100),c=Math.round(i.l*100);return this._a==1?"hsl("+u+", "+s+"%, "+c+"%)":"hsla("+u+", "+s+"%, "+c+"%, "+this._roundA+")"},toHex:function(i){return N4(this._r,this._g,this._b,i)},toHexString:function(i){return"#"+this.toHex(i)},toHex8:function(i){return JA(this._r,this._g,this._b,this._a,i)},toHex8String:function(i){return"#"+this.toHex8(i)},toRgb:function(){return{r:Math.round(this._r),g:Math.round(this._g),b:Math.round(this._b),a:this._a}},toRgbString:function(){return this._a==1?"rgb("+Math.round(this._r)+", "+Math.round(this._g)+", "+Math.round(this._b)+")":"rgba("+Math.round(this._r)+", "+Math.round(this._g)+", "+Math.round(this._b)+", "+this._roundA+")"},toPercentageRgb:function(){return{r:Math.round(sa(this._r,255)*100)+"%",g:Math.round(sa(this._g,255)*100)+"%",b:Math.round(sa(this._b,255)*100)+"%",a:this._a}},toPercentageRgbString:function(){return this._a==1?"rgb("+Math.round(sa(this._r,255)*100)+"%, "+Math.round(sa(this._g,255)*100)+"%, "+Math.round(sa(this._b,255)*100)+"%)":"rgba("+Math.round(sa(this._r,255)*100)+"%, "+Math.round(sa(this._g,255)*100)+"%, "+Math.round(sa(this._b,255)*100)+"%, "+this._roundA+")"},toName:function(){return this._a===0?"transparent":this._a<1?!1:sR[N4(this._r,this._g,this._b,!0)]||!1},toFilter:function(i){var u="#"+D4(this._r,this._g,this._b,this._a),s=u,c=this._gradientType?"GradientType = 1, ":"";if(i){var h=Be(i);s="#"+D4(h._r,h._g,h._b,h._a)}return"progid:DXImageTransform.Microsoft.gradient("+c+"startColorstr="+u+",endColorstr="+s+")"},toString:function(i){var u=!!i;i=i||this._format;var s=!1,c=this._a<1&&this._a>=0,h=!u&&c&&(i==="hex"||i==="hex6"||i==="hex3"||i==="hex4"||i==="hex8"||i==="name");return h?i==="name"&&this._a===0?this.toName():this.toRgbString():(i==="rgb"&&(s=this.toRgbString()),i==="prgb"&&(s=this.toPercentageRgbString()),(i==="hex"||i==="hex6")&&(s=this.toHexString()),i==="hex3"&&(s=this.toHexString(!0)),i==="hex4"&&(s=this.toHex8String(!0)),i==="hex8"&&(s=this.toHex8String()),i==="name"&&(s=this.toName()),i==="hsl"&&(s=this.toHslString()),i==="hsv"&&(s=this.toHsvString()),s||this.toHexString())},clone:function(){return Be(this.toString())},_applyModification:function(i,u){var s=i.apply(null,[this].concat([].slice.call(u)));return this._r=s._r,this._g=s._g,this._b=s._b,this.setAlpha(s._a),this},lighten:function(){return this._applyModification(eR,arguments)},brighten:function(){return this._applyModification(tR,arguments)},darken:function(){return this._applyModification(aR,arguments)},desaturate:function(){return this._applyModification(WA,arguments)},saturate:function(){return this._applyModification(IA,arguments)},greyscale:function(){return this._applyModification($A,arguments)},spin:function(){return this._applyModification(nR,arguments)},_applyCombination:function(i,u){return i.apply(null,[this].concat([].slice.call(u)))},analogous:function(){return this._applyCombination(lR,arguments)},complement:function(){return this._applyCombination(iR,arguments)},monochromatic:function(){return this._applyCombination(uR,arguments)},splitcomplement:function(){return this._applyCombination(rR,arguments)},triad:function(){return this._applyCombination(z4,[3])},tetrad:function(){return this._applyCombination(z4,[4])}};Be.fromRatio=function(n,i){if(g1(n)=="object"){var u={};for(var s in n)n.hasOwnProperty(s)&&(s==="a"?u[s]=n[s]:u[s]=ud(n[s]));n=u}return Be(n,i)};function FA(n){var i={r:0,g:0,b:0},u=1,s=null,c=null,h=null,d=!1,g=!1;return typeof n=="string"&&(n=hR(n)),g1(n)=="object"&&(Ll(n.r)&&Ll(n.g)&&Ll(n.b)?(i=kA(n.r,n.g,n.b),d=!0,g=String(n.r).substr(-1)==="%"?"prgb":"rgb"):Ll(n.h)&&Ll(n.s)&&Ll(n.v)?(s=ud(n.s),c=ud(n.v),i=ZA(n.h,s,c),d=!0,g="hsv"):Ll(n.h)&&Ll(n.s)&&Ll(n.l)&&(s=ud(n.s),h=ud(n.l),i=QA(n.h,s,h),d=!0,g="hsl"),n.hasOwnProperty("a")&&(u=n.a)),u=C8(u),{ok:d,format:n.format||g,r:Math.min(255,Math.max(i.r,0)),g:Math.min(255,Math.max(i.g,0)),b:Math.min(255,Math.max(i.b,0)),a:u}}function kA(n,i,u){return{r:sa(n,255)*255,g:sa(i,255)*255,b:sa(u,255)*255}}function M4(n,i,u){n=sa(n,255),i=sa(i,255),u=sa(u,255);var s=Math.max(n,i,u),c=Math.min(n,i,u),h,d,g=(s+c)/2;if(s==c)h=d=0;else{var v=s-c;switch(d=g>.5?v/(2-s-c):v/(s+c),s){case n:h=(i-u)/v+(i<u?6:0);break;case i:h=(u-n)/v+2;break;case u:h=(n-i)/v+4;break}h/=6}return{h,s:d,l:g}}function QA(n,i,u){var s,c,h;n=sa(n,360),i=sa(i,100),u=sa(u,100);function d(p,_,T){return T<0&&(T+=1),T>1&&(T-=1),T<1/6?p+(_-p)*6*T:T<1/2?_:T<2/3?p+(_-p)*(2/3-T)*6:p}if(i===0)s=c=h=u;else{var g=u<.5?u*(1+i):u+i-u*i,v=2*u-g;s=d(v,g,n+1/3),c=d(v,g,n),h=d(v,g,n-1/3)}return{r:s*255,g:c*255,b:h*255}}function w4(n,i,u){n=sa(n,255),i=sa(i,255),u=sa(u,255);var s=Math.max(n,i,u),c=Math.min(n,i,u),h,d,g=s,v=s-c;if(d=s===0?0:v/s,s==c)h=0;else{switch(s){case n:h=(i-u)/v+(i<u?6:0);break;case i:h=(u-n)/v+2;break;case u:h=(n-i)/v+4;break}h/=6}return{h,s:d,v:g}}function ZA(n,i,u){n=sa(n,360)*6,i=sa(i,100),u=sa(u,100);var s=Math.floor(n),c=n-s,h=u*(1-i),d=u*(1-c*i),g=u*(1-(1-c)*i),v=s%6,p=[u,d,h,h,g,u][v],_=[g,u,u,d,h,h][v],T=[h,h,g,u,u,d][v];return{r:p*255,g:_*255,b:T*255}}function N4(n,i,u,s){var c=[vr(Math.round(n).toString(16)),vr(Math.round(i).toString(16)),vr(Math.round(u).toString(16))];return s&&c[0].charAt(0)==c[0].charAt(1)&&c[1].charAt(0)==c[1].charAt(1)&&c[2].charAt(0)==c[2].charAt(1)?c[0].charAt(0)+c[1].charAt(0)+c[2].charAt(0):c.join("")}function JA(n,i,u,s,c){var h=[vr(Math.round(n).toString(16)),vr(Math.round(i).toString(16)),vr(Math.round(u).toString(16)),vr(T8(s))];return c&&h[0].charAt(0)==h[0].charAt(1)&&h[1].charAt(0)==h[1].charAt(1)&&h[2].charAt(0)==h[2].charAt(1)&&h[3].charAt(0)==h[3].charAt(1)?h[0].charAt(0)+h[1].charAt(0)+h[2].charAt(0)+h[3].charAt(0):h.join("")}function D4(n,i,u,s){var c=[vr(T8(s)),vr(Math.round(n).toString(16)),vr(Math.round(i).toString(16)),vr(Math.round(u).toString(16))];return c.join("")}Be.equals=function(n,i){return!n||!i?!1:Be(n).toRgbString()==Be(i).toRgbString()};Be.random=function(){return Be.fromRatio({r:Math.random(),g:Math.random(),b:Math.random()})};function WA(n,i){i=i===0?0:i||10;var u=Be(n).toHsl();return u.s-=i/100,u.s=D1(u.s),Be(u)}function IA(n,i){i=i===0?0:i||10;var u=Be(n).toHsl();return u.s+=i/100,u.s=D1(u.s),Be(u)}function $A(n){return Be(n).desaturate(100)}function eR(n,i){i=i===0?0:i||10;var u=Be(n).toHsl();return u.l+=i/100,u.l=D1(u.l),Be(u)}function tR(n,i){i=i===0?0:i||10;var u=Be(n).toRgb();return u.r=Math.max(0,Math.min(255,u.r-Math.round(255*-(i/100)))),u.g=Math.max(0,Math.min(255,u.g-Math.round(255*-(i/100)))),u.b=Math.max(0,Math.min(255,u.b-Math.round(255*-(i/100)))),Be(u)}function aR(n,i){i=i===0?0:i||10;var u=Be(n).toHsl();return u.l-=i/100,u.l=D1(u.l),Be(u)}function nR(n,i){var u=Be(n).toHsl(),s=(u.h+i)%360;return u.h=s<0?360+s:s,Be(u)}function iR(n){var i=Be(n).toHsl();return i.h=(i.h+180)%360,Be(i)}function z4(n,i){if(isNaN(i)||i<=0)throw new Error("Argument to polyad must be a positive number");for(var u=Be(n).toHsl(),s=[Be(n)],c=360/i,h=1;h<i;h++)s.push(Be({h:(u.h+h*c)%360,s:u.s,l:u.l}));return s}function rR(n){var i=Be(n).toHsl(),u=i.h;return[Be(n),Be({h:(u+72)%360,s:i.s,l:i.l}),Be({h:(u+216)%360,s:i.s,l:i.l})]}function lR(n,i,u){i=i||6,u=u||30;var s=Be(n).toHsl(),c=360/u,h=[Be(n)];for(s.h=(s.h-(c*i>>1)+720)%360;--i;)s.h=(s.h+c)%360,h.push(Be(s));return h}function uR(n,i){i=i||6;for(var u=Be(n).toHsv(),s=u.h,c=u.s,h=u.v,d=[],g=1/i;i--;)d.push(Be({h:s,s:c,v:h})),h=(h+g)%1;return d}Be.mix=function(n,i,u){u=u===0?0:u||50;var s=Be(n).toRgb(),c=Be(i).toRgb(),h=u/100,d={r:(c.r-s.r)*h+s.r,g:(c.g-s.g)*h+s.g,b:(c.b-s.b)*h+s.b,a:(c.a-s.a)*h+s.a};return Be(d)};Be.readability=function(n,i){var u=Be(n),s=Be(i);return(Math.max(u.getLuminance(),s.getLuminance())+.05)/(Math.min(u.getLuminance(),s.getLuminance())+.05)};Be.isReadable=function(n,i,u){var s=Be.readability(n,i),c,h;switch(h=!1,c=dR(u),c.level+c.size){case"AAsmall":case"AAAlarge":h=s>=4.5;break;case"AAlarge":h=s>=3;break;case"AAAsmall":h=s>=7;break}return h};Be.mostReadable=function(n,i,u){var s=null,c=0,h,d,g,v;u=u||{},d=u.includeFallbackColors,g=u.level,v=u.size;for(var p=0;p<i.length;p++)h=Be.readability(n,i[p]),h>c&&(c=h,s=Be(i[p]));return Be.isReadable(n,s,{level:g,size:v})||!d?s:(u.includeFallbackColors=!1,Be.mostReadable(n,["#fff","#000"],u))};var em=Be.names={aliceblue:"f0f8ff",antiquewhite:"faebd7",aqua:"0ff",aquamarine:"7fffd4",azure:"f0ffff",beige:"f5f5dc",bisque:"ffe4c4",black:"000",blanchedalmond:"ffebcd",blue:"00f",blueviolet:"8a2be2",brown:"a52a2a",burlywood:"deb887",burntsienna:"ea7e5d",cadetblue:"5f9ea0",chartreuse:"7fff00",chocolate:"d2691e",coral:"ff7f50",cornflowerblue:"6495ed",cornsilk:"fff8dc",crimson:"dc143c",cyan:"0ff",darkblue:"00008b",darkcyan:"008b8b",darkgoldenrod:"b8860b",darkgray:"a9a9a9",darkgreen:"006400",darkgrey:"a9a9a9",darkkhaki:"bdb76b",darkmagenta:"8b008b",darkolivegreen:"556b2f",darkorange:"ff8c00",darkorchid:"9932cc",darkred:"8b0000",darksalmon:"e9967a",darkseagreen:"8fbc8f",darkslateblue:"483d8b",darkslategray:"2f4f4f",darkslategrey:"2f4f4f",darkturquoise:"00ced1",darkviolet:"9400d3",deeppink:"ff1493",deepskyblue:"00bfff",dimgray:"696969",dimgrey:"696969",dodgerblue:"1e90ff",firebrick:"b22222",floralwhite:"fffaf0",forestgreen:"228b22",fuchsia:"f0f",gainsboro:"dcdcdc",ghostwhite:"f8f8ff",gold:"ffd700",goldenrod:"daa520",gray:"808080",green:"008000",greenyellow:"adff2f",grey:"808080",honeydew:"f0fff0",hotpink:"ff69b4",indianred:"cd5c5c",indigo:"4b0082",ivory:"fffff0",khaki:"f0e68c",lavender:"e6e6fa",lavenderblush:"fff0f5",lawngreen:"7cfc00",lemonchiffon:"fffacd",lightblue:"add8e6",lightcoral:"f08080",lightcyan:"e0ffff",lightgoldenrodyellow:"fafad2",lightgray:"d3d3d3",lightgreen:"90ee90",lightgrey:"d3d3d3",lightpink:"ffb6c1",lightsalmon:"ffa07a",lightseagreen:"20b2aa",lightskyblue:"87cefa",lightslategray:"789",lightslategrey:"789",lightsteelblue:"b0c4de",lightyellow:"ffffe0",lime:"0f0",limegreen:"32cd32",linen:"faf0e6",magenta:"f0f",maroon:"800000",mediumaquamarine:"66cdaa",mediumblue:"0000cd",mediumorchid:"ba55d3",mediumpurple:"9370db",mediumseagreen:"3cb371",mediumslateblue:"7b68ee",mediumspringgreen:"00fa9a",mediumturquoise:"48d1cc",mediumvioletred:"c71585",midnightblue:"191970",mintcream:"f5fffa",mistyrose:"ffe4e1",moccasin:"ffe4b5",navajowhite:"ffdead",navy:"000080",oldlace:"fdf5e6",olive:"808000",olivedrab:"6b8e23",orange:"ffa500",orangered:"ff4500",orchid:"da70d6",palegoldenrod:"eee8aa",palegreen:"98fb98",paleturquoise:"afeeee",palevioletred:"db7093",papayawhip:"ffefd5",peachpuff:"ffdab9",peru:"cd853f",pink:"ffc0cb",plum:"dda0dd",powderblue:"b0e0e6",purple:"800080",rebeccapurple:"663399",red:"f00",rosybrown:"bc8f8f",royalblue:"4169e1",saddlebrown:"8b4513",salmon:"fa8072",sandybrown:"f4a460",seagreen:"2e8b57",seashell:"fff5ee",sienna:"a0522d",silver:"c0c0c0",skyblue:"87ceeb",slateblue:"6a5acd",slategray:"708090",slategrey:"708090",snow:"fffafa",springgreen:"00ff7f",steelblue:"4682b4",tan:"d2b48c",teal:"008080",thistle:"d8bfd8",tomato:"ff6347",turquoise:"40e0d0",violet:"ee82ee",wheat:"f5deb3",white:"fff",whitesmoke:"f5f5f5",yellow:"ff0",yellowgreen:"9acd32"},sR=Be.hexNames=oR(em);function oR(n){var i={};for(var u in n)n.hasOwnProperty(u)&&(i[n[u]]=u);return i}function C8(n){return n=parseFloat(n),(isNaN(n)||n<0||n>1)&&(n=1),n}function sa(n,i){cR(n)&&(n="100%");var u=fR(n);return n=Math.min(i,Math.max(0,parseFloat(n))),u&&(n=parseInt(n*i,10)/100),Math.abs(n-i)<1e-6?1:n%i/parseFloat(i)}function D1(n){return Math.min(1,Math.max(0,n))}function mi(n){return parseInt(n,16)}function cR(n){return typeof n=="string"&&n.indexOf(".")!=-1&&parseFloat(n)===1}function fR(n){return typeof n=="string"&&n.indexOf("%")!=-1}function vr(n){return n.length==1?"0"+n:""+n}function ud(n){return n<=1&&(n=n*100+"%"),n}function T8(n){return Math.round(parseFloat(n)*255).toString(16)}function U4(n){return mi(n)/255}var pr=function(){var n="[-\\+]?\\d+%?",i="[-\\+]?\\d*\\.\\d+%?",u="(?:"+i+")|(?:"+n+")",s="[\\s|\\(]+("+u+")[,|\\s]+("+u+")[,|\\s]+("+u+")\\s*\\)?",c="[\\s|\\(]+("+u+")[,|\\s]+("+u+")[,|\\s]+("+u+")[,|\\s]+("+u+")\\s*\\)?";return{CSS_UNIT:new RegExp(u),rgb:new RegExp("rgb"+s),rgba:new RegExp("rgba"+c),hsl:new RegExp("hsl"+s),hsla:new RegExp("hsla"+c),hsv:new RegExp("hsv"+s),hsva:new RegExp("hsva"+c),hex3:/^#?([0-9a-fA-F]{1})([0-9a-fA-F]{1})([0-9a-fA-F]{1})$/,hex6:/^#?([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})$/,hex4:/^#?([0-9a-fA-F]{1})([0-9a-fA-F]{1})([0-9a-fA-F]{1})([0-9a-fA-F]{1})$/,hex8:/^#?([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})([0-9a-fA-F]{2})$/}}();function Ll(n){return!!pr.CSS_UNIT.exec(n)}function hR(n){n=n.replace(XA,"").replace(KA,"").toLowerCase();var i=!1;if(em[n])n=em[n],i=!0;else if(n=="transparent")return{r:0,g:0,b:0,a:0,format:"name"};var u;return(u=pr.rgb.exec(n))?{r:u[1],g:u[2],b:u[3]}:(u=pr.rgba.exec(n))?{r:u[1],g:u[2],b:u[3],a:u[4]}:(u=pr.hsl.exec(n))?{h:u[1],s:u[2],l:u[3]}:(u=pr.hsla.exec(n))?{h:u[1],s:u[2],l:u[3],a:u[4]}:(u=pr.hsv.exec(n))?{h:u[1],s:u[2],v:u[3]}:(u=pr.hsva.exec(n))?{h:u[1],s:u[2],v:u[3],a:u[4]}:(u=pr.hex8.exec(n))?{r:mi(u[1]),g:mi(u[2]),b:mi(u[3]),a:U4(u[4]),format:i?"name":"hex8"}:(u=pr.hex6.exec(n))?{r:mi(u[1]),g:mi(u[2]),b:mi(u[3]),format:i?"name":"hex"}:(u=pr.hex4.exec(n))?{r:mi(u[1]+""+u[1]),g:mi(u[2]+""+u[2]),b:mi(u[3]+""+u[3]),a:U4(u[4]+""+u[4]),format:i?"name":"hex8"}:(u=pr.hex3.exec(n))?{r:mi(u[1]+""+u[1]),g:mi(u[2]+""+u[2]),b:mi(u[3]+""+u[3]),format:i?"name":"hex"}:!1}function dR(n){var i,u;return n=n||{level:"AA",size:"small"},i=(n.level||"AA").toUpperCase(),u=(n.size||"small").toLowerCase(),i!=="AA"&&i!=="AAA"&&(i="AA"),u!=="small"&&u!=="large"&&(u="small"),{level:i,size:u}}var G4=function(i){var u=["r","g","b","a","h","s","l","v"],s=0,c=0;return PA(u,function(h){if(i[h]&&(s+=1,isNaN(i[h])||(c+=1),h==="s"||h==="l")){var d=/^\d+%$/;d.test(i[h])&&(c+=1)}}),s===c?i:!1},sd=function(i,u){var s=i.hex?Be(i.hex):Be(i),c=s.toHsl(),h=s.toHsv(),d=s.toRgb(),g=s.toHex();c.s===0&&(c.h=u||0,h.h=u||0);var v=g==="000000"&&d.a===0;return{hsl:c,hex:v?"transparent":"#"+g,rgb:d,hsv:h,oldHue:i.h||u||c.h,source:i.source}},ku=function(i){if(i==="transparent")return!0;var u=String(i).charAt(0)==="#"?1:0;return i.length!==4+u&&i.length<7+u&&Be(i).isValid()},Bm=function(i){if(!i)return"#fff";var u=sd(i);if(u.hex==="transparent")return"rgba(0,0,0,0.4)";var s=(u.rgb.r*299+u.rgb.g*587+u.rgb.b*114)/1e3;return s>=128?"#000":"#fff"},O2=function(i,u){var s=i.replace("°","");return Be(u+" ("+s+")")._ok},gh=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},gR=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function pR(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function vR(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function mR(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var ai=function(i){var u=function(s){mR(c,s);function c(h){pR(this,c);var d=vR(this,(c.__proto__||Object.getPrototypeOf(c)).call(this));return d.handleChange=function(g,v){var p=G4(g);if(p){var _=sd(g,g.h||d.state.oldHue);d.setState(_),d.props.onChangeComplete&&d.debounce(d.props.onChangeComplete,_,v),d.props.onChange&&d.props.onChange(_,v)}},d.handleSwatchHover=function(g,v){var p=G4(g);if(p){var _=sd(g,g.h||d.state.oldHue);d.props.onSwatchHover&&d.props.onSwatchHover(_,v)}},d.state=gh({},sd(h.color,0)),d.debounce=x8(function(g,v,p){g(v,p)},100),d}return gR(c,[{key:"render",value:function(){var d={};return this.props.onSwatchHover&&(d.onSwatchHover=this.handleSwatchHover),J.createElement(i,gh({},this.props,this.state,{onChange:this.handleChange},d))}}],[{key:"getDerivedStateFromProps",value:function(d,g){return gh({},sd(d.color,g.oldHue))}}]),c}(ue.PureComponent||ue.Component);return u.propTypes=gh({},i.propTypes),u.defaultProps=gh({},i.defaultProps,{color:{h:250,s:.5,l:.2,a:1}}),u},yR=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},bR=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function _R(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function q4(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function SR(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var xR=function(i){var u=arguments.length>1&&arguments[1]!==void 0?arguments[1]:"span";return function(s){SR(c,s);function c(){var h,d,g,v;_R(this,c);for(var p=arguments.length,_=Array(p),T=0;T<p;T++)_[T]=arguments[T];return v=(d=(g=q4(this,(h=c.__proto__||Object.getPrototypeOf(c)).call.apply(h,[this].concat(_))),g),g.state={focus:!1},g.handleFocus=function(){return g.setState({focus:!0})},g.handleBlur=function(){return g.setState({focus:!1})},d),q4(g,v)}return bR(c,[{key:"render",value:function(){return J.createElement(u,{onFocus:this.handleFocus,onBlur:this.handleBlur},J.createElement(i,yR({},this.props,this.state)))}}]),c}(J.Component)},H4=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},ER=13,CR=function(i){var u=i.color,s=i.style,c=i.onClick,h=c===void 0?function(){}:c,d=i.onHover,g=i.title,v=g===void 0?u:g,p=i.children,_=i.focus,T=i.focusStyle,C=T===void 0?{}:T,x=u==="transparent",E=Je({default:{swatch:H4({background:u,height:"100%",width:"100%",cursor:"pointer",position:"relative",outline:"none"},s,_?C:{})}}),O=function(z){return h(u,z)},w=function(z){return z.keyCode===ER&&h(u,z)},U=function(z){return d(u,z)},A={};return d&&(A.onMouseOver=U),J.createElement("div",H4({style:E.swatch,onClick:O,title:v,tabIndex:0,onKeyDown:w},A),p,x&&J.createElement(Bc,{borderRadius:E.swatch.borderRadius,boxShadow:"inset 0 0 0 1px rgba(0,0,0,0.1)"}))};const eo=xR(CR);var TR=function(i){var u=i.direction,s=Je({default:{picker:{width:"18px",height:"18px",borderRadius:"50%",transform:"translate(-9px, -1px)",backgroundColor:"rgb(248, 248, 248)",boxShadow:"0 1px 4px 0 rgba(0, 0, 0, 0.37)"}},vertical:{picker:{transform:"translate(-3px, -9px)"}}},{vertical:u==="vertical"});return J.createElement("div",{style:s.picker})},AR=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},A8=function(i){var u=i.rgb,s=i.hsl,c=i.width,h=i.height,d=i.onChange,g=i.direction,v=i.style,p=i.renderers,_=i.pointer,T=i.className,C=T===void 0?"":T,x=Je({default:{picker:{position:"relative",width:c,height:h},alpha:{radius:"2px",style:v}}});return J.createElement("div",{style:x.picker,className:"alpha-picker "+C},J.createElement(wm,AR({},x.alpha,{rgb:u,hsl:s,pointer:_,renderers:p,onChange:d,direction:g})))};A8.defaultProps={width:"316px",height:"16px",direction:"horizontal",pointer:TR};ai(A8);function R8(n,i){for(var u=-1,s=n==null?0:n.length,c=Array(s);++u<s;)c[u]=i(n[u],u,n);return c}var RR="__lodash_hash_undefined__";function OR(n){return this.__data__.set(n,RR),this}function MR(n){return this.__data__.has(n)}function p1(n){var i=-1,u=n==null?0:n.length;for(this.__data__=new kl;++i<u;)this.add(n[i])}p1.prototype.add=p1.prototype.push=OR;p1.prototype.has=MR;function wR(n,i){for(var u=-1,s=n==null?0:n.length;++u<s;)if(i(n[u],u,n))return!0;return!1}function NR(n,i){return n.has(i)}var DR=1,zR=2;function O8(n,i,u,s,c,h){var d=u&DR,g=n.length,v=i.length;if(g!=v&&!(d&&v>g))return!1;var p=h.get(n),_=h.get(i);if(p&&_)return p==i&&_==n;var T=-1,C=!0,x=u&zR?new p1:void 0;for(h.set(n,i),h.set(i,n);++T<g;){var E=n[T],O=i[T];if(s)var w=d?s(O,E,T,i,n,h):s(E,O,T,n,i,h);if(w!==void 0){if(w)continue;C=!1;break}if(x){if(!wR(i,function(U,A){if(!NR(x,A)&&(E===U||c(E,U,u,s,h)))return x.push(A)})){C=!1;break}}else if(!(E===O||c(E,O,u,s,h))){C=!1;break}}return h.delete(n),h.delete(i),C}function UR(n){var i=-1,u=Array(n.size);return n.forEach(function(s,c){u[++i]=[c,s]}),u}function GR(n){var i=-1,u=Array(n.size);return n.forEach(function(s){u[++i]=s}),u}var qR=1,HR=2,BR="[object Boolean]",LR="[object Date]",jR="[object Error]",VR="[object Map]",YR="[object Number]",PR="[object RegExp]",XR="[object Set]",KR="[object String]",FR="[object Symbol]",kR="[object ArrayBuffer]",QR="[object DataView]",B4=Pu?Pu.prototype:void 0,M2=B4?B4.valueOf:void 0;function ZR(n,i,u,s,c,h,d){switch(u){case QR:if(n.byteLength!=i.byteLength||n.byteOffset!=i.byteOffset)return!1;n=n.buffer,i=i.buffer;case kR:return!(n.byteLength!=i.byteLength||!h(new f1(n),new f1(i)));case BR:case LR:case YR:return _d(+n,+i);case jR:return n.name==i.name&&n.message==i.message;case PR:case KR:return n==i+"";case VR:var g=UR;case XR:var v=s&qR;if(g||(g=GR),n.size!=i.size&&!v)return!1;var p=d.get(n);if(p)return p==i;s|=HR,d.set(n,i);var _=O8(g(n),g(i),s,c,h,d);return d.delete(n),_;case FR:if(M2)return M2.call(n)==M2.call(i)}return!1}function JR(n,i){for(var u=-1,s=i.length,c=n.length;++u<s;)n[c+u]=i[u];return n}function WR(n,i,u){var s=i(n);return _i(n)?s:JR(s,u(n))}function IR(n,i){for(var u=-1,s=n==null?0:n.length,c=0,h=[];++u<s;){var d=n[u];i(d,u,n)&&(h[c++]=d)}return h}function $R(){return[]}var eO=Object.prototype,tO=eO.propertyIsEnumerable,L4=Object.getOwnPropertySymbols,aO=L4?function(n){return n==null?[]:(n=Object(n),IR(L4(n),function(i){return tO.call(n,i)}))}:$R;function j4(n){return WR(n,Hm,aO)}var nO=1,iO=Object.prototype,rO=iO.hasOwnProperty;function lO(n,i,u,s,c,h){var d=u&nO,g=j4(n),v=g.length,p=j4(i),_=p.length;if(v!=_&&!d)return!1;for(var T=v;T--;){var C=g[T];if(!(d?C in i:rO.call(i,C)))return!1}var x=h.get(n),E=h.get(i);if(x&&E)return x==i&&E==n;var O=!0;h.set(n,i),h.set(i,n);for(var w=d;++T<v;){C=g[T];var U=n[C],A=i[C];if(s)var R=d?s(A,U,C,i,n,h):s(U,A,C,n,i,h);if(!(R===void 0?U===A||c(U,A,u,s,h):R)){O=!1;break}w||(w=C=="constructor")}if(O&&!w){var z=n.constructor,G=i.constructor;z!=G&&"constructor"in n&&"constructor"in i&&!(typeof z=="function"&&z instanceof z&&typeof G=="function"&&G instanceof G)&&(O=!1)}return h.delete(n),h.delete(i),O}var tm=$s(yr,"DataView"),am=$s(yr,"Promise"),nm=$s(yr,"Set"),im=$s(yr,"WeakMap"),V4="[object Map]",uO="[object Object]",Y4="[object Promise]",P4="[object Set]",X4="[object WeakMap]",K4="[object DataView]",sO=Is(tm),oO=Is(dd),cO=Is(am),fO=Is(nm),hO=Is(im),Yu=Ws;(tm&&Yu(new tm(new ArrayBuffer(1)))!=K4||dd&&Yu(new dd)!=V4||am&&Yu(am.resolve())!=Y4||nm&&Yu(new nm)!=P4||im&&Yu(new im)!=X4)&&(Yu=function(n){var i=Ws(n),u=i==uO?n.constructor:void 0,s=u?Is(u):"";if(s)switch(s){case sO:return K4;case oO:return V4;case cO:return Y4;case fO:return P4;case hO:return X4}return i});var dO=1,F4="[object Arguments]",k4="[object Array]",a1="[object Object]",gO=Object.prototype,Q4=gO.hasOwnProperty;function pO(n,i,u,s,c,h){var d=_i(n),g=_i(i),v=d?k4:Yu(n),p=g?k4:Yu(i);v=v==F4?a1:v,p=p==F4?a1:p;var _=v==a1,T=p==a1,C=v==p;if(C&&d1(n)){if(!d1(i))return!1;d=!0,_=!1}if(C&&!_)return h||(h=new ll),d||Gm(n)?O8(n,i,u,s,c,h):ZR(n,i,v,u,s,c,h);if(!(u&dO)){var x=_&&Q4.call(n,"__wrapped__"),E=T&&Q4.call(i,"__wrapped__");if(x||E){var O=x?n.value():n,w=E?i.value():i;return h||(h=new ll),c(O,w,u,s,h)}}return C?(h||(h=new ll),lO(n,i,u,s,c,h)):!1}function Lm(n,i,u,s,c){return n===i?!0:n==null||i==null||!Xu(n)&&!Xu(i)?n!==n&&i!==i:pO(n,i,u,s,Lm,c)}var vO=1,mO=2;function yO(n,i,u,s){var c=u.length,h=c;if(n==null)return!h;for(n=Object(n);c--;){var d=u[c];if(d[2]?d[1]!==n[d[0]]:!(d[0]in n))return!1}for(;++c<h;){d=u[c];var g=d[0],v=n[g],p=d[1];if(d[2]){if(v===void 0&&!(g in n))return!1}else{var _=new ll,T;if(!(T===void 0?Lm(p,v,vO|mO,s,_):T))return!1}}return!0}function M8(n){return n===n&&!Vi(n)}function bO(n){for(var i=Hm(n),u=i.length;u--;){var s=i[u],c=n[s];i[u]=[s,c,M8(c)]}return i}function w8(n,i){return function(u){return u==null?!1:u[n]===i&&(i!==void 0||n in Object(u))}}function _O(n){var i=bO(n);return i.length==1&&i[0][2]?w8(i[0][0],i[0][1]):function(u){return u===n||yO(u,n,i)}}var SO=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,xO=/^\w*$/;function jm(n,i){if(_i(n))return!1;var u=typeof n;return u=="number"||u=="symbol"||u=="boolean"||n==null||w1(n)?!0:xO.test(n)||!SO.test(n)||i!=null&&n in Object(i)}var EO="Expected a function";function Vm(n,i){if(typeof n!="function"||i!=null&&typeof i!="function")throw new TypeError(EO);var u=function(){var s=arguments,c=i?i.apply(this,s):s[0],h=u.cache;if(h.has(c))return h.get(c);var d=n.apply(this,s);return u.cache=h.set(c,d)||h,d};return u.cache=new(Vm.Cache||kl),u}Vm.Cache=kl;var CO=500;function TO(n){var i=Vm(n,function(s){return u.size===CO&&u.clear(),s}),u=i.cache;return i}var AO=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,RO=/\\(\\)?/g,OO=TO(function(n){var i=[];return n.charCodeAt(0)===46&&i.push(""),n.replace(AO,function(u,s,c,h){i.push(c?h.replace(RO,"$1"):s||u)}),i}),Z4=Pu?Pu.prototype:void 0,J4=Z4?Z4.toString:void 0;function N8(n){if(typeof n=="string")return n;if(_i(n))return R8(n,N8)+"";if(w1(n))return J4?J4.call(n):"";var i=n+"";return i=="0"&&1/n==-1/0?"-0":i}function MO(n){return n==null?"":N8(n)}function D8(n,i){return _i(n)?n:jm(n,i)?[n]:OO(MO(n))}function z1(n){if(typeof n=="string"||w1(n))return n;var i=n+"";return i=="0"&&1/n==-1/0?"-0":i}function z8(n,i){i=D8(i,n);for(var u=0,s=i.length;n!=null&&u<s;)n=n[z1(i[u++])];return u&&u==s?n:void 0}function wO(n,i,u){var s=n==null?void 0:z8(n,i);return s===void 0?u:s}function NO(n,i){return n!=null&&i in Object(n)}function DO(n,i,u){i=D8(i,n);for(var s=-1,c=i.length,h=!1;++s<c;){var d=z1(i[s]);if(!(h=n!=null&&u(n,d)))break;n=n[d]}return h||++s!=c?h:(c=n==null?0:n.length,!!c&&Um(c)&&qm(d,c)&&(_i(n)||h1(n)))}function zO(n,i){return n!=null&&DO(n,i,NO)}var UO=1,GO=2;function qO(n,i){return jm(n)&&M8(i)?w8(z1(n),i):function(u){var s=wO(u,n);return s===void 0&&s===i?zO(u,n):Lm(i,s,UO|GO)}}function HO(n){return function(i){return i==null?void 0:i[n]}}function BO(n){return function(i){return z8(i,n)}}function LO(n){return jm(n)?HO(z1(n)):BO(n)}function jO(n){return typeof n=="function"?n:n==null?M1:typeof n=="object"?_i(n)?qO(n[0],n[1]):_O(n):LO(n)}function VO(n,i){var u=-1,s=jc(n)?Array(n.length):[];return E8(n,function(c,h,d){s[++u]=i(c,h,d)}),s}function to(n,i){var u=_i(n)?R8:VO;return u(n,jO(i))}var YO=function(i){var u=i.colors,s=i.onClick,c=i.onSwatchHover,h=Je({default:{swatches:{marginRight:"-10px"},swatch:{width:"22px",height:"22px",float:"left",marginRight:"10px",marginBottom:"10px",borderRadius:"4px"},clear:{clear:"both"}}});return J.createElement("div",{style:h.swatches},to(u,function(d){return J.createElement(eo,{key:d,color:d,style:h.swatch,onClick:s,onHover:c,focusStyle:{boxShadow:"0 0 4px "+d}})}),J.createElement("div",{style:h.clear}))},Ym=function(i){var u=i.onChange,s=i.onSwatchHover,c=i.hex,h=i.colors,d=i.width,g=i.triangle,v=i.styles,p=v===void 0?{}:v,_=i.className,T=_===void 0?"":_,C=c==="transparent",x=function(w,U){ku(w)&&u({hex:w,source:"hex"},U)},E=Je(ti({default:{card:{width:d,background:"#fff",boxShadow:"0 1px rgba(0,0,0,.1)",borderRadius:"6px",position:"relative"},head:{height:"110px",background:c,borderRadius:"6px 6px 0 0",display:"flex",alignItems:"center",justifyContent:"center",position:"relative"},body:{padding:"10px"},label:{fontSize:"18px",color:Bm(c),position:"relative"},triangle:{width:"0px",height:"0px",borderStyle:"solid",borderWidth:"0 10px 10px 10px",borderColor:"transparent transparent "+c+" transparent",position:"absolute",top:"-10px",left:"50%",marginLeft:"-10px"},input:{width:"100%",fontSize:"12px",color:"#666",border:"0px",outline:"none",height:"22px",boxShadow:"inset 0 0 0 1px #ddd",borderRadius:"4px",padding:"0 7px",boxSizing:"border-box"}},"hide-triangle":{triangle:{display:"none"}}},p),{"hide-triangle":g==="hide"});return J.createElement("div",{style:E.card,className:"block-picker "+T},J.createElement("div",{style:E.triangle}),J.createElement("div",{style:E.head},C&&J.createElement(Bc,{borderRadius:"6px 6px 0 0"}),J.createElement("div",{style:E.label},c)),J.createElement("div",{style:E.body},J.createElement(YO,{colors:h,onClick:x,onSwatchHover:s}),J.createElement(Et,{style:{input:E.input},value:c,onChange:x})))};Ym.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),colors:Ne.arrayOf(Ne.string),triangle:Ne.oneOf(["top","hide"]),styles:Ne.object};Ym.defaultProps={width:170,colors:["#D9E3F0","#F47373","#697689","#37D67A","#2CCCE4","#555555","#dce775","#ff8a65","#ba68c8"],triangle:"top",styles:{}};ai(Ym);var vc={100:"#ffcdd2",300:"#e57373",500:"#f44336",700:"#d32f2f",900:"#b71c1c"},mc={100:"#f8bbd0",300:"#f06292",500:"#e91e63",700:"#c2185b",900:"#880e4f"},yc={100:"#e1bee7",300:"#ba68c8",500:"#9c27b0",700:"#7b1fa2",900:"#4a148c"},bc={100:"#d1c4e9",300:"#9575cd",500:"#673ab7",700:"#512da8",900:"#311b92"},_c={100:"#c5cae9",300:"#7986cb",500:"#3f51b5",700:"#303f9f",900:"#1a237e"},Sc={100:"#bbdefb",300:"#64b5f6",500:"#2196f3",700:"#1976d2",900:"#0d47a1"},xc={100:"#b3e5fc",300:"#4fc3f7",500:"#03a9f4",700:"#0288d1",900:"#01579b"},Ec={100:"#b2ebf2",300:"#4dd0e1",500:"#00bcd4",700:"#0097a7",900:"#006064"},Cc={100:"#b2dfdb",300:"#4db6ac",500:"#009688",700:"#00796b",900:"#004d40"},od={100:"#c8e6c9",300:"#81c784",500:"#4caf50",700:"#388e3c"},Tc={100:"#dcedc8",300:"#aed581",500:"#8bc34a",700:"#689f38",900:"#33691e"},Ac={100:"#f0f4c3",300:"#dce775",500:"#cddc39",700:"#afb42b",900:"#827717"},Rc={100:"#fff9c4",300:"#fff176",500:"#ffeb3b",700:"#fbc02d",900:"#f57f17"},Oc={100:"#ffecb3",300:"#ffd54f",500:"#ffc107",700:"#ffa000",900:"#ff6f00"},Mc={100:"#ffe0b2",300:"#ffb74d",500:"#ff9800",700:"#f57c00",900:"#e65100"},wc={100:"#ffccbc",300:"#ff8a65",500:"#ff5722",700:"#e64a19",900:"#bf360c"},Nc={100:"#d7ccc8",300:"#a1887f",500:"#795548",700:"#5d4037",900:"#3e2723"},Dc={100:"#cfd8dc",300:"#90a4ae",500:"#607d8b",700:"#455a64",900:"#263238"},U8=function(i){var u=i.color,s=i.onClick,c=i.onSwatchHover,h=i.hover,d=i.active,g=i.circleSize,v=i.circleSpacing,p=Je({default:{swatch:{width:g,height:g,marginRight:v,marginBottom:v,transform:"scale(1)",transition:"100ms transform ease"},Swatch:{borderRadius:"50%",background:"transparent",boxShadow:"inset 0 0 0 "+(g/2+1)+"px "+u,transition:"100ms box-shadow ease"}},hover:{swatch:{transform:"scale(1.2)"}},active:{Swatch:{boxShadow:"inset 0 0 0 3px "+u}}},{hover:h,active:d});return J.createElement("div",{style:p.swatch},J.createElement(eo,{style:p.Swatch,color:u,onClick:s,onHover:c,focusStyle:{boxShadow:p.Swatch.boxShadow+", 0 0 5px "+u}}))};U8.defaultProps={circleSize:28,circleSpacing:14};const PO=Mm.handleHover(U8);var Pm=function(i){var u=i.width,s=i.onChange,c=i.onSwatchHover,h=i.colors,d=i.hex,g=i.circleSize,v=i.styles,p=v===void 0?{}:v,_=i.circleSpacing,T=i.className,C=T===void 0?"":T,x=Je(ti({default:{card:{width:u,display:"flex",flexWrap:"wrap",marginRight:-_,marginBottom:-_}}},p)),E=function(w,U){return s({hex:w,source:"hex"},U)};return J.createElement("div",{style:x.card,className:"circle-picker "+C},to(h,function(O){return J.createElement(PO,{key:O,color:O,onClick:E,onSwatchHover:c,active:d===O.toLowerCase(),circleSize:g,circleSpacing:_})}))};Pm.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),circleSize:Ne.number,circleSpacing:Ne.number,styles:Ne.object};Pm.defaultProps={width:252,circleSize:28,circleSpacing:14,colors:[vc[500],mc[500],yc[500],bc[500],_c[500],Sc[500],xc[500],Ec[500],Cc[500],od[500],Tc[500],Ac[500],Rc[500],Oc[500],Mc[500],wc[500],Nc[500],Dc[500]],styles:{}};ai(Pm);function W4(n){return n===void 0}var n1={},I4;function XO(){if(I4)return n1;I4=1,Object.defineProperty(n1,"__esModule",{value:!0});var n=Object.assign||function(d){for(var g=1;g<arguments.length;g++){var v=arguments[g];for(var p in v)Object.prototype.hasOwnProperty.call(v,p)&&(d[p]=v[p])}return d},i=Fu(),u=s(i);function s(d){return d&&d.__esModule?d:{default:d}}function c(d,g){var v={};for(var p in d)g.indexOf(p)>=0||Object.prototype.hasOwnProperty.call(d,p)&&(v[p]=d[p]);return v}var h=24;return n1.default=function(d){var g=d.fill,v=g===void 0?"currentColor":g,p=d.width,_=p===void 0?h:p,T=d.height,C=T===void 0?h:T,x=d.style,E=x===void 0?{}:x,O=c(d,["fill","width","height","style"]);return u.default.createElement("svg",n({viewBox:"0 0 "+h+" "+h,style:n({fill:v,width:_,height:C},E)},O),u.default.createElement("path",{d:"M12,18.17L8.83,15L7.42,16.41L12,21L16.59,16.41L15.17,15M12,5.83L15.17,9L16.58,7.59L12,3L7.41,7.59L8.83,9L12,5.83Z"}))},n1}var KO=XO();const FO=Ku(KO);var kO=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function QO(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function ZO(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function JO(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var G8=function(n){JO(i,n);function i(u){QO(this,i);var s=ZO(this,(i.__proto__||Object.getPrototypeOf(i)).call(this));return s.toggleViews=function(){s.state.view==="hex"?s.setState({view:"rgb"}):s.state.view==="rgb"?s.setState({view:"hsl"}):s.state.view==="hsl"&&(s.props.hsl.a===1?s.setState({view:"hex"}):s.setState({view:"rgb"}))},s.handleChange=function(c,h){c.hex?ku(c.hex)&&s.props.onChange({hex:c.hex,source:"hex"},h):c.r||c.g||c.b?s.props.onChange({r:c.r||s.props.rgb.r,g:c.g||s.props.rgb.g,b:c.b||s.props.rgb.b,source:"rgb"},h):c.a?(c.a<0?c.a=0:c.a>1&&(c.a=1),s.props.onChange({h:s.props.hsl.h,s:s.props.hsl.s,l:s.props.hsl.l,a:Math.round(c.a*100)/100,source:"rgb"},h)):(c.h||c.s||c.l)&&(typeof c.s=="string"&&c.s.includes("%")&&(c.s=c.s.replace("%","")),typeof c.l=="string"&&c.l.includes("%")&&(c.l=c.l.replace("%","")),c.s==1?c.s=.01:c.l==1&&(c.l=.01),s.props.onChange({h:c.h||s.props.hsl.h,s:Number(W4(c.s)?s.props.hsl.s:c.s),l:Number(W4(c.l)?s.props.hsl.l:c.l),source:"hsl"},h))},s.showHighlight=function(c){c.currentTarget.style.background="#eee"},s.hideHighlight=function(c){c.currentTarget.style.background="transparent"},u.hsl.a!==1&&u.view==="hex"?s.state={view:"rgb"}:s.state={view:u.view},s}return kO(i,[{key:"render",value:function(){var s=this,c=Je({default:{wrap:{paddingTop:"16px",display:"flex"},fields:{flex:"1",display:"flex",marginLeft:"-6px"},field:{paddingLeft:"6px",width:"100%"},alpha:{paddingLeft:"6px",width:"100%"},toggle:{width:"32px",textAlign:"right",position:"relative"},icon:{marginRight:"-4px",marginTop:"12px",cursor:"pointer",position:"relative"},iconHighlight:{position:"absolute",width:"24px",height:"28px",background:"#eee",borderRadius:"4px",top:"10px",left:"12px",display:"none"},input:{fontSize:"11px",color:"#333",width:"100%",borderRadius:"2px",border:"none",boxShadow:"inset 0 0 0 1px #dadada",height:"21px",textAlign:"center"},label:{textTransform:"uppercase",fontSize:"11px",lineHeight:"11px",color:"#969696",textAlign:"center",display:"block",marginTop:"12px"},svg:{fill:"#333",width:"24px",height:"24px",border:"1px transparent solid",borderRadius:"5px"}},disableAlpha:{alpha:{display:"none"}}},this.props,this.state),h=void 0;return this.state.view==="hex"?h=J.createElement("div",{style:c.fields,className:"flexbox-fix"},J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"hex",value:this.props.hex,onChange:this.handleChange}))):this.state.view==="rgb"?h=J.createElement("div",{style:c.fields,className:"flexbox-fix"},J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"r",value:this.props.rgb.r,onChange:this.handleChange})),J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"g",value:this.props.rgb.g,onChange:this.handleChange})),J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"b",value:this.props.rgb.b,onChange:this.handleChange})),J.createElement("div",{style:c.alpha},J.createElement(Et,{style:{input:c.input,label:c.label},label:"a",value:this.props.rgb.a,arrowOffset:.01,onChange:this.handleChange}))):this.state.view==="hsl"&&(h=J.createElement("div",{style:c.fields,className:"flexbox-fix"},J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"h",value:Math.round(this.props.hsl.h),onChange:this.handleChange})),J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"s",value:Math.round(this.props.hsl.s*100)+"%",onChange:this.handleChange})),J.createElement("div",{style:c.field},J.createElement(Et,{style:{input:c.input,label:c.label},label:"l",value:Math.round(this.props.hsl.l*100)+"%",onChange:this.handleChange})),J.createElement("div",{style:c.alpha},J.createElement(Et,{style:{input:c.input,label:c.label},label:"a",value:this.props.hsl.a,arrowOffset:.01,onChange:this.handleChange})))),J.createElement("div",{style:c.wrap,className:"flexbox-fix"},h,J.createElement("div",{style:c.toggle},J.createElement("div",{style:c.icon,onClick:this.toggleViews,ref:function(g){return s.icon=g}},J.createElement(FO,{style:c.svg,onMouseOver:this.showHighlight,onMouseEnter:this.showHighlight,onMouseOut:this.hideHighlight}))))}}],[{key:"getDerivedStateFromProps",value:function(s,c){return s.hsl.a!==1&&c.view==="hex"?{view:"rgb"}:null}}]),i}(J.Component);G8.defaultProps={view:"hex"};var $4=function(){var i=Je({default:{picker:{width:"12px",height:"12px",borderRadius:"6px",transform:"translate(-6px, -1px)",backgroundColor:"rgb(248, 248, 248)",boxShadow:"0 1px 4px 0 rgba(0, 0, 0, 0.37)"}}});return J.createElement("div",{style:i.picker})},WO=function(){var i=Je({default:{picker:{width:"12px",height:"12px",borderRadius:"6px",boxShadow:"inset 0 0 0 1px #fff",transform:"translate(-6px, -6px)"}}});return J.createElement("div",{style:i.picker})},Xm=function(i){var u=i.width,s=i.onChange,c=i.disableAlpha,h=i.rgb,d=i.hsl,g=i.hsv,v=i.hex,p=i.renderers,_=i.styles,T=_===void 0?{}:_,C=i.className,x=C===void 0?"":C,E=i.defaultView,O=Je(ti({default:{picker:{width:u,background:"#fff",borderRadius:"2px",boxShadow:"0 0 2px rgba(0,0,0,.3), 0 4px 8px rgba(0,0,0,.3)",boxSizing:"initial",fontFamily:"Menlo"},saturation:{width:"100%",paddingBottom:"55%",position:"relative",borderRadius:"2px 2px 0 0",overflow:"hidden"},Saturation:{radius:"2px 2px 0 0"},body:{padding:"16px 16px 12px"},controls:{display:"flex"},color:{width:"32px"},swatch:{marginTop:"6px",width:"16px",height:"16px",borderRadius:"8px",position:"relative",overflow:"hidden"},active:{absolute:"0px 0px 0px 0px",borderRadius:"8px",boxShadow:"inset 0 0 0 1px rgba(0,0,0,.1)",background:"rgba("+h.r+", "+h.g+", "+h.b+", "+h.a+")",zIndex:"2"},toggles:{flex:"1"},hue:{height:"10px",position:"relative",marginBottom:"8px"},Hue:{radius:"2px"},alpha:{height:"10px",position:"relative"},Alpha:{radius:"2px"}},disableAlpha:{color:{width:"22px"},alpha:{display:"none"},hue:{marginBottom:"0px"},swatch:{width:"10px",height:"10px",marginTop:"0px"}}},T),{disableAlpha:c});return J.createElement("div",{style:O.picker,className:"chrome-picker "+x},J.createElement("div",{style:O.saturation},J.createElement(N1,{style:O.Saturation,hsl:d,hsv:g,pointer:WO,onChange:s})),J.createElement("div",{style:O.body},J.createElement("div",{style:O.controls,className:"flexbox-fix"},J.createElement("div",{style:O.color},J.createElement("div",{style:O.swatch},J.createElement("div",{style:O.active}),J.createElement(Bc,{renderers:p}))),J.createElement("div",{style:O.toggles},J.createElement("div",{style:O.hue},J.createElement(Lc,{style:O.Hue,hsl:d,pointer:$4,onChange:s})),J.createElement("div",{style:O.alpha},J.createElement(wm,{style:O.Alpha,rgb:h,hsl:d,pointer:$4,renderers:p,onChange:s})))),J.createElement(G8,{rgb:h,hsl:d,hex:v,view:E,onChange:s,disableAlpha:c})))};Xm.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),disableAlpha:Ne.bool,styles:Ne.object,defaultView:Ne.oneOf(["hex","rgb","hsl"])};Xm.defaultProps={width:225,disableAlpha:!1,styles:{}};ai(Xm);var IO=function(i){var u=i.color,s=i.onClick,c=s===void 0?function(){}:s,h=i.onSwatchHover,d=i.active,g=Je({default:{color:{background:u,width:"15px",height:"15px",float:"left",marginRight:"5px",marginBottom:"5px",position:"relative",cursor:"pointer"},dot:{absolute:"5px 5px 5px 5px",background:Bm(u),borderRadius:"50%",opacity:"0"}},active:{dot:{opacity:"1"}},"color-#FFFFFF":{color:{boxShadow:"inset 0 0 0 1px #ddd"},dot:{background:"#000"}},transparent:{dot:{background:"#000"}}},{active:d,"color-#FFFFFF":u==="#FFFFFF",transparent:u==="transparent"});return J.createElement(eo,{style:g.color,color:u,onClick:c,onHover:h,focusStyle:{boxShadow:"0 0 4px "+u}},J.createElement("div",{style:g.dot}))},$O=function(i){var u=i.hex,s=i.rgb,c=i.onChange,h=Je({default:{fields:{display:"flex",paddingBottom:"6px",paddingRight:"5px",position:"relative"},active:{position:"absolute",top:"6px",left:"5px",height:"9px",width:"9px",background:u},HEXwrap:{flex:"6",position:"relative"},HEXinput:{width:"80%",padding:"0px",paddingLeft:"20%",border:"none",outline:"none",background:"none",fontSize:"12px",color:"#333",height:"16px"},HEXlabel:{display:"none"},RGBwrap:{flex:"3",position:"relative"},RGBinput:{width:"70%",padding:"0px",paddingLeft:"30%",border:"none",outline:"none",background:"none",fontSize:"12px",color:"#333",height:"16px"},RGBlabel:{position:"absolute",top:"3px",left:"0px",lineHeight:"16px",textTransform:"uppercase",fontSize:"12px",color:"#999"}}}),d=function(v,p){v.r||v.g||v.b?c({r:v.r||s.r,g:v.g||s.g,b:v.b||s.b,source:"rgb"},p):c({hex:v.hex,source:"hex"},p)};return J.createElement("div",{style:h.fields,className:"flexbox-fix"},J.createElement("div",{style:h.active}),J.createElement(Et,{style:{wrap:h.HEXwrap,input:h.HEXinput,label:h.HEXlabel},label:"hex",value:u,onChange:d}),J.createElement(Et,{style:{wrap:h.RGBwrap,input:h.RGBinput,label:h.RGBlabel},label:"r",value:s.r,onChange:d}),J.createElement(Et,{style:{wrap:h.RGBwrap,input:h.RGBinput,label:h.RGBlabel},label:"g",value:s.g,onChange:d}),J.createElement(Et,{style:{wrap:h.RGBwrap,input:h.RGBinput,label:h.RGBlabel},label:"b",value:s.b,onChange:d}))},Km=function(i){var u=i.onChange,s=i.onSwatchHover,c=i.colors,h=i.hex,d=i.rgb,g=i.styles,v=g===void 0?{}:g,p=i.className,_=p===void 0?"":p,T=Je(ti({default:{Compact:{background:"#f6f6f6",radius:"4px"},compact:{paddingTop:"5px",paddingLeft:"5px",boxSizing:"initial",width:"240px"},clear:{clear:"both"}}},v)),C=function(E,O){E.hex?ku(E.hex)&&u({hex:E.hex,source:"hex"},O):u(E,O)};return J.createElement(Sd,{style:T.Compact,styles:v},J.createElement("div",{style:T.compact,className:"compact-picker "+_},J.createElement("div",null,to(c,function(x){return J.createElement(IO,{key:x,color:x,active:x.toLowerCase()===h,onClick:C,onSwatchHover:s})}),J.createElement("div",{style:T.clear})),J.createElement($O,{hex:h,rgb:d,onChange:C})))};Km.propTypes={colors:Ne.arrayOf(Ne.string),styles:Ne.object};Km.defaultProps={colors:["#4D4D4D","#999999","#FFFFFF","#F44E3B","#FE9200","#FCDC00","#DBDF00","#A4DD00","#68CCCA","#73D8FF","#AEA1FF","#FDA1FF","#333333","#808080","#cccccc","#D33115","#E27300","#FCC400","#B0BC00","#68BC00","#16A5A5","#009CE0","#7B64FF","#FA28FF","#000000","#666666","#B3B3B3","#9F0500","#C45100","#FB9E00","#808900","#194D33","#0C797D","#0062B1","#653294","#AB149E"],styles:{}};ai(Km);var eM=function(i){var u=i.hover,s=i.color,c=i.onClick,h=i.onSwatchHover,d={position:"relative",zIndex:"2",outline:"2px solid #fff",boxShadow:"0 0 5px 2px rgba(0,0,0,0.25)"},g=Je({default:{swatch:{width:"25px",height:"25px",fontSize:"0"}},hover:{swatch:d}},{hover:u});return J.createElement("div",{style:g.swatch},J.createElement(eo,{color:s,onClick:c,onHover:h,focusStyle:d}))};const tM=Mm.handleHover(eM);var Fm=function(i){var u=i.width,s=i.colors,c=i.onChange,h=i.onSwatchHover,d=i.triangle,g=i.styles,v=g===void 0?{}:g,p=i.className,_=p===void 0?"":p,T=Je(ti({default:{card:{width:u,background:"#fff",border:"1px solid rgba(0,0,0,0.2)",boxShadow:"0 3px 12px rgba(0,0,0,0.15)",borderRadius:"4px",position:"relative",padding:"5px",display:"flex",flexWrap:"wrap"},triangle:{position:"absolute",border:"7px solid transparent",borderBottomColor:"#fff"},triangleShadow:{position:"absolute",border:"8px solid transparent",borderBottomColor:"rgba(0,0,0,0.15)"}},"hide-triangle":{triangle:{display:"none"},triangleShadow:{display:"none"}},"top-left-triangle":{triangle:{top:"-14px",left:"10px"},triangleShadow:{top:"-16px",left:"9px"}},"top-right-triangle":{triangle:{top:"-14px",right:"10px"},triangleShadow:{top:"-16px",right:"9px"}},"bottom-left-triangle":{triangle:{top:"35px",left:"10px",transform:"rotate(180deg)"},triangleShadow:{top:"37px",left:"9px",transform:"rotate(180deg)"}},"bottom-right-triangle":{triangle:{top:"35px",right:"10px",transform:"rotate(180deg)"},triangleShadow:{top:"37px",right:"9px",transform:"rotate(180deg)"}}},v),{"hide-triangle":d==="hide","top-left-triangle":d==="top-left","top-right-triangle":d==="top-right","bottom-left-triangle":d==="bottom-left","bottom-right-triangle":d==="bottom-right"}),C=function(E,O){return c({hex:E,source:"hex"},O)};return J.createElement("div",{style:T.card,className:"github-picker "+_},J.createElement("div",{style:T.triangleShadow}),J.createElement("div",{style:T.triangle}),to(s,function(x){return J.createElement(tM,{color:x,key:x,onClick:C,onSwatchHover:h})}))};Fm.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),colors:Ne.arrayOf(Ne.string),triangle:Ne.oneOf(["hide","top-left","top-right","bottom-left","bottom-right"]),styles:Ne.object};Fm.defaultProps={width:200,colors:["#B80000","#DB3E00","#FCCB00","#008B02","#006B76","#1273DE","#004DCF","#5300EB","#EB9694","#FAD0C3","#FEF3BD","#C1E1C5","#BEDADC","#C4DEF6","#BED3F3","#D4C4FB"],triangle:"top-left",styles:{}};ai(Fm);var aM=function(i){var u=i.direction,s=Je({default:{picker:{width:"18px",height:"18px",borderRadius:"50%",transform:"translate(-9px, -1px)",backgroundColor:"rgb(248, 248, 248)",boxShadow:"0 1px 4px 0 rgba(0, 0, 0, 0.37)"}},vertical:{picker:{transform:"translate(-3px, -9px)"}}},{vertical:u==="vertical"});return J.createElement("div",{style:s.picker})},nM=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},km=function(i){var u=i.width,s=i.height,c=i.onChange,h=i.hsl,d=i.direction,g=i.pointer,v=i.styles,p=v===void 0?{}:v,_=i.className,T=_===void 0?"":_,C=Je(ti({default:{picker:{position:"relative",width:u,height:s},hue:{radius:"2px"}}},p)),x=function(O){return c({a:1,h:O.h,l:.5,s:1})};return J.createElement("div",{style:C.picker,className:"hue-picker "+T},J.createElement(Lc,nM({},C.hue,{hsl:h,pointer:g,onChange:x,direction:d})))};km.propTypes={styles:Ne.object};km.defaultProps={width:"316px",height:"16px",direction:"horizontal",pointer:aM,styles:{}};ai(km);var iM=function(i){var u=i.onChange,s=i.hex,c=i.rgb,h=i.styles,d=h===void 0?{}:h,g=i.className,v=g===void 0?"":g,p=Je(ti({default:{material:{width:"98px",height:"98px",padding:"16px",fontFamily:"Roboto"},HEXwrap:{position:"relative"},HEXinput:{width:"100%",marginTop:"12px",fontSize:"15px",color:"#333",padding:"0px",border:"0px",borderBottom:"2px solid "+s,outline:"none",height:"30px"},HEXlabel:{position:"absolute",top:"0px",left:"0px",fontSize:"11px",color:"#999999",textTransform:"capitalize"},Hex:{style:{}},RGBwrap:{position:"relative"},RGBinput:{width:"100%",marginTop:"12px",fontSize:"15px",color:"#333",padding:"0px",border:"0px",borderBottom:"1px solid #eee",outline:"none",height:"30px"},RGBlabel:{position:"absolute",top:"0px",left:"0px",fontSize:"11px",color:"#999999",textTransform:"capitalize"},split:{display:"flex",marginRight:"-10px",paddingTop:"11px"},third:{flex:"1",paddingRight:"10px"}}},d)),_=function(C,x){C.hex?ku(C.hex)&&u({hex:C.hex,source:"hex"},x):(C.r||C.g||C.b)&&u({r:C.r||c.r,g:C.g||c.g,b:C.b||c.b,source:"rgb"},x)};return J.createElement(Sd,{styles:d},J.createElement("div",{style:p.material,className:"material-picker "+v},J.createElement(Et,{style:{wrap:p.HEXwrap,input:p.HEXinput,label:p.HEXlabel},label:"hex",value:s,onChange:_}),J.createElement("div",{style:p.split,className:"flexbox-fix"},J.createElement("div",{style:p.third},J.createElement(Et,{style:{wrap:p.RGBwrap,input:p.RGBinput,label:p.RGBlabel},label:"r",value:c.r,onChange:_})),J.createElement("div",{style:p.third},J.createElement(Et,{style:{wrap:p.RGBwrap,input:p.RGBinput,label:p.RGBlabel},label:"g",value:c.g,onChange:_})),J.createElement("div",{style:p.third},J.createElement(Et,{style:{wrap:p.RGBwrap,input:p.RGBinput,label:p.RGBlabel},label:"b",value:c.b,onChange:_})))))};ai(iM);var rM=function(i){var u=i.onChange,s=i.rgb,c=i.hsv,h=i.hex,d=Je({default:{fields:{paddingTop:"5px",paddingBottom:"9px",width:"80px",position:"relative"},divider:{height:"5px"},RGBwrap:{position:"relative"},RGBinput:{marginLeft:"40%",width:"40%",height:"18px",border:"1px solid #888888",boxShadow:"inset 0 1px 1px rgba(0,0,0,.1), 0 1px 0 0 #ECECEC",marginBottom:"5px",fontSize:"13px",paddingLeft:"3px",marginRight:"10px"},RGBlabel:{left:"0px",top:"0px",width:"34px",textTransform:"uppercase",fontSize:"13px",height:"18px",lineHeight:"22px",position:"absolute"},HEXwrap:{position:"relative"},HEXinput:{marginLeft:"20%",width:"80%",height:"18px",border:"1px solid #888888",boxShadow:"inset 0 1px 1px rgba(0,0,0,.1), 0 1px 0 0 #ECECEC",marginBottom:"6px",fontSize:"13px",paddingLeft:"3px"},HEXlabel:{position:"absolute",top:"0px",left:"0px",width:"14px",textTransform:"uppercase",fontSize:"13px",height:"18px",lineHeight:"22px"},fieldSymbols:{position:"absolute",top:"5px",right:"-7px",fontSize:"13px"},symbol:{height:"20px",lineHeight:"22px",paddingBottom:"7px"}}}),g=function(p,_){p["#"]?ku(p["#"])&&u({hex:p["#"],source:"hex"},_):p.r||p.g||p.b?u({r:p.r||s.r,g:p.g||s.g,b:p.b||s.b,source:"rgb"},_):(p.h||p.s||p.v)&&u({h:p.h||c.h,s:p.s||c.s,v:p.v||c.v,source:"hsv"},_)};return J.createElement("div",{style:d.fields},J.createElement(Et,{style:{wrap:d.RGBwrap,input:d.RGBinput,label:d.RGBlabel},label:"h",value:Math.round(c.h),onChange:g}),J.createElement(Et,{style:{wrap:d.RGBwrap,input:d.RGBinput,label:d.RGBlabel},label:"s",value:Math.round(c.s*100),onChange:g}),J.createElement(Et,{style:{wrap:d.RGBwrap,input:d.RGBinput,label:d.RGBlabel},label:"v",value:Math.round(c.v*100),onChange:g}),J.createElement("div",{style:d.divider}),J.createElement(Et,{style:{wrap:d.RGBwrap,input:d.RGBinput,label:d.RGBlabel},label:"r",value:s.r,onChange:g}),J.createElement(Et,{style:{wrap:d.RGBwrap,input:d.RGBinput,label:d.RGBlabel},label:"g",value:s.g,onChange:g}),J.createElement(Et,{style:{wrap:d.RGBwrap,input:d.RGBinput,label:d.RGBlabel},label:"b",value:s.b,onChange:g}),J.createElement("div",{style:d.divider}),J.createElement(Et,{style:{wrap:d.HEXwrap,input:d.HEXinput,label:d.HEXlabel},label:"#",value:h.replace("#",""),onChange:g}),J.createElement("div",{style:d.fieldSymbols},J.createElement("div",{style:d.symbol},"°"),J.createElement("div",{style:d.symbol},"%"),J.createElement("div",{style:d.symbol},"%")))},lM=function(i){var u=i.hsl,s=Je({default:{picker:{width:"12px",height:"12px",borderRadius:"6px",boxShadow:"inset 0 0 0 1px #fff",transform:"translate(-6px, -6px)"}},"black-outline":{picker:{boxShadow:"inset 0 0 0 1px #000"}}},{"black-outline":u.l>.5});return J.createElement("div",{style:s.picker})},uM=function(){var i=Je({default:{triangle:{width:0,height:0,borderStyle:"solid",borderWidth:"4px 0 4px 6px",borderColor:"transparent transparent transparent #fff",position:"absolute",top:"1px",left:"1px"},triangleBorder:{width:0,height:0,borderStyle:"solid",borderWidth:"5px 0 5px 8px",borderColor:"transparent transparent transparent #555"},left:{Extend:"triangleBorder",transform:"translate(-13px, -4px)"},leftInside:{Extend:"triangle",transform:"translate(-8px, -5px)"},right:{Extend:"triangleBorder",transform:"translate(20px, -14px) rotate(180deg)"},rightInside:{Extend:"triangle",transform:"translate(-8px, -5px)"}}});return J.createElement("div",{style:i.pointer},J.createElement("div",{style:i.left},J.createElement("div",{style:i.leftInside})),J.createElement("div",{style:i.right},J.createElement("div",{style:i.rightInside})))},e6=function(i){var u=i.onClick,s=i.label,c=i.children,h=i.active,d=Je({default:{button:{backgroundImage:"linear-gradient(-180deg, #FFFFFF 0%, #E6E6E6 100%)",border:"1px solid #878787",borderRadius:"2px",height:"20px",boxShadow:"0 1px 0 0 #EAEAEA",fontSize:"14px",color:"#000",lineHeight:"20px",textAlign:"center",marginBottom:"10px",cursor:"pointer"}},active:{button:{boxShadow:"0 0 0 1px #878787"}}},{active:h});return J.createElement("div",{style:d.button,onClick:u},s||c)},sM=function(i){var u=i.rgb,s=i.currentColor,c=Je({default:{swatches:{border:"1px solid #B3B3B3",borderBottom:"1px solid #F0F0F0",marginBottom:"2px",marginTop:"1px"},new:{height:"34px",background:"rgb("+u.r+","+u.g+", "+u.b+")",boxShadow:"inset 1px 0 0 #000, inset -1px 0 0 #000, inset 0 1px 0 #000"},current:{height:"34px",background:s,boxShadow:"inset 1px 0 0 #000, inset -1px 0 0 #000, inset 0 -1px 0 #000"},label:{fontSize:"14px",color:"#000",textAlign:"center"}}});return J.createElement("div",null,J.createElement("div",{style:c.label},"new"),J.createElement("div",{style:c.swatches},J.createElement("div",{style:c.new}),J.createElement("div",{style:c.current})),J.createElement("div",{style:c.label},"current"))},oM=function(){function n(i,u){for(var s=0;s<u.length;s++){var c=u[s];c.enumerable=c.enumerable||!1,c.configurable=!0,"value"in c&&(c.writable=!0),Object.defineProperty(i,c.key,c)}}return function(i,u,s){return u&&n(i.prototype,u),s&&n(i,s),i}}();function cM(n,i){if(!(n instanceof i))throw new TypeError("Cannot call a class as a function")}function fM(n,i){if(!n)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return i&&(typeof i=="object"||typeof i=="function")?i:n}function hM(n,i){if(typeof i!="function"&&i!==null)throw new TypeError("Super expression must either be null or a function, not "+typeof i);n.prototype=Object.create(i&&i.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),i&&(Object.setPrototypeOf?Object.setPrototypeOf(n,i):n.__proto__=i)}var Qm=function(n){hM(i,n);function i(u){cM(this,i);var s=fM(this,(i.__proto__||Object.getPrototypeOf(i)).call(this));return s.state={currentColor:u.hex},s}return oM(i,[{key:"render",value:function(){var s=this.props,c=s.styles,h=c===void 0?{}:c,d=s.className,g=d===void 0?"":d,v=Je(ti({default:{picker:{background:"#DCDCDC",borderRadius:"4px",boxShadow:"0 0 0 1px rgba(0,0,0,.25), 0 8px 16px rgba(0,0,0,.15)",boxSizing:"initial",width:"513px"},head:{backgroundImage:"linear-gradient(-180deg, #F0F0F0 0%, #D4D4D4 100%)",borderBottom:"1px solid #B1B1B1",boxShadow:"inset 0 1px 0 0 rgba(255,255,255,.2), inset 0 -1px 0 0 rgba(0,0,0,.02)",height:"23px",lineHeight:"24px",borderRadius:"4px 4px 0 0",fontSize:"13px",color:"#4D4D4D",textAlign:"center"},body:{padding:"15px 15px 0",display:"flex"},saturation:{width:"256px",height:"256px",position:"relative",border:"2px solid #B3B3B3",borderBottom:"2px solid #F0F0F0",overflow:"hidden"},hue:{position:"relative",height:"256px",width:"19px",marginLeft:"10px",border:"2px solid #B3B3B3",borderBottom:"2px solid #F0F0F0"},controls:{width:"180px",marginLeft:"10px"},top:{display:"flex"},previews:{width:"60px"},actions:{flex:"1",marginLeft:"20px"}}},h));return J.createElement("div",{style:v.picker,className:"photoshop-picker "+g},J.createElement("div",{style:v.head},this.props.header),J.createElement("div",{style:v.body,className:"flexbox-fix"},J.createElement("div",{style:v.saturation},J.createElement(N1,{hsl:this.props.hsl,hsv:this.props.hsv,pointer:lM,onChange:this.props.onChange})),J.createElement("div",{style:v.hue},J.createElement(Lc,{direction:"vertical",hsl:this.props.hsl,pointer:uM,onChange:this.props.onChange})),J.createElement("div",{style:v.controls},J.createElement("div",{style:v.top,className:"flexbox-fix"},J.createElement("div",{style:v.previews},J.createElement(sM,{rgb:this.props.rgb,currentColor:this.state.currentColor})),J.createElement("div",{style:v.actions},J.createElement(e6,{label:"OK",onClick:this.props.onAccept,active:!0}),J.createElement(e6,{label:"Cancel",onClick:this.props.onCancel}),J.createElement(rM,{onChange:this.props.onChange,rgb:this.props.rgb,hsv:this.props.hsv,hex:this.props.hex}))))))}}]),i}(J.Component);Qm.propTypes={header:Ne.string,styles:Ne.object};Qm.defaultProps={header:"Color Picker",styles:{}};ai(Qm);var dM=function(i){var u=i.onChange,s=i.rgb,c=i.hsl,h=i.hex,d=i.disableAlpha,g=Je({default:{fields:{display:"flex",paddingTop:"4px"},single:{flex:"1",paddingLeft:"6px"},alpha:{flex:"1",paddingLeft:"6px"},double:{flex:"2"},input:{width:"80%",padding:"4px 10% 3px",border:"none",boxShadow:"inset 0 0 0 1px #ccc",fontSize:"11px"},label:{display:"block",textAlign:"center",fontSize:"11px",color:"#222",paddingTop:"3px",paddingBottom:"4px",textTransform:"capitalize"}},disableAlpha:{alpha:{display:"none"}}},{disableAlpha:d}),v=function(_,T){_.hex?ku(_.hex)&&u({hex:_.hex,source:"hex"},T):_.r||_.g||_.b?u({r:_.r||s.r,g:_.g||s.g,b:_.b||s.b,a:s.a,source:"rgb"},T):_.a&&(_.a<0?_.a=0:_.a>100&&(_.a=100),_.a/=100,u({h:c.h,s:c.s,l:c.l,a:_.a,source:"rgb"},T))};return J.createElement("div",{style:g.fields,className:"flexbox-fix"},J.createElement("div",{style:g.double},J.createElement(Et,{style:{input:g.input,label:g.label},label:"hex",value:h.replace("#",""),onChange:v})),J.createElement("div",{style:g.single},J.createElement(Et,{style:{input:g.input,label:g.label},label:"r",value:s.r,onChange:v,dragLabel:"true",dragMax:"255"})),J.createElement("div",{style:g.single},J.createElement(Et,{style:{input:g.input,label:g.label},label:"g",value:s.g,onChange:v,dragLabel:"true",dragMax:"255"})),J.createElement("div",{style:g.single},J.createElement(Et,{style:{input:g.input,label:g.label},label:"b",value:s.b,onChange:v,dragLabel:"true",dragMax:"255"})),J.createElement("div",{style:g.alpha},J.createElement(Et,{style:{input:g.input,label:g.label},label:"a",value:Math.round(s.a*100),onChange:v,dragLabel:"true",dragMax:"100"})))},gM=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},q8=function(i){var u=i.colors,s=i.onClick,c=s===void 0?function(){}:s,h=i.onSwatchHover,d=Je({default:{colors:{margin:"0 -10px",padding:"10px 0 0 10px",borderTop:"1px solid #eee",display:"flex",flexWrap:"wrap",position:"relative"},swatchWrap:{width:"16px",height:"16px",margin:"0 10px 10px 0"},swatch:{borderRadius:"3px",boxShadow:"inset 0 0 0 1px rgba(0,0,0,.15)"}},"no-presets":{colors:{display:"none"}}},{"no-presets":!u||!u.length}),g=function(p,_){c({hex:p,source:"hex"},_)};return J.createElement("div",{style:d.colors,className:"flexbox-fix"},u.map(function(v){var p=typeof v=="string"?{color:v}:v,_=""+p.color+(p.title||"");return J.createElement("div",{key:_,style:d.swatchWrap},J.createElement(eo,gM({},p,{style:d.swatch,onClick:g,onHover:h,focusStyle:{boxShadow:"inset 0 0 0 1px rgba(0,0,0,.15), 0 0 4px "+p.color}})))}))};q8.propTypes={colors:Ne.arrayOf(Ne.oneOfType([Ne.string,Ne.shape({color:Ne.string,title:Ne.string})])).isRequired};var pM=Object.assign||function(n){for(var i=1;i<arguments.length;i++){var u=arguments[i];for(var s in u)Object.prototype.hasOwnProperty.call(u,s)&&(n[s]=u[s])}return n},Zm=function(i){var u=i.width,s=i.rgb,c=i.hex,h=i.hsv,d=i.hsl,g=i.onChange,v=i.onSwatchHover,p=i.disableAlpha,_=i.presetColors,T=i.renderers,C=i.styles,x=C===void 0?{}:C,E=i.className,O=E===void 0?"":E,w=Je(ti({default:pM({picker:{width:u,padding:"10px 10px 0",boxSizing:"initial",background:"#fff",borderRadius:"4px",boxShadow:"0 0 0 1px rgba(0,0,0,.15), 0 8px 16px rgba(0,0,0,.15)"},saturation:{width:"100%",paddingBottom:"75%",position:"relative",overflow:"hidden"},Saturation:{radius:"3px",shadow:"inset 0 0 0 1px rgba(0,0,0,.15), inset 0 0 4px rgba(0,0,0,.25)"},controls:{display:"flex"},sliders:{padding:"4px 0",flex:"1"},color:{width:"24px",height:"24px",position:"relative",marginTop:"4px",marginLeft:"4px",borderRadius:"3px"},activeColor:{absolute:"0px 0px 0px 0px",borderRadius:"2px",background:"rgba("+s.r+","+s.g+","+s.b+","+s.a+")",boxShadow:"inset 0 0 0 1px rgba(0,0,0,.15), inset 0 0 4px rgba(0,0,0,.25)"},hue:{position:"relative",height:"10px",overflow:"hidden"},Hue:{radius:"2px",shadow:"inset 0 0 0 1px rgba(0,0,0,.15), inset 0 0 4px rgba(0,0,0,.25)"},alpha:{position:"relative",height:"10px",marginTop:"4px",overflow:"hidden"},Alpha:{radius:"2px",shadow:"inset 0 0 0 1px rgba(0,0,0,.15), inset 0 0 4px rgba(0,0,0,.25)"}},x),disableAlpha:{color:{height:"10px"},hue:{height:"10px"},alpha:{display:"none"}}},x),{disableAlpha:p});return J.createElement("div",{style:w.picker,className:"sketch-picker "+O},J.createElement("div",{style:w.saturation},J.createElement(N1,{style:w.Saturation,hsl:d,hsv:h,onChange:g})),J.createElement("div",{style:w.controls,className:"flexbox-fix"},J.createElement("div",{style:w.sliders},J.createElement("div",{style:w.hue},J.createElement(Lc,{style:w.Hue,hsl:d,onChange:g})),J.createElement("div",{style:w.alpha},J.createElement(wm,{style:w.Alpha,rgb:s,hsl:d,renderers:T,onChange:g}))),J.createElement("div",{style:w.color},J.createElement(Bc,null),J.createElement("div",{style:w.activeColor}))),J.createElement(dM,{rgb:s,hsl:d,hex:c,onChange:g,disableAlpha:p}),J.createElement(q8,{colors:_,onClick:g,onSwatchHover:v}))};Zm.propTypes={disableAlpha:Ne.bool,width:Ne.oneOfType([Ne.string,Ne.number]),styles:Ne.object};Zm.defaultProps={disableAlpha:!1,width:200,styles:{},presetColors:["#D0021B","#F5A623","#F8E71C","#8B572A","#7ED321","#417505","#BD10E0","#9013FE","#4A90E2","#50E3C2","#B8E986","#000000","#4A4A4A","#9B9B9B","#FFFFFF"]};const vM=ai(Zm);var ph=function(i){var u=i.hsl,s=i.offset,c=i.onClick,h=c===void 0?function(){}:c,d=i.active,g=i.first,v=i.last,p=Je({default:{swatch:{height:"12px",background:"hsl("+u.h+", 50%, "+s*100+"%)",cursor:"pointer"}},first:{swatch:{borderRadius:"2px 0 0 2px"}},last:{swatch:{borderRadius:"0 2px 2px 0"}},active:{swatch:{transform:"scaleY(1.8)",borderRadius:"3.6px/2px"}}},{active:d,first:g,last:v}),_=function(C){return h({h:u.h,s:.5,l:s,source:"hsl"},C)};return J.createElement("div",{style:p.swatch,onClick:_})},mM=function(i){var u=i.onClick,s=i.hsl,c=Je({default:{swatches:{marginTop:"20px"},swatch:{boxSizing:"border-box",width:"20%",paddingRight:"1px",float:"left"},clear:{clear:"both"}}}),h=.1;return J.createElement("div",{style:c.swatches},J.createElement("div",{style:c.swatch},J.createElement(ph,{hsl:s,offset:".80",active:Math.abs(s.l-.8)<h&&Math.abs(s.s-.5)<h,onClick:u,first:!0})),J.createElement("div",{style:c.swatch},J.createElement(ph,{hsl:s,offset:".65",active:Math.abs(s.l-.65)<h&&Math.abs(s.s-.5)<h,onClick:u})),J.createElement("div",{style:c.swatch},J.createElement(ph,{hsl:s,offset:".50",active:Math.abs(s.l-.5)<h&&Math.abs(s.s-.5)<h,onClick:u})),J.createElement("div",{style:c.swatch},J.createElement(ph,{hsl:s,offset:".35",active:Math.abs(s.l-.35)<h&&Math.abs(s.s-.5)<h,onClick:u})),J.createElement("div",{style:c.swatch},J.createElement(ph,{hsl:s,offset:".20",active:Math.abs(s.l-.2)<h&&Math.abs(s.s-.5)<h,onClick:u,last:!0})),J.createElement("div",{style:c.clear}))},yM=function(){var i=Je({default:{picker:{width:"14px",height:"14px",borderRadius:"6px",transform:"translate(-7px, -1px)",backgroundColor:"rgb(248, 248, 248)",boxShadow:"0 1px 4px 0 rgba(0, 0, 0, 0.37)"}}});return J.createElement("div",{style:i.picker})},Jm=function(i){var u=i.hsl,s=i.onChange,c=i.pointer,h=i.styles,d=h===void 0?{}:h,g=i.className,v=g===void 0?"":g,p=Je(ti({default:{hue:{height:"12px",position:"relative"},Hue:{radius:"2px"}}},d));return J.createElement("div",{style:p.wrap||{},className:"slider-picker "+v},J.createElement("div",{style:p.hue},J.createElement(Lc,{style:p.Hue,hsl:u,pointer:c,onChange:s})),J.createElement("div",{style:p.swatches},J.createElement(mM,{hsl:u,onClick:s})))};Jm.propTypes={styles:Ne.object};Jm.defaultProps={pointer:yM,styles:{}};ai(Jm);var i1={},t6;function bM(){if(t6)return i1;t6=1,Object.defineProperty(i1,"__esModule",{value:!0});var n=Object.assign||function(d){for(var g=1;g<arguments.length;g++){var v=arguments[g];for(var p in v)Object.prototype.hasOwnProperty.call(v,p)&&(d[p]=v[p])}return d},i=Fu(),u=s(i);function s(d){return d&&d.__esModule?d:{default:d}}function c(d,g){var v={};for(var p in d)g.indexOf(p)>=0||Object.prototype.hasOwnProperty.call(d,p)&&(v[p]=d[p]);return v}var h=24;return i1.default=function(d){var g=d.fill,v=g===void 0?"currentColor":g,p=d.width,_=p===void 0?h:p,T=d.height,C=T===void 0?h:T,x=d.style,E=x===void 0?{}:x,O=c(d,["fill","width","height","style"]);return u.default.createElement("svg",n({viewBox:"0 0 "+h+" "+h,style:n({fill:v,width:_,height:C},E)},O),u.default.createElement("path",{d:"M21,7L9,19L3.5,13.5L4.91,12.09L9,16.17L19.59,5.59L21,7Z"}))},i1}var _M=bM();const SM=Ku(_M);var xM=function(i){var u=i.color,s=i.onClick,c=s===void 0?function(){}:s,h=i.onSwatchHover,d=i.first,g=i.last,v=i.active,p=Je({default:{color:{width:"40px",height:"24px",cursor:"pointer",background:u,marginBottom:"1px"},check:{color:Bm(u),marginLeft:"8px",display:"none"}},first:{color:{overflow:"hidden",borderRadius:"2px 2px 0 0"}},last:{color:{overflow:"hidden",borderRadius:"0 0 2px 2px"}},active:{check:{display:"block"}},"color-#FFFFFF":{color:{boxShadow:"inset 0 0 0 1px #ddd"},check:{color:"#333"}},transparent:{check:{color:"#333"}}},{first:d,last:g,active:v,"color-#FFFFFF":u==="#FFFFFF",transparent:u==="transparent"});return J.createElement(eo,{color:u,style:p.color,onClick:c,onHover:h,focusStyle:{boxShadow:"0 0 4px "+u}},J.createElement("div",{style:p.check},J.createElement(SM,null)))},EM=function(i){var u=i.onClick,s=i.onSwatchHover,c=i.group,h=i.active,d=Je({default:{group:{paddingBottom:"10px",width:"40px",float:"left",marginRight:"10px"}}});return J.createElement("div",{style:d.group},to(c,function(g,v){return J.createElement(xM,{key:g,color:g,active:g.toLowerCase()===h,first:v===0,last:v===c.length-1,onClick:u,onSwatchHover:s})}))},Wm=function(i){var u=i.width,s=i.height,c=i.onChange,h=i.onSwatchHover,d=i.colors,g=i.hex,v=i.styles,p=v===void 0?{}:v,_=i.className,T=_===void 0?"":_,C=Je(ti({default:{picker:{width:u,height:s},overflow:{height:s,overflowY:"scroll"},body:{padding:"16px 0 6px 16px"},clear:{clear:"both"}}},p)),x=function(O,w){return c({hex:O,source:"hex"},w)};return J.createElement("div",{style:C.picker,className:"swatches-picker "+T},J.createElement(Sd,null,J.createElement("div",{style:C.overflow},J.createElement("div",{style:C.body},to(d,function(E){return J.createElement(EM,{key:E.toString(),group:E,active:g,onClick:x,onSwatchHover:h})}),J.createElement("div",{style:C.clear})))))};Wm.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),height:Ne.oneOfType([Ne.string,Ne.number]),colors:Ne.arrayOf(Ne.arrayOf(Ne.string)),styles:Ne.object};Wm.defaultProps={width:320,height:240,colors:[[vc[900],vc[700],vc[500],vc[300],vc[100]],[mc[900],mc[700],mc[500],mc[300],mc[100]],[yc[900],yc[700],yc[500],yc[300],yc[100]],[bc[900],bc[700],bc[500],bc[300],bc[100]],[_c[900],_c[700],_c[500],_c[300],_c[100]],[Sc[900],Sc[700],Sc[500],Sc[300],Sc[100]],[xc[900],xc[700],xc[500],xc[300],xc[100]],[Ec[900],Ec[700],Ec[500],Ec[300],Ec[100]],[Cc[900],Cc[700],Cc[500],Cc[300],Cc[100]],["#194D33",od[700],od[500],od[300],od[100]],[Tc[900],Tc[700],Tc[500],Tc[300],Tc[100]],[Ac[900],Ac[700],Ac[500],Ac[300],Ac[100]],[Rc[900],Rc[700],Rc[500],Rc[300],Rc[100]],[Oc[900],Oc[700],Oc[500],Oc[300],Oc[100]],[Mc[900],Mc[700],Mc[500],Mc[300],Mc[100]],[wc[900],wc[700],wc[500],wc[300],wc[100]],[Nc[900],Nc[700],Nc[500],Nc[300],Nc[100]],[Dc[900],Dc[700],Dc[500],Dc[300],Dc[100]],["#000000","#525252","#969696","#D9D9D9","#FFFFFF"]],styles:{}};ai(Wm);var Im=function(i){var u=i.onChange,s=i.onSwatchHover,c=i.hex,h=i.colors,d=i.width,g=i.triangle,v=i.styles,p=v===void 0?{}:v,_=i.className,T=_===void 0?"":_,C=Je(ti({default:{card:{width:d,background:"#fff",border:"0 solid rgba(0,0,0,0.25)",boxShadow:"0 1px 4px rgba(0,0,0,0.25)",borderRadius:"4px",position:"relative"},body:{padding:"15px 9px 9px 15px"},label:{fontSize:"18px",color:"#fff"},triangle:{width:"0px",height:"0px",borderStyle:"solid",borderWidth:"0 9px 10px 9px",borderColor:"transparent transparent #fff transparent",position:"absolute"},triangleShadow:{width:"0px",height:"0px",borderStyle:"solid",borderWidth:"0 9px 10px 9px",borderColor:"transparent transparent rgba(0,0,0,.1) transparent",position:"absolute"},hash:{background:"#F0F0F0",height:"30px",width:"30px",borderRadius:"4px 0 0 4px",float:"left",color:"#98A1A4",display:"flex",alignItems:"center",justifyContent:"center"},input:{width:"100px",fontSize:"14px",color:"#666",border:"0px",outline:"none",height:"28px",boxShadow:"inset 0 0 0 1px #F0F0F0",boxSizing:"content-box",borderRadius:"0 4px 4px 0",float:"left",paddingLeft:"8px"},swatch:{width:"30px",height:"30px",float:"left",borderRadius:"4px",margin:"0 6px 6px 0"},clear:{clear:"both"}},"hide-triangle":{triangle:{display:"none"},triangleShadow:{display:"none"}},"top-left-triangle":{triangle:{top:"-10px",left:"12px"},triangleShadow:{top:"-11px",left:"12px"}},"top-right-triangle":{triangle:{top:"-10px",right:"12px"},triangleShadow:{top:"-11px",right:"12px"}}},p),{"hide-triangle":g==="hide","top-left-triangle":g==="top-left","top-right-triangle":g==="top-right"}),x=function(O,w){ku(O)&&u({hex:O,source:"hex"},w)};return J.createElement("div",{style:C.card,className:"twitter-picker "+T},J.createElement("div",{style:C.triangleShadow}),J.createElement("div",{style:C.triangle}),J.createElement("div",{style:C.body},to(h,function(E,O){return J.createElement(eo,{key:O,color:E,hex:E,style:C.swatch,onClick:x,onHover:s,focusStyle:{boxShadow:"0 0 4px "+E}})}),J.createElement("div",{style:C.hash},"#"),J.createElement(Et,{label:null,style:{input:C.input},value:c.replace("#",""),onChange:x}),J.createElement("div",{style:C.clear})))};Im.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),triangle:Ne.oneOf(["hide","top-left","top-right"]),colors:Ne.arrayOf(Ne.string),styles:Ne.object};Im.defaultProps={width:276,colors:["#FF6900","#FCB900","#7BDCB5","#00D084","#8ED1FC","#0693E3","#ABB8C3","#EB144C","#F78DA7","#9900EF"],triangle:"top-left",styles:{}};ai(Im);var $m=function(i){var u=Je({default:{picker:{width:"20px",height:"20px",borderRadius:"22px",border:"2px #fff solid",transform:"translate(-12px, -13px)",background:"hsl("+Math.round(i.hsl.h)+", "+Math.round(i.hsl.s*100)+"%, "+Math.round(i.hsl.l*100)+"%)"}}});return J.createElement("div",{style:u.picker})};$m.propTypes={hsl:Ne.shape({h:Ne.number,s:Ne.number,l:Ne.number,a:Ne.number})};$m.defaultProps={hsl:{a:1,h:249.94,l:.2,s:.5}};var ey=function(i){var u=Je({default:{picker:{width:"20px",height:"20px",borderRadius:"22px",transform:"translate(-10px, -7px)",background:"hsl("+Math.round(i.hsl.h)+", 100%, 50%)",border:"2px white solid"}}});return J.createElement("div",{style:u.picker})};ey.propTypes={hsl:Ne.shape({h:Ne.number,s:Ne.number,l:Ne.number,a:Ne.number})};ey.defaultProps={hsl:{a:1,h:249.94,l:.2,s:.5}};var CM=function(i){var u=i.onChange,s=i.rgb,c=i.hsl,h=i.hex,d=i.hsv,g=function(x,E){if(x.hex)ku(x.hex)&&u({hex:x.hex,source:"hex"},E);else if(x.rgb){var O=x.rgb.split(",");O2(x.rgb,"rgb")&&u({r:O[0],g:O[1],b:O[2],a:1,source:"rgb"},E)}else if(x.hsv){var w=x.hsv.split(",");O2(x.hsv,"hsv")&&(w[2]=w[2].replace("%",""),w[1]=w[1].replace("%",""),w[0]=w[0].replace("°",""),w[1]==1?w[1]=.01:w[2]==1&&(w[2]=.01),u({h:Number(w[0]),s:Number(w[1]),v:Number(w[2]),source:"hsv"},E))}else if(x.hsl){var U=x.hsl.split(",");O2(x.hsl,"hsl")&&(U[2]=U[2].replace("%",""),U[1]=U[1].replace("%",""),U[0]=U[0].replace("°",""),T[1]==1?T[1]=.01:T[2]==1&&(T[2]=.01),u({h:Number(U[0]),s:Number(U[1]),v:Number(U[2]),source:"hsl"},E))}},v=Je({default:{wrap:{display:"flex",height:"100px",marginTop:"4px"},fields:{width:"100%"},column:{paddingTop:"10px",display:"flex",justifyContent:"space-between"},double:{padding:"0px 4.4px",boxSizing:"border-box"},input:{width:"100%",height:"38px",boxSizing:"border-box",padding:"4px 10% 3px",textAlign:"center",border:"1px solid #dadce0",fontSize:"11px",textTransform:"lowercase",borderRadius:"5px",outline:"none",fontFamily:"Roboto,Arial,sans-serif"},input2:{height:"38px",width:"100%",border:"1px solid #dadce0",boxSizing:"border-box",fontSize:"11px",textTransform:"lowercase",borderRadius:"5px",outline:"none",paddingLeft:"10px",fontFamily:"Roboto,Arial,sans-serif"},label:{textAlign:"center",fontSize:"12px",background:"#fff",position:"absolute",textTransform:"uppercase",color:"#3c4043",width:"35px",top:"-6px",left:"0",right:"0",marginLeft:"auto",marginRight:"auto",fontFamily:"Roboto,Arial,sans-serif"},label2:{left:"10px",textAlign:"center",fontSize:"12px",background:"#fff",position:"absolute",textTransform:"uppercase",color:"#3c4043",width:"32px",top:"-6px",fontFamily:"Roboto,Arial,sans-serif"},single:{flexGrow:"1",margin:"0px 4.4px"}}}),p=s.r+", "+s.g+", "+s.b,_=Math.round(c.h)+"°, "+Math.round(c.s*100)+"%, "+Math.round(c.l*100)+"%",T=Math.round(d.h)+"°, "+Math.round(d.s*100)+"%, "+Math.round(d.v*100)+"%";return J.createElement("div",{style:v.wrap,className:"flexbox-fix"},J.createElement("div",{style:v.fields},J.createElement("div",{style:v.double},J.createElement(Et,{style:{input:v.input,label:v.label},label:"hex",value:h,onChange:g})),J.createElement("div",{style:v.column},J.createElement("div",{style:v.single},J.createElement(Et,{style:{input:v.input2,label:v.label2},label:"rgb",value:p,onChange:g})),J.createElement("div",{style:v.single},J.createElement(Et,{style:{input:v.input2,label:v.label2},label:"hsv",value:T,onChange:g})),J.createElement("div",{style:v.single},J.createElement(Et,{style:{input:v.input2,label:v.label2},label:"hsl",value:_,onChange:g})))))},ty=function(i){var u=i.width,s=i.onChange,c=i.rgb,h=i.hsl,d=i.hsv,g=i.hex,v=i.header,p=i.styles,_=p===void 0?{}:p,T=i.className,C=T===void 0?"":T,x=Je(ti({default:{picker:{width:u,background:"#fff",border:"1px solid #dfe1e5",boxSizing:"initial",display:"flex",flexWrap:"wrap",borderRadius:"8px 8px 0px 0px"},head:{height:"57px",width:"100%",paddingTop:"16px",paddingBottom:"16px",paddingLeft:"16px",fontSize:"20px",boxSizing:"border-box",fontFamily:"Roboto-Regular,HelveticaNeue,Arial,sans-serif"},saturation:{width:"70%",padding:"0px",position:"relative",overflow:"hidden"},swatch:{width:"30%",height:"228px",padding:"0px",background:"rgba("+c.r+", "+c.g+", "+c.b+", 1)",position:"relative",overflow:"hidden"},body:{margin:"auto",width:"95%"},controls:{display:"flex",boxSizing:"border-box",height:"52px",paddingTop:"22px"},color:{width:"32px"},hue:{height:"8px",position:"relative",margin:"0px 16px 0px 16px",width:"100%"},Hue:{radius:"2px"}}},_));return J.createElement("div",{style:x.picker,className:"google-picker "+C},J.createElement("div",{style:x.head},v),J.createElement("div",{style:x.swatch}),J.createElement("div",{style:x.saturation},J.createElement(N1,{hsl:h,hsv:d,pointer:$m,onChange:s})),J.createElement("div",{style:x.body},J.createElement("div",{style:x.controls,className:"flexbox-fix"},J.createElement("div",{style:x.hue},J.createElement(Lc,{style:x.Hue,hsl:h,radius:"4px",pointer:ey,onChange:s}))),J.createElement(CM,{rgb:c,hsl:h,hex:g,hsv:d,onChange:s})))};ty.propTypes={width:Ne.oneOfType([Ne.string,Ne.number]),styles:Ne.object,header:Ne.string};ty.defaultProps={width:652,styles:{},header:"Color picker"};ai(ty);var s1={exports:{}},vh={},w2={},N2={},a6;function ct(){return a6||(a6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n._registerNode=n.Konva=n.glob=void 0;const i=Math.PI/180;function u(){return typeof window<"u"&&({}.toString.call(window)==="[object Window]"||{}.toString.call(window)==="[object global]")}n.glob=typeof Uc<"u"?Uc:typeof window<"u"?window:typeof WorkerGlobalScope<"u"?self:{},n.Konva={_global:n.glob,version:"9.3.20",isBrowser:u(),isUnminified:/param/.test((function(c){}).toString()),dblClickWindow:400,getAngle(c){return n.Konva.angleDeg?c*i:c},enableTrace:!1,pointerEventsEnabled:!0,autoDrawEnabled:!0,hitOnDragEnabled:!1,capturePointerEventsEnabled:!1,_mouseListenClick:!1,_touchListenClick:!1,_pointerListenClick:!1,_mouseInDblClickWindow:!1,_touchInDblClickWindow:!1,_pointerInDblClickWindow:!1,_mouseDblClickPointerId:null,_touchDblClickPointerId:null,_pointerDblClickPointerId:null,_fixTextRendering:!1,pixelRatio:typeof window<"u"&&window.devicePixelRatio||1,dragDistance:3,angleDeg:!0,showWarnings:!0,dragButtons:[0,1],isDragging(){return n.Konva.DD.isDragging},isTransforming(){var c;return(c=n.Konva.Transformer)===null||c===void 0?void 0:c.isTransforming()},isDragReady(){return!!n.Konva.DD.node},releaseCanvasOnDestroy:!0,document:n.glob.document,_injectGlobal(c){n.glob.Konva=c}};const s=c=>{n.Konva[c.prototype.getClassName()]=c};n._registerNode=s,n.Konva._injectGlobal(n.Konva)}(N2)),N2}var D2={},n6;function Ea(){return n6||(n6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.Util=n.Transform=void 0;const i=ct();class u{constructor(z=[1,0,0,1,0,0]){this.dirty=!1,this.m=z&&z.slice()||[1,0,0,1,0,0]}reset(){this.m[0]=1,this.m[1]=0,this.m[2]=0,this.m[3]=1,this.m[4]=0,this.m[5]=0}copy(){return new u(this.m)}copyInto(z){z.m[0]=this.m[0],z.m[1]=this.m[1],z.m[2]=this.m[2],z.m[3]=this.m[3],z.m[4]=this.m[4],z.m[5]=this.m[5]}point(z){const G=this.m;return{x:G[0]*z.x+G[2]*z.y+G[4],y:G[1]*z.x+G[3]*z.y+G[5]}}translate(z,G){return this.m[4]+=this.m[0]*z+this.m[2]*G,this.m[5]+=this.m[1]*z+this.m[3]*G,this}scale(z,G){return this.m[0]*=z,this.m[1]*=z,this.m[2]*=G,this.m[3]*=G,this}rotate(z){const G=Math.cos(z),B=Math.sin(z),Q=this.m[0]*G+this.m[2]*B,X=this.m[1]*G+this.m[3]*B,Y=this.m[0]*-B+this.m[2]*G,V=this.m[1]*-B+this.m[3]*G;return this.m[0]=Q,this.m[1]=X,this.m[2]=Y,this.m[3]=V,this}getTranslation(){return{x:this.m[4],y:this.m[5]}}skew(z,G){const B=this.m[0]+this.m[2]*G,Q=this.m[1]+this.m[3]*G,X=this.m[2]+this.m[0]*z,Y=this.m[3]+this.m[1]*z;return this.m[0]=B,this.m[1]=Q,this.m[2]=X,this.m[3]=Y,this}multiply(z){const G=this.m[0]*z.m[0]+this.m[2]*z.m[1],B=this.m[1]*z.m[0]+this.m[3]*z.m[1],Q=this.m[0]*z.m[2]+this.m[2]*z.m[3],X=this.m[1]*z.m[2]+this.m[3]*z.m[3],Y=this.m[0]*z.m[4]+this.m[2]*z.m[5]+this.m[4],V=this.m[1]*z.m[4]+this.m[3]*z.m[5]+this.m[5];return this.m[0]=G,this.m[1]=B,this.m[2]=Q,this.m[3]=X,this.m[4]=Y,this.m[5]=V,this}invert(){const z=1/(this.m[0]*this.m[3]-this.m[1]*this.m[2]),G=this.m[3]*z,B=-this.m[1]*z,Q=-this.m[2]*z,X=this.m[0]*z,Y=z*(this.m[2]*this.m[5]-this.m[3]*this.m[4]),V=z*(this.m[1]*this.m[4]-this.m[0]*this.m[5]);return this.m[0]=G,this.m[1]=B,this.m[2]=Q,this.m[3]=X,this.m[4]=Y,this.m[5]=V,this}getMatrix(){return this.m}decompose(){const z=this.m[0],G=this.m[1],B=this.m[2],Q=this.m[3],X=this.m[4],Y=this.m[5],V=z*Q-G*B,F={x:X,y:Y,rotation:0,scaleX:0,scaleY:0,skewX:0,skewY:0};if(z!=0||G!=0){const I=Math.sqrt(z*z+G*G);F.rotation=G>0?Math.acos(z/I):-Math.acos(z/I),F.scaleX=I,F.scaleY=V/I,F.skewX=(z*B+G*Q)/V,F.skewY=0}else if(B!=0||Q!=0){const I=Math.sqrt(B*B+Q*Q);F.rotation=Math.PI/2-(Q>0?Math.acos(-B/I):-Math.acos(B/I)),F.scaleX=V/I,F.scaleY=I,F.skewX=0,F.skewY=(z*B+G*Q)/V}return F.rotation=n.Util._getRotation(F.rotation),F}}n.Transform=u;const s="[object Array]",c="[object Number]",h="[object String]",d="[object Boolean]",g=Math.PI/180,v=180/Math.PI,p="#",_="",T="0",C="Konva warning: ",x="Konva error: ",E="rgb(",O={aliceblue:[240,248,255],antiquewhite:[250,235,215],aqua:[0,255,255],aquamarine:[127,255,212],azure:[240,255,255],beige:[245,245,220],bisque:[255,228,196],black:[0,0,0],blanchedalmond:[255,235,205],blue:[0,0,255],blueviolet:[138,43,226],brown:[165,42,42],burlywood:[222,184,135],cadetblue:[95,158,160],chartreuse:[127,255,0],chocolate:[210,105,30],coral:[255,127,80],cornflowerblue:[100,149,237],cornsilk:[255,248,220],crimson:[220,20,60],cyan:[0,255,255],darkblue:[0,0,139],darkcyan:[0,139,139],darkgoldenrod:[184,132,11],darkgray:[169,169,169],darkgreen:[0,100,0],darkgrey:[169,169,169],darkkhaki:[189,183,107],darkmagenta:[139,0,139],darkolivegreen:[85,107,47],darkorange:[255,140,0],darkorchid:[153,50,204],darkred:[139,0,0],darksalmon:[233,150,122],darkseagreen:[143,188,143],darkslateblue:[72,61,139],darkslategray:[47,79,79],darkslategrey:[47,79,79],darkturquoise:[0,206,209],darkviolet:[148,0,211],deeppink:[255,20,147],deepskyblue:[0,191,255],dimgray:[105,105,105],dimgrey:[105,105,105],dodgerblue:[30,144,255],firebrick:[178,34,34],floralwhite:[255,255,240],forestgreen:[34,139,34],fuchsia:[255,0,255],gainsboro:[220,220,220],ghostwhite:[248,248,255],gold:[255,215,0],goldenrod:[218,165,32],gray:[128,128,128],green:[0,128,0],greenyellow:[173,255,47],grey:[128,128,128],honeydew:[240,255,240],hotpink:[255,105,180],indianred:[205,92,92],indigo:[75,0,130],ivory:[255,255,240],khaki:[240,230,140],lavender:[230,230,250],lavenderblush:[255,240,245],lawngreen:[124,252,0],lemonchiffon:[255,250,205],lightblue:[173,216,230],lightcoral:[240,128,128],lightcyan:[224,255,255],lightgoldenrodyellow:[250,250,210],lightgray:[211,211,211],lightgreen:[144,238,144],lightgrey:[211,211,211],lightpink:[255,182,193],lightsalmon:[255,160,122],lightseagreen:[32,178,170],lightskyblue:[135,206,250],lightslategray:[119,136,153],lightslategrey:[119,136,153],lightsteelblue:[176,196,222],lightyellow:[255,255,224],lime:[0,255,0],limegreen:[50,205,50],linen:[250,240,230],magenta:[255,0,255],maroon:[128,0,0],mediumaquamarine:[102,205,170],mediumblue:[0,0,205],mediumorchid:[186,85,211],mediumpurple:[147,112,219],mediumseagreen:[60,179,113],mediumslateblue:[123,104,238],mediumspringgreen:[0,250,154],mediumturquoise:[72,209,204],mediumvioletred:[199,21,133],midnightblue:[25,25,112],mintcream:[245,255,250],mistyrose:[255,228,225],moccasin:[255,228,181],navajowhite:[255,222,173],navy:[0,0,128],oldlace:[253,245,230],olive:[128,128,0],olivedrab:[107,142,35],orange:[255,165,0],orangered:[255,69,0],orchid:[218,112,214],palegoldenrod:[238,232,170],palegreen:[152,251,152],paleturquoise:[175,238,238],palevioletred:[219,112,147],papayawhip:[255,239,213],peachpuff:[255,218,185],peru:[205,133,63],pink:[255,192,203],plum:[221,160,203],powderblue:[176,224,230],purple:[128,0,128],rebeccapurple:[102,51,153],red:[255,0,0],rosybrown:[188,143,143],royalblue:[65,105,225],saddlebrown:[139,69,19],salmon:[250,128,114],sandybrown:[244,164,96],seagreen:[46,139,87],seashell:[255,245,238],sienna:[160,82,45],silver:[192,192,192],skyblue:[135,206,235],slateblue:[106,90,205],slategray:[119,128,144],slategrey:[119,128,144],snow:[255,255,250],springgreen:[0,255,127],steelblue:[70,130,180],tan:[210,180,140],teal:[0,128,128],thistle:[216,191,216],transparent:[255,255,255,0],tomato:[255,99,71],turquoise:[64,224,208],violet:[238,130,238],wheat:[245,222,179],white:[255,255,255],whitesmoke:[245,245,245],yellow:[255,255,0],yellowgreen:[154,205,5]},w=/rgb\((\d{1,3}),(\d{1,3}),(\d{1,3})\)/;let U=[];const A=typeof requestAnimationFrame<"u"&&requestAnimationFrame||function(R){setTimeout(R,60)};n.Util={_isElement(R){return!!(R&&R.nodeType==1)},_isFunction(R){return!!(R&&R.constructor&&R.call&&R.apply)},_isPlainObject(R){return!!R&&R.constructor===Object},_isArray(R){return Object.prototype.toString.call(R)===s},_isNumber(R){return Object.prototype.toString.call(R)===c&&!isNaN(R)&&isFinite(R)},_isString(R){return Object.prototype.toString.call(R)===h},_isBoolean(R){return Object.prototype.toString.call(R)===d},isObject(R){return R instanceof Object},isValidSelector(R){if(typeof R!="string")return!1;const z=R[0];return z==="#"||z==="."||z===z.toUpperCase()},_sign(R){return R===0||R>0?1:-1},requestAnimFrame(R){U.push(R),U.length===1&&A(function(){const z=U;U=[],z.forEach(function(G){G()})})},createCanvasElement(){const R=document.createElement("canvas");try{R.style=R.style||{}}catch{}return R},createImageElement(){return document.createElement("img")},_isInDocument(R){for(;R=R.parentNode;)if(R==document)return!0;return!1},_urlToImage(R,z){const G=n.Util.createImageElement();G.onload=function(){z(G)},G.src=R},_rgbToHex(R,z,G){return((1<<24)+(R<<16)+(z<<8)+G).toString(16).slice(1)},_hexToRgb(R){R=R.replace(p,_);const z=parseInt(R,16);return{r:z>>16&255,g:z>>8&255,b:z&255}},getRandomColor(){let R=(Math.random()*16777215<<0).toString(16);for(;R.length<6;)R=T+R;return p+R},getRGB(R){let z;return R in O?(z=O[R],{r:z[0],g:z[1],b:z[2]}):R[0]===p?this._hexToRgb(R.substring(1)):R.substr(0,4)===E?(z=w.exec(R.replace(/ /g,"")),{r:parseInt(z[1],10),g:parseInt(z[2],10),b:parseInt(z[3],10)}):{r:0,g:0,b:0}},colorToRGBA(R){return R=R||"black",n.Util._namedColorToRBA(R)||n.Util._hex3ColorToRGBA(R)||n.Util._hex4ColorToRGBA(R)||n.Util._hex6ColorToRGBA(R)||n.Util._hex8ColorToRGBA(R)||n.Util._rgbColorToRGBA(R)||n.Util._rgbaColorToRGBA(R)||n.Util._hslColorToRGBA(R)},_namedColorToRBA(R){const z=O[R.toLowerCase()];return z?{r:z[0],g:z[1],b:z[2],a:1}:null},_rgbColorToRGBA(R){if(R.indexOf("rgb(")===0){R=R.match(/rgb\(([^)]+)\)/)[1];const z=R.split(/ *, */).map(Number);return{r:z[0],g:z[1],b:z[2],a:1}}},_rgbaColorToRGBA(R){if(R.indexOf("rgba(")===0){R=R.match(/rgba\(([^)]+)\)/)[1];const z=R.split(/ *, */).map((G,B)=>G.slice(-1)==="%"?B===3?parseInt(G)/100:parseInt(G)/100*255:Number(G));return{r:z[0],g:z[1],b:z[2],a:z[3]}}},_hex8ColorToRGBA(R){if(R[0]==="#"&&R.length===9)return{r:parseInt(R.slice(1,3),16),g:parseInt(R.slice(3,5),16),b:parseInt(R.slice(5,7),16),a:parseInt(R.slice(7,9),16)/255}},_hex6ColorToRGBA(R){if(R[0]==="#"&&R.length===7)return{r:parseInt(R.slice(1,3),16),g:parseInt(R.slice(3,5),16),b:parseInt(R.slice(5,7),16),a:1}},_hex4ColorToRGBA(R){if(R[0]==="#"&&R.length===5)return{r:parseInt(R[1]+R[1],16),g:parseInt(R[2]+R[2],16),b:parseInt(R[3]+R[3],16),a:parseInt(R[4]+R[4],16)/255}},_hex3ColorToRGBA(R){if(R[0]==="#"&&R.length===4)return{r:parseInt(R[1]+R[1],16),g:parseInt(R[2]+R[2],16),b:parseInt(R[3]+R[3],16),a:1}},_hslColorToRGBA(R){if(/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.test(R)){const[z,...G]=/hsl\((\d+),\s*([\d.]+)%,\s*([\d.]+)%\)/g.exec(R),B=Number(G[0])/360,Q=Number(G[1])/100,X=Number(G[2])/100;let Y,V,F;if(Q===0)return F=X*255,{r:Math.round(F),g:Math.round(F),b:Math.round(F),a:1};X<.5?Y=X*(1+Q):Y=X+Q-X*Q;const I=2*X-Y,D=[0,0,0];for(let P=0;P<3;P++)V=B+1/3*-(P-1),V<0&&V++,V>1&&V--,6*V<1?F=I+(Y-I)*6*V:2*V<1?F=Y:3*V<2?F=I+(Y-I)*(2/3-V)*6:F=I,D[P]=F*255;return{r:Math.round(D[0]),g:Math.round(D[1]),b:Math.round(D[2]),a:1}}},haveIntersection(R,z){return!(z.x>R.x+R.width||z.x+z.width<R.x||z.y>R.y+R.height||z.y+z.height<R.y)},cloneObject(R){const z={};for(const G in R)this._isPlainObject(R[G])?z[G]=this.cloneObject(R[G]):this._isArray(R[G])?z[G]=this.cloneArray(R[G]):z[G]=R[G];return z},cloneArray(R){return R.slice(0)},degToRad(R){return R*g},radToDeg(R){return R*v},_degToRad(R){return n.Util.warn("Util._degToRad is removed. Please use public Util.degToRad instead."),n.Util.degToRad(R)},_radToDeg(R){return n.Util.warn("Util._radToDeg is removed. Please use public Util.radToDeg instead."),n.Util.radToDeg(R)},_getRotation(R){return i.Konva.angleDeg?n.Util.radToDeg(R):R},_capitalize(R){return R.charAt(0).toUpperCase()+R.slice(1)},throw(R){throw new Error(x+R)},error(R){console.error(x+R)},warn(R){i.Konva.showWarnings&&console.warn(C+R)},each(R,z){for(const G in R)z(G,R[G])},_inRange(R,z,G){return z<=R&&R<G},_getProjectionToSegment(R,z,G,B,Q,X){let Y,V,F;const I=(R-G)*(R-G)+(z-B)*(z-B);if(I==0)Y=R,V=z,F=(Q-G)*(Q-G)+(X-B)*(X-B);else{const D=((Q-R)*(G-R)+(X-z)*(B-z))/I;D<0?(Y=R,V=z,F=(R-Q)*(R-Q)+(z-X)*(z-X)):D>1?(Y=G,V=B,F=(G-Q)*(G-Q)+(B-X)*(B-X)):(Y=R+D*(G-R),V=z+D*(B-z),F=(Y-Q)*(Y-Q)+(V-X)*(V-X))}return[Y,V,F]},_getProjectionToLine(R,z,G){const B=n.Util.cloneObject(R);let Q=Number.MAX_VALUE;return z.forEach(function(X,Y){if(!G&&Y===z.length-1)return;const V=z[(Y+1)%z.length],F=n.Util._getProjectionToSegment(X.x,X.y,V.x,V.y,R.x,R.y),I=F[0],D=F[1],P=F[2];P<Q&&(B.x=I,B.y=D,Q=P)}),B},_prepareArrayForTween(R,z,G){const B=[],Q=[];if(R.length>z.length){const Y=z;z=R,R=Y}for(let Y=0;Y<R.length;Y+=2)B.push({x:R[Y],y:R[Y+1]});for(let Y=0;Y<z.length;Y+=2)Q.push({x:z[Y],y:z[Y+1]});const X=[];return Q.forEach(function(Y){const V=n.Util._getProjectionToLine(Y,B,G);X.push(V.x),X.push(V.y)}),X},_prepareToStringify(R){let z;R.visitedByCircularReferenceRemoval=!0;for(const G in R)if(R.hasOwnProperty(G)&&R[G]&&typeof R[G]=="object"){if(z=Object.getOwnPropertyDescriptor(R,G),R[G].visitedByCircularReferenceRemoval||n.Util._isElement(R[G]))if(z.configurable)delete R[G];else return null;else if(n.Util._prepareToStringify(R[G])===null)if(z.configurable)delete R[G];else return null}return delete R.visitedByCircularReferenceRemoval,R},_assign(R,z){for(const G in z)R[G]=z[G];return R},_getFirstPointerId(R){return R.touches?R.changedTouches[0].identifier:R.pointerId||999},releaseCanvas(...R){i.Konva.releaseCanvasOnDestroy&&R.forEach(z=>{z.width=0,z.height=0})},drawRoundedRectPath(R,z,G,B){let Q=0,X=0,Y=0,V=0;typeof B=="number"?Q=X=Y=V=Math.min(B,z/2,G/2):(Q=Math.min(B[0]||0,z/2,G/2),X=Math.min(B[1]||0,z/2,G/2),V=Math.min(B[2]||0,z/2,G/2),Y=Math.min(B[3]||0,z/2,G/2)),R.moveTo(Q,0),R.lineTo(z-X,0),R.arc(z-X,X,X,Math.PI*3/2,0,!1),R.lineTo(z,G-V),R.arc(z-V,G-V,V,0,Math.PI/2,!1),R.lineTo(Y,G),R.arc(Y,G-Y,Y,Math.PI/2,Math.PI,!1),R.lineTo(0,Q),R.arc(Q,Q,Q,Math.PI,Math.PI*3/2,!1)}}}(D2)),D2}var mh={},z2={},$n={},i6;function _t(){if(i6)return $n;i6=1,Object.defineProperty($n,"__esModule",{value:!0}),$n.RGBComponent=s,$n.alphaComponent=c,$n.getNumberValidator=h,$n.getNumberOrArrayOfNumbersValidator=d,$n.getNumberOrAutoValidator=g,$n.getStringValidator=v,$n.getStringOrGradientValidator=p,$n.getFunctionValidator=_,$n.getNumberArrayValidator=T,$n.getBooleanValidator=C,$n.getComponentValidator=x;const n=ct(),i=Ea();function u(E){return i.Util._isString(E)?'"'+E+'"':Object.prototype.toString.call(E)==="[object Number]"||i.Util._isBoolean(E)?E:Object.prototype.toString.call(E)}function s(E){return E>255?255:E<0?0:Math.round(E)}function c(E){return E>1?1:E<1e-4?1e-4:E}function h(){if(n.Konva.isUnminified)return function(E,O){return i.Util._isNumber(E)||i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a number.'),E}}function d(E){if(n.Konva.isUnminified)return function(O,w){let U=i.Util._isNumber(O),A=i.Util._isArray(O)&&O.length==E;return!U&&!A&&i.Util.warn(u(O)+' is a not valid value for "'+w+'" attribute. The value should be a number or Array<number>('+E+")"),O}}function g(){if(n.Konva.isUnminified)return function(E,O){var w=i.Util._isNumber(E),U=E==="auto";return w||U||i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a number or "auto".'),E}}function v(){if(n.Konva.isUnminified)return function(E,O){return i.Util._isString(E)||i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a string.'),E}}function p(){if(n.Konva.isUnminified)return function(E,O){const w=i.Util._isString(E),U=Object.prototype.toString.call(E)==="[object CanvasGradient]"||E&&E.addColorStop;return w||U||i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a string or a native gradient.'),E}}function _(){if(n.Konva.isUnminified)return function(E,O){return i.Util._isFunction(E)||i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a function.'),E}}function T(){if(n.Konva.isUnminified)return function(E,O){const w=Int8Array?Object.getPrototypeOf(Int8Array):null;return w&&E instanceof w||(i.Util._isArray(E)?E.forEach(function(U){i.Util._isNumber(U)||i.Util.warn('"'+O+'" attribute has non numeric element '+U+". Make sure that all elements are numbers.")}):i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a array of numbers.')),E}}function C(){if(n.Konva.isUnminified)return function(E,O){var w=E===!0||E===!1;return w||i.Util.warn(u(E)+' is a not valid value for "'+O+'" attribute. The value should be a boolean.'),E}}function x(E){if(n.Konva.isUnminified)return function(O,w){return O==null||i.Util.isObject(O)||i.Util.warn(u(O)+' is a not valid value for "'+w+'" attribute. The value should be an object with properties '+E),O}}return $n}var r6;function vt(){return r6||(r6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.Factory=void 0;const i=Ea(),u=_t(),s="get",c="set";n.Factory={addGetterSetter(h,d,g,v,p){n.Factory.addGetter(h,d,g),n.Factory.addSetter(h,d,v,p),n.Factory.addOverloadedGetterSetter(h,d)},addGetter(h,d,g){var v=s+i.Util._capitalize(d);h.prototype[v]=h.prototype[v]||function(){const p=this.attrs[d];return p===void 0?g:p}},addSetter(h,d,g,v){var p=c+i.Util._capitalize(d);h.prototype[p]||n.Factory.overWriteSetter(h,d,g,v)},overWriteSetter(h,d,g,v){var p=c+i.Util._capitalize(d);h.prototype[p]=function(_){return g&&_!==void 0&&_!==null&&(_=g.call(this,_,d)),this._setAttr(d,_),v&&v.call(this),this}},addComponentsGetterSetter(h,d,g,v,p){const _=g.length,T=i.Util._capitalize,C=s+T(d),x=c+T(d);h.prototype[C]=function(){const O={};for(let w=0;w<_;w++){const U=g[w];O[U]=this.getAttr(d+T(U))}return O};const E=(0,u.getComponentValidator)(g);h.prototype[x]=function(O){const w=this.attrs[d];v&&(O=v.call(this,O,d)),E&&E.call(this,O,d);for(const U in O)O.hasOwnProperty(U)&&this._setAttr(d+T(U),O[U]);return O||g.forEach(U=>{this._setAttr(d+T(U),void 0)}),this._fireChangeEvent(d,w,O),p&&p.call(this),this},n.Factory.addOverloadedGetterSetter(h,d)},addOverloadedGetterSetter(h,d){var g=i.Util._capitalize(d),v=c+g,p=s+g;h.prototype[d]=function(){return arguments.length?(this[v](arguments[0]),this):this[p]()}},addDeprecatedGetterSetter(h,d,g,v){i.Util.error("Adding deprecated "+d);const p=s+i.Util._capitalize(d),_=d+" property is deprecated and will be removed soon. Look at Konva change log for more information.";h.prototype[p]=function(){i.Util.error(_);const T=this.attrs[d];return T===void 0?g:T},n.Factory.addSetter(h,d,v,function(){i.Util.error(_)}),n.Factory.addOverloadedGetterSetter(h,d)},backCompat(h,d){i.Util.each(d,function(g,v){const p=h.prototype[v],_=s+i.Util._capitalize(g),T=c+i.Util._capitalize(g);function C(){p.apply(this,arguments),i.Util.error('"'+g+'" method is deprecated and will be removed soon. Use ""'+v+'" instead.')}h.prototype[g]=C,h.prototype[_]=C,h.prototype[T]=C})},afterSetFilter(){this._filterUpToDate=!1}}}(z2)),z2}var jl={},Vl={},l6;function H8(){if(l6)return Vl;l6=1,Object.defineProperty(Vl,"__esModule",{value:!0}),Vl.HitContext=Vl.SceneContext=Vl.Context=void 0;const n=Ea(),i=ct();function u(U){const A=[],R=U.length,z=n.Util;for(let G=0;G<R;G++){let B=U[G];z._isNumber(B)?B=Math.round(B*1e3)/1e3:z._isString(B)||(B=B+""),A.push(B)}return A}const s=",",c="(",h=")",d="([",g="])",v=";",p="()",_="=",T=["arc","arcTo","beginPath","bezierCurveTo","clearRect","clip","closePath","createLinearGradient","createPattern","createRadialGradient","drawImage","ellipse","fill","fillText","getImageData","createImageData","lineTo","moveTo","putImageData","quadraticCurveTo","rect","roundRect","restore","rotate","save","scale","setLineDash","setTransform","stroke","strokeText","transform","translate"],C=["fillStyle","strokeStyle","shadowColor","shadowBlur","shadowOffsetX","shadowOffsetY","letterSpacing","lineCap","lineDashOffset","lineJoin","lineWidth","miterLimit","direction","font","textAlign","textBaseline","globalAlpha","globalCompositeOperation","imageSmoothingEnabled"],x=100;let E=class{constructor(A){this.canvas=A,i.Konva.enableTrace&&(this.traceArr=[],this._enableTrace())}fillShape(A){A.fillEnabled()&&this._fill(A)}_fill(A){}strokeShape(A){A.hasStroke()&&this._stroke(A)}_stroke(A){}fillStrokeShape(A){A.attrs.fillAfterStrokeEnabled?(this.strokeShape(A),this.fillShape(A)):(this.fillShape(A),this.strokeShape(A))}getTrace(A,R){let z=this.traceArr,G=z.length,B="",Q,X,Y,V;for(Q=0;Q<G;Q++)X=z[Q],Y=X.method,Y?(V=X.args,B+=Y,A?B+=p:n.Util._isArray(V[0])?B+=d+V.join(s)+g:(R&&(V=V.map(F=>typeof F=="number"?Math.floor(F):F)),B+=c+V.join(s)+h)):(B+=X.property,A||(B+=_+X.val)),B+=v;return B}clearTrace(){this.traceArr=[]}_trace(A){let R=this.traceArr,z;R.push(A),z=R.length,z>=x&&R.shift()}reset(){const A=this.getCanvas().getPixelRatio();this.setTransform(1*A,0,0,1*A,0,0)}getCanvas(){return this.canvas}clear(A){const R=this.getCanvas();A?this.clearRect(A.x||0,A.y||0,A.width||0,A.height||0):this.clearRect(0,0,R.getWidth()/R.pixelRatio,R.getHeight()/R.pixelRatio)}_applyLineCap(A){const R=A.attrs.lineCap;R&&this.setAttr("lineCap",R)}_applyOpacity(A){const R=A.getAbsoluteOpacity();R!==1&&this.setAttr("globalAlpha",R)}_applyLineJoin(A){const R=A.attrs.lineJoin;R&&this.setAttr("lineJoin",R)}setAttr(A,R){this._context[A]=R}arc(A,R,z,G,B,Q){this._context.arc(A,R,z,G,B,Q)}arcTo(A,R,z,G,B){this._context.arcTo(A,R,z,G,B)}beginPath(){this._context.beginPath()}bezierCurveTo(A,R,z,G,B,Q){this._context.bezierCurveTo(A,R,z,G,B,Q)}clearRect(A,R,z,G){this._context.clearRect(A,R,z,G)}clip(...A){this._context.clip.apply(this._context,A)}closePath(){this._context.closePath()}createImageData(A,R){const z=arguments;if(z.length===2)return this._context.createImageData(A,R);if(z.length===1)return this._context.createImageData(A)}createLinearGradient(A,R,z,G){return this._context.createLinearGradient(A,R,z,G)}createPattern(A,R){return this._context.createPattern(A,R)}createRadialGradient(A,R,z,G,B,Q){return this._context.createRadialGradient(A,R,z,G,B,Q)}drawImage(A,R,z,G,B,Q,X,Y,V){const F=arguments,I=this._context;F.length===3?I.drawImage(A,R,z):F.length===5?I.drawImage(A,R,z,G,B):F.length===9&&I.drawImage(A,R,z,G,B,Q,X,Y,V)}ellipse(A,R,z,G,B,Q,X,Y){this._context.ellipse(A,R,z,G,B,Q,X,Y)}isPointInPath(A,R,z,G){return z?this._context.isPointInPath(z,A,R,G):this._context.isPointInPath(A,R,G)}fill(...A){this._context.fill.apply(this._context,A)}fillRect(A,R,z,G){this._context.fillRect(A,R,z,G)}strokeRect(A,R,z,G){this._context.strokeRect(A,R,z,G)}fillText(A,R,z,G){G?this._context.fillText(A,R,z,G):this._context.fillText(A,R,z)}measureText(A){return this._context.measureText(A)}getImageData(A,R,z,G){return this._context.getImageData(A,R,z,G)}lineTo(A,R){this._context.lineTo(A,R)}moveTo(A,R){this._context.moveTo(A,R)}rect(A,R,z,G){this._context.rect(A,R,z,G)}roundRect(A,R,z,G,B){this._context.roundRect(A,R,z,G,B)}putImageData(A,R,z){this._context.putImageData(A,R,z)}quadraticCurveTo(A,R,z,G){this._context.quadraticCurveTo(A,R,z,G)}restore(){this._context.restore()}rotate(A){this._context.rotate(A)}save(){this._context.save()}scale(A,R){this._context.scale(A,R)}setLineDash(A){this._context.setLineDash?this._context.setLineDash(A):"mozDash"in this._context?this._context.mozDash=A:"webkitLineDash"in this._context&&(this._context.webkitLineDash=A)}getLineDash(){return this._context.getLineDash()}setTransform(A,R,z,G,B,Q){this._context.setTransform(A,R,z,G,B,Q)}stroke(A){A?this._context.stroke(A):this._context.stroke()}strokeText(A,R,z,G){this._context.strokeText(A,R,z,G)}transform(A,R,z,G,B,Q){this._context.transform(A,R,z,G,B,Q)}translate(A,R){this._context.translate(A,R)}_enableTrace(){let A=this,R=T.length,z=this.setAttr,G,B;const Q=function(X){let Y=A[X],V;A[X]=function(){return B=u(Array.prototype.slice.call(arguments,0)),V=Y.apply(A,arguments),A._trace({method:X,args:B}),V}};for(G=0;G<R;G++)Q(T[G]);A.setAttr=function(){z.apply(A,arguments);const X=arguments[0];let Y=arguments[1];(X==="shadowOffsetX"||X==="shadowOffsetY"||X==="shadowBlur")&&(Y=Y/this.canvas.getPixelRatio()),A._trace({property:X,val:Y})}}_applyGlobalCompositeOperation(A){const R=A.attrs.globalCompositeOperation;!R||R==="source-over"||this.setAttr("globalCompositeOperation",R)}};Vl.Context=E,C.forEach(function(U){Object.defineProperty(E.prototype,U,{get(){return this._context[U]},set(A){this._context[U]=A}})});class O extends E{constructor(A,{willReadFrequently:R=!1}={}){super(A),this._context=A._canvas.getContext("2d",{willReadFrequently:R})}_fillColor(A){const R=A.fill();this.setAttr("fillStyle",R),A._fillFunc(this)}_fillPattern(A){this.setAttr("fillStyle",A._getFillPattern()),A._fillFunc(this)}_fillLinearGradient(A){const R=A._getLinearGradient();R&&(this.setAttr("fillStyle",R),A._fillFunc(this))}_fillRadialGradient(A){const R=A._getRadialGradient();R&&(this.setAttr("fillStyle",R),A._fillFunc(this))}_fill(A){const R=A.fill(),z=A.getFillPriority();if(R&&z==="color"){this._fillColor(A);return}const G=A.getFillPatternImage();if(G&&z==="pattern"){this._fillPattern(A);return}const B=A.getFillLinearGradientColorStops();if(B&&z==="linear-gradient"){this._fillLinearGradient(A);return}const Q=A.getFillRadialGradientColorStops();if(Q&&z==="radial-gradient"){this._fillRadialGradient(A);return}R?this._fillColor(A):G?this._fillPattern(A):B?this._fillLinearGradient(A):Q&&this._fillRadialGradient(A)}_strokeLinearGradient(A){const R=A.getStrokeLinearGradientStartPoint(),z=A.getStrokeLinearGradientEndPoint(),G=A.getStrokeLinearGradientColorStops(),B=this.createLinearGradient(R.x,R.y,z.x,z.y);if(G){for(let Q=0;Q<G.length;Q+=2)B.addColorStop(G[Q],G[Q+1]);this.setAttr("strokeStyle",B)}}_stroke(A){const R=A.dash(),z=A.getStrokeScaleEnabled();if(A.hasStroke()){if(!z){this.save();const B=this.getCanvas().getPixelRatio();this.setTransform(B,0,0,B,0,0)}this._applyLineCap(A),R&&A.dashEnabled()&&(this.setLineDash(R),this.setAttr("lineDashOffset",A.dashOffset())),this.setAttr("lineWidth",A.strokeWidth()),A.getShadowForStrokeEnabled()||this.setAttr("shadowColor","rgba(0,0,0,0)"),A.getStrokeLinearGradientColorStops()?this._strokeLinearGradient(A):this.setAttr("strokeStyle",A.stroke()),A._strokeFunc(this),z||this.restore()}}_applyShadow(A){var R,z,G;const B=(R=A.getShadowRGBA())!==null&&R!==void 0?R:"black",Q=(z=A.getShadowBlur())!==null&&z!==void 0?z:5,X=(G=A.getShadowOffset())!==null&&G!==void 0?G:{x:0,y:0},Y=A.getAbsoluteScale(),V=this.canvas.getPixelRatio(),F=Y.x*V,I=Y.y*V;this.setAttr("shadowColor",B),this.setAttr("shadowBlur",Q*Math.min(Math.abs(F),Math.abs(I))),this.setAttr("shadowOffsetX",X.x*F),this.setAttr("shadowOffsetY",X.y*I)}}Vl.SceneContext=O;class w extends E{constructor(A){super(A),this._context=A._canvas.getContext("2d",{willReadFrequently:!0})}_fill(A){this.save(),this.setAttr("fillStyle",A.colorKey),A._fillFuncHit(this),this.restore()}strokeShape(A){A.hasHitStroke()&&this._stroke(A)}_stroke(A){if(A.hasHitStroke()){const R=A.getStrokeScaleEnabled();if(!R){this.save();const B=this.getCanvas().getPixelRatio();this.setTransform(B,0,0,B,0,0)}this._applyLineCap(A);const z=A.hitStrokeWidth(),G=z==="auto"?A.strokeWidth():z;this.setAttr("lineWidth",G),this.setAttr("strokeStyle",A.colorKey),A._strokeFuncHit(this),R||this.restore()}}}return Vl.HitContext=w,Vl}var u6;function U1(){if(u6)return jl;u6=1,Object.defineProperty(jl,"__esModule",{value:!0}),jl.HitCanvas=jl.SceneCanvas=jl.Canvas=void 0;const n=Ea(),i=H8(),u=ct();let s;function c(){if(s)return s;const v=n.Util.createCanvasElement(),p=v.getContext("2d");return s=function(){const _=u.Konva._global.devicePixelRatio||1,T=p.webkitBackingStorePixelRatio||p.mozBackingStorePixelRatio||p.msBackingStorePixelRatio||p.oBackingStorePixelRatio||p.backingStorePixelRatio||1;return _/T}(),n.Util.releaseCanvas(v),s}let h=class{constructor(p){this.pixelRatio=1,this.width=0,this.height=0,this.isCache=!1;const T=(p||{}).pixelRatio||u.Konva.pixelRatio||c();this.pixelRatio=T,this._canvas=n.Util.createCanvasElement(),this._canvas.style.padding="0",this._canvas.style.margin="0",this._canvas.style.border="0",this._canvas.style.background="transparent",this._canvas.style.position="absolute",this._canvas.style.top="0",this._canvas.style.left="0"}getContext(){return this.context}getPixelRatio(){return this.pixelRatio}setPixelRatio(p){const _=this.pixelRatio;this.pixelRatio=p,this.setSize(this.getWidth()/_,this.getHeight()/_)}setWidth(p){this.width=this._canvas.width=p*this.pixelRatio,this._canvas.style.width=p+"px";const _=this.pixelRatio;this.getContext()._context.scale(_,_)}setHeight(p){this.height=this._canvas.height=p*this.pixelRatio,this._canvas.style.height=p+"px";const _=this.pixelRatio;this.getContext()._context.scale(_,_)}getWidth(){return this.width}getHeight(){return this.height}setSize(p,_){this.setWidth(p||0),this.setHeight(_||0)}toDataURL(p,_){try{return this._canvas.toDataURL(p,_)}catch{try{return this._canvas.toDataURL()}catch(C){return n.Util.error("Unable to get data URL. "+C.message+" For more info read https://konvajs.org/docs/posts/Tainted_Canvas.html."),""}}}};jl.Canvas=h;class d extends h{constructor(p={width:0,height:0,willReadFrequently:!1}){super(p),this.context=new i.SceneContext(this,{willReadFrequently:p.willReadFrequently}),this.setSize(p.width,p.height)}}jl.SceneCanvas=d;class g extends h{constructor(p={width:0,height:0}){super(p),this.hitCanvas=!0,this.context=new i.HitContext(this),this.setSize(p.width,p.height)}}return jl.HitCanvas=g,jl}var U2={},s6;function ay(){return s6||(s6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.DD=void 0;const i=ct(),u=Ea();n.DD={get isDragging(){let s=!1;return n.DD._dragElements.forEach(c=>{c.dragStatus==="dragging"&&(s=!0)}),s},justDragged:!1,get node(){let s;return n.DD._dragElements.forEach(c=>{s=c.node}),s},_dragElements:new Map,_drag(s){const c=[];n.DD._dragElements.forEach((h,d)=>{const{node:g}=h,v=g.getStage();v.setPointersPositions(s),h.pointerId===void 0&&(h.pointerId=u.Util._getFirstPointerId(s));const p=v._changedPointerPositions.find(_=>_.id===h.pointerId);if(p){if(h.dragStatus!=="dragging"){const _=g.dragDistance();if(Math.max(Math.abs(p.x-h.startPointerPos.x),Math.abs(p.y-h.startPointerPos.y))<_||(g.startDrag({evt:s}),!g.isDragging()))return}g._setDragPosition(s,h),c.push(g)}}),c.forEach(h=>{h.fire("dragmove",{type:"dragmove",target:h,evt:s},!0)})},_endDragBefore(s){const c=[];n.DD._dragElements.forEach(h=>{const{node:d}=h,g=d.getStage();if(s&&g.setPointersPositions(s),!g._changedPointerPositions.find(_=>_.id===h.pointerId))return;(h.dragStatus==="dragging"||h.dragStatus==="stopped")&&(n.DD.justDragged=!0,i.Konva._mouseListenClick=!1,i.Konva._touchListenClick=!1,i.Konva._pointerListenClick=!1,h.dragStatus="stopped");const p=h.node.getLayer()||h.node instanceof i.Konva.Stage&&h.node;p&&c.indexOf(p)===-1&&c.push(p)}),c.forEach(h=>{h.draw()})},_endDragAfter(s){n.DD._dragElements.forEach((c,h)=>{c.dragStatus==="stopped"&&c.node.fire("dragend",{type:"dragend",target:c.node,evt:s},!0),c.dragStatus!=="dragging"&&n.DD._dragElements.delete(h)})}},i.Konva.isBrowser&&(window.addEventListener("mouseup",n.DD._endDragBefore,!0),window.addEventListener("touchend",n.DD._endDragBefore,!0),window.addEventListener("touchcancel",n.DD._endDragBefore,!0),window.addEventListener("mousemove",n.DD._drag),window.addEventListener("touchmove",n.DD._drag),window.addEventListener("mouseup",n.DD._endDragAfter,!1),window.addEventListener("touchend",n.DD._endDragAfter,!1),window.addEventListener("touchcancel",n.DD._endDragAfter,!1))}(U2)),U2}var o6;function wa(){if(o6)return mh;o6=1,Object.defineProperty(mh,"__esModule",{value:!0}),mh.Node=void 0;const n=Ea(),i=vt(),u=U1(),s=ct(),c=ay(),h=_t(),d="absoluteOpacity",g="allEventListeners",v="absoluteTransform",p="absoluteScale",_="canvas",T="Change",C="children",x="konva",E="listening",O="mouseenter",w="mouseleave",U="set",A="Shape",R=" ",z="stage",G="transform",B="Stage",Q="visible",X=["xChange.konva","yChange.konva","scaleXChange.konva","scaleYChange.konva","skewXChange.konva","skewYChange.konva","rotationChange.konva","offsetXChange.konva","offsetYChange.konva","transformsEnabledChange.konva"].join(R);let Y=1,V=class rm{constructor(D){this._id=Y++,this.eventListeners={},this.attrs={},this.index=0,this._allEventListeners=null,this.parent=null,this._cache=new Map,this._attachedDepsListeners=new Map,this._lastPos=null,this._batchingTransformChange=!1,this._needClearTransformCache=!1,this._filterUpToDate=!1,this._isUnderCache=!1,this._dragEventId=null,this._shouldFireChangeEvents=!1,this.setAttrs(D),this._shouldFireChangeEvents=!0}hasChildren(){return!1}_clearCache(D){(D===G||D===v)&&this._cache.get(D)?this._cache.get(D).dirty=!0:D?this._cache.delete(D):this._cache.clear()}_getCache(D,P){let H=this._cache.get(D);return(H===void 0||(D===G||D===v)&&H.dirty===!0)&&(H=P.call(this),this._cache.set(D,H)),H}_calculate(D,P,H){if(!this._attachedDepsListeners.get(D)){const N=P.map(L=>L+"Change.konva").join(R);this.on(N,()=>{this._clearCache(D)}),this._attachedDepsListeners.set(D,!0)}return this._getCache(D,H)}_getCanvasCache(){return this._cache.get(_)}_clearSelfAndDescendantCache(D){this._clearCache(D),D===v&&this.fire("absoluteTransformChange")}clearCache(){if(this._cache.has(_)){const{scene:D,filter:P,hit:H}=this._cache.get(_);n.Util.releaseCanvas(D,P,H),this._cache.delete(_)}return this._clearSelfAndDescendantCache(),this._requestDraw(),this}cache(D){const P=D||{};let H={};(P.x===void 0||P.y===void 0||P.width===void 0||P.height===void 0)&&(H=this.getClientRect({skipTransform:!0,relativeTo:this.getParent()||void 0}));let N=Math.ceil(P.width||H.width),L=Math.ceil(P.height||H.height),Z=P.pixelRatio,ae=P.x===void 0?Math.floor(H.x):P.x,j=P.y===void 0?Math.floor(H.y):P.y,te=P.offset||0,de=P.drawBorder||!1,ne=P.hitCanvasPixelRatio||1;if(!N||!L){n.Util.error("Can not cache the node. Width or height of the node equals 0. Caching is skipped.");return}const ce=Math.abs(Math.round(H.x)-ae)>.5?1:0,Se=Math.abs(Math.round(H.y)-j)>.5?1:0;N+=te*2+ce,L+=te*2+Se,ae-=te,j-=te;const xe=new u.SceneCanvas({pixelRatio:Z,width:N,height:L}),$=new u.SceneCanvas({pixelRatio:Z,width:0,height:0,willReadFrequently:!0}),oe=new u.HitCanvas({pixelRatio:ne,width:N,height:L}),Te=xe.getContext(),Re=oe.getContext();return oe.isCache=!0,xe.isCache=!0,this._cache.delete(_),this._filterUpToDate=!1,P.imageSmoothingEnabled===!1&&(xe.getContext()._context.imageSmoothingEnabled=!1,$.getContext()._context.imageSmoothingEnabled=!1),Te.save(),Re.save(),Te.translate(-ae,-j),Re.translate(-ae,-j),this._isUnderCache=!0,this._clearSelfAndDescendantCache(d),this._clearSelfAndDescendantCache(p),this.drawScene(xe,this),this.drawHit(oe,this),this._isUnderCache=!1,Te.restore(),Re.restore(),de&&(Te.save(),Te.beginPath(),Te.rect(0,0,N,L),Te.closePath(),Te.setAttr("strokeStyle","red"),Te.setAttr("lineWidth",5),Te.stroke(),Te.restore()),this._cache.set(_,{scene:xe,filter:$,hit:oe,x:ae,y:j}),this._requestDraw(),this}isCached(){return this._cache.has(_)}getClientRect(D){throw new Error('abstract "getClientRect" method call')}_transformedRect(D,P){const H=[{x:D.x,y:D.y},{x:D.x+D.width,y:D.y},{x:D.x+D.width,y:D.y+D.height},{x:D.x,y:D.y+D.height}];let N=1/0,L=1/0,Z=-1/0,ae=-1/0;const j=this.getAbsoluteTransform(P);return H.forEach(function(te){const de=j.point(te);N===void 0&&(N=Z=de.x,L=ae=de.y),N=Math.min(N,de.x),L=Math.min(L,de.y),Z=Math.max(Z,de.x),ae=Math.max(ae,de.y)}),{x:N,y:L,width:Z-N,height:ae-L}}_drawCachedSceneCanvas(D){D.save(),D._applyOpacity(this),D._applyGlobalCompositeOperation(this);const P=this._getCanvasCache();D.translate(P.x,P.y);const H=this._getCachedSceneCanvas(),N=H.pixelRatio;D.drawImage(H._canvas,0,0,H.width/N,H.height/N),D.restore()}_drawCachedHitCanvas(D){const P=this._getCanvasCache(),H=P.hit;D.save(),D.translate(P.x,P.y),D.drawImage(H._canvas,0,0,H.width/H.pixelRatio,H.height/H.pixelRatio),D.restore()}_getCachedSceneCanvas(){let D=this.filters(),P=this._getCanvasCache(),H=P.scene,N=P.filter,L=N.getContext(),Z,ae,j,te;if(D){if(!this._filterUpToDate){const de=H.pixelRatio;N.setSize(H.width/H.pixelRatio,H.height/H.pixelRatio);try{for(Z=D.length,L.clear(),L.drawImage(H._canvas,0,0,H.getWidth()/de,H.getHeight()/de),ae=L.getImageData(0,0,N.getWidth(),N.getHeight()),j=0;j<Z;j++){if(te=D[j],typeof te!="function"){n.Util.error("Filter should be type of function, but got "+typeof te+" instead. Please check correct filters");continue}te.call(this,ae),L.putImageData(ae,0,0)}}catch(ne){n.Util.error("Unable to apply filter. "+ne.message+" This post my help you https://konvajs.org/docs/posts/Tainted_Canvas.html.")}this._filterUpToDate=!0}return N}return H}on(D,P){if(this._cache&&this._cache.delete(g),arguments.length===3)return this._delegate.apply(this,arguments);let H=D.split(R),N=H.length,L,Z,ae,j,te;for(L=0;L<N;L++)Z=H[L],ae=Z.split("."),j=ae[0],te=ae[1]||"",this.eventListeners[j]||(this.eventListeners[j]=[]),this.eventListeners[j].push({name:te,handler:P});return this}off(D,P){let H=(D||"").split(R),N=H.length,L,Z,ae,j,te,de;if(this._cache&&this._cache.delete(g),!D)for(Z in this.eventListeners)this._off(Z);for(L=0;L<N;L++)if(ae=H[L],j=ae.split("."),te=j[0],de=j[1],te)this.eventListeners[te]&&this._off(te,de,P);else for(Z in this.eventListeners)this._off(Z,de,P);return this}dispatchEvent(D){const P={target:this,type:D.type,evt:D};return this.fire(D.type,P),this}addEventListener(D,P){return this.on(D,function(H){P.call(this,H.evt)}),this}removeEventListener(D){return this.off(D),this}_delegate(D,P,H){const N=this;this.on(D,function(L){const Z=L.target.findAncestors(P,!0,N);for(let ae=0;ae<Z.length;ae++)L=n.Util.cloneObject(L),L.currentTarget=Z[ae],H.call(Z[ae],L)})}remove(){return this.isDragging()&&this.stopDrag(),c.DD._dragElements.delete(this._id),this._remove(),this}_clearCaches(){this._clearSelfAndDescendantCache(v),this._clearSelfAndDescendantCache(d),this._clearSelfAndDescendantCache(p),this._clearSelfAndDescendantCache(z),this._clearSelfAndDescendantCache(Q),this._clearSelfAndDescendantCache(E)}_remove(){this._clearCaches();const D=this.getParent();D&&D.children&&(D.children.splice(this.index,1),D._setChildrenIndices(),this.parent=null)}destroy(){return this.remove(),this.clearCache(),this}getAttr(D){const P="get"+n.Util._capitalize(D);return n.Util._isFunction(this[P])?this[P]():this.attrs[D]}getAncestors(){let D=this.getParent(),P=[];for(;D;)P.push(D),D=D.getParent();return P}getAttrs(){return this.attrs||{}}setAttrs(D){return this._batchTransformChanges(()=>{let P,H;if(!D)return this;for(P in D)P!==C&&(H=U+n.Util._capitalize(P),n.Util._isFunction(this[H])?this[H](D[P]):this._setAttr(P,D[P]))}),this}isListening(){return this._getCache(E,this._isListening)}_isListening(D){if(!this.listening())return!1;const H=this.getParent();return H&&H!==D&&this!==D?H._isListening(D):!0}isVisible(){return this._getCache(Q,this._isVisible)}_isVisible(D){if(!this.visible())return!1;const H=this.getParent();return H&&H!==D&&this!==D?H._isVisible(D):!0}shouldDrawHit(D,P=!1){if(D)return this._isVisible(D)&&this._isListening(D);const H=this.getLayer();let N=!1;c.DD._dragElements.forEach(Z=>{Z.dragStatus==="dragging"&&(Z.node.nodeType==="Stage"||Z.node.getLayer()===H)&&(N=!0)});const L=!P&&!s.Konva.hitOnDragEnabled&&(N||s.Konva.isTransforming());return this.isListening()&&this.isVisible()&&!L}show(){return this.visible(!0),this}hide(){return this.visible(!1),this}getZIndex(){return this.index||0}getAbsoluteZIndex(){let D=this.getDepth(),P=this,H=0,N,L,Z,ae;function j(de){for(N=[],L=de.length,Z=0;Z<L;Z++)ae=de[Z],H++,ae.nodeType!==A&&(N=N.concat(ae.getChildren().slice())),ae._id===P._id&&(Z=L);N.length>0&&N[0].getDepth()<=D&&j(N)}const te=this.getStage();return P.nodeType!==B&&te&&j(te.getChildren()),H}getDepth(){let D=0,P=this.parent;for(;P;)D++,P=P.parent;return D}_batchTransformChanges(D){this._batchingTransformChange=!0,D(),this._batchingTransformChange=!1,this._needClearTransformCache&&(this._clearCache(G),this._clearSelfAndDescendantCache(v)),this._needClearTransformCache=!1}setPosition(D){return this._batchTransformChanges(()=>{this.x(D.x),this.y(D.y)}),this}getPosition(){return{x:this.x(),y:this.y()}}getRelativePointerPosition(){const D=this.getStage();if(!D)return null;const P=D.getPointerPosition();if(!P)return null;const H=this.getAbsoluteTransform().copy();return H.invert(),H.point(P)}getAbsolutePosition(D){let P=!1,H=this.parent;for(;H;){if(H.isCached()){P=!0;break}H=H.parent}P&&!D&&(D=!0);const N=this.getAbsoluteTransform(D).getMatrix(),L=new n.Transform,Z=this.offset();return L.m=N.slice(),L.translate(Z.x,Z.y),L.getTranslation()}setAbsolutePosition(D){const{x:P,y:H,...N}=this._clearTransform();this.attrs.x=P,this.attrs.y=H,this._clearCache(G);const L=this._getAbsoluteTransform().copy();return L.invert(),L.translate(D.x,D.y),D={x:this.attrs.x+L.getTranslation().x,y:this.attrs.y+L.getTranslation().y},this._setTransform(N),this.setPosition({x:D.x,y:D.y}),this._clearCache(G),this._clearSelfAndDescendantCache(v),this}_setTransform(D){let P;for(P in D)this.attrs[P]=D[P]}_clearTransform(){const D={x:this.x(),y:this.y(),rotation:this.rotation(),scaleX:this.scaleX(),scaleY:this.scaleY(),offsetX:this.offsetX(),offsetY:this.offsetY(),skewX:this.skewX(),skewY:this.skewY()};return this.attrs.x=0,this.attrs.y=0,this.attrs.rotation=0,this.attrs.scaleX=1,this.attrs.scaleY=1,this.attrs.offsetX=0,this.attrs.offsetY=0,this.attrs.skewX=0,this.attrs.skewY=0,D}move(D){let P=D.x,H=D.y,N=this.x(),L=this.y();return P!==void 0&&(N+=P),H!==void 0&&(L+=H),this.setPosition({x:N,y:L}),this}_eachAncestorReverse(D,P){let H=[],N=this.getParent(),L,Z;if(!(P&&P._id===this._id)){for(H.unshift(this);N&&(!P||N._id!==P._id);)H.unshift(N),N=N.parent;for(L=H.length,Z=0;Z<L;Z++)D(H[Z])}}rotate(D){return this.rotation(this.rotation()+D),this}moveToTop(){if(!this.parent)return n.Util.warn("Node has no parent. moveToTop function is ignored."),!1;const D=this.index,P=this.parent.getChildren().length;return D<P-1?(this.parent.children.splice(D,1),this.parent.children.push(this),this.parent._setChildrenIndices(),!0):!1}moveUp(){if(!this.parent)return n.Util.warn("Node has no parent. moveUp function is ignored."),!1;const D=this.index,P=this.parent.getChildren().length;return D<P-1?(this.parent.children.splice(D,1),this.parent.children.splice(D+1,0,this),this.parent._setChildrenIndices(),!0):!1}moveDown(){if(!this.parent)return n.Util.warn("Node has no parent. moveDown function is ignored."),!1;const D=this.index;return D>0?(this.parent.children.splice(D,1),this.parent.children.splice(D-1,0,this),this.parent._setChildrenIndices(),!0):!1}moveToBottom(){if(!this.parent)return n.Util.warn("Node has no parent. moveToBottom function is ignored."),!1;const D=this.index;return D>0?(this.parent.children.splice(D,1),this.parent.children.unshift(this),this.parent._setChildrenIndices(),!0):!1}setZIndex(D){if(!this.parent)return n.Util.warn("Node has no parent. zIndex parameter is ignored."),this;(D<0||D>=this.parent.children.length)&&n.Util.warn("Unexpected value "+D+" for zIndex property. zIndex is just index of a node in children of its parent. Expected value is from 0 to "+(this.parent.children.length-1)+".");const P=this.index;return this.parent.children.splice(P,1),this.parent.children.splice(D,0,this),this.parent._setChildrenIndices(),this}getAbsoluteOpacity(){return this._getCache(d,this._getAbsoluteOpacity)}_getAbsoluteOpacity(){let D=this.opacity();const P=this.getParent();return P&&!P._isUnderCache&&(D*=P.getAbsoluteOpacity()),D}moveTo(D){return this.getParent()!==D&&(this._remove(),D.add(this)),this}toObject(){let D=this.getAttrs(),P,H,N,L,Z;const ae={attrs:{},className:this.getClassName()};for(P in D)H=D[P],Z=n.Util.isObject(H)&&!n.Util._isPlainObject(H)&&!n.Util._isArray(H),!Z&&(N=typeof this[P]=="function"&&this[P],delete D[P],L=N?N.call(this):null,D[P]=H,L!==H&&(ae.attrs[P]=H));return n.Util._prepareToStringify(ae)}toJSON(){return JSON.stringify(this.toObject())}getParent(){return this.parent}findAncestors(D,P,H){const N=[];P&&this._isMatch(D)&&N.push(this);let L=this.parent;for(;L;){if(L===H)return N;L._isMatch(D)&&N.push(L),L=L.parent}return N}isAncestorOf(D){return!1}findAncestor(D,P,H){return this.findAncestors(D,P,H)[0]}_isMatch(D){if(!D)return!1;if(typeof D=="function")return D(this);let P=D.replace(/ /g,"").split(","),H=P.length,N,L;for(N=0;N<H;N++)if(L=P[N],n.Util.isValidSelector(L)||(n.Util.warn('Selector "'+L+'" is invalid. Allowed selectors examples are "#foo", ".bar" or "Group".'),n.Util.warn('If you have a custom shape with such className, please change it to start with upper letter like "Triangle".'),n.Util.warn("Konva is awesome, right?")),L.charAt(0)==="#"){if(this.id()===L.slice(1))return!0}else if(L.charAt(0)==="."){if(this.hasName(L.slice(1)))return!0}else if(this.className===L||this.nodeType===L)return!0;return!1}getLayer(){const D=this.getParent();return D?D.getLayer():null}getStage(){return this._getCache(z,this._getStage)}_getStage(){const D=this.getParent();return D?D.getStage():null}fire(D,P={},H){return P.target=P.target||this,H?this._fireAndBubble(D,P):this._fire(D,P),this}getAbsoluteTransform(D){return D?this._getAbsoluteTransform(D):this._getCache(v,this._getAbsoluteTransform)}_getAbsoluteTransform(D){let P;if(D)return P=new n.Transform,this._eachAncestorReverse(function(H){const N=H.transformsEnabled();N==="all"?P.multiply(H.getTransform()):N==="position"&&P.translate(H.x()-H.offsetX(),H.y()-H.offsetY())},D),P;{P=this._cache.get(v)||new n.Transform,this.parent?this.parent.getAbsoluteTransform().copyInto(P):P.reset();const H=this.transformsEnabled();if(H==="all")P.multiply(this.getTransform());else if(H==="position"){const N=this.attrs.x||0,L=this.attrs.y||0,Z=this.attrs.offsetX||0,ae=this.attrs.offsetY||0;P.translate(N-Z,L-ae)}return P.dirty=!1,P}}getAbsoluteScale(D){let P=this;for(;P;)P._isUnderCache&&(D=P),P=P.getParent();const N=this.getAbsoluteTransform(D).decompose();return{x:N.scaleX,y:N.scaleY}}getAbsoluteRotation(){return this.getAbsoluteTransform().decompose().rotation}getTransform(){return this._getCache(G,this._getTransform)}_getTransform(){var D,P;const H=this._cache.get(G)||new n.Transform;H.reset();const N=this.x(),L=this.y(),Z=s.Konva.getAngle(this.rotation()),ae=(D=this.attrs.scaleX)!==null&&D!==void 0?D:1,j=(P=this.attrs.scaleY)!==null&&P!==void 0?P:1,te=this.attrs.skewX||0,de=this.attrs.skewY||0,ne=this.attrs.offsetX||0,ce=this.attrs.offsetY||0;return(N!==0||L!==0)&&H.translate(N,L),Z!==0&&H.rotate(Z),(te!==0||de!==0)&&H.skew(te,de),(ae!==1||j!==1)&&H.scale(ae,j),(ne!==0||ce!==0)&&H.translate(-1*ne,-1*ce),H.dirty=!1,H}clone(D){let P=n.Util.cloneObject(this.attrs),H,N,L,Z,ae;for(H in D)P[H]=D[H];const j=new this.constructor(P);for(H in this.eventListeners)for(N=this.eventListeners[H],L=N.length,Z=0;Z<L;Z++)ae=N[Z],ae.name.indexOf(x)<0&&(j.eventListeners[H]||(j.eventListeners[H]=[]),j.eventListeners[H].push(ae));return j}_toKonvaCanvas(D){D=D||{};const P=this.getClientRect(),H=this.getStage(),N=D.x!==void 0?D.x:Math.floor(P.x),L=D.y!==void 0?D.y:Math.floor(P.y),Z=D.pixelRatio||1,ae=new u.SceneCanvas({width:D.width||Math.ceil(P.width)||(H?H.width():0),height:D.height||Math.ceil(P.height)||(H?H.height():0),pixelRatio:Z}),j=ae.getContext(),te=new u.SceneCanvas({width:ae.width/ae.pixelRatio+Math.abs(N),height:ae.height/ae.pixelRatio+Math.abs(L),pixelRatio:ae.pixelRatio});return D.imageSmoothingEnabled===!1&&(j._context.imageSmoothingEnabled=!1),j.save(),(N||L)&&j.translate(-1*N,-1*L),this.drawScene(ae,void 0,te),j.restore(),ae}toCanvas(D){return this._toKonvaCanvas(D)._canvas}toDataURL(D){D=D||{};const P=D.mimeType||null,H=D.quality||null,N=this._toKonvaCanvas(D).toDataURL(P,H);return D.callback&&D.callback(N),N}toImage(D){return new Promise((P,H)=>{try{const N=D==null?void 0:D.callback;N&&delete D.callback,n.Util._urlToImage(this.toDataURL(D),function(L){P(L),N==null||N(L)})}catch(N){H(N)}})}toBlob(D){return new Promise((P,H)=>{try{const N=D==null?void 0:D.callback;N&&delete D.callback,this.toCanvas(D).toBlob(L=>{P(L),N==null||N(L)},D==null?void 0:D.mimeType,D==null?void 0:D.quality)}catch(N){H(N)}})}setSize(D){return this.width(D.width),this.height(D.height),this}getSize(){return{width:this.width(),height:this.height()}}getClassName(){return this.className||this.nodeType}getType(){return this.nodeType}getDragDistance(){return this.attrs.dragDistance!==void 0?this.attrs.dragDistance:this.parent?this.parent.getDragDistance():s.Konva.dragDistance}_off(D,P,H){let N=this.eventListeners[D],L,Z,ae;for(L=0;L<N.length;L++)if(Z=N[L].name,ae=N[L].handler,(Z!=="konva"||P==="konva")&&(!P||Z===P)&&(!H||H===ae)){if(N.splice(L,1),N.length===0){delete this.eventListeners[D];break}L--}}_fireChangeEvent(D,P,H){this._fire(D+T,{oldVal:P,newVal:H})}addName(D){if(!this.hasName(D)){const P=this.name(),H=P?P+" "+D:D;this.name(H)}return this}hasName(D){if(!D)return!1;const P=this.name();return P?(P||"").split(/\s/g).indexOf(D)!==-1:!1}removeName(D){const P=(this.name()||"").split(/\s/g),H=P.indexOf(D);return H!==-1&&(P.splice(H,1),this.name(P.join(" "))),this}setAttr(D,P){const H=this[U+n.Util._capitalize(D)];return n.Util._isFunction(H)?H.call(this,P):this._setAttr(D,P),this}_requestDraw(){if(s.Konva.autoDrawEnabled){const D=this.getLayer()||this.getStage();D==null||D.batchDraw()}}_setAttr(D,P){const H=this.attrs[D];H===P&&!n.Util.isObject(P)||(P==null?delete this.attrs[D]:this.attrs[D]=P,this._shouldFireChangeEvents&&this._fireChangeEvent(D,H,P),this._requestDraw())}_setComponentAttr(D,P,H){let N;H!==void 0&&(N=this.attrs[D],N||(this.attrs[D]=this.getAttr(D)),this.attrs[D][P]=H,this._fireChangeEvent(D,N,H))}_fireAndBubble(D,P,H){if(P&&this.nodeType===A&&(P.target=this),!((D===O||D===w)&&(H&&(this===H||this.isAncestorOf&&this.isAncestorOf(H))||this.nodeType==="Stage"&&!H))){this._fire(D,P);const L=(D===O||D===w)&&H&&H.isAncestorOf&&H.isAncestorOf(this)&&!H.isAncestorOf(this.parent);(P&&!P.cancelBubble||!P)&&this.parent&&this.parent.isListening()&&!L&&(H&&H.parent?this._fireAndBubble.call(this.parent,D,P,H):this._fireAndBubble.call(this.parent,D,P))}}_getProtoListeners(D){var P,H,N;const L=(P=this._cache.get(g))!==null&&P!==void 0?P:{};let Z=L==null?void 0:L[D];if(Z===void 0){Z=[];let ae=Object.getPrototypeOf(this);for(;ae;){const j=(N=(H=ae.eventListeners)===null||H===void 0?void 0:H[D])!==null&&N!==void 0?N:[];Z.push(...j),ae=Object.getPrototypeOf(ae)}L[D]=Z,this._cache.set(g,L)}return Z}_fire(D,P){P=P||{},P.currentTarget=this,P.type=D;const H=this._getProtoListeners(D);if(H)for(var N=0;N<H.length;N++)H[N].handler.call(this,P);const L=this.eventListeners[D];if(L)for(var N=0;N<L.length;N++)L[N].handler.call(this,P)}draw(){return this.drawScene(),this.drawHit(),this}_createDragElement(D){const P=D?D.pointerId:void 0,H=this.getStage(),N=this.getAbsolutePosition();if(!H)return;const L=H._getPointerById(P)||H._changedPointerPositions[0]||N;c.DD._dragElements.set(this._id,{node:this,startPointerPos:L,offset:{x:L.x-N.x,y:L.y-N.y},dragStatus:"ready",pointerId:P})}startDrag(D,P=!0){c.DD._dragElements.has(this._id)||this._createDragElement(D);const H=c.DD._dragElements.get(this._id);H.dragStatus="dragging",this.fire("dragstart",{type:"dragstart",target:this,evt:D&&D.evt},P)}_setDragPosition(D,P){const H=this.getStage()._getPointerById(P.pointerId);if(!H)return;let N={x:H.x-P.offset.x,y:H.y-P.offset.y};const L=this.dragBoundFunc();if(L!==void 0){const Z=L.call(this,N,D);Z?N=Z:n.Util.warn("dragBoundFunc did not return any value. That is unexpected behavior. You must return new absolute position from dragBoundFunc.")}(!this._lastPos||this._lastPos.x!==N.x||this._lastPos.y!==N.y)&&(this.setAbsolutePosition(N),this._requestDraw()),this._lastPos=N}stopDrag(D){const P=c.DD._dragElements.get(this._id);P&&(P.dragStatus="stopped"),c.DD._endDragBefore(D),c.DD._endDragAfter(D)}setDraggable(D){this._setAttr("draggable",D),this._dragChange()}isDragging(){const D=c.DD._dragElements.get(this._id);return D?D.dragStatus==="dragging":!1}_listenDrag(){this._dragCleanup(),this.on("mousedown.konva touchstart.konva",function(D){if(!(!(D.evt.button!==void 0)||s.Konva.dragButtons.indexOf(D.evt.button)>=0)||this.isDragging())return;let N=!1;c.DD._dragElements.forEach(L=>{this.isAncestorOf(L.node)&&(N=!0)}),N||this._createDragElement(D)})}_dragChange(){if(this.attrs.draggable)this._listenDrag();else{if(this._dragCleanup(),!this.getStage())return;const P=c.DD._dragElements.get(this._id),H=P&&P.dragStatus==="dragging",N=P&&P.dragStatus==="ready";H?this.stopDrag():N&&c.DD._dragElements.delete(this._id)}}_dragCleanup(){this.off("mousedown.konva"),this.off("touchstart.konva")}isClientRectOnScreen(D={x:0,y:0}){const P=this.getStage();if(!P)return!1;const H={x:-D.x,y:-D.y,width:P.width()+2*D.x,height:P.height()+2*D.y};return n.Util.haveIntersection(H,this.getClientRect())}static create(D,P){return n.Util._isString(D)&&(D=JSON.parse(D)),this._createNode(D,P)}static _createNode(D,P){let H=rm.prototype.getClassName.call(D),N=D.children,L,Z,ae;P&&(D.attrs.container=P),s.Konva[H]||(n.Util.warn('Can not find a node with class name "'+H+'". Fallback to "Shape".'),H="Shape");const j=s.Konva[H];if(L=new j(D.attrs),N)for(Z=N.length,ae=0;ae<Z;ae++)L.add(rm._createNode(N[ae]));return L}};mh.Node=V,V.prototype.nodeType="Node",V.prototype._attrsAffectingSize=[],V.prototype.eventListeners={},V.prototype.on.call(V.prototype,X,function(){if(this._batchingTransformChange){this._needClearTransformCache=!0;return}this._clearCache(G),this._clearSelfAndDescendantCache(v)}),V.prototype.on.call(V.prototype,"visibleChange.konva",function(){this._clearSelfAndDescendantCache(Q)}),V.prototype.on.call(V.prototype,"listeningChange.konva",function(){this._clearSelfAndDescendantCache(E)}),V.prototype.on.call(V.prototype,"opacityChange.konva",function(){this._clearSelfAndDescendantCache(d)});const F=i.Factory.addGetterSetter;return F(V,"zIndex"),F(V,"absolutePosition"),F(V,"position"),F(V,"x",0,(0,h.getNumberValidator)()),F(V,"y",0,(0,h.getNumberValidator)()),F(V,"globalCompositeOperation","source-over",(0,h.getStringValidator)()),F(V,"opacity",1,(0,h.getNumberValidator)()),F(V,"name","",(0,h.getStringValidator)()),F(V,"id","",(0,h.getStringValidator)()),F(V,"rotation",0,(0,h.getNumberValidator)()),i.Factory.addComponentsGetterSetter(V,"scale",["x","y"]),F(V,"scaleX",1,(0,h.getNumberValidator)()),F(V,"scaleY",1,(0,h.getNumberValidator)()),i.Factory.addComponentsGetterSetter(V,"skew",["x","y"]),F(V,"skewX",0,(0,h.getNumberValidator)()),F(V,"skewY",0,(0,h.getNumberValidator)()),i.Factory.addComponentsGetterSetter(V,"offset",["x","y"]),F(V,"offsetX",0,(0,h.getNumberValidator)()),F(V,"offsetY",0,(0,h.getNumberValidator)()),F(V,"dragDistance",void 0,(0,h.getNumberValidator)()),F(V,"width",0,(0,h.getNumberValidator)()),F(V,"height",0,(0,h.getNumberValidator)()),F(V,"listening",!0,(0,h.getBooleanValidator)()),F(V,"preventDefault",!0,(0,h.getBooleanValidator)()),F(V,"filters",void 0,function(I){return this._filterUpToDate=!1,I}),F(V,"visible",!0,(0,h.getBooleanValidator)()),F(V,"transformsEnabled","all",(0,h.getStringValidator)()),F(V,"size"),F(V,"dragBoundFunc"),F(V,"draggable",!1,(0,h.getBooleanValidator)()),i.Factory.backCompat(V,{rotateDeg:"rotate",setRotationDeg:"setRotation",getRotationDeg:"getRotation"}),mh}var yh={},c6;function G1(){if(c6)return yh;c6=1,Object.defineProperty(yh,"__esModule",{value:!0}),yh.Container=void 0;const n=vt(),i=wa(),u=_t();let s=class extends i.Node{constructor(){super(...arguments),this.children=[]}getChildren(h){if(!h)return this.children||[];const d=this.children||[],g=[];return d.forEach(function(v){h(v)&&g.push(v)}),g}hasChildren(){return this.getChildren().length>0}removeChildren(){return this.getChildren().forEach(h=>{h.parent=null,h.index=0,h.remove()}),this.children=[],this._requestDraw(),this}destroyChildren(){return this.getChildren().forEach(h=>{h.parent=null,h.index=0,h.destroy()}),this.children=[],this._requestDraw(),this}add(...h){if(h.length===0)return this;if(h.length>1){for(let g=0;g<h.length;g++)this.add(h[g]);return this}const d=h[0];return d.getParent()?(d.moveTo(this),this):(this._validateAdd(d),d.index=this.getChildren().length,d.parent=this,d._clearCaches(),this.getChildren().push(d),this._fire("add",{child:d}),this._requestDraw(),this)}destroy(){return this.hasChildren()&&this.destroyChildren(),super.destroy(),this}find(h){return this._generalFind(h,!1)}findOne(h){const d=this._generalFind(h,!0);return d.length>0?d[0]:void 0}_generalFind(h,d){const g=[];return this._descendants(v=>{const p=v._isMatch(h);return p&&g.push(v),!!(p&&d)}),g}_descendants(h){let d=!1;const g=this.getChildren();for(const v of g){if(d=h(v),d)return!0;if(v.hasChildren()&&(d=v._descendants(h),d))return!0}return!1}toObject(){const h=i.Node.prototype.toObject.call(this);return h.children=[],this.getChildren().forEach(d=>{h.children.push(d.toObject())}),h}isAncestorOf(h){let d=h.getParent();for(;d;){if(d._id===this._id)return!0;d=d.getParent()}return!1}clone(h){const d=i.Node.prototype.clone.call(this,h);return this.getChildren().forEach(function(g){d.add(g.clone())}),d}getAllIntersections(h){const d=[];return this.find("Shape").forEach(g=>{g.isVisible()&&g.intersects(h)&&d.push(g)}),d}_clearSelfAndDescendantCache(h){var d;super._clearSelfAndDescendantCache(h),!this.isCached()&&((d=this.children)===null||d===void 0||d.forEach(function(g){g._clearSelfAndDescendantCache(h)}))}_setChildrenIndices(){var h;(h=this.children)===null||h===void 0||h.forEach(function(d,g){d.index=g}),this._requestDraw()}drawScene(h,d,g){const v=this.getLayer(),p=h||v&&v.getCanvas(),_=p&&p.getContext(),T=this._getCanvasCache(),C=T&&T.scene,x=p&&p.isCache;if(!this.isVisible()&&!x)return this;if(C){_.save();const E=this.getAbsoluteTransform(d).getMatrix();_.transform(E[0],E[1],E[2],E[3],E[4],E[5]),this._drawCachedSceneCanvas(_),_.restore()}else this._drawChildren("drawScene",p,d,g);return this}drawHit(h,d){if(!this.shouldDrawHit(d))return this;const g=this.getLayer(),v=h||g&&g.hitCanvas,p=v&&v.getContext(),_=this._getCanvasCache();if(_&&_.hit){p.save();const C=this.getAbsoluteTransform(d).getMatrix();p.transform(C[0],C[1],C[2],C[3],C[4],C[5]),this._drawCachedHitCanvas(p),p.restore()}else this._drawChildren("drawHit",v,d);return this}_drawChildren(h,d,g,v){var p;const _=d&&d.getContext(),T=this.clipWidth(),C=this.clipHeight(),x=this.clipFunc(),E=typeof T=="number"&&typeof C=="number"||x,O=g===this;if(E){_.save();const U=this.getAbsoluteTransform(g);let A=U.getMatrix();_.transform(A[0],A[1],A[2],A[3],A[4],A[5]),_.beginPath();let R;if(x)R=x.call(this,_,this);else{const z=this.clipX(),G=this.clipY();_.rect(z||0,G||0,T,C)}_.clip.apply(_,R),A=U.copy().invert().getMatrix(),_.transform(A[0],A[1],A[2],A[3],A[4],A[5])}const w=!O&&this.globalCompositeOperation()!=="source-over"&&h==="drawScene";w&&(_.save(),_._applyGlobalCompositeOperation(this)),(p=this.children)===null||p===void 0||p.forEach(function(U){U[h](d,g,v)}),w&&_.restore(),E&&_.restore()}getClientRect(h={}){var d;const g=h.skipTransform,v=h.relativeTo;let p,_,T,C,x={x:1/0,y:1/0,width:0,height:0};const E=this;(d=this.children)===null||d===void 0||d.forEach(function(U){if(!U.visible())return;const A=U.getClientRect({relativeTo:E,skipShadow:h.skipShadow,skipStroke:h.skipStroke});A.width===0&&A.height===0||(p===void 0?(p=A.x,_=A.y,T=A.x+A.width,C=A.y+A.height):(p=Math.min(p,A.x),_=Math.min(_,A.y),T=Math.max(T,A.x+A.width),C=Math.max(C,A.y+A.height)))});const O=this.find("Shape");let w=!1;for(let U=0;U<O.length;U++)if(O[U]._isVisible(this)){w=!0;break}return w&&p!==void 0?x={x:p,y:_,width:T-p,height:C-_}:x={x:0,y:0,width:0,height:0},g?x:this._transformedRect(x,v)}};return yh.Container=s,n.Factory.addComponentsGetterSetter(s,"clip",["x","y","width","height"]),n.Factory.addGetterSetter(s,"clipX",void 0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(s,"clipY",void 0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(s,"clipWidth",void 0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(s,"clipHeight",void 0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(s,"clipFunc"),yh}var G2={},Vu={},f6;function B8(){if(f6)return Vu;f6=1,Object.defineProperty(Vu,"__esModule",{value:!0}),Vu.getCapturedShape=s,Vu.createEvent=c,Vu.hasPointerCapture=h,Vu.setPointerCapture=d,Vu.releaseCapture=g;const n=ct(),i=new Map,u=n.Konva._global.PointerEvent!==void 0;function s(v){return i.get(v)}function c(v){return{evt:v,pointerId:v.pointerId}}function h(v,p){return i.get(v)===p}function d(v,p){g(v),p.getStage()&&(i.set(v,p),u&&p._fire("gotpointercapture",c(new PointerEvent("gotpointercapture"))))}function g(v,p){const _=i.get(v);if(!_)return;const T=_.getStage();T&&T.content,i.delete(v),u&&_._fire("lostpointercapture",c(new PointerEvent("lostpointercapture")))}return Vu}var h6;function TM(){return h6||(h6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.Stage=n.stages=void 0;const i=Ea(),u=vt(),s=G1(),c=ct(),h=U1(),d=ay(),g=ct(),v=B8(),p="Stage",_="string",T="px",C="mouseout",x="mouseleave",E="mouseover",O="mouseenter",w="mousemove",U="mousedown",A="mouseup",R="pointermove",z="pointerdown",G="pointerup",B="pointercancel",Q="lostpointercapture",X="pointerout",Y="pointerleave",V="pointerover",F="pointerenter",I="contextmenu",D="touchstart",P="touchend",H="touchmove",N="touchcancel",L="wheel",Z=5,ae=[[O,"_pointerenter"],[U,"_pointerdown"],[w,"_pointermove"],[A,"_pointerup"],[x,"_pointerleave"],[D,"_pointerdown"],[H,"_pointermove"],[P,"_pointerup"],[N,"_pointercancel"],[E,"_pointerover"],[L,"_wheel"],[I,"_contextmenu"],[z,"_pointerdown"],[R,"_pointermove"],[G,"_pointerup"],[B,"_pointercancel"],[Q,"_lostpointercapture"]],j={mouse:{[X]:C,[Y]:x,[V]:E,[F]:O,[R]:w,[z]:U,[G]:A,[B]:"mousecancel",pointerclick:"click",pointerdblclick:"dblclick"},touch:{[X]:"touchout",[Y]:"touchleave",[V]:"touchover",[F]:"touchenter",[R]:H,[z]:D,[G]:P,[B]:N,pointerclick:"tap",pointerdblclick:"dbltap"},pointer:{[X]:X,[Y]:Y,[V]:V,[F]:F,[R]:R,[z]:z,[G]:G,[B]:B,pointerclick:"pointerclick",pointerdblclick:"pointerdblclick"}},te=xe=>xe.indexOf("pointer")>=0?"pointer":xe.indexOf("touch")>=0?"touch":"mouse",de=xe=>{const $=te(xe);if($==="pointer")return c.Konva.pointerEventsEnabled&&j.pointer;if($==="touch")return j.touch;if($==="mouse")return j.mouse};function ne(xe={}){return(xe.clipFunc||xe.clipWidth||xe.clipHeight)&&i.Util.warn("Stage does not support clipping. Please use clip for Layers or Groups."),xe}const ce="Pointer position is missing and not registered by the stage. Looks like it is outside of the stage container. You can set it manually from event: stage.setPointersPositions(event);";n.stages=[];class Se extends s.Container{constructor($){super(ne($)),this._pointerPositions=[],this._changedPointerPositions=[],this._buildDOM(),this._bindContentEvents(),n.stages.push(this),this.on("widthChange.konva heightChange.konva",this._resizeDOM),this.on("visibleChange.konva",this._checkVisibility),this.on("clipWidthChange.konva clipHeightChange.konva clipFuncChange.konva",()=>{ne(this.attrs)}),this._checkVisibility()}_validateAdd($){const oe=$.getType()==="Layer",Te=$.getType()==="FastLayer";oe||Te||i.Util.throw("You may only add layers to the stage.")}_checkVisibility(){if(!this.content)return;const $=this.visible()?"":"none";this.content.style.display=$}setContainer($){if(typeof $===_){if($.charAt(0)==="."){const Te=$.slice(1);$=document.getElementsByClassName(Te)[0]}else{var oe;$.charAt(0)!=="#"?oe=$:oe=$.slice(1),$=document.getElementById(oe)}if(!$)throw"Can not find container in document with id "+oe}return this._setAttr("container",$),this.content&&(this.content.parentElement&&this.content.parentElement.removeChild(this.content),$.appendChild(this.content)),this}shouldDrawHit(){return!0}clear(){const $=this.children,oe=$.length;for(let Te=0;Te<oe;Te++)$[Te].clear();return this}clone($){return $||($={}),$.container=typeof document<"u"&&document.createElement("div"),s.Container.prototype.clone.call(this,$)}destroy(){super.destroy();const $=this.content;$&&i.Util._isInDocument($)&&this.container().removeChild($);const oe=n.stages.indexOf(this);return oe>-1&&n.stages.splice(oe,1),i.Util.releaseCanvas(this.bufferCanvas._canvas,this.bufferHitCanvas._canvas),this}getPointerPosition(){const $=this._pointerPositions[0]||this._changedPointerPositions[0];return $?{x:$.x,y:$.y}:(i.Util.warn(ce),null)}_getPointerById($){return this._pointerPositions.find(oe=>oe.id===$)}getPointersPositions(){return this._pointerPositions}getStage(){return this}getContent(){return this.content}_toKonvaCanvas($){$=$||{},$.x=$.x||0,$.y=$.y||0,$.width=$.width||this.width(),$.height=$.height||this.height();const oe=new h.SceneCanvas({width:$.width,height:$.height,pixelRatio:$.pixelRatio||1}),Te=oe.getContext()._context,Re=this.children;return($.x||$.y)&&Te.translate(-1*$.x,-1*$.y),Re.forEach(function(Me){if(!Me.isVisible())return;const Ge=Me._toKonvaCanvas($);Te.drawImage(Ge._canvas,$.x,$.y,Ge.getWidth()/Ge.getPixelRatio(),Ge.getHeight()/Ge.getPixelRatio())}),oe}getIntersection($){if(!$)return null;const oe=this.children,Te=oe.length,Re=Te-1;for(let Me=Re;Me>=0;Me--){const Ge=oe[Me].getIntersection($);if(Ge)return Ge}return null}_resizeDOM(){const $=this.width(),oe=this.height();this.content&&(this.content.style.width=$+T,this.content.style.height=oe+T),this.bufferCanvas.setSize($,oe),this.bufferHitCanvas.setSize($,oe),this.children.forEach(Te=>{Te.setSize({width:$,height:oe}),Te.draw()})}add($,...oe){if(arguments.length>1){for(let Re=0;Re<arguments.length;Re++)this.add(arguments[Re]);return this}super.add($);const Te=this.children.length;return Te>Z&&i.Util.warn("The stage has "+Te+" layers. Recommended maximum number of layers is 3-5. Adding more layers into the stage may drop the performance. Rethink your tree structure, you can use Konva.Group."),$.setSize({width:this.width(),height:this.height()}),$.draw(),c.Konva.isBrowser&&this.content.appendChild($.canvas._canvas),this}getParent(){return null}getLayer(){return null}hasPointerCapture($){return v.hasPointerCapture($,this)}setPointerCapture($){v.setPointerCapture($,this)}releaseCapture($){v.releaseCapture($,this)}getLayers(){return this.children}_bindContentEvents(){c.Konva.isBrowser&&ae.forEach(([$,oe])=>{this.content.addEventListener($,Te=>{this[oe](Te)},{passive:!1})})}_pointerenter($){this.setPointersPositions($);const oe=de($.type);oe&&this._fire(oe.pointerenter,{evt:$,target:this,currentTarget:this})}_pointerover($){this.setPointersPositions($);const oe=de($.type);oe&&this._fire(oe.pointerover,{evt:$,target:this,currentTarget:this})}_getTargetShape($){let oe=this[$+"targetShape"];return oe&&!oe.getStage()&&(oe=null),oe}_pointerleave($){const oe=de($.type),Te=te($.type);if(!oe)return;this.setPointersPositions($);const Re=this._getTargetShape(Te),Me=!(c.Konva.isDragging()||c.Konva.isTransforming())||c.Konva.hitOnDragEnabled;Re&&Me?(Re._fireAndBubble(oe.pointerout,{evt:$}),Re._fireAndBubble(oe.pointerleave,{evt:$}),this._fire(oe.pointerleave,{evt:$,target:this,currentTarget:this}),this[Te+"targetShape"]=null):Me&&(this._fire(oe.pointerleave,{evt:$,target:this,currentTarget:this}),this._fire(oe.pointerout,{evt:$,target:this,currentTarget:this})),this.pointerPos=null,this._pointerPositions=[]}_pointerdown($){const oe=de($.type),Te=te($.type);if(!oe)return;this.setPointersPositions($);let Re=!1;this._changedPointerPositions.forEach(Me=>{const Ge=this.getIntersection(Me);if(d.DD.justDragged=!1,c.Konva["_"+Te+"ListenClick"]=!0,!Ge||!Ge.isListening()){this[Te+"ClickStartShape"]=void 0;return}c.Konva.capturePointerEventsEnabled&&Ge.setPointerCapture(Me.id),this[Te+"ClickStartShape"]=Ge,Ge._fireAndBubble(oe.pointerdown,{evt:$,pointerId:Me.id}),Re=!0;const $e=$.type.indexOf("touch")>=0;Ge.preventDefault()&&$.cancelable&&$e&&$.preventDefault()}),Re||this._fire(oe.pointerdown,{evt:$,target:this,currentTarget:this,pointerId:this._pointerPositions[0].id})}_pointermove($){const oe=de($.type),Te=te($.type);if(!oe||(c.Konva.isDragging()&&d.DD.node.preventDefault()&&$.cancelable&&$.preventDefault(),this.setPointersPositions($),!(!(c.Konva.isDragging()||c.Konva.isTransforming())||c.Konva.hitOnDragEnabled)))return;const Me={};let Ge=!1;const $e=this._getTargetShape(Te);this._changedPointerPositions.forEach(et=>{const ze=v.getCapturedShape(et.id)||this.getIntersection(et),At=et.id,we={evt:$,pointerId:At},ft=$e!==ze;if(ft&&$e&&($e._fireAndBubble(oe.pointerout,{...we},ze),$e._fireAndBubble(oe.pointerleave,{...we},ze)),ze){if(Me[ze._id])return;Me[ze._id]=!0}ze&&ze.isListening()?(Ge=!0,ft&&(ze._fireAndBubble(oe.pointerover,{...we},$e),ze._fireAndBubble(oe.pointerenter,{...we},$e),this[Te+"targetShape"]=ze),ze._fireAndBubble(oe.pointermove,{...we})):$e&&(this._fire(oe.pointerover,{evt:$,target:this,currentTarget:this,pointerId:At}),this[Te+"targetShape"]=null)}),Ge||this._fire(oe.pointermove,{evt:$,target:this,currentTarget:this,pointerId:this._changedPointerPositions[0].id})}_pointerup($){const oe=de($.type),Te=te($.type);if(!oe)return;this.setPointersPositions($);const Re=this[Te+"ClickStartShape"],Me=this[Te+"ClickEndShape"],Ge={};let $e=!1;this._changedPointerPositions.forEach(et=>{const ze=v.getCapturedShape(et.id)||this.getIntersection(et);if(ze){if(ze.releaseCapture(et.id),Ge[ze._id])return;Ge[ze._id]=!0}const At=et.id,we={evt:$,pointerId:At};let ft=!1;c.Konva["_"+Te+"InDblClickWindow"]?(ft=!0,clearTimeout(this[Te+"DblTimeout"])):d.DD.justDragged||(c.Konva["_"+Te+"InDblClickWindow"]=!0,clearTimeout(this[Te+"DblTimeout"])),this[Te+"DblTimeout"]=setTimeout(function(){c.Konva["_"+Te+"InDblClickWindow"]=!1},c.Konva.dblClickWindow),ze&&ze.isListening()?($e=!0,this[Te+"ClickEndShape"]=ze,ze._fireAndBubble(oe.pointerup,{...we}),c.Konva["_"+Te+"ListenClick"]&&Re&&Re===ze&&(ze._fireAndBubble(oe.pointerclick,{...we}),ft&&Me&&Me===ze&&ze._fireAndBubble(oe.pointerdblclick,{...we}))):(this[Te+"ClickEndShape"]=null,c.Konva["_"+Te+"ListenClick"]&&this._fire(oe.pointerclick,{evt:$,target:this,currentTarget:this,pointerId:At}),ft&&this._fire(oe.pointerdblclick,{evt:$,target:this,currentTarget:this,pointerId:At}))}),$e||this._fire(oe.pointerup,{evt:$,target:this,currentTarget:this,pointerId:this._changedPointerPositions[0].id}),c.Konva["_"+Te+"ListenClick"]=!1,$.cancelable&&Te!=="touch"&&Te!=="pointer"&&$.preventDefault()}_contextmenu($){this.setPointersPositions($);const oe=this.getIntersection(this.getPointerPosition());oe&&oe.isListening()?oe._fireAndBubble(I,{evt:$}):this._fire(I,{evt:$,target:this,currentTarget:this})}_wheel($){this.setPointersPositions($);const oe=this.getIntersection(this.getPointerPosition());oe&&oe.isListening()?oe._fireAndBubble(L,{evt:$}):this._fire(L,{evt:$,target:this,currentTarget:this})}_pointercancel($){this.setPointersPositions($);const oe=v.getCapturedShape($.pointerId)||this.getIntersection(this.getPointerPosition());oe&&oe._fireAndBubble(G,v.createEvent($)),v.releaseCapture($.pointerId)}_lostpointercapture($){v.releaseCapture($.pointerId)}setPointersPositions($){const oe=this._getContentPosition();let Te=null,Re=null;$=$||window.event,$.touches!==void 0?(this._pointerPositions=[],this._changedPointerPositions=[],Array.prototype.forEach.call($.touches,Me=>{this._pointerPositions.push({id:Me.identifier,x:(Me.clientX-oe.left)/oe.scaleX,y:(Me.clientY-oe.top)/oe.scaleY})}),Array.prototype.forEach.call($.changedTouches||$.touches,Me=>{this._changedPointerPositions.push({id:Me.identifier,x:(Me.clientX-oe.left)/oe.scaleX,y:(Me.clientY-oe.top)/oe.scaleY})})):(Te=($.clientX-oe.left)/oe.scaleX,Re=($.clientY-oe.top)/oe.scaleY,this.pointerPos={x:Te,y:Re},this._pointerPositions=[{x:Te,y:Re,id:i.Util._getFirstPointerId($)}],this._changedPointerPositions=[{x:Te,y:Re,id:i.Util._getFirstPointerId($)}])}_setPointerPosition($){i.Util.warn('Method _setPointerPosition is deprecated. Use "stage.setPointersPositions(event)" instead.'),this.setPointersPositions($)}_getContentPosition(){if(!this.content||!this.content.getBoundingClientRect)return{top:0,left:0,scaleX:1,scaleY:1};const $=this.content.getBoundingClientRect();return{top:$.top,left:$.left,scaleX:$.width/this.content.clientWidth||1,scaleY:$.height/this.content.clientHeight||1}}_buildDOM(){if(this.bufferCanvas=new h.SceneCanvas({width:this.width(),height:this.height()}),this.bufferHitCanvas=new h.HitCanvas({pixelRatio:1,width:this.width(),height:this.height()}),!c.Konva.isBrowser)return;const $=this.container();if(!$)throw"Stage has no container. A container is required.";$.innerHTML="",this.content=document.createElement("div"),this.content.style.position="relative",this.content.style.userSelect="none",this.content.className="konvajs-content",this.content.setAttribute("role","presentation"),$.appendChild(this.content),this._resizeDOM()}cache(){return i.Util.warn("Cache function is not allowed for stage. You may use cache only for layers, groups and shapes."),this}clearCache(){return this}batchDraw(){return this.getChildren().forEach(function($){$.batchDraw()}),this}}n.Stage=Se,Se.prototype.nodeType=p,(0,g._registerNode)(Se),u.Factory.addGetterSetter(Se,"container"),c.Konva.isBrowser&&document.addEventListener("visibilitychange",()=>{n.stages.forEach(xe=>{xe.batchDraw()})})}(G2)),G2}var bh={},q2={},d6;function en(){return d6||(d6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.Shape=n.shapes=void 0;const i=ct(),u=Ea(),s=vt(),c=wa(),h=_t(),d=ct(),g=B8(),v="hasShadow",p="shadowRGBA",_="patternImage",T="linearGradient",C="radialGradient";let x;function E(){return x||(x=u.Util.createCanvasElement().getContext("2d"),x)}n.shapes={};function O(Y){const V=this.attrs.fillRule;V?Y.fill(V):Y.fill()}function w(Y){Y.stroke()}function U(Y){const V=this.attrs.fillRule;V?Y.fill(V):Y.fill()}function A(Y){Y.stroke()}function R(){this._clearCache(v)}function z(){this._clearCache(p)}function G(){this._clearCache(_)}function B(){this._clearCache(T)}function Q(){this._clearCache(C)}class X extends c.Node{constructor(V){super(V);let F;for(;F=u.Util.getRandomColor(),!(F&&!(F in n.shapes)););this.colorKey=F,n.shapes[F]=this}getContext(){return u.Util.warn("shape.getContext() method is deprecated. Please do not use it."),this.getLayer().getContext()}getCanvas(){return u.Util.warn("shape.getCanvas() method is deprecated. Please do not use it."),this.getLayer().getCanvas()}getSceneFunc(){return this.attrs.sceneFunc||this._sceneFunc}getHitFunc(){return this.attrs.hitFunc||this._hitFunc}hasShadow(){return this._getCache(v,this._hasShadow)}_hasShadow(){return this.shadowEnabled()&&this.shadowOpacity()!==0&&!!(this.shadowColor()||this.shadowBlur()||this.shadowOffsetX()||this.shadowOffsetY())}_getFillPattern(){return this._getCache(_,this.__getFillPattern)}__getFillPattern(){if(this.fillPatternImage()){const F=E().createPattern(this.fillPatternImage(),this.fillPatternRepeat()||"repeat");if(F&&F.setTransform){const I=new u.Transform;I.translate(this.fillPatternX(),this.fillPatternY()),I.rotate(i.Konva.getAngle(this.fillPatternRotation())),I.scale(this.fillPatternScaleX(),this.fillPatternScaleY()),I.translate(-1*this.fillPatternOffsetX(),-1*this.fillPatternOffsetY());const D=I.getMatrix(),P=typeof DOMMatrix>"u"?{a:D[0],b:D[1],c:D[2],d:D[3],e:D[4],f:D[5]}:new DOMMatrix(D);F.setTransform(P)}return F}}_getLinearGradient(){return this._getCache(T,this.__getLinearGradient)}__getLinearGradient(){const V=this.fillLinearGradientColorStops();if(V){const F=E(),I=this.fillLinearGradientStartPoint(),D=this.fillLinearGradientEndPoint(),P=F.createLinearGradient(I.x,I.y,D.x,D.y);for(let H=0;H<V.length;H+=2)P.addColorStop(V[H],V[H+1]);return P}}_getRadialGradient(){return this._getCache(C,this.__getRadialGradient)}__getRadialGradient(){const V=this.fillRadialGradientColorStops();if(V){const F=E(),I=this.fillRadialGradientStartPoint(),D=this.fillRadialGradientEndPoint(),P=F.createRadialGradient(I.x,I.y,this.fillRadialGradientStartRadius(),D.x,D.y,this.fillRadialGradientEndRadius());for(let H=0;H<V.length;H+=2)P.addColorStop(V[H],V[H+1]);return P}}getShadowRGBA(){return this._getCache(p,this._getShadowRGBA)}_getShadowRGBA(){if(!this.hasShadow())return;const V=u.Util.colorToRGBA(this.shadowColor());if(V)return"rgba("+V.r+","+V.g+","+V.b+","+V.a*(this.shadowOpacity()||1)+")"}hasFill(){return this._calculate("hasFill",["fillEnabled","fill","fillPatternImage","fillLinearGradientColorStops","fillRadialGradientColorStops"],()=>this.fillEnabled()&&!!(this.fill()||this.fillPatternImage()||this.fillLinearGradientColorStops()||this.fillRadialGradientColorStops()))}hasStroke(){return this._calculate("hasStroke",["strokeEnabled","strokeWidth","stroke","strokeLinearGradientColorStops"],()=>this.strokeEnabled()&&this.strokeWidth()&&!!(this.stroke()||this.strokeLinearGradientColorStops()))}hasHitStroke(){const V=this.hitStrokeWidth();return V==="auto"?this.hasStroke():this.strokeEnabled()&&!!V}intersects(V){const F=this.getStage();if(!F)return!1;const I=F.bufferHitCanvas;return I.getContext().clear(),this.drawHit(I,void 0,!0),I.context.getImageData(Math.round(V.x),Math.round(V.y),1,1).data[3]>0}destroy(){return c.Node.prototype.destroy.call(this),delete n.shapes[this.colorKey],delete this.colorKey,this}_useBufferCanvas(V){var F;if(!((F=this.attrs.perfectDrawEnabled)!==null&&F!==void 0?F:!0))return!1;const D=V||this.hasFill(),P=this.hasStroke(),H=this.getAbsoluteOpacity()!==1;if(D&&P&&H)return!0;const N=this.hasShadow(),L=this.shadowForStrokeEnabled();return!!(D&&P&&N&&L)}setStrokeHitEnabled(V){u.Util.warn("strokeHitEnabled property is deprecated. Please use hitStrokeWidth instead."),V?this.hitStrokeWidth("auto"):this.hitStrokeWidth(0)}getStrokeHitEnabled(){return this.hitStrokeWidth()!==0}getSelfRect(){const V=this.size();return{x:this._centroid?-V.width/2:0,y:this._centroid?-V.height/2:0,width:V.width,height:V.height}}getClientRect(V={}){let F=!1,I=this.getParent();for(;I;){if(I.isCached()){F=!0;break}I=I.getParent()}const D=V.skipTransform,P=V.relativeTo||F&&this.getStage()||void 0,H=this.getSelfRect(),L=!V.skipStroke&&this.hasStroke()&&this.strokeWidth()||0,Z=H.width+L,ae=H.height+L,j=!V.skipShadow&&this.hasShadow(),te=j?this.shadowOffsetX():0,de=j?this.shadowOffsetY():0,ne=Z+Math.abs(te),ce=ae+Math.abs(de),Se=j&&this.shadowBlur()||0,xe=ne+Se*2,$=ce+Se*2,oe={width:xe,height:$,x:-(L/2+Se)+Math.min(te,0)+H.x,y:-(L/2+Se)+Math.min(de,0)+H.y};return D?oe:this._transformedRect(oe,P)}drawScene(V,F,I){const D=this.getLayer();let P=V||D.getCanvas(),H=P.getContext(),N=this._getCanvasCache(),L=this.getSceneFunc(),Z=this.hasShadow(),ae,j;const te=P.isCache,de=F===this;if(!this.isVisible()&&!de)return this;if(N){H.save();const ce=this.getAbsoluteTransform(F).getMatrix();return H.transform(ce[0],ce[1],ce[2],ce[3],ce[4],ce[5]),this._drawCachedSceneCanvas(H),H.restore(),this}if(!L)return this;if(H.save(),this._useBufferCanvas()&&!te){ae=this.getStage();const ce=I||ae.bufferCanvas;j=ce.getContext(),j.clear(),j.save(),j._applyLineJoin(this);var ne=this.getAbsoluteTransform(F).getMatrix();j.transform(ne[0],ne[1],ne[2],ne[3],ne[4],ne[5]),L.call(this,j,this),j.restore();const Se=ce.pixelRatio;Z&&H._applyShadow(this),H._applyOpacity(this),H._applyGlobalCompositeOperation(this),H.drawImage(ce._canvas,0,0,ce.width/Se,ce.height/Se)}else{if(H._applyLineJoin(this),!de){var ne=this.getAbsoluteTransform(F).getMatrix();H.transform(ne[0],ne[1],ne[2],ne[3],ne[4],ne[5]),H._applyOpacity(this),H._applyGlobalCompositeOperation(this)}Z&&H._applyShadow(this),L.call(this,H,this)}return H.restore(),this}drawHit(V,F,I=!1){if(!this.shouldDrawHit(F,I))return this;const D=this.getLayer(),P=V||D.hitCanvas,H=P&&P.getContext(),N=this.hitFunc()||this.sceneFunc(),L=this._getCanvasCache(),Z=L&&L.hit;if(this.colorKey||u.Util.warn("Looks like your canvas has a destroyed shape in it. Do not reuse shape after you destroyed it. If you want to reuse shape you should call remove() instead of destroy()"),Z){H.save();const j=this.getAbsoluteTransform(F).getMatrix();return H.transform(j[0],j[1],j[2],j[3],j[4],j[5]),this._drawCachedHitCanvas(H),H.restore(),this}if(!N)return this;if(H.save(),H._applyLineJoin(this),!(this===F)){const j=this.getAbsoluteTransform(F).getMatrix();H.transform(j[0],j[1],j[2],j[3],j[4],j[5])}return N.call(this,H,this),H.restore(),this}drawHitFromCache(V=0){const F=this._getCanvasCache(),I=this._getCachedSceneCanvas(),D=F.hit,P=D.getContext(),H=D.getWidth(),N=D.getHeight();P.clear(),P.drawImage(I._canvas,0,0,H,N);try{const L=P.getImageData(0,0,H,N),Z=L.data,ae=Z.length,j=u.Util._hexToRgb(this.colorKey);for(let te=0;te<ae;te+=4)Z[te+3]>V?(Z[te]=j.r,Z[te+1]=j.g,Z[te+2]=j.b,Z[te+3]=255):Z[te+3]=0;P.putImageData(L,0,0)}catch(L){u.Util.error("Unable to draw hit graph from cached scene canvas. "+L.message)}return this}hasPointerCapture(V){return g.hasPointerCapture(V,this)}setPointerCapture(V){g.setPointerCapture(V,this)}releaseCapture(V){g.releaseCapture(V,this)}}n.Shape=X,X.prototype._fillFunc=O,X.prototype._strokeFunc=w,X.prototype._fillFuncHit=U,X.prototype._strokeFuncHit=A,X.prototype._centroid=!1,X.prototype.nodeType="Shape",(0,d._registerNode)(X),X.prototype.eventListeners={},X.prototype.on.call(X.prototype,"shadowColorChange.konva shadowBlurChange.konva shadowOffsetChange.konva shadowOpacityChange.konva shadowEnabledChange.konva",R),X.prototype.on.call(X.prototype,"shadowColorChange.konva shadowOpacityChange.konva shadowEnabledChange.konva",z),X.prototype.on.call(X.prototype,"fillPriorityChange.konva fillPatternImageChange.konva fillPatternRepeatChange.konva fillPatternScaleXChange.konva fillPatternScaleYChange.konva fillPatternOffsetXChange.konva fillPatternOffsetYChange.konva fillPatternXChange.konva fillPatternYChange.konva fillPatternRotationChange.konva",G),X.prototype.on.call(X.prototype,"fillPriorityChange.konva fillLinearGradientColorStopsChange.konva fillLinearGradientStartPointXChange.konva fillLinearGradientStartPointYChange.konva fillLinearGradientEndPointXChange.konva fillLinearGradientEndPointYChange.konva",B),X.prototype.on.call(X.prototype,"fillPriorityChange.konva fillRadialGradientColorStopsChange.konva fillRadialGradientStartPointXChange.konva fillRadialGradientStartPointYChange.konva fillRadialGradientEndPointXChange.konva fillRadialGradientEndPointYChange.konva fillRadialGradientStartRadiusChange.konva fillRadialGradientEndRadiusChange.konva",Q),s.Factory.addGetterSetter(X,"stroke",void 0,(0,h.getStringOrGradientValidator)()),s.Factory.addGetterSetter(X,"strokeWidth",2,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"fillAfterStrokeEnabled",!1),s.Factory.addGetterSetter(X,"hitStrokeWidth","auto",(0,h.getNumberOrAutoValidator)()),s.Factory.addGetterSetter(X,"strokeHitEnabled",!0,(0,h.getBooleanValidator)()),s.Factory.addGetterSetter(X,"perfectDrawEnabled",!0,(0,h.getBooleanValidator)()),s.Factory.addGetterSetter(X,"shadowForStrokeEnabled",!0,(0,h.getBooleanValidator)()),s.Factory.addGetterSetter(X,"lineJoin"),s.Factory.addGetterSetter(X,"lineCap"),s.Factory.addGetterSetter(X,"sceneFunc"),s.Factory.addGetterSetter(X,"hitFunc"),s.Factory.addGetterSetter(X,"dash"),s.Factory.addGetterSetter(X,"dashOffset",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"shadowColor",void 0,(0,h.getStringValidator)()),s.Factory.addGetterSetter(X,"shadowBlur",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"shadowOpacity",1,(0,h.getNumberValidator)()),s.Factory.addComponentsGetterSetter(X,"shadowOffset",["x","y"]),s.Factory.addGetterSetter(X,"shadowOffsetX",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"shadowOffsetY",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"fillPatternImage"),s.Factory.addGetterSetter(X,"fill",void 0,(0,h.getStringOrGradientValidator)()),s.Factory.addGetterSetter(X,"fillPatternX",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"fillPatternY",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"fillLinearGradientColorStops"),s.Factory.addGetterSetter(X,"strokeLinearGradientColorStops"),s.Factory.addGetterSetter(X,"fillRadialGradientStartRadius",0),s.Factory.addGetterSetter(X,"fillRadialGradientEndRadius",0),s.Factory.addGetterSetter(X,"fillRadialGradientColorStops"),s.Factory.addGetterSetter(X,"fillPatternRepeat","repeat"),s.Factory.addGetterSetter(X,"fillEnabled",!0),s.Factory.addGetterSetter(X,"strokeEnabled",!0),s.Factory.addGetterSetter(X,"shadowEnabled",!0),s.Factory.addGetterSetter(X,"dashEnabled",!0),s.Factory.addGetterSetter(X,"strokeScaleEnabled",!0),s.Factory.addGetterSetter(X,"fillPriority","color"),s.Factory.addComponentsGetterSetter(X,"fillPatternOffset",["x","y"]),s.Factory.addGetterSetter(X,"fillPatternOffsetX",0,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"fillPatternOffsetY",0,(0,h.getNumberValidator)()),s.Factory.addComponentsGetterSetter(X,"fillPatternScale",["x","y"]),s.Factory.addGetterSetter(X,"fillPatternScaleX",1,(0,h.getNumberValidator)()),s.Factory.addGetterSetter(X,"fillPatternScaleY",1,(0,h.getNumberValidator)()),s.Factory.addComponentsGetterSetter(X,"fillLinearGradientStartPoint",["x","y"]),s.Factory.addComponentsGetterSetter(X,"strokeLinearGradientStartPoint",["x","y"]),s.Factory.addGetterSetter(X,"fillLinearGradientStartPointX",0),s.Factory.addGetterSetter(X,"strokeLinearGradientStartPointX",0),s.Factory.addGetterSetter(X,"fillLinearGradientStartPointY",0),s.Factory.addGetterSetter(X,"strokeLinearGradientStartPointY",0),s.Factory.addComponentsGetterSetter(X,"fillLinearGradientEndPoint",["x","y"]),s.Factory.addComponentsGetterSetter(X,"strokeLinearGradientEndPoint",["x","y"]),s.Factory.addGetterSetter(X,"fillLinearGradientEndPointX",0),s.Factory.addGetterSetter(X,"strokeLinearGradientEndPointX",0),s.Factory.addGetterSetter(X,"fillLinearGradientEndPointY",0),s.Factory.addGetterSetter(X,"strokeLinearGradientEndPointY",0),s.Factory.addComponentsGetterSetter(X,"fillRadialGradientStartPoint",["x","y"]),s.Factory.addGetterSetter(X,"fillRadialGradientStartPointX",0),s.Factory.addGetterSetter(X,"fillRadialGradientStartPointY",0),s.Factory.addComponentsGetterSetter(X,"fillRadialGradientEndPoint",["x","y"]),s.Factory.addGetterSetter(X,"fillRadialGradientEndPointX",0),s.Factory.addGetterSetter(X,"fillRadialGradientEndPointY",0),s.Factory.addGetterSetter(X,"fillPatternRotation",0),s.Factory.addGetterSetter(X,"fillRule",void 0,(0,h.getStringValidator)()),s.Factory.backCompat(X,{dashArray:"dash",getDashArray:"getDash",setDashArray:"getDash",drawFunc:"sceneFunc",getDrawFunc:"getSceneFunc",setDrawFunc:"setSceneFunc",drawHitFunc:"hitFunc",getDrawHitFunc:"getHitFunc",setDrawHitFunc:"setHitFunc"})}(q2)),q2}var g6;function L8(){if(g6)return bh;g6=1,Object.defineProperty(bh,"__esModule",{value:!0}),bh.Layer=void 0;const n=Ea(),i=G1(),u=wa(),s=vt(),c=U1(),h=_t(),d=en(),g=ct(),v="#",p="beforeDraw",_="draw",T=[{x:0,y:0},{x:-1,y:-1},{x:1,y:-1},{x:1,y:1},{x:-1,y:1}],C=T.length;class x extends i.Container{constructor(O){super(O),this.canvas=new c.SceneCanvas,this.hitCanvas=new c.HitCanvas({pixelRatio:1}),this._waitingForDraw=!1,this.on("visibleChange.konva",this._checkVisibility),this._checkVisibility(),this.on("imageSmoothingEnabledChange.konva",this._setSmoothEnabled),this._setSmoothEnabled()}createPNGStream(){return this.canvas._canvas.createPNGStream()}getCanvas(){return this.canvas}getNativeCanvasElement(){return this.canvas._canvas}getHitCanvas(){return this.hitCanvas}getContext(){return this.getCanvas().getContext()}clear(O){return this.getContext().clear(O),this.getHitCanvas().getContext().clear(O),this}setZIndex(O){super.setZIndex(O);const w=this.getStage();return w&&w.content&&(w.content.removeChild(this.getNativeCanvasElement()),O<w.children.length-1?w.content.insertBefore(this.getNativeCanvasElement(),w.children[O+1].getCanvas()._canvas):w.content.appendChild(this.getNativeCanvasElement())),this}moveToTop(){u.Node.prototype.moveToTop.call(this);const O=this.getStage();return O&&O.content&&(O.content.removeChild(this.getNativeCanvasElement()),O.content.appendChild(this.getNativeCanvasElement())),!0}moveUp(){if(!u.Node.prototype.moveUp.call(this))return!1;const w=this.getStage();return!w||!w.content?!1:(w.content.removeChild(this.getNativeCanvasElement()),this.index<w.children.length-1?w.content.insertBefore(this.getNativeCanvasElement(),w.children[this.index+1].getCanvas()._canvas):w.content.appendChild(this.getNativeCanvasElement()),!0)}moveDown(){if(u.Node.prototype.moveDown.call(this)){const O=this.getStage();if(O){const w=O.children;O.content&&(O.content.removeChild(this.getNativeCanvasElement()),O.content.insertBefore(this.getNativeCanvasElement(),w[this.index+1].getCanvas()._canvas))}return!0}return!1}moveToBottom(){if(u.Node.prototype.moveToBottom.call(this)){const O=this.getStage();if(O){const w=O.children;O.content&&(O.content.removeChild(this.getNativeCanvasElement()),O.content.insertBefore(this.getNativeCanvasElement(),w[1].getCanvas()._canvas))}return!0}return!1}getLayer(){return this}remove(){const O=this.getNativeCanvasElement();return u.Node.prototype.remove.call(this),O&&O.parentNode&&n.Util._isInDocument(O)&&O.parentNode.removeChild(O),this}getStage(){return this.parent}setSize({width:O,height:w}){return this.canvas.setSize(O,w),this.hitCanvas.setSize(O,w),this._setSmoothEnabled(),this}_validateAdd(O){const w=O.getType();w!=="Group"&&w!=="Shape"&&n.Util.throw("You may only add groups and shapes to a layer.")}_toKonvaCanvas(O){return O=O||{},O.width=O.width||this.getWidth(),O.height=O.height||this.getHeight(),O.x=O.x!==void 0?O.x:this.x(),O.y=O.y!==void 0?O.y:this.y(),u.Node.prototype._toKonvaCanvas.call(this,O)}_checkVisibility(){this.visible()?this.canvas._canvas.style.display="block":this.canvas._canvas.style.display="none"}_setSmoothEnabled(){this.getContext()._context.imageSmoothingEnabled=this.imageSmoothingEnabled()}getWidth(){if(this.parent)return this.parent.width()}setWidth(){n.Util.warn('Can not change width of layer. Use "stage.width(value)" function instead.')}getHeight(){if(this.parent)return this.parent.height()}setHeight(){n.Util.warn('Can not change height of layer. Use "stage.height(value)" function instead.')}batchDraw(){return this._waitingForDraw||(this._waitingForDraw=!0,n.Util.requestAnimFrame(()=>{this.draw(),this._waitingForDraw=!1})),this}getIntersection(O){if(!this.isListening()||!this.isVisible())return null;let w=1,U=!1;for(;;){for(let A=0;A<C;A++){const R=T[A],z=this._getIntersection({x:O.x+R.x*w,y:O.y+R.y*w}),G=z.shape;if(G)return G;if(U=!!z.antialiased,!z.antialiased)break}if(U)w+=1;else return null}}_getIntersection(O){const w=this.hitCanvas.pixelRatio,U=this.hitCanvas.context.getImageData(Math.round(O.x*w),Math.round(O.y*w),1,1).data,A=U[3];if(A===255){const R=n.Util._rgbToHex(U[0],U[1],U[2]),z=d.shapes[v+R];return z?{shape:z}:{antialiased:!0}}else if(A>0)return{antialiased:!0};return{}}drawScene(O,w){const U=this.getLayer(),A=O||U&&U.getCanvas();return this._fire(p,{node:this}),this.clearBeforeDraw()&&A.getContext().clear(),i.Container.prototype.drawScene.call(this,A,w),this._fire(_,{node:this}),this}drawHit(O,w){const U=this.getLayer(),A=O||U&&U.hitCanvas;return U&&U.clearBeforeDraw()&&U.getHitCanvas().getContext().clear(),i.Container.prototype.drawHit.call(this,A,w),this}enableHitGraph(){return this.hitGraphEnabled(!0),this}disableHitGraph(){return this.hitGraphEnabled(!1),this}setHitGraphEnabled(O){n.Util.warn("hitGraphEnabled method is deprecated. Please use layer.listening() instead."),this.listening(O)}getHitGraphEnabled(O){return n.Util.warn("hitGraphEnabled method is deprecated. Please use layer.listening() instead."),this.listening()}toggleHitCanvas(){if(!this.parent||!this.parent.content)return;const O=this.parent;!!this.hitCanvas._canvas.parentNode?O.content.removeChild(this.hitCanvas._canvas):O.content.appendChild(this.hitCanvas._canvas)}destroy(){return n.Util.releaseCanvas(this.getNativeCanvasElement(),this.getHitCanvas()._canvas),super.destroy()}}return bh.Layer=x,x.prototype.nodeType="Layer",(0,g._registerNode)(x),s.Factory.addGetterSetter(x,"imageSmoothingEnabled",!0),s.Factory.addGetterSetter(x,"clearBeforeDraw",!0),s.Factory.addGetterSetter(x,"hitGraphEnabled",!0,(0,h.getBooleanValidator)()),bh}var _h={},p6;function AM(){if(p6)return _h;p6=1,Object.defineProperty(_h,"__esModule",{value:!0}),_h.FastLayer=void 0;const n=Ea(),i=L8(),u=ct();let s=class extends i.Layer{constructor(h){super(h),this.listening(!1),n.Util.warn('Konva.Fast layer is deprecated. Please use "new Konva.Layer({ listening: false })" instead.')}};return _h.FastLayer=s,s.prototype.nodeType="FastLayer",(0,u._registerNode)(s),_h}var Sh={},v6;function ny(){if(v6)return Sh;v6=1,Object.defineProperty(Sh,"__esModule",{value:!0}),Sh.Group=void 0;const n=Ea(),i=G1(),u=ct();let s=class extends i.Container{_validateAdd(h){const d=h.getType();d!=="Group"&&d!=="Shape"&&n.Util.throw("You may only add groups and shapes to groups.")}};return Sh.Group=s,s.prototype.nodeType="Group",(0,u._registerNode)(s),Sh}var xh={},m6;function iy(){if(m6)return xh;m6=1,Object.defineProperty(xh,"__esModule",{value:!0}),xh.Animation=void 0;const n=ct(),i=Ea(),u=function(){return n.glob.performance&&n.glob.performance.now?function(){return n.glob.performance.now()}:function(){return new Date().getTime()}}();let s=class zc{constructor(h,d){this.id=zc.animIdCounter++,this.frame={time:0,timeDiff:0,lastTime:u(),frameRate:0},this.func=h,this.setLayers(d)}setLayers(h){let d=[];return h&&(d=Array.isArray(h)?h:[h]),this.layers=d,this}getLayers(){return this.layers}addLayer(h){const d=this.layers,g=d.length;for(let v=0;v<g;v++)if(d[v]._id===h._id)return!1;return this.layers.push(h),!0}isRunning(){const d=zc.animations,g=d.length;for(let v=0;v<g;v++)if(d[v].id===this.id)return!0;return!1}start(){return this.stop(),this.frame.timeDiff=0,this.frame.lastTime=u(),zc._addAnimation(this),this}stop(){return zc._removeAnimation(this),this}_updateFrameObject(h){this.frame.timeDiff=h-this.frame.lastTime,this.frame.lastTime=h,this.frame.time+=this.frame.timeDiff,this.frame.frameRate=1e3/this.frame.timeDiff}static _addAnimation(h){this.animations.push(h),this._handleAnimation()}static _removeAnimation(h){const d=h.id,g=this.animations,v=g.length;for(let p=0;p<v;p++)if(g[p].id===d){this.animations.splice(p,1);break}}static _runFrames(){const h={},d=this.animations;for(let g=0;g<d.length;g++){const v=d[g],p=v.layers,_=v.func;v._updateFrameObject(u());const T=p.length;let C;if(_?C=_.call(v,v.frame)!==!1:C=!0,!!C)for(let x=0;x<T;x++){const E=p[x];E._id!==void 0&&(h[E._id]=E)}}for(const g in h)h.hasOwnProperty(g)&&h[g].batchDraw()}static _animationLoop(){const h=zc;h.animations.length?(h._runFrames(),i.Util.requestAnimFrame(h._animationLoop)):h.animRunning=!1}static _handleAnimation(){this.animRunning||(this.animRunning=!0,i.Util.requestAnimFrame(this._animationLoop))}};return xh.Animation=s,s.animations=[],s.animIdCounter=0,s.animRunning=!1,xh}var H2={},y6;function RM(){return y6||(y6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.Easings=n.Tween=void 0;const i=Ea(),u=iy(),s=wa(),c=ct(),h={node:1,duration:1,easing:1,onFinish:1,yoyo:1},d=1,g=2,v=3,p=["fill","stroke","shadowColor"];let _=0;class T{constructor(E,O,w,U,A,R,z){this.prop=E,this.propFunc=O,this.begin=U,this._pos=U,this.duration=R,this._change=0,this.prevPos=0,this.yoyo=z,this._time=0,this._position=0,this._startTime=0,this._finish=0,this.func=w,this._change=A-this.begin,this.pause()}fire(E){const O=this[E];O&&O()}setTime(E){E>this.duration?this.yoyo?(this._time=this.duration,this.reverse()):this.finish():E<0?this.yoyo?(this._time=0,this.play()):this.reset():(this._time=E,this.update())}getTime(){return this._time}setPosition(E){this.prevPos=this._pos,this.propFunc(E),this._pos=E}getPosition(E){return E===void 0&&(E=this._time),this.func(E,this.begin,this._change,this.duration)}play(){this.state=g,this._startTime=this.getTimer()-this._time,this.onEnterFrame(),this.fire("onPlay")}reverse(){this.state=v,this._time=this.duration-this._time,this._startTime=this.getTimer()-this._time,this.onEnterFrame(),this.fire("onReverse")}seek(E){this.pause(),this._time=E,this.update(),this.fire("onSeek")}reset(){this.pause(),this._time=0,this.update(),this.fire("onReset")}finish(){this.pause(),this._time=this.duration,this.update(),this.fire("onFinish")}update(){this.setPosition(this.getPosition(this._time)),this.fire("onUpdate")}onEnterFrame(){const E=this.getTimer()-this._startTime;this.state===g?this.setTime(E):this.state===v&&this.setTime(this.duration-E)}pause(){this.state=d,this.fire("onPause")}getTimer(){return new Date().getTime()}}class C{constructor(E){const O=this,w=E.node,U=w._id,A=E.easing||n.Easings.Linear,R=!!E.yoyo;let z,G;typeof E.duration>"u"?z=.3:E.duration===0?z=.001:z=E.duration,this.node=w,this._id=_++;const B=w.getLayer()||(w instanceof c.Konva.Stage?w.getLayers():null);B||i.Util.error("Tween constructor have `node` that is not in a layer. Please add node into layer first."),this.anim=new u.Animation(function(){O.tween.onEnterFrame()},B),this.tween=new T(G,function(Q){O._tweenFunc(Q)},A,0,1,z*1e3,R),this._addListeners(),C.attrs[U]||(C.attrs[U]={}),C.attrs[U][this._id]||(C.attrs[U][this._id]={}),C.tweens[U]||(C.tweens[U]={});for(G in E)h[G]===void 0&&this._addAttr(G,E[G]);this.reset(),this.onFinish=E.onFinish,this.onReset=E.onReset,this.onUpdate=E.onUpdate}_addAttr(E,O){const w=this.node,U=w._id;let A,R,z,G,B;const Q=C.tweens[U][E];Q&&delete C.attrs[U][Q][E];let X=w.getAttr(E);if(i.Util._isArray(O))if(A=[],R=Math.max(O.length,X.length),E==="points"&&O.length!==X.length&&(O.length>X.length?(G=X,X=i.Util._prepareArrayForTween(X,O,w.closed())):(z=O,O=i.Util._prepareArrayForTween(O,X,w.closed()))),E.indexOf("fill")===0)for(let Y=0;Y<R;Y++)if(Y%2===0)A.push(O[Y]-X[Y]);else{const V=i.Util.colorToRGBA(X[Y]);B=i.Util.colorToRGBA(O[Y]),X[Y]=V,A.push({r:B.r-V.r,g:B.g-V.g,b:B.b-V.b,a:B.a-V.a})}else for(let Y=0;Y<R;Y++)A.push(O[Y]-X[Y]);else p.indexOf(E)!==-1?(X=i.Util.colorToRGBA(X),B=i.Util.colorToRGBA(O),A={r:B.r-X.r,g:B.g-X.g,b:B.b-X.b,a:B.a-X.a}):A=O-X;C.attrs[U][this._id][E]={start:X,diff:A,end:O,trueEnd:z,trueStart:G},C.tweens[U][E]=this._id}_tweenFunc(E){const O=this.node,w=C.attrs[O._id][this._id];let U,A,R,z,G,B,Q,X;for(U in w){if(A=w[U],R=A.start,z=A.diff,X=A.end,i.Util._isArray(R))if(G=[],Q=Math.max(R.length,X.length),U.indexOf("fill")===0)for(B=0;B<Q;B++)B%2===0?G.push((R[B]||0)+z[B]*E):G.push("rgba("+Math.round(R[B].r+z[B].r*E)+","+Math.round(R[B].g+z[B].g*E)+","+Math.round(R[B].b+z[B].b*E)+","+(R[B].a+z[B].a*E)+")");else for(B=0;B<Q;B++)G.push((R[B]||0)+z[B]*E);else p.indexOf(U)!==-1?G="rgba("+Math.round(R.r+z.r*E)+","+Math.round(R.g+z.g*E)+","+Math.round(R.b+z.b*E)+","+(R.a+z.a*E)+")":G=R+z*E;O.setAttr(U,G)}}_addListeners(){this.tween.onPlay=()=>{this.anim.start()},this.tween.onReverse=()=>{this.anim.start()},this.tween.onPause=()=>{this.anim.stop()},this.tween.onFinish=()=>{const E=this.node,O=C.attrs[E._id][this._id];O.points&&O.points.trueEnd&&E.setAttr("points",O.points.trueEnd),this.onFinish&&this.onFinish.call(this)},this.tween.onReset=()=>{const E=this.node,O=C.attrs[E._id][this._id];O.points&&O.points.trueStart&&E.points(O.points.trueStart),this.onReset&&this.onReset()},this.tween.onUpdate=()=>{this.onUpdate&&this.onUpdate.call(this)}}play(){return this.tween.play(),this}reverse(){return this.tween.reverse(),this}reset(){return this.tween.reset(),this}seek(E){return this.tween.seek(E*1e3),this}pause(){return this.tween.pause(),this}finish(){return this.tween.finish(),this}destroy(){const E=this.node._id,O=this._id,w=C.tweens[E];this.pause();for(const U in w)delete C.tweens[E][U];delete C.attrs[E][O]}}n.Tween=C,C.attrs={},C.tweens={},s.Node.prototype.to=function(x){const E=x.onFinish;x.node=this,x.onFinish=function(){this.destroy(),E&&E()},new C(x).play()},n.Easings={BackEaseIn(x,E,O,w){return O*(x/=w)*x*((1.70158+1)*x-1.70158)+E},BackEaseOut(x,E,O,w){return O*((x=x/w-1)*x*((1.70158+1)*x+1.70158)+1)+E},BackEaseInOut(x,E,O,w){let U=1.70158;return(x/=w/2)<1?O/2*(x*x*(((U*=1.525)+1)*x-U))+E:O/2*((x-=2)*x*(((U*=1.525)+1)*x+U)+2)+E},ElasticEaseIn(x,E,O,w,U,A){let R=0;return x===0?E:(x/=w)===1?E+O:(A||(A=w*.3),!U||U<Math.abs(O)?(U=O,R=A/4):R=A/(2*Math.PI)*Math.asin(O/U),-(U*Math.pow(2,10*(x-=1))*Math.sin((x*w-R)*(2*Math.PI)/A))+E)},ElasticEaseOut(x,E,O,w,U,A){let R=0;return x===0?E:(x/=w)===1?E+O:(A||(A=w*.3),!U||U<Math.abs(O)?(U=O,R=A/4):R=A/(2*Math.PI)*Math.asin(O/U),U*Math.pow(2,-10*x)*Math.sin((x*w-R)*(2*Math.PI)/A)+O+E)},ElasticEaseInOut(x,E,O,w,U,A){let R=0;return x===0?E:(x/=w/2)===2?E+O:(A||(A=w*(.3*1.5)),!U||U<Math.abs(O)?(U=O,R=A/4):R=A/(2*Math.PI)*Math.asin(O/U),x<1?-.5*(U*Math.pow(2,10*(x-=1))*Math.sin((x*w-R)*(2*Math.PI)/A))+E:U*Math.pow(2,-10*(x-=1))*Math.sin((x*w-R)*(2*Math.PI)/A)*.5+O+E)},BounceEaseOut(x,E,O,w){return(x/=w)<1/2.75?O*(7.5625*x*x)+E:x<2/2.75?O*(7.5625*(x-=1.5/2.75)*x+.75)+E:x<2.5/2.75?O*(7.5625*(x-=2.25/2.75)*x+.9375)+E:O*(7.5625*(x-=2.625/2.75)*x+.984375)+E},BounceEaseIn(x,E,O,w){return O-n.Easings.BounceEaseOut(w-x,0,O,w)+E},BounceEaseInOut(x,E,O,w){return x<w/2?n.Easings.BounceEaseIn(x*2,0,O,w)*.5+E:n.Easings.BounceEaseOut(x*2-w,0,O,w)*.5+O*.5+E},EaseIn(x,E,O,w){return O*(x/=w)*x+E},EaseOut(x,E,O,w){return-O*(x/=w)*(x-2)+E},EaseInOut(x,E,O,w){return(x/=w/2)<1?O/2*x*x+E:-O/2*(--x*(x-2)-1)+E},StrongEaseIn(x,E,O,w){return O*(x/=w)*x*x*x*x+E},StrongEaseOut(x,E,O,w){return O*((x=x/w-1)*x*x*x*x+1)+E},StrongEaseInOut(x,E,O,w){return(x/=w/2)<1?O/2*x*x*x*x*x+E:O/2*((x-=2)*x*x*x*x+2)+E},Linear(x,E,O,w){return O*x/w+E}}}(H2)),H2}var b6;function lm(){return b6||(b6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.Konva=void 0;const i=ct(),u=Ea(),s=wa(),c=G1(),h=TM(),d=L8(),g=AM(),v=ny(),p=ay(),_=en(),T=iy(),C=RM(),x=H8(),E=U1();n.Konva=u.Util._assign(i.Konva,{Util:u.Util,Transform:u.Transform,Node:s.Node,Container:c.Container,Stage:h.Stage,stages:h.stages,Layer:d.Layer,FastLayer:g.FastLayer,Group:v.Group,DD:p.DD,Shape:_.Shape,shapes:_.shapes,Animation:T.Animation,Tween:C.Tween,Easings:C.Easings,Context:x.Context,Canvas:E.Canvas}),n.default=n.Konva}(w2)),w2}var Eh={},_6;function OM(){if(_6)return Eh;_6=1,Object.defineProperty(Eh,"__esModule",{value:!0}),Eh.Arc=void 0;const n=vt(),i=en(),u=ct(),s=_t(),c=ct();let h=class extends i.Shape{_sceneFunc(g){const v=u.Konva.getAngle(this.angle()),p=this.clockwise();g.beginPath(),g.arc(0,0,this.outerRadius(),0,v,p),g.arc(0,0,this.innerRadius(),v,0,!p),g.closePath(),g.fillStrokeShape(this)}getWidth(){return this.outerRadius()*2}getHeight(){return this.outerRadius()*2}setWidth(g){this.outerRadius(g/2)}setHeight(g){this.outerRadius(g/2)}getSelfRect(){const g=this.innerRadius(),v=this.outerRadius(),p=this.clockwise(),_=u.Konva.getAngle(p?360-this.angle():this.angle()),T=Math.cos(Math.min(_,Math.PI)),C=1,x=Math.sin(Math.min(Math.max(Math.PI,_),3*Math.PI/2)),E=Math.sin(Math.min(_,Math.PI/2)),O=T*(T>0?g:v),w=C*v,U=x*(x>0?g:v),A=E*(E>0?v:g);return{x:O,y:p?-1*A:U,width:w-O,height:A-U}}};return Eh.Arc=h,h.prototype._centroid=!0,h.prototype.className="Arc",h.prototype._attrsAffectingSize=["innerRadius","outerRadius","angle","clockwise"],(0,c._registerNode)(h),n.Factory.addGetterSetter(h,"innerRadius",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(h,"outerRadius",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(h,"angle",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(h,"clockwise",!1,(0,s.getBooleanValidator)()),Eh}var Ch={},Th={},S6;function j8(){if(S6)return Th;S6=1,Object.defineProperty(Th,"__esModule",{value:!0}),Th.Line=void 0;const n=vt(),i=ct(),u=en(),s=_t();function c(g,v,p,_,T,C,x){const E=Math.sqrt(Math.pow(p-g,2)+Math.pow(_-v,2)),O=Math.sqrt(Math.pow(T-p,2)+Math.pow(C-_,2)),w=x*E/(E+O),U=x*O/(E+O),A=p-w*(T-g),R=_-w*(C-v),z=p+U*(T-g),G=_+U*(C-v);return[A,R,z,G]}function h(g,v){const p=g.length,_=[];for(let T=2;T<p-2;T+=2){const C=c(g[T-2],g[T-1],g[T],g[T+1],g[T+2],g[T+3],v);isNaN(C[0])||(_.push(C[0]),_.push(C[1]),_.push(g[T]),_.push(g[T+1]),_.push(C[2]),_.push(C[3]))}return _}class d extends u.Shape{constructor(v){super(v),this.on("pointsChange.konva tensionChange.konva closedChange.konva bezierChange.konva",function(){this._clearCache("tensionPoints")})}_sceneFunc(v){let p=this.points(),_=p.length,T=this.tension(),C=this.closed(),x=this.bezier(),E,O,w;if(_){if(v.beginPath(),v.moveTo(p[0],p[1]),T!==0&&_>4){for(E=this.getTensionPoints(),O=E.length,w=C?0:4,C||v.quadraticCurveTo(E[0],E[1],E[2],E[3]);w<O-2;)v.bezierCurveTo(E[w++],E[w++],E[w++],E[w++],E[w++],E[w++]);C||v.quadraticCurveTo(E[O-2],E[O-1],p[_-2],p[_-1])}else if(x)for(w=2;w<_;)v.bezierCurveTo(p[w++],p[w++],p[w++],p[w++],p[w++],p[w++]);else for(w=2;w<_;w+=2)v.lineTo(p[w],p[w+1]);C?(v.closePath(),v.fillStrokeShape(this)):v.strokeShape(this)}}getTensionPoints(){return this._getCache("tensionPoints",this._getTensionPoints)}_getTensionPoints(){return this.closed()?this._getTensionPointsClosed():h(this.points(),this.tension())}_getTensionPointsClosed(){const v=this.points(),p=v.length,_=this.tension(),T=c(v[p-2],v[p-1],v[0],v[1],v[2],v[3],_),C=c(v[p-4],v[p-3],v[p-2],v[p-1],v[0],v[1],_),x=h(v,_);return[T[2],T[3]].concat(x).concat([C[0],C[1],v[p-2],v[p-1],C[2],C[3],T[0],T[1],v[0],v[1]])}getWidth(){return this.getSelfRect().width}getHeight(){return this.getSelfRect().height}getSelfRect(){let v=this.points();if(v.length<4)return{x:v[0]||0,y:v[1]||0,width:0,height:0};this.tension()!==0?v=[v[0],v[1],...this._getTensionPoints(),v[v.length-2],v[v.length-1]]:v=this.points();let p=v[0],_=v[0],T=v[1],C=v[1],x,E;for(let O=0;O<v.length/2;O++)x=v[O*2],E=v[O*2+1],p=Math.min(p,x),_=Math.max(_,x),T=Math.min(T,E),C=Math.max(C,E);return{x:p,y:T,width:_-p,height:C-T}}}return Th.Line=d,d.prototype.className="Line",d.prototype._attrsAffectingSize=["points","bezier","tension"],(0,i._registerNode)(d),n.Factory.addGetterSetter(d,"closed",!1),n.Factory.addGetterSetter(d,"bezier",!1),n.Factory.addGetterSetter(d,"tension",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(d,"points",[],(0,s.getNumberArrayValidator)()),Th}var Ah={},B2={},x6;function MM(){return x6||(x6=1,function(n){Object.defineProperty(n,"__esModule",{value:!0}),n.t2length=n.getQuadraticArcLength=n.getCubicArcLength=n.binomialCoefficients=n.cValues=n.tValues=void 0,n.tValues=[[],[],[-.5773502691896257,.5773502691896257],[0,-.7745966692414834,.7745966692414834],[-.33998104358485626,.33998104358485626,-.8611363115940526,.8611363115940526],[0,-.5384693101056831,.5384693101056831,-.906179845938664,.906179845938664],[.6612093864662645,-.6612093864662645,-.2386191860831969,.2386191860831969,-.932469514203152,.932469514203152],[0,.4058451513773972,-.4058451513773972,-.7415311855993945,.7415311855993945,-.9491079123427585,.9491079123427585],[-.1834346424956498,.1834346424956498,-.525532409916329,.525532409916329,-.7966664774136267,.7966664774136267,-.9602898564975363,.9602898564975363],[0,-.8360311073266358,.8360311073266358,-.9681602395076261,.9681602395076261,-.3242534234038089,.3242534234038089,-.6133714327005904,.6133714327005904],[-.14887433898163122,.14887433898163122,-.4333953941292472,.4333953941292472,-.6794095682990244,.6794095682990244,-.8650633666889845,.8650633666889845,-.9739065285171717,.9739065285171717],[0,-.26954315595234496,.26954315595234496,-.5190961292068118,.5190961292068118,-.7301520055740494,.7301520055740494,-.8870625997680953,.8870625997680953,-.978228658146057,.978228658146057],[-.1252334085114689,.1252334085114689,-.3678314989981802,.3678314989981802,-.5873179542866175,.5873179542866175,-.7699026741943047,.7699026741943047,-.9041172563704749,.9041172563704749,-.9815606342467192,.9815606342467192],[0,-.2304583159551348,.2304583159551348,-.44849275103644687,.44849275103644687,-.6423493394403402,.6423493394403402,-.8015780907333099,.8015780907333099,-.9175983992229779,.9175983992229779,-.9841830547185881,.9841830547185881],[-.10805494870734367,.10805494870734367,-.31911236892788974,.31911236892788974,-.5152486363581541,.5152486363581541,-.6872929048116855,.6872929048116855,-.827201315069765,.827201315069765,-.9284348836635735,.9284348836635735,-.9862838086968123,.9862838086968123],[0,-.20119409399743451,.20119409399743451,-.3941513470775634,.3941513470775634,-.5709721726085388,.5709721726085388,-.7244177313601701,.7244177313601701,-.8482065834104272,.8482065834104272,-.937273392400706,.937273392400706,-.9879925180204854,.9879925180204854],[-.09501250983763744,.09501250983763744,-.2816035507792589,.2816035507792589,-.45801677765722737,.45801677765722737,-.6178762444026438,.6178762444026438,-.755404408355003,.755404408355003,-.8656312023878318,.8656312023878318,-.9445750230732326,.9445750230732326,-.9894009349916499,.9894009349916499],[0,-.17848418149584785,.17848418149584785,-.3512317634538763,.3512317634538763,-.5126905370864769,.5126905370864769,-.6576711592166907,.6576711592166907,-.7815140038968014,.7815140038968014,-.8802391537269859,.8802391537269859,-.9506755217687678,.9506755217687678,-.9905754753144174,.9905754753144174],[-.0847750130417353,.0847750130417353,-.2518862256915055,.2518862256915055,-.41175116146284263,.41175116146284263,-.5597708310739475,.5597708310739475,-.6916870430603532,.6916870430603532,-.8037049589725231,.8037049589725231,-.8926024664975557,.8926024664975557,-.9558239495713977,.9558239495713977,-.9915651684209309,.9915651684209309],[0,-.16035864564022537,.16035864564022537,-.31656409996362983,.31656409996362983,-.46457074137596094,.46457074137596094,-.600545304661681,.600545304661681,-.7209661773352294,.7209661773352294,-.8227146565371428,.8227146565371428,-.9031559036148179,.9031559036148179,-.96020815213483,.96020815213483,-.9924068438435844,.9924068438435844],[-.07652652113349734,.07652652113349734,-.22778585114164507,.22778585114164507,-.37370608871541955,.37370608871541955,-.5108670019508271,.5108670019508271,-.636053680726515,.636053680726515,-.7463319064601508,.7463319064601508,-.8391169718222188,.8391169718222188,-.912234428251326,.912234428251326,-.9639719272779138,.9639719272779138,-.9931285991850949,.9931285991850949],[0,-.1455618541608951,.1455618541608951,-.2880213168024011,.2880213168024011,-.4243421202074388,.4243421202074388,-.5516188358872198,.5516188358872198,-.6671388041974123,.6671388041974123,-.7684399634756779,.7684399634756779,-.8533633645833173,.8533633645833173,-.9200993341504008,.9200993341504008,-.9672268385663063,.9672268385663063,-.9937521706203895,.9937521706203895],[-.06973927331972223,.06973927331972223,-.20786042668822127,.20786042668822127,-.34193582089208424,.34193582089208424,-.469355837986757,.469355837986757,-.5876404035069116,.5876404035069116,-.6944872631866827,.6944872631866827,-.7878168059792081,.7878168059792081,-.8658125777203002,.8658125777203002,-.926956772187174,.926956772187174,-.9700604978354287,.9700604978354287,-.9942945854823992,.9942945854823992],[0,-.1332568242984661,.1332568242984661,-.26413568097034495,.26413568097034495,-.3903010380302908,.3903010380302908,-.5095014778460075,.5095014778460075,-.6196098757636461,.6196098757636461,-.7186613631319502,.7186613631319502,-.8048884016188399,.8048884016188399,-.8767523582704416,.8767523582704416,-.9329710868260161,.9329710868260161,-.9725424712181152,.9725424712181152,-.9947693349975522,.9947693349975522],[-.06405689286260563,.06405689286260563,-.1911188674736163,.1911188674736163,-.3150426796961634,.3150426796961634,-.4337935076260451,.4337935076260451,-.5454214713888396,.5454214713888396,-.6480936519369755,.6480936519369755,-.7401241915785544,.7401241915785544,-.820001985973903,.820001985973903,-.8864155270044011,.8864155270044011,-.9382745520027328,.9382745520027328,-.9747285559713095,.9747285559713095,-.9951872199970213,.9951872199970213]],n.cValues=[[],[],[1,1],[.8888888888888888,.5555555555555556,.5555555555555556],[.6521451548625461,.6521451548625461,.34785484513745385,.34785484513745385],[.5688888888888889,.47862867049936647,.47862867049936647,.23692688505618908,.23692688505618908],[.3607615730481386,.3607615730481386,.46791393457269104,.46791393457269104,.17132449237917036,.17132449237917036],[.4179591836734694,.3818300505051189,.3818300505051189,.27970539148927664,.27970539148927664,.1294849661688697,.1294849661688697],[.362683783378362,.362683783378362,.31370664587788727,.31370664587788727,.22238103445337448,.22238103445337448,.10122853629037626,.10122853629037626],[.3302393550012598,.1806481606948574,.1806481606948574,.08127438836157441,.08127438836157441,.31234707704000286,.31234707704000286,.26061069640293544,.26061069640293544],[.29552422471475287,.29552422471475287,.26926671930999635,.26926671930999635,.21908636251598204,.21908636251598204,.1494513491505806,.1494513491505806,.06667134430868814,.06667134430868814],[.2729250867779006,.26280454451024665,.26280454451024665,.23319376459199048,.23319376459199048,.18629021092773426,.18629021092773426,.1255803694649046,.1255803694649046,.05566856711617366,.05566856711617366],[.24914704581340277,.24914704581340277,.2334925365383548,.2334925365383548,.20316742672306592,.20316742672306592,.16007832854334622,.16007832854334622,.10693932599531843,.10693932599531843,.04717533638651183,.04717533638651183],[.2325515532308739,.22628318026289723,.22628318026289723,.2078160475368885,.2078160475368885,.17814598076194574,.17814598076194574,.13887351021978725,.13887351021978725,.09212149983772845,.09212149983772845,.04048400476531588,.04048400476531588],[.2152638534631578,.2152638534631578,.2051984637212956,.2051984637212956,.18553839747793782,.18553839747793782,.15720316715819355,.15720316715819355,.12151857068790319,.12151857068790319,.08015808715976021,.08015808715976021,.03511946033175186,.03511946033175186],[.2025782419255613,.19843148532711158,.19843148532711158,.1861610000155622,.1861610000155622,.16626920581699392,.16626920581699392,.13957067792615432,.13957067792615432,.10715922046717194,.10715922046717194,.07036604748810812,.07036604748810812,.03075324199611727,.03075324199611727],[.1894506104550685,.1894506104550685,.18260341504492358,.18260341504492358,.16915651939500254,.16915651939500254,.14959598881657674,.14959598881657674,.12462897125553388,.12462897125553388,.09515851168249279,.09515851168249279,.062253523938647894,.062253523938647894,.027152459411754096,.027152459411754096],[.17944647035620653,.17656270536699264,.17656270536699264,.16800410215645004,.16800410215645004,.15404576107681028,.15404576107681028,.13513636846852548,.13513636846852548,.11188384719340397,.11188384719340397,.08503614831717918,.08503614831717918,.0554595293739872,.0554595293739872,.02414830286854793,.02414830286854793],[.1691423829631436,.1691423829631436,.16427648374583273,.16427648374583273,.15468467512626524,.15468467512626524,.14064291467065065,.14064291467065065,.12255520671147846,.12255520671147846,.10094204410628717,.10094204410628717,.07642573025488905,.07642573025488905,.0497145488949698,.0497145488949698,.02161601352648331,.02161601352648331],[.1610544498487837,.15896884339395434,.15896884339395434,.15276604206585967,.15276604206585967,.1426067021736066,.1426067021736066,.12875396253933621,.12875396253933621,.11156664554733399,.11156664554733399,.09149002162245,.09149002162245,.06904454273764123,.06904454273764123,.0448142267656996,.0448142267656996,.019461788229726478,.019461788229726478],[.15275338713072584,.15275338713072584,.14917298647260374,.14917298647260374,.14209610931838204,.14209610931838204,.13168863844917664,.13168863844917664,.11819453196151841,.11819453196151841,.10193011981724044,.10193011981724044,.08327674157670475,.08327674157670475,.06267204833410907,.06267204833410907,.04060142980038694,.04060142980038694,.017614007139152118,.017614007139152118],[.14608113364969041,.14452440398997005,.14452440398997005,.13988739479107315,.13988739479107315,.13226893863333747,.13226893863333747,.12183141605372853,.12183141605372853,.10879729916714838,.10879729916714838,.09344442345603386,.09344442345603386,.0761001136283793,.0761001136283793,.057134425426857205,.057134425426857205,.036953789770852494,.036953789770852494,.016017228257774335,.016017228257774335],[.13925187285563198,.13925187285563198,.13654149834601517,.13654149834601517,.13117350478706238,.13117350478706238,.12325237681051242,.12325237681051242,.11293229608053922,.11293229608053922,.10041414444288096,.10041414444288096,.08594160621706773,.08594160621706773,.06979646842452049,.06979646842452049,.052293335152683286,.052293335152683286,.03377490158481415,.03377490158481415,.0146279952982722,.0146279952982722],[.13365457218610619,.1324620394046966,.1324620394046966,.12890572218808216,.12890572218808216,.12304908430672953,.12304908430672953,.11499664022241136,.11499664022241136,.10489209146454141,.10489209146454141,.09291576606003515,.09291576606003515,.07928141177671895,.07928141177671895,.06423242140852585,.06423242140852585,.04803767173108467,.04803767173108467,.030988005856979445,.030988005856979445,.013411859487141771,.013411859487141771],[.12793819534675216,.12793819534675216,.1258374563468283,.1258374563468283,.12167047292780339,.12167047292780339,.1155056680537256,.1155056680537256,.10744427011596563,.10744427011596563,.09761865210411388,.09761865210411388,.08619016153195327,.08619016153195327,.0733464814110803,.0733464814110803,.05929858491543678,.05929858491543678,.04427743881741981,.04427743881741981,.028531388628933663,.028531388628933663,.0123412297999872,.0123412297999872]],n.binomialCoefficients=[[1],[1,1],[1,2,1],[1,3,3,1]];const i=(d,g,v)=>{let p,_;const C=v/2;p=0;for(let x=0;x<20;x++)_=C*n.tValues[20][x]+C,p+=n.cValues[20][x]*s(d,g,_);return C*p};n.getCubicArcLength=i;const u=(d,g,v)=>{v===void 0&&(v=1);const p=d[0]-2*d[1]+d[2],_=g[0]-2*g[1]+g[2],T=2*d[1]-2*d[0],C=2*g[1]-2*g[0],x=4*(p*p+_*_),E=4*(p*T+_*C),O=T*T+C*C;if(x===0)return v*Math.sqrt(Math.pow(d[2]-d[0],2)+Math.pow(g[2]-g[0],2));const w=E/(2*x),U=O/x,A=v+w,R=U-w*w,z=A*A+R>0?Math.sqrt(A*A+R):0,G=w*w+R>0?Math.sqrt(w*w+R):0,B=w+Math.sqrt(w*w+R)!==0?R*Math.log(Math.abs((A+z)/(w+G))):0;return Math.sqrt(x)/2*(A*z-w*G+B)};n.getQuadraticArcLength=u;function s(d,g,v){const p=c(1,v,d),_=c(1,v,g),T=p*p+_*_;return Math.sqrt(T)}const c=(d,g,v)=>{const p=v.length-1;let _,T;if(p===0)return 0;if(d===0){T=0;for(let C=0;C<=p;C++)T+=n.binomialCoefficients[p][C]*Math.pow(1-g,p-C)*Math.pow(g,C)*v[C];return T}else{_=new Array(p);for(let C=0;C<p;C++)_[C]=p*(v[C+1]-v[C]);return c(d-1,g,_)}},h=(d,g,v)=>{let p=1,_=d/g,T=(d-v(_))/g,C=0;for(;p>.001;){const x=v(_+T),E=Math.abs(d-x)/g;if(E<p)p=E,_+=T;else{const O=v(_-T),w=Math.abs(d-O)/g;w<p?(p=w,_-=T):T/=2}if(C++,C>500)break}return _};n.t2length=h}(B2)),B2}var E6;function ry(){if(E6)return Ah;E6=1,Object.defineProperty(Ah,"__esModule",{value:!0}),Ah.Path=void 0;const n=vt(),i=en(),u=ct(),s=MM();let c=class ei extends i.Shape{constructor(d){super(d),this.dataArray=[],this.pathLength=0,this._readDataAttribute(),this.on("dataChange.konva",function(){this._readDataAttribute()})}_readDataAttribute(){this.dataArray=ei.parsePathData(this.data()),this.pathLength=ei.getPathLength(this.dataArray)}_sceneFunc(d){const g=this.dataArray;d.beginPath();let v=!1;for(let z=0;z<g.length;z++){const G=g[z].command,B=g[z].points;switch(G){case"L":d.lineTo(B[0],B[1]);break;case"M":d.moveTo(B[0],B[1]);break;case"C":d.bezierCurveTo(B[0],B[1],B[2],B[3],B[4],B[5]);break;case"Q":d.quadraticCurveTo(B[0],B[1],B[2],B[3]);break;case"A":var p=B[0],_=B[1],T=B[2],C=B[3],x=B[4],E=B[5],O=B[6],w=B[7],U=T>C?T:C,A=T>C?1:T/C,R=T>C?C/T:1;d.translate(p,_),d.rotate(O),d.scale(A,R),d.arc(0,0,U,x,x+E,1-w),d.scale(1/A,1/R),d.rotate(-O),d.translate(-p,-_);break;case"z":v=!0,d.closePath();break}}!v&&!this.hasFill()?d.strokeShape(this):d.fillStrokeShape(this)}getSelfRect(){let d=[];this.dataArray.forEach(function(x){if(x.command==="A"){const E=x.points[4],O=x.points[5],w=x.points[4]+O;let U=Math.PI/180;if(Math.abs(E-w)<U&&(U=Math.abs(E-w)),O<0)for(let A=E-U;A>w;A-=U){const R=ei.getPointOnEllipticalArc(x.points[0],x.points[1],x.points[2],x.points[3],A,0);d.push(R.x,R.y)}else for(let A=E+U;A<w;A+=U){const R=ei.getPointOnEllipticalArc(x.points[0],x.points[1],x.points[2],x.points[3],A,0);d.push(R.x,R.y)}}else if(x.command==="C")for(let E=0;E<=1;E+=.01){const O=ei.getPointOnCubicBezier(E,x.start.x,x.start.y,x.points[0],x.points[1],x.points[2],x.points[3],x.points[4],x.points[5]);d.push(O.x,O.y)}else d=d.concat(x.points)});let g=d[0],v=d[0],p=d[1],_=d[1],T,C;for(let x=0;x<d.length/2;x++)T=d[x*2],C=d[x*2+1],isNaN(T)||(g=Math.min(g,T),v=Math.max(v,T)),isNaN(C)||(p=Math.min(p,C),_=Math.max(_,C));return{x:g,y:p,width:v-g,height:_-p}}getLength(){return this.pathLength}getPointAtLength(d){return ei.getPointAtLengthOfDataArray(d,this.dataArray)}static getLineLength(d,g,v,p){return Math.sqrt((v-d)*(v-d)+(p-g)*(p-g))}static getPathLength(d){let g=0;for(let v=0;v<d.length;++v)g+=d[v].pathLength;return g}static getPointAtLengthOfDataArray(d,g){let v,p=0,_=g.length;if(!_)return null;for(;p<_&&d>g[p].pathLength;)d-=g[p].pathLength,++p;if(p===_)return v=g[p-1].points.slice(-2),{x:v[0],y:v[1]};if(d<.01)return v=g[p].points.slice(0,2),{x:v[0],y:v[1]};const T=g[p],C=T.points;switch(T.command){case"L":return ei.getPointOnLine(d,T.start.x,T.start.y,C[0],C[1]);case"C":return ei.getPointOnCubicBezier((0,s.t2length)(d,ei.getPathLength(g),z=>(0,s.getCubicArcLength)([T.start.x,C[0],C[2],C[4]],[T.start.y,C[1],C[3],C[5]],z)),T.start.x,T.start.y,C[0],C[1],C[2],C[3],C[4],C[5]);case"Q":return ei.getPointOnQuadraticBezier((0,s.t2length)(d,ei.getPathLength(g),z=>(0,s.getQuadraticArcLength)([T.start.x,C[0],C[2]],[T.start.y,C[1],C[3]],z)),T.start.x,T.start.y,C[0],C[1],C[2],C[3]);case"A":var x=C[0],E=C[1],O=C[2],w=C[3],U=C[4],A=C[5],R=C[6];return U+=A*d/T.pathLength,ei.getPointOnEllipticalArc(x,E,O,w,U,R)}return null}static getPointOnLine(d,g,v,p,_,T,C){T=T??g,C=C??v;const x=this.getLineLength(g,v,p,_);if(x<1e-10)return{x:g,y:v};if(p===g)return{x:T,y:C+(_>v?d:-d)};const E=(_-v)/(p-g),O=Math.sqrt(d*d/(1+E*E))*(p<g?-1:1),w=E*O;if(Math.abs(C-v-E*(T-g))<1e-10)return{x:T+O,y:C+w};const U=((T-g)*(p-g)+(C-v)*(_-v))/(x*x),A=g+U*(p-g),R=v+U*(_-v),z=this.getLineLength(T,C,A,R),G=Math.sqrt(d*d-z*z),B=Math.sqrt(G*G/(1+E*E))*(p<g?-1:1),Q=E*B;return{x:A+B,y:R+Q}}static getPointOnCubicBezier(d,g,v,p,_,T,C,x,E){function O(G){return G*G*G}function w(G){return 3*G*G*(1-G)}function U(G){return 3*G*(1-G)*(1-G)}function A(G){return(1-G)*(1-G)*(1-G)}const R=x*O(d)+T*w(d)+p*U(d)+g*A(d),z=E*O(d)+C*w(d)+_*U(d)+v*A(d);return{x:R,y:z}}static getPointOnQuadraticBezier(d,g,v,p,_,T,C){function x(A){return A*A}function E(A){return 2*A*(1-A)}function O(A){return(1-A)*(1-A)}const w=T*x(d)+p*E(d)+g*O(d),U=C*x(d)+_*E(d)+v*O(d);return{x:w,y:U}}static getPointOnEllipticalArc(d,g,v,p,_,T){const C=Math.cos(T),x=Math.sin(T),E={x:v*Math.cos(_),y:p*Math.sin(_)};return{x:d+(E.x*C-E.y*x),y:g+(E.x*x+E.y*C)}}static parsePathData(d){if(!d)return[];let g=d;const v=["m","M","l","L","v","V","h","H","z","Z","c","C","q","Q","t","T","s","S","a","A"];g=g.replace(new RegExp(" ","g"),",");for(var p=0;p<v.length;p++)g=g.replace(new RegExp(v[p],"g"),"|"+v[p]);const _=g.split("|"),T=[],C=[];let x=0,E=0;const O=/([-+]?((\d+\.\d+)|((\d+)|(\.\d+)))(?:e[-+]?\d+)?)/gi;let w;for(p=1;p<_.length;p++){let D=_[p],P=D.charAt(0);for(D=D.slice(1),C.length=0;w=O.exec(D);)C.push(w[0]);const H=[];for(let N=0,L=C.length;N<L;N++){if(C[N]==="00"){H.push(0,0);continue}const Z=parseFloat(C[N]);isNaN(Z)?H.push(0):H.push(Z)}for(;H.length>0&&!isNaN(H[0]);){let N="",L=[];const Z=x,ae=E;var U,A,R,z,G,B,Q,X,Y,V;switch(P){case"l":x+=H.shift(),E+=H.shift(),N="L",L.push(x,E);break;case"L":x=H.shift(),E=H.shift(),L.push(x,E);break;case"m":var F=H.shift(),I=H.shift();if(x+=F,E+=I,N="M",T.length>2&&T[T.length-1].command==="z"){for(let j=T.length-2;j>=0;j--)if(T[j].command==="M"){x=T[j].points[0]+F,E=T[j].points[1]+I;break}}L.push(x,E),P="l";break;case"M":x=H.shift(),E=H.shift(),N="M",L.push(x,E),P="L";break;case"h":x+=H.shift(),N="L",L.push(x,E);break;case"H":x=H.shift(),N="L",L.push(x,E);break;case"v":E+=H.shift(),N="L",L.push(x,E);break;case"V":E=H.shift(),N="L",L.push(x,E);break;case"C":L.push(H.shift(),H.shift(),H.shift(),H.shift()),x=H.shift(),E=H.shift(),L.push(x,E);break;case"c":L.push(x+H.shift(),E+H.shift(),x+H.shift(),E+H.shift()),x+=H.shift(),E+=H.shift(),N="C",L.push(x,E);break;case"S":A=x,R=E,U=T[T.length-1],U.command==="C"&&(A=x+(x-U.points[2]),R=E+(E-U.points[3])),L.push(A,R,H.shift(),H.shift()),x=H.shift(),E=H.shift(),N="C",L.push(x,E);break;case"s":A=x,R=E,U=T[T.length-1],U.command==="C"&&(A=x+(x-U.points[2]),R=E+(E-U.points[3])),L.push(A,R,x+H.shift(),E+H.shift()),x+=H.shift(),E+=H.shift(),N="C",L.push(x,E);break;case"Q":L.push(H.shift(),H.shift()),x=H.shift(),E=H.shift(),L.push(x,E);break;case"q":L.push(x+H.shift(),E+H.shift()),x+=H.shift(),E+=H.shift(),N="Q",L.push(x,E);break;case"T":A=x,R=E,U=T[T.length-1],U.command==="Q"&&(A=x+(x-U.points[0]),R=E+(E-U.points[1])),x=H.shift(),E=H.shift(),N="Q",L.push(A,R,x,E);break;case"t":A=x,R=E,U=T[T.length-1],U.command==="Q"&&(A=x+(x-U.points[0]),R=E+(E-U.points[1])),x+=H.shift(),E+=H.shift(),N="Q",L.push(A,R,x,E);break;case"A":z=H.shift(),G=H.shift(),B=H.shift(),Q=H.shift(),X=H.shift(),Y=x,V=E,x=H.shift(),E=H.shift(),N="A",L=this.convertEndpointToCenterParameterization(Y,V,x,E,Q,X,z,G,B);break;case"a":z=H.shift(),G=H.shift(),B=H.shift(),Q=H.shift(),X=H.shift(),Y=x,V=E,x+=H.shift(),E+=H.shift(),N="A",L=this.convertEndpointToCenterParameterization(Y,V,x,E,Q,X,z,G,B);break}T.push({command:N||P,points:L,start:{x:Z,y:ae},pathLength:this.calcLength(Z,ae,N||P,L)})}(P==="z"||P==="Z")&&T.push({command:"z",points:[],start:void 0,pathLength:0})}return T}static calcLength(d,g,v,p){let _,T,C,x;const E=ei;switch(v){case"L":return E.getLineLength(d,g,p[0],p[1]);case"C":return(0,s.getCubicArcLength)([d,p[0],p[2],p[4]],[g,p[1],p[3],p[5]],1);case"Q":return(0,s.getQuadraticArcLength)([d,p[0],p[2]],[g,p[1],p[3]],1);case"A":_=0;var O=p[4],w=p[5],U=p[4]+w,A=Math.PI/180;if(Math.abs(O-U)<A&&(A=Math.abs(O-U)),T=E.getPointOnEllipticalArc(p[0],p[1],p[2],p[3],O,0),w<0)for(x=O-A;x>U;x-=A)C=E.getPointOnEllipticalArc(p[0],p[1],p[2],p[3],x,0),_+=E.getLineLength(T.x,T.y,C.x,C.y),T=C;else for(x=O+A;x<U;x+=A)C=E.getPointOnEllipticalArc(p[0],p[1],p[2],p[3],x,0),_+=E.getLineLength(T.x,T.y,C.x,C.y),T=C;return C=E.getPointOnEllipticalArc(p[0],p[1],p[2],p[3],U,0),_+=E.getLineLength(T.x,T.y,C.x,C.y),_}return 0}static convertEndpointToCenterParameterization(d,g,v,p,_,T,C,x,E){const O=E*(Math.PI/180),w=Math.cos(O)*(d-v)/2+Math.sin(O)*(g-p)/2,U=-1*Math.sin(O)*(d-v)/2+Math.cos(O)*(g-p)/2,A=w*w/(C*C)+U*U/(x*x);A>1&&(C*=Math.sqrt(A),x*=Math.sqrt(A));let R=Math.sqrt((C*C*(x*x)-C*C*(U*U)-x*x*(w*w))/(C*C*(U*U)+x*x*(w*w)));_===T&&(R*=-1),isNaN(R)&&(R=0);const z=R*C*U/x,G=R*-x*w/C,B=(d+v)/2+Math.cos(O)*z-Math.sin(O)*G,Q=(g+p)/2+Math.sin(O)*z+Math.cos(O)*G,X=function(H){return Math.sqrt(H[0]*H[0]+H[1]*H[1])},Y=function(H,N){return(H[0]*N[0]+H[1]*N[1])/(X(H)*X(N))},V=function(H,N){return(H[0]*N[1]<H[1]*N[0]?-1:1)*Math.acos(Y(H,N))},F=V([1,0],[(w-z)/C,(U-G)/x]),I=[(w-z)/C,(U-G)/x],D=[(-1*w-z)/C,(-1*U-G)/x];let P=V(I,D);return Y(I,D)<=-1&&(P=Math.PI),Y(I,D)>=1&&(P=0),T===0&&P>0&&(P=P-2*Math.PI),T===1&&P<0&&(P=P+2*Math.PI),[B,Q,C,x,F,P,O,T]}};return Ah.Path=c,c.prototype.className="Path",c.prototype._attrsAffectingSize=["data"],(0,u._registerNode)(c),n.Factory.addGetterSetter(c,"data"),Ah}var C6;function wM(){if(C6)return Ch;C6=1,Object.defineProperty(Ch,"__esModule",{value:!0}),Ch.Arrow=void 0;const n=vt(),i=j8(),u=_t(),s=ct(),c=ry();let h=class extends i.Line{_sceneFunc(g){super._sceneFunc(g);const v=Math.PI*2,p=this.points();let _=p;const T=this.tension()!==0&&p.length>4;T&&(_=this.getTensionPoints());const C=this.pointerLength(),x=p.length;let E,O;if(T){const A=[_[_.length-4],_[_.length-3],_[_.length-2],_[_.length-1],p[x-2],p[x-1]],R=c.Path.calcLength(_[_.length-4],_[_.length-3],"C",A),z=c.Path.getPointOnQuadraticBezier(Math.min(1,1-C/R),A[0],A[1],A[2],A[3],A[4],A[5]);E=p[x-2]-z.x,O=p[x-1]-z.y}else E=p[x-2]-p[x-4],O=p[x-1]-p[x-3];const w=(Math.atan2(O,E)+v)%v,U=this.pointerWidth();this.pointerAtEnding()&&(g.save(),g.beginPath(),g.translate(p[x-2],p[x-1]),g.rotate(w),g.moveTo(0,0),g.lineTo(-C,U/2),g.lineTo(-C,-U/2),g.closePath(),g.restore(),this.__fillStroke(g)),this.pointerAtBeginning()&&(g.save(),g.beginPath(),g.translate(p[0],p[1]),T?(E=(_[0]+_[2])/2-p[0],O=(_[1]+_[3])/2-p[1]):(E=p[2]-p[0],O=p[3]-p[1]),g.rotate((Math.atan2(-O,-E)+v)%v),g.moveTo(0,0),g.lineTo(-C,U/2),g.lineTo(-C,-U/2),g.closePath(),g.restore(),this.__fillStroke(g))}__fillStroke(g){const v=this.dashEnabled();v&&(this.attrs.dashEnabled=!1,g.setLineDash([])),g.fillStrokeShape(this),v&&(this.attrs.dashEnabled=!0)}getSelfRect(){const g=super.getSelfRect(),v=this.pointerWidth()/2;return{x:g.x,y:g.y-v,width:g.width,height:g.height+v*2}}};return Ch.Arrow=h,h.prototype.className="Arrow",(0,s._registerNode)(h),n.Factory.addGetterSetter(h,"pointerLength",10,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(h,"pointerWidth",10,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(h,"pointerAtBeginning",!1),n.Factory.addGetterSetter(h,"pointerAtEnding",!0),Ch}var Rh={},T6;function NM(){if(T6)return Rh;T6=1,Object.defineProperty(Rh,"__esModule",{value:!0}),Rh.Circle=void 0;const n=vt(),i=en(),u=_t(),s=ct();class c extends i.Shape{_sceneFunc(d){d.beginPath(),d.arc(0,0,this.attrs.radius||0,0,Math.PI*2,!1),d.closePath(),d.fillStrokeShape(this)}getWidth(){return this.radius()*2}getHeight(){return this.radius()*2}setWidth(d){this.radius()!==d/2&&this.radius(d/2)}setHeight(d){this.radius()!==d/2&&this.radius(d/2)}}return Rh.Circle=c,c.prototype._centroid=!0,c.prototype.className="Circle",c.prototype._attrsAffectingSize=["radius"],(0,s._registerNode)(c),n.Factory.addGetterSetter(c,"radius",0,(0,u.getNumberValidator)()),Rh}var Oh={},A6;function DM(){if(A6)return Oh;A6=1,Object.defineProperty(Oh,"__esModule",{value:!0}),Oh.Ellipse=void 0;const n=vt(),i=en(),u=_t(),s=ct();let c=class extends i.Shape{_sceneFunc(d){const g=this.radiusX(),v=this.radiusY();d.beginPath(),d.save(),g!==v&&d.scale(1,v/g),d.arc(0,0,g,0,Math.PI*2,!1),d.restore(),d.closePath(),d.fillStrokeShape(this)}getWidth(){return this.radiusX()*2}getHeight(){return this.radiusY()*2}setWidth(d){this.radiusX(d/2)}setHeight(d){this.radiusY(d/2)}};return Oh.Ellipse=c,c.prototype.className="Ellipse",c.prototype._centroid=!0,c.prototype._attrsAffectingSize=["radiusX","radiusY"],(0,s._registerNode)(c),n.Factory.addComponentsGetterSetter(c,"radius",["x","y"]),n.Factory.addGetterSetter(c,"radiusX",0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(c,"radiusY",0,(0,u.getNumberValidator)()),Oh}var Mh={},R6;function zM(){if(R6)return Mh;R6=1,Object.defineProperty(Mh,"__esModule",{value:!0}),Mh.Image=void 0;const n=Ea(),i=vt(),u=en(),s=ct(),c=_t();let h=class V8 extends u.Shape{constructor(g){super(g),this._loadListener=()=>{this._requestDraw()},this.on("imageChange.konva",v=>{this._removeImageLoad(v.oldVal),this._setImageLoad()}),this._setImageLoad()}_setImageLoad(){const g=this.image();g&&g.complete||g&&g.readyState===4||g&&g.addEventListener&&g.addEventListener("load",this._loadListener)}_removeImageLoad(g){g&&g.removeEventListener&&g.removeEventListener("load",this._loadListener)}destroy(){return this._removeImageLoad(this.image()),super.destroy(),this}_useBufferCanvas(){const g=!!this.cornerRadius(),v=this.hasShadow();return g&&v?!0:super._useBufferCanvas(!0)}_sceneFunc(g){const v=this.getWidth(),p=this.getHeight(),_=this.cornerRadius(),T=this.attrs.image;let C;if(T){const x=this.attrs.cropWidth,E=this.attrs.cropHeight;x&&E?C=[T,this.cropX(),this.cropY(),x,E,0,0,v,p]:C=[T,0,0,v,p]}(this.hasFill()||this.hasStroke()||_)&&(g.beginPath(),_?n.Util.drawRoundedRectPath(g,v,p,_):g.rect(0,0,v,p),g.closePath(),g.fillStrokeShape(this)),T&&(_&&g.clip(),g.drawImage.apply(g,C))}_hitFunc(g){const v=this.width(),p=this.height(),_=this.cornerRadius();g.beginPath(),_?n.Util.drawRoundedRectPath(g,v,p,_):g.rect(0,0,v,p),g.closePath(),g.fillStrokeShape(this)}getWidth(){var g,v;return(g=this.attrs.width)!==null&&g!==void 0?g:(v=this.image())===null||v===void 0?void 0:v.width}getHeight(){var g,v;return(g=this.attrs.height)!==null&&g!==void 0?g:(v=this.image())===null||v===void 0?void 0:v.height}static fromURL(g,v,p=null){const _=n.Util.createImageElement();_.onload=function(){const T=new V8({image:_});v(T)},_.onerror=p,_.crossOrigin="Anonymous",_.src=g}};return Mh.Image=h,h.prototype.className="Image",(0,s._registerNode)(h),i.Factory.addGetterSetter(h,"cornerRadius",0,(0,c.getNumberOrArrayOfNumbersValidator)(4)),i.Factory.addGetterSetter(h,"image"),i.Factory.addComponentsGetterSetter(h,"crop",["x","y","width","height"]),i.Factory.addGetterSetter(h,"cropX",0,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(h,"cropY",0,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(h,"cropWidth",0,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(h,"cropHeight",0,(0,c.getNumberValidator)()),Mh}var Fs={},O6;function UM(){if(O6)return Fs;O6=1,Object.defineProperty(Fs,"__esModule",{value:!0}),Fs.Tag=Fs.Label=void 0;const n=vt(),i=en(),u=ny(),s=_t(),c=ct(),h=["fontFamily","fontSize","fontStyle","padding","lineHeight","text","width","height","pointerDirection","pointerWidth","pointerHeight"],d="Change.konva",g="none",v="up",p="right",_="down",T="left",C=h.length;let x=class extends u.Group{constructor(w){super(w),this.on("add.konva",function(U){this._addListeners(U.child),this._sync()})}getText(){return this.find("Text")[0]}getTag(){return this.find("Tag")[0]}_addListeners(w){let U=this,A;const R=function(){U._sync()};for(A=0;A<C;A++)w.on(h[A]+d,R)}getWidth(){return this.getText().width()}getHeight(){return this.getText().height()}_sync(){let w=this.getText(),U=this.getTag(),A,R,z,G,B,Q,X;if(w&&U){switch(A=w.width(),R=w.height(),z=U.pointerDirection(),G=U.pointerWidth(),X=U.pointerHeight(),B=0,Q=0,z){case v:B=A/2,Q=-1*X;break;case p:B=A+G,Q=R/2;break;case _:B=A/2,Q=R+X;break;case T:B=-1*G,Q=R/2;break}U.setAttrs({x:-1*B,y:-1*Q,width:A,height:R}),w.setAttrs({x:-1*B,y:-1*Q})}}};Fs.Label=x,x.prototype.className="Label",(0,c._registerNode)(x);class E extends i.Shape{_sceneFunc(w){const U=this.width(),A=this.height(),R=this.pointerDirection(),z=this.pointerWidth(),G=this.pointerHeight(),B=this.cornerRadius();let Q=0,X=0,Y=0,V=0;typeof B=="number"?Q=X=Y=V=Math.min(B,U/2,A/2):(Q=Math.min(B[0]||0,U/2,A/2),X=Math.min(B[1]||0,U/2,A/2),V=Math.min(B[2]||0,U/2,A/2),Y=Math.min(B[3]||0,U/2,A/2)),w.beginPath(),w.moveTo(Q,0),R===v&&(w.lineTo((U-z)/2,0),w.lineTo(U/2,-1*G),w.lineTo((U+z)/2,0)),w.lineTo(U-X,0),w.arc(U-X,X,X,Math.PI*3/2,0,!1),R===p&&(w.lineTo(U,(A-G)/2),w.lineTo(U+z,A/2),w.lineTo(U,(A+G)/2)),w.lineTo(U,A-V),w.arc(U-V,A-V,V,0,Math.PI/2,!1),R===_&&(w.lineTo((U+z)/2,A),w.lineTo(U/2,A+G),w.lineTo((U-z)/2,A)),w.lineTo(Y,A),w.arc(Y,A-Y,Y,Math.PI/2,Math.PI,!1),R===T&&(w.lineTo(0,(A+G)/2),w.lineTo(-1*z,A/2),w.lineTo(0,(A-G)/2)),w.lineTo(0,Q),w.arc(Q,Q,Q,Math.PI,Math.PI*3/2,!1),w.closePath(),w.fillStrokeShape(this)}getSelfRect(){let w=0,U=0,A=this.pointerWidth(),R=this.pointerHeight(),z=this.pointerDirection(),G=this.width(),B=this.height();return z===v?(U-=R,B+=R):z===_?B+=R:z===T?(w-=A*1.5,G+=A):z===p&&(G+=A*1.5),{x:w,y:U,width:G,height:B}}}return Fs.Tag=E,E.prototype.className="Tag",(0,c._registerNode)(E),n.Factory.addGetterSetter(E,"pointerDirection",g),n.Factory.addGetterSetter(E,"pointerWidth",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(E,"pointerHeight",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(E,"cornerRadius",0,(0,s.getNumberOrArrayOfNumbersValidator)(4)),Fs}var wh={},M6;function Y8(){if(M6)return wh;M6=1,Object.defineProperty(wh,"__esModule",{value:!0}),wh.Rect=void 0;const n=vt(),i=en(),u=ct(),s=Ea(),c=_t();let h=class extends i.Shape{_sceneFunc(g){const v=this.cornerRadius(),p=this.width(),_=this.height();g.beginPath(),v?s.Util.drawRoundedRectPath(g,p,_,v):g.rect(0,0,p,_),g.closePath(),g.fillStrokeShape(this)}};return wh.Rect=h,h.prototype.className="Rect",(0,u._registerNode)(h),n.Factory.addGetterSetter(h,"cornerRadius",0,(0,c.getNumberOrArrayOfNumbersValidator)(4)),wh}var Nh={},w6;function GM(){if(w6)return Nh;w6=1,Object.defineProperty(Nh,"__esModule",{value:!0}),Nh.RegularPolygon=void 0;const n=vt(),i=en(),u=_t(),s=ct();let c=class extends i.Shape{_sceneFunc(d){const g=this._getPoints();d.beginPath(),d.moveTo(g[0].x,g[0].y);for(let v=1;v<g.length;v++)d.lineTo(g[v].x,g[v].y);d.closePath(),d.fillStrokeShape(this)}_getPoints(){const d=this.attrs.sides,g=this.attrs.radius||0,v=[];for(let p=0;p<d;p++)v.push({x:g*Math.sin(p*2*Math.PI/d),y:-1*g*Math.cos(p*2*Math.PI/d)});return v}getSelfRect(){const d=this._getPoints();let g=d[0].x,v=d[0].y,p=d[0].x,_=d[0].y;return d.forEach(T=>{g=Math.min(g,T.x),v=Math.max(v,T.x),p=Math.min(p,T.y),_=Math.max(_,T.y)}),{x:g,y:p,width:v-g,height:_-p}}getWidth(){return this.radius()*2}getHeight(){return this.radius()*2}setWidth(d){this.radius(d/2)}setHeight(d){this.radius(d/2)}};return Nh.RegularPolygon=c,c.prototype.className="RegularPolygon",c.prototype._centroid=!0,c.prototype._attrsAffectingSize=["radius"],(0,s._registerNode)(c),n.Factory.addGetterSetter(c,"radius",0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(c,"sides",0,(0,u.getNumberValidator)()),Nh}var Dh={},N6;function qM(){if(N6)return Dh;N6=1,Object.defineProperty(Dh,"__esModule",{value:!0}),Dh.Ring=void 0;const n=vt(),i=en(),u=_t(),s=ct(),c=Math.PI*2;let h=class extends i.Shape{_sceneFunc(g){g.beginPath(),g.arc(0,0,this.innerRadius(),0,c,!1),g.moveTo(this.outerRadius(),0),g.arc(0,0,this.outerRadius(),c,0,!0),g.closePath(),g.fillStrokeShape(this)}getWidth(){return this.outerRadius()*2}getHeight(){return this.outerRadius()*2}setWidth(g){this.outerRadius(g/2)}setHeight(g){this.outerRadius(g/2)}};return Dh.Ring=h,h.prototype.className="Ring",h.prototype._centroid=!0,h.prototype._attrsAffectingSize=["innerRadius","outerRadius"],(0,s._registerNode)(h),n.Factory.addGetterSetter(h,"innerRadius",0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(h,"outerRadius",0,(0,u.getNumberValidator)()),Dh}var zh={},D6;function HM(){if(D6)return zh;D6=1,Object.defineProperty(zh,"__esModule",{value:!0}),zh.Sprite=void 0;const n=vt(),i=en(),u=iy(),s=_t(),c=ct();let h=class extends i.Shape{constructor(g){super(g),this._updated=!0,this.anim=new u.Animation(()=>{const v=this._updated;return this._updated=!1,v}),this.on("animationChange.konva",function(){this.frameIndex(0)}),this.on("frameIndexChange.konva",function(){this._updated=!0}),this.on("frameRateChange.konva",function(){this.anim.isRunning()&&(clearInterval(this.interval),this._setInterval())})}_sceneFunc(g){const v=this.animation(),p=this.frameIndex(),_=p*4,T=this.animations()[v],C=this.frameOffsets(),x=T[_+0],E=T[_+1],O=T[_+2],w=T[_+3],U=this.image();if((this.hasFill()||this.hasStroke())&&(g.beginPath(),g.rect(0,0,O,w),g.closePath(),g.fillStrokeShape(this)),U)if(C){const A=C[v],R=p*2;g.drawImage(U,x,E,O,w,A[R+0],A[R+1],O,w)}else g.drawImage(U,x,E,O,w,0,0,O,w)}_hitFunc(g){const v=this.animation(),p=this.frameIndex(),_=p*4,T=this.animations()[v],C=this.frameOffsets(),x=T[_+2],E=T[_+3];if(g.beginPath(),C){const O=C[v],w=p*2;g.rect(O[w+0],O[w+1],x,E)}else g.rect(0,0,x,E);g.closePath(),g.fillShape(this)}_useBufferCanvas(){return super._useBufferCanvas(!0)}_setInterval(){const g=this;this.interval=setInterval(function(){g._updateIndex()},1e3/this.frameRate())}start(){if(this.isRunning())return;const g=this.getLayer();this.anim.setLayers(g),this._setInterval(),this.anim.start()}stop(){this.anim.stop(),clearInterval(this.interval)}isRunning(){return this.anim.isRunning()}_updateIndex(){const g=this.frameIndex(),v=this.animation(),p=this.animations(),_=p[v],T=_.length/4;g<T-1?this.frameIndex(g+1):this.frameIndex(0)}};return zh.Sprite=h,h.prototype.className="Sprite",(0,c._registerNode)(h),n.Factory.addGetterSetter(h,"animation"),n.Factory.addGetterSetter(h,"animations"),n.Factory.addGetterSetter(h,"frameOffsets"),n.Factory.addGetterSetter(h,"image"),n.Factory.addGetterSetter(h,"frameIndex",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(h,"frameRate",17,(0,s.getNumberValidator)()),n.Factory.backCompat(h,{index:"frameIndex",getIndex:"getFrameIndex",setIndex:"setFrameIndex"}),zh}var Uh={},z6;function BM(){if(z6)return Uh;z6=1,Object.defineProperty(Uh,"__esModule",{value:!0}),Uh.Star=void 0;const n=vt(),i=en(),u=_t(),s=ct();let c=class extends i.Shape{_sceneFunc(d){const g=this.innerRadius(),v=this.outerRadius(),p=this.numPoints();d.beginPath(),d.moveTo(0,0-v);for(let _=1;_<p*2;_++){const T=_%2===0?v:g,C=T*Math.sin(_*Math.PI/p),x=-1*T*Math.cos(_*Math.PI/p);d.lineTo(C,x)}d.closePath(),d.fillStrokeShape(this)}getWidth(){return this.outerRadius()*2}getHeight(){return this.outerRadius()*2}setWidth(d){this.outerRadius(d/2)}setHeight(d){this.outerRadius(d/2)}};return Uh.Star=c,c.prototype.className="Star",c.prototype._centroid=!0,c.prototype._attrsAffectingSize=["innerRadius","outerRadius"],(0,s._registerNode)(c),n.Factory.addGetterSetter(c,"numPoints",5,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(c,"innerRadius",0,(0,u.getNumberValidator)()),n.Factory.addGetterSetter(c,"outerRadius",0,(0,u.getNumberValidator)()),Uh}var pc={},U6;function P8(){if(U6)return pc;U6=1,Object.defineProperty(pc,"__esModule",{value:!0}),pc.Text=void 0,pc.stringToArray=d;const n=Ea(),i=vt(),u=en(),s=ct(),c=_t(),h=ct();function d(de){return[...de].reduce((ne,ce,Se,xe)=>{if(new RegExp("\\p{Emoji}","u").test(ce)){const $=xe[Se+1];$&&new RegExp("\\p{Emoji_Modifier}|\\u200D","u").test($)?(ne.push(ce+$),xe[Se+1]=""):ne.push(ce)}else new RegExp("\\p{Regional_Indicator}{2}","u").test(ce+(xe[Se+1]||""))?ne.push(ce+xe[Se+1]):Se>0&&new RegExp("\\p{Mn}|\\p{Me}|\\p{Mc}","u").test(ce)?ne[ne.length-1]+=ce:ce&&ne.push(ce);return ne},[])}const g="auto",v="center",p="inherit",_="justify",T="Change.konva",C="2d",x="-",E="left",O="text",w="Text",U="top",A="bottom",R="middle",z="normal",G="px ",B=" ",Q="right",X="rtl",Y="word",V="char",F="none",I="…",D=["direction","fontFamily","fontSize","fontStyle","fontVariant","padding","align","verticalAlign","lineHeight","text","width","height","wrap","ellipsis","letterSpacing"],P=D.length;function H(de){return de.split(",").map(ne=>{ne=ne.trim();const ce=ne.indexOf(" ")>=0,Se=ne.indexOf('"')>=0||ne.indexOf("'")>=0;return ce&&!Se&&(ne=`"${ne}"`),ne}).join(", ")}let N;function L(){return N||(N=n.Util.createCanvasElement().getContext(C),N)}function Z(de){de.fillText(this._partialText,this._partialTextX,this._partialTextY)}function ae(de){de.setAttr("miterLimit",2),de.strokeText(this._partialText,this._partialTextX,this._partialTextY)}function j(de){return de=de||{},!de.fillLinearGradientColorStops&&!de.fillRadialGradientColorStops&&!de.fillPatternImage&&(de.fill=de.fill||"black"),de}let te=class extends u.Shape{constructor(ne){super(j(ne)),this._partialTextX=0,this._partialTextY=0;for(let ce=0;ce<P;ce++)this.on(D[ce]+T,this._setTextData);this._setTextData()}_sceneFunc(ne){const ce=this.textArr,Se=ce.length;if(!this.text())return;let xe=this.padding(),$=this.fontSize(),oe=this.lineHeight()*$,Te=this.verticalAlign(),Re=this.direction(),Me=0,Ge=this.align(),$e=this.getWidth(),et=this.letterSpacing(),ze=this.fill(),At=this.textDecoration(),we=At.indexOf("underline")!==-1,ft=At.indexOf("line-through")!==-1,na;Re=Re===p?ne.direction:Re;let Rt=oe/2,Vt=R;if(s.Konva._fixTextRendering){const tn=this.measureSize("M");Vt="alphabetic",Rt=(tn.fontBoundingBoxAscent-tn.fontBoundingBoxDescent)/2+oe/2}var ht=0,lt=0;for(Re===X&&ne.setAttr("direction",Re),ne.setAttr("font",this._getContextFont()),ne.setAttr("textBaseline",Vt),ne.setAttr("textAlign",E),Te===R?Me=(this.getHeight()-Se*oe-xe*2)/2:Te===A&&(Me=this.getHeight()-Se*oe-xe*2),ne.translate(xe,Me+xe),na=0;na<Se;na++){var ht=0,lt=0,ma=ce[na],Ca=ma.text,Zt=ma.width,Dt=ma.lastInParagraph,Fe,zt;if(ne.save(),Ge===Q?ht+=$e-Zt-xe*2:Ge===v&&(ht+=($e-Zt-xe*2)/2),we){ne.save(),ne.beginPath();const ya=s.Konva._fixTextRendering?Math.round($/4):Math.round($/2),mt=ht,yt=Rt+lt+ya;ne.moveTo(mt,yt),Fe=Ca.split(" ").length-1,zt=Ge===_&&!Dt?$e-xe*2:Zt,ne.lineTo(mt+Math.round(zt),yt),ne.lineWidth=$/15;const He=this._getLinearGradient();ne.strokeStyle=He||ze,ne.stroke(),ne.restore()}if(ft){ne.save(),ne.beginPath();const ya=s.Konva._fixTextRendering?-Math.round($/4):0;ne.moveTo(ht,Rt+lt+ya),Fe=Ca.split(" ").length-1,zt=Ge===_&&!Dt?$e-xe*2:Zt,ne.lineTo(ht+Math.round(zt),Rt+lt+ya),ne.lineWidth=$/15;const mt=this._getLinearGradient();ne.strokeStyle=mt||ze,ne.stroke(),ne.restore()}if(Re!==X&&(et!==0||Ge===_)){Fe=Ca.split(" ").length-1;const ya=d(Ca);for(let mt=0;mt<ya.length;mt++){const yt=ya[mt];yt===" "&&!Dt&&Ge===_&&(ht+=($e-xe*2-Zt)/Fe),this._partialTextX=ht,this._partialTextY=Rt+lt,this._partialText=yt,ne.fillStrokeShape(this),ht+=this.measureSize(yt).width+et}}else et!==0&&ne.setAttr("letterSpacing",`${et}px`),this._partialTextX=ht,this._partialTextY=Rt+lt,this._partialText=Ca,ne.fillStrokeShape(this);ne.restore(),Se>1&&(Rt+=oe)}}_hitFunc(ne){const ce=this.getWidth(),Se=this.getHeight();ne.beginPath(),ne.rect(0,0,ce,Se),ne.closePath(),ne.fillStrokeShape(this)}setText(ne){const ce=n.Util._isString(ne)?ne:ne==null?"":ne+"";return this._setAttr(O,ce),this}getWidth(){return this.attrs.width===g||this.attrs.width===void 0?this.getTextWidth()+this.padding()*2:this.attrs.width}getHeight(){return this.attrs.height===g||this.attrs.height===void 0?this.fontSize()*this.textArr.length*this.lineHeight()+this.padding()*2:this.attrs.height}getTextWidth(){return this.textWidth}getTextHeight(){return n.Util.warn("text.getTextHeight() method is deprecated. Use text.height() - for full height and text.fontSize() - for one line height."),this.textHeight}measureSize(ne){var ce,Se,xe,$,oe,Te,Re,Me,Ge,$e,et;let ze=L(),At=this.fontSize(),we;ze.save(),ze.font=this._getContextFont(),we=ze.measureText(ne),ze.restore();const ft=At/100;return{actualBoundingBoxAscent:(ce=we.actualBoundingBoxAscent)!==null&&ce!==void 0?ce:71.58203125*ft,actualBoundingBoxDescent:(Se=we.actualBoundingBoxDescent)!==null&&Se!==void 0?Se:0,actualBoundingBoxLeft:(xe=we.actualBoundingBoxLeft)!==null&&xe!==void 0?xe:-7.421875*ft,actualBoundingBoxRight:($=we.actualBoundingBoxRight)!==null&&$!==void 0?$:75.732421875*ft,alphabeticBaseline:(oe=we.alphabeticBaseline)!==null&&oe!==void 0?oe:0,emHeightAscent:(Te=we.emHeightAscent)!==null&&Te!==void 0?Te:100*ft,emHeightDescent:(Re=we.emHeightDescent)!==null&&Re!==void 0?Re:-20*ft,fontBoundingBoxAscent:(Me=we.fontBoundingBoxAscent)!==null&&Me!==void 0?Me:91*ft,fontBoundingBoxDescent:(Ge=we.fontBoundingBoxDescent)!==null&&Ge!==void 0?Ge:21*ft,hangingBaseline:($e=we.hangingBaseline)!==null&&$e!==void 0?$e:72.80000305175781*ft,ideographicBaseline:(et=we.ideographicBaseline)!==null&&et!==void 0?et:-21*ft,width:we.width,height:At}}_getContextFont(){return this.fontStyle()+B+this.fontVariant()+B+(this.fontSize()+G)+H(this.fontFamily())}_addTextLine(ne){this.align()===_&&(ne=ne.trim());const Se=this._getTextWidth(ne);return this.textArr.push({text:ne,width:Se,lastInParagraph:!1})}_getTextWidth(ne){const ce=this.letterSpacing(),Se=ne.length;return L().measureText(ne).width+ce*Se}_setTextData(){let ne=this.text().split(`
-`),ce=+this.fontSize(),Se=0,xe=this.lineHeight()*ce,$=this.attrs.width,oe=this.attrs.height,Te=$!==g&&$!==void 0,Re=oe!==g&&oe!==void 0,Me=this.padding(),Ge=$-Me*2,$e=oe-Me*2,et=0,ze=this.wrap(),At=ze!==F,we=ze!==V&&At,ft=this.ellipsis();this.textArr=[],L().font=this._getContextFont();const na=ft?this._getTextWidth(I):0;for(let Rt=0,Vt=ne.length;Rt<Vt;++Rt){let ht=ne[Rt],lt=this._getTextWidth(ht);if(Te&&lt>Ge)for(;ht.length>0;){let ma=0,Ca=d(ht).length,Zt="",Dt=0;for(;ma<Ca;){const Fe=ma+Ca>>>1,zt=d(ht),tn=zt.slice(0,Fe+1).join(""),ka=this._getTextWidth(tn);(ft&&Re&&et+xe>$e?ka+na:ka)<=Ge?(ma=Fe+1,Zt=tn,Dt=ka):Ca=Fe}if(Zt){if(we){const tn=d(ht),ka=d(Zt),ya=tn[ka.length],mt=ya===B||ya===x;let yt;if(mt&&Dt<=Ge)yt=ka.length;else{const He=ka.lastIndexOf(B),Gt=ka.lastIndexOf(x);yt=Math.max(He,Gt)+1}yt>0&&(ma=yt,Zt=tn.slice(0,ma).join(""),Dt=this._getTextWidth(Zt))}if(Zt=Zt.trimRight(),this._addTextLine(Zt),Se=Math.max(Se,Dt),et+=xe,this._shouldHandleEllipsis(et)){this._tryToAddEllipsisToLastLine();break}if(ht=d(ht).slice(ma).join("").trimLeft(),ht.length>0&&(lt=this._getTextWidth(ht),lt<=Ge)){this._addTextLine(ht),et+=xe,Se=Math.max(Se,lt);break}}else break}else this._addTextLine(ht),et+=xe,Se=Math.max(Se,lt),this._shouldHandleEllipsis(et)&&Rt<Vt-1&&this._tryToAddEllipsisToLastLine();if(this.textArr[this.textArr.length-1]&&(this.textArr[this.textArr.length-1].lastInParagraph=!0),Re&&et+xe>$e)break}this.textHeight=ce,this.textWidth=Se}_shouldHandleEllipsis(ne){const ce=+this.fontSize(),Se=this.lineHeight()*ce,xe=this.attrs.height,$=xe!==g&&xe!==void 0,oe=this.padding(),Te=xe-oe*2;return!(this.wrap()!==F)||$&&ne+Se>Te}_tryToAddEllipsisToLastLine(){const ne=this.attrs.width,ce=ne!==g&&ne!==void 0,Se=this.padding(),xe=ne-Se*2,$=this.ellipsis(),oe=this.textArr[this.textArr.length-1];!oe||!$||(ce&&(this._getTextWidth(oe.text+I)<xe||(oe.text=oe.text.slice(0,oe.text.length-3))),this.textArr.splice(this.textArr.length-1,1),this._addTextLine(oe.text+I))}getStrokeScaleEnabled(){return!0}_useBufferCanvas(){const ne=this.textDecoration().indexOf("underline")!==-1||this.textDecoration().indexOf("line-through")!==-1,ce=this.hasShadow();return ne&&ce?!0:super._useBufferCanvas()}};return pc.Text=te,te.prototype._fillFunc=Z,te.prototype._strokeFunc=ae,te.prototype.className=w,te.prototype._attrsAffectingSize=["text","fontSize","padding","wrap","lineHeight","letterSpacing"],(0,h._registerNode)(te),i.Factory.overWriteSetter(te,"width",(0,c.getNumberOrAutoValidator)()),i.Factory.overWriteSetter(te,"height",(0,c.getNumberOrAutoValidator)()),i.Factory.addGetterSetter(te,"direction",p),i.Factory.addGetterSetter(te,"fontFamily","Arial"),i.Factory.addGetterSetter(te,"fontSize",12,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(te,"fontStyle",z),i.Factory.addGetterSetter(te,"fontVariant",z),i.Factory.addGetterSetter(te,"padding",0,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(te,"align",E),i.Factory.addGetterSetter(te,"verticalAlign",U),i.Factory.addGetterSetter(te,"lineHeight",1,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(te,"wrap",Y),i.Factory.addGetterSetter(te,"ellipsis",!1,(0,c.getBooleanValidator)()),i.Factory.addGetterSetter(te,"letterSpacing",0,(0,c.getNumberValidator)()),i.Factory.addGetterSetter(te,"text","",(0,c.getStringValidator)()),i.Factory.addGetterSetter(te,"textDecoration",""),pc}var Gh={},G6;function LM(){if(G6)return Gh;G6=1,Object.defineProperty(Gh,"__esModule",{value:!0}),Gh.TextPath=void 0;const n=Ea(),i=vt(),u=en(),s=ry(),c=P8(),h=_t(),d=ct(),g="",v="normal";function p(C){C.fillText(this.partialText,0,0)}function _(C){C.strokeText(this.partialText,0,0)}let T=class extends u.Shape{constructor(x){super(x),this.dummyCanvas=n.Util.createCanvasElement(),this.dataArray=[],this._readDataAttribute(),this.on("dataChange.konva",function(){this._readDataAttribute(),this._setTextData()}),this.on("textChange.konva alignChange.konva letterSpacingChange.konva kerningFuncChange.konva fontSizeChange.konva fontFamilyChange.konva",this._setTextData),this._setTextData()}_getTextPathLength(){return s.Path.getPathLength(this.dataArray)}_getPointAtLength(x){if(!this.attrs.data)return null;const E=this.pathLength;return x-1>E?null:s.Path.getPointAtLengthOfDataArray(x,this.dataArray)}_readDataAttribute(){this.dataArray=s.Path.parsePathData(this.attrs.data),this.pathLength=this._getTextPathLength()}_sceneFunc(x){x.setAttr("font",this._getContextFont()),x.setAttr("textBaseline",this.textBaseline()),x.setAttr("textAlign","left"),x.save();const E=this.textDecoration(),O=this.fill(),w=this.fontSize(),U=this.glyphInfo;E==="underline"&&x.beginPath();for(let A=0;A<U.length;A++){x.save();const R=U[A].p0;x.translate(R.x,R.y),x.rotate(U[A].rotation),this.partialText=U[A].text,x.fillStrokeShape(this),E==="underline"&&(A===0&&x.moveTo(0,w/2+1),x.lineTo(w,w/2+1)),x.restore()}E==="underline"&&(x.strokeStyle=O,x.lineWidth=w/20,x.stroke()),x.restore()}_hitFunc(x){x.beginPath();const E=this.glyphInfo;if(E.length>=1){const O=E[0].p0;x.moveTo(O.x,O.y)}for(let O=0;O<E.length;O++){const w=E[O].p1;x.lineTo(w.x,w.y)}x.setAttr("lineWidth",this.fontSize()),x.setAttr("strokeStyle",this.colorKey),x.stroke()}getTextWidth(){return this.textWidth}getTextHeight(){return n.Util.warn("text.getTextHeight() method is deprecated. Use text.height() - for full height and text.fontSize() - for one line height."),this.textHeight}setText(x){return c.Text.prototype.setText.call(this,x)}_getContextFont(){return c.Text.prototype._getContextFont.call(this)}_getTextSize(x){const O=this.dummyCanvas.getContext("2d");O.save(),O.font=this._getContextFont();const w=O.measureText(x);return O.restore(),{width:w.width,height:parseInt(`${this.fontSize()}`,10)}}_setTextData(){const{width:x,height:E}=this._getTextSize(this.attrs.text);if(this.textWidth=x,this.textHeight=E,this.glyphInfo=[],!this.attrs.data)return null;const O=this.letterSpacing(),w=this.align(),U=this.kerningFunc(),A=Math.max(this.textWidth+((this.attrs.text||"").length-1)*O,0);let R=0;w==="center"&&(R=Math.max(0,this.pathLength/2-A/2)),w==="right"&&(R=Math.max(0,this.pathLength-A));const z=(0,c.stringToArray)(this.text());let G=R;for(let B=0;B<z.length;B++){const Q=this._getPointAtLength(G);if(!Q)return;let X=this._getTextSize(z[B]).width+O;if(z[B]===" "&&w==="justify"){const P=this.text().split(" ").length-1;X+=(this.pathLength-A)/P}const Y=this._getPointAtLength(G+X);if(!Y)return;const V=s.Path.getLineLength(Q.x,Q.y,Y.x,Y.y);let F=0;if(U)try{F=U(z[B-1],z[B])*this.fontSize()}catch{F=0}Q.x+=F,Y.x+=F,this.textWidth+=F;const I=s.Path.getPointOnLine(F+V/2,Q.x,Q.y,Y.x,Y.y),D=Math.atan2(Y.y-Q.y,Y.x-Q.x);this.glyphInfo.push({transposeX:I.x,transposeY:I.y,text:z[B],rotation:D,p0:Q,p1:Y}),G+=X}}getSelfRect(){if(!this.glyphInfo.length)return{x:0,y:0,width:0,height:0};const x=[];this.glyphInfo.forEach(function(G){x.push(G.p0.x),x.push(G.p0.y),x.push(G.p1.x),x.push(G.p1.y)});let E=x[0]||0,O=x[0]||0,w=x[1]||0,U=x[1]||0,A,R;for(let G=0;G<x.length/2;G++)A=x[G*2],R=x[G*2+1],E=Math.min(E,A),O=Math.max(O,A),w=Math.min(w,R),U=Math.max(U,R);const z=this.fontSize();return{x:E-z/2,y:w-z/2,width:O-E+z,height:U-w+z}}destroy(){return n.Util.releaseCanvas(this.dummyCanvas),super.destroy()}};return Gh.TextPath=T,T.prototype._fillFunc=p,T.prototype._strokeFunc=_,T.prototype._fillFuncHit=p,T.prototype._strokeFuncHit=_,T.prototype.className="TextPath",T.prototype._attrsAffectingSize=["text","fontSize","data"],(0,d._registerNode)(T),i.Factory.addGetterSetter(T,"data"),i.Factory.addGetterSetter(T,"fontFamily","Arial"),i.Factory.addGetterSetter(T,"fontSize",12,(0,h.getNumberValidator)()),i.Factory.addGetterSetter(T,"fontStyle",v),i.Factory.addGetterSetter(T,"align","left"),i.Factory.addGetterSetter(T,"letterSpacing",0,(0,h.getNumberValidator)()),i.Factory.addGetterSetter(T,"textBaseline","middle"),i.Factory.addGetterSetter(T,"fontVariant",v),i.Factory.addGetterSetter(T,"text",g),i.Factory.addGetterSetter(T,"textDecoration",""),i.Factory.addGetterSetter(T,"kerningFunc",void 0),Gh}var qh={},q6;function jM(){if(q6)return qh;q6=1,Object.defineProperty(qh,"__esModule",{value:!0}),qh.Transformer=void 0;const n=Ea(),i=vt(),u=wa(),s=en(),c=Y8(),h=ny(),d=ct(),g=_t(),v=ct(),p="tr-konva",_=["resizeEnabledChange","rotateAnchorOffsetChange","rotateEnabledChange","enabledAnchorsChange","anchorSizeChange","borderEnabledChange","borderStrokeChange","borderStrokeWidthChange","borderDashChange","anchorStrokeChange","anchorStrokeWidthChange","anchorFillChange","anchorCornerRadiusChange","ignoreStrokeChange","anchorStyleFuncChange"].map(X=>X+`.${p}`).join(" "),T="nodesRect",C=["widthChange","heightChange","scaleXChange","scaleYChange","skewXChange","skewYChange","rotationChange","offsetXChange","offsetYChange","transformsEnabledChange","strokeWidthChange"],x={"top-left":-45,"top-center":0,"top-right":45,"middle-right":-90,"middle-left":90,"bottom-left":-135,"bottom-center":180,"bottom-right":135},E="ontouchstart"in d.Konva._global;function O(X,Y,V){if(X==="rotater")return V;Y+=n.Util.degToRad(x[X]||0);const F=(n.Util.radToDeg(Y)%360+360)%360;return n.Util._inRange(F,315+22.5,360)||n.Util._inRange(F,0,22.5)?"ns-resize":n.Util._inRange(F,45-22.5,45+22.5)?"nesw-resize":n.Util._inRange(F,90-22.5,90+22.5)?"ew-resize":n.Util._inRange(F,135-22.5,135+22.5)?"nwse-resize":n.Util._inRange(F,180-22.5,180+22.5)?"ns-resize":n.Util._inRange(F,225-22.5,225+22.5)?"nesw-resize":n.Util._inRange(F,270-22.5,270+22.5)?"ew-resize":n.Util._inRange(F,315-22.5,315+22.5)?"nwse-resize":(n.Util.error("Transformer has unknown angle for cursor detection: "+F),"pointer")}const w=["top-left","top-center","top-right","middle-right","middle-left","bottom-left","bottom-center","bottom-right"];function U(X){return{x:X.x+X.width/2*Math.cos(X.rotation)+X.height/2*Math.sin(-X.rotation),y:X.y+X.height/2*Math.cos(X.rotation)+X.width/2*Math.sin(X.rotation)}}function A(X,Y,V){const F=V.x+(X.x-V.x)*Math.cos(Y)-(X.y-V.y)*Math.sin(Y),I=V.y+(X.x-V.x)*Math.sin(Y)+(X.y-V.y)*Math.cos(Y);return{...X,rotation:X.rotation+Y,x:F,y:I}}function R(X,Y){const V=U(X);return A(X,Y,V)}function z(X,Y,V){let F=Y;for(let I=0;I<X.length;I++){const D=d.Konva.getAngle(X[I]),P=Math.abs(D-Y)%(Math.PI*2);Math.min(P,Math.PI*2-P)<V&&(F=D)}return F}let G=0,B=class extends h.Group{constructor(Y){super(Y),this._movingAnchorName=null,this._transforming=!1,this._createElements(),this._handleMouseMove=this._handleMouseMove.bind(this),this._handleMouseUp=this._handleMouseUp.bind(this),this.update=this.update.bind(this),this.on(_,this.update),this.getNode()&&this.update()}attachTo(Y){return this.setNode(Y),this}setNode(Y){return n.Util.warn("tr.setNode(shape), tr.node(shape) and tr.attachTo(shape) methods are deprecated. Please use tr.nodes(nodesArray) instead."),this.setNodes([Y])}getNode(){return this._nodes&&this._nodes[0]}_getEventNamespace(){return p+this._id}setNodes(Y=[]){this._nodes&&this._nodes.length&&this.detach();const V=Y.filter(I=>I.isAncestorOf(this)?(n.Util.error("Konva.Transformer cannot be an a child of the node you are trying to attach"),!1):!0);return this._nodes=Y=V,Y.length===1&&this.useSingleNodeRotation()?this.rotation(Y[0].getAbsoluteRotation()):this.rotation(0),this._nodes.forEach(I=>{const D=()=>{this.nodes().length===1&&this.useSingleNodeRotation()&&this.rotation(this.nodes()[0].getAbsoluteRotation()),this._resetTransformCache(),!this._transforming&&!this.isDragging()&&this.update()};if(I._attrsAffectingSize.length){const P=I._attrsAffectingSize.map(H=>H+"Change."+this._getEventNamespace()).join(" ");I.on(P,D)}I.on(C.map(P=>P+`.${this._getEventNamespace()}`).join(" "),D),I.on(`absoluteTransformChange.${this._getEventNamespace()}`,D),this._proxyDrag(I)}),this._resetTransformCache(),!!this.findOne(".top-left")&&this.update(),this}_proxyDrag(Y){let V;Y.on(`dragstart.${this._getEventNamespace()}`,F=>{V=Y.getAbsolutePosition(),!this.isDragging()&&Y!==this.findOne(".back")&&this.startDrag(F,!1)}),Y.on(`dragmove.${this._getEventNamespace()}`,F=>{if(!V)return;const I=Y.getAbsolutePosition(),D=I.x-V.x,P=I.y-V.y;this.nodes().forEach(H=>{if(H===Y||H.isDragging())return;const N=H.getAbsolutePosition();H.setAbsolutePosition({x:N.x+D,y:N.y+P}),H.startDrag(F)}),V=null})}getNodes(){return this._nodes||[]}getActiveAnchor(){return this._movingAnchorName}detach(){this._nodes&&this._nodes.forEach(Y=>{Y.off("."+this._getEventNamespace())}),this._nodes=[],this._resetTransformCache()}_resetTransformCache(){this._clearCache(T),this._clearCache("transform"),this._clearSelfAndDescendantCache("absoluteTransform")}_getNodeRect(){return this._getCache(T,this.__getNodeRect)}__getNodeShape(Y,V=this.rotation(),F){const I=Y.getClientRect({skipTransform:!0,skipShadow:!0,skipStroke:this.ignoreStroke()}),D=Y.getAbsoluteScale(F),P=Y.getAbsolutePosition(F),H=I.x*D.x-Y.offsetX()*D.x,N=I.y*D.y-Y.offsetY()*D.y,L=(d.Konva.getAngle(Y.getAbsoluteRotation())+Math.PI*2)%(Math.PI*2),Z={x:P.x+H*Math.cos(L)+N*Math.sin(-L),y:P.y+N*Math.cos(L)+H*Math.sin(L),width:I.width*D.x,height:I.height*D.y,rotation:L};return A(Z,-d.Konva.getAngle(V),{x:0,y:0})}__getNodeRect(){if(!this.getNode())return{x:-1e8,y:-1e8,width:0,height:0,rotation:0};const V=[];this.nodes().map(L=>{const Z=L.getClientRect({skipTransform:!0,skipShadow:!0,skipStroke:this.ignoreStroke()}),ae=[{x:Z.x,y:Z.y},{x:Z.x+Z.width,y:Z.y},{x:Z.x+Z.width,y:Z.y+Z.height},{x:Z.x,y:Z.y+Z.height}],j=L.getAbsoluteTransform();ae.forEach(function(te){const de=j.point(te);V.push(de)})});const F=new n.Transform;F.rotate(-d.Konva.getAngle(this.rotation()));let I=1/0,D=1/0,P=-1/0,H=-1/0;V.forEach(function(L){const Z=F.point(L);I===void 0&&(I=P=Z.x,D=H=Z.y),I=Math.min(I,Z.x),D=Math.min(D,Z.y),P=Math.max(P,Z.x),H=Math.max(H,Z.y)}),F.invert();const N=F.point({x:I,y:D});return{x:N.x,y:N.y,width:P-I,height:H-D,rotation:d.Konva.getAngle(this.rotation())}}getX(){return this._getNodeRect().x}getY(){return this._getNodeRect().y}getWidth(){return this._getNodeRect().width}getHeight(){return this._getNodeRect().height}_createElements(){this._createBack(),w.forEach(Y=>{this._createAnchor(Y)}),this._createAnchor("rotater")}_createAnchor(Y){const V=new c.Rect({stroke:"rgb(0, 161, 255)",fill:"white",strokeWidth:1,name:Y+" _anchor",dragDistance:0,draggable:!0,hitStrokeWidth:E?10:"auto"}),F=this;V.on("mousedown touchstart",function(I){F._handleMouseDown(I)}),V.on("dragstart",I=>{V.stopDrag(),I.cancelBubble=!0}),V.on("dragend",I=>{I.cancelBubble=!0}),V.on("mouseenter",()=>{const I=d.Konva.getAngle(this.rotation()),D=this.rotateAnchorCursor(),P=O(Y,I,D);V.getStage().content&&(V.getStage().content.style.cursor=P),this._cursorChange=!0}),V.on("mouseout",()=>{V.getStage().content&&(V.getStage().content.style.cursor=""),this._cursorChange=!1}),this.add(V)}_createBack(){const Y=new s.Shape({name:"back",width:0,height:0,draggable:!0,sceneFunc(V,F){const I=F.getParent(),D=I.padding();V.beginPath(),V.rect(-D,-D,F.width()+D*2,F.height()+D*2),V.moveTo(F.width()/2,-D),I.rotateEnabled()&&I.rotateLineVisible()&&V.lineTo(F.width()/2,-I.rotateAnchorOffset()*n.Util._sign(F.height())-D),V.fillStrokeShape(F)},hitFunc:(V,F)=>{if(!this.shouldOverdrawWholeArea())return;const I=this.padding();V.beginPath(),V.rect(-I,-I,F.width()+I*2,F.height()+I*2),V.fillStrokeShape(F)}});this.add(Y),this._proxyDrag(Y),Y.on("dragstart",V=>{V.cancelBubble=!0}),Y.on("dragmove",V=>{V.cancelBubble=!0}),Y.on("dragend",V=>{V.cancelBubble=!0}),this.on("dragmove",V=>{this.update()})}_handleMouseDown(Y){if(this._transforming)return;this._movingAnchorName=Y.target.name().split(" ")[0];const V=this._getNodeRect(),F=V.width,I=V.height,D=Math.sqrt(Math.pow(F,2)+Math.pow(I,2));this.sin=Math.abs(I/D),this.cos=Math.abs(F/D),typeof window<"u"&&(window.addEventListener("mousemove",this._handleMouseMove),window.addEventListener("touchmove",this._handleMouseMove),window.addEventListener("mouseup",this._handleMouseUp,!0),window.addEventListener("touchend",this._handleMouseUp,!0)),this._transforming=!0;const P=Y.target.getAbsolutePosition(),H=Y.target.getStage().getPointerPosition();this._anchorDragOffset={x:H.x-P.x,y:H.y-P.y},G++,this._fire("transformstart",{evt:Y.evt,target:this.getNode()}),this._nodes.forEach(N=>{N._fire("transformstart",{evt:Y.evt,target:N})})}_handleMouseMove(Y){let V,F,I;const D=this.findOne("."+this._movingAnchorName),P=D.getStage();P.setPointersPositions(Y);const H=P.getPointerPosition();let N={x:H.x-this._anchorDragOffset.x,y:H.y-this._anchorDragOffset.y};const L=D.getAbsolutePosition();this.anchorDragBoundFunc()&&(N=this.anchorDragBoundFunc()(L,N,Y)),D.setAbsolutePosition(N);const Z=D.getAbsolutePosition();if(L.x===Z.x&&L.y===Z.y)return;if(this._movingAnchorName==="rotater"){const Te=this._getNodeRect();V=D.x()-Te.width/2,F=-D.y()+Te.height/2;let Re=Math.atan2(-F,V)+Math.PI/2;Te.height<0&&(Re-=Math.PI);const Ge=d.Konva.getAngle(this.rotation())+Re,$e=d.Konva.getAngle(this.rotationSnapTolerance()),ze=z(this.rotationSnaps(),Ge,$e)-Te.rotation,At=R(Te,ze);this._fitNodesInto(At,Y);return}const ae=this.shiftBehavior();let j;ae==="inverted"?j=this.keepRatio()&&!Y.shiftKey:ae==="none"?j=this.keepRatio():j=this.keepRatio()||Y.shiftKey;var Se=this.centeredScaling()||Y.altKey;if(this._movingAnchorName==="top-left"){if(j){var te=Se?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".bottom-right").x(),y:this.findOne(".bottom-right").y()};I=Math.sqrt(Math.pow(te.x-D.x(),2)+Math.pow(te.y-D.y(),2));var de=this.findOne(".top-left").x()>te.x?-1:1,ne=this.findOne(".top-left").y()>te.y?-1:1;V=I*this.cos*de,F=I*this.sin*ne,this.findOne(".top-left").x(te.x-V),this.findOne(".top-left").y(te.y-F)}}else if(this._movingAnchorName==="top-center")this.findOne(".top-left").y(D.y());else if(this._movingAnchorName==="top-right"){if(j){var te=Se?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".bottom-left").x(),y:this.findOne(".bottom-left").y()};I=Math.sqrt(Math.pow(D.x()-te.x,2)+Math.pow(te.y-D.y(),2));var de=this.findOne(".top-right").x()<te.x?-1:1,ne=this.findOne(".top-right").y()>te.y?-1:1;V=I*this.cos*de,F=I*this.sin*ne,this.findOne(".top-right").x(te.x+V),this.findOne(".top-right").y(te.y-F)}var ce=D.position();this.findOne(".top-left").y(ce.y),this.findOne(".bottom-right").x(ce.x)}else if(this._movingAnchorName==="middle-left")this.findOne(".top-left").x(D.x());else if(this._movingAnchorName==="middle-right")this.findOne(".bottom-right").x(D.x());else if(this._movingAnchorName==="bottom-left"){if(j){var te=Se?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".top-right").x(),y:this.findOne(".top-right").y()};I=Math.sqrt(Math.pow(te.x-D.x(),2)+Math.pow(D.y()-te.y,2));var de=te.x<D.x()?-1:1,ne=D.y()<te.y?-1:1;V=I*this.cos*de,F=I*this.sin*ne,D.x(te.x-V),D.y(te.y+F)}ce=D.position(),this.findOne(".top-left").x(ce.x),this.findOne(".bottom-right").y(ce.y)}else if(this._movingAnchorName==="bottom-center")this.findOne(".bottom-right").y(D.y());else if(this._movingAnchorName==="bottom-right"){if(j){var te=Se?{x:this.width()/2,y:this.height()/2}:{x:this.findOne(".top-left").x(),y:this.findOne(".top-left").y()};I=Math.sqrt(Math.pow(D.x()-te.x,2)+Math.pow(D.y()-te.y,2));var de=this.findOne(".bottom-right").x()<te.x?-1:1,ne=this.findOne(".bottom-right").y()<te.y?-1:1;V=I*this.cos*de,F=I*this.sin*ne,this.findOne(".bottom-right").x(te.x+V),this.findOne(".bottom-right").y(te.y+F)}}else console.error(new Error("Wrong position argument of selection resizer: "+this._movingAnchorName));var Se=this.centeredScaling()||Y.altKey;if(Se){const Te=this.findOne(".top-left"),Re=this.findOne(".bottom-right"),Me=Te.x(),Ge=Te.y(),$e=this.getWidth()-Re.x(),et=this.getHeight()-Re.y();Re.move({x:-Me,y:-Ge}),Te.move({x:$e,y:et})}const xe=this.findOne(".top-left").getAbsolutePosition();V=xe.x,F=xe.y;const $=this.findOne(".bottom-right").x()-this.findOne(".top-left").x(),oe=this.findOne(".bottom-right").y()-this.findOne(".top-left").y();this._fitNodesInto({x:V,y:F,width:$,height:oe,rotation:d.Konva.getAngle(this.rotation())},Y)}_handleMouseUp(Y){this._removeEvents(Y)}getAbsoluteTransform(){return this.getTransform()}_removeEvents(Y){var V;if(this._transforming){this._transforming=!1,typeof window<"u"&&(window.removeEventListener("mousemove",this._handleMouseMove),window.removeEventListener("touchmove",this._handleMouseMove),window.removeEventListener("mouseup",this._handleMouseUp,!0),window.removeEventListener("touchend",this._handleMouseUp,!0));const F=this.getNode();G--,this._fire("transformend",{evt:Y,target:F}),(V=this.getLayer())===null||V===void 0||V.batchDraw(),F&&this._nodes.forEach(I=>{var D;I._fire("transformend",{evt:Y,target:I}),(D=I.getLayer())===null||D===void 0||D.batchDraw()}),this._movingAnchorName=null}}_fitNodesInto(Y,V){const F=this._getNodeRect(),I=1;if(n.Util._inRange(Y.width,-this.padding()*2-I,I)){this.update();return}if(n.Util._inRange(Y.height,-this.padding()*2-I,I)){this.update();return}const D=new n.Transform;if(D.rotate(d.Konva.getAngle(this.rotation())),this._movingAnchorName&&Y.width<0&&this._movingAnchorName.indexOf("left")>=0){const j=D.point({x:-this.padding()*2,y:0});Y.x+=j.x,Y.y+=j.y,Y.width+=this.padding()*2,this._movingAnchorName=this._movingAnchorName.replace("left","right"),this._anchorDragOffset.x-=j.x,this._anchorDragOffset.y-=j.y}else if(this._movingAnchorName&&Y.width<0&&this._movingAnchorName.indexOf("right")>=0){const j=D.point({x:this.padding()*2,y:0});this._movingAnchorName=this._movingAnchorName.replace("right","left"),this._anchorDragOffset.x-=j.x,this._anchorDragOffset.y-=j.y,Y.width+=this.padding()*2}if(this._movingAnchorName&&Y.height<0&&this._movingAnchorName.indexOf("top")>=0){const j=D.point({x:0,y:-this.padding()*2});Y.x+=j.x,Y.y+=j.y,this._movingAnchorName=this._movingAnchorName.replace("top","bottom"),this._anchorDragOffset.x-=j.x,this._anchorDragOffset.y-=j.y,Y.height+=this.padding()*2}else if(this._movingAnchorName&&Y.height<0&&this._movingAnchorName.indexOf("bottom")>=0){const j=D.point({x:0,y:this.padding()*2});this._movingAnchorName=this._movingAnchorName.replace("bottom","top"),this._anchorDragOffset.x-=j.x,this._anchorDragOffset.y-=j.y,Y.height+=this.padding()*2}if(this.boundBoxFunc()){const j=this.boundBoxFunc()(F,Y);j?Y=j:n.Util.warn("boundBoxFunc returned falsy. You should return new bound rect from it!")}const P=1e7,H=new n.Transform;H.translate(F.x,F.y),H.rotate(F.rotation),H.scale(F.width/P,F.height/P);const N=new n.Transform,L=Y.width/P,Z=Y.height/P;this.flipEnabled()===!1?(N.translate(Y.x,Y.y),N.rotate(Y.rotation),N.translate(Y.width<0?Y.width:0,Y.height<0?Y.height:0),N.scale(Math.abs(L),Math.abs(Z))):(N.translate(Y.x,Y.y),N.rotate(Y.rotation),N.scale(L,Z));const ae=N.multiply(H.invert());this._nodes.forEach(j=>{var te;const de=j.getParent().getAbsoluteTransform(),ne=j.getTransform().copy();ne.translate(j.offsetX(),j.offsetY());const ce=new n.Transform;ce.multiply(de.copy().invert()).multiply(ae).multiply(de).multiply(ne);const Se=ce.decompose();j.setAttrs(Se),(te=j.getLayer())===null||te===void 0||te.batchDraw()}),this.rotation(n.Util._getRotation(Y.rotation)),this._nodes.forEach(j=>{this._fire("transform",{evt:V,target:j}),j._fire("transform",{evt:V,target:j})}),this._resetTransformCache(),this.update(),this.getLayer().batchDraw()}forceUpdate(){this._resetTransformCache(),this.update()}_batchChangeChild(Y,V){this.findOne(Y).setAttrs(V)}update(){var Y;const V=this._getNodeRect();this.rotation(n.Util._getRotation(V.rotation));const F=V.width,I=V.height,D=this.enabledAnchors(),P=this.resizeEnabled(),H=this.padding(),N=this.anchorSize(),L=this.find("._anchor");L.forEach(ae=>{ae.setAttrs({width:N,height:N,offsetX:N/2,offsetY:N/2,stroke:this.anchorStroke(),strokeWidth:this.anchorStrokeWidth(),fill:this.anchorFill(),cornerRadius:this.anchorCornerRadius()})}),this._batchChangeChild(".top-left",{x:0,y:0,offsetX:N/2+H,offsetY:N/2+H,visible:P&&D.indexOf("top-left")>=0}),this._batchChangeChild(".top-center",{x:F/2,y:0,offsetY:N/2+H,visible:P&&D.indexOf("top-center")>=0}),this._batchChangeChild(".top-right",{x:F,y:0,offsetX:N/2-H,offsetY:N/2+H,visible:P&&D.indexOf("top-right")>=0}),this._batchChangeChild(".middle-left",{x:0,y:I/2,offsetX:N/2+H,visible:P&&D.indexOf("middle-left")>=0}),this._batchChangeChild(".middle-right",{x:F,y:I/2,offsetX:N/2-H,visible:P&&D.indexOf("middle-right")>=0}),this._batchChangeChild(".bottom-left",{x:0,y:I,offsetX:N/2+H,offsetY:N/2-H,visible:P&&D.indexOf("bottom-left")>=0}),this._batchChangeChild(".bottom-center",{x:F/2,y:I,offsetY:N/2-H,visible:P&&D.indexOf("bottom-center")>=0}),this._batchChangeChild(".bottom-right",{x:F,y:I,offsetX:N/2-H,offsetY:N/2-H,visible:P&&D.indexOf("bottom-right")>=0}),this._batchChangeChild(".rotater",{x:F/2,y:-this.rotateAnchorOffset()*n.Util._sign(I)-H,visible:this.rotateEnabled()}),this._batchChangeChild(".back",{width:F,height:I,visible:this.borderEnabled(),stroke:this.borderStroke(),strokeWidth:this.borderStrokeWidth(),dash:this.borderDash(),x:0,y:0});const Z=this.anchorStyleFunc();Z&&L.forEach(ae=>{Z(ae)}),(Y=this.getLayer())===null||Y===void 0||Y.batchDraw()}isTransforming(){return this._transforming}stopTransform(){if(this._transforming){this._removeEvents();const Y=this.findOne("."+this._movingAnchorName);Y&&Y.stopDrag()}}destroy(){return this.getStage()&&this._cursorChange&&this.getStage().content&&(this.getStage().content.style.cursor=""),h.Group.prototype.destroy.call(this),this.detach(),this._removeEvents(),this}toObject(){return u.Node.prototype.toObject.call(this)}clone(Y){return u.Node.prototype.clone.call(this,Y)}getClientRect(){return this.nodes().length>0?super.getClientRect():{x:0,y:0,width:0,height:0}}};qh.Transformer=B,B.isTransforming=()=>G>0;function Q(X){return X instanceof Array||n.Util.warn("enabledAnchors value should be an array"),X instanceof Array&&X.forEach(function(Y){w.indexOf(Y)===-1&&n.Util.warn("Unknown anchor name: "+Y+". Available names are: "+w.join(", "))}),X||[]}return B.prototype.className="Transformer",(0,v._registerNode)(B),i.Factory.addGetterSetter(B,"enabledAnchors",w,Q),i.Factory.addGetterSetter(B,"flipEnabled",!0,(0,g.getBooleanValidator)()),i.Factory.addGetterSetter(B,"resizeEnabled",!0),i.Factory.addGetterSetter(B,"anchorSize",10,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"rotateEnabled",!0),i.Factory.addGetterSetter(B,"rotateLineVisible",!0),i.Factory.addGetterSetter(B,"rotationSnaps",[]),i.Factory.addGetterSetter(B,"rotateAnchorOffset",50,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"rotateAnchorCursor","crosshair"),i.Factory.addGetterSetter(B,"rotationSnapTolerance",5,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"borderEnabled",!0),i.Factory.addGetterSetter(B,"anchorStroke","rgb(0, 161, 255)"),i.Factory.addGetterSetter(B,"anchorStrokeWidth",1,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"anchorFill","white"),i.Factory.addGetterSetter(B,"anchorCornerRadius",0,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"borderStroke","rgb(0, 161, 255)"),i.Factory.addGetterSetter(B,"borderStrokeWidth",1,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"borderDash"),i.Factory.addGetterSetter(B,"keepRatio",!0),i.Factory.addGetterSetter(B,"shiftBehavior","default"),i.Factory.addGetterSetter(B,"centeredScaling",!1),i.Factory.addGetterSetter(B,"ignoreStroke",!1),i.Factory.addGetterSetter(B,"padding",0,(0,g.getNumberValidator)()),i.Factory.addGetterSetter(B,"nodes"),i.Factory.addGetterSetter(B,"node"),i.Factory.addGetterSetter(B,"boundBoxFunc"),i.Factory.addGetterSetter(B,"anchorDragBoundFunc"),i.Factory.addGetterSetter(B,"anchorStyleFunc"),i.Factory.addGetterSetter(B,"shouldOverdrawWholeArea",!1),i.Factory.addGetterSetter(B,"useSingleNodeRotation",!0),i.Factory.backCompat(B,{lineEnabled:"borderEnabled",rotateHandlerOffset:"rotateAnchorOffset",enabledHandlers:"enabledAnchors"}),qh}var Hh={},H6;function VM(){if(H6)return Hh;H6=1,Object.defineProperty(Hh,"__esModule",{value:!0}),Hh.Wedge=void 0;const n=vt(),i=en(),u=ct(),s=_t(),c=ct();let h=class extends i.Shape{_sceneFunc(g){g.beginPath(),g.arc(0,0,this.radius(),0,u.Konva.getAngle(this.angle()),this.clockwise()),g.lineTo(0,0),g.closePath(),g.fillStrokeShape(this)}getWidth(){return this.radius()*2}getHeight(){return this.radius()*2}setWidth(g){this.radius(g/2)}setHeight(g){this.radius(g/2)}};return Hh.Wedge=h,h.prototype.className="Wedge",h.prototype._centroid=!0,h.prototype._attrsAffectingSize=["radius"],(0,c._registerNode)(h),n.Factory.addGetterSetter(h,"radius",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(h,"angle",0,(0,s.getNumberValidator)()),n.Factory.addGetterSetter(h,"clockwise",!1),n.Factory.backCompat(h,{angleDeg:"angle",getAngleDeg:"getAngle",setAngleDeg:"setAngle"}),Hh}var Bh={},B6;function YM(){if(B6)return Bh;B6=1,Object.defineProperty(Bh,"__esModule",{value:!0}),Bh.Blur=void 0;const n=vt(),i=wa(),u=_t();function s(){this.r=0,this.g=0,this.b=0,this.a=0,this.next=null}const c=[512,512,456,512,328,456,335,512,405,328,271,456,388,335,292,512,454,405,364,328,298,271,496,456,420,388,360,335,312,292,273,512,482,454,428,405,383,364,345,328,312,298,284,271,259,496,475,456,437,420,404,388,374,360,347,335,323,312,302,292,282,273,265,512,497,482,468,454,441,428,417,405,394,383,373,364,354,345,337,328,320,312,305,298,291,284,278,271,265,259,507,496,485,475,465,456,446,437,428,420,412,404,396,388,381,374,367,360,354,347,341,335,329,323,318,312,307,302,297,292,287,282,278,273,269,265,261,512,505,497,489,482,475,468,461,454,447,441,435,428,422,417,411,405,399,394,389,383,378,373,368,364,359,354,350,345,341,337,332,328,324,320,316,312,309,305,301,298,294,291,287,284,281,278,274,271,268,265,262,259,257,507,501,496,491,485,480,475,470,465,460,456,451,446,442,437,433,428,424,420,416,412,408,404,400,396,392,388,385,381,377,374,370,367,363,360,357,354,350,347,344,341,338,335,332,329,326,323,320,318,315,312,310,307,304,302,299,297,294,292,289,287,285,282,280,278,275,273,271,269,267,265,263,261,259],h=[9,11,12,13,13,14,14,15,15,15,15,16,16,16,16,17,17,17,17,17,17,17,18,18,18,18,18,18,18,18,18,19,19,19,19,19,19,19,19,19,19,19,19,19,19,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24];function d(v,p){const _=v.data,T=v.width,C=v.height;let x,E,O,w,U,A,R,z,G,B,Q,X,Y,V,F,I,D,P,H,N,L,Z,ae,j;const te=p+p+1,de=T-1,ne=C-1,ce=p+1,Se=ce*(ce+1)/2,xe=new s,$=c[p],oe=h[p];let Te=null,Re=xe,Me=null,Ge=null;for(O=1;O<te;O++)Re=Re.next=new s,O===ce&&(Te=Re);for(Re.next=xe,R=A=0,E=0;E<C;E++){for(I=D=P=H=z=G=B=Q=0,X=ce*(N=_[A]),Y=ce*(L=_[A+1]),V=ce*(Z=_[A+2]),F=ce*(ae=_[A+3]),z+=Se*N,G+=Se*L,B+=Se*Z,Q+=Se*ae,Re=xe,O=0;O<ce;O++)Re.r=N,Re.g=L,Re.b=Z,Re.a=ae,Re=Re.next;for(O=1;O<ce;O++)w=A+((de<O?de:O)<<2),z+=(Re.r=N=_[w])*(j=ce-O),G+=(Re.g=L=_[w+1])*j,B+=(Re.b=Z=_[w+2])*j,Q+=(Re.a=ae=_[w+3])*j,I+=N,D+=L,P+=Z,H+=ae,Re=Re.next;for(Me=xe,Ge=Te,x=0;x<T;x++)_[A+3]=ae=Q*$>>oe,ae!==0?(ae=255/ae,_[A]=(z*$>>oe)*ae,_[A+1]=(G*$>>oe)*ae,_[A+2]=(B*$>>oe)*ae):_[A]=_[A+1]=_[A+2]=0,z-=X,G-=Y,B-=V,Q-=F,X-=Me.r,Y-=Me.g,V-=Me.b,F-=Me.a,w=R+((w=x+p+1)<de?w:de)<<2,I+=Me.r=_[w],D+=Me.g=_[w+1],P+=Me.b=_[w+2],H+=Me.a=_[w+3],z+=I,G+=D,B+=P,Q+=H,Me=Me.next,X+=N=Ge.r,Y+=L=Ge.g,V+=Z=Ge.b,F+=ae=Ge.a,I-=N,D-=L,P-=Z,H-=ae,Ge=Ge.next,A+=4;R+=T}for(x=0;x<T;x++){for(D=P=H=I=G=B=Q=z=0,A=x<<2,X=ce*(N=_[A]),Y=ce*(L=_[A+1]),V=ce*(Z=_[A+2]),F=ce*(ae=_[A+3]),z+=Se*N,G+=Se*L,B+=Se*Z,Q+=Se*ae,Re=xe,O=0;O<ce;O++)Re.r=N,Re.g=L,Re.b=Z,Re.a=ae,Re=Re.next;for(U=T,O=1;O<=p;O++)A=U+x<<2,z+=(Re.r=N=_[A])*(j=ce-O),G+=(Re.g=L=_[A+1])*j,B+=(Re.b=Z=_[A+2])*j,Q+=(Re.a=ae=_[A+3])*j,I+=N,D+=L,P+=Z,H+=ae,Re=Re.next,O<ne&&(U+=T);for(A=x,Me=xe,Ge=Te,E=0;E<C;E++)w=A<<2,_[w+3]=ae=Q*$>>oe,ae>0?(ae=255/ae,_[w]=(z*$>>oe)*ae,_[w+1]=(G*$>>oe)*ae,_[w+2]=(B*$>>oe)*ae):_[w]=_[w+1]=_[w+2]=0,z-=X,G-=Y,B-=V,Q-=F,X-=Me.r,Y-=Me.g,V-=Me.b,F-=Me.a,w=x+((w=E+ce)<ne?w:ne)*T<<2,z+=I+=Me.r=_[w],G+=D+=Me.g=_[w+1],B+=P+=Me.b=_[w+2],Q+=H+=Me.a=_[w+3],Me=Me.next,X+=N=Ge.r,Y+=L=Ge.g,V+=Z=Ge.b,F+=ae=Ge.a,I-=N,D-=L,P-=Z,H-=ae,Ge=Ge.next,A+=T}}const g=function(p){const _=Math.round(this.blurRadius());_>0&&d(p,_)};return Bh.Blur=g,n.Factory.addGetterSetter(i.Node,"blurRadius",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Bh}var Lh={},L6;function PM(){if(L6)return Lh;L6=1,Object.defineProperty(Lh,"__esModule",{value:!0}),Lh.Brighten=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=this.brightness()*255,d=c.data,g=d.length;for(let v=0;v<g;v+=4)d[v]+=h,d[v+1]+=h,d[v+2]+=h};return Lh.Brighten=s,n.Factory.addGetterSetter(i.Node,"brightness",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Lh}var jh={},j6;function XM(){if(j6)return jh;j6=1,Object.defineProperty(jh,"__esModule",{value:!0}),jh.Contrast=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=Math.pow((this.contrast()+100)/100,2),d=c.data,g=d.length;let v=150,p=150,_=150;for(let T=0;T<g;T+=4)v=d[T],p=d[T+1],_=d[T+2],v/=255,v-=.5,v*=h,v+=.5,v*=255,p/=255,p-=.5,p*=h,p+=.5,p*=255,_/=255,_-=.5,_*=h,_+=.5,_*=255,v=v<0?0:v>255?255:v,p=p<0?0:p>255?255:p,_=_<0?0:_>255?255:_,d[T]=v,d[T+1]=p,d[T+2]=_};return jh.Contrast=s,n.Factory.addGetterSetter(i.Node,"contrast",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),jh}var Vh={},V6;function KM(){if(V6)return Vh;V6=1,Object.defineProperty(Vh,"__esModule",{value:!0}),Vh.Emboss=void 0;const n=vt(),i=wa(),u=Ea(),s=_t(),c=function(h){const d=this.embossStrength()*10,g=this.embossWhiteLevel()*255,v=this.embossDirection(),p=this.embossBlend(),_=h.data,T=h.width,C=h.height,x=T*4;let E=0,O=0,w=C;switch(v){case"top-left":E=-1,O=-1;break;case"top":E=-1,O=0;break;case"top-right":E=-1,O=1;break;case"right":E=0,O=1;break;case"bottom-right":E=1,O=1;break;case"bottom":E=1,O=0;break;case"bottom-left":E=1,O=-1;break;case"left":E=0,O=-1;break;default:u.Util.error("Unknown emboss direction: "+v)}do{const U=(w-1)*x;let A=E;w+A<1&&(A=0),w+A>C&&(A=0);const R=(w-1+A)*T*4;let z=T;do{const G=U+(z-1)*4;let B=O;z+B<1&&(B=0),z+B>T&&(B=0);const Q=R+(z-1+B)*4,X=_[G]-_[Q],Y=_[G+1]-_[Q+1],V=_[G+2]-_[Q+2];let F=X;const I=F>0?F:-F,D=Y>0?Y:-Y,P=V>0?V:-V;if(D>I&&(F=Y),P>I&&(F=V),F*=d,p){const H=_[G]+F,N=_[G+1]+F,L=_[G+2]+F;_[G]=H>255?255:H<0?0:H,_[G+1]=N>255?255:N<0?0:N,_[G+2]=L>255?255:L<0?0:L}else{let H=g-F;H<0?H=0:H>255&&(H=255),_[G]=_[G+1]=_[G+2]=H}}while(--z)}while(--w)};return Vh.Emboss=c,n.Factory.addGetterSetter(i.Node,"embossStrength",.5,(0,s.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"embossWhiteLevel",.5,(0,s.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"embossDirection","top-left",void 0,n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"embossBlend",!1,void 0,n.Factory.afterSetFilter),Vh}var Yh={},Y6;function FM(){if(Y6)return Yh;Y6=1,Object.defineProperty(Yh,"__esModule",{value:!0}),Yh.Enhance=void 0;const n=vt(),i=wa(),u=_t();function s(h,d,g,v,p){const _=g-d,T=p-v;if(_===0)return v+T/2;if(T===0)return v;let C=(h-d)/_;return C=T*C+v,C}const c=function(h){const d=h.data,g=d.length;let v=d[0],p=v,_,T=d[1],C=T,x,E=d[2],O=E,w;const U=this.enhance();if(U===0)return;for(let F=0;F<g;F+=4)_=d[F+0],_<v?v=_:_>p&&(p=_),x=d[F+1],x<T?T=x:x>C&&(C=x),w=d[F+2],w<E?E=w:w>O&&(O=w);p===v&&(p=255,v=0),C===T&&(C=255,T=0),O===E&&(O=255,E=0);let A,R,z,G,B,Q,X,Y,V;U>0?(R=p+U*(255-p),z=v-U*(v-0),B=C+U*(255-C),Q=T-U*(T-0),Y=O+U*(255-O),V=E-U*(E-0)):(A=(p+v)*.5,R=p+U*(p-A),z=v+U*(v-A),G=(C+T)*.5,B=C+U*(C-G),Q=T+U*(T-G),X=(O+E)*.5,Y=O+U*(O-X),V=E+U*(E-X));for(let F=0;F<g;F+=4)d[F+0]=s(d[F+0],v,p,z,R),d[F+1]=s(d[F+1],T,C,Q,B),d[F+2]=s(d[F+2],E,O,V,Y)};return Yh.Enhance=c,n.Factory.addGetterSetter(i.Node,"enhance",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Yh}var Ph={},P6;function kM(){if(P6)return Ph;P6=1,Object.defineProperty(Ph,"__esModule",{value:!0}),Ph.Grayscale=void 0;const n=function(i){const u=i.data,s=u.length;for(let c=0;c<s;c+=4){const h=.34*u[c]+.5*u[c+1]+.16*u[c+2];u[c]=h,u[c+1]=h,u[c+2]=h}};return Ph.Grayscale=n,Ph}var Xh={},X6;function QM(){if(X6)return Xh;X6=1,Object.defineProperty(Xh,"__esModule",{value:!0}),Xh.HSL=void 0;const n=vt(),i=wa(),u=_t();n.Factory.addGetterSetter(i.Node,"hue",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"saturation",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"luminance",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter);const s=function(c){const h=c.data,d=h.length,g=1,v=Math.pow(2,this.saturation()),p=Math.abs(this.hue()+360)%360,_=this.luminance()*127,T=g*v*Math.cos(p*Math.PI/180),C=g*v*Math.sin(p*Math.PI/180),x=.299*g+.701*T+.167*C,E=.587*g-.587*T+.33*C,O=.114*g-.114*T-.497*C,w=.299*g-.299*T-.328*C,U=.587*g+.413*T+.035*C,A=.114*g-.114*T+.293*C,R=.299*g-.3*T+1.25*C,z=.587*g-.586*T-1.05*C,G=.114*g+.886*T-.2*C;let B,Q,X,Y;for(let V=0;V<d;V+=4)B=h[V+0],Q=h[V+1],X=h[V+2],Y=h[V+3],h[V+0]=x*B+E*Q+O*X+_,h[V+1]=w*B+U*Q+A*X+_,h[V+2]=R*B+z*Q+G*X+_,h[V+3]=Y};return Xh.HSL=s,Xh}var Kh={},K6;function ZM(){if(K6)return Kh;K6=1,Object.defineProperty(Kh,"__esModule",{value:!0}),Kh.HSV=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=c.data,d=h.length,g=Math.pow(2,this.value()),v=Math.pow(2,this.saturation()),p=Math.abs(this.hue()+360)%360,_=g*v*Math.cos(p*Math.PI/180),T=g*v*Math.sin(p*Math.PI/180),C=.299*g+.701*_+.167*T,x=.587*g-.587*_+.33*T,E=.114*g-.114*_-.497*T,O=.299*g-.299*_-.328*T,w=.587*g+.413*_+.035*T,U=.114*g-.114*_+.293*T,A=.299*g-.3*_+1.25*T,R=.587*g-.586*_-1.05*T,z=.114*g+.886*_-.2*T;let G,B,Q,X;for(let Y=0;Y<d;Y+=4)G=h[Y+0],B=h[Y+1],Q=h[Y+2],X=h[Y+3],h[Y+0]=C*G+x*B+E*Q,h[Y+1]=O*G+w*B+U*Q,h[Y+2]=A*G+R*B+z*Q,h[Y+3]=X};return Kh.HSV=s,n.Factory.addGetterSetter(i.Node,"hue",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"saturation",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"value",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Kh}var Fh={},F6;function JM(){if(F6)return Fh;F6=1,Object.defineProperty(Fh,"__esModule",{value:!0}),Fh.Invert=void 0;const n=function(i){const u=i.data,s=u.length;for(let c=0;c<s;c+=4)u[c]=255-u[c],u[c+1]=255-u[c+1],u[c+2]=255-u[c+2]};return Fh.Invert=n,Fh}var kh={},k6;function WM(){if(k6)return kh;k6=1,Object.defineProperty(kh,"__esModule",{value:!0}),kh.Kaleidoscope=void 0;const n=vt(),i=wa(),u=Ea(),s=_t(),c=function(g,v,p){const _=g.data,T=v.data,C=g.width,x=g.height,E=p.polarCenterX||C/2,O=p.polarCenterY||x/2;let w=Math.sqrt(E*E+O*O),U=C-E,A=x-O;const R=Math.sqrt(U*U+A*A);w=R>w?R:w;const z=x,G=C,B=360/G*Math.PI/180;for(let Q=0;Q<G;Q+=1){const X=Math.sin(Q*B),Y=Math.cos(Q*B);for(let V=0;V<z;V+=1){U=Math.floor(E+w*V/z*Y),A=Math.floor(O+w*V/z*X);let F=(A*C+U)*4;const I=_[F+0],D=_[F+1],P=_[F+2],H=_[F+3];F=(Q+V*C)*4,T[F+0]=I,T[F+1]=D,T[F+2]=P,T[F+3]=H}}},h=function(g,v,p){const _=g.data,T=v.data,C=g.width,x=g.height,E=p.polarCenterX||C/2,O=p.polarCenterY||x/2;let w=Math.sqrt(E*E+O*O),U=C-E,A=x-O;const R=Math.sqrt(U*U+A*A);w=R>w?R:w;const z=x,G=C,B=0;let Q,X;for(U=0;U<C;U+=1)for(A=0;A<x;A+=1){const Y=U-E,V=A-O,F=Math.sqrt(Y*Y+V*V)*z/w;let I=(Math.atan2(V,Y)*180/Math.PI+360+B)%360;I=I*G/360,Q=Math.floor(I),X=Math.floor(F);let D=(X*C+Q)*4;const P=_[D+0],H=_[D+1],N=_[D+2],L=_[D+3];D=(A*C+U)*4,T[D+0]=P,T[D+1]=H,T[D+2]=N,T[D+3]=L}},d=function(g){const v=g.width,p=g.height;let _,T,C,x,E,O,w,U,A,R,z=Math.round(this.kaleidoscopePower());const G=Math.round(this.kaleidoscopeAngle()),B=Math.floor(v*(G%360)/360);if(z<1)return;const Q=u.Util.createCanvasElement();Q.width=v,Q.height=p;const X=Q.getContext("2d").getImageData(0,0,v,p);u.Util.releaseCanvas(Q),c(g,X,{polarCenterX:v/2,polarCenterY:p/2});let Y=v/Math.pow(2,z);for(;Y<=8;)Y=Y*2,z-=1;Y=Math.ceil(Y);let V=Y,F=0,I=V,D=1;for(B+Y>v&&(F=V,I=0,D=-1),T=0;T<p;T+=1)for(_=F;_!==I;_+=D)C=Math.round(_+B)%v,A=(v*T+C)*4,E=X.data[A+0],O=X.data[A+1],w=X.data[A+2],U=X.data[A+3],R=(v*T+_)*4,X.data[R+0]=E,X.data[R+1]=O,X.data[R+2]=w,X.data[R+3]=U;for(T=0;T<p;T+=1)for(V=Math.floor(Y),x=0;x<z;x+=1){for(_=0;_<V+1;_+=1)A=(v*T+_)*4,E=X.data[A+0],O=X.data[A+1],w=X.data[A+2],U=X.data[A+3],R=(v*T+V*2-_-1)*4,X.data[R+0]=E,X.data[R+1]=O,X.data[R+2]=w,X.data[R+3]=U;V*=2}h(X,g,{})};return kh.Kaleidoscope=d,n.Factory.addGetterSetter(i.Node,"kaleidoscopePower",2,(0,s.getNumberValidator)(),n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"kaleidoscopeAngle",0,(0,s.getNumberValidator)(),n.Factory.afterSetFilter),kh}var Qh={},Q6;function IM(){if(Q6)return Qh;Q6=1,Object.defineProperty(Qh,"__esModule",{value:!0}),Qh.Mask=void 0;const n=vt(),i=wa(),u=_t();function s(C,x,E){let O=(E*C.width+x)*4;const w=[];return w.push(C.data[O++],C.data[O++],C.data[O++],C.data[O++]),w}function c(C,x){return Math.sqrt(Math.pow(C[0]-x[0],2)+Math.pow(C[1]-x[1],2)+Math.pow(C[2]-x[2],2))}function h(C){const x=[0,0,0];for(let E=0;E<C.length;E++)x[0]+=C[E][0],x[1]+=C[E][1],x[2]+=C[E][2];return x[0]/=C.length,x[1]/=C.length,x[2]/=C.length,x}function d(C,x){const E=s(C,0,0),O=s(C,C.width-1,0),w=s(C,0,C.height-1),U=s(C,C.width-1,C.height-1),A=x||10;if(c(E,O)<A&&c(O,U)<A&&c(U,w)<A&&c(w,E)<A){const R=h([O,E,U,w]),z=[];for(let G=0;G<C.width*C.height;G++){const B=c(R,[C.data[G*4],C.data[G*4+1],C.data[G*4+2]]);z[G]=B<A?0:255}return z}}function g(C,x){for(let E=0;E<C.width*C.height;E++)C.data[4*E+3]=x[E]}function v(C,x,E){const O=[1,1,1,1,0,1,1,1,1],w=Math.round(Math.sqrt(O.length)),U=Math.floor(w/2),A=[];for(let R=0;R<E;R++)for(let z=0;z<x;z++){const G=R*x+z;let B=0;for(let Q=0;Q<w;Q++)for(let X=0;X<w;X++){const Y=R+Q-U,V=z+X-U;if(Y>=0&&Y<E&&V>=0&&V<x){const F=Y*x+V,I=O[Q*w+X];B+=C[F]*I}}A[G]=B===255*8?255:0}return A}function p(C,x,E){const O=[1,1,1,1,1,1,1,1,1],w=Math.round(Math.sqrt(O.length)),U=Math.floor(w/2),A=[];for(let R=0;R<E;R++)for(let z=0;z<x;z++){const G=R*x+z;let B=0;for(let Q=0;Q<w;Q++)for(let X=0;X<w;X++){const Y=R+Q-U,V=z+X-U;if(Y>=0&&Y<E&&V>=0&&V<x){const F=Y*x+V,I=O[Q*w+X];B+=C[F]*I}}A[G]=B>=255*4?255:0}return A}function _(C,x,E){const O=[.1111111111111111,.1111111111111111,.1111111111111111,.1111111111111111,.1111111111111111,.1111111111111111,.1111111111111111,.1111111111111111,.1111111111111111],w=Math.round(Math.sqrt(O.length)),U=Math.floor(w/2),A=[];for(let R=0;R<E;R++)for(let z=0;z<x;z++){const G=R*x+z;let B=0;for(let Q=0;Q<w;Q++)for(let X=0;X<w;X++){const Y=R+Q-U,V=z+X-U;if(Y>=0&&Y<E&&V>=0&&V<x){const F=Y*x+V,I=O[Q*w+X];B+=C[F]*I}}A[G]=B}return A}const T=function(C){const x=this.threshold();let E=d(C,x);return E&&(E=v(E,C.width,C.height),E=p(E,C.width,C.height),E=_(E,C.width,C.height),g(C,E)),C};return Qh.Mask=T,n.Factory.addGetterSetter(i.Node,"threshold",0,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Qh}var Zh={},Z6;function $M(){if(Z6)return Zh;Z6=1,Object.defineProperty(Zh,"__esModule",{value:!0}),Zh.Noise=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=this.noise()*255,d=c.data,g=d.length,v=h/2;for(let p=0;p<g;p+=4)d[p+0]+=v-2*v*Math.random(),d[p+1]+=v-2*v*Math.random(),d[p+2]+=v-2*v*Math.random()};return Zh.Noise=s,n.Factory.addGetterSetter(i.Node,"noise",.2,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Zh}var Jh={},J6;function ew(){if(J6)return Jh;J6=1,Object.defineProperty(Jh,"__esModule",{value:!0}),Jh.Pixelate=void 0;const n=vt(),i=Ea(),u=wa(),s=_t(),c=function(h){let d=Math.ceil(this.pixelSize()),g=h.width,v=h.height,p,_,T,C,x,E,O,w=Math.ceil(g/d),U=Math.ceil(v/d),A,R,z,G,B,Q,X,Y=h.data;if(d<=0){i.Util.error("pixelSize value can not be <= 0");return}for(B=0;B<w;B+=1)for(Q=0;Q<U;Q+=1){for(C=0,x=0,E=0,O=0,A=B*d,R=A+d,z=Q*d,G=z+d,X=0,p=A;p<R;p+=1)if(!(p>=g))for(_=z;_<G;_+=1)_>=v||(T=(g*_+p)*4,C+=Y[T+0],x+=Y[T+1],E+=Y[T+2],O+=Y[T+3],X+=1);for(C=C/X,x=x/X,E=E/X,O=O/X,p=A;p<R;p+=1)if(!(p>=g))for(_=z;_<G;_+=1)_>=v||(T=(g*_+p)*4,Y[T+0]=C,Y[T+1]=x,Y[T+2]=E,Y[T+3]=O)}};return Jh.Pixelate=c,n.Factory.addGetterSetter(u.Node,"pixelSize",8,(0,s.getNumberValidator)(),n.Factory.afterSetFilter),Jh}var Wh={},W6;function tw(){if(W6)return Wh;W6=1,Object.defineProperty(Wh,"__esModule",{value:!0}),Wh.Posterize=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=Math.round(this.levels()*254)+1,d=c.data,g=d.length,v=255/h;for(let p=0;p<g;p+=1)d[p]=Math.floor(d[p]/v)*v};return Wh.Posterize=s,n.Factory.addGetterSetter(i.Node,"levels",.5,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),Wh}var Ih={},I6;function aw(){if(I6)return Ih;I6=1,Object.defineProperty(Ih,"__esModule",{value:!0}),Ih.RGB=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=c.data,d=h.length,g=this.red(),v=this.green(),p=this.blue();for(let _=0;_<d;_+=4){const T=(.34*h[_]+.5*h[_+1]+.16*h[_+2])/255;h[_]=T*g,h[_+1]=T*v,h[_+2]=T*p,h[_+3]=h[_+3]}};return Ih.RGB=s,n.Factory.addGetterSetter(i.Node,"red",0,function(c){return this._filterUpToDate=!1,c>255?255:c<0?0:Math.round(c)}),n.Factory.addGetterSetter(i.Node,"green",0,function(c){return this._filterUpToDate=!1,c>255?255:c<0?0:Math.round(c)}),n.Factory.addGetterSetter(i.Node,"blue",0,u.RGBComponent,n.Factory.afterSetFilter),Ih}var $h={},$6;function nw(){if($6)return $h;$6=1,Object.defineProperty($h,"__esModule",{value:!0}),$h.RGBA=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=c.data,d=h.length,g=this.red(),v=this.green(),p=this.blue(),_=this.alpha();for(let T=0;T<d;T+=4){const C=1-_;h[T]=g*_+h[T]*C,h[T+1]=v*_+h[T+1]*C,h[T+2]=p*_+h[T+2]*C}};return $h.RGBA=s,n.Factory.addGetterSetter(i.Node,"red",0,function(c){return this._filterUpToDate=!1,c>255?255:c<0?0:Math.round(c)}),n.Factory.addGetterSetter(i.Node,"green",0,function(c){return this._filterUpToDate=!1,c>255?255:c<0?0:Math.round(c)}),n.Factory.addGetterSetter(i.Node,"blue",0,u.RGBComponent,n.Factory.afterSetFilter),n.Factory.addGetterSetter(i.Node,"alpha",1,function(c){return this._filterUpToDate=!1,c>1?1:c<0?0:c}),$h}var ed={},e_;function iw(){if(e_)return ed;e_=1,Object.defineProperty(ed,"__esModule",{value:!0}),ed.Sepia=void 0;const n=function(i){const u=i.data,s=u.length;for(let c=0;c<s;c+=4){const h=u[c+0],d=u[c+1],g=u[c+2];u[c+0]=Math.min(255,h*.393+d*.769+g*.189),u[c+1]=Math.min(255,h*.349+d*.686+g*.168),u[c+2]=Math.min(255,h*.272+d*.534+g*.131)}};return ed.Sepia=n,ed}var td={},t_;function rw(){if(t_)return td;t_=1,Object.defineProperty(td,"__esModule",{value:!0}),td.Solarize=void 0;const n=function(i){const u=i.data,s=i.width,c=i.height,h=s*4;let d=c;do{const g=(d-1)*h;let v=s;do{const p=g+(v-1)*4;let _=u[p],T=u[p+1],C=u[p+2];_>127&&(_=255-_),T>127&&(T=255-T),C>127&&(C=255-C),u[p]=_,u[p+1]=T,u[p+2]=C}while(--v)}while(--d)};return td.Solarize=n,td}var ad={},a_;function lw(){if(a_)return ad;a_=1,Object.defineProperty(ad,"__esModule",{value:!0}),ad.Threshold=void 0;const n=vt(),i=wa(),u=_t(),s=function(c){const h=this.threshold()*255,d=c.data,g=d.length;for(let v=0;v<g;v+=1)d[v]=d[v]<h?0:255};return ad.Threshold=s,n.Factory.addGetterSetter(i.Node,"threshold",.5,(0,u.getNumberValidator)(),n.Factory.afterSetFilter),ad}var n_;function uw(){if(n_)return vh;n_=1,Object.defineProperty(vh,"__esModule",{value:!0}),vh.Konva=void 0;const n=lm(),i=OM(),u=wM(),s=NM(),c=DM(),h=zM(),d=UM(),g=j8(),v=ry(),p=Y8(),_=GM(),T=qM(),C=HM(),x=BM(),E=P8(),O=LM(),w=jM(),U=VM(),A=YM(),R=PM(),z=XM(),G=KM(),B=FM(),Q=kM(),X=QM(),Y=ZM(),V=JM(),F=WM(),I=IM(),D=$M(),P=ew(),H=tw(),N=aw(),L=nw(),Z=iw(),ae=rw(),j=lw();return vh.Konva=n.Konva.Util._assign(n.Konva,{Arc:i.Arc,Arrow:u.Arrow,Circle:s.Circle,Ellipse:c.Ellipse,Image:h.Image,Label:d.Label,Tag:d.Tag,Line:g.Line,Path:v.Path,Rect:p.Rect,RegularPolygon:_.RegularPolygon,Ring:T.Ring,Sprite:C.Sprite,Star:x.Star,Text:E.Text,TextPath:O.TextPath,Transformer:w.Transformer,Wedge:U.Wedge,Filters:{Blur:A.Blur,Brighten:R.Brighten,Contrast:z.Contrast,Emboss:G.Emboss,Enhance:B.Enhance,Grayscale:Q.Grayscale,HSL:X.HSL,HSV:Y.HSV,Invert:V.Invert,Kaleidoscope:F.Kaleidoscope,Mask:I.Mask,Noise:D.Noise,Pixelate:P.Pixelate,Posterize:H.Posterize,RGB:N.RGB,RGBA:L.RGBA,Sepia:Z.Sepia,Solarize:ae.Solarize,Threshold:j.Threshold}}),vh}var sw=s1.exports,i_;function ow(){if(i_)return s1.exports;i_=1,Object.defineProperty(sw,"__esModule",{value:!0});const n=uw();return s1.exports=n.Konva,s1.exports}ow();var r1={exports:{}},r_;function cw(){return r_||(r_=1,function(n,i){Object.defineProperty(i,"__esModule",{value:!0}),i.Konva=void 0;var u=lm();Object.defineProperty(i,"Konva",{enumerable:!0,get:function(){return u.Konva}});const s=lm();n.exports=s.Konva}(r1,r1.exports)),r1.exports}var fw=cw();const v1=Ku(fw);var L2={exports:{}},j2={exports:{}},V2={exports:{}},Y2={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var l_;function hw(){return l_||(l_=1,function(n){function i(N,L){var Z=N.length;N.push(L);e:for(;0<Z;){var ae=Z-1>>>1,j=N[ae];if(0<c(j,L))N[ae]=L,N[Z]=j,Z=ae;else break e}}function u(N){return N.length===0?null:N[0]}function s(N){if(N.length===0)return null;var L=N[0],Z=N.pop();if(Z!==L){N[0]=Z;e:for(var ae=0,j=N.length,te=j>>>1;ae<te;){var de=2*(ae+1)-1,ne=N[de],ce=de+1,Se=N[ce];if(0>c(ne,Z))ce<j&&0>c(Se,ne)?(N[ae]=Se,N[ce]=Z,ae=ce):(N[ae]=ne,N[de]=Z,ae=de);else if(ce<j&&0>c(Se,Z))N[ae]=Se,N[ce]=Z,ae=ce;else break e}}return L}function c(N,L){var Z=N.sortIndex-L.sortIndex;return Z!==0?Z:N.id-L.id}if(n.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var h=performance;n.unstable_now=function(){return h.now()}}else{var d=Date,g=d.now();n.unstable_now=function(){return d.now()-g}}var v=[],p=[],_=1,T=null,C=3,x=!1,E=!1,O=!1,w=typeof setTimeout=="function"?setTimeout:null,U=typeof clearTimeout=="function"?clearTimeout:null,A=typeof setImmediate<"u"?setImmediate:null;function R(N){for(var L=u(p);L!==null;){if(L.callback===null)s(p);else if(L.startTime<=N)s(p),L.sortIndex=L.expirationTime,i(v,L);else break;L=u(p)}}function z(N){if(O=!1,R(N),!E)if(u(v)!==null)E=!0,P();else{var L=u(p);L!==null&&H(z,L.startTime-N)}}var G=!1,B=-1,Q=5,X=-1;function Y(){return!(n.unstable_now()-X<Q)}function V(){if(G){var N=n.unstable_now();X=N;var L=!0;try{e:{E=!1,O&&(O=!1,U(B),B=-1),x=!0;var Z=C;try{t:{for(R(N),T=u(v);T!==null&&!(T.expirationTime>N&&Y());){var ae=T.callback;if(typeof ae=="function"){T.callback=null,C=T.priorityLevel;var j=ae(T.expirationTime<=N);if(N=n.unstable_now(),typeof j=="function"){T.callback=j,R(N),L=!0;break t}T===u(v)&&s(v),R(N)}else s(v);T=u(v)}if(T!==null)L=!0;else{var te=u(p);te!==null&&H(z,te.startTime-N),L=!1}}break e}finally{T=null,C=Z,x=!1}L=void 0}}finally{L?F():G=!1}}}var F;if(typeof A=="function")F=function(){A(V)};else if(typeof MessageChannel<"u"){var I=new MessageChannel,D=I.port2;I.port1.onmessage=V,F=function(){D.postMessage(null)}}else F=function(){w(V,0)};function P(){G||(G=!0,F())}function H(N,L){B=w(function(){N(n.unstable_now())},L)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(N){N.callback=null},n.unstable_continueExecution=function(){E||x||(E=!0,P())},n.unstable_forceFrameRate=function(N){0>N||125<N?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Q=0<N?Math.floor(1e3/N):5},n.unstable_getCurrentPriorityLevel=function(){return C},n.unstable_getFirstCallbackNode=function(){return u(v)},n.unstable_next=function(N){switch(C){case 1:case 2:case 3:var L=3;break;default:L=C}var Z=C;C=L;try{return N()}finally{C=Z}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=function(){},n.unstable_runWithPriority=function(N,L){switch(N){case 1:case 2:case 3:case 4:case 5:break;default:N=3}var Z=C;C=N;try{return L()}finally{C=Z}},n.unstable_scheduleCallback=function(N,L,Z){var ae=n.unstable_now();switch(typeof Z=="object"&&Z!==null?(Z=Z.delay,Z=typeof Z=="number"&&0<Z?ae+Z:ae):Z=ae,N){case 1:var j=-1;break;case 2:j=250;break;case 5:j=1073741823;break;case 4:j=1e4;break;default:j=5e3}return j=Z+j,N={id:_++,callback:L,priorityLevel:N,startTime:Z,expirationTime:j,sortIndex:-1},Z>ae?(N.sortIndex=Z,i(p,N),u(v)===null&&N===u(p)&&(O?(U(B),B=-1):O=!0,H(z,Z-ae))):(N.sortIndex=j,i(v,N),E||x||(E=!0,P())),N},n.unstable_shouldYield=Y,n.unstable_wrapCallback=function(N){var L=C;return function(){var Z=C;C=L;try{return N.apply(this,arguments)}finally{C=Z}}}}(Y2)),Y2}var u_;function dw(){return u_||(u_=1,V2.exports=hw()),V2.exports}/**
- * @license React
- * react-reconciler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var s_;function gw(){return s_||(s_=1,function(n){n.exports=function(i){function u(a,r,f,y){return new Cf(a,r,f,y)}function s(){}function c(a){var r="https://react.dev/errors/"+a;if(1<arguments.length){r+="?args[]="+encodeURIComponent(arguments[1]);for(var f=2;f<arguments.length;f++)r+="&args[]="+encodeURIComponent(arguments[f])}return"Minified React error #"+a+"; visit "+r+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function h(a){return a===null||typeof a!="object"?null:(a=nr&&a[nr]||a["@@iterator"],typeof a=="function"?a:null)}function d(a){if(a==null)return null;if(typeof a=="function")return a.$$typeof===Of?null:a.displayName||a.name||null;if(typeof a=="string")return a;switch(a){case Vr:return"Fragment";case Yn:return"Portal";case Do:return"Profiler";case Os:return"StrictMode";case zo:return"Suspense";case pu:return"SuspenseList"}if(typeof a=="object")switch(a.$$typeof){case ui:return(a.displayName||"Context")+".Provider";case Af:return(a._context.displayName||"Context")+".Consumer";case ws:var r=a.render;return a=a.displayName,a||(a=r.displayName||r.name||"",a=a!==""?"ForwardRef("+a+")":"ForwardRef"),a;case Uo:return r=a.displayName||null,r!==null?r:d(a.type)||"Memo";case Pn:r=a._payload,a=a._init;try{return d(a(r))}catch{}}return null}function g(a){if(Ri===void 0)try{throw Error()}catch(f){var r=f.stack.trim().match(/\n( *(at )?)/);Ri=r&&r[1]||"",ir=-1<f.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<f.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ri+a+ir}function v(a,r){if(!a||_l)return"";_l=!0;var f=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var y={DetermineComponentFrameRoot:function(){try{if(r){var De=function(){throw Error()};if(Object.defineProperty(De.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(De,[])}catch(Ie){var Ue=Ie}Reflect.construct(a,[],De)}else{try{De.call()}catch(Ie){Ue=Ie}a.call(De.prototype)}}else{try{throw Error()}catch(Ie){Ue=Ie}(De=a())&&typeof De.catch=="function"&&De.catch(function(){})}}catch(Ie){if(Ie&&Ue&&typeof Ie.stack=="string")return[Ie.stack,Ue.stack]}return[null,null]}};y.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var S=Object.getOwnPropertyDescriptor(y.DetermineComponentFrameRoot,"name");S&&S.configurable&&Object.defineProperty(y.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var M=y.DetermineComponentFrameRoot(),k=M[0],ee=M[1];if(k&&ee){var se=k.split(`
-`),be=ee.split(`
-`);for(S=y=0;y<se.length&&!se[y].includes("DetermineComponentFrameRoot");)y++;for(;S<be.length&&!be[S].includes("DetermineComponentFrameRoot");)S++;if(y===se.length||S===be.length)for(y=se.length-1,S=be.length-1;1<=y&&0<=S&&se[y]!==be[S];)S--;for(;1<=y&&0<=S;y--,S--)if(se[y]!==be[S]){if(y!==1||S!==1)do if(y--,S--,0>S||se[y]!==be[S]){var Oe=`
-`+se[y].replace(" at new "," at ");return a.displayName&&Oe.includes("<anonymous>")&&(Oe=Oe.replace("<anonymous>",a.displayName)),Oe}while(1<=y&&0<=S);break}}}finally{_l=!1,Error.prepareStackTrace=f}return(f=a?a.displayName||a.name:"")?g(f):""}function p(a){switch(a.tag){case 26:case 27:case 5:return g(a.type);case 16:return g("Lazy");case 13:return g("Suspense");case 19:return g("SuspenseList");case 0:case 15:return a=v(a.type,!1),a;case 11:return a=v(a.type.render,!1),a;case 1:return a=v(a.type,!0),a;default:return""}}function _(a){try{var r="";do r+=p(a),a=a.return;while(a);return r}catch(f){return`
-Error generating stack: `+f.message+`
-`+f.stack}}function T(a){var r=a,f=a;if(a.alternate)for(;r.return;)r=r.return;else{a=r;do r=a,(r.flags&4098)!==0&&(f=r.return),a=r.return;while(a)}return r.tag===3?f:null}function C(a){if(T(a)!==a)throw Error(c(188))}function x(a){var r=a.alternate;if(!r){if(r=T(a),r===null)throw Error(c(188));return r!==a?null:a}for(var f=a,y=r;;){var S=f.return;if(S===null)break;var M=S.alternate;if(M===null){if(y=S.return,y!==null){f=y;continue}break}if(S.child===M.child){for(M=S.child;M;){if(M===f)return C(S),a;if(M===y)return C(S),r;M=M.sibling}throw Error(c(188))}if(f.return!==y.return)f=S,y=M;else{for(var k=!1,ee=S.child;ee;){if(ee===f){k=!0,f=S,y=M;break}if(ee===y){k=!0,y=S,f=M;break}ee=ee.sibling}if(!k){for(ee=M.child;ee;){if(ee===f){k=!0,f=M,y=S;break}if(ee===y){k=!0,y=M,f=S;break}ee=ee.sibling}if(!k)throw Error(c(189))}}if(f.alternate!==y)throw Error(c(190))}if(f.tag!==3)throw Error(c(188));return f.stateNode.current===f?a:r}function E(a){var r=a.tag;if(r===5||r===26||r===27||r===6)return a;for(a=a.child;a!==null;){if(r=E(a),r!==null)return r;a=a.sibling}return null}function O(a){var r=a.tag;if(r===5||r===26||r===27||r===6)return a;for(a=a.child;a!==null;){if(a.tag!==4&&(r=O(a),r!==null))return r;a=a.sibling}return null}function w(a){return{current:a}}function U(a){0>sr||(a.current=da[sr],da[sr]=null,sr--)}function A(a,r){sr++,da[sr]=a.current,a.current=r}function R(a){return a>>>=0,a===0?32:31-(N0(a)/D0|0)|0}function z(a){var r=a&42;if(r!==0)return r;switch(a&-a){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return a&4194176;case 4194304:case 8388608:case 16777216:case 33554432:return a&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return a}}function G(a,r){var f=a.pendingLanes;if(f===0)return 0;var y=0,S=a.suspendedLanes,M=a.pingedLanes,k=a.warmLanes;a=a.finishedLanes!==0;var ee=f&134217727;return ee!==0?(f=ee&~S,f!==0?y=z(f):(M&=ee,M!==0?y=z(M):a||(k=ee&~k,k!==0&&(y=z(k))))):(ee=f&~S,ee!==0?y=z(ee):M!==0?y=z(M):a||(k=f&~k,k!==0&&(y=z(k)))),y===0?0:r!==0&&r!==y&&(r&S)===0&&(S=y&-y,k=r&-r,S>=k||S===32&&(k&4194176)!==0)?r:y}function B(a,r){return(a.pendingLanes&~(a.suspendedLanes&~a.pingedLanes)&r)===0}function Q(a,r){switch(a){case 1:case 2:case 4:case 8:return r+250;case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return r+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function X(){var a=Mi;return Mi<<=1,(Mi&4194176)===0&&(Mi=128),a}function Y(){var a=El;return El<<=1,(El&62914560)===0&&(El=4194304),a}function V(a){for(var r=[],f=0;31>f;f++)r.push(a);return r}function F(a,r){a.pendingLanes|=r,r!==268435456&&(a.suspendedLanes=0,a.pingedLanes=0,a.warmLanes=0)}function I(a,r,f,y,S,M){var k=a.pendingLanes;a.pendingLanes=f,a.suspendedLanes=0,a.pingedLanes=0,a.warmLanes=0,a.expiredLanes&=f,a.entangledLanes&=f,a.errorRecoveryDisabledLanes&=f,a.shellSuspendCounter=0;var ee=a.entanglements,se=a.expirationTimes,be=a.hiddenUpdates;for(f=k&~f;0<f;){var Oe=31-sn(f),De=1<<Oe;ee[Oe]=0,se[Oe]=-1;var Ue=be[Oe];if(Ue!==null)for(be[Oe]=null,Oe=0;Oe<Ue.length;Oe++){var Ie=Ue[Oe];Ie!==null&&(Ie.lane&=-536870913)}f&=~De}y!==0&&D(a,y,0),M!==0&&S===0&&a.tag!==0&&(a.suspendedLanes|=M&~(k&~r))}function D(a,r,f){a.pendingLanes|=r,a.suspendedLanes&=~r;var y=31-sn(r);a.entangledLanes|=r,a.entanglements[y]=a.entanglements[y]|1073741824|f&4194218}function P(a,r){var f=a.entangledLanes|=r;for(a=a.entanglements;f;){var y=31-sn(f),S=1<<y;S&r|a[y]&r&&(a[y]|=r),f&=~S}}function H(a){return a&=-a,2<a?8<a?(a&134217727)!==0?32:268435456:8:2}function N(a){if(bn&&typeof bn.onCommitFiberRoot=="function")try{bn.onCommitFiberRoot(ga,a,void 0,(a.current.flags&128)===128)}catch{}}function L(a){if(typeof G0=="function"&&Ga(a),bn&&typeof bn.setStrictMode=="function")try{bn.setStrictMode(ga,a)}catch{}}function Z(a,r){return a===r&&(a!==0||1/a===1/r)||a!==a&&r!==r}function ae(a,r){if(typeof a=="object"&&a!==null){var f=kf.get(a);return f!==void 0?f:(r={value:a,source:r,stack:_(r)},kf.set(a,r),r)}return{value:a,source:r,stack:_(r)}}function j(a,r){Cl[Tl++]=Cu,Cl[Tl++]=Al,Al=a,Cu=r}function te(a,r,f){Rn[On++]=ci,Rn[On++]=fi,Rn[On++]=Qr,Qr=a;var y=ci;a=fi;var S=32-sn(y)-1;y&=~(1<<S),f+=1;var M=32-sn(r)+S;if(30<M){var k=S-S%5;M=(y&(1<<k)-1).toString(32),y>>=k,S-=k,ci=1<<32-sn(r)+S|f<<S|y,fi=M+a}else ci=1<<M|f<<S|y,fi=a}function de(a){a.return!==null&&(j(a,1),te(a,1,0))}function ne(a){for(;a===Al;)Al=Cl[--Tl],Cl[Tl]=null,Cu=Cl[--Tl],Cl[Tl]=null;for(;a===Qr;)Qr=Rn[--On],Rn[On]=null,fi=Rn[--On],Rn[On]=null,ci=Rn[--On],Rn[On]=null}function ce(a,r){A(wi,r),A(Tu,a),A(Ra,null),a=Jd(r),U(Ra),A(Ra,a)}function Se(){U(Ra),U(Tu),U(wi)}function xe(a){a.memoizedState!==null&&A(Rl,a);var r=Ra.current,f=bu(r,a.type);r!==f&&(A(Tu,a),A(Ra,f))}function $(a){Tu.current===a&&(U(Ra),U(Tu)),Rl.current===a&&(U(Rl),ln?si._currentValue=Pr:si._currentValue2=Pr)}function oe(a){var r=Error(c(418,""));throw $e(ae(r,a)),Ls}function Te(a,r){if(!Xa)throw Error(c(175));S0(a.stateNode,a.type,a.memoizedProps,r,a)||oe(a)}function Re(a){for(Ka=a.return;Ka;)switch(Ka.tag){case 3:case 27:qa=!0;return;case 5:case 13:qa=!1;return;default:Ka=Ka.return}}function Me(a){if(!Xa||a!==Ka)return!1;if(!bt)return Re(a),bt=!0,!1;var r=!1;if(Ht?a.tag!==3&&a.tag!==27&&(a.tag!==5||Po(a.type)&&!at(a.type,a.memoizedProps))&&(r=!0):a.tag!==3&&(a.tag!==5||Po(a.type)&&!at(a.type,a.memoizedProps))&&(r=!0),r&&Fa&&oe(a),Re(a),a.tag===13){if(!Xa)throw Error(c(316));if(a=a.memoizedState,a=a!==null?a.dehydrated:null,!a)throw Error(c(317));Fa=E0(a)}else Fa=Ka?Pf(a.stateNode):null;return!0}function Ge(){Xa&&(Fa=Ka=null,bt=!1)}function $e(a){Fn===null?Fn=[a]:Fn.push(a)}function et(){for(var a=Ol,r=hi=Ol=0;r<a;){var f=kn[r];kn[r++]=null;var y=kn[r];kn[r++]=null;var S=kn[r];kn[r++]=null;var M=kn[r];if(kn[r++]=null,y!==null&&S!==null){var k=y.pending;k===null?S.next=S:(S.next=k.next,k.next=S),y.pending=S}M!==0&&ft(f,S,M)}}function ze(a,r,f,y){kn[Ol++]=a,kn[Ol++]=r,kn[Ol++]=f,kn[Ol++]=y,hi|=y,a.lanes|=y,a=a.alternate,a!==null&&(a.lanes|=y)}function At(a,r,f,y){return ze(a,r,f,y),na(a)}function we(a,r){return ze(a,null,null,r),na(a)}function ft(a,r,f){a.lanes|=f;var y=a.alternate;y!==null&&(y.lanes|=f);for(var S=!1,M=a.return;M!==null;)M.childLanes|=f,y=M.alternate,y!==null&&(y.childLanes|=f),M.tag===22&&(a=M.stateNode,a===null||a._visibility&1||(S=!0)),a=M,M=M.return;S&&r!==null&&a.tag===3&&(M=a.stateNode,S=31-sn(f),M=M.hiddenUpdates,a=M[S],a===null?M[S]=[r]:a.push(r),r.lane=f|536870912)}function na(a){if(50<Uu)throw Uu=0,ic=null,Error(c(185));for(var r=a.return;r!==null;)a=r,r=a.return;return a.tag===3?a.stateNode:null}function Rt(a){a!==or&&a.next===null&&(or===null?js=or=a:or=or.next=a),Yt=!0,Ml||(Ml=!0,Zt(ht))}function Vt(a,r){if(!Qf&&Yt){Qf=!0;do for(var f=!1,y=js;y!==null;){if(a!==0){var S=y.pendingLanes;if(S===0)var M=0;else{var k=y.suspendedLanes,ee=y.pingedLanes;M=(1<<31-sn(42|a)+1)-1,M&=S&~(k&~ee),M=M&201326677?M&201326677|1:M?M|2:0}M!==0&&(f=!0,Ca(y,M))}else M=dt,M=G(y,y===wt?M:0),(M&3)===0||B(y,M)||(f=!0,Ca(y,M));y=y.next}while(f);Qf=!1}}function ht(){Yt=Ml=!1;var a=0;Au!==0&&(e0()&&(a=Au),Au=0);for(var r=Kn(),f=null,y=js;y!==null;){var S=y.next,M=lt(y,r);M===0?(y.next=null,f===null?js=S:f.next=S,S===null&&(or=f)):(f=y,(a!==0||(M&3)!==0)&&(Yt=!0)),y=S}Vt(a)}function lt(a,r){for(var f=a.suspendedLanes,y=a.pingedLanes,S=a.expirationTimes,M=a.pendingLanes&-62914561;0<M;){var k=31-sn(M),ee=1<<k,se=S[k];se===-1?((ee&f)===0||(ee&y)!==0)&&(S[k]=Q(ee,r)):se<=r&&(a.expiredLanes|=ee),M&=~ee}if(r=wt,f=dt,f=G(a,a===r?f:0),y=a.callbackNode,f===0||a===r&&qt===2||a.cancelPendingCommit!==null)return y!==null&&y!==null&&ko(y),a.callbackNode=null,a.callbackPriority=0;if((f&3)===0||B(a,f)){if(r=f&-f,r===a.callbackPriority)return r;switch(y!==null&&ko(y),H(f)){case 2:case 8:f=U0;break;case 32:f=Jo;break;case 268435456:f=J1;break;default:f=Jo}return y=ma.bind(null,a),f=Bs(f,y),a.callbackPriority=r,a.callbackNode=f,r}return y!==null&&y!==null&&ko(y),a.callbackPriority=2,a.callbackNode=null,2}function ma(a,r){var f=a.callbackNode;if(li()&&a.callbackNode!==f)return null;var y=dt;return y=G(a,a===wt?y:0),y===0?null:(qr(a,y,r),lt(a,Kn()),a.callbackNode!=null&&a.callbackNode===f?ma.bind(null,a):null)}function Ca(a,r){if(li())return null;qr(a,r,!0)}function Zt(a){zf?ur(function(){(xt&6)!==0?Bs(Zo,a):a()}):Bs(Zo,a)}function Dt(){return Au===0&&(Au=X()),Au}function Fe(a,r){if(Ru===null){var f=Ru=[];wl=0,Mn=Dt(),Nl={status:"pending",value:void 0,then:function(y){f.push(y)}}}return wl++,r.then(zt,zt),r}function zt(){if(--wl===0&&Ru!==null){Nl!==null&&(Nl.status="fulfilled");var a=Ru;Ru=null,Mn=0,Nl=null;for(var r=0;r<a.length;r++)(0,a[r])()}}function tn(a,r){var f=[],y={status:"pending",value:null,reason:null,then:function(S){f.push(S)}};return a.then(function(){y.status="fulfilled",y.value=r;for(var S=0;S<f.length;S++)(0,f[S])(r)},function(S){for(y.status="rejected",y.reason=S,S=0;S<f.length;S++)(0,f[S])(void 0)}),y}function ka(a){a.updateQueue={baseState:a.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function ya(a,r){a=a.updateQueue,r.updateQueue===a&&(r.updateQueue={baseState:a.baseState,firstBaseUpdate:a.firstBaseUpdate,lastBaseUpdate:a.lastBaseUpdate,shared:a.shared,callbacks:null})}function mt(a){return{lane:a,tag:0,payload:null,callback:null,next:null}}function yt(a,r,f){var y=a.updateQueue;if(y===null)return null;if(y=y.shared,(xt&2)!==0){var S=y.pending;return S===null?r.next=r:(r.next=S.next,S.next=r),y.pending=r,r=na(a),ft(a,null,f),r}return ze(a,y,r,f),na(a)}function He(a,r,f){if(r=r.updateQueue,r!==null&&(r=r.shared,(f&4194176)!==0)){var y=r.lanes;y&=a.pendingLanes,f|=y,r.lanes=f,P(a,f)}}function Gt(a,r){var f=a.updateQueue,y=a.alternate;if(y!==null&&(y=y.updateQueue,f===y)){var S=null,M=null;if(f=f.firstBaseUpdate,f!==null){do{var k={lane:f.lane,tag:f.tag,payload:f.payload,callback:null,next:null};M===null?S=M=k:M=M.next=k,f=f.next}while(f!==null);M===null?S=M=r:M=M.next=r}else S=M=r;f={baseState:y.baseState,firstBaseUpdate:S,lastBaseUpdate:M,shared:y.shared,callbacks:y.callbacks},a.updateQueue=f;return}a=f.lastBaseUpdate,a===null?f.firstBaseUpdate=r:a.next=r,f.lastBaseUpdate=r}function It(){if(Dl){var a=Nl;if(a!==null)throw a}}function Na(a,r,f,y){Dl=!1;var S=a.updateQueue;cr=!1;var M=S.firstBaseUpdate,k=S.lastBaseUpdate,ee=S.shared.pending;if(ee!==null){S.shared.pending=null;var se=ee,be=se.next;se.next=null,k===null?M=be:k.next=be,k=se;var Oe=a.alternate;Oe!==null&&(Oe=Oe.updateQueue,ee=Oe.lastBaseUpdate,ee!==k&&(ee===null?Oe.firstBaseUpdate=be:ee.next=be,Oe.lastBaseUpdate=se))}if(M!==null){var De=S.baseState;k=0,Oe=be=se=null,ee=M;do{var Ue=ee.lane&-536870913,Ie=Ue!==ee.lane;if(Ie?(dt&Ue)===Ue:(y&Ue)===Ue){Ue!==0&&Ue===Mn&&(Dl=!0),Oe!==null&&(Oe=Oe.next={lane:0,tag:ee.tag,payload:ee.payload,callback:null,next:null});e:{var Hn=a,nl=ee;Ue=r;var il=f;switch(nl.tag){case 1:if(Hn=nl.payload,typeof Hn=="function"){De=Hn.call(il,De,Ue);break e}De=Hn;break e;case 3:Hn.flags=Hn.flags&-65537|128;case 0:if(Hn=nl.payload,Ue=typeof Hn=="function"?Hn.call(il,De,Ue):Hn,Ue==null)break e;De=No({},De,Ue);break e;case 2:cr=!0}}Ue=ee.callback,Ue!==null&&(a.flags|=64,Ie&&(a.flags|=8192),Ie=S.callbacks,Ie===null?S.callbacks=[Ue]:Ie.push(Ue))}else Ie={lane:Ue,tag:ee.tag,payload:ee.payload,callback:ee.callback,next:null},Oe===null?(be=Oe=Ie,se=De):Oe=Oe.next=Ie,k|=Ue;if(ee=ee.next,ee===null){if(ee=S.shared.pending,ee===null)break;Ie=ee,ee=Ie.next,Ie.next=null,S.lastBaseUpdate=Ie,S.shared.pending=null}}while(!0);Oe===null&&(se=De),S.baseState=se,S.firstBaseUpdate=be,S.lastBaseUpdate=Oe,M===null&&(S.shared.lanes=0),Gn|=k,a.lanes=k,a.memoizedState=De}}function oa(a,r){if(typeof a!="function")throw Error(c(191,a));a.call(r)}function br(a,r){var f=a.callbacks;if(f!==null)for(a.callbacks=null,a=0;a<f.length;a++)oa(f[a],r)}function Yi(a,r){if(_n(a,r))return!0;if(typeof a!="object"||a===null||typeof r!="object"||r===null)return!1;var f=Object.keys(a),y=Object.keys(r);if(f.length!==y.length)return!1;for(y=0;y<f.length;y++){var S=f[y];if(!Ni.call(r,S)||!_n(a[S],r[S]))return!1}return!0}function Jt(a){return a=a.status,a==="fulfilled"||a==="rejected"}function ca(){}function it(a,r,f){switch(f=a[f],f===void 0?a.push(r):f!==r&&(r.then(ca,ca),r=f),r.status){case"fulfilled":return r.value;case"rejected":throw a=r.reason,a===Ou?Error(c(483)):a;default:if(typeof r.status=="string")r.then(ca,ca);else{if(a=wt,a!==null&&100<a.shellSuspendCounter)throw Error(c(482));a=r,a.status="pending",a.then(function(y){if(r.status==="pending"){var S=r;S.status="fulfilled",S.value=y}},function(y){if(r.status==="pending"){var S=r;S.status="rejected",S.reason=y}})}switch(r.status){case"fulfilled":return r.value;case"rejected":throw a=r.reason,a===Ou?Error(c(483)):a}throw Zr=r,Ou}}function Zu(){if(Zr===null)throw Error(c(459));var a=Zr;return Zr=null,a}function _r(a){var r=Wr;return Wr+=1,Jr===null&&(Jr=[]),it(Jr,a,r)}function fl(a,r){r=r.props.ref,a.ref=r!==void 0?r:null}function Ju(a,r){throw r.$$typeof===P1?Error(c(525)):(a=Object.prototype.toString.call(r),Error(c(31,a==="[object Object]"?"object with keys {"+Object.keys(r).join(", ")+"}":a)))}function xd(a){var r=a._init;return r(a._payload)}function Pi(a){function r(pe,ie){if(a){var ye=pe.deletions;ye===null?(pe.deletions=[ie],pe.flags|=16):ye.push(ie)}}function f(pe,ie){if(!a)return null;for(;ie!==null;)r(pe,ie),ie=ie.sibling;return null}function y(pe){for(var ie=new Map;pe!==null;)pe.key!==null?ie.set(pe.key,pe):ie.set(pe.index,pe),pe=pe.sibling;return ie}function S(pe,ie){return pe=Vn(pe,ie),pe.index=0,pe.sibling=null,pe}function M(pe,ie,ye){return pe.index=ye,a?(ye=pe.alternate,ye!==null?(ye=ye.index,ye<ie?(pe.flags|=33554434,ie):ye):(pe.flags|=33554434,ie)):(pe.flags|=1048576,ie)}function k(pe){return a&&pe.alternate===null&&(pe.flags|=33554434),pe}function ee(pe,ie,ye,Ae){return ie===null||ie.tag!==6?(ie=Mo(ye,pe.mode,Ae),ie.return=pe,ie):(ie=S(ie,ye),ie.return=pe,ie)}function se(pe,ie,ye,Ae){var Le=ye.type;return Le===Vr?Oe(pe,ie,ye.props.children,Ae,ye.key):ie!==null&&(ie.elementType===Le||typeof Le=="object"&&Le!==null&&Le.$$typeof===Pn&&xd(Le)===ie.type)?(ie=S(ie,ye.props),fl(ie,ye),ie.return=pe,ie):(ie=Ai(ye.type,ye.key,ye.props,null,pe.mode,Ae),fl(ie,ye),ie.return=pe,ie)}function be(pe,ie,ye,Ae){return ie===null||ie.tag!==4||ie.stateNode.containerInfo!==ye.containerInfo||ie.stateNode.implementation!==ye.implementation?(ie=Tf(ye,pe.mode,Ae),ie.return=pe,ie):(ie=S(ie,ye.children||[]),ie.return=pe,ie)}function Oe(pe,ie,ye,Ae,Le){return ie===null||ie.tag!==7?(ie=ia(ye,pe.mode,Ae,Le),ie.return=pe,ie):(ie=S(ie,ye),ie.return=pe,ie)}function De(pe,ie,ye){if(typeof ie=="string"&&ie!==""||typeof ie=="number"||typeof ie=="bigint")return ie=Mo(""+ie,pe.mode,ye),ie.return=pe,ie;if(typeof ie=="object"&&ie!==null){switch(ie.$$typeof){case Rs:return ye=Ai(ie.type,ie.key,ie.props,null,pe.mode,ye),fl(ye,ie),ye.return=pe,ye;case Yn:return ie=Tf(ie,pe.mode,ye),ie.return=pe,ie;case Pn:var Ae=ie._init;return ie=Ae(ie._payload),De(pe,ie,ye)}if(vu(ie)||h(ie))return ie=ia(ie,pe.mode,ye,null),ie.return=pe,ie;if(typeof ie.then=="function")return De(pe,_r(ie),ye);if(ie.$$typeof===ui)return De(pe,hs(pe,ie),ye);Ju(pe,ie)}return null}function Ue(pe,ie,ye,Ae){var Le=ie!==null?ie.key:null;if(typeof ye=="string"&&ye!==""||typeof ye=="number"||typeof ye=="bigint")return Le!==null?null:ee(pe,ie,""+ye,Ae);if(typeof ye=="object"&&ye!==null){switch(ye.$$typeof){case Rs:return ye.key===Le?se(pe,ie,ye,Ae):null;case Yn:return ye.key===Le?be(pe,ie,ye,Ae):null;case Pn:return Le=ye._init,ye=Le(ye._payload),Ue(pe,ie,ye,Ae)}if(vu(ye)||h(ye))return Le!==null?null:Oe(pe,ie,ye,Ae,null);if(typeof ye.then=="function")return Ue(pe,ie,_r(ye),Ae);if(ye.$$typeof===ui)return Ue(pe,ie,hs(pe,ye),Ae);Ju(pe,ye)}return null}function Ie(pe,ie,ye,Ae,Le){if(typeof Ae=="string"&&Ae!==""||typeof Ae=="number"||typeof Ae=="bigint")return pe=pe.get(ye)||null,ee(ie,pe,""+Ae,Le);if(typeof Ae=="object"&&Ae!==null){switch(Ae.$$typeof){case Rs:return pe=pe.get(Ae.key===null?ye:Ae.key)||null,se(ie,pe,Ae,Le);case Yn:return pe=pe.get(Ae.key===null?ye:Ae.key)||null,be(ie,pe,Ae,Le);case Pn:var Qt=Ae._init;return Ae=Qt(Ae._payload),Ie(pe,ie,ye,Ae,Le)}if(vu(Ae)||h(Ae))return pe=pe.get(ye)||null,Oe(ie,pe,Ae,Le,null);if(typeof Ae.then=="function")return Ie(pe,ie,ye,_r(Ae),Le);if(Ae.$$typeof===ui)return Ie(pe,ie,ye,hs(ie,Ae),Le);Ju(ie,Ae)}return null}function Hn(pe,ie,ye,Ae){for(var Le=null,Qt=null,Qe=ie,Tt=ie=0,pa=null;Qe!==null&&Tt<ye.length;Tt++){Qe.index>Tt?(pa=Qe,Qe=null):pa=Qe.sibling;var ot=Ue(pe,Qe,ye[Tt],Ae);if(ot===null){Qe===null&&(Qe=pa);break}a&&Qe&&ot.alternate===null&&r(pe,Qe),ie=M(ot,ie,Tt),Qt===null?Le=ot:Qt.sibling=ot,Qt=ot,Qe=pa}if(Tt===ye.length)return f(pe,Qe),bt&&j(pe,Tt),Le;if(Qe===null){for(;Tt<ye.length;Tt++)Qe=De(pe,ye[Tt],Ae),Qe!==null&&(ie=M(Qe,ie,Tt),Qt===null?Le=Qe:Qt.sibling=Qe,Qt=Qe);return bt&&j(pe,Tt),Le}for(Qe=y(Qe);Tt<ye.length;Tt++)pa=Ie(Qe,pe,Tt,ye[Tt],Ae),pa!==null&&(a&&pa.alternate!==null&&Qe.delete(pa.key===null?Tt:pa.key),ie=M(pa,ie,Tt),Qt===null?Le=pa:Qt.sibling=pa,Qt=pa);return a&&Qe.forEach(function(Li){return r(pe,Li)}),bt&&j(pe,Tt),Le}function nl(pe,ie,ye,Ae){if(ye==null)throw Error(c(151));for(var Le=null,Qt=null,Qe=ie,Tt=ie=0,pa=null,ot=ye.next();Qe!==null&&!ot.done;Tt++,ot=ye.next()){Qe.index>Tt?(pa=Qe,Qe=null):pa=Qe.sibling;var Li=Ue(pe,Qe,ot.value,Ae);if(Li===null){Qe===null&&(Qe=pa);break}a&&Qe&&Li.alternate===null&&r(pe,Qe),ie=M(Li,ie,Tt),Qt===null?Le=Li:Qt.sibling=Li,Qt=Li,Qe=pa}if(ot.done)return f(pe,Qe),bt&&j(pe,Tt),Le;if(Qe===null){for(;!ot.done;Tt++,ot=ye.next())ot=De(pe,ot.value,Ae),ot!==null&&(ie=M(ot,ie,Tt),Qt===null?Le=ot:Qt.sibling=ot,Qt=ot);return bt&&j(pe,Tt),Le}for(Qe=y(Qe);!ot.done;Tt++,ot=ye.next())ot=Ie(Qe,pe,Tt,ot.value,Ae),ot!==null&&(a&&ot.alternate!==null&&Qe.delete(ot.key===null?Tt:ot.key),ie=M(ot,ie,Tt),Qt===null?Le=ot:Qt.sibling=ot,Qt=ot);return a&&Qe.forEach(function(rc){return r(pe,rc)}),bt&&j(pe,Tt),Le}function il(pe,ie,ye,Ae){if(typeof ye=="object"&&ye!==null&&ye.type===Vr&&ye.key===null&&(ye=ye.props.children),typeof ye=="object"&&ye!==null){switch(ye.$$typeof){case Rs:e:{for(var Le=ye.key;ie!==null;){if(ie.key===Le){if(Le=ye.type,Le===Vr){if(ie.tag===7){f(pe,ie.sibling),Ae=S(ie,ye.props.children),Ae.return=pe,pe=Ae;break e}}else if(ie.elementType===Le||typeof Le=="object"&&Le!==null&&Le.$$typeof===Pn&&xd(Le)===ie.type){f(pe,ie.sibling),Ae=S(ie,ye.props),fl(Ae,ye),Ae.return=pe,pe=Ae;break e}f(pe,ie);break}else r(pe,ie);ie=ie.sibling}ye.type===Vr?(Ae=ia(ye.props.children,pe.mode,Ae,ye.key),Ae.return=pe,pe=Ae):(Ae=Ai(ye.type,ye.key,ye.props,null,pe.mode,Ae),fl(Ae,ye),Ae.return=pe,pe=Ae)}return k(pe);case Yn:e:{for(Le=ye.key;ie!==null;){if(ie.key===Le)if(ie.tag===4&&ie.stateNode.containerInfo===ye.containerInfo&&ie.stateNode.implementation===ye.implementation){f(pe,ie.sibling),Ae=S(ie,ye.children||[]),Ae.return=pe,pe=Ae;break e}else{f(pe,ie);break}else r(pe,ie);ie=ie.sibling}Ae=Tf(ye,pe.mode,Ae),Ae.return=pe,pe=Ae}return k(pe);case Pn:return Le=ye._init,ye=Le(ye._payload),il(pe,ie,ye,Ae)}if(vu(ye))return Hn(pe,ie,ye,Ae);if(h(ye)){if(Le=h(ye),typeof Le!="function")throw Error(c(150));return ye=Le.call(ye),nl(pe,ie,ye,Ae)}if(typeof ye.then=="function")return il(pe,ie,_r(ye),Ae);if(ye.$$typeof===ui)return il(pe,ie,hs(pe,ye),Ae);Ju(pe,ye)}return typeof ye=="string"&&ye!==""||typeof ye=="number"||typeof ye=="bigint"?(ye=""+ye,ie!==null&&ie.tag===6?(f(pe,ie.sibling),Ae=S(ie,ye),Ae.return=pe,pe=Ae):(f(pe,ie),Ae=Mo(ye,pe.mode,Ae),Ae.return=pe,pe=Ae),k(pe)):f(pe,ie)}return function(pe,ie,ye,Ae){try{Wr=0;var Le=il(pe,ie,ye,Ae);return Jr=null,Le}catch(Qe){if(Qe===Ou)throw Qe;var Qt=u(29,Qe,null,pe.mode);return Qt.lanes=Ae,Qt.return=pe,Qt}finally{}}}function Ba(a,r){a=Ia,A(Mu,a),A(Pt,r),Ia=a|r.baseLanes}function Qa(){A(Mu,Ia),A(Pt,Pt.current)}function Sr(){Ia=Mu.current,U(Pt),U(Mu)}function Si(a){var r=a.alternate;A(Oa,Oa.current&1),A(wn,a),Bt===null&&(r===null||Pt.current!==null||r.memoizedState!==null)&&(Bt=a)}function Ed(a){if(a.tag===22){if(A(Oa,Oa.current),A(wn,a),Bt===null){var r=a.alternate;r!==null&&r.memoizedState!==null&&(Bt=a)}}else xr()}function xr(){A(Oa,Oa.current),A(wn,wn.current)}function xi(a){U(wn),Bt===a&&(Bt=null),U(Oa)}function Er(a){for(var r=a;r!==null;){if(r.tag===13){var f=r.memoizedState;if(f!==null&&(f=f.dehydrated,f===null||jo(f)||Vo(f)))return r}else if(r.tag===19&&r.memoizedProps.revealOrder!==void 0){if((r.flags&128)!==0)return r}else if(r.child!==null){r.child.return=r,r=r.child;continue}if(r===a)break;for(;r.sibling===null;){if(r.return===null||r.return===a)return null;r=r.return}r.sibling.return=r.return,r=r.sibling}return null}function $t(){throw Error(c(321))}function Cr(a,r){if(r===null)return!1;for(var f=0;f<r.length&&f<a.length;f++)if(!_n(a[f],r[f]))return!1;return!0}function Tr(a,r,f,y,S,M){return fr=M,rt=r,r.memoizedState=null,r.updateQueue=null,r.lanes=0,ke.H=a===null||a.memoizedState===null?el:on,$r=!1,M=f(y,S),$r=!1,zl&&(M=hl(r,f,y,S)),Ql(a),M}function Ql(a){ke.H=ra;var r=Ye!==null&&Ye.next!==null;if(fr=0,St=Ye=rt=null,Qn=!1,Ul=0,Ha=null,r)throw Error(c(300));a===null||Lt||(a=a.dependencies,a!==null&&fs(a)&&(Lt=!0))}function hl(a,r,f,y){rt=a;var S=0;do{if(zl&&(Ha=null),Ul=0,zl=!1,25<=S)throw Error(c(301));if(S+=1,St=Ye=null,a.updateQueue!=null){var M=a.updateQueue;M.lastEffect=null,M.events=null,M.stores=null,M.memoCache!=null&&(M.memoCache.index=0)}ke.H=Nn,M=r(f,y)}while(zl);return M}function Da(){var a=ke.H,r=a.useState()[0];return r=typeof r.then=="function"?Zl(r):r,a=a.useState()[0],(Ye!==null?Ye.memoizedState:null)!==a&&(rt.flags|=1024),r}function ao(){var a=Wo!==0;return Wo=0,a}function no(a,r,f){r.updateQueue=a.updateQueue,r.flags&=-2053,a.lanes&=~f}function Xi(a){if(Qn){for(a=a.memoizedState;a!==null;){var r=a.queue;r!==null&&(r.pending=null),a=a.next}Qn=!1}fr=0,St=Ye=rt=null,zl=!1,Ul=Wo=0,Ha=null}function Ta(){var a={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return St===null?rt.memoizedState=St=a:St=St.next=a,St}function ba(){if(Ye===null){var a=rt.alternate;a=a!==null?a.memoizedState:null}else a=Ye.next;var r=St===null?rt.memoizedState:St.next;if(r!==null)St=r,Ye=a;else{if(a===null)throw rt.alternate===null?Error(c(467)):Error(c(310));Ye=a,a={memoizedState:Ye.memoizedState,baseState:Ye.baseState,baseQueue:Ye.baseQueue,queue:Ye.queue,next:null},St===null?rt.memoizedState=St=a:St=St.next=a}return St}function Zl(a){var r=Ul;return Ul+=1,Ha===null&&(Ha=[]),a=it(Ha,a,r),r=rt,(St===null?r.memoizedState:St.next)===null&&(r=r.alternate,ke.H=r===null||r.memoizedState===null?el:on),a}function Wu(a){if(a!==null&&typeof a=="object"){if(typeof a.then=="function")return Zl(a);if(a.$$typeof===ui)return ja(a)}throw Error(c(438,String(a)))}function Vc(a){var r=null,f=rt.updateQueue;if(f!==null&&(r=f.memoCache),r==null){var y=rt.alternate;y!==null&&(y=y.updateQueue,y!==null&&(y=y.memoCache,y!=null&&(r={data:y.data.map(function(S){return S.slice()}),index:0})))}if(r==null&&(r={data:[],index:0}),f===null&&(f=Io(),rt.updateQueue=f),f.memoCache=r,f=r.data[r.index],f===void 0)for(f=r.data[r.index]=Array(a),y=0;y<a;y++)f[y]=Zd;return r.index++,f}function Bn(a,r){return typeof r=="function"?r(a):r}function dl(a){var r=ba();return ni(r,Ye,a)}function ni(a,r,f){var y=a.queue;if(y===null)throw Error(c(311));y.lastRenderedReducer=f;var S=a.baseQueue,M=y.pending;if(M!==null){if(S!==null){var k=S.next;S.next=M.next,M.next=k}r.baseQueue=S=M,y.pending=null}if(M=a.baseState,S===null)a.memoizedState=M;else{r=S.next;var ee=k=null,se=null,be=r,Oe=!1;do{var De=be.lane&-536870913;if(De!==be.lane?(dt&De)===De:(fr&De)===De){var Ue=be.revertLane;if(Ue===0)se!==null&&(se=se.next={lane:0,revertLane:0,action:be.action,hasEagerState:be.hasEagerState,eagerState:be.eagerState,next:null}),De===Mn&&(Oe=!0);else if((fr&Ue)===Ue){be=be.next,Ue===Mn&&(Oe=!0);continue}else De={lane:0,revertLane:be.revertLane,action:be.action,hasEagerState:be.hasEagerState,eagerState:be.eagerState,next:null},se===null?(ee=se=De,k=M):se=se.next=De,rt.lanes|=Ue,Gn|=Ue;De=be.action,$r&&f(M,De),M=be.hasEagerState?be.eagerState:f(M,De)}else Ue={lane:De,revertLane:be.revertLane,action:be.action,hasEagerState:be.hasEagerState,eagerState:be.eagerState,next:null},se===null?(ee=se=Ue,k=M):se=se.next=Ue,rt.lanes|=De,Gn|=De;be=be.next}while(be!==null&&be!==r);if(se===null?k=M:se.next=ee,!_n(M,a.memoizedState)&&(Lt=!0,Oe&&(f=Nl,f!==null)))throw f;a.memoizedState=M,a.baseState=k,a.baseQueue=se,y.lastRenderedState=M}return S===null&&(y.lanes=0),[a.memoizedState,y.dispatch]}function Iu(a){var r=ba(),f=r.queue;if(f===null)throw Error(c(311));f.lastRenderedReducer=a;var y=f.dispatch,S=f.pending,M=r.memoizedState;if(S!==null){f.pending=null;var k=S=S.next;do M=a(M,k.action),k=k.next;while(k!==S);_n(M,r.memoizedState)||(Lt=!0),r.memoizedState=M,r.baseQueue===null&&(r.baseState=M),f.lastRenderedState=M}return[M,y]}function Yc(a,r,f){var y=rt,S=ba(),M=bt;if(M){if(f===void 0)throw Error(c(407));f=f()}else f=r();var k=!_n((Ye||S).memoizedState,f);if(k&&(S.memoizedState=f,Lt=!0),S=S.queue,Zc(ro.bind(null,y,S,a),[a]),S.getSnapshot!==r||k||St!==null&&St.memoizedState.tag&1){if(y.flags|=2048,ii(9,io.bind(null,y,S,f,r),{destroy:void 0},null),wt===null)throw Error(c(349));M||(fr&60)!==0||gl(y,r,f)}return f}function gl(a,r,f){a.flags|=16384,a={getSnapshot:r,value:f},r=rt.updateQueue,r===null?(r=Io(),rt.updateQueue=r,r.stores=[a]):(f=r.stores,f===null?r.stores=[a]:f.push(a))}function io(a,r,f,y){r.value=f,r.getSnapshot=y,Cd(r)&&Pc(a)}function ro(a,r,f){return f(function(){Cd(r)&&Pc(a)})}function Cd(a){var r=a.getSnapshot;a=a.value;try{var f=r();return!_n(a,f)}catch{return!0}}function Pc(a){var r=we(a,2);r!==null&&Ua(r,a,2)}function hn(a){var r=Ta();if(typeof a=="function"){var f=a;if(a=f(),$r){L(!0);try{f()}finally{L(!1)}}}return r.memoizedState=r.baseState=a,r.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Bn,lastRenderedState:a},r}function Xc(a,r,f,y){return a.baseState=f,ni(a,Ye,typeof y=="function"?y:Bn)}function B1(a,r,f,y,S){if(ls(a))throw Error(c(485));if(a=r.action,a!==null){var M={payload:S,action:a,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(k){M.listeners.push(k)}};ke.T!==null?f(!0):M.isTransition=!1,y(M),f=r.pending,f===null?(M.next=r.pending=M,$u(r,M)):(M.next=f.next,r.pending=f.next=M)}}function $u(a,r){var f=r.action,y=r.payload,S=a.state;if(r.isTransition){var M=ke.T,k={};ke.T=k;try{var ee=f(S,y),se=ke.S;se!==null&&se(k,ee),Kc(a,r,ee)}catch(be){Fc(a,r,be)}finally{ke.T=M}}else try{M=f(S,y),Kc(a,r,M)}catch(be){Fc(a,r,be)}}function Kc(a,r,f){f!==null&&typeof f=="object"&&typeof f.then=="function"?f.then(function(y){es(a,r,y)},function(y){return Fc(a,r,y)}):es(a,r,f)}function es(a,r,f){r.status="fulfilled",r.value=f,xn(r),a.state=f,r=a.pending,r!==null&&(f=r.next,f===r?a.pending=null:(f=f.next,r.next=f,$u(a,f)))}function Fc(a,r,f){var y=a.pending;if(a.pending=null,y!==null){y=y.next;do r.status="rejected",r.reason=f,xn(r),r=r.next;while(r!==y)}a.action=null}function xn(a){a=a.listeners;for(var r=0;r<a.length;r++)(0,a[r])()}function lo(a,r){return r}function kc(a,r){if(bt){var f=wt.formState;if(f!==null){e:{var y=rt;if(bt){if(Fa){var S=Yf(Fa,qa);if(S){Fa=Pf(S),y=m0(S);break e}}oe(y)}y=!1}y&&(r=f[0])}}f=Ta(),f.memoizedState=f.baseState=r,y={pending:null,lanes:0,dispatch:null,lastRenderedReducer:lo,lastRenderedState:r},f.queue=y,f=$c.bind(null,rt,y),y.dispatch=f,y=hn(!1);var M=Il.bind(null,rt,!1,y.queue);return y=Ta(),S={state:r,dispatch:null,action:a,pending:null},y.queue=S,f=B1.bind(null,rt,S,M,f),S.dispatch=f,y.memoizedState=a,[r,f,!1]}function uo(a){var r=ba();return pl(r,Ye,a)}function pl(a,r,f){r=ni(a,r,lo)[0],a=dl(Bn)[0],r=typeof r=="object"&&r!==null&&typeof r.then=="function"?Zl(r):r;var y=ba(),S=y.queue,M=S.dispatch;return f!==y.memoizedState&&(rt.flags|=2048,ii(9,Td.bind(null,S,f),{destroy:void 0},null)),[r,M,a]}function Td(a,r){a.action=r}function Qc(a){var r=ba(),f=Ye;if(f!==null)return pl(r,f,a);ba(),r=r.memoizedState,f=ba();var y=f.queue.dispatch;return f.memoizedState=a,[r,y,!1]}function ii(a,r,f,y){return a={tag:a,create:r,inst:f,deps:y,next:null},r=rt.updateQueue,r===null&&(r=Io(),rt.updateQueue=r),f=r.lastEffect,f===null?r.lastEffect=a.next=a:(y=f.next,f.next=a,a.next=y,r.lastEffect=a),a}function Ad(){return ba().memoizedState}function ts(a,r,f,y){var S=Ta();rt.flags|=a,S.memoizedState=ii(1|r,f,{destroy:void 0},y===void 0?null:y)}function as(a,r,f,y){var S=ba();y=y===void 0?null:y;var M=S.memoizedState.inst;Ye!==null&&y!==null&&Cr(y,Ye.memoizedState.deps)?S.memoizedState=ii(r,f,M,y):(rt.flags|=a,S.memoizedState=ii(1|r,f,M,y))}function so(a,r){ts(8390656,8,a,r)}function Zc(a,r){as(2048,8,a,r)}function Rd(a,r){return as(4,2,a,r)}function ns(a,r){return as(4,4,a,r)}function oo(a,r){if(typeof r=="function"){a=a();var f=r(a);return function(){typeof f=="function"?f():r(null)}}if(r!=null)return a=a(),r.current=a,function(){r.current=null}}function co(a,r,f){f=f!=null?f.concat([a]):null,as(4,4,oo.bind(null,r,a),f)}function Ar(){}function vl(a,r){var f=ba();r=r===void 0?null:r;var y=f.memoizedState;return r!==null&&Cr(r,y[1])?y[0]:(f.memoizedState=[a,r],a)}function Jc(a,r){var f=ba();r=r===void 0?null:r;var y=f.memoizedState;if(r!==null&&Cr(r,y[1]))return y[0];if(y=a(),$r){L(!0);try{a()}finally{L(!1)}}return f.memoizedState=[y,r],y}function is(a,r,f){return f===void 0||(fr&1073741824)!==0?a.memoizedState=r:(a.memoizedState=f,a=bf(),rt.lanes|=a,Gn|=a,f)}function Wc(a,r,f,y){return _n(f,r)?f:Pt.current!==null?(a=is(a,f,y),_n(a,r)||(Lt=!0),a):(fr&42)===0?(Lt=!0,a.memoizedState=f):(a=bf(),rt.lanes|=a,Gn|=a,r)}function Jl(a,r,f,y,S){var M=lr();Ja(M!==0&&8>M?M:8);var k=ke.T,ee={};ke.T=ee,Il(a,!1,r,f);try{var se=S(),be=ke.S;if(be!==null&&be(ee,se),se!==null&&typeof se=="object"&&typeof se.then=="function"){var Oe=tn(se,y);Rr(a,r,Oe,fa(a))}else Rr(a,r,y,fa(a))}catch(De){Rr(a,r,{then:function(){},status:"rejected",reason:De},fa())}finally{Ja(M),ke.T=k}}function Ei(a){var r=a.memoizedState;if(r!==null)return r;r={memoizedState:Pr,baseState:Pr,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Bn,lastRenderedState:Pr},next:null};var f={};return r.next={memoizedState:f,baseState:f,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Bn,lastRenderedState:f},next:null},a.memoizedState=r,a=a.alternate,a!==null&&(a.memoizedState=r),r}function rs(){return ja(si)}function Wl(){return ba().memoizedState}function Ki(){return ba().memoizedState}function Ic(a){for(var r=a.return;r!==null;){switch(r.tag){case 24:case 3:var f=fa();a=mt(f);var y=yt(r,a,f);y!==null&&(Ua(y,r,f),He(y,r,f)),r={cache:Nr()},a.payload=r;return}r=r.return}}function fo(a,r,f){var y=fa();f={lane:y,revertLane:0,action:f,hasEagerState:!1,eagerState:null,next:null},ls(a)?an(r,f):(f=At(a,r,f,y),f!==null&&(Ua(f,a,y),Or(f,r,y)))}function $c(a,r,f){var y=fa();Rr(a,r,f,y)}function Rr(a,r,f,y){var S={lane:y,revertLane:0,action:f,hasEagerState:!1,eagerState:null,next:null};if(ls(a))an(r,S);else{var M=a.alternate;if(a.lanes===0&&(M===null||M.lanes===0)&&(M=r.lastRenderedReducer,M!==null))try{var k=r.lastRenderedState,ee=M(k,f);if(S.hasEagerState=!0,S.eagerState=ee,_n(ee,k))return ze(a,r,S,0),wt===null&&et(),!1}catch{}finally{}if(f=At(a,r,S,y),f!==null)return Ua(f,a,y),Or(f,r,y),!0}return!1}function Il(a,r,f,y){if(y={lane:2,revertLane:Dt(),action:y,hasEagerState:!1,eagerState:null,next:null},ls(a)){if(r)throw Error(c(479))}else r=At(a,f,y,2),r!==null&&Ua(r,a,2)}function ls(a){var r=a.alternate;return a===rt||r!==null&&r===rt}function an(a,r){zl=Qn=!0;var f=a.pending;f===null?r.next=r:(r.next=f.next,f.next=r),a.pending=r}function Or(a,r,f){if((f&4194176)!==0){var y=r.lanes;y&=a.pendingLanes,f|=y,r.lanes=f,P(a,f)}}function $l(a,r,f,y){r=a.memoizedState,f=f(y,r),f=f==null?r:No({},r,f),a.memoizedState=f,a.lanes===0&&(a.updateQueue.baseState=f)}function eu(a,r,f,y,S,M,k){return a=a.stateNode,typeof a.shouldComponentUpdate=="function"?a.shouldComponentUpdate(y,M,k):r.prototype&&r.prototype.isPureReactComponent?!Yi(f,y)||!Yi(S,M):!0}function Od(a,r,f,y){a=r.state,typeof r.componentWillReceiveProps=="function"&&r.componentWillReceiveProps(f,y),typeof r.UNSAFE_componentWillReceiveProps=="function"&&r.UNSAFE_componentWillReceiveProps(f,y),r.state!==a&&zi.enqueueReplaceState(r,r.state,null)}function Fi(a,r){var f=r;if("ref"in r){f={};for(var y in r)y!=="ref"&&(f[y]=r[y])}if(a=a.defaultProps){f===r&&(f=No({},f));for(var S in a)f[S]===void 0&&(f[S]=a[S])}return f}function tu(a,r){try{var f=a.onUncaughtError;f(r.value,{componentStack:r.stack})}catch(y){setTimeout(function(){throw y})}}function au(a,r,f){try{var y=a.onCaughtError;y(f.value,{componentStack:f.stack,errorBoundary:r.tag===1?r.stateNode:null})}catch(S){setTimeout(function(){throw S})}}function nu(a,r,f){return f=mt(f),f.tag=3,f.payload={element:null},f.callback=function(){tu(a,r)},f}function ef(a){return a=mt(a),a.tag=3,a}function Md(a,r,f,y){var S=f.type.getDerivedStateFromError;if(typeof S=="function"){var M=y.value;a.payload=function(){return S(M)},a.callback=function(){au(r,f,y)}}var k=f.stateNode;k!==null&&typeof k.componentDidCatch=="function"&&(a.callback=function(){au(r,f,y),typeof S!="function"&&(tl===null?tl=new Set([this]):tl.add(this));var ee=y.stack;this.componentDidCatch(y.value,{componentStack:ee!==null?ee:""})})}function L1(a,r,f,y,S){if(f.flags|=32768,y!==null&&typeof y=="object"&&typeof y.then=="function"){if(r=f.alternate,r!==null&&cs(r,f,S,!0),f=wn.current,f!==null){switch(f.tag){case 13:return Bt===null?er():f.alternate===null&&jt===0&&(jt=3),f.flags&=-257,f.flags|=65536,f.lanes=S,y===Ys?f.flags|=16384:(r=f.updateQueue,r===null?f.updateQueue=new Set([y]):r.add(y),bl(a,y,S)),!1;case 22:return f.flags|=65536,y===Ys?f.flags|=16384:(r=f.updateQueue,r===null?(r={transitions:null,markerInstances:null,retryQueue:new Set([y])},f.updateQueue=r):(f=r.retryQueue,f===null?r.retryQueue=new Set([y]):f.add(y)),bl(a,y,S)),!1}throw Error(c(435,f.tag))}return bl(a,y,S),er(),!1}if(bt)return r=wn.current,r!==null?((r.flags&65536)===0&&(r.flags|=256),r.flags|=65536,r.lanes=S,y!==Ls&&(a=Error(c(422),{cause:y}),$e(ae(a,f)))):(y!==Ls&&(r=Error(c(423),{cause:y}),$e(ae(r,f))),a=a.current.alternate,a.flags|=65536,S&=-S,a.lanes|=S,y=ae(y,f),S=nu(a.stateNode,y,S),Gt(a,S),jt!==4&&(jt=2)),!1;var M=Error(c(520),{cause:y});if(M=ae(M,f),ql===null?ql=[M]:ql.push(M),jt!==4&&(jt=2),r===null)return!0;y=ae(y,f),f=r;do{switch(f.tag){case 3:return f.flags|=65536,a=S&-S,f.lanes|=a,a=nu(f.stateNode,y,a),Gt(f,a),!1;case 1:if(r=f.type,M=f.stateNode,(f.flags&128)===0&&(typeof r.getDerivedStateFromError=="function"||M!==null&&typeof M.componentDidCatch=="function"&&(tl===null||!tl.has(M))))return f.flags|=65536,S&=-S,f.lanes|=S,S=ef(S),Md(S,a,f,y),Gt(f,S),!1}f=f.return}while(f!==null);return!1}function La(a,r,f,y){r.child=a===null?Di(r,null,f,y):Ir(r,a.child,f,y)}function ho(a,r,f,y,S){f=f.render;var M=r.ref;if("ref"in y){var k={};for(var ee in y)ee!=="ref"&&(k[ee]=y[ee])}else k=y;return wr(r),y=Tr(a,r,f,k,M,S),ee=ao(),a!==null&&!Lt?(no(a,r,S),ki(a,r,S)):(bt&&ee&&de(r),r.flags|=1,La(a,r,y,S),r.child)}function wd(a,r,f,y,S){if(a===null){var M=f.type;return typeof M=="function"&&!Es(M)&&M.defaultProps===void 0&&f.compare===null?(r.tag=15,r.type=M,Nd(a,r,M,y,S)):(a=Ai(f.type,null,y,r,r.mode,S),a.ref=r.ref,a.return=r,r.child=a)}if(M=a.child,!lf(a,S)){var k=M.memoizedProps;if(f=f.compare,f=f!==null?f:Yi,f(k,y)&&a.ref===r.ref)return ki(a,r,S)}return r.flags|=1,a=Vn(M,y),a.ref=r.ref,a.return=r,r.child=a}function Nd(a,r,f,y,S){if(a!==null){var M=a.memoizedProps;if(Yi(M,y)&&a.ref===r.ref)if(Lt=!1,r.pendingProps=y=M,lf(a,S))(a.flags&131072)!==0&&(Lt=!0);else return r.lanes=a.lanes,ki(a,r,S)}return go(a,r,f,y,S)}function Dd(a,r,f){var y=r.pendingProps,S=y.children,M=(r.stateNode._pendingVisibility&2)!==0,k=a!==null?a.memoizedState:null;if(us(a,r),y.mode==="hidden"||M){if((r.flags&128)!==0){if(y=k!==null?k.baseLanes|f:f,a!==null){for(S=r.child=a.child,M=0;S!==null;)M=M|S.lanes|S.childLanes,S=S.sibling;r.childLanes=M&~y}else r.childLanes=0,r.child=null;return zd(a,r,y,f)}if((f&536870912)!==0)r.memoizedState={baseLanes:0,cachePool:null},a!==null&&vo(r,k!==null?k.cachePool:null),k!==null?Ba(r,k):Qa(),Ed(r);else return r.lanes=r.childLanes=536870912,zd(a,r,k!==null?k.baseLanes|f:f,f)}else k!==null?(vo(r,k.cachePool),Ba(r,k),xr(),r.memoizedState=null):(a!==null&&vo(r,null),Qa(),xr());return La(a,r,S,f),r.child}function zd(a,r,f,y){var S=sf();return S=S===null?null:{parent:ln?Xt._currentValue:Xt._currentValue2,pool:S},r.memoizedState={baseLanes:f,cachePool:S},a!==null&&vo(r,null),Qa(),Ed(r),a!==null&&cs(a,r,y,!0),null}function us(a,r){var f=r.ref;if(f===null)a!==null&&a.ref!==null&&(r.flags|=2097664);else{if(typeof f!="function"&&typeof f!="object")throw Error(c(284));(a===null||a.ref!==f)&&(r.flags|=2097664)}}function go(a,r,f,y,S){return wr(r),f=Tr(a,r,f,y,void 0,S),y=ao(),a!==null&&!Lt?(no(a,r,S),ki(a,r,S)):(bt&&y&&de(r),r.flags|=1,La(a,r,f,S),r.child)}function Ud(a,r,f,y,S,M){return wr(r),r.updateQueue=null,f=hl(r,y,f,S),Ql(a),y=ao(),a!==null&&!Lt?(no(a,r,M),ki(a,r,M)):(bt&&y&&de(r),r.flags|=1,La(a,r,f,M),r.child)}function Gd(a,r,f,y,S){if(wr(r),r.stateNode===null){var M=kr,k=f.contextType;typeof k=="object"&&k!==null&&(M=ja(k)),M=new f(y,M),r.memoizedState=M.state!==null&&M.state!==void 0?M.state:null,M.updater=zi,r.stateNode=M,M._reactInternals=r,M=r.stateNode,M.props=y,M.state=r.memoizedState,M.refs={},ka(r),k=f.contextType,M.context=typeof k=="object"&&k!==null?ja(k):kr,M.state=r.memoizedState,k=f.getDerivedStateFromProps,typeof k=="function"&&($l(r,f,k,y),M.state=r.memoizedState),typeof f.getDerivedStateFromProps=="function"||typeof M.getSnapshotBeforeUpdate=="function"||typeof M.UNSAFE_componentWillMount!="function"&&typeof M.componentWillMount!="function"||(k=M.state,typeof M.componentWillMount=="function"&&M.componentWillMount(),typeof M.UNSAFE_componentWillMount=="function"&&M.UNSAFE_componentWillMount(),k!==M.state&&zi.enqueueReplaceState(M,M.state,null),Na(r,y,M,S),It(),M.state=r.memoizedState),typeof M.componentDidMount=="function"&&(r.flags|=4194308),y=!0}else if(a===null){M=r.stateNode;var ee=r.memoizedProps,se=Fi(f,ee);M.props=se;var be=M.context,Oe=f.contextType;k=kr,typeof Oe=="object"&&Oe!==null&&(k=ja(Oe));var De=f.getDerivedStateFromProps;Oe=typeof De=="function"||typeof M.getSnapshotBeforeUpdate=="function",ee=r.pendingProps!==ee,Oe||typeof M.UNSAFE_componentWillReceiveProps!="function"&&typeof M.componentWillReceiveProps!="function"||(ee||be!==k)&&Od(r,M,y,k),cr=!1;var Ue=r.memoizedState;M.state=Ue,Na(r,y,M,S),It(),be=r.memoizedState,ee||Ue!==be||cr?(typeof De=="function"&&($l(r,f,De,y),be=r.memoizedState),(se=cr||eu(r,f,se,y,Ue,be,k))?(Oe||typeof M.UNSAFE_componentWillMount!="function"&&typeof M.componentWillMount!="function"||(typeof M.componentWillMount=="function"&&M.componentWillMount(),typeof M.UNSAFE_componentWillMount=="function"&&M.UNSAFE_componentWillMount()),typeof M.componentDidMount=="function"&&(r.flags|=4194308)):(typeof M.componentDidMount=="function"&&(r.flags|=4194308),r.memoizedProps=y,r.memoizedState=be),M.props=y,M.state=be,M.context=k,y=se):(typeof M.componentDidMount=="function"&&(r.flags|=4194308),y=!1)}else{M=r.stateNode,ya(a,r),k=r.memoizedProps,Oe=Fi(f,k),M.props=Oe,De=r.pendingProps,Ue=M.context,be=f.contextType,se=kr,typeof be=="object"&&be!==null&&(se=ja(be)),ee=f.getDerivedStateFromProps,(be=typeof ee=="function"||typeof M.getSnapshotBeforeUpdate=="function")||typeof M.UNSAFE_componentWillReceiveProps!="function"&&typeof M.componentWillReceiveProps!="function"||(k!==De||Ue!==se)&&Od(r,M,y,se),cr=!1,Ue=r.memoizedState,M.state=Ue,Na(r,y,M,S),It();var Ie=r.memoizedState;k!==De||Ue!==Ie||cr||a!==null&&a.dependencies!==null&&fs(a.dependencies)?(typeof ee=="function"&&($l(r,f,ee,y),Ie=r.memoizedState),(Oe=cr||eu(r,f,Oe,y,Ue,Ie,se)||a!==null&&a.dependencies!==null&&fs(a.dependencies))?(be||typeof M.UNSAFE_componentWillUpdate!="function"&&typeof M.componentWillUpdate!="function"||(typeof M.componentWillUpdate=="function"&&M.componentWillUpdate(y,Ie,se),typeof M.UNSAFE_componentWillUpdate=="function"&&M.UNSAFE_componentWillUpdate(y,Ie,se)),typeof M.componentDidUpdate=="function"&&(r.flags|=4),typeof M.getSnapshotBeforeUpdate=="function"&&(r.flags|=1024)):(typeof M.componentDidUpdate!="function"||k===a.memoizedProps&&Ue===a.memoizedState||(r.flags|=4),typeof M.getSnapshotBeforeUpdate!="function"||k===a.memoizedProps&&Ue===a.memoizedState||(r.flags|=1024),r.memoizedProps=y,r.memoizedState=Ie),M.props=y,M.state=Ie,M.context=se,y=Oe):(typeof M.componentDidUpdate!="function"||k===a.memoizedProps&&Ue===a.memoizedState||(r.flags|=4),typeof M.getSnapshotBeforeUpdate!="function"||k===a.memoizedProps&&Ue===a.memoizedState||(r.flags|=1024),y=!1)}return M=y,us(a,r),y=(r.flags&128)!==0,M||y?(M=r.stateNode,f=y&&typeof f.getDerivedStateFromError!="function"?null:M.render(),r.flags|=1,a!==null&&y?(r.child=Ir(r,a.child,null,S),r.child=Ir(r,null,f,S)):La(a,r,f,S),r.memoizedState=M.state,a=r.child):a=ki(a,r,S),a}function qd(a,r,f,y){return Ge(),r.flags|=256,La(a,r,f,y),r.child}function tf(a){return{baseLanes:a,cachePool:of()}}function ss(a,r,f){return a=a!==null?a.childLanes&~f:0,r&&(a|=qn),a}function Hd(a,r,f){var y=r.pendingProps,S=!1,M=(r.flags&128)!==0,k;if((k=M)||(k=a!==null&&a.memoizedState===null?!1:(Oa.current&2)!==0),k&&(S=!0,r.flags&=-129),k=(r.flags&32)!==0,r.flags&=-33,a===null){if(bt){if(S?Si(r):xr(),bt){var ee=Fa,se;(se=ee)&&(ee=_0(ee,qa),ee!==null?(r.memoizedState={dehydrated:ee,treeContext:Qr!==null?{id:ci,overflow:fi}:null,retryLane:536870912},se=u(18,null,null,0),se.stateNode=ee,se.return=r,r.child=se,Ka=r,Fa=null,se=!0):se=!1),se||oe(r)}if(ee=r.memoizedState,ee!==null&&(ee=ee.dehydrated,ee!==null))return Vo(ee)?r.lanes=16:r.lanes=536870912,null;xi(r)}return ee=y.children,y=y.fallback,S?(xr(),S=r.mode,ee=nf({mode:"hidden",children:ee},S),y=ia(y,S,f,null),ee.return=r,y.return=r,ee.sibling=y,r.child=ee,S=r.child,S.memoizedState=tf(f),S.childLanes=ss(a,k,f),r.memoizedState=tc,y):(Si(r),af(r,ee))}if(se=a.memoizedState,se!==null&&(ee=se.dehydrated,ee!==null)){if(M)r.flags&256?(Si(r),r.flags&=-257,r=po(a,r,f)):r.memoizedState!==null?(xr(),r.child=a.child,r.flags|=128,r=null):(xr(),S=y.fallback,ee=r.mode,y=nf({mode:"visible",children:y.children},ee),S=ia(S,ee,f,null),S.flags|=2,y.return=r,S.return=r,y.sibling=S,r.child=y,Ir(r,a.child,null,f),y=r.child,y.memoizedState=tf(f),y.childLanes=ss(a,k,f),r.memoizedState=tc,r=S);else if(Si(r),Vo(ee))k=p0(ee).digest,y=Error(c(419)),y.stack="",y.digest=k,$e({value:y,source:null,stack:null}),r=po(a,r,f);else if(Lt||cs(a,r,f,!1),k=(f&a.childLanes)!==0,Lt||k){if(k=wt,k!==null){if(y=f&-f,(y&42)!==0)y=1;else switch(y){case 2:y=1;break;case 8:y=4;break;case 32:y=16;break;case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:y=64;break;case 268435456:y=134217728;break;default:y=0}if(y=(y&(k.suspendedLanes|f))!==0?0:y,y!==0&&y!==se.retryLane)throw se.retryLane=y,we(a,y),Ua(k,a,y),ec}jo(ee)||er(),r=po(a,r,f)}else jo(ee)?(r.flags|=128,r.child=a.child,r=tr.bind(null,a),v0(ee,r),r=null):(a=se.treeContext,Xa&&(Fa=b0(ee),Ka=r,bt=!0,Fn=null,qa=!1,a!==null&&(Rn[On++]=ci,Rn[On++]=fi,Rn[On++]=Qr,ci=a.id,fi=a.overflow,Qr=r)),r=af(r,y.children),r.flags|=4096);return r}return S?(xr(),S=y.fallback,ee=r.mode,se=a.child,M=se.sibling,y=Vn(se,{mode:"hidden",children:y.children}),y.subtreeFlags=se.subtreeFlags&31457280,M!==null?S=Vn(M,S):(S=ia(S,ee,f,null),S.flags|=2),S.return=r,y.return=r,y.sibling=S,r.child=y,y=S,S=r.child,ee=a.child.memoizedState,ee===null?ee=tf(f):(se=ee.cachePool,se!==null?(M=ln?Xt._currentValue:Xt._currentValue2,se=se.parent!==M?{parent:M,pool:M}:se):se=of(),ee={baseLanes:ee.baseLanes|f,cachePool:se}),S.memoizedState=ee,S.childLanes=ss(a,k,f),r.memoizedState=tc,y):(Si(r),f=a.child,a=f.sibling,f=Vn(f,{mode:"visible",children:y.children}),f.return=r,f.sibling=null,a!==null&&(k=r.deletions,k===null?(r.deletions=[a],r.flags|=16):k.push(a)),r.child=f,r.memoizedState=null,f)}function af(a,r){return r=nf({mode:"visible",children:r},a.mode),r.return=a,a.child=r}function nf(a,r){return Ts(a,r,0,null)}function po(a,r,f){return Ir(r,a.child,null,f),a=af(r,r.pendingProps.children),a.flags|=2,r.memoizedState=null,a}function Bd(a,r,f){a.lanes|=r;var y=a.alternate;y!==null&&(y.lanes|=r),os(a.return,r,f)}function rf(a,r,f,y,S){var M=a.memoizedState;M===null?a.memoizedState={isBackwards:r,rendering:null,renderingStartTime:0,last:y,tail:f,tailMode:S}:(M.isBackwards=r,M.rendering=null,M.renderingStartTime=0,M.last=y,M.tail=f,M.tailMode=S)}function Ld(a,r,f){var y=r.pendingProps,S=y.revealOrder,M=y.tail;if(La(a,r,y.children,f),y=Oa.current,(y&2)!==0)y=y&1|2,r.flags|=128;else{if(a!==null&&(a.flags&128)!==0)e:for(a=r.child;a!==null;){if(a.tag===13)a.memoizedState!==null&&Bd(a,f,r);else if(a.tag===19)Bd(a,f,r);else if(a.child!==null){a.child.return=a,a=a.child;continue}if(a===r)break e;for(;a.sibling===null;){if(a.return===null||a.return===r)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}y&=1}switch(A(Oa,y),S){case"forwards":for(f=r.child,S=null;f!==null;)a=f.alternate,a!==null&&Er(a)===null&&(S=f),f=f.sibling;f=S,f===null?(S=r.child,r.child=null):(S=f.sibling,f.sibling=null),rf(r,!1,S,f,M);break;case"backwards":for(f=null,S=r.child,r.child=null;S!==null;){if(a=S.alternate,a!==null&&Er(a)===null){r.child=S;break}a=S.sibling,S.sibling=f,f=S,S=a}rf(r,!0,f,null,M);break;case"together":rf(r,!1,null,null,void 0);break;default:r.memoizedState=null}return r.child}function ki(a,r,f){if(a!==null&&(r.dependencies=a.dependencies),Gn|=r.lanes,(f&r.childLanes)===0)if(a!==null){if(cs(a,r,f,!1),(f&r.childLanes)===0)return null}else return null;if(a!==null&&r.child!==a.child)throw Error(c(153));if(r.child!==null){for(a=r.child,f=Vn(a,a.pendingProps),r.child=f,f.return=r;a.sibling!==null;)a=a.sibling,f=f.sibling=Vn(a,a.pendingProps),f.return=r;f.sibling=null}return r.child}function lf(a,r){return(a.lanes&r)!==0?!0:(a=a.dependencies,!!(a!==null&&fs(a)))}function j1(a,r,f){switch(r.tag){case 3:ce(r,r.stateNode.containerInfo),Mr(r,Xt,a.memoizedState.cache),Ge();break;case 27:case 5:xe(r);break;case 4:ce(r,r.stateNode.containerInfo);break;case 10:Mr(r,r.type,r.memoizedProps.value);break;case 13:var y=r.memoizedState;if(y!==null)return y.dehydrated!==null?(Si(r),r.flags|=128,null):(f&r.child.childLanes)!==0?Hd(a,r,f):(Si(r),a=ki(a,r,f),a!==null?a.sibling:null);Si(r);break;case 19:var S=(a.flags&128)!==0;if(y=(f&r.childLanes)!==0,y||(cs(a,r,f,!1),y=(f&r.childLanes)!==0),S){if(y)return Ld(a,r,f);r.flags|=128}if(S=r.memoizedState,S!==null&&(S.rendering=null,S.tail=null,S.lastEffect=null),A(Oa,Oa.current),y)break;return null;case 22:case 23:return r.lanes=0,Dd(a,r,f);case 24:Mr(r,Xt,a.memoizedState.cache)}return ki(a,r,f)}function jd(a,r,f){if(a!==null)if(a.memoizedProps!==r.pendingProps)Lt=!0;else{if(!lf(a,f)&&(r.flags&128)===0)return Lt=!1,j1(a,r,f);Lt=(a.flags&131072)!==0}else Lt=!1,bt&&(r.flags&1048576)!==0&&te(r,Cu,r.index);switch(r.lanes=0,r.tag){case 16:e:{a=r.pendingProps;var y=r.elementType,S=y._init;if(y=S(y._payload),r.type=y,typeof y=="function")Es(y)?(a=Fi(y,a),r.tag=1,r=Gd(null,r,y,a,f)):(r.tag=0,r=go(null,r,y,a,f));else{if(y!=null){if(S=y.$$typeof,S===ws){r.tag=11,r=ho(null,r,y,a,f);break e}else if(S===Uo){r.tag=14,r=wd(null,r,y,a,f);break e}}throw r=d(y)||y,Error(c(306,r,""))}}return r;case 0:return go(a,r,r.type,r.pendingProps,f);case 1:return y=r.type,S=Fi(y,r.pendingProps),Gd(a,r,y,S,f);case 3:e:{if(ce(r,r.stateNode.containerInfo),a===null)throw Error(c(387));var M=r.pendingProps;S=r.memoizedState,y=S.element,ya(a,r),Na(r,M,null,f);var k=r.memoizedState;if(M=k.cache,Mr(r,Xt,M),M!==S.cache&&ml(r,[Xt],f,!0),It(),M=k.element,Xa&&S.isDehydrated)if(S={element:M,isDehydrated:!1,cache:k.cache},r.updateQueue.baseState=S,r.memoizedState=S,r.flags&256){r=qd(a,r,M,f);break e}else if(M!==y){y=ae(Error(c(424)),r),$e(y),r=qd(a,r,M,f);break e}else for(Xa&&(Fa=y0(r.stateNode.containerInfo),Ka=r,bt=!0,Fn=null,qa=!0),f=Di(r,null,M,f),r.child=f;f;)f.flags=f.flags&-3|4096,f=f.sibling;else{if(Ge(),M===y){r=ki(a,r,f);break e}La(a,r,M,f)}r=r.child}return r;case 26:if(An)return us(a,r),a===null?(f=Ff(r.type,null,r.pendingProps,null))?r.memoizedState=f:bt||(r.stateNode=Fo(r.type,r.pendingProps,wi.current,r)):r.memoizedState=Ff(r.type,a.memoizedProps,r.pendingProps,a.memoizedState),null;case 27:if(Ht)return xe(r),a===null&&Ht&&bt&&(y=r.stateNode=oi(r.type,r.pendingProps,wi.current,Ra.current,!1),Ka=r,qa=!0,Fa=Yo(y)),y=r.pendingProps.children,a!==null||bt?La(a,r,y,f):r.child=Ir(r,null,y,f),us(a,r),r.child;case 5:return a===null&&bt&&(Xo(r.type,r.pendingProps,Ra.current),(S=y=Fa)&&(y=k1(y,r.type,r.pendingProps,qa),y!==null?(r.stateNode=y,Ka=r,Fa=Yo(y),qa=!1,S=!0):S=!1),S||oe(r)),xe(r),S=r.type,M=r.pendingProps,k=a!==null?a.memoizedProps:null,y=M.children,at(S,M)?y=null:k!==null&&at(S,k)&&(r.flags|=32),r.memoizedState!==null&&(S=Tr(a,r,Da,null,null,f),ln?si._currentValue=S:si._currentValue2=S),us(a,r),La(a,r,y,f),r.child;case 6:return a===null&&bt&&(T0(r.pendingProps,Ra.current),(a=f=Fa)&&(f=Xf(f,r.pendingProps,qa),f!==null?(r.stateNode=f,Ka=r,Fa=null,a=!0):a=!1),a||oe(r)),null;case 13:return Hd(a,r,f);case 4:return ce(r,r.stateNode.containerInfo),y=r.pendingProps,a===null?r.child=Ir(r,null,y,f):La(a,r,y,f),r.child;case 11:return ho(a,r,r.type,r.pendingProps,f);case 7:return La(a,r,r.pendingProps,f),r.child;case 8:return La(a,r,r.pendingProps.children,f),r.child;case 12:return La(a,r,r.pendingProps.children,f),r.child;case 10:return y=r.pendingProps,Mr(r,r.type,y.value),La(a,r,y.children,f),r.child;case 9:return S=r.type._context,y=r.pendingProps.children,wr(r),S=ja(S),y=y(S),r.flags|=1,La(a,r,y,f),r.child;case 14:return wd(a,r,r.type,r.pendingProps,f);case 15:return Nd(a,r,r.type,r.pendingProps,f);case 19:return Ld(a,r,f);case 22:return Dd(a,r,f);case 24:return wr(r),y=ja(Xt),a===null?(S=sf(),S===null&&(S=wt,M=Nr(),S.pooledCache=M,M.refCount++,M!==null&&(S.pooledCacheLanes|=f),S=M),r.memoizedState={parent:y,cache:S},ka(r),Mr(r,Xt,S)):((a.lanes&f)!==0&&(ya(a,r),Na(r,null,null,f),It()),S=a.memoizedState,M=r.memoizedState,S.parent!==y?(S={parent:y,cache:y},r.memoizedState=S,r.lanes===0&&(r.memoizedState=r.updateQueue.baseState=S),Mr(r,Xt,y)):(y=M.cache,Mr(r,Xt,y),y!==S.cache&&ml(r,[Xt],f,!0))),La(a,r,r.pendingProps.children,f),r.child;case 29:throw r.pendingProps}throw Error(c(156,r.tag))}function Mr(a,r,f){ln?(A(hr,r._currentValue),r._currentValue=f):(A(hr,r._currentValue2),r._currentValue2=f)}function Qi(a){var r=hr.current;ln?a._currentValue=r:a._currentValue2=r,U(hr)}function os(a,r,f){for(;a!==null;){var y=a.alternate;if((a.childLanes&r)!==r?(a.childLanes|=r,y!==null&&(y.childLanes|=r)):y!==null&&(y.childLanes&r)!==r&&(y.childLanes|=r),a===f)break;a=a.return}}function ml(a,r,f,y){var S=a.child;for(S!==null&&(S.return=a);S!==null;){var M=S.dependencies;if(M!==null){var k=S.child;M=M.firstContext;e:for(;M!==null;){var ee=M;M=S;for(var se=0;se<r.length;se++)if(ee.context===r[se]){M.lanes|=f,ee=M.alternate,ee!==null&&(ee.lanes|=f),os(M.return,f,a),y||(k=null);break e}M=ee.next}}else if(S.tag===18){if(k=S.return,k===null)throw Error(c(341));k.lanes|=f,M=k.alternate,M!==null&&(M.lanes|=f),os(k,f,a),k=null}else k=S.child;if(k!==null)k.return=S;else for(k=S;k!==null;){if(k===a){k=null;break}if(S=k.sibling,S!==null){S.return=k.return,k=S;break}k=k.return}S=k}}function cs(a,r,f,y){a=null;for(var S=r,M=!1;S!==null;){if(!M){if((S.flags&524288)!==0)M=!0;else if((S.flags&262144)!==0)break}if(S.tag===10){var k=S.alternate;if(k===null)throw Error(c(387));if(k=k.memoizedProps,k!==null){var ee=S.type;_n(S.pendingProps.value,k.value)||(a!==null?a.push(ee):a=[ee])}}else if(S===Rl.current){if(k=S.alternate,k===null)throw Error(c(387));k.memoizedState.memoizedState!==S.memoizedState.memoizedState&&(a!==null?a.push(si):a=[si])}S=S.return}a!==null&&ml(r,a,f,y),r.flags|=262144}function fs(a){for(a=a.firstContext;a!==null;){var r=a.context;if(!_n(ln?r._currentValue:r._currentValue2,a.memoizedValue))return!0;a=a.next}return!1}function wr(a){gi=a,Dn=null,a=a.dependencies,a!==null&&(a.firstContext=null)}function ja(a){return uf(gi,a)}function hs(a,r){return gi===null&&wr(a),uf(a,r)}function uf(a,r){var f=ln?r._currentValue:r._currentValue2;if(r={context:r,memoizedValue:f,next:null},Dn===null){if(a===null)throw Error(c(308));Dn=r,a.dependencies={lanes:0,firstContext:r},a.flags|=524288}else Dn=Dn.next=r;return f}function Nr(){return{controller:new wu,data:new Map,refCount:0}}function ds(a){a.refCount--,a.refCount===0&&q0(H0,function(){a.controller.abort()})}function sf(){var a=Ui.current;return a!==null?a:wt.pooledCache}function vo(a,r){r===null?A(Ui,Ui.current):A(Ui,r.pool)}function of(){var a=sf();return a===null?null:{parent:ln?Xt._currentValue:Xt._currentValue2,pool:a}}function dn(a){a.flags|=4}function iu(a,r){if(a!==null&&a.child===r.child)return!1;if((r.flags&16)!==0)return!0;for(a=r.child;a!==null;){if((a.flags&13878)!==0||(a.subtreeFlags&13878)!==0)return!0;a=a.sibling}return!1}function yl(a,r,f,y){if(Aa)for(f=r.child;f!==null;){if(f.tag===5||f.tag===6)Ds(a,f.stateNode);else if(!(f.tag===4||Ht&&f.tag===27)&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===r)break;for(;f.sibling===null;){if(f.return===null||f.return===r)return;f=f.return}f.sibling.return=f.return,f=f.sibling}else if(Xn)for(var S=r.child;S!==null;){if(S.tag===5){var M=S.stateNode;f&&y&&(M=jf(M,S.type,S.memoizedProps)),Ds(a,M)}else if(S.tag===6)M=S.stateNode,f&&y&&(M=Vf(M,S.memoizedProps)),Ds(a,M);else if(S.tag!==4){if(S.tag===22&&S.memoizedState!==null)M=S.child,M!==null&&(M.return=S),yl(a,S,!0,!0);else if(S.child!==null){S.child.return=S,S=S.child;continue}}if(S===r)break;for(;S.sibling===null;){if(S.return===null||S.return===r)return;S=S.return}S.sibling.return=S.return,S=S.sibling}}function Vd(a,r,f,y){if(Xn)for(var S=r.child;S!==null;){if(S.tag===5){var M=S.stateNode;f&&y&&(M=jf(M,S.type,S.memoizedProps)),Lf(a,M)}else if(S.tag===6)M=S.stateNode,f&&y&&(M=Vf(M,S.memoizedProps)),Lf(a,M);else if(S.tag!==4){if(S.tag===22&&S.memoizedState!==null)M=S.child,M!==null&&(M.return=S),Vd(a,S,!(S.memoizedProps!==null&&S.memoizedProps.mode==="manual"),!0);else if(S.child!==null){S.child.return=S,S=S.child;continue}}if(S===r)break;for(;S.sibling===null;){if(S.return===null||S.return===r)return;S=S.return}S.sibling.return=S.return,S=S.sibling}}function gs(a,r){if(Xn&&iu(a,r)){a=r.stateNode;var f=a.containerInfo,y=zs();Vd(y,r,!1,!1),a.pendingChildren=y,dn(r),Lo(f,y)}}function mo(a,r,f,y){if(Aa)a.memoizedProps!==y&&dn(r);else if(Xn){var S=a.stateNode,M=a.memoizedProps;if((a=iu(a,r))||M!==y){var k=Ra.current;M=Su(S,f,M,y,!a,null),M===S?r.stateNode=S:(rr(M,f,y,k)&&dn(r),r.stateNode=M,a?yl(M,r,!1,!1):dn(r))}else r.stateNode=S}}function yo(a,r,f){if(Nf(r,f)){if(a.flags|=16777216,!Ho(r,f))if(Hr())a.flags|=8192;else throw Zr=Ys,Vs}else a.flags&=-16777217}function bo(a,r){if(O0(r)){if(a.flags|=16777216,!xl(r))if(Hr())a.flags|=8192;else throw Zr=Ys,Vs}else a.flags&=-16777217}function ru(a,r){r!==null&&(a.flags|=4),a.flags&16384&&(r=a.tag!==22?Y():536870912,a.lanes|=r,Hi|=r)}function lu(a,r){if(!bt)switch(a.tailMode){case"hidden":r=a.tail;for(var f=null;r!==null;)r.alternate!==null&&(f=r),r=r.sibling;f===null?a.tail=null:f.sibling=null;break;case"collapsed":f=a.tail;for(var y=null;f!==null;)f.alternate!==null&&(y=f),f=f.sibling;y===null?r||a.tail===null?a.tail=null:a.tail.sibling=null:y.sibling=null}}function Wt(a){var r=a.alternate!==null&&a.alternate.child===a.child,f=0,y=0;if(r)for(var S=a.child;S!==null;)f|=S.lanes|S.childLanes,y|=S.subtreeFlags&31457280,y|=S.flags&31457280,S.return=a,S=S.sibling;else for(S=a.child;S!==null;)f|=S.lanes|S.childLanes,y|=S.subtreeFlags,y|=S.flags,S.return=a,S=S.sibling;return a.subtreeFlags|=y,a.childLanes=f,r}function Yd(a,r,f){var y=r.pendingProps;switch(ne(r),r.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Wt(r),null;case 1:return Wt(r),null;case 3:return f=r.stateNode,y=null,a!==null&&(y=a.memoizedState.cache),r.memoizedState.cache!==y&&(r.flags|=2048),Qi(Xt),Se(),f.pendingContext&&(f.context=f.pendingContext,f.pendingContext=null),(a===null||a.child===null)&&(Me(r)?dn(r):a===null||a.memoizedState.isDehydrated&&(r.flags&256)===0||(r.flags|=1024,Fn!==null&&(Ss(Fn),Fn=null))),gs(a,r),Wt(r),null;case 26:if(An){f=r.type;var S=r.memoizedState;return a===null?(dn(r),S!==null?(Wt(r),bo(r,S)):(Wt(r),yo(r,f,y))):S?S!==a.memoizedState?(dn(r),Wt(r),bo(r,S)):(Wt(r),r.flags&=-16777217):(Aa?a.memoizedProps!==y&&dn(r):mo(a,r,f,y),Wt(r),yo(r,f,y)),null}case 27:if(Ht){if($(r),f=wi.current,S=r.type,a!==null&&r.stateNode!=null)Aa?a.memoizedProps!==y&&dn(r):mo(a,r,S,y);else{if(!y){if(r.stateNode===null)throw Error(c(166));return Wt(r),null}a=Ra.current,Me(r)?Te(r,a):(a=oi(S,y,f,a,!0),r.stateNode=a,dn(r))}return Wt(r),null}case 5:if($(r),f=r.type,a!==null&&r.stateNode!=null)mo(a,r,f,y);else{if(!y){if(r.stateNode===null)throw Error(c(166));return Wt(r),null}a=Ra.current,Me(r)?Te(r,a):(S=wf(f,y,wi.current,a,r),yl(S,r,!1,!1),r.stateNode=S,rr(S,f,y,a)&&dn(r))}return Wt(r),yo(r,r.type,r.pendingProps),null;case 6:if(a&&r.stateNode!=null)f=a.memoizedProps,Aa?f!==y&&dn(r):Xn&&(f!==y?(r.stateNode=Ut(y,wi.current,Ra.current,r),dn(r)):r.stateNode=a.stateNode);else{if(typeof y!="string"&&r.stateNode===null)throw Error(c(166));if(a=wi.current,f=Ra.current,Me(r)){if(!Xa)throw Error(c(176));if(a=r.stateNode,f=r.memoizedProps,y=null,S=Ka,S!==null)switch(S.tag){case 27:case 5:y=S.memoizedProps}Kf(a,f,r,y)||oe(r)}else r.stateNode=Ut(y,a,f,r)}return Wt(r),null;case 13:if(y=r.memoizedState,a===null||a.memoizedState!==null&&a.memoizedState.dehydrated!==null){if(S=Me(r),y!==null&&y.dehydrated!==null){if(a===null){if(!S)throw Error(c(318));if(!Xa)throw Error(c(344));if(S=r.memoizedState,S=S!==null?S.dehydrated:null,!S)throw Error(c(317));x0(S,r)}else Ge(),(r.flags&128)===0&&(r.memoizedState=null),r.flags|=4;Wt(r),S=!1}else Fn!==null&&(Ss(Fn),Fn=null),S=!0;if(!S)return r.flags&256?(xi(r),r):(xi(r),null)}if(xi(r),(r.flags&128)!==0)return r.lanes=f,r;if(f=y!==null,a=a!==null&&a.memoizedState!==null,f){y=r.child,S=null,y.alternate!==null&&y.alternate.memoizedState!==null&&y.alternate.memoizedState.cachePool!==null&&(S=y.alternate.memoizedState.cachePool.pool);var M=null;y.memoizedState!==null&&y.memoizedState.cachePool!==null&&(M=y.memoizedState.cachePool.pool),M!==S&&(y.flags|=2048)}return f!==a&&f&&(r.child.flags|=8192),ru(r,r.updateQueue),Wt(r),null;case 4:return Se(),gs(a,r),a===null&&ha(r.stateNode.containerInfo),Wt(r),null;case 10:return Qi(r.type),Wt(r),null;case 19:if(U(Oa),S=r.memoizedState,S===null)return Wt(r),null;if(y=(r.flags&128)!==0,M=S.rendering,M===null)if(y)lu(S,!1);else{if(jt!==0||a!==null&&(a.flags&128)!==0)for(a=r.child;a!==null;){if(M=Er(a),M!==null){for(r.flags|=128,lu(S,!1),a=M.updateQueue,r.updateQueue=a,ru(r,a),r.subtreeFlags=0,a=f,f=r.child;f!==null;)Cs(f,a),f=f.sibling;return A(Oa,Oa.current&1|2),r.child}a=a.sibling}S.tail!==null&&Kn()>zu&&(r.flags|=128,y=!0,lu(S,!1),r.lanes=4194304)}else{if(!y)if(a=Er(M),a!==null){if(r.flags|=128,y=!0,a=a.updateQueue,r.updateQueue=a,ru(r,a),lu(S,!0),S.tail===null&&S.tailMode==="hidden"&&!M.alternate&&!bt)return Wt(r),null}else 2*Kn()-S.renderingStartTime>zu&&f!==536870912&&(r.flags|=128,y=!0,lu(S,!1),r.lanes=4194304);S.isBackwards?(M.sibling=r.child,r.child=M):(a=S.last,a!==null?a.sibling=M:r.child=M,S.last=M)}return S.tail!==null?(r=S.tail,S.rendering=r,S.tail=r.sibling,S.renderingStartTime=Kn(),r.sibling=null,a=Oa.current,A(Oa,y?a&1|2:a&1),r):(Wt(r),null);case 22:case 23:return xi(r),Sr(),y=r.memoizedState!==null,a!==null?a.memoizedState!==null!==y&&(r.flags|=8192):y&&(r.flags|=8192),y?(f&536870912)!==0&&(r.flags&128)===0&&(Wt(r),r.subtreeFlags&6&&(r.flags|=8192)):Wt(r),f=r.updateQueue,f!==null&&ru(r,f.retryQueue),f=null,a!==null&&a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(f=a.memoizedState.cachePool.pool),y=null,r.memoizedState!==null&&r.memoizedState.cachePool!==null&&(y=r.memoizedState.cachePool.pool),y!==f&&(r.flags|=2048),a!==null&&U(Ui),null;case 24:return f=null,a!==null&&(f=a.memoizedState.cache),r.memoizedState.cache!==f&&(r.flags|=2048),Qi(Xt),Wt(r),null;case 25:return null}throw Error(c(156,r.tag))}function V1(a,r){switch(ne(r),r.tag){case 1:return a=r.flags,a&65536?(r.flags=a&-65537|128,r):null;case 3:return Qi(Xt),Se(),a=r.flags,(a&65536)!==0&&(a&128)===0?(r.flags=a&-65537|128,r):null;case 26:case 27:case 5:return $(r),null;case 13:if(xi(r),a=r.memoizedState,a!==null&&a.dehydrated!==null){if(r.alternate===null)throw Error(c(340));Ge()}return a=r.flags,a&65536?(r.flags=a&-65537|128,r):null;case 19:return U(Oa),null;case 4:return Se(),null;case 10:return Qi(r.type),null;case 22:case 23:return xi(r),Sr(),a!==null&&U(Ui),a=r.flags,a&65536?(r.flags=a&-65537|128,r):null;case 24:return Qi(Xt),null;case 25:return null;default:return null}}function Pd(a,r){switch(ne(r),r.tag){case 3:Qi(Xt),Se();break;case 26:case 27:case 5:$(r);break;case 4:Se();break;case 13:xi(r);break;case 19:U(Oa);break;case 10:Qi(r.type);break;case 22:case 23:xi(r),Sr(),a!==null&&U(Ui);break;case 24:Qi(Xt)}}function ps(a,r){try{var f=r.updateQueue,y=f!==null?f.lastEffect:null;if(y!==null){var S=y.next;f=S;do{if((f.tag&a)===a){y=void 0;var M=f.create,k=f.inst;y=M(),k.destroy=y}f=f.next}while(f!==S)}}catch(ee){Ot(r,r.return,ee)}}function Dr(a,r,f){try{var y=r.updateQueue,S=y!==null?y.lastEffect:null;if(S!==null){var M=S.next;y=M;do{if((y.tag&a)===a){var k=y.inst,ee=k.destroy;if(ee!==void 0){k.destroy=void 0,S=r;var se=f;try{ee()}catch(be){Ot(S,se,be)}}}y=y.next}while(y!==M)}}catch(be){Ot(r,r.return,be)}}function Xd(a){var r=a.updateQueue;if(r!==null){var f=a.stateNode;try{br(r,f)}catch(y){Ot(a,a.return,y)}}}function gn(a,r,f){f.props=Fi(a.type,a.memoizedProps),f.state=a.memoizedState;try{f.componentWillUnmount()}catch(y){Ot(a,r,y)}}function ri(a,r){try{var f=a.ref;if(f!==null){var y=a.stateNode;switch(a.tag){case 26:case 27:case 5:var S=yu(y);break;default:S=y}typeof f=="function"?a.refCleanup=f(S):f.current=S}}catch(M){Ot(a,r,M)}}function pn(a,r){var f=a.ref,y=a.refCleanup;if(f!==null)if(typeof y=="function")try{y()}catch(S){Ot(a,r,S)}finally{a.refCleanup=null,a=a.alternate,a!=null&&(a.refCleanup=null)}else if(typeof f=="function")try{f(null)}catch(S){Ot(a,r,S)}else f.current=null}function cf(a){var r=a.type,f=a.memoizedProps,y=a.stateNode;try{K1(y,r,f,a)}catch(S){Ot(a,a.return,S)}}function ff(a,r,f){try{u0(a.stateNode,a.type,f,r,a)}catch(y){Ot(a,a.return,y)}}function hf(a){return a.tag===5||a.tag===3||(An?a.tag===26:!1)||(Ht?a.tag===27:!1)||a.tag===4}function vs(a){e:for(;;){for(;a.sibling===null;){if(a.return===null||hf(a.return))return null;a=a.return}for(a.sibling.return=a.return,a=a.sibling;a.tag!==5&&a.tag!==6&&(!Ht||a.tag!==27)&&a.tag!==18;){if(a.flags&2||a.child===null||a.tag===4)continue e;a.child.return=a,a=a.child}if(!(a.flags&2))return a.stateNode}}function df(a,r,f){var y=a.tag;if(y===5||y===6)a=a.stateNode,r?o0(f,a,r):qf(f,a);else if(!(y===4||Ht&&y===27)&&(a=a.child,a!==null))for(df(a,r,f),a=a.sibling;a!==null;)df(a,r,f),a=a.sibling}function Zi(a,r,f){var y=a.tag;if(y===5||y===6)a=a.stateNode,r?s0(f,a,r):r0(f,a);else if(!(y===4||Ht&&y===27)&&(a=a.child,a!==null))for(Zi(a,r,f),a=a.sibling;a!==null;)Zi(a,r,f),a=a.sibling}function _o(a,r,f){a=a.containerInfo;try{xu(a,f)}catch(y){Ot(r,r.return,y)}}function ms(a,r){for(Go(a.containerInfo),We=r;We!==null;)if(a=We,r=a.child,(a.subtreeFlags&1028)!==0&&r!==null)r.return=a,We=r;else for(;We!==null;){a=We;var f=a.alternate;switch(r=a.flags,a.tag){case 0:break;case 11:case 15:break;case 1:if((r&1024)!==0&&f!==null){r=void 0;var y=a,S=f.memoizedProps;f=f.memoizedState;var M=y.stateNode;try{var k=Fi(y.type,S,y.elementType===y.type);r=M.getSnapshotBeforeUpdate(k,f),M.__reactInternalSnapshotBeforeUpdate=r}catch(ee){Ot(y,y.return,ee)}}break;case 3:(r&1024)!==0&&Aa&&g0(a.stateNode.containerInfo);break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((r&1024)!==0)throw Error(c(163))}if(r=a.sibling,r!==null){r.return=a.return,We=r;break}We=a.return}return k=st,st=!1,k}function So(a,r,f){var y=f.flags;switch(f.tag){case 0:case 11:case 15:Wi(a,f),y&4&&ps(5,f);break;case 1:if(Wi(a,f),y&4)if(a=f.stateNode,r===null)try{a.componentDidMount()}catch(ee){Ot(f,f.return,ee)}else{var S=Fi(f.type,r.memoizedProps);r=r.memoizedState;try{a.componentDidUpdate(S,r,a.__reactInternalSnapshotBeforeUpdate)}catch(ee){Ot(f,f.return,ee)}}y&64&&Xd(f),y&512&&ri(f,f.return);break;case 3:if(Wi(a,f),y&64&&(y=f.updateQueue,y!==null)){if(a=null,f.child!==null)switch(f.child.tag){case 27:case 5:a=yu(f.child.stateNode);break;case 1:a=f.child.stateNode}try{br(y,a)}catch(ee){Ot(f,f.return,ee)}}break;case 26:if(An){Wi(a,f),y&512&&ri(f,f.return);break}case 27:case 5:Wi(a,f),r===null&&y&4&&cf(f),y&512&&ri(f,f.return);break;case 12:Wi(a,f);break;case 13:Wi(a,f),y&4&&xo(a,f);break;case 22:if(S=f.memoizedState!==null||Gi,!S){r=r!==null&&r.memoizedState!==null||la;var M=Gi,k=la;Gi=S,(la=r)&&!k?Ii(a,f,(f.subtreeFlags&8772)!==0):Wi(a,f),Gi=M,la=k}y&512&&(f.memoizedProps.mode==="manual"?ri(f,f.return):pn(f,f.return));break;default:Wi(a,f)}}function gf(a){var r=a.alternate;r!==null&&(a.alternate=null,gf(r)),a.child=null,a.deletions=null,a.sibling=null,a.tag===5&&(r=a.stateNode,r!==null&&X1(r)),a.stateNode=null,a.return=null,a.dependencies=null,a.memoizedProps=null,a.memoizedState=null,a.pendingProps=null,a.stateNode=null,a.updateQueue=null}function Va(a,r,f){for(f=f.child;f!==null;)zr(a,r,f),f=f.sibling}function zr(a,r,f){if(bn&&typeof bn.onCommitFiberUnmount=="function")try{bn.onCommitFiberUnmount(ga,f)}catch{}switch(f.tag){case 26:if(An){la||pn(f,r),Va(a,r,f),f.memoizedState?Sl(f.memoizedState):f.stateNode&&Eu(f.stateNode);break}case 27:if(Ht){la||pn(f,r);var y=Ve,S=nt;Ve=f.stateNode,Va(a,r,f),Fr(f.stateNode),Ve=y,nt=S;break}case 5:la||pn(f,r);case 6:if(Aa){if(y=Ve,S=nt,Ve=null,Va(a,r,f),Ve=y,nt=S,Ve!==null)if(nt)try{c0(Ve,f.stateNode)}catch(M){Ot(f,r,M)}else try{Hf(Ve,f.stateNode)}catch(M){Ot(f,r,M)}}else Va(a,r,f);break;case 18:Aa&&Ve!==null&&(nt?Us(Ve,f.stateNode):C0(Ve,f.stateNode));break;case 4:Aa?(y=Ve,S=nt,Ve=f.stateNode.containerInfo,nt=!0,Va(a,r,f),Ve=y,nt=S):(Xn&&_o(f.stateNode,f,zs()),Va(a,r,f));break;case 0:case 11:case 14:case 15:la||Dr(2,f,r),la||Dr(4,f,r),Va(a,r,f);break;case 1:la||(pn(f,r),y=f.stateNode,typeof y.componentWillUnmount=="function"&&gn(f,r,y)),Va(a,r,f);break;case 21:Va(a,r,f);break;case 22:la||pn(f,r),la=(y=la)||f.memoizedState!==null,Va(a,r,f),la=y;break;default:Va(a,r,f)}}function xo(a,r){if(Xa&&r.memoizedState===null&&(a=r.alternate,a!==null&&(a=a.memoizedState,a!==null&&(a=a.dehydrated,a!==null))))try{Z1(a)}catch(f){Ot(r,r.return,f)}}function Kd(a){switch(a.tag){case 13:case 19:var r=a.stateNode;return r===null&&(r=a.stateNode=new Mt),r;case 22:return a=a.stateNode,r=a._retryCache,r===null&&(r=a._retryCache=new Mt),r;default:throw Error(c(435,a.tag))}}function Ji(a,r){var f=Kd(a);r.forEach(function(y){var S=jr.bind(null,a,y);f.has(y)||(f.add(y),y.then(S,S))})}function nn(a,r){var f=r.deletions;if(f!==null)for(var y=0;y<f.length;y++){var S=f[y],M=a,k=r;if(Aa){var ee=k;e:for(;ee!==null;){switch(ee.tag){case 27:case 5:Ve=ee.stateNode,nt=!1;break e;case 3:Ve=ee.stateNode.containerInfo,nt=!0;break e;case 4:Ve=ee.stateNode.containerInfo,nt=!0;break e}ee=ee.return}if(Ve===null)throw Error(c(160));zr(M,k,S),Ve=null,nt=!1}else zr(M,k,S);M=S.alternate,M!==null&&(M.return=null),S.return=null}if(r.subtreeFlags&13878)for(r=r.child;r!==null;)pf(r,a),r=r.sibling}function pf(a,r){var f=a.alternate,y=a.flags;switch(a.tag){case 0:case 11:case 14:case 15:nn(r,a),vn(a),y&4&&(Dr(3,a,a.return),ps(3,a),Dr(5,a,a.return));break;case 1:nn(r,a),vn(a),y&512&&(la||f===null||pn(f,f.return)),y&64&&Gi&&(a=a.updateQueue,a!==null&&(y=a.callbacks,y!==null&&(f=a.shared.hiddenCallbacks,a.shared.hiddenCallbacks=f===null?y:f.concat(y))));break;case 26:if(An){var S=ta;nn(r,a),vn(a),y&512&&(la||f===null||pn(f,f.return)),y&4&&(y=f!==null?f.memoizedState:null,r=a.memoizedState,f===null?r===null?a.stateNode===null?a.stateNode=qs(S,a.type,a.memoizedProps,a):Hs(S,a.type,a.stateNode):a.stateNode=A0(S,r,a.memoizedProps):y!==r?(y===null?f.stateNode!==null&&Eu(f.stateNode):Sl(y),r===null?Hs(S,a.type,a.stateNode):A0(S,r,a.memoizedProps)):r===null&&a.stateNode!==null&&ff(a,a.memoizedProps,f.memoizedProps));break}case 27:if(Ht&&y&4&&a.alternate===null){S=a.stateNode;var M=a.memoizedProps;try{Kr(S),w0(a.type,M,S,a)}catch(Oe){Ot(a,a.return,Oe)}}case 5:if(nn(r,a),vn(a),y&512&&(la||f===null||pn(f,f.return)),Aa){if(a.flags&32){r=a.stateNode;try{Bf(r)}catch(Oe){Ot(a,a.return,Oe)}}y&4&&a.stateNode!=null&&(r=a.memoizedProps,ff(a,r,f!==null?f.memoizedProps:r)),y&1024&&(Jf=!0)}break;case 6:if(nn(r,a),vn(a),y&4&&Aa){if(a.stateNode===null)throw Error(c(162));y=a.memoizedProps,f=f!==null?f.memoizedProps:y,r=a.stateNode;try{l0(r,f,y)}catch(Oe){Ot(a,a.return,Oe)}}break;case 3:if(An?(R0(),S=ta,ta=Ko(r.containerInfo),nn(r,a),ta=S):nn(r,a),vn(a),y&4){if(Aa&&Xa&&f!==null&&f.memoizedState.isDehydrated)try{Q1(r.containerInfo)}catch(Oe){Ot(a,a.return,Oe)}if(Xn){y=r.containerInfo,f=r.pendingChildren;try{xu(y,f)}catch(Oe){Ot(a,a.return,Oe)}}}Jf&&(Jf=!1,Fd(a));break;case 4:An?(f=ta,ta=Ko(a.stateNode.containerInfo),nn(r,a),vn(a),ta=f):(nn(r,a),vn(a)),y&4&&Xn&&_o(a.stateNode,a,a.stateNode.pendingChildren);break;case 12:nn(r,a),vn(a);break;case 13:nn(r,a),vn(a),a.child.flags&8192&&a.memoizedState!==null!=(f!==null&&f.memoizedState!==null)&&(cn=Kn()),y&4&&(y=a.updateQueue,y!==null&&(a.updateQueue=null,Ji(a,y)));break;case 22:y&512&&(la||f===null||pn(f,f.return)),S=a.memoizedState!==null;var k=f!==null&&f.memoizedState!==null,ee=Gi,se=la;if(Gi=ee||S,la=se||k,nn(r,a),la=se,Gi=ee,vn(a),r=a.stateNode,r._current=a,r._visibility&=-3,r._visibility|=r._pendingVisibility&2,y&8192&&(r._visibility=S?r._visibility&-2:r._visibility|1,S&&(r=Gi||la,f===null||k||r||uu(a)),Aa&&(a.memoizedProps===null||a.memoizedProps.mode!=="manual"))){e:if(f=null,Aa)for(r=a;;){if(r.tag===5||An&&r.tag===26||Ht&&r.tag===27){if(f===null){k=f=r;try{M=k.stateNode,S?f0(M):d0(k.stateNode,k.memoizedProps)}catch(Oe){Ot(k,k.return,Oe)}}}else if(r.tag===6){if(f===null){k=r;try{var be=k.stateNode;S?h0(be):F1(be,k.memoizedProps)}catch(Oe){Ot(k,k.return,Oe)}}}else if((r.tag!==22&&r.tag!==23||r.memoizedState===null||r===a)&&r.child!==null){r.child.return=r,r=r.child;continue}if(r===a)break e;for(;r.sibling===null;){if(r.return===null||r.return===a)break e;f===r&&(f=null),r=r.return}f===r&&(f=null),r.sibling.return=r.return,r=r.sibling}}y&4&&(y=a.updateQueue,y!==null&&(f=y.retryQueue,f!==null&&(y.retryQueue=null,Ji(a,f))));break;case 19:nn(r,a),vn(a),y&4&&(y=a.updateQueue,y!==null&&(a.updateQueue=null,Ji(a,y)));break;case 21:break;default:nn(r,a),vn(a)}}function vn(a){var r=a.flags;if(r&2){try{if(Aa&&(!Ht||a.tag!==27)){e:{for(var f=a.return;f!==null;){if(hf(f)){var y=f;break e}f=f.return}throw Error(c(160))}switch(y.tag){case 27:if(Ht){var S=y.stateNode,M=vs(a);Zi(a,M,S);break}case 5:var k=y.stateNode;y.flags&32&&(Bf(k),y.flags&=-33);var ee=vs(a);Zi(a,ee,k);break;case 3:case 4:var se=y.stateNode.containerInfo,be=vs(a);df(a,be,se);break;default:throw Error(c(161))}}}catch(Oe){Ot(a,a.return,Oe)}a.flags&=-3}r&4096&&(a.flags&=-4097)}function Fd(a){if(a.subtreeFlags&1024)for(a=a.child;a!==null;){var r=a;Fd(r),r.tag===5&&r.flags&1024&&Bo(r.stateNode),a=a.sibling}}function Wi(a,r){if(r.subtreeFlags&8772)for(r=r.child;r!==null;)So(a,r.alternate,r),r=r.sibling}function uu(a){for(a=a.child;a!==null;){var r=a;switch(r.tag){case 0:case 11:case 14:case 15:Dr(4,r,r.return),uu(r);break;case 1:pn(r,r.return);var f=r.stateNode;typeof f.componentWillUnmount=="function"&&gn(r,r.return,f),uu(r);break;case 26:case 27:case 5:pn(r,r.return),uu(r);break;case 22:pn(r,r.return),r.memoizedState===null&&uu(r);break;default:uu(r)}a=a.sibling}}function Ii(a,r,f){for(f=f&&(r.subtreeFlags&8772)!==0,r=r.child;r!==null;){var y=r.alternate,S=a,M=r,k=M.flags;switch(M.tag){case 0:case 11:case 15:Ii(S,M,f),ps(4,M);break;case 1:if(Ii(S,M,f),y=M,S=y.stateNode,typeof S.componentDidMount=="function")try{S.componentDidMount()}catch(be){Ot(y,y.return,be)}if(y=M,S=y.updateQueue,S!==null){var ee=y.stateNode;try{var se=S.shared.hiddenCallbacks;if(se!==null)for(S.shared.hiddenCallbacks=null,S=0;S<se.length;S++)oa(se[S],ee)}catch(be){Ot(y,y.return,be)}}f&&k&64&&Xd(M),ri(M,M.return);break;case 26:case 27:case 5:Ii(S,M,f),f&&y===null&&k&4&&cf(M),ri(M,M.return);break;case 12:Ii(S,M,f);break;case 13:Ii(S,M,f),f&&k&4&&xo(S,M);break;case 22:M.memoizedState===null&&Ii(S,M,f),ri(M,M.return);break;default:Ii(S,M,f)}r=r.sibling}}function Eo(a,r){var f=null;a!==null&&a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(f=a.memoizedState.cachePool.pool),a=null,r.memoizedState!==null&&r.memoizedState.cachePool!==null&&(a=r.memoizedState.cachePool.pool),a!==f&&(a!=null&&a.refCount++,f!=null&&ds(f))}function ys(a,r){a=null,r.alternate!==null&&(a=r.alternate.memoizedState.cache),r=r.memoizedState.cache,r!==a&&(r.refCount++,a!=null&&ds(a))}function za(a,r,f,y){if(r.subtreeFlags&10256)for(r=r.child;r!==null;)vf(a,r,f,y),r=r.sibling}function vf(a,r,f,y){var S=r.flags;switch(r.tag){case 0:case 11:case 15:za(a,r,f,y),S&2048&&ps(9,r);break;case 3:za(a,r,f,y),S&2048&&(a=null,r.alternate!==null&&(a=r.alternate.memoizedState.cache),r=r.memoizedState.cache,r!==a&&(r.refCount++,a!=null&&ds(a)));break;case 12:if(S&2048){za(a,r,f,y),a=r.stateNode;try{var M=r.memoizedProps,k=M.id,ee=M.onPostCommit;typeof ee=="function"&&ee(k,r.alternate===null?"mount":"update",a.passiveEffectDuration,-0)}catch(se){Ot(r,r.return,se)}}else za(a,r,f,y);break;case 23:break;case 22:M=r.stateNode,r.memoizedState!==null?M._visibility&4?za(a,r,f,y):Za(a,r):M._visibility&4?za(a,r,f,y):(M._visibility|=4,Ya(a,r,f,y,(r.subtreeFlags&10256)!==0)),S&2048&&Eo(r.alternate,r);break;case 24:za(a,r,f,y),S&2048&&ys(r.alternate,r);break;default:za(a,r,f,y)}}function Ya(a,r,f,y,S){for(S=S&&(r.subtreeFlags&10256)!==0,r=r.child;r!==null;){var M=a,k=r,ee=f,se=y,be=k.flags;switch(k.tag){case 0:case 11:case 15:Ya(M,k,ee,se,S),ps(8,k);break;case 23:break;case 22:var Oe=k.stateNode;k.memoizedState!==null?Oe._visibility&4?Ya(M,k,ee,se,S):Za(M,k):(Oe._visibility|=4,Ya(M,k,ee,se,S)),S&&be&2048&&Eo(k.alternate,k);break;case 24:Ya(M,k,ee,se,S),S&&be&2048&&ys(k.alternate,k);break;default:Ya(M,k,ee,se,S)}r=r.sibling}}function Za(a,r){if(r.subtreeFlags&10256)for(r=r.child;r!==null;){var f=a,y=r,S=y.flags;switch(y.tag){case 22:Za(f,y),S&2048&&Eo(y.alternate,y);break;case 24:Za(f,y),S&2048&&ys(y.alternate,y);break;default:Za(f,y)}r=r.sibling}}function Ln(a){if(a.subtreeFlags&zn)for(a=a.child;a!==null;)Co(a),a=a.sibling}function Co(a){switch(a.tag){case 26:Ln(a),a.flags&zn&&(a.memoizedState!==null?M0(ta,a.memoizedState,a.memoizedProps):un(a.type,a.memoizedProps));break;case 5:Ln(a),a.flags&zn&&un(a.type,a.memoizedProps);break;case 3:case 4:if(An){var r=ta;ta=Ko(a.stateNode.containerInfo),Ln(a),ta=r}else Ln(a);break;case 22:a.memoizedState===null&&(r=a.alternate,r!==null&&r.memoizedState!==null?(r=zn,zn=16777216,Ln(a),zn=r):Ln(a));break;default:Ln(a)}}function bs(a){var r=a.alternate;if(r!==null&&(a=r.child,a!==null)){r.child=null;do r=a.sibling,a.sibling=null,a=r;while(a!==null)}}function Ur(a){var r=a.deletions;if((a.flags&16)!==0){if(r!==null)for(var f=0;f<r.length;f++){var y=r[f];We=y,mf(y,a)}bs(a)}if(a.subtreeFlags&10256)for(a=a.child;a!==null;)To(a),a=a.sibling}function To(a){switch(a.tag){case 0:case 11:case 15:Ur(a),a.flags&2048&&Dr(9,a,a.return);break;case 3:Ur(a);break;case 12:Ur(a);break;case 22:var r=a.stateNode;a.memoizedState!==null&&r._visibility&4&&(a.return===null||a.return.tag!==13)?(r._visibility&=-5,$i(a)):Ur(a);break;default:Ur(a)}}function $i(a){var r=a.deletions;if((a.flags&16)!==0){if(r!==null)for(var f=0;f<r.length;f++){var y=r[f];We=y,mf(y,a)}bs(a)}for(a=a.child;a!==null;){switch(r=a,r.tag){case 0:case 11:case 15:Dr(8,r,r.return),$i(r);break;case 22:f=r.stateNode,f._visibility&4&&(f._visibility&=-5,$i(r));break;default:$i(r)}a=a.sibling}}function mf(a,r){for(;We!==null;){var f=We;switch(f.tag){case 0:case 11:case 15:Dr(8,f,r);break;case 23:case 22:if(f.memoizedState!==null&&f.memoizedState.cachePool!==null){var y=f.memoizedState.cachePool.pool;y!=null&&y.refCount++}break;case 24:ds(f.memoizedState.cache)}if(y=f.child,y!==null)y.return=f,We=y;else e:for(f=a;We!==null;){y=We;var S=y.sibling,M=y.return;if(gf(y),y===f){We=null;break e}if(S!==null){S.return=M,We=S;break e}We=M}}}function su(a){var r=Id(a);if(r!=null){if(typeof r.memoizedProps["data-testname"]!="string")throw Error(c(364));return r}if(a=Uf(a),a===null)throw Error(c(362));return a.stateNode.current}function Gr(a,r){var f=a.tag;switch(r.$$typeof){case Du:if(a.type===r.value)return!0;break;case Zn:e:{for(r=r.value,a=[a,0],f=0;f<a.length;){var y=a[f++],S=y.tag,M=a[f++],k=r[M];if(S!==5&&S!==26&&S!==27||!_u(y)){for(;k!=null&&Gr(y,k);)M++,k=r[M];if(M===r.length){r=!0;break e}else for(y=y.child;y!==null;)a.push(y,M),y=y.sibling}}r=!1}return r;case kt:if((f===5||f===26||f===27)&&a0(a.stateNode,r.value))return!0;break;case qi:if((f===5||f===6||f===26||f===27)&&(a=t0(a),a!==null&&0<=a.indexOf(r.value)))return!0;break;case pi:if((f===5||f===26||f===27)&&(a=a.memoizedProps["data-testname"],typeof a=="string"&&a.toLowerCase()===r.value.toLowerCase()))return!0;break;default:throw Error(c(365))}return!1}function yf(a){switch(a.$$typeof){case Du:return"<"+(d(a.value)||"Unknown")+">";case Zn:return":has("+(yf(a)||"")+")";case kt:return'[role="'+a.value+'"]';case qi:return'"'+a.value+'"';case pi:return'[data-testname="'+a.value+'"]';default:throw Error(c(365))}}function mn(a,r){var f=[];a=[a,0];for(var y=0;y<a.length;){var S=a[y++],M=S.tag,k=a[y++],ee=r[k];if(M!==5&&M!==26&&M!==27||!_u(S)){for(;ee!=null&&Gr(S,ee);)k++,ee=r[k];if(k===r.length)f.push(S);else for(S=S.child;S!==null;)a.push(S,k),S=S.sibling}}return f}function _s(a,r){if(!Xr)throw Error(c(363));a=su(a),a=mn(a,r),r=[],a=Array.from(a);for(var f=0;f<a.length;){var y=a[f++],S=y.tag;if(S===5||S===26||S===27)_u(y)||r.push(y.stateNode);else for(y=y.child;y!==null;)a.push(y),y=y.sibling}return r}function fa(){if((xt&2)!==0&&dt!==0)return dt&-dt;if(ke.T!==null){var a=Mn;return a!==0?a:Dt()}return $d()}function bf(){qn===0&&(qn=(dt&536870912)===0||bt?X():536870912);var a=wn.current;return a!==null&&(a.flags|=32),qn}function Ua(a,r,f){(a===wt&&qt===2||a.cancelPendingCommit!==null)&&(Pa(a,0),yn(a,dt,qn,!1)),F(a,f),((xt&2)===0||a!==wt)&&(a===wt&&((xt&2)===0&&(dr|=f),jt===4&&yn(a,dt,qn,!1)),Rt(a))}function qr(a,r,f){if((xt&6)!==0)throw Error(c(327));var y=!f&&(r&60)===0&&(r&a.expiredLanes)===0||B(a,r),S=y?Sf(a,r):Ro(a,r,!0),M=y;do{if(S===0){Un&&!y&&yn(a,r,0,!1);break}else if(S===6)yn(a,r,0,!Wn);else{if(f=a.current.alternate,M&&!ou(f)){S=Ro(a,r,!1),M=!1;continue}if(S===2){if(M=r,a.errorRecoveryDisabledLanes&M)var k=0;else k=a.pendingLanes&-536870913,k=k!==0?k:k&536870912?536870912:0;if(k!==0){r=k;e:{var ee=a;S=ql;var se=Xa&&ee.current.memoizedState.isDehydrated;if(se&&(Pa(ee,k).flags|=256),k=Ro(ee,k,!1),k!==2){if(Ma&&!se){ee.errorRecoveryDisabledLanes|=M,dr|=M,S=4;break e}M=ua,ua=S,M!==null&&Ss(M)}S=k}if(M=!1,S!==2)continue}}if(S===1){Pa(a,0),yn(a,r,0,!0);break}e:{switch(y=a,S){case 0:case 1:throw Error(c(345));case 4:if((r&4194176)===r){yn(y,r,qn,!Wn);break e}break;case 2:ua=null;break;case 3:case 5:break;default:throw Error(c(329))}if(y.finishedWork=f,y.finishedLanes=r,(r&62914560)===r&&(M=cn+300-Kn(),10<M)){if(yn(y,r,qn,!Wn),G(y,0)!==0)break e;y.timeoutHandle=Sa(Ao.bind(null,y,f,ua,Xs,ac,r,qn,dr,Hi,Wn,2,-0,0),M);break e}Ao(y,f,ua,Xs,ac,r,qn,dr,Hi,Wn,0,-0,0)}}break}while(!0);Rt(a)}function Ss(a){ua===null?ua=a:ua.push.apply(ua,a)}function Ao(a,r,f,y,S,M,k,ee,se,be,Oe,De,Ue){var Ie=r.subtreeFlags;if((Ie&8192||(Ie&16785408)===16785408)&&(Df(),Co(r),r=xa(),r!==null)){a.cancelPendingCommit=r(Br.bind(null,a,f,y,S,k,ee,se,1,De,Ue)),yn(a,M,k,!be);return}Br(a,f,y,S,k,ee,se,Oe,De,Ue)}function ou(a){for(var r=a;;){var f=r.tag;if((f===0||f===11||f===15)&&r.flags&16384&&(f=r.updateQueue,f!==null&&(f=f.stores,f!==null)))for(var y=0;y<f.length;y++){var S=f[y],M=S.getSnapshot;S=S.value;try{if(!_n(M(),S))return!1}catch{return!1}}if(f=r.child,r.subtreeFlags&16384&&f!==null)f.return=r,r=f;else{if(r===a)break;for(;r.sibling===null;){if(r.return===null||r.return===a)return!0;r=r.return}r.sibling.return=r.return,r=r.sibling}}return!0}function yn(a,r,f,y){r&=~Ps,r&=~dr,a.suspendedLanes|=r,a.pingedLanes&=~r,y&&(a.warmLanes|=r),y=a.expirationTimes;for(var S=r;0<S;){var M=31-sn(S),k=1<<M;y[M]=-1,S&=~k}f!==0&&D(a,f,r)}function xs(){return(xt&6)===0?(Vt(0),!1):!0}function cu(){if(Pe!==null){if(qt===0)var a=Pe.return;else a=Pe,Dn=gi=null,Xi(a),Jr=null,Wr=0,a=Pe;for(;a!==null;)Pd(a.alternate,a),a=a.return;Pe=null}}function Pa(a,r){a.finishedWork=null,a.finishedLanes=0;var f=a.timeoutHandle;f!==Yr&&(a.timeoutHandle=Yr,qo(f)),f=a.cancelPendingCommit,f!==null&&(a.cancelPendingCommit=null,f()),cu(),wt=a,Pe=f=Vn(a.current,null),dt=r,qt=0,Wa=null,Wn=!1,Un=B(a,r),Ma=!1,Hi=qn=Ps=dr=Gn=jt=0,ua=ql=null,ac=!1,(r&8)!==0&&(r|=r&32);var y=a.entangledLanes;if(y!==0)for(a=a.entanglements,y&=r;0<y;){var S=31-sn(y),M=1<<S;r|=a[S],y&=~M}return Ia=r,et(),f}function En(a,r){rt=null,ke.H=ra,r===Ou?(r=Zu(),qt=3):r===Vs?(r=Zu(),qt=4):qt=r===ec?8:r!==null&&typeof r=="object"&&typeof r.then=="function"?6:1,Wa=r,Pe===null&&(jt=1,tu(a,ae(r,a.current)))}function Hr(){var a=wn.current;return a===null?!0:(dt&4194176)===dt?Bt===null:(dt&62914560)===dt||(dt&536870912)!==0?a===Bt:!1}function Ci(){var a=ke.H;return ke.H=ra,a===null?ra:a}function Ti(){var a=ke.A;return ke.A=Nu,a}function er(){jt=4,Wn||(dt&4194176)!==dt&&wn.current!==null||(Un=!0),(Gn&134217727)===0&&(dr&134217727)===0||wt===null||yn(wt,dt,qn,!1)}function Ro(a,r,f){var y=xt;xt|=2;var S=Ci(),M=Ti();(wt!==a||dt!==r)&&(Xs=null,Pa(a,r)),r=!1;var k=jt;e:do try{if(qt!==0&&Pe!==null){var ee=Pe,se=Wa;switch(qt){case 8:cu(),k=6;break e;case 3:case 2:case 6:wn.current===null&&(r=!0);var be=qt;if(qt=0,Wa=null,jn(a,ee,se,be),f&&Un){k=0;break e}break;default:be=qt,qt=0,Wa=null,jn(a,ee,se,be)}}_f(),k=jt;break}catch(Oe){En(a,Oe)}while(!0);return r&&a.shellSuspendCounter++,Dn=gi=null,xt=y,ke.H=S,ke.A=M,Pe===null&&(wt=null,dt=0,et()),k}function _f(){for(;Pe!==null;)ea(Pe)}function Sf(a,r){var f=xt;xt|=2;var y=Ci(),S=Ti();wt!==a||dt!==r?(Xs=null,zu=Kn()+500,Pa(a,r)):Un=B(a,r);e:do try{if(qt!==0&&Pe!==null){r=Pe;var M=Wa;t:switch(qt){case 1:qt=0,Wa=null,jn(a,r,M,1);break;case 2:if(Jt(M)){qt=0,Wa=null,Ct(r);break}r=function(){qt===2&&wt===a&&(qt=7),Rt(a)},M.then(r,r);break e;case 3:qt=7;break e;case 4:qt=5;break e;case 7:Jt(M)?(qt=0,Wa=null,Ct(r)):(qt=0,Wa=null,jn(a,r,M,7));break;case 5:var k=null;switch(Pe.tag){case 26:k=Pe.memoizedState;case 5:case 27:var ee=Pe,se=ee.type,be=ee.pendingProps;if(k?xl(k):Ho(se,be)){qt=0,Wa=null;var Oe=ee.sibling;if(Oe!==null)Pe=Oe;else{var De=ee.return;De!==null?(Pe=De,Cn(De)):Pe=null}break t}}qt=0,Wa=null,jn(a,r,M,5);break;case 6:qt=0,Wa=null,jn(a,r,M,6);break;case 8:cu(),jt=6;break e;default:throw Error(c(462))}}rn();break}catch(Ue){En(a,Ue)}while(!0);return Dn=gi=null,ke.H=y,ke.A=S,xt=f,Pe!==null?0:(wt=null,dt=0,et(),jt)}function rn(){for(;Pe!==null&&!z0();)ea(Pe)}function ea(a){var r=jd(a.alternate,a,Ia);a.memoizedProps=a.pendingProps,r===null?Cn(a):Pe=r}function Ct(a){var r=a,f=r.alternate;switch(r.tag){case 15:case 0:r=Ud(f,r,r.pendingProps,r.type,void 0,dt);break;case 11:r=Ud(f,r,r.pendingProps,r.type.render,r.ref,dt);break;case 5:Xi(r);default:Pd(f,r),r=Pe=Cs(r,Ia),r=jd(f,r,Ia)}a.memoizedProps=a.pendingProps,r===null?Cn(a):Pe=r}function jn(a,r,f,y){Dn=gi=null,Xi(r),Jr=null,Wr=0;var S=r.return;try{if(L1(a,S,r,f,dt)){jt=1,tu(a,ae(f,a.current)),Pe=null;return}}catch(M){if(S!==null)throw Pe=S,M;jt=1,tu(a,ae(f,a.current)),Pe=null;return}r.flags&32768?(bt||y===1?a=!0:Un||(dt&536870912)!==0?a=!1:(Wn=a=!0,(y===2||y===3||y===6)&&(y=wn.current,y!==null&&y.tag===13&&(y.flags|=16384))),Oo(r,a)):Cn(r)}function Cn(a){var r=a;do{if((r.flags&32768)!==0){Oo(r,Wn);return}a=r.return;var f=Yd(r.alternate,r,Ia);if(f!==null){Pe=f;return}if(r=r.sibling,r!==null){Pe=r;return}Pe=r=a}while(r!==null);jt===0&&(jt=5)}function Oo(a,r){do{var f=V1(a.alternate,a);if(f!==null){f.flags&=32767,Pe=f;return}if(f=a.return,f!==null&&(f.flags|=32768,f.subtreeFlags=0,f.deletions=null),!r&&(a=a.sibling,a!==null)){Pe=a;return}Pe=a=f}while(a!==null);jt=6,Pe=null}function Br(a,r,f,y,S,M,k,ee,se,be){var Oe=ke.T,De=lr();try{Ja(2),ke.T=null,kd(a,r,f,y,De,S,M,k,ee,se,be)}finally{ke.T=Oe,Ja(De)}}function kd(a,r,f,y,S,M,k,ee){do li();while(Bi!==null);if((xt&6)!==0)throw Error(c(327));var se=a.finishedWork;if(y=a.finishedLanes,se===null)return null;if(a.finishedWork=null,a.finishedLanes=0,se===a.current)throw Error(c(177));a.callbackNode=null,a.callbackPriority=0,a.cancelPendingCommit=null;var be=se.lanes|se.childLanes;if(be|=hi,I(a,y,be,M,k,ee),a===wt&&(Pe=wt=null,dt=0),(se.subtreeFlags&10256)===0&&(se.flags&10256)===0||vi||(vi=!0,al=be,nc=f,ar(Jo,function(){return li(),null})),f=(se.flags&15990)!==0,(se.subtreeFlags&15990)!==0||f?(f=ke.T,ke.T=null,M=lr(),Ja(2),k=xt,xt|=4,ms(a,se),pf(se,a),Wd(a.containerInfo),a.current=se,So(a,se.alternate,se),Qo(),xt=k,Ja(M),ke.T=f):a.current=se,vi?(vi=!1,Bi=a,Hl=y):xf(a,be),be=a.pendingLanes,be===0&&(tl=null),N(se.stateNode),Rt(a),r!==null)for(S=a.onRecoverableError,se=0;se<r.length;se++)be=r[se],S(be.value,{componentStack:be.stack});return(Hl&3)!==0&&li(),be=a.pendingLanes,(y&4194218)!==0&&(be&42)!==0?a===ic?Uu++:(Uu=0,ic=a):Uu=0,Vt(0),null}function xf(a,r){(a.pooledCacheLanes&=r)===0&&(r=a.pooledCache,r!=null&&(a.pooledCache=null,ds(r)))}function li(){if(Bi!==null){var a=Bi,r=al;al=0;var f=H(Hl),y=32>f?32:f;f=ke.T;var S=lr();try{if(Ja(y),ke.T=null,Bi===null)var M=!1;else{y=nc,nc=null;var k=Bi,ee=Hl;if(Bi=null,Hl=0,(xt&6)!==0)throw Error(c(331));var se=xt;if(xt|=4,To(k.current),vf(k,k.current,ee,y),xt=se,Vt(0,!1),bn&&typeof bn.onPostCommitFiberRoot=="function")try{bn.onPostCommitFiberRoot(ga,k)}catch{}M=!0}return M}finally{Ja(S),ke.T=f,xf(a,r)}}return!1}function fu(a,r,f){r=ae(f,r),r=nu(a.stateNode,r,2),a=yt(a,r,2),a!==null&&(F(a,2),Rt(a))}function Ot(a,r,f){if(a.tag===3)fu(a,a,f);else for(;r!==null;){if(r.tag===3){fu(r,a,f);break}else if(r.tag===1){var y=r.stateNode;if(typeof r.type.getDerivedStateFromError=="function"||typeof y.componentDidCatch=="function"&&(tl===null||!tl.has(y))){a=ae(f,a),f=ef(2),y=yt(r,f,2),y!==null&&(Md(f,y,r,a),F(y,2),Rt(y));break}}r=r.return}}function bl(a,r,f){var y=a.pingCache;if(y===null){y=a.pingCache=new Jn;var S=new Set;y.set(r,S)}else S=y.get(r),S===void 0&&(S=new Set,y.set(r,S));S.has(f)||(Ma=!0,S.add(f),a=Ef.bind(null,a,r,f),r.then(a,a))}function Ef(a,r,f){var y=a.pingCache;y!==null&&y.delete(r),a.pingedLanes|=a.suspendedLanes&f,a.warmLanes&=~f,wt===a&&(dt&f)===f&&(jt===4||jt===3&&(dt&62914560)===dt&&300>Kn()-cn?(xt&2)===0&&Pa(a,0):Ps|=f,Hi===dt&&(Hi=0)),Rt(a)}function Lr(a,r){r===0&&(r=Y()),a=we(a,r),a!==null&&(F(a,r),Rt(a))}function tr(a){var r=a.memoizedState,f=0;r!==null&&(f=r.retryLane),Lr(a,f)}function jr(a,r){var f=0;switch(a.tag){case 13:var y=a.stateNode,S=a.memoizedState;S!==null&&(f=S.retryLane);break;case 19:y=a.stateNode;break;case 22:y=a.stateNode._retryCache;break;default:throw Error(c(314))}y!==null&&y.delete(r),Lr(a,f)}function ar(a,r){return Bs(a,r)}function Cf(a,r,f,y){this.tag=a,this.key=f,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=r,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=y,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Es(a){return a=a.prototype,!(!a||!a.isReactComponent)}function Vn(a,r){var f=a.alternate;return f===null?(f=u(a.tag,r,a.key,a.mode),f.elementType=a.elementType,f.type=a.type,f.stateNode=a.stateNode,f.alternate=a,a.alternate=f):(f.pendingProps=r,f.type=a.type,f.flags=0,f.subtreeFlags=0,f.deletions=null),f.flags=a.flags&31457280,f.childLanes=a.childLanes,f.lanes=a.lanes,f.child=a.child,f.memoizedProps=a.memoizedProps,f.memoizedState=a.memoizedState,f.updateQueue=a.updateQueue,r=a.dependencies,f.dependencies=r===null?null:{lanes:r.lanes,firstContext:r.firstContext},f.sibling=a.sibling,f.index=a.index,f.ref=a.ref,f.refCleanup=a.refCleanup,f}function Cs(a,r){a.flags&=31457282;var f=a.alternate;return f===null?(a.childLanes=0,a.lanes=r,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=f.childLanes,a.lanes=f.lanes,a.child=f.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=f.memoizedProps,a.memoizedState=f.memoizedState,a.updateQueue=f.updateQueue,a.type=f.type,r=f.dependencies,a.dependencies=r===null?null:{lanes:r.lanes,firstContext:r.firstContext}),a}function Ai(a,r,f,y,S,M){var k=0;if(y=a,typeof a=="function")Es(a)&&(k=1);else if(typeof a=="string")k=An&&Ht?Gs(a,f,Ra.current)?26:Oi(a)?27:5:An?Gs(a,f,Ra.current)?26:5:Ht&&Oi(a)?27:5;else e:switch(a){case Vr:return ia(f.children,S,M,r);case Os:k=8,S|=24;break;case Do:return a=u(12,f,r,S|2),a.elementType=Do,a.lanes=M,a;case zo:return a=u(13,f,r,S),a.elementType=zo,a.lanes=M,a;case pu:return a=u(19,f,r,S),a.elementType=pu,a.lanes=M,a;case Rf:return Ts(f,S,M,r);default:if(typeof a=="object"&&a!==null)switch(a.$$typeof){case Ms:case ui:k=10;break e;case Af:k=9;break e;case ws:k=11;break e;case Uo:k=14;break e;case Pn:k=16,y=null;break e}k=29,f=Error(c(130,a===null?"null":typeof a,"")),y=null}return r=u(k,f,r,S),r.elementType=a,r.type=y,r.lanes=M,r}function ia(a,r,f,y){return a=u(7,a,y,r),a.lanes=f,a}function Ts(a,r,f,y){a=u(22,a,y,r),a.elementType=Rf,a.lanes=f;var S={_visibility:1,_pendingVisibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null,_current:null,detach:function(){var M=S._current;if(M===null)throw Error(c(456));if((S._pendingVisibility&2)===0){var k=we(M,2);k!==null&&(S._pendingVisibility|=2,Ua(k,M,2))}},attach:function(){var M=S._current;if(M===null)throw Error(c(456));if((S._pendingVisibility&2)!==0){var k=we(M,2);k!==null&&(S._pendingVisibility&=-3,Ua(k,M,2))}}};return a.stateNode=S,a}function Mo(a,r,f){return a=u(6,a,null,r),a.lanes=f,a}function Tf(a,r,f){return r=u(4,a.children!==null?a.children:[],a.key,r),r.lanes=f,r.stateNode={containerInfo:a.containerInfo,pendingChildren:null,implementation:a.implementation},r}function Y1(a,r,f,y,S,M,k,ee){this.tag=1,this.containerInfo=a,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=Yr,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=V(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.finishedLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=V(0),this.hiddenUpdates=V(null),this.identifierPrefix=y,this.onUncaughtError=S,this.onCaughtError=M,this.onRecoverableError=k,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=ee,this.incompleteTransitions=new Map}function Qd(a,r,f,y,S,M,k,ee,se,be,Oe,De){return a=new Y1(a,r,f,k,ee,se,be,De),r=1,M===!0&&(r|=24),M=u(3,null,null,r),a.current=M,M.stateNode=a,r=Nr(),r.refCount++,a.pooledCache=r,r.refCount++,M.memoizedState={element:y,isDehydrated:f,cache:r},ka(M),a}function _a(a){return a?(a=kr,a):kr}function wo(a){var r=a._reactInternals;if(r===void 0)throw typeof a.render=="function"?Error(c(188)):(a=Object.keys(a).join(","),Error(c(268,a)));return a=x(r),a=a!==null?E(a):null,a===null?null:yu(a.stateNode)}function hu(a,r,f,y,S,M){S=_a(S),y.context===null?y.context=S:y.pendingContext=S,y=mt(r),y.payload={element:f},M=M===void 0?null:M,M!==null&&(y.callback=M),f=yt(a,y,r),f!==null&&(Ua(f,a,r),He(f,a,r))}function du(a,r){if(a=a.memoizedState,a!==null&&a.dehydrated!==null){var f=a.retryLane;a.retryLane=f!==0&&f<r?f:r}}function As(a,r){du(a,r),(a=a.alternate)&&du(a,r)}var tt={},gu=Fu(),Tn=dw(),No=Object.assign,P1=Symbol.for("react.element"),Rs=Symbol.for("react.transitional.element"),Yn=Symbol.for("react.portal"),Vr=Symbol.for("react.fragment"),Os=Symbol.for("react.strict_mode"),Do=Symbol.for("react.profiler"),Ms=Symbol.for("react.provider"),Af=Symbol.for("react.consumer"),ui=Symbol.for("react.context"),ws=Symbol.for("react.forward_ref"),zo=Symbol.for("react.suspense"),pu=Symbol.for("react.suspense_list"),Uo=Symbol.for("react.memo"),Pn=Symbol.for("react.lazy"),Rf=Symbol.for("react.offscreen"),Zd=Symbol.for("react.memo_cache_sentinel"),nr=Symbol.iterator,Of=Symbol.for("react.client.reference"),ke=gu.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,Ri,ir,_l=!1,vu=Array.isArray,Mf=i.rendererVersion,Ns=i.rendererPackageName,mu=i.extraDevToolsConfig,yu=i.getPublicInstance,Jd=i.getRootHostContext,bu=i.getChildHostContext,Go=i.prepareForCommit,Wd=i.resetAfterCommit,wf=i.createInstance,Ds=i.appendInitialChild,rr=i.finalizeInitialChildren,at=i.shouldSetTextContent,Ut=i.createTextInstance,Sa=i.scheduleTimeout,qo=i.cancelTimeout,Yr=i.noTimeout,ln=i.isPrimaryRenderer;i.warnsIfNotActing;var Aa=i.supportsMutation,Xn=i.supportsPersistence,Xa=i.supportsHydration,Id=i.getInstanceFromNode;i.beforeActiveInstanceBlur,i.afterActiveInstanceBlur;var ha=i.preparePortalMount;i.prepareScopeUpdate,i.getInstanceFromScope;var Ja=i.setCurrentUpdatePriority,lr=i.getCurrentUpdatePriority,$d=i.resolveUpdatePriority;i.resolveEventType,i.resolveEventTimeStamp;var e0=i.shouldAttemptEagerTransition,X1=i.detachDeletedInstance;i.requestPostPaintCallback;var Nf=i.maySuspendCommit,Ho=i.preloadInstance,Df=i.startSuspendingCommit,un=i.suspendInstance,xa=i.waitForCommitToBeReady,Pr=i.NotPendingTransition,si=i.HostTransitionContext,Bo=i.resetFormInstance;i.bindToConsole;var zf=i.supportsMicrotasks,ur=i.scheduleMicrotask,Xr=i.supportsTestSelectors,Uf=i.findFiberRoot,Gf=i.getBoundingRect,t0=i.getTextContent,_u=i.isHiddenSubtree,a0=i.matchAccessibilityRole,n0=i.setFocusIfFocusable,i0=i.setupIntersectionObserver,r0=i.appendChild,qf=i.appendChildToContainer,l0=i.commitTextUpdate,K1=i.commitMount,u0=i.commitUpdate,s0=i.insertBefore,o0=i.insertInContainerBefore,Hf=i.removeChild,c0=i.removeChildFromContainer,Bf=i.resetTextContent,f0=i.hideInstance,h0=i.hideTextInstance,d0=i.unhideInstance,F1=i.unhideTextInstance,g0=i.clearContainer,Su=i.cloneInstance,zs=i.createContainerChildSet,Lf=i.appendChildToContainerChildSet,Lo=i.finalizeContainerChildren,xu=i.replaceContainerChildren,jf=i.cloneHiddenInstance,Vf=i.cloneHiddenTextInstance,jo=i.isSuspenseInstancePending,Vo=i.isSuspenseInstanceFallback,p0=i.getSuspenseInstanceFallbackErrorDetails,v0=i.registerSuspenseInstanceRetry,Yf=i.canHydrateFormStateMarker,m0=i.isFormStateMarkerMatching,Pf=i.getNextHydratableSibling,Yo=i.getFirstHydratableChild,y0=i.getFirstHydratableChildWithinContainer,b0=i.getFirstHydratableChildWithinSuspenseInstance,k1=i.canHydrateInstance,Xf=i.canHydrateTextInstance,_0=i.canHydrateSuspenseInstance,S0=i.hydrateInstance,Kf=i.hydrateTextInstance,x0=i.hydrateSuspenseInstance,E0=i.getNextHydratableInstanceAfterSuspenseInstance,Q1=i.commitHydratedContainer,Z1=i.commitHydratedSuspenseInstance,C0=i.clearSuspenseBoundary,Us=i.clearSuspenseBoundaryFromContainer,Po=i.shouldDeleteUnhydratedTailInstances;i.diffHydratedPropsForDevWarnings,i.diffHydratedTextForDevWarnings,i.describeHydratableInstanceForDevWarnings;var Xo=i.validateHydratableInstance,T0=i.validateHydratableTextInstance,An=i.supportsResources,Gs=i.isHostHoistableType,Ko=i.getHoistableRoot,Ff=i.getResource,A0=i.acquireResource,Sl=i.releaseResource,qs=i.hydrateHoistable,Hs=i.mountHoistable,Eu=i.unmountHoistable,Fo=i.createHoistableInstance,R0=i.prepareToCommitHoistables,O0=i.mayResourceSuspendCommit,xl=i.preloadResource,M0=i.suspendResource,Ht=i.supportsSingletons,oi=i.resolveSingletonInstance,Kr=i.clearSingleton,w0=i.acquireSingletonInstance,Fr=i.releaseSingletonInstance,Oi=i.isHostSingletonType,da=[],sr=-1,kr={},sn=Math.clz32?Math.clz32:R,N0=Math.log,D0=Math.LN2,Mi=128,El=4194304,Bs=Tn.unstable_scheduleCallback,ko=Tn.unstable_cancelCallback,z0=Tn.unstable_shouldYield,Qo=Tn.unstable_requestPaint,Kn=Tn.unstable_now,Zo=Tn.unstable_ImmediatePriority,U0=Tn.unstable_UserBlockingPriority,Jo=Tn.unstable_NormalPriority,J1=Tn.unstable_IdlePriority,G0=Tn.log,Ga=Tn.unstable_setDisableYieldValue,ga=null,bn=null,_n=typeof Object.is=="function"?Object.is:Z,kf=new WeakMap,Cl=[],Tl=0,Al=null,Cu=0,Rn=[],On=0,Qr=null,ci=1,fi="",Ra=w(null),Tu=w(null),wi=w(null),Rl=w(null),Ka=null,Fa=null,bt=!1,Fn=null,qa=!1,Ls=Error(c(519)),kn=[],Ol=0,hi=0,js=null,or=null,Ml=!1,Yt=!1,Qf=!1,Au=0,Ru=null,wl=0,Mn=0,Nl=null,cr=!1,Dl=!1,Ni=Object.prototype.hasOwnProperty,Ou=Error(c(460)),Vs=Error(c(474)),Ys={then:function(){}},Zr=null,Jr=null,Wr=0,Ir=Pi(!0),Di=Pi(!1),Pt=w(null),Mu=w(0),wn=w(null),Bt=null,Oa=w(0),fr=0,rt=null,Ye=null,St=null,Qn=!1,zl=!1,$r=!1,Wo=0,Ul=0,Ha=null,di=0,Io=function(){return{lastEffect:null,events:null,stores:null,memoCache:null}},ra={readContext:ja,use:Wu,useCallback:$t,useContext:$t,useEffect:$t,useImperativeHandle:$t,useLayoutEffect:$t,useInsertionEffect:$t,useMemo:$t,useReducer:$t,useRef:$t,useState:$t,useDebugValue:$t,useDeferredValue:$t,useTransition:$t,useSyncExternalStore:$t,useId:$t};ra.useCacheRefresh=$t,ra.useMemoCache=$t,ra.useHostTransitionStatus=$t,ra.useFormState=$t,ra.useActionState=$t,ra.useOptimistic=$t;var el={readContext:ja,use:Wu,useCallback:function(a,r){return Ta().memoizedState=[a,r===void 0?null:r],a},useContext:ja,useEffect:so,useImperativeHandle:function(a,r,f){f=f!=null?f.concat([a]):null,ts(4194308,4,oo.bind(null,r,a),f)},useLayoutEffect:function(a,r){return ts(4194308,4,a,r)},useInsertionEffect:function(a,r){ts(4,2,a,r)},useMemo:function(a,r){var f=Ta();r=r===void 0?null:r;var y=a();if($r){L(!0);try{a()}finally{L(!1)}}return f.memoizedState=[y,r],y},useReducer:function(a,r,f){var y=Ta();if(f!==void 0){var S=f(r);if($r){L(!0);try{f(r)}finally{L(!1)}}}else S=r;return y.memoizedState=y.baseState=S,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:a,lastRenderedState:S},y.queue=a,a=a.dispatch=fo.bind(null,rt,a),[y.memoizedState,a]},useRef:function(a){var r=Ta();return a={current:a},r.memoizedState=a},useState:function(a){a=hn(a);var r=a.queue,f=$c.bind(null,rt,r);return r.dispatch=f,[a.memoizedState,f]},useDebugValue:Ar,useDeferredValue:function(a,r){var f=Ta();return is(f,a,r)},useTransition:function(){var a=hn(!1);return a=Jl.bind(null,rt,a.queue,!0,!1),Ta().memoizedState=a,[!1,a]},useSyncExternalStore:function(a,r,f){var y=rt,S=Ta();if(bt){if(f===void 0)throw Error(c(407));f=f()}else{if(f=r(),wt===null)throw Error(c(349));(dt&60)!==0||gl(y,r,f)}S.memoizedState=f;var M={value:f,getSnapshot:r};return S.queue=M,so(ro.bind(null,y,M,a),[a]),y.flags|=2048,ii(9,io.bind(null,y,M,f,r),{destroy:void 0},null),f},useId:function(){var a=Ta(),r=wt.identifierPrefix;if(bt){var f=fi,y=ci;f=(y&~(1<<32-sn(y)-1)).toString(32)+f,r=":"+r+"R"+f,f=Wo++,0<f&&(r+="H"+f.toString(32)),r+=":"}else f=di++,r=":"+r+"r"+f.toString(32)+":";return a.memoizedState=r},useCacheRefresh:function(){return Ta().memoizedState=Ic.bind(null,rt)}};el.useMemoCache=Vc,el.useHostTransitionStatus=rs,el.useFormState=kc,el.useActionState=kc,el.useOptimistic=function(a){var r=Ta();r.memoizedState=r.baseState=a;var f={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return r.queue=f,r=Il.bind(null,rt,!0,f),f.dispatch=r,[a,r]};var on={readContext:ja,use:Wu,useCallback:vl,useContext:ja,useEffect:Zc,useImperativeHandle:co,useInsertionEffect:Rd,useLayoutEffect:ns,useMemo:Jc,useReducer:dl,useRef:Ad,useState:function(){return dl(Bn)},useDebugValue:Ar,useDeferredValue:function(a,r){var f=ba();return Wc(f,Ye.memoizedState,a,r)},useTransition:function(){var a=dl(Bn)[0],r=ba().memoizedState;return[typeof a=="boolean"?a:Zl(a),r]},useSyncExternalStore:Yc,useId:Wl};on.useCacheRefresh=Ki,on.useMemoCache=Vc,on.useHostTransitionStatus=rs,on.useFormState=uo,on.useActionState=uo,on.useOptimistic=function(a,r){var f=ba();return Xc(f,Ye,a,r)};var Nn={readContext:ja,use:Wu,useCallback:vl,useContext:ja,useEffect:Zc,useImperativeHandle:co,useInsertionEffect:Rd,useLayoutEffect:ns,useMemo:Jc,useReducer:Iu,useRef:Ad,useState:function(){return Iu(Bn)},useDebugValue:Ar,useDeferredValue:function(a,r){var f=ba();return Ye===null?is(f,a,r):Wc(f,Ye.memoizedState,a,r)},useTransition:function(){var a=Iu(Bn)[0],r=ba().memoizedState;return[typeof a=="boolean"?a:Zl(a),r]},useSyncExternalStore:Yc,useId:Wl};Nn.useCacheRefresh=Ki,Nn.useMemoCache=Vc,Nn.useHostTransitionStatus=rs,Nn.useFormState=Qc,Nn.useActionState=Qc,Nn.useOptimistic=function(a,r){var f=ba();return Ye!==null?Xc(f,Ye,a,r):(f.baseState=a,[a,f.queue.dispatch])};var zi={isMounted:function(a){return(a=a._reactInternals)?T(a)===a:!1},enqueueSetState:function(a,r,f){a=a._reactInternals;var y=fa(),S=mt(y);S.payload=r,f!=null&&(S.callback=f),r=yt(a,S,y),r!==null&&(Ua(r,a,y),He(r,a,y))},enqueueReplaceState:function(a,r,f){a=a._reactInternals;var y=fa(),S=mt(y);S.tag=1,S.payload=r,f!=null&&(S.callback=f),r=yt(a,S,y),r!==null&&(Ua(r,a,y),He(r,a,y))},enqueueForceUpdate:function(a,r){a=a._reactInternals;var f=fa(),y=mt(f);y.tag=2,r!=null&&(y.callback=r),r=yt(a,y,f),r!==null&&(Ua(r,a,f),He(r,a,f))}},$o=typeof reportError=="function"?reportError:function(a){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var r=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof a=="object"&&a!==null&&typeof a.message=="string"?String(a.message):String(a),error:a});if(!window.dispatchEvent(r))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",a);return}console.error(a)},ec=Error(c(461)),Lt=!1,tc={dehydrated:null,treeContext:null,retryLane:0},hr=w(null),gi=null,Dn=null,wu=typeof AbortController<"u"?AbortController:function(){var a=[],r=this.signal={aborted:!1,addEventListener:function(f,y){a.push(y)}};this.abort=function(){r.aborted=!0,a.forEach(function(f){return f()})}},q0=Tn.unstable_scheduleCallback,H0=Tn.unstable_NormalPriority,Xt={$$typeof:ui,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0},Zf=ke.S;ke.S=function(a,r){typeof r=="object"&&r!==null&&typeof r.then=="function"&&Fe(a,r),Zf!==null&&Zf(a,r)};var Ui=w(null),Gi=!1,la=!1,Jf=!1,Mt=typeof WeakSet=="function"?WeakSet:Set,We=null,st=!1,Ve=null,nt=!1,ta=null,zn=8192,Nu={getCacheForType:function(a){var r=ja(Xt),f=r.data.get(a);return f===void 0&&(f=a(),r.data.set(a,f)),f}},Du=0,Zn=1,kt=2,pi=3,qi=4;if(typeof Symbol=="function"&&Symbol.for){var Gl=Symbol.for;Du=Gl("selector.component"),Zn=Gl("selector.has_pseudo_class"),kt=Gl("selector.role"),pi=Gl("selector.test_id"),qi=Gl("selector.text")}var Jn=typeof WeakMap=="function"?WeakMap:Map,xt=0,wt=null,Pe=null,dt=0,qt=0,Wa=null,Wn=!1,Un=!1,Ma=!1,Ia=0,jt=0,Gn=0,dr=0,Ps=0,qn=0,Hi=0,ql=null,ua=null,ac=!1,cn=0,zu=1/0,Xs=null,tl=null,vi=!1,Bi=null,Hl=0,al=0,nc=null,Uu=0,ic=null;return tt.attemptContinuousHydration=function(a){if(a.tag===13){var r=we(a,67108864);r!==null&&Ua(r,a,67108864),As(a,67108864)}},tt.attemptHydrationAtCurrentPriority=function(a){if(a.tag===13){var r=fa(),f=we(a,r);f!==null&&Ua(f,a,r),As(a,r)}},tt.attemptSynchronousHydration=function(a){switch(a.tag){case 3:if(a=a.stateNode,a.current.memoizedState.isDehydrated){var r=z(a.pendingLanes);if(r!==0){for(a.pendingLanes|=2,a.entangledLanes|=2;r;){var f=1<<31-sn(r);a.entanglements[1]|=f,r&=~f}Rt(a),(xt&6)===0&&(zu=Kn()+500,Vt(0))}}break;case 13:r=we(a,2),r!==null&&Ua(r,a,2),xs(),As(a,2)}},tt.batchedUpdates=function(a,r){return a(r)},tt.createComponentSelector=function(a){return{$$typeof:Du,value:a}},tt.createContainer=function(a,r,f,y,S,M,k,ee,se,be){return Qd(a,r,!1,null,f,y,M,k,ee,se,be,null)},tt.createHasPseudoClassSelector=function(a){return{$$typeof:Zn,value:a}},tt.createHydrationContainer=function(a,r,f,y,S,M,k,ee,se,be,Oe,De,Ue){return a=Qd(f,y,!0,a,S,M,ee,se,be,Oe,De,Ue),a.context=_a(null),f=a.current,y=fa(),S=mt(y),S.callback=r??null,yt(f,S,y),a.current.lanes=y,F(a,y),Rt(a),a},tt.createPortal=function(a,r,f){var y=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:Yn,key:y==null?null:""+y,children:a,containerInfo:r,implementation:f}},tt.createRoleSelector=function(a){return{$$typeof:kt,value:a}},tt.createTestNameSelector=function(a){return{$$typeof:pi,value:a}},tt.createTextSelector=function(a){return{$$typeof:qi,value:a}},tt.defaultOnCaughtError=function(a){console.error(a)},tt.defaultOnRecoverableError=function(a){$o(a)},tt.defaultOnUncaughtError=function(a){$o(a)},tt.deferredUpdates=function(a){var r=ke.T,f=lr();try{return Ja(32),ke.T=null,a()}finally{Ja(f),ke.T=r}},tt.discreteUpdates=function(a,r,f,y,S){var M=ke.T,k=lr();try{return Ja(2),ke.T=null,a(r,f,y,S)}finally{Ja(k),ke.T=M,xt===0&&(zu=Kn()+500)}},tt.findAllNodes=_s,tt.findBoundingRects=function(a,r){if(!Xr)throw Error(c(363));r=_s(a,r),a=[];for(var f=0;f<r.length;f++)a.push(Gf(r[f]));for(r=a.length-1;0<r;r--){f=a[r];for(var y=f.x,S=y+f.width,M=f.y,k=M+f.height,ee=r-1;0<=ee;ee--)if(r!==ee){var se=a[ee],be=se.x,Oe=be+se.width,De=se.y,Ue=De+se.height;if(y>=be&&M>=De&&S<=Oe&&k<=Ue){a.splice(r,1);break}else if(y!==be||f.width!==se.width||Ue<M||De>k){if(!(M!==De||f.height!==se.height||Oe<y||be>S)){be>y&&(se.width+=be-y,se.x=y),Oe<S&&(se.width=S-be),a.splice(r,1);break}}else{De>M&&(se.height+=De-M,se.y=M),Ue<k&&(se.height=k-De),a.splice(r,1);break}}}return a},tt.findHostInstance=wo,tt.findHostInstanceWithNoPortals=function(a){return a=x(a),a=a!==null?O(a):null,a===null?null:yu(a.stateNode)},tt.findHostInstanceWithWarning=function(a){return wo(a)},tt.flushPassiveEffects=li,tt.flushSyncFromReconciler=function(a){var r=xt;xt|=1;var f=ke.T,y=lr();try{if(Ja(2),ke.T=null,a)return a()}finally{Ja(y),ke.T=f,xt=r,(xt&6)===0&&Vt(0)}},tt.flushSyncWork=xs,tt.focusWithin=function(a,r){if(!Xr)throw Error(c(363));for(a=su(a),r=mn(a,r),r=Array.from(r),a=0;a<r.length;){var f=r[a++],y=f.tag;if(!_u(f)){if((y===5||y===26||y===27)&&n0(f.stateNode))return!0;for(f=f.child;f!==null;)r.push(f),f=f.sibling}}return!1},tt.getFindAllNodesFailureDescription=function(a,r){if(!Xr)throw Error(c(363));var f=0,y=[];a=[su(a),0];for(var S=0;S<a.length;){var M=a[S++],k=M.tag,ee=a[S++],se=r[ee];if((k!==5&&k!==26&&k!==27||!_u(M))&&(Gr(M,se)&&(y.push(yf(se)),ee++,ee>f&&(f=ee)),ee<r.length))for(M=M.child;M!==null;)a.push(M,ee),M=M.sibling}if(f<r.length){for(a=[];f<r.length;f++)a.push(yf(r[f]));return`findAllNodes was able to match part of the selector:
-  `+(y.join(" > ")+`
-
-No matching component was found for:
-  `)+a.join(" > ")}return null},tt.getPublicRootInstance=function(a){if(a=a.current,!a.child)return null;switch(a.child.tag){case 27:case 5:return yu(a.child.stateNode);default:return a.child.stateNode}},tt.injectIntoDevTools=function(){var a={bundleType:0,version:Mf,rendererPackageName:Ns,currentDispatcherRef:ke,findFiberByHostInstance:Id,reconcilerVersion:"19.0.0"};if(mu!==null&&(a.rendererConfig=mu),typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u")a=!1;else{var r=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(r.isDisabled||!r.supportsFiber)a=!0;else{try{ga=r.inject(a),bn=r}catch{}a=!!r.checkDCE}}return a},tt.isAlreadyRendering=function(){return!1},tt.observeVisibleRects=function(a,r,f,y){if(!Xr)throw Error(c(363));a=_s(a,r);var S=i0(a,f,y).disconnect;return{disconnect:function(){S()}}},tt.shouldError=function(){return null},tt.shouldSuspend=function(){return!1},tt.startHostTransition=function(a,r,f,y){if(a.tag!==5)throw Error(c(476));var S=Ei(a).queue;Jl(a,S,r,Pr,f===null?s:function(){var M=Ei(a).next.queue;return Rr(a,M,{},fa()),f(y)})},tt.updateContainer=function(a,r,f,y){var S=r.current,M=fa();return hu(S,M,a,r,f,y),M},tt.updateContainerSync=function(a,r,f,y){return r.tag===0&&li(),hu(r.current,2,a,r,f,y),2},tt},n.exports.default=n.exports,Object.defineProperty(n.exports,"__esModule",{value:!0})}(j2)),j2.exports}var o_;function pw(){return o_||(o_=1,L2.exports=gw()),L2.exports}var vw=pw();const mw=Ku(vw);var P2={exports:{}},Yl={};/**
- * @license React
- * react-reconciler-constants.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var c_;function yw(){return c_||(c_=1,Yl.ConcurrentRoot=1,Yl.ContinuousEventPriority=8,Yl.DefaultEventPriority=32,Yl.DiscreteEventPriority=2,Yl.IdleEventPriority=268435456,Yl.LegacyRoot=0,Yl.NoEventPriority=0),Yl}var f_;function bw(){return f_||(f_=1,P2.exports=yw()),P2.exports}var q1=bw(),_w=ct();const h_={children:!0,ref:!0,key:!0,style:!0,forwardedRef:!0,unstable_applyCache:!0,unstable_applyDrawHitFromCache:!0};let d_=!1,g_=!1;const ly=".react-konva-event",Sw=`ReactKonva: You have a Konva node with draggable = true and position defined but no onDragMove or onDragEnd events are handled.
-Position of a node will be changed during drag&drop, so you should update state of the react app as well.
-Consider to add onDragMove or onDragEnd events.
-For more info see: https://github.com/konvajs/react-konva/issues/256
-`,xw=`ReactKonva: You are using "zIndex" attribute for a Konva node.
-react-konva may get confused with ordering. Just define correct order of elements in your render function of a component.
-For more info see: https://github.com/konvajs/react-konva/issues/194
-`,Ew={};function H1(n,i,u=Ew){if(!d_&&"zIndex"in i&&(console.warn(xw),d_=!0),!g_&&i.draggable){var s=i.x!==void 0||i.y!==void 0,c=i.onDragEnd||i.onDragMove;s&&!c&&(console.warn(Sw),g_=!0)}for(var h in u)if(!h_[h]){var d=h.slice(0,2)==="on",g=u[h]!==i[h];if(d&&g){var v=h.substr(2).toLowerCase();v.substr(0,7)==="content"&&(v="content"+v.substr(7,1).toUpperCase()+v.substr(8)),n.off(v,u[h])}var p=!i.hasOwnProperty(h);p&&n.setAttr(h,void 0)}var _=i._useStrictMode,T={},C=!1;const x={};for(var h in i)if(!h_[h]){var d=h.slice(0,2)==="on",E=u[h]!==i[h];if(d&&E){var v=h.substr(2).toLowerCase();v.substr(0,7)==="content"&&(v="content"+v.substr(7,1).toUpperCase()+v.substr(8)),i[h]&&(x[v]=i[h])}!d&&(i[h]!==u[h]||_&&i[h]!==n.getAttr(h))&&(C=!0,T[h]=i[h])}C&&(n.setAttrs(T),Qu(n));for(var v in x)n.on(v+ly,x[v])}function Qu(n){if(!_w.Konva.autoDrawEnabled){var i=n.getLayer()||n.getStage();i&&i.batchDraw()}}var X2={exports:{}},K2={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var p_;function Cw(){return p_||(p_=1,function(n){function i(N,L){var Z=N.length;N.push(L);e:for(;0<Z;){var ae=Z-1>>>1,j=N[ae];if(0<c(j,L))N[ae]=L,N[Z]=j,Z=ae;else break e}}function u(N){return N.length===0?null:N[0]}function s(N){if(N.length===0)return null;var L=N[0],Z=N.pop();if(Z!==L){N[0]=Z;e:for(var ae=0,j=N.length,te=j>>>1;ae<te;){var de=2*(ae+1)-1,ne=N[de],ce=de+1,Se=N[ce];if(0>c(ne,Z))ce<j&&0>c(Se,ne)?(N[ae]=Se,N[ce]=Z,ae=ce):(N[ae]=ne,N[de]=Z,ae=de);else if(ce<j&&0>c(Se,Z))N[ae]=Se,N[ce]=Z,ae=ce;else break e}}return L}function c(N,L){var Z=N.sortIndex-L.sortIndex;return Z!==0?Z:N.id-L.id}if(n.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var h=performance;n.unstable_now=function(){return h.now()}}else{var d=Date,g=d.now();n.unstable_now=function(){return d.now()-g}}var v=[],p=[],_=1,T=null,C=3,x=!1,E=!1,O=!1,w=typeof setTimeout=="function"?setTimeout:null,U=typeof clearTimeout=="function"?clearTimeout:null,A=typeof setImmediate<"u"?setImmediate:null;function R(N){for(var L=u(p);L!==null;){if(L.callback===null)s(p);else if(L.startTime<=N)s(p),L.sortIndex=L.expirationTime,i(v,L);else break;L=u(p)}}function z(N){if(O=!1,R(N),!E)if(u(v)!==null)E=!0,P();else{var L=u(p);L!==null&&H(z,L.startTime-N)}}var G=!1,B=-1,Q=5,X=-1;function Y(){return!(n.unstable_now()-X<Q)}function V(){if(G){var N=n.unstable_now();X=N;var L=!0;try{e:{E=!1,O&&(O=!1,U(B),B=-1),x=!0;var Z=C;try{t:{for(R(N),T=u(v);T!==null&&!(T.expirationTime>N&&Y());){var ae=T.callback;if(typeof ae=="function"){T.callback=null,C=T.priorityLevel;var j=ae(T.expirationTime<=N);if(N=n.unstable_now(),typeof j=="function"){T.callback=j,R(N),L=!0;break t}T===u(v)&&s(v),R(N)}else s(v);T=u(v)}if(T!==null)L=!0;else{var te=u(p);te!==null&&H(z,te.startTime-N),L=!1}}break e}finally{T=null,C=Z,x=!1}L=void 0}}finally{L?F():G=!1}}}var F;if(typeof A=="function")F=function(){A(V)};else if(typeof MessageChannel<"u"){var I=new MessageChannel,D=I.port2;I.port1.onmessage=V,F=function(){D.postMessage(null)}}else F=function(){w(V,0)};function P(){G||(G=!0,F())}function H(N,L){B=w(function(){N(n.unstable_now())},L)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(N){N.callback=null},n.unstable_continueExecution=function(){E||x||(E=!0,P())},n.unstable_forceFrameRate=function(N){0>N||125<N?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Q=0<N?Math.floor(1e3/N):5},n.unstable_getCurrentPriorityLevel=function(){return C},n.unstable_getFirstCallbackNode=function(){return u(v)},n.unstable_next=function(N){switch(C){case 1:case 2:case 3:var L=3;break;default:L=C}var Z=C;C=L;try{return N()}finally{C=Z}},n.unstable_pauseExecution=function(){},n.unstable_requestPaint=function(){},n.unstable_runWithPriority=function(N,L){switch(N){case 1:case 2:case 3:case 4:case 5:break;default:N=3}var Z=C;C=N;try{return L()}finally{C=Z}},n.unstable_scheduleCallback=function(N,L,Z){var ae=n.unstable_now();switch(typeof Z=="object"&&Z!==null?(Z=Z.delay,Z=typeof Z=="number"&&0<Z?ae+Z:ae):Z=ae,N){case 1:var j=-1;break;case 2:j=250;break;case 5:j=1073741823;break;case 4:j=1e4;break;default:j=5e3}return j=Z+j,N={id:_++,callback:L,priorityLevel:N,startTime:Z,expirationTime:j,sortIndex:-1},Z>ae?(N.sortIndex=Z,i(p,N),u(v)===null&&N===u(p)&&(O?(U(B),B=-1):O=!0,H(z,Z-ae))):(N.sortIndex=j,i(v,N),E||x||(E=!0,P())),N},n.unstable_shouldYield=Y,n.unstable_wrapCallback=function(N){var L=C;return function(){var Z=C;C=L;try{return N.apply(this,arguments)}finally{C=Z}}}}(K2)),K2}var v_;function Tw(){return v_||(v_=1,X2.exports=Cw()),X2.exports}var F2=Tw();const X8={},Aw={};v1.Node.prototype._applyProps=H1;let K8=q1.DefaultEventPriority;function Rw(n,i){if(typeof i=="string"){console.error(`Do not use plain text as child of Konva.Node. You are using text: ${i}`);return}n.add(i),Qu(n)}function Ow(n,i,u){let s=v1[n];s||(console.error(`Konva has no node with the type ${n}. Group will be used instead. If you use minimal version of react-konva, just import required nodes into Konva: "import "konva/lib/shapes/${n}"  If you want to render DOM elements as part of canvas tree take a look into this demo: https://konvajs.github.io/docs/react/DOM_Portal.html`),s=v1.Group);const c={},h={};for(var d in i){var g=d.slice(0,2)==="on";g?h[d]=i[d]:c[d]=i[d]}const v=new s(c);return H1(v,h),v}function Mw(n,i,u){console.error(`Text components are not supported for now in ReactKonva. Your text is: "${n}"`)}function ww(n,i,u){return!1}function Nw(n){return n}function Dw(){return null}function zw(){return null}function Uw(n,i,u,s){return Aw}function Gw(){}function qw(n){}function Hw(n,i){return!1}function Bw(){return X8}function Lw(){return X8}const jw=setTimeout,Vw=clearTimeout,Yw=!0,Pw=n=>{n()},Xw=-1;function Kw(n,i){return!1}const Fw=!1,kw=!1,Qw=!0,Zw=!1,Jw=!1;function Ww(n,i){i.parent===n?i.moveToTop():n.add(i),Qu(n)}function Iw(n,i){i.parent===n?i.moveToTop():n.add(i),Qu(n)}function F8(n,i,u){i._remove(),n.add(i),i.setZIndex(u.getZIndex()),Qu(n)}function $w(n,i,u){F8(n,i,u)}function eN(n,i){i.destroy(),i.off(ly),Qu(n)}function tN(n,i){i.destroy(),i.off(ly),Qu(n)}function aN(n,i,u){console.error(`Text components are not yet supported in ReactKonva. You text is: "${u}"`)}function nN(n,i,u){}function iN(n,i,u,s){H1(n,s,u)}function rN(n){n.hide(),Qu(n)}function lN(n){}function uN(n,i){(i.visible==null||i.visible)&&n.show()}function sN(n,i){}function oN(n){}function cN(){}function fN(){return q1.DefaultEventPriority}function hN(){}function dN(){return null}function gN(n){K8=n}function pN(){return K8}function vN(){return q1.DiscreteEventPriority}function mN(){return!1}function yN(){}function bN(){return!1}function _N(){return!0}function SN(){}function xN(){}function EN(){return null}const CN=null;function TN(){}const AN=Object.freeze(Object.defineProperty({__proto__:null,NotPendingTransition:CN,appendChild:Ww,appendChildToContainer:Iw,appendInitialChild:Rw,cancelTimeout:Vw,clearContainer:oN,commitMount:nN,commitTextUpdate:aN,commitUpdate:iN,createInstance:Ow,createTextInstance:Mw,detachDeletedInstance:cN,finalizeInitialChildren:ww,getChildHostContext:Lw,getCurrentEventPriority:fN,getCurrentUpdatePriority:pN,getInstanceFromScope:dN,getPublicInstance:Nw,getRootHostContext:Bw,hideInstance:rN,hideTextInstance:lN,idlePriority:F2.unstable_IdlePriority,insertBefore:F8,insertInContainerBefore:$w,isPrimaryRenderer:Fw,maySuspendCommit:bN,noTimeout:Xw,now:F2.unstable_now,preloadInstance:_N,prepareForCommit:Dw,preparePortalMount:zw,prepareScopeUpdate:hN,prepareUpdate:Uw,removeChild:eN,removeChildFromContainer:tN,requestPostPaintCallback:yN,resetAfterCommit:Gw,resetFormInstance:TN,resetTextContent:qw,resolveUpdatePriority:vN,run:F2.unstable_runWithPriority,scheduleMicrotask:Pw,scheduleTimeout:jw,setCurrentUpdatePriority:gN,shouldAttemptEagerTransition:mN,shouldDeprioritizeSubtree:Hw,shouldSetTextContent:Kw,startSuspendingCommit:SN,supportsHydration:Jw,supportsMicrotasks:Yw,supportsMutation:Qw,supportsPersistence:Zw,suspendInstance:xN,unhideInstance:uN,unhideTextInstance:sN,waitForCommitToBeReady:EN,warnsIfNotActing:kw},Symbol.toStringTag,{value:"Module"}));function k8(n,i,u){if(!n)return;if(u(n)===!0)return n;let s=n.child;for(;s;){const c=k8(s,i,u);if(c)return c;s=s.sibling}}function Q8(n){try{return Object.defineProperties(n,{_currentRenderer:{get(){return null},set(){}},_currentRenderer2:{get(){return null},set(){}}})}catch{return n}}const uy=Q8(ue.createContext(null));class Z8 extends ue.Component{render(){return ue.createElement(uy.Provider,{value:this._reactInternals},this.props.children)}}function RN(){const n=ue.useContext(uy);if(n===null)throw new Error("its-fine: useFiber must be called within a <FiberProvider />!");const i=ue.useId();return ue.useMemo(()=>{for(const u of[n,n==null?void 0:n.alternate]){if(!u)continue;const s=k8(u,!1,c=>{let h=c.memoizedState;for(;h;){if(h.memoizedState===i)return!0;h=h.next}});if(s)return s}},[n,i])}const ON=Symbol.for("react.context"),MN=n=>n!==null&&typeof n=="object"&&"$$typeof"in n&&n.$$typeof===ON;function wN(){const n=RN(),[i]=ue.useState(()=>new Map);i.clear();let u=n;for(;u;){const s=u.type;MN(s)&&s!==uy&&!i.has(s)&&i.set(s,ue.use(Q8(s))),u=u.return}return i}function NN(){const n=wN();return ue.useMemo(()=>Array.from(n.keys()).reduce((i,u)=>s=>ue.createElement(i,null,ue.createElement(u.Provider,{...s,value:n.get(u)})),i=>ue.createElement(Z8,{...i})),[n])}if(J.version.indexOf("19")===-1)throw new Error("react-konva version 19 is only compatible with React 19. Make sure to have the last version of react-konva and react or downgrade react-konva to version 18.");function DN(n){const i=J.useRef({});return J.useLayoutEffect(()=>{i.current=n}),J.useLayoutEffect(()=>()=>{i.current={}},[]),i.current}const zN=n=>{const i=J.useRef(null),u=J.useRef(null),s=J.useRef(null),c=DN(n),h=NN(),d=g=>{const{forwardedRef:v}=n;v&&(typeof v=="function"?v(g):v.current=g)};return J.useLayoutEffect(()=>(u.current=new v1.Stage({width:n.width,height:n.height,container:i.current}),d(u.current),s.current=cd.createContainer(u.current,q1.ConcurrentRoot,null,!1,null,"",console.error,console.error,console.error,null),cd.updateContainer(J.createElement(h,{},n.children),s.current,null,()=>{}),()=>{d(null),cd.updateContainer(null,s.current,null),u.current.destroy()}),[]),J.useLayoutEffect(()=>{d(u.current),H1(u.current,n,c),cd.updateContainer(J.createElement(h,{},n.children),s.current,null)}),J.createElement("div",{ref:i,id:n.id,accessKey:n.accessKey,className:n.className,role:n.role,style:n.style,tabIndex:n.tabIndex,title:n.title})},UN="Layer",GN="Circle",m_="Line",cd=mw(AN);cd.injectIntoDevTools({findHostInstanceByFiber:()=>null,bundleType:0,version:J.version,rendererPackageName:"react-konva"});const qN=J.forwardRef((n,i)=>J.createElement(Z8,{},J.createElement(zN,{...n,forwardedRef:i}))),HN=({width:n,height:i,strokes:u,onDrawEnd:s,isDrawingEnabled:c,currentTool:h,selectedColor:d,selectedBrushSize:g,className:v})=>{const[p,_]=ue.useState(!1),[T,C]=ue.useState([]),x=ue.useRef(null),[E,O]=ue.useState(!1),[w,U]=ue.useState({x:0,y:0}),A=G=>{if(!c)return;_(!0);const B=x.current;if(!B)return;const Q=B.getPointerPosition();Q&&C([Q.x,Q.y])},R=G=>{const B=x.current;if(!B)return;const Q=B.getPointerPosition();Q&&(c&&U({x:Q.x,y:Q.y}),!(!p||!c)&&C(X=>[...X,Q.x,Q.y]))},z=()=>{if(!p||!c)return;_(!1);let G=[...T];if(G.length===2&&G.push(G[0],G[1]),G.length>=4){const B={id:Date.now().toString(),points:G,tool:h,color:h==="eraser"?"#ffffff":d,width:g};s(B)}C([])};return he.jsx(qN,{width:n,height:i,onMouseDown:A,onMouseMove:R,onMouseUp:z,onMouseEnter:()=>{c&&O(!0)},onMouseLeave:()=>{O(!1),z()},ref:x,style:{touchAction:"none"},className:v,children:he.jsxs(UN,{children:[u.map(G=>he.jsx(m_,{points:G.points,stroke:G.tool==="eraser"?"#ffffff":G.color,strokeWidth:G.width,tension:.5,lineCap:"round",lineJoin:"round",globalCompositeOperation:G.tool==="eraser"?"destination-out":"source-over"},G.id)),p&&T.length>0&&he.jsx(m_,{points:T,stroke:h==="eraser"?"#ffffff":d,strokeWidth:g,tension:.5,lineCap:"round",lineJoin:"round",globalCompositeOperation:h==="eraser"?"destination-out":"source-over"}),E&&c&&he.jsx(GN,{x:w.x,y:w.y,radius:g/2,fill:h==="pen"?d:"rgba(150, 150, 150, 0.3)",stroke:h==="eraser"?"rgba(100, 100, 100, 0.8)":void 0,strokeWidth:h==="eraser"?1:void 0,listening:!1})]})})},BN=({isOpen:n,onClose:i})=>{if(!n)return null;const u={position:"fixed",top:"50%",left:"50%",transform:"translate(-50%, -50%)",backgroundColor:"white",padding:"30px 50px",borderRadius:"10px",boxShadow:"0 5px 15px rgba(0,0,0,0.3)",zIndex:1e3,textAlign:"center"},s={position:"fixed",top:0,left:0,right:0,bottom:0,backgroundColor:"rgba(0,0,0,0.5)",zIndex:999},c={marginTop:"20px",padding:"10px 20px",fontSize:"1em",cursor:"pointer"};return he.jsxs(he.Fragment,{children:[he.jsx("div",{style:s,onClick:i}),he.jsxs("div",{style:u,children:[he.jsx("h2",{children:"Mission Accomplished!"}),he.jsx("p",{children:"Congratulations, team! You've successfully identified all your agents!"}),he.jsx("button",{style:c,onClick:i,children:"Play Again?"})," "]})]})},y_="data:image/svg+xml,%3c?xml%20version='1.0'%20encoding='iso-8859-1'?%3e%3c!--%20Uploaded%20to:%20SVG%20Repo,%20www.svgrepo.com,%20Generator:%20SVG%20Repo%20Mixer%20Tools%20--%3e%3c!DOCTYPE%20svg%20PUBLIC%20'-//W3C//DTD%20SVG%201.1//EN'%20'http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd'%3e%3csvg%20fill='%23000000'%20version='1.1'%20id='Capa_1'%20xmlns='http://www.w3.org/2000/svg'%20xmlns:xlink='http://www.w3.org/1999/xlink'%20width='800px'%20height='800px'%20viewBox='0%200%20209.322%20209.322'%20xml:space='preserve'%3e%3cg%3e%3cpath%20d='M105.572,101.811c9.889-6.368,27.417-16.464,28.106-42.166c0.536-20.278-9.971-49.506-49.155-50.878%20C53.041,7.659,39.9,28.251,36.071,46.739l-0.928-0.126c-1.932,0-3.438,1.28-5.34,2.889c-2.084,1.784-4.683,3.979-7.792,4.308%20c-3.573,0.361-8.111-1.206-11.698-2.449c-4.193-1.431-6.624-2.047-8.265-0.759c-1.503,1.163-2.178,3.262-2.028,6.226%20c0.331,6.326,4.971,18.917,16.016,25.778c7.67,4.765,16.248,5.482,20.681,5.482c0.006,0,0.006,0,0.006,0%20c2.37,0,4.945-0.239,7.388-0.726c2.741,4.218,5.228,7.476,6.037,9.752c2.054,5.851-27.848,25.087-27.848,55.01%20c0,29.916,22.013,48.475,56.727,48.475h55.004c30.593,0,70.814-29.908,75.291-92.48C180.781,132.191,167.028,98.15,105.572,101.811%20z%20M18.941,77.945C8.775,71.617,4.992,58.922,5.294,55.525c0.897,0.24,2.194,0.689,3.228,1.042%20c4.105,1.415,9.416,3.228,14.068,2.707c4.799-0.499,8.253-3.437,10.778-5.574c0.607-0.509,1.393-1.176,1.872-1.491%20c0.87,0.315,0.962,0.693,1.176,3.14c0.196,2.26,0.473,5.37,2.362,9.006c1.437,2.761,3.581,5.705,5.646,8.542%20c1.701,2.336,4.278,5.871,4.535,6.404c-0.445,1.184-4.907,3.282-12.229,3.282C30.177,82.591,23.69,80.904,18.941,77.945z%20M56.86,49.368c0-4.938,4.001-8.943,8.931-8.943c4.941,0,8.942,4.005,8.942,8.943c0,4.931-4.001,8.942-8.942,8.942%20C60.854,58.311,56.86,54.299,56.86,49.368z%20M149.159,155.398l-20.63,11.169l13.408,9.293c0,0-49.854,15.813-72.198-6.885%20c-11.006-11.16-13.06-28.533,4.124-38.84c17.184-10.312,84.609,3.943,84.609,3.943L134.295,147.8L149.159,155.398z'/%3e%3c/g%3e%3c/svg%3e",LN=()=>he.jsx("style",{children:`
-      @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-      }
-    `}),jN=({gridWords:n,gridRevealStatus:i,onCardClick:u,myRole:s,activeClueGiverPerspective:c,isGuessingActive:h,playerKeyCard:d})=>{const g=C=>{switch(C){case"green":return"✅";case"assassin":return"💀";case"neutral":return"➖";default:return"❓"}},v=C=>{const x=i[C];return x?x.revealed_by_guesser_for_a==="assassin"||x.revealed_by_guesser_for_b==="assassin"?"assassin":x.revealed_by_guesser_for_a==="green"||x.revealed_by_guesser_for_b==="green"?"green":c==="a"&&x.revealed_by_guesser_for_a?x.revealed_by_guesser_for_a:c==="b"&&x.revealed_by_guesser_for_b?x.revealed_by_guesser_for_b:null:null},p=C=>{if(!h||s!=="guesser"||!c)return!1;const x=i[C];return!x||x.revealed_by_guesser_for_a==="assassin"||x.revealed_by_guesser_for_b==="assassin"?!1:c==="a"?x.revealed_by_guesser_for_a===null:c==="b"?x.revealed_by_guesser_for_b===null:!1},_=C=>{const x={...nd.gridTile};let E=x.backgroundColor,O=x.color||"black",w=x.cursor,U=x.border;const A=v(C);if(A==="green"||A==="assassin")E="#E0E0E0",O="#E0E0E0";else if(A==="neutral")E="#cfd8dc",O="black";else if(d&&d.length>C)switch(d[C]){case"green":E="#7cb342",O="white";break;case"assassin":E="#d32f2f",O="white";break;case"neutral":E="#bdbdbd",O="black";break;default:E="#FFFACD",O="black";break}else E="#FFFACD",O="black";return p(C)&&(w="pointer",U="2px solid #2196f3"),{...x,position:"relative",backgroundColor:E,color:O,cursor:w,border:U,display:"flex",alignItems:"center",justifyContent:"center"}},T=C=>{p(C)&&u(C)};return!n||n.length===0?(console.log("No words received in WordGrid component"),he.jsxs("div",{style:nd.loadingContainer,children:[he.jsx(LN,{}),he.jsx("div",{style:nd.loadingText,children:"Loading words from server..."}),he.jsx("div",{style:nd.loadingSpinner})]})):he.jsxs("div",{children:[he.jsx("style",{children:`
-          .card-tokens-container-class {
-            position: absolute;
-            bottom: 2px; /* Reposition to bottom */
-            left: 2px;   /* Reposition to left */
-            z-index: 1;
-            display: flex;
-            gap: 2px;
-          }
-          .token-image {
-            width: 18px; /* Adjust size as needed */
-            height: 18px; /* Adjust size as needed */
-          }
-          .red-duck {
-            /* Example filter for red - tune in browser dev tools if needed */
-            filter: brightness(0) saturate(100%) invert(30%) sepia(90%) saturate(5000%) hue-rotate(350deg) brightness(100%) contrast(100%);
-          }
-          .blue-duck {
-            /* Example filter for blue - tune in browser dev tools if needed */
-            filter: brightness(0) saturate(100%) invert(50%) sepia(80%) saturate(5000%) hue-rotate(190deg) brightness(100%) contrast(100%);
-          }
-        `}),he.jsx("div",{style:nd.gridContainer,children:n.map((C,x)=>{const E=i[x];let O=!1,w=!1;const U=v(x);return E&&U!=="green"&&U!=="assassin"&&(E.revealed_by_guesser_for_a==="neutral"&&(O=!0),E.revealed_by_guesser_for_b==="neutral"&&(w=!0)),he.jsxs("div",{className:"word-card",style:_(x),onClick:()=>T(x),children:[U&&(U==="green"||U==="assassin")?he.jsx("span",{className:"card-type-icon",style:{fontSize:"1.5em"},children:g(U)}):he.jsx("span",{className:"word-text",children:C.toUpperCase()}),he.jsxs("div",{className:"card-tokens-container-class",children:[O&&he.jsx("img",{src:y_,alt:"Red Duck Token",className:"token-image red-duck"}),w&&he.jsx("img",{src:y_,alt:"Blue Duck Token",className:"token-image blue-duck"})]})]},x)})})]})},nd={gridContainer:{display:"grid",gridTemplateColumns:"repeat(5, 1fr)",gap:"10px",maxWidth:"600px"},gridTile:{display:"flex",position:"relative",alignItems:"center",justifyContent:"center",height:"60px",backgroundColor:"#f5f5f5",padding:"10px",borderRadius:"5px",cursor:"default",textAlign:"center",boxShadow:"0 2px 4px rgba(0,0,0,0.1)",userSelect:"none",fontWeight:"bold"},loadingContainer:{display:"flex",flexDirection:"column",alignItems:"center",justifyContent:"center",padding:"30px",width:"250px",height:"150px",backgroundColor:"#f0f4f8",borderRadius:"8px",boxShadow:"0 4px 8px rgba(0,0,0,0.1)"},loadingText:{padding:"10px",textAlign:"center",fontSize:"1.2em",color:"#555",marginBottom:"15px"},loadingSpinner:{width:"30px",height:"30px",border:"3px solid #f3f3f3",borderTop:"3px solid #3498db",borderRadius:"50%",animation:"spin 1s linear infinite"}},VN=()=>`client-${Math.random().toString(36).substring(2,15)}-${Date.now().toString(36).substring(6)}`,k2=[{name:"Black",value:"#000000"},{name:"Red",value:"#FF0000"},{name:"Blue",value:"#0000FF"},{name:"Green",value:"#008000"},{name:"Yellow",value:"#FFFF00"}],b_=[{name:"Small",value:2},{name:"Medium",value:5},{name:"Large",value:10},{name:"X-Large",value:20}],YN=1,PN=50,Q2=n=>({id:n.id,points:n.points.flat(),color:n.color,width:n.width,tool:n.tool,clientId:n.clientId}),XN=()=>{const{gameId:n="default-game"}=E9(),i=sm(),[u]=ue.useState(()=>VN()),[s,c]=ue.useState([]),[h,d]=ue.useState([]),[g,v]=ue.useState("pen"),p=ue.useRef(null),[_,T]=ue.useState(!1),[C,x]=ue.useState(null),[E,O]=ue.useState(null),[w,U]=ue.useState(!0),[A,R]=ue.useState(!1),[z,G]=ue.useState(0),[B,Q]=ue.useState(!1),[X,Y]=ue.useState(0),[V,F]=ue.useState(!1),[I,D]=ue.useState(null),[P,H]=ue.useState([]),[N,L]=ue.useState(0),[Z,ae]=ue.useState([]),[j,te]=ue.useState(Array(25).fill("")),[de,ne]=ue.useState(Array(25).fill("")),[ce,Se]=ue.useState(()=>Array(25).fill(null).map(()=>({revealed_by_guesser_for_a:null,revealed_by_guesser_for_b:null}))),[xe,$]=ue.useState("spectator"),[oe,Te]=ue.useState({}),[Re,Me]=ue.useState(null),[Ge,$e]=ue.useState(null),[et,ze]=ue.useState(k2[0].value),[At,we]=ue.useState(b_[1].value),[ft,na]=ue.useState(!1),Rt=ue.useRef(null),[Vt,ht]=ue.useState(null),lt=ue.useRef(null),ma=5,Ca=3e3;ue.useEffect(()=>{const He=Gt=>{Rt.current&&!Rt.current.contains(Gt.target)&&na(!1)};return ft?document.addEventListener("mousedown",He):document.removeEventListener("mousedown",He),()=>{document.removeEventListener("mousedown",He)}},[ft]);const Zt=He=>{if(!p.current||p.current.readyState!==WebSocket.OPEN){console.warn("WebSocket not connected. Cannot send word click.");return}Fe==="guesser"&&B?(console.log(`Word at index ${He} clicked by guesser ${u}`),p.current.send(JSON.stringify({type:"GUESS_WORD",gameId:n,payload:{clientId:u,wordIndex:He}}))):console.log("Word click ignored. Not guesser or guessing not active.")},Dt=()=>{p.current&&p.current.readyState===WebSocket.OPEN&&u&&Fe==="guesser"&&B?(console.log(`Guesser ${u} is ending their guessing turn.`),p.current.send(JSON.stringify({type:"END_GUESSING",gameId:n,clientId:u}))):console.warn("Cannot end guessing: Conditions not met.")};console.log("[GamePage Render] playerType:",xe,"keyCardA:",j.length>0?j[0]:"empty","keyCardB:",de.length>0?de[0]:"empty"),console.log("[GamePage Render] allAgentsFoundMessage STATE IS:",Ge);const Fe=J.useMemo(()=>{if(!u)return"connecting";if(u===C)return"drawer";if(u===E)return"guesser";if(P.length>0&&!C&&!E){if(P[0]===u&&xe!=="b")return"drawer";if(P.length>1&&P[1]===u&&xe!=="a")return"guesser"}return"spectator"},[u,C,E,P,xe]),zt=ue.useCallback(()=>{lt.current&&clearTimeout(lt.current);const He=n.toLowerCase(),Gt=window.location.protocol==="https:"?"wss:":"ws:",It=window.location.host,Na=`${Gt}//${It}/ws/${He}/${u}`;if(p.current&&(p.current.readyState===WebSocket.OPEN||p.current.readyState===WebSocket.CONNECTING)){console.log("WebSocket is already open or connecting. Aborting new connection attempt.");return}console.log(`[Connect] gameId: ${He}, clientId: ${u}`),console.log(`Attempting to connect to WebSocket: ${Na} (Attempt: ${N+1})`),p.current=new WebSocket(Na),p.current.onopen=()=>{console.log(`WebSocket connected for client ${u} to game ${He}`),T(!0),L(0)},p.current.onmessage=oa=>{var br,Yi;try{const Jt=JSON.parse(oa.data);switch(console.log("RAW WebSocket message received:",Jt),console.log("[WebSocket OnMessage] Parsed message type:",Jt.type,"Payload:",Jt.payload),Jt.type){case"INITIAL_GAME_DATA":const ca=Jt.payload;console.log("[WebSocket INITIAL_GAME_DATA] Processing. Received payload:",ca),Array.isArray(ca.strokes)&&c(ca.strokes.map(Q2)),ca.player_type&&($(ca.player_type),console.log(`[WebSocket INITIAL_GAME_DATA] Set playerType to: ${ca.player_type} for client ${u}`)),Array.isArray(ca.key_card_a)&&(te(ca.key_card_a),console.log("[WebSocket INITIAL_GAME_DATA] Set keyCardA:",ca.key_card_a.length>0?ca.key_card_a[0]:"empty_or_short")),Array.isArray(ca.key_card_b)&&(ne(ca.key_card_b),console.log("[WebSocket INITIAL_GAME_DATA] Set keyCardB:",ca.key_card_b.length>0?ca.key_card_b[0]:"empty_or_short")),$e(ca.all_agents_found_message||null),ht(ca.current_clue||null);break;case"STROKE_DRAWN":if(Jt.payload&&Jt.senderClientId!==u){const Zu=Q2(Jt.payload);c(_r=>[..._r,Zu])}break;case"CANVAS_CLEARED":c([]),d([]),console.log(`Canvas cleared based on ${Jt.senderClientId===u?"own":"remote"} request.`);break;case"GAME_STATE":console.log("Received GAME_STATE payload:",JSON.stringify(Jt.payload,null,2));const it=Jt.payload;Array.isArray(it.strokes)&&c(it.strokes.map(Q2)),it.drawing_submitted&&d([]),x(it.current_drawing_player_id??null),O(it.current_guessing_player_id??null),U(it.drawing_phase_active??!1),R(it.drawing_submitted??!1),Q(it.guessing_active??!1),Y(it.correct_guesses_this_turn??0),G(it.turn_number??0),F(it.game_over||!1),D(it.winner||null),H(it.connected_client_ids||[]),ht(it.current_clue||null),Array.isArray(it.grid_words)&&ae(it.grid_words),Array.isArray(it.key_card_a)&&(te(it.key_card_a),console.log("[WebSocket GAME_STATE] Set keyCardA:",it.key_card_a.length>0?it.key_card_a[0]:"empty_or_short")),Array.isArray(it.key_card_b)&&(ne(it.key_card_b),console.log("[WebSocket GAME_STATE] Set keyCardB:",it.key_card_b.length>0?it.key_card_b[0]:"empty_or_short")),it.grid_reveal_status&&(console.log("[GamePage OnMessage GAME_STATE] Received grid_reveal_status:",JSON.stringify(it.grid_reveal_status,null,2)),Se(it.grid_reveal_status)),it.player_type&&($(it.player_type),console.log(`[WebSocket GAME_STATE] Set playerType to: ${it.player_type} for client ${u}`)),it.player_identities&&Te(it.player_identities),it.player_cleared_opponent_board&&it.player_cleared_opponent_board.toLowerCase()===xe?Me("You have guessed all their cards now its just your cards that remain"):Me(null),console.log("[WebSocket Handler] gameState.all_agents_found_message IS:",it.all_agents_found_message),$e(it.all_agents_found_message||null);break;case"GAME_NOT_FOUND":alert(`Error: Game '${n}' not found. ${((br=Jt.payload)==null?void 0:br.message)||""}`),i("/");break;case"ERROR_MESSAGE":alert(`Server error: ${((Yi=Jt.payload)==null?void 0:Yi.error)||"Unknown error"}`);break;default:console.warn(`[WebSocket OnMessage] Received unknown message type: ${Jt.type}`,Jt)}}catch(Jt){console.error("Error processing WebSocket message:",Jt,oa.data)}},p.current.onclose=oa=>{console.error(`WebSocket disconnected. Code: ${oa.code}, Reason: '${oa.reason}', WasClean: ${oa.wasClean}`),T(!1),oa.code===1006||N>=ma-1?(lt.current&&clearTimeout(lt.current),oa.code===1006?(console.warn(`WebSocket connection to ${n} failed (Code 1006), game likely no longer exists. Navigating to home.`),alert("The game session has ended or the connection was refused. Returning to the home page.")):(console.warn(`Max reconnect attempts reached for ${n}. Navigating to home.`),alert("Could not re-establish connection to the game server after multiple attempts. Returning to the home page.")),L(0),i("/")):oa.code!==1e3&&oa.code!==1005&&(console.log(`Reconnect attempt ${N+1} scheduled for ${n}. Code: ${oa.code}`),lt.current=window.setTimeout(()=>{L(br=>br+1),zt()},Ca))},p.current.onerror=oa=>{console.error("WebSocket error:",oa)}},[n,u,i]);ue.useEffect(()=>(n&&u&&(console.log(`[useEffect-Connect] gameId: ${n}, clientId: ${u}`),zt()),()=>{p.current&&(console.log("Cleaning up WebSocket connection in useEffect unmount/re-run."),p.current.onopen=null,p.current.onmessage=null,p.current.onerror=null,p.current.onclose=null,(p.current.readyState===WebSocket.OPEN||p.current.readyState===WebSocket.CONNECTING)&&p.current.close(1e3,"Component unmounting or re-running effect"),p.current=null),lt.current&&clearTimeout(lt.current)}),[zt,n,u]);const tn=(He,Gt,It,Na)=>{if(p.current&&p.current.readyState===WebSocket.OPEN&&u){const oa={points:He,color:Gt,width:It,tool:Na};p.current.send(JSON.stringify({type:"DRAW_STROKE",payload:oa,gameId:n,senderClientId:u}))}},ka=He=>{if(!(Fe!=="drawer"||!w||A))if(p.current&&p.current.readyState===WebSocket.OPEN&&u){const Gt=[];for(let It=0;It<He.points.length;It+=2)It+1<He.points.length&&Gt.push([He.points[It],He.points[It+1]]);if(Gt.length>0){const Na={id:`local-${Date.now()}-${Math.random().toString(36).substr(2,9)}`,...He,clientId:u};d(oa=>[...oa,Na]),tn(Gt,He.color,He.width,He.tool)}else console.warn("handleLocalStrokeEnd: No valid point pairs.")}else console.error("Cannot send stroke: WebSocket not connected or client ID missing.")},ya=()=>{if(p.current&&p.current.readyState===WebSocket.OPEN&&u&&Fe==="drawer"&&!A){const He=h.map(Gt=>{const It=[];for(let Na=0;Na<Gt.points.length;Na+=2)Na+1<Gt.points.length&&It.push([Gt.points[Na],Gt.points[Na+1]]);return{id:Gt.id,points:It,color:Gt.color,width:Gt.width,tool:Gt.tool,clientId:Gt.clientId}});console.log("Sending SUBMIT_DRAWING with local strokes:",He),p.current.send(JSON.stringify({type:"SUBMIT_DRAWING",gameId:n,clientId:u,payload:{strokes:He}})),d([])}else console.error("Cannot submit drawing: Conditions not met.")},mt=()=>{p.current&&p.current.readyState===WebSocket.OPEN&&u&&Fe==="drawer"&&w&&!A?(d([]),p.current.send(JSON.stringify({type:"CLEAR_CANVAS",gameId:n,clientId:u})),console.log("Sent CLEAR_CANVAS request.")):console.warn("Clear canvas action prevented.")};console.log("[GamePage Render] currentDrawingPlayerId:",C),console.log("[GamePage Render] playerIdentities:",JSON.stringify(oe));const yt=C&&oe[C]?oe[C]:null;return console.log("[GamePage Render] Calculated activeClueGiverPerspective for WordGrid:",yt),console.log("[GamePage Render] guessingActive state:",B),console.log("[GamePage Render] myRole:",Fe),he.jsxs(he.Fragment,{children:[V&&(I==="Players Win! (15 Green Words)"?he.jsx(BN,{isOpen:!0,onClose:()=>{console.log("WinModal closed, navigate or rematch needed"),F(!1),D(null)}}):he.jsx("div",{className:"fixed inset-0 flex items-center justify-center z-50",style:{backgroundColor:"rgba(0, 0, 0, 0.75)"},children:he.jsxs("p",{className:"text-red-500 font-bold text-3xl p-8 bg-gray-800 rounded-lg shadow-xl",children:["Game Over! ",I?`Winner: ${I}`:"It's a draw!"]})})),he.jsxs("div",{className:"flex flex-col min-h-screen bg-gray-200 text-gray-800 font-sans",children:[he.jsxs("header",{className:"flex justify-between items-center p-3 bg-gray-300 shadow-lg sticky top-0 z-40",children:[he.jsx("h1",{className:"text-3xl font-bold text-blue-700",children:"SketchCodes"}),Fe==="drawer"&&w&&!A&&_&&he.jsxs("div",{className:"flex-1 flex flex-col items-center space-y-1 mx-2",children:[he.jsxs("div",{className:"flex items-center space-x-3",children:[he.jsxs("div",{className:"flex items-center space-x-1",children:[he.jsx("span",{className:"text-xs font-medium mr-1",children:"Color:"}),k2.map(He=>he.jsx("button",{onClick:()=>ze(He.value),className:`w-[25px] h-[25px] rounded-full border-2 focus:outline-none focus:ring-2 focus:ring-offset-1 focus:ring-blue-500 transition-all duration-150 ease-in-out
-                                  ${et===He.value?"border-blue-700 ring-2 ring-blue-500":"border-gray-400 hover:border-gray-600"}`,style:{backgroundColor:He.value},title:He.name,disabled:!w||A},He.value))]}),he.jsxs("div",{className:"relative",children:[he.jsx("button",{onClick:()=>{_&&Fe==="drawer"&&w&&!A&&na(!ft)},className:"p-0.5 bg-white rounded shadow border border-gray-400 hover:border-gray-500 disabled:opacity-50 disabled:cursor-not-allowed",title:"Select custom color",disabled:!w||A,children:he.jsx("div",{style:{width:"20px",height:"14px",backgroundColor:et,borderRadius:"2px"}})}),ft&&he.jsx("div",{ref:Rt,className:"absolute z-50 top-full mt-1 left-1/2 transform -translate-x-1/2 shadow-xl rounded",children:he.jsx(vM,{color:et,onChange:He=>ze(He.hex),disableAlpha:!0,presetColors:k2.map(He=>He.value),width:"200px",styles:{default:{picker:{boxShadow:"none",borderRadius:"4px",border:"1px solid #ccc"}}}})})]}),he.jsxs("div",{className:"flex items-center space-x-1",children:[he.jsx("button",{onClick:()=>v("pen"),disabled:g==="pen"||!w||A,className:`px-2 py-0.5 border rounded text-xs transition-colors duration-150
-                                    ${g==="pen"?"bg-blue-600 text-white border-blue-700":"bg-white hover:bg-gray-100 border-gray-400"}`,children:"Pen"}),he.jsx("button",{onClick:()=>v("eraser"),disabled:g==="eraser"||!w||A,className:`px-2 py-0.5 border rounded text-xs transition-colors duration-150
-                                    ${g==="eraser"?"bg-gray-600 text-white border-gray-700":"bg-white hover:bg-gray-100 border-gray-400"}`,children:"Eraser"})]})]}),he.jsxs("div",{className:"flex items-center space-x-2",children:[he.jsx("span",{className:"text-xs font-medium mr-1",children:"Size:"}),he.jsx("div",{className:"flex items-center space-x-1",children:b_.map(He=>he.jsxs("button",{onClick:()=>we(He.value),className:`px-1.5 py-0.5 border rounded text-xs transition-colors duration-150
-                                  ${At===He.value?"bg-blue-600 text-white border-blue-700":"bg-white hover:bg-gray-100 border-gray-400"}`,disabled:!w||A,children:[He.name," (",He.value,"px)"]},He.name))}),he.jsxs("div",{className:"flex items-center space-x-1",children:[he.jsx("input",{type:"range",id:"brushSizeSlider",min:YN,max:PN,value:At,onChange:He=>we(parseInt(He.target.value,10)),disabled:!w||A,className:"w-20 h-3 accent-blue-600 cursor-pointer disabled:opacity-50",title:`Brush/Eraser Size: ${At}px`}),he.jsxs("span",{className:"text-xs w-8 text-right tabular-nums",children:[At,"px"]})]})]})]}),!(Fe==="drawer"&&w&&!A&&_)&&he.jsx("div",{className:"flex-1 mx-2"}),he.jsxs("div",{className:"text-xs space-y-0 text-right min-w-[140px]",children:[he.jsxs("p",{children:[he.jsx("strong",{children:"Turn:"})," ",he.jsx("span",{className:"font-mono",children:z})]}),he.jsxs("p",{children:[he.jsx("strong",{children:"Phase:"})," ",he.jsxs("span",{className:"font-semibold",children:[w?"Drawing":B?"Guessing":"Waiting",A?" (Submitted)":""]})]}),he.jsxs("p",{children:[he.jsx("strong",{children:"Role:"})," ",he.jsx("span",{className:"font-semibold",children:(Fe==null?void 0:Fe.charAt(0).toUpperCase())+(Fe==null?void 0:Fe.slice(1))})]})]})]}),he.jsxs("main",{className:"flex flex-1 p-2 gap-2 overflow-hidden",children:[he.jsxs("div",{className:"flex-grow-[3] bg-white shadow-xl rounded-lg p-1 flex flex-col items-center justify-center relative overflow-hidden",children:[Ge&&he.jsx("div",{className:"absolute top-2 left-1/2 transform -translate-x-1/2 bg-green-100 border border-green-500 text-green-700 px-3 py-1.5 rounded-md shadow-md z-10 text-xs font-semibold",children:Ge}),Re&&he.jsx("div",{className:"absolute top-2 left-1/2 transform -translate-x-1/2 bg-blue-100 border border-blue-500 text-blue-700 px-3 py-1.5 rounded-md shadow-md z-10 text-xs font-semibold",children:Re}),he.jsx(HN,{strokes:Fe==="drawer"?[...s,...h]:s,onDrawEnd:ka,width:800,height:600,isDrawingEnabled:_&&Fe==="drawer"&&w&&!A,currentTool:g,selectedColor:et,selectedBrushSize:At,className:"border border-gray-400 rounded-md shadow-inner bg-gray-50"})]}),he.jsxs("div",{className:"flex-grow-[1] bg-gray-50 p-2 shadow-xl rounded-lg flex flex-col space-y-2 overflow-y-auto",children:[he.jsx("h2",{className:"text-base font-bold text-center text-gray-700 sticky top-0 bg-gray-50 py-1 z-10",children:"Game Board"}),he.jsx(jN,{gridWords:Z,gridRevealStatus:ce,onCardClick:Zt,myRole:Fe,activeClueGiverPerspective:yt,isGuessingActive:B,playerKeyCard:xe==="a"?j:xe==="b"?de:[]}),Vt&&typeof Vt.word=="string"&&typeof Vt.number=="number"&&he.jsxs("div",{className:"mt-auto p-2 bg-yellow-100 border border-yellow-400 rounded-md shadow-md",children:[he.jsx("p",{className:"text-xs font-semibold text-gray-700",children:"Current Clue:"}),he.jsxs("p",{className:"text-lg font-bold text-yellow-700 text-center",children:[Vt.word," - ",Vt.number]})]})]})]}),he.jsxs("footer",{className:"flex justify-between items-center p-2 bg-gray-300 shadow-lg border-t border-gray-400",children:[he.jsxs("div",{className:"text-xs min-w-[150px]",children:[!_&&he.jsxs("p",{className:"text-red-600 font-semibold",children:["Connecting... (Attempts: ",N,")"]}),_&&he.jsxs("p",{className:"text-green-700 font-semibold",children:["Connected as ",Fe," (",u.substring(0,6),")"]}),he.jsxs("p",{className:"text-gray-600",children:["Players: ",Array.isArray(P)?P.length:0," online"]})]}),he.jsxs("div",{className:"flex space-x-2",children:[Fe==="drawer"&&w&&!A&&_&&he.jsxs(he.Fragment,{children:[he.jsx("button",{onClick:mt,className:"px-3 py-1.5 bg-yellow-500 hover:bg-yellow-600 text-white rounded shadow-md text-xs font-semibold transition-colors duration-150",children:"Clear Drawing"}),he.jsx("button",{onClick:ya,className:"px-3 py-1.5 bg-green-500 hover:bg-green-600 text-white rounded shadow-md text-xs font-semibold transition-colors duration-150",children:"Submit Drawing"})]}),Fe==="guesser"&&B&&!V&&_&&he.jsx("button",{onClick:Dt,className:"px-3 py-1.5 bg-blue-500 hover:bg-blue-600 text-white rounded shadow-md text-xs font-semibold transition-colors duration-150",children:"End Guessing"})]}),he.jsxs("div",{className:"text-xs text-right min-w-[150px] text-gray-600",children:["Game ID: ",he.jsx("span",{className:"font-mono",children:n})]})]})]})]})};function KN(){return he.jsx("div",{className:"App min-h-screen",children:he.jsxs(B9,{children:[he.jsx(J2,{path:"/",element:he.jsx(_7,{})}),he.jsx(J2,{path:"/game/:gameId",element:he.jsx(XN,{})})]})})}FS.createRoot(document.getElementById("root")).render(he.jsx(J.StrictMode,{children:he.jsx(s7,{children:he.jsx(KN,{})})}))});export default FN();
@@ -26,6 +26,20 @@ const BRUSH_SIZES = [
 const MIN_BRUSH_SIZE = 1;
 const MAX_BRUSH_SIZE = 50; // Max brush/eraser size for the slider
 
+// The server sends JSON as UTF-8 binary frames (encoded once per broadcast), so decode them here.
+const textDecoder = new TextDecoder();
+
+// Large messages arrive zlib-compressed (compressed once on the server rather than per socket).
+// A zlib stream starts with 0x78, which no JSON text does.
+const decodeFrame = async (data: string | ArrayBuffer): Promise<string> => {
+  if (typeof data === 'string') return data;
+  if (new Uint8Array(data)[0] === 0x78) {
+    const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('deflate'));
+    return new Response(stream).text();
+  }
+  return textDecoder.decode(data);
+};
+
 interface BackendStrokePayload {
   id: string;
   points: number[][];
@@ -56,7 +70,7 @@ interface CardRevealStatus {
 
 interface GameStatePayload {
   game_id: string;
-  strokes: BackendStrokePayload[];
+  strokes?: BackendStrokePayload[]; // Omitted from GAME_STATE when unchanged since the last one
   current_drawing_player_id: string | null;
   current_guessing_player_id: string | null;
   drawing_phase_active: boolean;
@@ -213,6 +227,7 @@ const GamePage: React.FC = () => {
     console.log(`[Connect] gameId: ${lowerCaseGameId}, clientId: ${clientId}`);
     console.log(`Attempting to connect to WebSocket: ${wsUrl} (Attempt: ${reconnectAttempts + 1})`);
     ws.current = new WebSocket(wsUrl);
+    ws.current.binaryType = 'arraybuffer';
 
     ws.current.onopen = () => {
       console.log(`WebSocket connected for client ${clientId} to game ${lowerCaseGameId}`);
@@ -220,114 +235,125 @@ const GamePage: React.FC = () => {
       setReconnectAttempts(0);
     };
 
+    // Decompression is async, so frames are chained to keep them in arrival order.
+    let messageChain = Promise.resolve();
     ws.current.onmessage = (event) => {
-      try {
-        const message = JSON.parse(event.data as string) as WebSocketMessage;
-        console.log("RAW WebSocket message received:", message);
-
-        console.log('[WebSocket OnMessage] Parsed message type:', message.type, 'Payload:', message.payload); // Diagnostic log
-
-        switch (message.type) {
-          case 'INITIAL_GAME_DATA':
-            const initialPayload = message.payload as GameStatePayload;
-            console.log('[WebSocket INITIAL_GAME_DATA] Processing. Received payload:', initialPayload);
-
-            if (Array.isArray(initialPayload.strokes)) {
-              setStrokes(initialPayload.strokes.map(mapBackendStrokeToFrontendStroke));
-            }
-            if (initialPayload.player_type) {
-              setPlayerType(initialPayload.player_type);
-              console.log(`[WebSocket INITIAL_GAME_DATA] Set playerType to: ${initialPayload.player_type} for client ${clientId}`);
-            }
-            if (Array.isArray(initialPayload.key_card_a)) {
-              setKeyCardA(initialPayload.key_card_a);
-              console.log('[WebSocket INITIAL_GAME_DATA] Set keyCardA:', initialPayload.key_card_a.length > 0 ? initialPayload.key_card_a[0] : 'empty_or_short');
-            }
-            if (Array.isArray(initialPayload.key_card_b)) {
-              setKeyCardB(initialPayload.key_card_b);
-              console.log('[WebSocket INITIAL_GAME_DATA] Set keyCardB:', initialPayload.key_card_b.length > 0 ? initialPayload.key_card_b[0] : 'empty_or_short');
-            }
-            setAllAgentsFoundMessage(initialPayload.all_agents_found_message || null);
-            setCurrentClue(initialPayload.current_clue || null); // Set current clue
-            break;
-          case 'STROKE_DRAWN':
-            if (message.payload && message.senderClientId !== clientId) {
-              const newStroke = mapBackendStrokeToFrontendStroke(message.payload as BackendStrokePayload);
-              setStrokes(prevStrokes => [...prevStrokes, newStroke]);
-            }
-            break;
-          case 'CANVAS_CLEARED':
-            setStrokes([]);
-            setLocalStrokes([]); 
-            console.log(`Canvas cleared based on ${message.senderClientId === clientId ? 'own' : 'remote'} request.`);
-            break;
-          case 'GAME_STATE':
-            console.log('Received GAME_STATE payload:', JSON.stringify(message.payload, null, 2));
-            const gameState = message.payload as GameStatePayload;
-
-            if (Array.isArray(gameState.strokes)) {
-              setStrokes(gameState.strokes.map(mapBackendStrokeToFrontendStroke));
-            }
-
-            if (gameState.drawing_submitted) {
-                setLocalStrokes([]);
-            }
-            
-            setCurrentDrawingPlayerId(gameState.current_drawing_player_id ?? null);
-            setCurrentGuessingPlayerId(gameState.current_guessing_player_id ?? null);
-            setDrawingPhaseActive(gameState.drawing_phase_active ?? false);
-            setDrawingSubmitted(gameState.drawing_submitted ?? false);
-            setGuessingActive(gameState.guessing_active ?? false);
-            setCorrectGuessesThisTurn(gameState.correct_guesses_this_turn ?? 0);
-            setTurnNumber(gameState.turn_number ?? 0);
-            setGameOver(gameState.game_over || false);
-            setWinner(gameState.winner || null);
-            setConnectedClientIds(gameState.connected_client_ids || []);
-            setCurrentClue(gameState.current_clue || null); // Set current clue
-
-            if (Array.isArray(gameState.grid_words)) setGridWords(gameState.grid_words);
-            if (Array.isArray(gameState.key_card_a)) {
-              setKeyCardA(gameState.key_card_a);
-              console.log('[WebSocket GAME_STATE] Set keyCardA:', gameState.key_card_a.length > 0 ? gameState.key_card_a[0] : 'empty_or_short');
-            }
-            if (Array.isArray(gameState.key_card_b)) {
-              setKeyCardB(gameState.key_card_b);
-              console.log('[WebSocket GAME_STATE] Set keyCardB:', gameState.key_card_b.length > 0 ? gameState.key_card_b[0] : 'empty_or_short');
-            }
-            if (gameState.grid_reveal_status) {
-              console.log(
-            "[GamePage OnMessage GAME_STATE] Received grid_reveal_status:", 
-            JSON.stringify(gameState.grid_reveal_status, null, 2) // Stringify for clear logging
-        );
-              setGridRevealStatus(gameState.grid_reveal_status);
-            }
-            if (gameState.player_type) {
-              setPlayerType(gameState.player_type);
-              console.log(`[WebSocket GAME_STATE] Set playerType to: ${gameState.player_type} for client ${clientId}`);
-            }
-            if (gameState.player_identities) setPlayerIdentities(gameState.player_identities);
+      messageChain = messageChain.then(() => handleFrame(event.data as string | ArrayBuffer));
+    };
 
-            // Handle opponent board cleared message
-            if (gameState.player_cleared_opponent_board && gameState.player_cleared_opponent_board.toLowerCase() === playerType) {
-              setOpponentBoardClearedMessage("You have guessed all their cards now its just your cards that remain");
-            } else {
-              setOpponentBoardClearedMessage(null); // Clear message if flag not present or not for this player
-            }
-            console.log("[WebSocket Handler] gameState.all_agents_found_message IS:", gameState.all_agents_found_message);
-            setAllAgentsFoundMessage(gameState.all_agents_found_message || null);
-            break;
-          case 'GAME_NOT_FOUND':
-            alert(`Error: Game '${gameId}' not found. ${message.payload?.message || ''}`);
-            navigate('/');
-            break;
-          case 'ERROR_MESSAGE':
-            alert(`Server error: ${message.payload?.error || 'Unknown error'}`);
-            break;
-          default:
-            console.warn(`[WebSocket OnMessage] Received unknown message type: ${message.type}`, message);
+    const handleFrame = async (data: string | ArrayBuffer) => {
+      try {
+        const raw = await decodeFrame(data);
+        // Messages queued while the previous frame was in flight arrive batched as a JSON array.
+        const parsed = JSON.parse(raw) as WebSocketMessage | WebSocketMessage[];
+        for (const message of Array.isArray(parsed) ? parsed : [parsed]) {
+          console.log("RAW WebSocket message received:", message);
+
+          console.log('[WebSocket OnMessage] Parsed message type:', message.type, 'Payload:', message.payload); // Diagnostic log
+
+          switch (message.type) {
+            case 'INITIAL_GAME_DATA':
+              const initialPayload = message.payload as GameStatePayload;
+              console.log('[WebSocket INITIAL_GAME_DATA] Processing. Received payload:', initialPayload);
+
+              if (Array.isArray(initialPayload.strokes)) {
+                setStrokes(initialPayload.strokes.map(mapBackendStrokeToFrontendStroke));
+              }
+              if (Array.isArray(initialPayload.grid_words)) setGridWords(initialPayload.grid_words);
+              if (initialPayload.player_type) {
+                setPlayerType(initialPayload.player_type);
+                console.log(`[WebSocket INITIAL_GAME_DATA] Set playerType to: ${initialPayload.player_type} for client ${clientId}`);
+              }
+              if (Array.isArray(initialPayload.key_card_a)) {
+                setKeyCardA(initialPayload.key_card_a);
+                console.log('[WebSocket INITIAL_GAME_DATA] Set keyCardA:', initialPayload.key_card_a.length > 0 ? initialPayload.key_card_a[0] : 'empty_or_short');
+              }
+              if (Array.isArray(initialPayload.key_card_b)) {
+                setKeyCardB(initialPayload.key_card_b);
+                console.log('[WebSocket INITIAL_GAME_DATA] Set keyCardB:', initialPayload.key_card_b.length > 0 ? initialPayload.key_card_b[0] : 'empty_or_short');
+              }
+              setAllAgentsFoundMessage(initialPayload.all_agents_found_message || null);
+              setCurrentClue(initialPayload.current_clue || null); // Set current clue
+              break;
+            case 'STROKE_DRAWN':
+              if (message.payload && message.senderClientId !== clientId) {
+                const newStroke = mapBackendStrokeToFrontendStroke(message.payload as BackendStrokePayload);
+                setStrokes(prevStrokes => [...prevStrokes, newStroke]);
+              }
+              break;
+            case 'CANVAS_CLEARED':
+              setStrokes([]);
+              setLocalStrokes([]); 
+              console.log(`Canvas cleared based on ${message.senderClientId === clientId ? 'own' : 'remote'} request.`);
+              break;
+            case 'GAME_STATE':
+              console.log('Received GAME_STATE payload:', JSON.stringify(message.payload, null, 2));
+              const gameState = message.payload as GameStatePayload;
+
+              if (Array.isArray(gameState.strokes)) {
+                setStrokes(gameState.strokes.map(mapBackendStrokeToFrontendStroke));
+              }
+
+              if (gameState.drawing_submitted) {
+                  setLocalStrokes([]);
+              }
+              
+              setCurrentDrawingPlayerId(gameState.current_drawing_player_id ?? null);
+              setCurrentGuessingPlayerId(gameState.current_guessing_player_id ?? null);
+              setDrawingPhaseActive(gameState.drawing_phase_active ?? false);
+              setDrawingSubmitted(gameState.drawing_submitted ?? false);
+              setGuessingActive(gameState.guessing_active ?? false);
+              setCorrectGuessesThisTurn(gameState.correct_guesses_this_turn ?? 0);
+              setTurnNumber(gameState.turn_number ?? 0);
+              setGameOver(gameState.game_over || false);
+              setWinner(gameState.winner || null);
+              setConnectedClientIds(gameState.connected_client_ids || []);
+              setCurrentClue(gameState.current_clue || null); // Set current clue
+
+              if (Array.isArray(gameState.grid_words)) setGridWords(gameState.grid_words);
+              if (Array.isArray(gameState.key_card_a)) {
+                setKeyCardA(gameState.key_card_a);
+                console.log('[WebSocket GAME_STATE] Set keyCardA:', gameState.key_card_a.length > 0 ? gameState.key_card_a[0] : 'empty_or_short');
+              }
+              if (Array.isArray(gameState.key_card_b)) {
+                setKeyCardB(gameState.key_card_b);
+                console.log('[WebSocket GAME_STATE] Set keyCardB:', gameState.key_card_b.length > 0 ? gameState.key_card_b[0] : 'empty_or_short');
+              }
+              if (gameState.grid_reveal_status) {
+                console.log(
+              "[GamePage OnMessage GAME_STATE] Received grid_reveal_status:", 
+              JSON.stringify(gameState.grid_reveal_status, null, 2) // Stringify for clear logging
+          );
+                setGridRevealStatus(gameState.grid_reveal_status);
+              }
+              if (gameState.player_type) {
+                setPlayerType(gameState.player_type);
+                console.log(`[WebSocket GAME_STATE] Set playerType to: ${gameState.player_type} for client ${clientId}`);
+              }
+              if (gameState.player_identities) setPlayerIdentities(gameState.player_identities);
+
+              // Handle opponent board cleared message
+              if (gameState.player_cleared_opponent_board && gameState.player_cleared_opponent_board.toLowerCase() === playerType) {
+                setOpponentBoardClearedMessage("You have guessed all their cards now its just your cards that remain");
+              } else {
+                setOpponentBoardClearedMessage(null); // Clear message if flag not present or not for this player
+              }
+              console.log("[WebSocket Handler] gameState.all_agents_found_message IS:", gameState.all_agents_found_message);
+              setAllAgentsFoundMessage(gameState.all_agents_found_message || null);
+              break;
+            case 'GAME_NOT_FOUND':
+              alert(`Error: Game '${gameId}' not found. ${message.payload?.message || ''}`);
+              navigate('/');
+              break;
+            case 'ERROR_MESSAGE':
+              alert(`Server error: ${message.payload?.error || 'Unknown error'}`);
+              break;
+            default:
+              console.warn(`[WebSocket OnMessage] Received unknown message type: ${message.type}`, message);
+          }
         }
       } catch (error) {
-        console.error('Error processing WebSocket message:', error, event.data);
+        console.error('Error processing WebSocket message:', error, data);
       }
     };
 